@@ -0,0 +1,66 @@
+"""Key RAG chunks by content hash and keep a single HNSW index.
+
+Adds rag_documents.content_hash (SHA-256 of the chunk text, as computed by
+EmbeddingService.hash_text) so re-ingestion can reuse stored embeddings and
+skip unchanged chunks, backfilled for existing rows.
+
+Drops the IVFFlat index. It was built on an empty table, so its lists were
+never trained on real data, and every insert paid for two ANN indexes.
+Retrieval uses the HNSW index, which is recreated if missing.
+
+Revision ID: 20261019_rag_ann_index
+Revises: 20261019_schedule_rollups
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261019_rag_ann_index"
+down_revision = "20261019_schedule_rollups"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "rag_documents",
+        sa.Column(
+            "content_hash",
+            sa.String(64),
+            nullable=True,
+            comment="SHA-256 of content; keys the embedding cache on re-ingest",
+        ),
+    )
+    op.execute(
+        """
+        UPDATE rag_documents
+        SET content_hash = encode(sha256(convert_to(content, 'UTF8')), 'hex')
+        """
+    )
+    op.create_index(
+        "ix_rag_documents_content_hash", "rag_documents", ["content_hash"]
+    )
+
+    op.execute("DROP INDEX IF EXISTS ix_rag_documents_embedding_ivfflat")
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_rag_documents_embedding_hnsw
+        ON rag_documents
+        USING hnsw (embedding vector_cosine_ops)
+        WITH (m = 16, ef_construction = 64)
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        """
+        CREATE INDEX IF NOT EXISTS ix_rag_documents_embedding_ivfflat
+        ON rag_documents
+        USING ivfflat (embedding vector_cosine_ops)
+        WITH (lists = 100)
+        """
+    )
+    op.drop_index("ix_rag_documents_content_hash", table_name="rag_documents")
+    op.drop_column("rag_documents", "content_hash")
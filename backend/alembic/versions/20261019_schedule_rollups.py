@@ -0,0 +1,103 @@
+"""Create schedule rollup tables.
+
+Precomputed per-person-per-day workload, per-rotation-per-day coverage and
+per-block assignment counts, plus refresh bookkeeping. Rows are populated on
+first read (or by the refresh_schedule_rollups task) and kept current from
+assignment writes.
+
+Revision ID: 20261019_schedule_rollups
+Revises: 20260314_cal_policy_cols
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+revision = "20261019_schedule_rollups"
+down_revision = "20260314_cal_policy_cols"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "person_workload_rollups",
+        sa.Column(
+            "person_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("people.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("assignment_count", sa.Integer(), nullable=False),
+        sa.Column("fmit_count", sa.Integer(), nullable=False),
+        sa.Column("clinic_count", sa.Integer(), nullable=False),
+        sa.Column("admin_count", sa.Integer(), nullable=False),
+        sa.Column("academic_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "person_id", "date", name="pk_person_workload_rollups"
+        ),
+    )
+    op.create_index(
+        "ix_person_workload_rollups_date", "person_workload_rollups", ["date"]
+    )
+
+    op.create_table(
+        "rotation_coverage_rollups",
+        sa.Column(
+            "rotation_template_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("rotation_templates.id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("assignment_count", sa.Integer(), nullable=False),
+        sa.Column("person_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint(
+            "rotation_template_id", "date", name="pk_rotation_coverage_rollups"
+        ),
+    )
+    op.create_index(
+        "ix_rotation_coverage_rollups_date", "rotation_coverage_rollups", ["date"]
+    )
+
+    op.create_table(
+        "block_assignment_rollups",
+        sa.Column(
+            "block_id",
+            UUID(as_uuid=True),
+            sa.ForeignKey("blocks.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("time_of_day", sa.String(2), nullable=False),
+        sa.Column("assignment_count", sa.Integer(), nullable=False),
+    )
+    op.create_index(
+        "ix_block_assignment_rollups_date", "block_assignment_rollups", ["date"]
+    )
+
+    op.create_table(
+        "schedule_rollup_states",
+        sa.Column("name", sa.String(64), primary_key=True),
+        sa.Column("refreshed_at", sa.DateTime(), nullable=False),
+        sa.Column("stale_since", sa.DateTime(), nullable=True),
+        sa.Column("row_count", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schedule_rollup_states")
+    op.drop_index(
+        "ix_block_assignment_rollups_date", table_name="block_assignment_rollups"
+    )
+    op.drop_table("block_assignment_rollups")
+    op.drop_index(
+        "ix_rotation_coverage_rollups_date", table_name="rotation_coverage_rollups"
+    )
+    op.drop_table("rotation_coverage_rollups")
+    op.drop_index(
+        "ix_person_workload_rollups_date", table_name="person_workload_rollups"
+    )
+    op.drop_table("person_workload_rollups")
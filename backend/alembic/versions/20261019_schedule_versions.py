@@ -0,0 +1,37 @@
+"""Create schedule version counters for calendar feed ETags.
+
+One row per scope (person:<uuid>, program, structure), bumped in the
+writer's transaction on assignment, block, person and template changes.
+The program and structure scopes are seeded so feeds carry a
+Last-Modified date from the start.
+
+Revision ID: 20261019_schedule_versions
+Revises: 20261019_rag_ann_index
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+revision = "20261019_schedule_versions"
+down_revision = "20261019_rag_ann_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "schedule_versions",
+        sa.Column("scope", sa.String(64), primary_key=True),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+    )
+    op.execute(
+        "INSERT INTO schedule_versions (scope, version, updated_at) "
+        "SELECT scope, 1, now() AT TIME ZONE 'utc' "
+        "FROM (VALUES ('program'), ('structure')) AS seed (scope)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("schedule_versions")
@@ -1,48 +1,49 @@
 """Analytics module for schedule analysis and reporting."""
 
+from typing import TYPE_CHECKING
+
 from sqlalchemy.orm import Session
 
-from app.analytics.api import (
-    APIAnalyticsService,
-    get_api_analytics_service,
-)
-from app.analytics.arima_forecast import (
-    ARIMAConfig,
-    ARIMAForecaster,
-    WorkloadSeries,
-    auto_select_arima_order,
-    check_stationarity,
-    forecast_workload,
-)
-from app.analytics.engine import AnalyticsEngine
-from app.analytics.metrics import (
-    calculate_acgme_compliance_rate,
-    calculate_consecutive_duty_stats,
-    calculate_coverage_rate,
-    calculate_fairness_index,
-    calculate_preference_satisfaction,
-)
-from app.analytics.persistent_homology import (
-    CoverageVoid,
-    CyclicPattern,
-    PersistenceDiagram,
-    PersistentScheduleAnalyzer,
-    TopologicalFeature,
-)
-from app.analytics.reports import ReportGenerator
-from app.analytics.stability_metrics import (
-    StabilityMetrics,
-    StabilityMetricsComputer,
-    compute_stability_metrics,
-)
-from app.analytics.tda_visualization import (
-    BarcodeVisualization,
-    create_tda_summary_report,
-    visualize_point_cloud,
-)
-
-
-def get_analytics_engine(db: Session) -> AnalyticsEngine:
+from app.core.lazy_imports import lazy_exports
+
+if TYPE_CHECKING:
+    from app.analytics.engine import AnalyticsEngine
+    from app.analytics.reports import ReportGenerator
+
+# Re-exports are imported on first access; ARIMA (statsmodels) and the TDA
+# modules (ripser, matplotlib) are expensive and rarely needed.
+_LAZY_EXPORTS = {
+    "APIAnalyticsService": "app.analytics.api",
+    "get_api_analytics_service": "app.analytics.api",
+    "ARIMAConfig": "app.analytics.arima_forecast",
+    "ARIMAForecaster": "app.analytics.arima_forecast",
+    "WorkloadSeries": "app.analytics.arima_forecast",
+    "auto_select_arima_order": "app.analytics.arima_forecast",
+    "check_stationarity": "app.analytics.arima_forecast",
+    "forecast_workload": "app.analytics.arima_forecast",
+    "AnalyticsEngine": "app.analytics.engine",
+    "calculate_acgme_compliance_rate": "app.analytics.metrics",
+    "calculate_consecutive_duty_stats": "app.analytics.metrics",
+    "calculate_coverage_rate": "app.analytics.metrics",
+    "calculate_fairness_index": "app.analytics.metrics",
+    "calculate_preference_satisfaction": "app.analytics.metrics",
+    "CoverageVoid": "app.analytics.persistent_homology",
+    "CyclicPattern": "app.analytics.persistent_homology",
+    "PersistenceDiagram": "app.analytics.persistent_homology",
+    "PersistentScheduleAnalyzer": "app.analytics.persistent_homology",
+    "TopologicalFeature": "app.analytics.persistent_homology",
+    "ReportGenerator": "app.analytics.reports",
+    "StabilityMetrics": "app.analytics.stability_metrics",
+    "StabilityMetricsComputer": "app.analytics.stability_metrics",
+    "compute_stability_metrics": "app.analytics.stability_metrics",
+    "BarcodeVisualization": "app.analytics.tda_visualization",
+    "create_tda_summary_report": "app.analytics.tda_visualization",
+    "visualize_point_cloud": "app.analytics.tda_visualization",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+
+
+def get_analytics_engine(db: Session) -> "AnalyticsEngine":
     """
     Factory function to create an AnalyticsEngine instance.
 
@@ -52,10 +53,12 @@ def get_analytics_engine(db: Session) -> AnalyticsEngine:
     Returns:
         Configured AnalyticsEngine instance
     """
+    from app.analytics.engine import AnalyticsEngine
+
     return AnalyticsEngine(db)
 
 
-def get_report_generator(db: Session) -> ReportGenerator:
+def get_report_generator(db: Session) -> "ReportGenerator":
     """
     Factory function to create a ReportGenerator instance.
 
@@ -65,6 +68,8 @@ def get_report_generator(db: Session) -> ReportGenerator:
     Returns:
         Configured ReportGenerator instance
     """
+    from app.analytics.reports import ReportGenerator
+
     return ReportGenerator(db)
 
 
@@ -11,6 +11,7 @@ from sqlalchemy import select, func, and_, or_
 from sqlalchemy.orm import selectinload
 import numpy as np
 
+from app.db.rollups import BLOCK_COUNTS, daily_assignment_query, rollups_fresh_async
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.person import Person
@@ -257,19 +258,10 @@ class MetricCalculator:
         total_capacity = len(persons)
 
         # Get assignments per day
-        query = (
-            select(Block.date, func.count(Assignment.id))
-            .join(Assignment, Block.id == Assignment.block_id, isouter=True)
-            .where(
-                and_(
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-            .group_by(Block.date)
+        fresh = await rollups_fresh_async(self.db, (BLOCK_COUNTS,))
+        result = await self.db.execute(
+            daily_assignment_query(start_date, end_date, from_rollup=fresh)
         )
-
-        result = await self.db.execute(query)
         daily_assignments = result.all()
 
         utilizations = []
@@ -7,13 +7,12 @@ from typing import Any, Dict, List, Optional
 import logging
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_
+from sqlalchemy import select, func
 from sqlalchemy.orm import selectinload
 import pandas as pd
 import numpy as np
 
-from app.models.assignment import Assignment
-from app.models.block import Block
+from app.db.rollups import BLOCK_COUNTS, daily_assignment_query, rollups_fresh_async
 from app.models.person import Person
 
 logger = logging.getLogger(__name__)
@@ -101,23 +100,10 @@ class TimeSeriesAnalyzer:
         granularity: str,
     ) -> pd.Series:
         """Get time series of assignment counts."""
-        query = (
-            select(
-                Block.date,
-                func.count(Assignment.id).label("count"),
-            )
-            .join(Assignment, Block.id == Assignment.block_id, isouter=True)
-            .where(
-                and_(
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-            .group_by(Block.date)
-            .order_by(Block.date)
+        fresh = await rollups_fresh_async(self.db, (BLOCK_COUNTS,))
+        result = await self.db.execute(
+            daily_assignment_query(start_date, end_date, from_rollup=fresh)
         )
-
-        result = await self.db.execute(query)
         data = result.all()
 
         df = pd.DataFrame([{"date": row.date, "count": row.count} for row in data])
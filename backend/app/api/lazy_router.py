@@ -0,0 +1,149 @@
+"""
+Lazily mounted API routers.
+
+Rarely used subsystems (exotic resilience, QUBO/quantum templates, FRMS,
+game theory) pull in heavy numeric stacks at import time. Instead of
+importing their route modules in every worker, ``install_lazy_routers``
+registers a lightweight placeholder route per subsystem that matches the
+subsystem's path prefix. The first request under that prefix imports the
+module, splices its real routes into the placeholder's position, and
+re-dispatches the request. OpenAPI generation loads every pending router so
+the published schema stays complete.
+
+Until a router is loaded its routes are not visible to ``app.url_path_for``.
+"""
+
+import importlib
+import logging
+import threading
+from dataclasses import dataclass
+
+from fastapi import FastAPI
+from starlette.routing import BaseRoute, Match
+from starlette.types import Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class LazyRouterSpec:
+    """
+    A router to mount on first use.
+
+    Attributes:
+        module: Dotted path of a module exposing ``router``
+        path_prefix: Path (below the API prefix) the router serves
+        router_prefix: Prefix passed to ``include_router``; defaults to
+            ``path_prefix``. Use "" when the router defines its own prefix.
+        tags: OpenAPI tags
+    """
+
+    module: str
+    path_prefix: str
+    router_prefix: str | None = None
+    tags: tuple[str, ...] = ()
+
+
+class LazyRouterMount(BaseRoute):
+    """Placeholder route that imports and mounts a router on first match."""
+
+    def __init__(self, app: FastAPI, spec: LazyRouterSpec, api_prefix: str) -> None:
+        """
+        Initialize the placeholder.
+
+        Args:
+            app: Application the router is mounted on
+            spec: Router to load
+            api_prefix: Prefix the API router is mounted under (e.g. "/api/v1")
+        """
+        self.app = app
+        self.spec = spec
+        self.api_prefix = api_prefix
+        self.path = api_prefix + spec.path_prefix
+        self.loaded = False
+        self._lock = threading.Lock()
+
+    def matches(self, scope: Scope) -> tuple[Match, Scope]:
+        if scope["type"] in ("http", "websocket"):
+            path = scope["path"]
+            if path == self.path or path.startswith(self.path + "/"):
+                return Match.FULL, {}
+        return Match.NONE, {}
+
+    def load(self) -> None:
+        """Import the router module and replace this placeholder with it."""
+        with self._lock:
+            if self.loaded:
+                return
+            module = importlib.import_module(self.spec.module)
+            routes = self.app.router.routes
+            position = routes.index(self)
+            first_new = len(routes)
+
+            router_prefix = self.spec.router_prefix
+            if router_prefix is None:
+                router_prefix = self.spec.path_prefix
+            self.app.include_router(
+                module.router,
+                prefix=self.api_prefix + router_prefix,
+                tags=list(self.spec.tags) or None,
+            )
+
+            # Keep the original registration order
+            new_routes = routes[first_new:]
+            del routes[first_new:]
+            routes[position : position + 1] = new_routes
+
+            self.app.openapi_schema = None
+            self.loaded = True
+        logger.info(f"Lazily mounted {self.spec.module} at {self.path}")
+
+    async def handle(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.load()
+        await self.app.router(scope, receive, send)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(path={self.path!r}, module={self.spec.module!r})"
+
+
+def load_lazy_routers(app: FastAPI) -> None:
+    """
+    Mount every pending lazy router on an application.
+
+    Args:
+        app: FastAPI application
+    """
+    for route in list(app.router.routes):
+        if isinstance(route, LazyRouterMount):
+            route.load()
+
+
+def install_lazy_routers(
+    app: FastAPI,
+    specs: list[LazyRouterSpec],
+    prefix: str = "",
+    eager: bool = False,
+) -> None:
+    """
+    Register lazy routers on an application.
+
+    Args:
+        app: FastAPI application
+        specs: Routers to register
+        prefix: API prefix the routers live under
+        eager: Mount everything immediately (the pre-lazy behaviour)
+    """
+    for spec in specs:
+        app.router.routes.append(LazyRouterMount(app, spec, prefix))
+
+    if eager:
+        load_lazy_routers(app)
+        return
+
+    build_openapi = app.openapi
+
+    def openapi() -> dict:
+        load_lazy_routers(app)
+        return build_openapi()
+
+    app.openapi = openapi  # type: ignore[method-assign]
@@ -2,6 +2,7 @@
 
 from fastapi import APIRouter
 
+from app.api.lazy_router import LazyRouterSpec
 from app.api.routes import (
     absences,
     academic_blocks,
@@ -39,17 +40,14 @@ from app.api.routes import (
     db_admin,
     docs,
     enums,
-    exotic_resilience,
     experiments,
     export,
     exports,
     fairness,
-    fatigue_risk,
     features,
     fmit_assignments,
     fmit_health,
     fmit_timeline,
-    game_theory,
     graduation_requirements,
     half_day_assignments,
     health,
@@ -73,7 +71,6 @@ from app.api.routes import (
     procedures,
     profiling,
     proxy_coverage,
-    qubo_templates,
     queue,
     quota,
     rag,
@@ -89,7 +86,6 @@ from app.api.routes import (
     schedule_overrides,
     scheduler,
     scheduler_ops,
-    scheduling_catalyst,
     search,
     sessions,
     settings,
@@ -200,17 +196,6 @@ api_router.include_router(export.router, prefix="/export", tags=["export"])
 api_router.include_router(exports.router, prefix="/exports", tags=["exports"])
 api_router.include_router(reports.router, prefix="/reports", tags=["reports"])
 api_router.include_router(resilience.router, prefix="/resilience", tags=["resilience"])
-api_router.include_router(
-    exotic_resilience.router,
-    prefix="/resilience/exotic",
-    tags=["exotic-resilience"],
-)
-api_router.include_router(
-    fatigue_risk.router
-)  # prefix="/fatigue-risk" defined in router
-api_router.include_router(
-    game_theory.router, prefix="/game-theory", tags=["game-theory"]
-)
 api_router.include_router(
     scheduler_ops.router, prefix="/scheduler", tags=["scheduler-ops"]
 )
@@ -250,19 +235,11 @@ api_router.include_router(
 )
 api_router.include_router(rate_limit.router, prefix="/rate-limit", tags=["rate-limit"])
 api_router.include_router(quota.router, prefix="/quota", tags=["quota"])
-api_router.include_router(
-    scheduling_catalyst.router,
-    prefix="/scheduling-catalyst",
-    tags=["scheduling-catalyst"],
-)
 api_router.include_router(ml.router, prefix="/ml", tags=["ml"])
 api_router.include_router(rag.router, prefix="/rag", tags=["rag"])
 api_router.include_router(
     task_history.router, prefix="/task-history", tags=["task-history"]
 )
-api_router.include_router(
-    qubo_templates.router, prefix="/qubo-templates", tags=["qubo-templates"]
-)
 api_router.include_router(mcp_proxy.router, prefix="/mcp", tags=["mcp-proxy"])
 # FMIT scheduling routes
 api_router.include_router(swap.router)  # prefix="/swaps" defined in router
@@ -332,3 +309,25 @@ api_router.include_router(
     prefix="/graduation-requirements",
     tags=["graduation-requirements"],
 )
+
+# Routers for rarely used subsystems. These pull in heavy numeric and
+# solver dependencies, so they are mounted on first request (see
+# app.api.lazy_router) instead of at import time.
+LAZY_ROUTERS = [
+    LazyRouterSpec(
+        "app.api.routes.exotic_resilience",
+        "/resilience/exotic",
+        tags=("exotic-resilience",),
+    ),
+    # prefix="/fatigue-risk" defined in router
+    LazyRouterSpec("app.api.routes.fatigue_risk", "/fatigue-risk", router_prefix=""),
+    LazyRouterSpec("app.api.routes.game_theory", "/game-theory", tags=("game-theory",)),
+    LazyRouterSpec(
+        "app.api.routes.scheduling_catalyst",
+        "/scheduling-catalyst",
+        tags=("scheduling-catalyst",),
+    ),
+    LazyRouterSpec(
+        "app.api.routes.qubo_templates", "/qubo-templates", tags=("qubo-templates",)
+    ),
+]
@@ -25,7 +25,7 @@ from app.analytics.metrics import (
     calculate_fairness_index,
 )
 from app.core.security import get_current_active_user
-from app.db.session import get_async_db, get_db
+from app.db.session import get_async_db, get_db, get_read_db
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.person import Person
@@ -100,7 +100,7 @@ def _anonymize_id(original_id: str, salt: str = "research") -> str:
 
 @router.get("/analytics/metrics/current", response_model=ScheduleVersionMetrics)
 async def get_current_metrics(
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> ScheduleVersionMetrics:
     """
@@ -191,7 +191,7 @@ async def get_metrics_history(
     ),
     start_date: datetime = Query(..., description="Start date (ISO format)"),
     end_date: datetime = Query(..., description="End date (ISO format)"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> list[MetricTimeSeries]:
     """
@@ -326,7 +326,7 @@ async def get_metrics_history(
 @router.get("/analytics/fairness/trend", response_model=FairnessTrendReport)
 async def get_fairness_trend(
     months: int = Query(6, ge=1, le=24, description="Number of months to analyze"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> FairnessTrendReport:
     """
@@ -475,7 +475,7 @@ async def get_fairness_trend(
 async def compare_versions(
     version_a: str,
     version_b: str,
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> VersionComparison:
     """
@@ -782,7 +782,7 @@ async def export_for_research(
     start_date: datetime = Query(..., description="Start date (ISO format)"),
     end_date: datetime = Query(..., description="End date (ISO format)"),
     anonymize: bool = Query(True, description="Anonymize sensitive data"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> ResearchDataExport:
     """
@@ -8,10 +8,13 @@ import csv
 import io
 import json
 import logging
+from collections.abc import Iterable, Iterator
 from datetime import UTC, datetime, timedelta
+from itertools import chain
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from fastapi.responses import StreamingResponse
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
@@ -378,6 +381,9 @@ async def get_audit_logs(
     search: str | None = Query(None, description="Search query"),
     entity_id: str | None = Query(None, description="Filter by specific entity ID"),
     acgme_overrides_only: bool = Query(False, description="Show only ACGME overrides"),
+    cursor: str | None = Query(
+        None, description="Cursor from a previous page's nextCursor (overrides page)"
+    ),
     db=Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> AuditLogResponse:
@@ -393,6 +399,9 @@ async def get_audit_logs(
     - Search text
     - Specific entity
     - ACGME overrides only
+
+    Pass ``nextCursor`` back as ``cursor`` to page through history with
+    keyset pagination, whose cost does not grow with the page number.
     """
     # Parse comma-separated filters
     entity_types_list = entity_types.split(",") if entity_types else None
@@ -400,12 +409,20 @@ async def get_audit_logs(
     user_ids_list = user_ids.split(",") if user_ids else None
     severity_list = severity.split(",") if severity else None
 
+    after = None
+    if cursor:
+        try:
+            after = audit_service.AuditCursor.decode(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
     # Try to get real audit data from SQLAlchemy-Continuum
     try:
-        entries, total = audit_service.get_audit_logs(
-            db=db,
+        result = audit_service.query_audit_logs(
+            db,
             page=page,
             page_size=page_size,
+            after=after,
             start_date=start_date,
             end_date=end_date,
             entity_types=entity_types_list,
@@ -416,19 +433,21 @@ async def get_audit_logs(
             entity_id=entity_id,
             acgme_overrides_only=acgme_overrides_only,
         )
+        total = result.total or 0
 
         # If we got real data, use it
         if total > 0:
             logger.info(f"Retrieved {total} real audit entries")
             total_pages = (total + page_size - 1) // page_size
             return AuditLogResponse(
-                items=entries,
+                items=result.entries,
                 total=total,
                 page=page,
                 page_size=page_size,
                 total_pages=total_pages,
+                next_cursor=result.next_cursor.encode() if result.next_cursor else None,
             )
-    except (ValueError, KeyError, AttributeError) as e:
+    except (ValueError, KeyError, AttributeError, SQLAlchemyError) as e:
         logger.warning(
             f"Error fetching real audit data, falling back to mock: {e}", exc_info=True
         )
@@ -646,26 +665,30 @@ async def export_audit_logs(
         start_date = filters.date_range.start
         end_date = filters.date_range.end
 
-    # Try to get real audit data
-    entries = []
+    # Try to stream real audit data
+    entries: Iterable[AuditLogEntry] = []
+    acgme_columns = acgme_only
+    filter_params = {
+        "start_date": start_date,
+        "end_date": end_date,
+        "entity_types": entity_types,
+        "actions": actions,
+        "user_ids": user_ids,
+        "severity": severity_list,
+        "search": search,
+        "entity_id": entity_id,
+        "acgme_overrides_only": acgme_only,
+    }
     try:
-        entries, _ = audit_service.get_audit_logs(  # type: ignore[assignment]
-            db=db,
-            page=1,
-            page_size=10000,  # Export all matching entries
-            start_date=start_date,
-            end_date=end_date,
-            entity_types=entity_types,
-            actions=actions,
-            user_ids=user_ids,
-            severity=severity_list,
-            search=search,
-            entity_id=entity_id,
-            acgme_overrides_only=acgme_only,
-        )
-        if entries:
-            logger.info(f"Exporting {len(entries)} real audit entries")
-    except (ValueError, KeyError, AttributeError) as e:
+        stream = audit_service.iter_audit_logs(db, **filter_params)
+        first = next(stream, None)
+        if first is not None:
+            logger.info("Exporting real audit entries")
+            entries = chain([first], stream)
+            acgme_columns = acgme_only or audit_service.has_acgme_overrides(
+                db, **filter_params
+            )
+    except (ValueError, KeyError, AttributeError, SQLAlchemyError) as e:
         logger.warning(
             f"Error fetching real audit data for export, falling back to mock: {e}",
             exc_info=True,
@@ -677,35 +700,84 @@ async def export_audit_logs(
         entries, _ = _generate_mock_audit_entries(  # type: ignore[assignment]
             page=1,
             page_size=10000,
-            start_date=start_date,
-            end_date=end_date,
-            entity_types=entity_types,
-            actions=actions,
-            user_ids=user_ids,
-            severity=severity_list,
-            search=search,
-            entity_id=entity_id,
-            acgme_overrides_only=acgme_only,
+            **filter_params,
         )
+        acgme_columns = acgme_only or any(e.acgme_override for e in entries)
 
     if config.format == "json":
-        # Export as JSON
-        output = io.StringIO()
-        json_data = [entry.model_dump(by_alias=True) for entry in entries]
-        json.dump(json_data, output, indent=2)
-        output.seek(0)
-
         return StreamingResponse(
-            iter([output.getvalue()]),
+            _stream_json(entries),
             media_type="application/json",
             headers={"Content-Disposition": "attachment; filename=audit_logs.json"},
         )
 
     elif config.format == "csv":
-        # Export as CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
+        return StreamingResponse(
+            _stream_csv(entries, config, acgme_columns),
+            media_type="text/csv",
+            headers={"Content-Disposition": "attachment; filename=audit_logs.csv"},
+        )
+
+    elif config.format == "pdf":
+        return StreamingResponse(
+            _stream_pdf(entries, config),
+            media_type="application/pdf",
+            headers={"Content-Disposition": "attachment; filename=audit_logs.pdf"},
+        )
+
+    else:
+        raise HTTPException(
+            status_code=400, detail=f"Unsupported export format: {config.format}"
+        )
+
+
+# Entries written per chunk of a streamed export
+EXPORT_CHUNK_SIZE = 200
+
+
+def _chunks(lines: Iterable[str]) -> Iterator[str]:
+    """Group export lines into chunks of ``EXPORT_CHUNK_SIZE`` entries."""
+    chunk = []
+    for line in lines:
+        chunk.append(line)
+        if len(chunk) >= EXPORT_CHUNK_SIZE:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+def _stream_json(entries: Iterable[AuditLogEntry]) -> Iterator[str]:
+    """Stream entries as a JSON array, formatted like ``json.dump(indent=2)``."""
 
+    def lines() -> Iterator[str]:
+        separator = "[\n"
+        for entry in entries:
+            item = json.dumps(entry.model_dump(by_alias=True), indent=2)
+            yield separator + "  " + item.replace("\n", "\n  ")
+            separator = ",\n"
+        yield "[]" if separator == "[\n" else "\n]"
+
+    return _chunks(lines())
+
+
+def _stream_csv(
+    entries: Iterable[AuditLogEntry],
+    config: AuditExportConfig,
+    acgme_columns: bool,
+) -> Iterator[str]:
+    """Stream entries as CSV rows."""
+    output = io.StringIO()
+    writer = csv.writer(output)
+
+    def line(row: list) -> str:
+        writer.writerow(row)
+        value = output.getvalue()
+        output.seek(0)
+        output.truncate()
+        return value
+
+    def lines() -> Iterator[str]:
         # Header
         header = [
             "ID",
@@ -726,10 +798,10 @@ async def export_audit_logs(
         if config.include_metadata:
             header.append("Metadata")
 
-        if acgme_only or any(e.acgme_override for e in entries):
+        if acgme_columns:
             header.extend(["ACGME Override", "ACGME Justification"])
 
-        writer.writerow(header)
+        yield line(header)
 
         # Rows
         for entry in entries:
@@ -761,7 +833,7 @@ async def export_audit_logs(
                 metadata_str = json.dumps(entry.metadata) if entry.metadata else ""
                 row.append(metadata_str)
 
-            if acgme_only or any(e.acgme_override for e in entries):
+            if acgme_columns:
                 row.extend(
                     [
                         "Yes" if entry.acgme_override else "No",
@@ -769,24 +841,22 @@ async def export_audit_logs(
                     ]
                 )
 
-            writer.writerow(row)
+            yield line(row)
 
-        output.seek(0)
+    return _chunks(lines())
 
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="text/csv",
-            headers={"Content-Disposition": "attachment; filename=audit_logs.csv"},
-        )
 
-    elif config.format == "pdf":
-        # For PDF, return a simple text representation
-        # In production, this would use a proper PDF library like ReportLab
-        output = io.StringIO()
-        output.write("AUDIT LOG REPORT\n")
-        output.write("=" * 80 + "\n\n")
+def _stream_pdf(
+    entries: Iterable[AuditLogEntry], config: AuditExportConfig
+) -> Iterator[str]:
+    """Stream entries as a plain-text report."""
+    # In production, this would use a proper PDF library like ReportLab
+
+    def lines() -> Iterator[str]:
+        yield "AUDIT LOG REPORT\n" + "=" * 80 + "\n\n"
 
         for entry in entries:
+            output = io.StringIO()
             output.write(f"ID: {entry.id}\n")
             output.write(f"Timestamp: {entry.timestamp}\n")
             output.write(
@@ -811,19 +881,9 @@ async def export_audit_logs(
                     )
 
             output.write("-" * 80 + "\n\n")
+            yield output.getvalue()
 
-        output.seek(0)
-
-        return StreamingResponse(
-            iter([output.getvalue()]),
-            media_type="application/pdf",
-            headers={"Content-Disposition": "attachment; filename=audit_logs.pdf"},
-        )
-
-    else:
-        raise HTTPException(
-            status_code=400, detail=f"Unsupported export format: {config.format}"
-        )
+    return _chunks(lines())
 
 
 @router.post("/mark-reviewed", status_code=204)
@@ -1,14 +1,16 @@
 """Calendar export API routes."""
 
 import logging
-from datetime import date, datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
+from email.utils import format_datetime, parsedate_to_datetime
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
+from app.caching.etag import ETagGenerator
 from app.core.security import get_current_active_user
 from app.db.session import get_db
 from app.models.user import User
@@ -17,14 +19,44 @@ from app.schemas.calendar import (
     CalendarSubscriptionListResponse,
     CalendarSubscriptionResponse,
 )
-from app.services.calendar_service import CalendarService
+from app.services.calendar_service import CalendarService, FeedVersion
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _validators(version: FeedVersion) -> dict[str, str]:
+    """ETag and Last-Modified headers for a feed."""
+    headers = {"ETag": version.etag}
+    if version.last_modified is not None:
+        headers["Last-Modified"] = format_datetime(version.last_modified, usegmt=True)
+    return headers
+
+
+def _not_modified(request: Request, version: FeedVersion) -> bool:
+    """Whether the client's cached copy is current (If-None-Match wins)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        return ETagGenerator.matches_any(
+            version.etag, ETagGenerator.parse_if_none_match(if_none_match)
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or version.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=UTC)
+    # HTTP dates have one-second resolution
+    return version.last_modified.replace(microsecond=0) <= since
+
+
 @router.get("/export/ics")
 async def export_all_calendars(
+    request: Request,
     start_date: date = Query(..., description="Start date for calendar export"),
     end_date: date = Query(..., description="End date for calendar export"),
     person_ids: list[UUID] | None = Query(None, description="Person UUIDs to filter"),
@@ -42,8 +74,11 @@ async def export_all_calendars(
     Downloads an ICS file containing all assignments within the date range.
     Can be filtered by persons, rotations, or rotation types.
     Compatible with Google Calendar, Outlook, and Apple Calendar.
+    Answers 304 when If-None-Match/If-Modified-Since show the schedule is
+    unchanged.
 
     Args:
+        request: HTTP request (for conditional headers)
         start_date: Start date for export (YYYY-MM-DD)
         end_date: End date for export (YYYY-MM-DD)
         person_ids: Optional list of person UUIDs to filter
@@ -52,10 +87,21 @@ async def export_all_calendars(
         db: Database session
 
     Returns:
-        ICS file download
+        ICS file download, streamed
     """
     try:
-        ics_content = CalendarService.generate_ics_all(
+        version = CalendarService.all_feed_version(
+            db,
+            start_date,
+            end_date,
+            person_ids=person_ids,
+            rotation_ids=rotation_ids,
+            include_types=include_types,
+        )
+        if _not_modified(request, version):
+            return Response(status_code=304, headers=_validators(version))
+
+        stream = CalendarService.stream_ics_all(
             db=db,
             start_date=start_date,
             end_date=end_date,
@@ -65,11 +111,12 @@ async def export_all_calendars(
         )
 
         # Return ICS file as download
-        return Response(
-            content=ics_content,
+        return StreamingResponse(
+            stream,
             media_type="text/calendar",
             headers={
-                "Content-Disposition": f'attachment; filename="complete_schedule_{start_date}_{end_date}.ics"'
+                **_validators(version),
+                "Content-Disposition": f'attachment; filename="complete_schedule_{start_date}_{end_date}.ics"',
             },
         )
     except (ValueError, KeyError, AttributeError) as e:
@@ -81,6 +128,7 @@ async def export_all_calendars(
 
 @router.get("/export/ics/{person_id}")
 async def export_person_ics(
+    request: Request,
     person_id: UUID,
     start_date: date = Query(..., description="Start date for calendar export"),
     end_date: date = Query(..., description="End date for calendar export"),
@@ -96,6 +144,7 @@ async def export_person_ics(
     within the date range. Can be imported into Google Calendar, Outlook, or Apple Calendar.
 
     Args:
+        request: HTTP request (for conditional headers)
         person_id: Person UUID
         start_date: Start date for export (YYYY-MM-DD)
         end_date: End date for export (YYYY-MM-DD)
@@ -103,10 +152,16 @@ async def export_person_ics(
         db: Database session
 
     Returns:
-        ICS file download
+        ICS file download, streamed (304 if unchanged)
     """
     try:
-        ics_content = CalendarService.generate_ics_for_person(
+        version = CalendarService.person_feed_version(
+            db, person_id, start_date, end_date, include_types
+        )
+        if _not_modified(request, version):
+            return Response(status_code=304, headers=_validators(version))
+
+        stream = CalendarService.stream_ics_for_person(
             db=db,
             person_id=person_id,
             start_date=start_date,
@@ -115,11 +170,12 @@ async def export_person_ics(
         )
 
         # Return ICS file as download
-        return Response(
-            content=ics_content,
+        return StreamingResponse(
+            stream,
             media_type="text/calendar",
             headers={
-                "Content-Disposition": f'attachment; filename="schedule_{person_id}_{start_date}_{end_date}.ics"'
+                **_validators(version),
+                "Content-Disposition": f'attachment; filename="schedule_{person_id}_{start_date}_{end_date}.ics"',
             },
         )
     except ValueError as e:
@@ -134,6 +190,7 @@ async def export_person_ics(
 
 @router.get("/export/person/{person_id}")
 async def export_person_calendar(
+    request: Request,
     person_id: UUID,
     start_date: date = Query(..., description="Start date for calendar export"),
     end_date: date = Query(..., description="End date for calendar export"),
@@ -149,6 +206,7 @@ async def export_person_calendar(
     within the date range. Can be imported into Google Calendar, Outlook, or Apple Calendar.
 
     Args:
+        request: HTTP request (for conditional headers)
         person_id: Person UUID
         start_date: Start date for export (YYYY-MM-DD)
         end_date: End date for export (YYYY-MM-DD)
@@ -156,10 +214,16 @@ async def export_person_calendar(
         db: Database session
 
     Returns:
-        ICS file download
+        ICS file download, streamed (304 if unchanged)
     """
     try:
-        ics_content = CalendarService.generate_ics_for_person(
+        version = CalendarService.person_feed_version(
+            db, person_id, start_date, end_date, include_types
+        )
+        if _not_modified(request, version):
+            return Response(status_code=304, headers=_validators(version))
+
+        stream = CalendarService.stream_ics_for_person(
             db=db,
             person_id=person_id,
             start_date=start_date,
@@ -168,11 +232,12 @@ async def export_person_calendar(
         )
 
         # Return ICS file as download
-        return Response(
-            content=ics_content,
+        return StreamingResponse(
+            stream,
             media_type="text/calendar",
             headers={
-                "Content-Disposition": f'attachment; filename="schedule_{person_id}_{start_date}_{end_date}.ics"'
+                **_validators(version),
+                "Content-Disposition": f'attachment; filename="schedule_{person_id}_{start_date}_{end_date}.ics"',
             },
         )
     except ValueError as e:
@@ -187,6 +252,7 @@ async def export_person_calendar(
 
 @router.get("/export/rotation/{rotation_id}")
 async def export_rotation_calendar(
+    request: Request,
     rotation_id: UUID,
     start_date: date = Query(..., description="Start date for calendar export"),
     end_date: date = Query(..., description="End date for calendar export"),
@@ -199,16 +265,23 @@ async def export_rotation_calendar(
     within the date range. Useful for rotation coordinators to see who is assigned.
 
     Args:
+        request: HTTP request (for conditional headers)
         rotation_id: Rotation template UUID
         start_date: Start date for export (YYYY-MM-DD)
         end_date: End date for export (YYYY-MM-DD)
         db: Database session
 
     Returns:
-        ICS file download
+        ICS file download, streamed (304 if unchanged)
     """
     try:
-        ics_content = CalendarService.generate_ics_for_rotation(
+        version = CalendarService.rotation_feed_version(
+            db, rotation_id, start_date, end_date
+        )
+        if _not_modified(request, version):
+            return Response(status_code=304, headers=_validators(version))
+
+        stream = CalendarService.stream_ics_for_rotation(
             db=db,
             rotation_id=rotation_id,
             start_date=start_date,
@@ -216,11 +289,12 @@ async def export_rotation_calendar(
         )
 
         # Return ICS file as download
-        return Response(
-            content=ics_content,
+        return StreamingResponse(
+            stream,
             media_type="text/calendar",
             headers={
-                "Content-Disposition": f'attachment; filename="rotation_{rotation_id}_{start_date}_{end_date}.ics"'
+                **_validators(version),
+                "Content-Disposition": f'attachment; filename="rotation_{rotation_id}_{start_date}_{end_date}.ics"',
             },
         )
     except ValueError as e:
@@ -311,6 +385,7 @@ async def create_subscription(
 @router.get("/subscribe/{token}")
 async def get_subscription_feed(
     token: str,
+    request: Request,
     db=Depends(get_db),
 ) -> Response:
     """
@@ -326,10 +401,13 @@ async def get_subscription_feed(
 
     **Cache behavior:**
     Calendar apps typically poll every 15-60 minutes. The response includes
-    Cache-Control headers to suggest a 15-minute refresh interval.
+    Cache-Control headers to suggest a 15-minute refresh interval, plus an
+    ETag and Last-Modified; polls that send them back get 304 Not Modified
+    until the person's schedule changes.
 
     Args:
         token: Subscription token from the URL
+        request: HTTP request (for conditional headers)
         db: Database session
 
     Returns:
@@ -348,7 +426,20 @@ async def get_subscription_feed(
         start_date = date.today()
         end_date = (datetime.now() + timedelta(days=180)).date()
 
-        ics_content = CalendarService.generate_ics_for_person(
+        version = CalendarService.person_feed_version(
+            db, person_id, start_date, end_date
+        )
+        headers = {
+            **_validators(version),
+            # Suggest 15-minute refresh, but allow caching
+            "Cache-Control": "private, max-age=900",
+            # Prevent transformation by proxies
+            "X-Content-Type-Options": "nosniff",
+        }
+        if _not_modified(request, version):
+            return Response(status_code=304, headers=headers)
+
+        stream = CalendarService.stream_ics_for_person(
             db=db,
             person_id=person_id,
             start_date=start_date,
@@ -356,16 +447,10 @@ async def get_subscription_feed(
         )
 
         # Return ICS with proper headers for calendar apps
-        return Response(
-            content=ics_content,
+        return StreamingResponse(
+            stream,
             media_type="text/calendar",
-            headers={
-                "Content-Type": "text/calendar; charset=utf-8",
-                # Suggest 15-minute refresh, but allow caching
-                "Cache-Control": "private, max-age=900",
-                # Prevent transformation by proxies
-                "X-Content-Type-Options": "nosniff",
-            },
+            headers={"Content-Type": "text/calendar; charset=utf-8", **headers},
         )
     except HTTPException:
         raise
@@ -469,7 +554,8 @@ async def revoke_subscription(
 @router.get("/feed/{token}")
 async def get_subscription_feed_legacy(
     token: str,
+    request: Request,
     db=Depends(get_db),
 ) -> Response:
-    """Legacy endpoint - redirects to /subscribe/{token}."""
-    return get_subscription_feed(token, db)
+    """Legacy endpoint - serves the same feed as /subscribe/{token}."""
+    return await get_subscription_feed(token, request, db)
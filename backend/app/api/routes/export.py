@@ -13,7 +13,7 @@ from sqlalchemy.orm import joinedload
 
 from app.api.dependencies.role_filter import require_admin
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models.absence import Absence
 from app.models.assignment import Assignment
 from app.models.block import Block
@@ -59,7 +59,7 @@ def create_json_response(data: list, filename: str) -> StreamingResponse:
 @router.get("/people")
 async def export_people(
     format: str = Query("csv", description="Export format: csv or json"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
 ):
@@ -96,7 +96,7 @@ async def export_absences(
     format: str = Query("csv", description="Export format: csv or json"),
     start_date: date | None = Query(None, description="Filter absences starting from"),
     end_date: date | None = Query(None, description="Filter absences ending by"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
 ):
@@ -150,7 +150,7 @@ async def export_schedule(
     format: str = Query("csv", description="Export format: csv or json"),
     start_date: date = Query(..., description="Schedule start date"),
     end_date: date = Query(..., description="Schedule end date"),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
 ):
@@ -222,7 +222,7 @@ async def export_schedule_xlsx(
     include_overrides: bool = Query(
         True, description="Include override assignments in export"
     ),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
 ):
@@ -281,7 +281,7 @@ async def export_schedule_year_xlsx(
     include_overrides: bool = Query(
         True, description="Include override assignments in export"
     ),
-    db=Depends(get_db),
+    db=Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
     _: None = Depends(require_admin()),
 ):
@@ -18,7 +18,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.security import get_current_active_user
 from app.core.slowapi_limiter import limiter
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.exports.jobs import execute_export_job
 from app.exports.scheduler import ExportSchedulerService
 from app.models.export_job import (
@@ -81,7 +81,7 @@ async def list_export_jobs(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     enabled_only: bool = Query(False, description="Only return enabled jobs"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -113,7 +113,7 @@ async def list_export_jobs(
 @router.get("/{job_id}", response_model=ExportJobResponse)
 async def get_export_job(
     job_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -240,7 +240,7 @@ async def list_job_executions(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     status: ExportJobStatus | None = Query(None, description="Filter by status"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -295,7 +295,7 @@ async def list_job_executions(
 @router.get("/executions/{execution_id}", response_model=ExportJobExecutionResponse)
 async def get_execution(
     execution_id: str,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
@@ -430,7 +430,7 @@ async def list_export_templates(
 
 @router.get("/stats/overview", response_model=ExportJobStatsResponse)
 async def get_export_stats(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """
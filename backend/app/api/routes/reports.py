@@ -9,7 +9,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import select
 
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models.user import User
 from app.schemas.reports import (
     AnalyticsReportRequest,
@@ -33,7 +33,7 @@ logger = logging.getLogger(__name__)
 @router.post("/schedule", response_model=ReportResponse)
 async def generate_schedule_report(
     request: ScheduleReportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> StreamingResponse:
     """
@@ -97,7 +97,7 @@ async def generate_schedule_report(
 @router.post("/compliance", response_model=ReportResponse)
 async def generate_compliance_report(
     request: ComplianceReportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> StreamingResponse:
     """
@@ -163,7 +163,7 @@ async def generate_compliance_report(
 @router.post("/analytics", response_model=ReportResponse)
 async def generate_analytics_report(
     request: AnalyticsReportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> StreamingResponse:
     """
@@ -229,7 +229,7 @@ async def generate_analytics_report(
 @router.post("/faculty-summary", response_model=ReportResponse)
 async def generate_faculty_summary_report(
     request: FacultySummaryReportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> StreamingResponse:
     """
@@ -301,7 +301,7 @@ async def get_block_quality_report(
     block_number: int = Query(..., ge=0, le=13),
     academic_year: int | None = Query(None),
     format: str = Query("summary", pattern="^(summary|full|markdown)$"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Generate a block quality report (summary/full/markdown)."""
@@ -347,7 +347,7 @@ async def get_multi_block_quality_report(
     ),
     academic_year: int | None = Query(None),
     include_summary: bool = Query(True),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ):
     """Generate block quality summaries for multiple blocks."""
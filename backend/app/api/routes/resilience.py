@@ -37,7 +37,7 @@ logger = logging.getLogger(__name__)
 
 from app.api.dependencies.role_filter import require_admin
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_db, get_read_db
 from app.models.resilience import (
     FallbackActivation,
     ResilienceEvent,
@@ -222,7 +222,7 @@ async def get_system_health(
     max_assignments: int | None = Query(
         None, ge=1, description="Optional limit for assignment records"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get current system health status.
@@ -428,7 +428,7 @@ async def deactivate_crisis_response(
 
 @router.get("/fallbacks", response_model=FallbackListResponse)
 async def list_fallbacks(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     List all available fallback schedules.
@@ -487,6 +487,8 @@ async def activate_fallback(
     Activate a pre-computed fallback schedule. Requires admin role.
 
     This instantly switches to the fallback schedule without recomputation.
+    With ``faculty_ids`` and absence dates, the pre-solved repair for those
+    faculty is applied to the schedule for the absence.
     """
     service = get_resilience_service(db)
 
@@ -509,27 +511,59 @@ async def activate_fallback(
             status_code=400, detail=f"Unknown scenario: {request.scenario}"
         )
 
-    fallback = service.activate_fallback(
-        scenario=service_scenario,
-        approved_by=str(current_user.id),
-    )
-
-    if not fallback:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Fallback schedule for '{request.scenario.value}' not found or not precomputed",
+    if request.faculty_ids:
+        # Apply the pre-solved repair for these faculty over the absence
+        activated = service.activate_fallback_for_absence(
+            faculty_ids=request.faculty_ids,
+            start_date=request.start_date,
+            end_date=request.end_date,
+            approved_by=str(current_user.id),
+        )
+        if not activated:
+            raise HTTPException(
+                status_code=404,
+                detail="No precomputed fallback repair for these faculty",
+            )
+        repair, assignments_count = activated
+        fallback = service.fallback.fallback_schedules.get(service_scenario)
+        coverage_rate = repair.coverage_rate
+        services_reduced = fallback.services_reduced if fallback else []
+        assumptions = fallback.assumptions if fallback else []
+        message = (
+            f"Fallback '{request.scenario.value}' activated: "
+            f"{assignments_count} assignments reassigned, "
+            f"{len(repair.uncovered)} left uncovered"
+        )
+    else:
+        fallback = service.activate_fallback(
+            scenario=service_scenario,
+            approved_by=str(current_user.id),
         )
 
+        if not fallback:
+            raise HTTPException(
+                status_code=404,
+                detail=(
+                    f"Fallback schedule for '{request.scenario.value}' "
+                    "not found or not precomputed"
+                ),
+            )
+        assignments_count = len(fallback.assignments)
+        coverage_rate = fallback.coverage_rate
+        services_reduced = fallback.services_reduced
+        assumptions = fallback.assumptions
+        message = f"Fallback '{request.scenario.value}' activated successfully"
+
     # Persist activation
     activation = FallbackActivation(
         scenario=request.scenario.value,
         scenario_description=_get_scenario_description(request.scenario),
         activated_by=str(current_user.id),
         activation_reason=request.reason,
-        assignments_count=len(fallback.assignments),
-        coverage_rate=fallback.coverage_rate,
-        services_reduced=fallback.services_reduced,
-        assumptions=fallback.assumptions,
+        assignments_count=assignments_count,
+        coverage_rate=coverage_rate,
+        services_reduced=services_reduced,
+        assumptions=assumptions,
     )
     db.add(activation)
 
@@ -547,10 +581,10 @@ async def activate_fallback(
     return FallbackActivationResponse(
         success=True,
         scenario=request.scenario,
-        assignments_count=len(fallback.assignments),
-        coverage_rate=fallback.coverage_rate,
-        services_reduced=fallback.services_reduced,
-        message=f"Fallback '{request.scenario.value}' activated successfully",
+        assignments_count=assignments_count,
+        coverage_rate=coverage_rate,
+        services_reduced=services_reduced,
+        message=message,
     )
 
 
@@ -617,7 +651,7 @@ async def deactivate_fallback(
 
 @router.get("/load-shedding", response_model=LoadSheddingStatus)
 async def get_load_shedding_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get current load shedding status.
@@ -717,7 +751,7 @@ async def get_vulnerability_report(
     start_date: date | None = None,
     end_date: date | None = None,
     include_n2: bool = Query(True, description="Include N-2 analysis (more expensive)"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Run full N-1/N-2 vulnerability analysis.
@@ -833,7 +867,7 @@ async def get_comprehensive_report(
     max_assignments: int | None = Query(
         None, ge=1, description="Optional limit for assignment records"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Generate comprehensive resilience report.
@@ -919,7 +953,7 @@ async def get_health_check_history(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     status: OverallStatus | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get historical health check records.
@@ -968,7 +1002,7 @@ async def get_event_history(
     page: int = Query(1, ge=1),
     page_size: int = Query(50, ge=1, le=100),
     event_type: str | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get historical resilience events.
@@ -1045,7 +1079,7 @@ async def get_mtf_compliance(
     check_circuit_breaker: bool = Query(
         True, description="Check circuit breaker status"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get MTF (Military Treatment Facility) compliance status using the Iron Dome service.
@@ -1228,7 +1262,7 @@ async def get_mtf_compliance(
 
 @router.get("/tier2/homeostasis", response_model=HomeostasisStatusResponse)
 async def get_homeostasis_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get current homeostasis status including feedback loops and allostatic load.
@@ -1388,7 +1422,7 @@ async def calculate_allostatic_load(
 
 @router.get("/tier2/zones", response_model=ZoneListResponse)
 async def list_zones(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     List all scheduling zones and their current status.
@@ -1427,7 +1461,7 @@ async def list_zones(
 
 @router.get("/tier2/zones/report", response_model=BlastRadiusReportResponse)
 async def get_blast_radius_report(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get comprehensive blast radius containment report.
@@ -1654,7 +1688,7 @@ async def set_containment_level(
 
 @router.get("/tier2/equilibrium", response_model=EquilibriumReportResponse)
 async def get_equilibrium_report(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get comprehensive equilibrium analysis report.
@@ -1974,7 +2008,7 @@ async def calculate_equilibrium_shift(
 
 @router.get("/tier2/status", response_model=Tier2StatusResponse)
 async def get_tier2_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get combined status of all Tier 2 resilience components.
@@ -2066,7 +2100,7 @@ async def end_cognitive_session(
 )
 async def get_cognitive_session_status(
     session_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get cognitive load status for a session.
@@ -2191,7 +2225,7 @@ async def resolve_decision(
 
 @router.get("/tier3/cognitive/queue", response_model=DecisionQueueResponse)
 async def get_decision_queue(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get status of pending decision queue.
@@ -2220,7 +2254,7 @@ async def get_decision_queue(
     response_model=PrioritizedDecisionsResponse,
 )
 async def get_prioritized_decisions(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get pending decisions in recommended processing order."""
     service = get_resilience_service(db)
@@ -2360,7 +2394,7 @@ async def record_behavioral_signal(
 async def get_collective_preference(
     slot_type: str | None = None,
     slot_id: UUID | None = None,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get aggregated preference for a slot or slot type."""
     service = get_resilience_service(db)
@@ -2394,7 +2428,7 @@ async def get_faculty_preferences(
     faculty_id: UUID,
     trail_type: str | None = None,
     min_strength: float = 0.1,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get all preference trails for a faculty member."""
     from app.resilience.stigmergy import TrailType
@@ -2432,7 +2466,7 @@ async def get_faculty_preferences(
 
 @router.get("/tier3/stigmergy/swap-network", response_model=SwapNetworkResponse)
 async def get_swap_network(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get swap affinity network showing faculty pairings."""
     service = get_resilience_service(db)
@@ -2480,7 +2514,7 @@ async def suggest_assignments(
 
 @router.get("/tier3/stigmergy/status", response_model=StigmergyStatusResponse)
 async def get_stigmergy_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get overall status of the stigmergy system."""
     service = get_resilience_service(db)
@@ -2503,7 +2537,7 @@ async def get_stigmergy_status(
 
 @router.get("/tier3/stigmergy/patterns", response_model=StigmergyPatternsResponse)
 async def detect_preference_patterns(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Detect emergent patterns from collective trails."""
     service = get_resilience_service(db)
@@ -2631,7 +2665,7 @@ async def analyze_hubs(
 @router.get("/tier3/hubs/top", response_model=TopHubsResponse)
 async def get_top_hubs(
     n: int = Query(5, ge=1, le=20),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get top N most critical hubs."""
     service = get_resilience_service(db)
@@ -2655,7 +2689,7 @@ async def get_top_hubs(
 @router.get("/tier3/hubs/{faculty_id}/profile", response_model=HubProfileDetailResponse)
 async def get_hub_profile(
     faculty_id: UUID,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get detailed profile for a hub faculty member."""
     service = get_resilience_service(db)
@@ -2685,7 +2719,7 @@ async def get_hub_profile(
     "/tier3/hubs/cross-training", response_model=CrossTrainingRecommendationsResponse
 )
 async def get_cross_training_recommendations(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get cross-training recommendations to reduce hub concentration."""
     service = get_resilience_service(db)
@@ -2760,7 +2794,7 @@ async def create_hub_protection_plan(
 
 @router.get("/tier3/hubs/distribution", response_model=HubDistributionReportResponse)
 async def get_hub_distribution_report(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get report on hub distribution across the system."""
     service = get_resilience_service(db)
@@ -2788,7 +2822,7 @@ async def get_hub_distribution_report(
 
 @router.get("/tier3/hubs/status", response_model=HubStatusResponse)
 async def get_hub_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """Get summary status of hub analysis."""
     service = get_resilience_service(db)
@@ -2804,7 +2838,7 @@ async def get_hub_status(
 
 @router.get("/tier3/status", response_model=Tier3StatusResponse)
 async def get_tier3_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get combined status of all Tier 3 resilience components.
@@ -3082,7 +3116,7 @@ async def calculate_burnout_rt(
 
 @router.get("/circuit-breakers", response_model=AllBreakersStatusResponse)
 async def get_circuit_breakers_status(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get status of all circuit breakers (Netflix Hystrix pattern).
@@ -3170,7 +3204,7 @@ async def get_circuit_breakers_status(
 
 @router.get("/circuit-breakers/health", response_model=BreakerHealthResponse)
 async def get_circuit_breakers_health(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ):
     """
     Get aggregated health metrics for all circuit breakers.
@@ -1150,6 +1150,8 @@ async def find_swap_candidates_json(
     from app.models.block import Block
     from app.models.person import Person
     from app.models.rotation_template import RotationTemplate
+    from app.services.swap.validation import Shift, evaluate_swaps
+    from app.services.swap.validation.batch_compliance import swap_delta
 
     # Validate person exists
     try:
@@ -1268,6 +1270,24 @@ async def find_swap_candidates_json(
         )
     ).all()
 
+    # What-if ACGME check of every candidate trade in one vectorized pass
+    compliance = {}
+    if target_assignment and target_block:
+        requester_shift = Shift(
+            person_uuid, target_block.date, target_block.time_of_day
+        )
+        deltas = [
+            swap_delta(
+                assignment.id,
+                requester_shift,
+                Shift(person.id, block.date, block.time_of_day),
+            )
+            for assignment, block, person, _ in other_assignments
+        ]
+        compliance = {
+            result.key: result for result in await evaluate_swaps(db, deltas)
+        }
+
     for assignment, block, person, rotation in other_assignments:
         # Calculate a simple match score based on various factors
         score = 0.5  # Base score
@@ -1295,6 +1315,11 @@ async def find_swap_candidates_json(
             else:
                 score -= 0.2
 
+        # Penalize trades that would break duty-hour rules for either side
+        candidate_compliance = compliance.get(assignment.id)
+        if candidate_compliance and not candidate_compliance.compliant:
+            score -= 0.4
+
         score = max(0.0, min(1.0, score))
 
         # Determine approval likelihood based on score
@@ -1318,6 +1343,14 @@ async def find_swap_candidates_json(
                 compatibility_factors={
                     "same_type": person.type == requester.type,
                     "same_block": target_block and block.id == target_block.id,
+                    **(
+                        {
+                            "acgme_compliant": candidate_compliance.compliant,
+                            "violated_rules": candidate_compliance.violated_rules,
+                        }
+                        if candidate_compliance
+                        else {}
+                    ),
                 },
                 mutual_benefit=target_block and block.id == target_block.id,
                 approval_likelihood=likelihood,
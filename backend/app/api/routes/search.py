@@ -13,7 +13,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models.user import User
 from app.schemas.search import (
     PeopleSearchRequest,
@@ -36,7 +36,7 @@ router = APIRouter()
 @router.post("", response_model=SearchResponse)
 async def search(
     request: SearchRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SearchResponse:
     """
@@ -84,7 +84,7 @@ async def quick_search(
     query: str = Query(..., min_length=1, max_length=200, description="Search query"),
     entity_type: str = Query(default="person", description="Entity type to search"),
     limit: int = Query(default=10, ge=1, le=50, description="Maximum results"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> QuickSearchResponse:
     """
@@ -117,7 +117,7 @@ async def quick_search(
 @router.post("/people", response_model=SearchResponse)
 async def search_people(
     request: PeopleSearchRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SearchResponse:
     """
@@ -159,7 +159,7 @@ async def search_people(
 @router.post("/rotations", response_model=SearchResponse)
 async def search_rotations(
     request: RotationSearchRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SearchResponse:
     """
@@ -197,7 +197,7 @@ async def search_rotations(
 @router.post("/procedures", response_model=SearchResponse)
 async def search_procedures(
     request: ProcedureSearchRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SearchResponse:
     """
@@ -236,7 +236,7 @@ async def global_search(
     query: str = Query(..., min_length=1, max_length=500, description="Search query"),
     page: int = Query(default=1, ge=1, description="Page number"),
     page_size: int = Query(default=20, ge=1, le=100, description="Results per page"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SearchResponse:
     """
@@ -273,7 +273,7 @@ async def global_search(
 @router.post("/suggest", response_model=SuggestionResponse)
 async def get_suggestions(
     request: SuggestionRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SuggestionResponse:
     """
@@ -311,7 +311,7 @@ async def get_suggestions_get(
         default="person", description="Entity type for suggestions"
     ),
     limit: int = Query(default=10, ge=1, le=50, description="Maximum suggestions"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> SuggestionResponse:
     """
@@ -14,7 +14,7 @@ from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.core.security import get_current_active_user
-from app.db.session import get_db
+from app.db.session import get_read_db
 from app.models.user import User
 from app.schemas.visualization import (
     CoverageHeatmapResponse,
@@ -40,7 +40,7 @@ async def get_unified_heatmap(
     group_by: str = Query(
         "person", description="Group by 'person', 'rotation', 'daily', or 'weekly'"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> HeatmapResponse:
     """
@@ -87,7 +87,7 @@ async def get_unified_heatmap(
 @router.post("/heatmap/unified", response_model=HeatmapResponse)
 async def get_unified_heatmap_with_time_range(
     request: UnifiedHeatmapRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> HeatmapResponse:
     """
@@ -159,7 +159,7 @@ async def get_heatmap_image(
     format: str = Query("png", description="Export format: png, pdf, or svg"),
     width: int = Query(1200, description="Width in pixels", gt=0),
     height: int = Query(800, description="Height in pixels", gt=0),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Response:
     """
@@ -242,7 +242,7 @@ async def get_heatmap_image(
 async def get_coverage_heatmap(
     start_date: date = Query(..., description="Start date for coverage analysis"),
     end_date: date = Query(..., description="End date for coverage analysis"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> CoverageHeatmapResponse:
     """
@@ -275,7 +275,7 @@ async def get_workload_heatmap(
     start_date: date = Query(..., description="Start date"),
     end_date: date = Query(..., description="End date"),
     include_weekends: bool = Query(False, description="Include weekends in analysis"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> HeatmapResponse:
     """
@@ -314,7 +314,7 @@ async def get_workload_heatmap(
 @router.post("/export")
 async def export_heatmap(
     request: ExportRequest,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Response:
     """
@@ -422,7 +422,7 @@ async def get_3d_voxel_grid(
         None, description="Filter by rotation types"
     ),
     include_violations: bool = Query(True, description="Include ACGME violation data"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict:
     """
@@ -603,7 +603,7 @@ async def get_3d_voxel_grid(
 async def get_3d_conflicts(
     start_date: date = Query(..., description="Start date"),
     end_date: date = Query(..., description="End date"),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict:
     """
@@ -657,7 +657,7 @@ async def get_3d_coverage_gaps(
     required_rotation_types: list[str] = Query(
         ["clinic"], description="Rotation types that must be covered"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     current_user: User = Depends(get_current_active_user),
 ) -> dict:
     """
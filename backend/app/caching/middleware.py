@@ -28,8 +28,8 @@ import logging
 from datetime import datetime, UTC
 
 from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
-from starlette.types import ASGIApp
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.caching.etag import ETagGenerator
 from app.caching.http_cache import (
@@ -43,7 +43,7 @@ from app.caching.invalidation import CacheInvalidator, InvalidationReason
 logger = logging.getLogger(__name__)
 
 
-class HTTPCacheMiddleware(BaseHTTPMiddleware):
+class HTTPCacheMiddleware:
     """
     Middleware for automatic HTTP response caching.
 
@@ -54,6 +54,10 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
     - ETag generation
     - Automatic cache invalidation
 
+    Implemented as plain ASGI: response bodies are never buffered, so
+    streaming responses pass through chunk by chunk. A response is cached
+    only when it arrives as a single body message (a regular ``Response``).
+
     Example:
         app.add_middleware(
             HTTPCacheMiddleware,
@@ -87,7 +91,7 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
             exclude_paths: Paths to exclude from caching
             vary_headers: Headers to include in Vary (e.g., ["Accept", "Accept-Language"])
         """
-        super().__init__(app)
+        self.app = app
 
         self.config = config or HTTPCacheConfig(default_max_age=default_max_age)
         self.http_cache = HTTPCache(self.config)
@@ -110,37 +114,43 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
             f"methods={self.cache_methods}"
         )
 
-    async def dispatch(self, request: Request, call_next):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """
         Process request and handle caching.
 
         Args:
-            request: Incoming HTTP request
-            call_next: Next middleware in chain
-
-        Returns:
-            HTTP response (from cache or upstream)
+            scope: ASGI connection scope
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
-        # Skip if caching disabled
-        if not self.config.enabled:
-            return await call_next(request)
+        # Skip non-HTTP scopes and when caching is disabled
+        if scope["type"] != "http" or not self.config.enabled:
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
 
-            # Skip excluded paths
+        # Skip excluded paths
         if self._is_excluded_path(request.url.path):
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
-            # Handle cacheable methods (GET, HEAD)
+        # Handle cacheable methods (GET, HEAD)
         if request.method in self.cache_methods:
-            return await self._handle_cacheable_request(request, call_next)
+            await self._handle_cacheable_request(request, receive, send)
+            return
 
-            # Handle mutation methods (POST, PUT, PATCH, DELETE)
+        # Handle mutation methods (POST, PUT, PATCH, DELETE)
         if request.method in self.mutation_methods:
-            return await self._handle_mutation_request(request, call_next)
+            await self._handle_mutation_request(request, receive, send)
+            return
 
-            # Other methods - pass through
-        return await call_next(request)
+        # Other methods - pass through
+        await self.app(scope, receive, send)
 
-    async def _handle_cacheable_request(self, request: Request, call_next):
+    async def _handle_cacheable_request(
+        self, request: Request, receive: Receive, send: Send
+    ) -> None:
         """
         Handle cacheable request (GET, HEAD).
 
@@ -148,10 +158,8 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
 
         Args:
             request: HTTP request
-            call_next: Next middleware
-
-        Returns:
-            Cached or fresh response
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
         cache_key = self._make_cache_key(request)
         vary_values = self._get_vary_values(request)
@@ -171,7 +179,7 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
                     f"Invalid If-Modified-Since header: {if_modified_since_header}"
                 )
 
-                # Check if resource has been modified
+        # Check if resource has been modified
         if if_none_match or if_modified_since:
             is_modified = await self.http_cache.is_modified(
                 key=cache_key,
@@ -183,25 +191,46 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
             if not is_modified:
                 # Return 304 Not Modified
                 logger.debug(f"Returning 304 Not Modified for {cache_key}")
-                return Response(status_code=304)
+                await Response(status_code=304)(request.scope, receive, send)
+                return
 
-                # Try to get from cache
+        # Try to get from cache
         cached = await self.http_cache.get(cache_key, vary_values)
 
         if cached:
             logger.debug(f"Serving from cache: {cache_key}")
-            return self._create_response_from_cache(cached)
-
-            # Cache miss - get fresh response
-        response = await call_next(request)
-
-        # Cache successful responses
-        if response.status_code == 200:
-            await self._cache_response(request, response, cache_key, vary_values)
+            response = self._create_response_from_cache(cached)
+            await response(request.scope, receive, send)
+            return
 
-        return response
+        # Cache miss - get fresh response. The start message is held until
+        # the first body message so cache headers can still be added.
+        start_message: Message | None = None
 
-    async def _handle_mutation_request(self, request: Request, call_next):
+        async def send_wrapper(message: Message) -> None:
+            nonlocal start_message
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] == "http.response.body" and start_message:
+                start, start_message = start_message, None
+                # Cache successful, non-streaming responses
+                if start["status"] == 200 and not message.get("more_body", False):
+                    await self._cache_response(
+                        request,
+                        MutableHeaders(scope=start),
+                        message.get("body", b""),
+                        cache_key,
+                        vary_values,
+                    )
+                await send(start)
+            await send(message)
+
+        await self.app(request.scope, receive, send_wrapper)
+
+    async def _handle_mutation_request(
+        self, request: Request, receive: Receive, send: Send
+    ) -> None:
         """
         Handle mutation request (POST, PUT, PATCH, DELETE).
 
@@ -209,24 +238,29 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
 
         Args:
             request: HTTP request
-            call_next: Next middleware
-
-        Returns:
-            Response from upstream
+            receive: ASGI receive callable
+            send: ASGI send callable
         """
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
         # Process request
-        response = await call_next(request)
+        await self.app(request.scope, receive, send_wrapper)
 
         # Invalidate cache on successful mutations
-        if 200 <= response.status_code < 300:
+        if 200 <= status_code < 300:
             await self._invalidate_for_mutation(request)
 
-        return response
-
     async def _cache_response(
         self,
         request: Request,
-        response: Response,
+        headers: MutableHeaders,
+        body: bytes,
         cache_key: str,
         vary_values: dict[str, str] | None,
     ) -> None:
@@ -235,57 +269,58 @@ class HTTPCacheMiddleware(BaseHTTPMiddleware):
 
         Args:
             request: HTTP request
-            response: HTTP response
+            headers: Outgoing response headers (cache headers are added)
+            body: Complete response body
             cache_key: Cache key
             vary_values: Vary header values
         """
         # Only cache if response has body
-        if not hasattr(response, "body") or not response.body:
+        if not body:
             return
 
-            # Check if response is cacheable
-        cache_control = response.headers.get("Cache-Control")
+        # Check if response is cacheable
+        cache_control = headers.get("Cache-Control")
         if cache_control:
             directive = CacheDirective.from_header(cache_control)
             if not directive.is_cacheable():
                 logger.debug(f"Response not cacheable: {cache_control}")
                 return
 
-                # Generate ETag if enabled
+        # Generate ETag if enabled
         etag = None
         if self.enable_etag:
-            etag = self.etag_generator.generate(response.body)
-            response.headers["ETag"] = etag
+            etag = self.etag_generator.generate(body)
+            headers["ETag"] = etag
 
-            # Add Last-Modified if enabled
+        # Add Last-Modified if enabled
         last_modified = None
         if self.enable_last_modified:
             last_modified = datetime.now(UTC)
-            response.headers["Last-Modified"] = last_modified.strftime(
+            headers["Last-Modified"] = last_modified.strftime(
                 "%a, %d %b %Y %H:%M:%S GMT"
             )
 
-            # Add Vary header
+        # Add Vary header
         if self.vary_headers:
-            existing_vary = response.headers.get("Vary", "")
+            existing_vary = headers.get("Vary", "")
             vary_set = set(existing_vary.split(", ")) if existing_vary else set()
             vary_set.update(self.vary_headers)
-            response.headers["Vary"] = ", ".join(sorted(vary_set))
+            headers["Vary"] = ", ".join(sorted(vary_set))
 
-            # Add Cache-Control if not present
+        # Add Cache-Control if not present
         if not cache_control:
             directive = CacheDirective(
                 public=self.config.default_public,
                 max_age=self.config.default_max_age,
             )
-            response.headers["Cache-Control"] = directive.to_header()
+            headers["Cache-Control"] = directive.to_header()
 
-            # Create cached response
+        # Create cached response
         cached_response = CachedResponse(
-            status_code=response.status_code,
-            headers=dict(response.headers),
-            body=response.body,
-            content_type=response.headers.get("Content-Type", "application/json"),
+            status_code=200,
+            headers=dict(headers),
+            body=body,
+            content_type=headers.get("Content-Type", "application/json"),
             etag=etag,
             last_modified=last_modified,
             max_age=self.config.default_max_age,
@@ -48,6 +48,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
+from app.core.token_revocation import get_revoked_token_cache
 from app.db.session import get_db
 from app.models.token_blacklist import TokenBlacklist
 
@@ -332,7 +333,7 @@ def verify_audience_token(
             )
 
         # Check if token is blacklisted
-        if db is not None and TokenBlacklist.is_blacklisted(db, jti):
+        if db is not None and get_revoked_token_cache().is_revoked(db, jti):
             logger.warning(
                 f"Blacklisted audience token attempted: jti={jti}, "
                 f"audience={audience}, user_id={user_id}"
@@ -440,6 +441,7 @@ def revoke_audience_token(
     )
     db.add(record)
     db.commit()
+    get_revoked_token_cache().revoke(jti)
 
     logger.info(
         f"Audience token revoked: jti={jti}, user_id={user_id}, reason={reason}"
@@ -0,0 +1,301 @@
+"""
+Per-request authentication context.
+
+The bearer token is decoded and its signature verified once per request. The
+resulting ``AuthContext`` is stored on ``request.state.auth_context``, where
+rate limiting, throttling, logging context and the ``get_current_user``
+dependency all read it instead of decoding the JWT again.
+
+``AuthContext`` only covers what the token itself proves. Revocation is
+checked lazily (at most once per request) through the in-process
+``RevokedTokenCache``, and the user row is served from ``AuthUserCache``.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+from uuid import UUID
+
+import jwt
+from fastapi.security.utils import get_authorization_scheme_param
+from jwt.exceptions import ExpiredSignatureError, InvalidSignatureError
+from jwt.exceptions import PyJWTError as JWTError
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+from starlette.requests import HTTPConnection
+
+from app.core.config import get_settings
+from app.core.token_revocation import get_revoked_token_cache
+from app.models.user import User
+
+settings = get_settings()
+
+ALGORITHM = "HS256"
+AUTH_CONTEXT_STATE_KEY = "auth_context"
+
+DEFAULT_USER_CACHE_TTL = 30  # seconds
+DEFAULT_USER_CACHE_MAX_ENTRIES = 4096
+
+
+@dataclass
+class AuthContext:
+    """
+    Result of decoding a request's token once.
+
+    Attributes:
+        token: Raw token, or None if the request carried no credentials
+        claims: Verified claims, or None if absent or invalid
+        error: Failure category ("expired", "invalid_signature", "malformed")
+    """
+
+    token: str | None = None
+    claims: dict[str, Any] | None = None
+    error: str | None = None
+    _revoked: bool | None = field(default=None, repr=False)
+
+    @classmethod
+    def from_token(cls, token: str | None) -> AuthContext:
+        """
+        Decode and verify a token.
+
+        Args:
+            token: Raw JWT or None
+
+        Returns:
+            AuthContext with claims on success or an error category
+        """
+        if not token:
+            return cls()
+        try:
+            claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+        except ExpiredSignatureError:
+            return cls(token=token, error="expired")
+        except InvalidSignatureError:
+            return cls(token=token, error="invalid_signature")
+        except JWTError:
+            return cls(token=token, error="malformed")
+        return cls(token=token, claims=claims)
+
+    @property
+    def is_authenticated(self) -> bool:
+        """Whether the token carried valid, unexpired claims."""
+        return self.claims is not None
+
+    def _claim(self, name: str) -> Any:
+        return self.claims.get(name) if self.claims else None
+
+    @property
+    def user_id(self) -> str | None:
+        """Subject claim (user ID)."""
+        return self._claim("sub")
+
+    @property
+    def username(self) -> str | None:
+        """Username claim."""
+        return self._claim("username")
+
+    @property
+    def role(self) -> str | None:
+        """Role claim."""
+        return self._claim("role")
+
+    @property
+    def jti(self) -> str | None:
+        """JWT ID claim."""
+        return self._claim("jti")
+
+    @property
+    def token_type(self) -> str:
+        """Token type ("access" unless the token declares otherwise)."""
+        return self._claim("type") or "access"
+
+    @property
+    def token_version(self) -> Any:
+        """Version used to key the cached user row (``tv`` claim, else ``iat``)."""
+        version = self._claim("tv")
+        return version if version is not None else self._claim("iat")
+
+    def is_revoked(self, db: Session) -> bool:
+        """
+        Check revocation once per context.
+
+        Args:
+            db: Database session for the revoked-token cache fallback
+
+        Returns:
+            True if the token's JTI is blacklisted
+        """
+        if self._revoked is None:
+            jti = self.jti
+            self._revoked = bool(jti) and get_revoked_token_cache().is_revoked(
+                db, jti
+            )
+        return self._revoked
+
+
+def extract_token(connection: HTTPConnection) -> str | None:
+    """
+    Extract the access token from a request.
+
+    The httpOnly ``access_token`` cookie takes priority over the
+    Authorization header, matching ``get_current_user``.
+
+    Args:
+        connection: Request or websocket connection
+
+    Returns:
+        Raw token or None
+    """
+    cookie_token = connection.cookies.get("access_token")
+    if cookie_token:
+        return cookie_token[7:] if cookie_token.startswith("Bearer ") else cookie_token
+    scheme, param = get_authorization_scheme_param(
+        connection.headers.get("Authorization")
+    )
+    if scheme.lower() == "bearer" and param:
+        return param
+    return None
+
+
+def get_request_auth_context(connection: HTTPConnection) -> AuthContext:
+    """
+    Get the request's AuthContext, decoding the token on first access.
+
+    Args:
+        connection: Request or websocket connection
+
+    Returns:
+        AuthContext shared by everything handling this request
+    """
+    context = getattr(connection.state, AUTH_CONTEXT_STATE_KEY, None)
+    if context is None:
+        context = AuthContext.from_token(extract_token(connection))
+        setattr(connection.state, AUTH_CONTEXT_STATE_KEY, context)
+    return context
+
+
+class AuthUserCache:
+    """
+    Short-TTL cache of user rows keyed by (user_id, token version).
+
+    Rows are stored as column snapshots and merged into the caller's session
+    without a SELECT. Local updates and deletes of a user invalidate it
+    immediately; changes made by other workers are bounded by the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_USER_CACHE_TTL,
+        max_entries: int = DEFAULT_USER_CACHE_MAX_ENTRIES,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached row is reused (0 disables caching)
+            max_entries: Maximum cached rows
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, Any], tuple[float, dict]] = (
+            OrderedDict()
+        )
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether user rows are cached."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get_user(self, db: Session, user_id: UUID, version: Any = None) -> User | None:
+        """
+        Load a user, reusing a recent snapshot when available.
+
+        Args:
+            db: Database session the returned user is attached to
+            user_id: User ID from the token
+            version: Token version (see ``AuthContext.token_version``)
+
+        Returns:
+            User attached to ``db``, or None if it does not exist
+        """
+        key = (str(user_id), version)
+        if self.enabled:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None and entry[0] > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    values = entry[1]
+                else:
+                    values = None
+            if values is not None:
+                user = User(**values)
+                make_transient_to_detached(user)
+                return db.merge(user, load=False)
+
+        self.misses += 1
+        user = db.query(User).filter(User.id == user_id).first()
+        if user is not None and self.enabled:
+            snapshot = {
+                attr.key: getattr(user, attr.key)
+                for attr in inspect(User).column_attrs
+            }
+            with self._lock:
+                self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return user
+
+    def invalidate(self, user_id: Any) -> None:
+        """
+        Drop every cached row for a user.
+
+        Args:
+            user_id: User whose rows changed
+        """
+        user_key = str(user_id)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == user_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every cached row."""
+        with self._lock:
+            self._entries.clear()
+
+
+_auth_user_cache: AuthUserCache | None = None
+_auth_user_cache_lock = threading.Lock()
+
+
+def get_auth_user_cache() -> AuthUserCache:
+    """
+    Get the process-wide user row cache.
+
+    Returns:
+        AuthUserCache with TTL from ``settings.AUTH_USER_CACHE_TTL_SECONDS``
+    """
+    global _auth_user_cache
+    if _auth_user_cache is None:
+        with _auth_user_cache_lock:
+            if _auth_user_cache is None:
+                _auth_user_cache = AuthUserCache(
+                    ttl=getattr(
+                        settings, "AUTH_USER_CACHE_TTL_SECONDS", DEFAULT_USER_CACHE_TTL
+                    )
+                )
+    return _auth_user_cache
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_cached_user(mapper, connection, target) -> None:
+    get_auth_user_cache().invalidate(target.id)
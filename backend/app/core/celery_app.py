@@ -110,6 +110,12 @@ celery_app.conf.update(
             "kwargs": {"retention_days": 365},
             "options": {"queue": "metrics"},
         },
+        # Schedule Metrics - Reconcile heatmap/fairness rollups
+        "schedule-metrics-refresh-rollups": {
+            "task": "app.tasks.schedule_metrics_tasks.refresh_schedule_rollups",
+            "schedule": crontab(minute="*/5"),
+            "options": {"queue": "metrics"},
+        },
         # Schedule Metrics - Weekly fairness report on Monday at 7 AM
         "schedule-metrics-weekly-fairness-report": {
             "task": "app.tasks.schedule_metrics_tasks.generate_fairness_trend_report",
@@ -0,0 +1,53 @@
+"""
+Deferred imports for heavy packages.
+
+Several packages (``app.scheduling``, ``app.analytics``, ``app.resilience``)
+re-export dozens of classes from their ``__init__``. Importing any one
+submodule used to execute every re-export, dragging in matplotlib, networkx,
+scipy, statsmodels and friends for every API worker, Celery worker and CLI
+command. ``lazy_exports`` builds PEP 562 module hooks so each re-export is
+imported the first time it is accessed instead.
+
+Usage (in a package ``__init__``):
+    _LAZY_EXPORTS = {
+        "SchedulingEngine": "app.scheduling.engine",
+        "get_cb_metrics": "app.resilience.circuit_breaker:get_metrics",
+    }
+    __getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
+"""
+
+import importlib
+import sys
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+    package: str, exports: dict[str, str]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Build ``__getattr__``/``__dir__`` hooks for a package's lazy re-exports.
+
+    Args:
+        package: The package's ``__name__``
+        exports: Mapping of exported name to ``"module"`` (attribute has the
+            same name) or ``"module:attribute"`` (re-exported under an alias)
+
+    Returns:
+        Tuple of (``__getattr__``, ``__dir__``) to assign at module level
+    """
+
+    def __getattr__(name: str) -> Any:
+        target = exports.get(name)
+        if target is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module_name, _, attribute = target.partition(":")
+        value = getattr(importlib.import_module(module_name), attribute or name)
+        # Cache on the package so later lookups bypass this hook
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
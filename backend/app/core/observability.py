@@ -31,11 +31,11 @@ from functools import wraps
 from types import TracebackType
 from typing import Literal, Optional, ParamSpec, TypeVar
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 
 from app.core.logging import get_logger
 from app.core.logging import set_request_id as set_logging_request_id
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
 
 logger = get_logger(__name__)
 
@@ -309,7 +309,7 @@ class ScheduleTimer:
 metrics = ObservabilityMetrics()
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
+class RequestIDMiddleware(ASGIMiddleware):
     """
     Middleware to add X-Request-ID header for request correlation.
 
@@ -327,9 +327,9 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
     MAX_REQUEST_ID_LENGTH = 255
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    async def before_request(self, context: RequestContext) -> None:
         # Get or generate request ID
-        request_id = request.headers.get("X-Request-ID")
+        request_id = context.headers.get("X-Request-ID")
 
         # Validate incoming request ID
         if request_id:
@@ -338,22 +338,25 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
             if not request_id or len(request_id) > self.MAX_REQUEST_ID_LENGTH:
                 request_id = None
 
-                # Generate new UUID if no valid request ID provided
+        # Generate new UUID if no valid request ID provided
         if not request_id:
             request_id = str(uuid.uuid4())
 
-            # Store in context variable for observability metrics
-        token = request_id_ctx.set(request_id)
+        # Store in context variable for observability metrics
+        context.extras["request_id"] = request_id
+        context.extras["request_id_token"] = request_id_ctx.set(request_id)
 
         # Also set in logging context for structured logging
         set_logging_request_id(request_id)
+        return None
 
-        try:
-            response = await call_next(request)
-            response.headers["X-Request-ID"] = request_id
-            return response
-        finally:
-            request_id_ctx.reset(token)
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
+        headers["X-Request-ID"] = context.extras["request_id"]
+
+    def after_request(self, context: RequestContext) -> None:
+        request_id_ctx.reset(context.extras.pop("request_id_token"))
 
 
 def with_request_id(func: Callable[P, R]) -> Callable[P, R]:
@@ -11,7 +11,14 @@ from jwt.exceptions import PyJWTError as JWTError
 from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
+from app.core.auth_context import (
+    ALGORITHM,
+    AuthContext,
+    get_auth_user_cache,
+    get_request_auth_context,
+)
 from app.core.config import get_settings
+from app.core.token_revocation import get_revoked_token_cache
 from app.db.session import get_db
 from app.models.token_blacklist import TokenBlacklist
 from app.models.user import User
@@ -31,9 +38,6 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
 
-# JWT settings
-ALGORITHM = "HS256"
-
 
 def get_password_hash(password: str) -> str:
     """Hash a password using bcrypt."""
@@ -177,7 +181,7 @@ def verify_refresh_token(
             return None, None, None
 
         # Check if token is blacklisted
-        if TokenBlacklist.is_blacklisted(db, jti):
+        if get_revoked_token_cache().is_revoked(db, jti):
             if obs_metrics:
                 obs_metrics.record_auth_failure("blacklisted_refresh")
             return None, None, None
@@ -227,44 +231,52 @@ def verify_token(token: str, db: Session | None = None) -> TokenData | None:
     Returns:
         TokenData if valid access token, None otherwise
     """
-    try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    return verify_auth_context(AuthContext.from_token(token), db)
 
-        # SECURITY: Reject refresh tokens - they must only be used at /refresh endpoint
-        # Refresh tokens have type="refresh", access tokens have no type field
-        if payload.get("type") == "refresh":
-            if obs_metrics:
-                obs_metrics.record_auth_failure("refresh_token_as_access")
-            return None
 
-        user_id: str = payload.get("sub")
-        username: str = payload.get("username")
-        jti: str = payload.get("jti")
+def verify_auth_context(
+    context: AuthContext, db: Session | None = None
+) -> TokenData | None:
+    """
+    Validate an already-decoded token as an access token.
 
-        if user_id is None:
-            if obs_metrics:
-                obs_metrics.record_auth_failure("missing_sub")
-            return None
+    Applies the same checks as ``verify_token`` without decoding the JWT
+    again. The revocation result is memoized on the context.
 
-        # Check if token is blacklisted
-        if db is not None and jti and TokenBlacklist.is_blacklisted(db, jti):
-            if obs_metrics:
-                obs_metrics.record_auth_failure("blacklisted")
-            return None
+    Args:
+        context: AuthContext for the token
+        db: Database session for blacklist check (optional)
 
-        return TokenData(user_id=user_id, username=username, jti=jti)
-    except JWTError as e:
+    Returns:
+        TokenData if valid access token, None otherwise
+    """
+    if context.claims is None:
+        if obs_metrics and context.error:
+            obs_metrics.record_auth_failure(context.error)
+        return None
+
+    # SECURITY: Reject refresh tokens - they must only be used at /refresh endpoint
+    # Refresh tokens have type="refresh", access tokens have no type field
+    if context.token_type == "refresh":
         if obs_metrics:
-            # Categorize the error
-            error_str = str(e).lower()
-            if "expired" in error_str:
-                obs_metrics.record_auth_failure("expired")
-            elif "signature" in error_str:
-                obs_metrics.record_auth_failure("invalid_signature")
-            else:
-                obs_metrics.record_auth_failure("malformed")
+            obs_metrics.record_auth_failure("refresh_token_as_access")
+        return None
+
+    if context.user_id is None:
+        if obs_metrics:
+            obs_metrics.record_auth_failure("missing_sub")
         return None
 
+    # Check if token is blacklisted
+    if db is not None and context.is_revoked(db):
+        if obs_metrics:
+            obs_metrics.record_auth_failure("blacklisted")
+        return None
+
+    return TokenData(
+        user_id=context.user_id, username=context.username, jti=context.jti
+    )
+
 
 def blacklist_token(
     db: Session,
@@ -294,6 +306,7 @@ def blacklist_token(
     )
     db.add(record)
     db.commit()
+    get_revoked_token_cache().revoke(jti)
 
     # Record metric
     if obs_metrics:
@@ -384,11 +397,18 @@ async def get_current_user(
     elif not token:
         return None
 
-    token_data = verify_token(token, db)
+    # Reuse the claims decoded by AuthContextMiddleware for this request
+    context = get_request_auth_context(request)
+    if context.token != token:
+        context = AuthContext.from_token(token)
+
+    token_data = verify_auth_context(context, db)
     if token_data is None or token_data.user_id is None:
         return None
 
-    user = get_user_by_id(db, UUID(token_data.user_id))
+    user = get_auth_user_cache().get_user(
+        db, UUID(token_data.user_id), context.token_version
+    )
     if user is None or not user.is_active:
         return None
 
@@ -453,7 +473,7 @@ def _verify_impersonation_token(token: str, db: Session) -> tuple[User, User] |
             return None
 
         # Check if token is blacklisted
-        if TokenBlacklist.is_blacklisted(db, jti):
+        if get_revoked_token_cache().is_revoked(db, jti):
             return None
 
         # Get users
@@ -12,10 +12,13 @@ from collections.abc import Callable
 from fastapi import Request, Response
 from slowapi import Limiter
 from slowapi.errors import RateLimitExceeded
+from slowapi.middleware import _find_route_handler, _should_exempt, sync_check_limits
 from slowapi.util import get_remote_address
+from starlette.datastructures import MutableHeaders
 from starlette.responses import JSONResponse
 
 from app.core.config import get_settings
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -148,6 +151,48 @@ def get_limiter() -> Limiter:
     return limiter
 
 
+class SlowAPIRateLimitMiddleware(ASGIMiddleware):
+    """
+    Pure-ASGI equivalent of ``slowapi.middleware.SlowAPIMiddleware``.
+
+    Applies the limiter's default limits with the same checks and headers as
+    the upstream middleware. ``SlowAPIASGIMiddleware`` from slowapi 0.1.9 is
+    not used because it re-sends the response start message for every body
+    chunk, which breaks streaming responses.
+    """
+
+    async def before_request(self, context: RequestContext) -> Response | None:
+        app = context.scope["app"]
+        app_limiter: Limiter = app.state.limiter
+        if not app_limiter.enabled:
+            return None
+
+        handler = _find_route_handler(app.routes, context.scope)
+        if _should_exempt(app_limiter, handler):
+            return None
+
+        request = Request(context.scope)
+        error_response, should_inject_headers = sync_check_limits(
+            app_limiter, request, handler, app
+        )
+        if error_response is not None:
+            return error_response
+        if should_inject_headers:
+            context.extras["view_rate_limit"] = (
+                app_limiter,
+                request.state.view_rate_limit,
+            )
+        return None
+
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
+        view_rate_limit = context.extras.get("view_rate_limit")
+        if view_rate_limit is not None:
+            app_limiter, current_limit = view_rate_limit
+            app_limiter._inject_asgi_headers(headers, current_limit)
+
+
 def _apply_limit(limit_value: str, func: Callable) -> Callable:
     """
     Apply a slowapi limit to a FastAPI route handler.
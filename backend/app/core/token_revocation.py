@@ -0,0 +1,373 @@
+"""
+In-process revoked-token filter kept in sync over Redis pub/sub.
+
+Every authenticated request used to run a ``TokenBlacklist`` query. Revoked
+tokens are rare and short-lived, so almost every lookup answers "not
+revoked". ``RevokedTokenCache`` answers that case from memory:
+
+- A bloom filter holds every blacklisted JTI. A miss is a definite "not
+  revoked" and needs no database round trip.
+- A bloom hit is confirmed against the database once, then remembered in a
+  small LRU (revoked, or a false positive) for later requests.
+- Revocations are published on a Redis channel. Every worker subscribes and
+  adds published JTIs to its filter, and the filter is rebuilt from the
+  database periodically and after every (re)subscription.
+
+The filter is only trusted while the subscription is live and the last
+rebuild is fresh. Otherwise lookups fall back to the database, which is the
+previous behaviour.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.models.token_blacklist import TokenBlacklist
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REVOCATION_CHANNEL = "auth:revoked_tokens"
+DEFAULT_FILTER_CAPACITY = 100_000
+DEFAULT_FALSE_POSITIVE_RATE = 0.001
+DEFAULT_RESYNC_SECONDS = 300
+DEFAULT_CONFIRMED_LRU_SIZE = 4096
+
+
+class BloomFilter:
+    """Fixed-size bloom filter over strings using double hashing."""
+
+    def __init__(
+        self,
+        capacity: int = DEFAULT_FILTER_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+    ) -> None:
+        """
+        Initialize an empty filter.
+
+        Args:
+            capacity: Expected number of members
+            false_positive_rate: Target false positive rate at capacity
+        """
+        capacity = max(capacity, 1)
+        bits = -capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        self.num_bits = max(int(math.ceil(bits)), 8)
+        self.num_hashes = max(int(round(self.num_bits / capacity * math.log(2))), 1)
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str) -> list[int]:
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+
+    def add(self, item: str) -> None:
+        """Add a member."""
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+class RevokedTokenCache:
+    """Answer "is this JTI revoked?" from memory, falling back to the database."""
+
+    def __init__(
+        self,
+        redis_url: str | None = None,
+        channel: str = DEFAULT_REVOCATION_CHANNEL,
+        capacity: int = DEFAULT_FILTER_CAPACITY,
+        false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+        resync_seconds: float = DEFAULT_RESYNC_SECONDS,
+        confirmed_lru_size: int = DEFAULT_CONFIRMED_LRU_SIZE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            redis_url: Redis URL for revocation pub/sub (None disables the
+                in-process filter; every lookup then queries the database)
+            channel: Pub/sub channel carrying revoked JTIs
+            capacity: Minimum bloom filter capacity
+            false_positive_rate: Target bloom filter false positive rate
+            resync_seconds: Maximum age of the filter before it is rebuilt
+            confirmed_lru_size: Database-confirmed answers kept per kind
+        """
+        self.redis_url = redis_url
+        self.channel = channel
+        self.capacity = capacity
+        self.false_positive_rate = false_positive_rate
+        self.resync_seconds = resync_seconds
+        self.confirmed_lru_size = confirmed_lru_size
+
+        self._bloom = BloomFilter(capacity, false_positive_rate)
+        self._revoked: OrderedDict[str, None] = OrderedDict()
+        self._false_positives: OrderedDict[str, None] = OrderedDict()
+        self._rebuild_log: list[str] | None = None
+        self._synced_at: float | None = None
+        self._lock = threading.Lock()
+        self._rebuild_lock = threading.Lock()
+
+        self._subscribed = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._publisher: Any = None
+
+        self.filter_negatives = 0
+        self.lru_hits = 0
+        self.db_checks = 0
+        self.false_positive_count = 0
+
+    @property
+    def authoritative(self) -> bool:
+        """Whether a bloom filter miss can be trusted without the database."""
+        return (
+            self._subscribed.is_set()
+            and self._synced_at is not None
+            and time.monotonic() - self._synced_at < self.resync_seconds
+        )
+
+    def _remember(self, entries: OrderedDict[str, None], jti: str) -> None:
+        entries[jti] = None
+        entries.move_to_end(jti)
+        while len(entries) > self.confirmed_lru_size:
+            entries.popitem(last=False)
+
+    def add(self, jti: str) -> None:
+        """
+        Record a revoked JTI locally.
+
+        Args:
+            jti: JWT ID that was revoked
+        """
+        with self._lock:
+            self._bloom.add(jti)
+            self._false_positives.pop(jti, None)
+            self._remember(self._revoked, jti)
+            if self._rebuild_log is not None:
+                self._rebuild_log.append(jti)
+
+    def revoke(self, jti: str) -> None:
+        """
+        Record a revoked JTI and broadcast it to other workers.
+
+        Call after the ``TokenBlacklist`` row is committed.
+
+        Args:
+            jti: JWT ID that was revoked
+        """
+        self.add(jti)
+        if self.redis_url is None:
+            return
+        try:
+            if self._publisher is None:
+                import redis
+
+                self._publisher = redis.from_url(
+                    self.redis_url, socket_connect_timeout=2, socket_timeout=2
+                )
+            self._publisher.publish(self.channel, jti)
+        except Exception as e:
+            # Peers pick the revocation up on their next resync
+            logger.warning(f"Failed to publish token revocation: {e}")
+            self._publisher = None
+
+    def resync(self, db: Session) -> int:
+        """
+        Rebuild the bloom filter from the blacklist table.
+
+        Every row is loaded, expired or not: expired tokens already fail
+        signature verification, and ``TokenBlacklist.cleanup_expired`` keeps
+        the table small.
+
+        Args:
+            db: Database session
+
+        Returns:
+            Number of JTIs loaded
+        """
+        with self._rebuild_lock:
+            with self._lock:
+                self._rebuild_log = []
+            try:
+                jtis = [jti for (jti,) in db.query(TokenBlacklist.jti).all()]
+                bloom = BloomFilter(
+                    max(self.capacity, 2 * len(jtis)), self.false_positive_rate
+                )
+                for jti in jtis:
+                    bloom.add(jti)
+                with self._lock:
+                    # Revocations received while the query ran
+                    for jti in self._rebuild_log:
+                        bloom.add(jti)
+                    self._bloom = bloom
+                    self._false_positives.clear()
+                    self._synced_at = time.monotonic()
+            finally:
+                with self._lock:
+                    self._rebuild_log = None
+        return len(jtis)
+
+    def _query(self, db: Session, jti: str) -> bool:
+        self.db_checks += 1
+        return TokenBlacklist.is_blacklisted(db, jti)
+
+    def is_revoked(self, db: Session, jti: str) -> bool:
+        """
+        Check whether a JTI has been revoked.
+
+        Args:
+            db: Database session used for fallback and confirmation
+            jti: JWT ID to check
+
+        Returns:
+            True if the token is blacklisted
+        """
+        if not self._subscribed.is_set():
+            return self._query(db, jti)
+        if not self.authoritative:
+            try:
+                self.resync(db)
+            except Exception as e:
+                logger.warning(f"Revoked-token filter resync failed: {e}")
+                return self._query(db, jti)
+
+        with self._lock:
+            if jti not in self._bloom:
+                self.filter_negatives += 1
+                return False
+            if jti in self._revoked:
+                self._revoked.move_to_end(jti)
+                self.lru_hits += 1
+                return True
+            if jti in self._false_positives:
+                self._false_positives.move_to_end(jti)
+                self.lru_hits += 1
+                return False
+
+        revoked = self._query(db, jti)
+        with self._lock:
+            if revoked:
+                self._remember(self._revoked, jti)
+            elif jti in self._bloom:
+                self.false_positive_count += 1
+                self._remember(self._false_positives, jti)
+        return revoked
+
+    def _listen(self) -> None:
+        import redis
+
+        backoff = 1.0
+        while not self._stop.is_set():
+            pubsub = None
+            try:
+                client = redis.from_url(self.redis_url, socket_connect_timeout=5)
+                pubsub = client.pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                # Messages may have been missed while unsubscribed
+                with self._lock:
+                    self._synced_at = None
+                self._subscribed.set()
+                backoff = 1.0
+                logger.info(f"Subscribed to token revocations on {self.channel}")
+                while not self._stop.is_set():
+                    message = pubsub.get_message(timeout=1.0)
+                    if message and message.get("type") == "message":
+                        data = message["data"]
+                        self.add(data.decode() if isinstance(data, bytes) else data)
+            except Exception as e:
+                logger.warning(f"Token revocation subscription lost: {e}")
+            finally:
+                self._subscribed.clear()
+                if pubsub is not None:
+                    try:
+                        pubsub.close()
+                    except Exception:
+                        pass
+            self._stop.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
+    def start(self) -> None:
+        """Start the background subscriber (no-op without a Redis URL)."""
+        if self.redis_url is None or (self._thread and self._thread.is_alive()):
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, name="revoked-token-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the background subscriber."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        self._subscribed.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with filter size and lookup counters
+        """
+        with self._lock:
+            return {
+                "subscribed": self._subscribed.is_set(),
+                "authoritative": self.authoritative,
+                "filter_members": self._bloom.count,
+                "filter_bits": self._bloom.num_bits,
+                "filter_negatives": self.filter_negatives,
+                "lru_hits": self.lru_hits,
+                "db_checks": self.db_checks,
+                "false_positives": self.false_positive_count,
+            }
+
+
+_revoked_token_cache: RevokedTokenCache | None = None
+_revoked_token_cache_lock = threading.Lock()
+
+
+def get_revoked_token_cache() -> RevokedTokenCache:
+    """
+    Get the process-wide revoked-token cache.
+
+    Returns:
+        RevokedTokenCache configured from settings
+    """
+    global _revoked_token_cache
+    if _revoked_token_cache is None:
+        with _revoked_token_cache_lock:
+            if _revoked_token_cache is None:
+                from app.core.config import get_settings
+
+                settings = get_settings()
+                enabled = getattr(settings, "AUTH_REVOCATION_CACHE_ENABLED", True)
+                _revoked_token_cache = RevokedTokenCache(
+                    redis_url=settings.redis_url_with_password if enabled else None,
+                    channel=getattr(
+                        settings,
+                        "AUTH_REVOCATION_CHANNEL",
+                        DEFAULT_REVOCATION_CHANNEL,
+                    ),
+                    resync_seconds=getattr(
+                        settings,
+                        "AUTH_REVOCATION_RESYNC_SECONDS",
+                        DEFAULT_RESYNC_SECONDS,
+                    ),
+                )
+    return _revoked_token_cache
@@ -1,5 +1,5 @@
 # Database module
 from app.db.base import Base
-from app.db.session import engine, get_db
+from app.db.session import engine, get_db, get_read_db
 
-__all__ = ["Base", "get_db", "engine"]
+__all__ = ["Base", "get_db", "get_read_db", "engine"]
@@ -4,12 +4,14 @@ Provides utilities for efficient bulk inserts, updates, and deletes.
 """
 
 import logging
+from dataclasses import dataclass
 from typing import Any, Sequence, Type, TypeVar
 
-from sqlalchemy import insert, update, delete
+from sqlalchemy import and_, insert, update, delete, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 
 logger = logging.getLogger(__name__)
 
@@ -265,3 +267,132 @@ async def bulk_insert_assignments(
         conflict_columns=["id"],
         update_columns=["person_id", "block_id", "rotation_id", "updated_at"],
     )
+
+
+@dataclass
+class HalfDayUpsertResult:
+    """Row counts from a set-based half-day assignment upsert."""
+
+    created: int = 0
+    updated: int = 0
+    skipped_locked: int = 0
+    skipped_existing: int = 0
+
+    @property
+    def written(self) -> int:
+        """Rows inserted or overwritten."""
+        return self.created + self.updated
+
+
+def _upsert_insert(session: Session, model: Any) -> Any:
+    """Return a dialect-specific INSERT that supports ON CONFLICT."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        return pg_insert(model)
+    if dialect == "sqlite":
+        return sqlite_insert(model)
+    raise NotImplementedError(f"ON CONFLICT upsert not supported for {dialect}")
+
+
+def upsert_half_day_assignments(
+    session: Session,
+    rows: Sequence[dict[str, Any]],
+    overwrite: bool = True,
+    batch_size: int = 1000,
+) -> HalfDayUpsertResult:
+    """Write half-day slots with multi-row INSERT ... ON CONFLICT.
+
+    Replaces a SELECT + add/update round-trip per slot. Conflicts on
+    (person_id, date, time_of_day) update ``activity_id``/``source`` unless
+    the existing row is locked (preload/manual source); the lock check is
+    repeated in the statement's WHERE clause so concurrent writers cannot
+    overwrite a slot locked after the pre-read. Rows with the same slot key
+    collapse to the last one, matching sequential per-row updates.
+
+    Pending ORM objects for the same slots must be flushed first.
+
+    Args:
+        session: Synchronous database session (not committed)
+        rows: Dicts with person_id, date, time_of_day, activity_id and source
+        overwrite: Update unlocked existing rows; when False existing rows are
+            left untouched (ON CONFLICT DO NOTHING)
+        batch_size: Rows per INSERT statement
+
+    Returns:
+        HalfDayUpsertResult with created/updated/skipped counts
+    """
+    from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
+
+    result = HalfDayUpsertResult()
+    if not rows:
+        return result
+
+    by_key: dict[tuple[Any, Any, str], dict[str, Any]] = {}
+    for row in rows:
+        by_key[(row["person_id"], row["date"], row["time_of_day"])] = row
+
+    locked_sources = (AssignmentSource.PRELOAD.value, AssignmentSource.MANUAL.value)
+    person_ids = {key[0] for key in by_key}
+    dates = [key[1] for key in by_key]
+    existing_sources: dict[tuple[Any, Any, str], str] = {}
+    for person_id, slot_date, time_of_day, source in session.execute(
+        select(
+            HalfDayAssignment.person_id,
+            HalfDayAssignment.date,
+            HalfDayAssignment.time_of_day,
+            HalfDayAssignment.source,
+        ).where(
+            HalfDayAssignment.person_id.in_(person_ids),
+            HalfDayAssignment.date >= min(dates),
+            HalfDayAssignment.date <= max(dates),
+        )
+    ):
+        existing_sources[(person_id, slot_date, time_of_day)] = source
+
+    payload = []
+    for key, row in by_key.items():
+        source = existing_sources.get(key)
+        if source is None:
+            result.created += 1
+        elif source in locked_sources:
+            result.skipped_locked += 1
+            continue
+        elif overwrite:
+            result.updated += 1
+        else:
+            result.skipped_existing += 1
+            continue
+        payload.append(row)
+
+    for i in range(0, len(payload), batch_size):
+        stmt = _upsert_insert(session, HalfDayAssignment)
+        conflict_columns = ["person_id", "date", "time_of_day"]
+        if overwrite:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={
+                    "activity_id": stmt.excluded.activity_id,
+                    "source": stmt.excluded.source,
+                    "updated_at": stmt.excluded.updated_at,
+                },
+                # Explicit comparisons: IN () cannot expand under executemany
+                where=and_(
+                    *(HalfDayAssignment.source != source for source in locked_sources)
+                ),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=conflict_columns)
+        session.execute(stmt, payload[i : i + batch_size])
+
+    # Core writes bypass the identity map; drop stale in-session copies
+    if result.updated:
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, HalfDayAssignment):
+                session.expire(obj)
+
+    logger.debug(
+        f"Upserted half-day slots: created={result.created}, "
+        f"updated={result.updated}, skipped_locked={result.skipped_locked}, "
+        f"skipped_existing={result.skipped_existing}"
+    )
+    return result
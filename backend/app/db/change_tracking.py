@@ -0,0 +1,182 @@
+"""Shared scaffolding for session listeners that follow schedule writes.
+
+Several derived stores are kept in step with the schedule tables by session
+listeners: the schedule rollups (``app.db.rollups``), the calendar feed
+version counters (``app.db.schedule_versions``) and the conflict analysis
+cache (``app.scheduling.conflicts.cache``). They all need the same pieces:
+
+- ``collect_flush_changes`` reads a flush's inserted, updated and deleted
+  rows of one model, with the current and previous values of its keys
+- ``PendingChanges`` accumulates what flushes changed in ``session.info``
+  until the transaction commits or rolls back
+- ``bulk_write_mapper`` recognises ORM bulk INSERT/UPDATE/DELETE statements,
+  whose rows cannot be inspected, and ``bulk_write_connection`` returns the
+  connection they run on
+- ``table_available`` checks (and caches) that a derived table exists
+- ``register_listeners`` installs a module's listeners idempotently
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event, inspect
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Mapper, ORMExecuteState, Session
+from sqlalchemy.orm.base import NO_VALUE
+
+
+@dataclass
+class FlushChanges:
+    """
+    Rows of one model that a flush touched, plus everything else it touched.
+
+    Attributes:
+        rows: For each touched row, key -> current and previous values
+        unresolved: A touched row's keys could not be read (for example a
+            deleted row whose columns were never loaded)
+        new: Other objects inserted by the flush
+        dirty: Other objects updated by the flush
+        deleted: Other objects deleted by the flush
+    """
+
+    rows: list[dict[str, set[Any]]] = field(default_factory=list)
+    unresolved: bool = False
+    new: list[Any] = field(default_factory=list)
+    dirty: list[Any] = field(default_factory=list)
+    deleted: list[Any] = field(default_factory=list)
+
+    def values(self, key: str) -> set[Any]:
+        """Every current or previous value of ``key`` across touched rows."""
+        return {value for row in self.rows for value in row[key]}
+
+
+def history_values(obj: Any, key: str) -> set[Any]:
+    """Current and previous values of an attribute (None excluded)."""
+    attr = inspect(obj).attrs[key]
+    history = attr.history
+    values = set(history.added) | set(history.deleted) | set(history.unchanged)
+    if not values and attr.loaded_value is not NO_VALUE:
+        values.add(attr.loaded_value)
+    values.discard(None)
+    return values
+
+
+def attribute_changed(obj: Any, key: str) -> bool:
+    """Whether a flush changes an attribute."""
+    return inspect(obj).attrs[key].history.has_changes()
+
+
+def collect_flush_changes(
+    session: Session,
+    model: type,
+    keys: Sequence[str],
+    tracked: Sequence[str] | None = None,
+) -> FlushChanges:
+    """
+    Gather a flush's changes to ``model`` rows.
+
+    Args:
+        session: Session inside ``after_flush``
+        model: Mapped class whose rows are collected
+        keys: Attributes to read from each touched row
+        tracked: Attributes whose change makes an updated row count as
+            touched (None: any column change)
+
+    Returns:
+        FlushChanges for the flush
+    """
+    changes = FlushChanges()
+
+    def touch(obj: Any) -> None:
+        row = {key: history_values(obj, key) for key in keys}
+        if not all(row.values()):
+            changes.unresolved = True
+        changes.rows.append(row)
+
+    for obj in session.new:
+        if isinstance(obj, model):
+            touch(obj)
+        else:
+            changes.new.append(obj)
+
+    for obj in session.deleted:
+        if isinstance(obj, model):
+            touch(obj)
+        else:
+            changes.deleted.append(obj)
+
+    for obj in session.dirty:
+        if not isinstance(obj, model):
+            changes.dirty.append(obj)
+        elif (
+            session.is_modified(obj, include_collections=False)
+            if tracked is None
+            else any(attribute_changed(obj, key) for key in tracked)
+        ):
+            touch(obj)
+
+    return changes
+
+
+class PendingChanges:
+    """Changes collected across a transaction's flushes, kept in session.info."""
+
+    def __init__(self, key: str) -> None:
+        self.key = key
+
+    def add(self, session: Session, items: Iterable[Any]) -> None:
+        """Record changed items for the current transaction."""
+        session.info.setdefault(self.key, set()).update(items)
+
+    def pop(self, session: Session) -> set[Any]:
+        """Take the recorded items, leaving none pending."""
+        return session.info.pop(self.key, None) or set()
+
+
+def bulk_write_mapper(
+    orm_execute_state: ORMExecuteState, models: tuple[type, ...]
+) -> Mapper | None:
+    """
+    The target mapper of an ORM bulk INSERT/UPDATE/DELETE on ``models``.
+
+    Returns:
+        The mapper, or None for reads and writes to other tables
+    """
+    if not (
+        orm_execute_state.is_insert
+        or orm_execute_state.is_update
+        or orm_execute_state.is_delete
+    ):
+        return None
+    mapper = orm_execute_state.bind_mapper
+    if mapper is None or not issubclass(mapper.class_, models):
+        return None
+    return mapper
+
+
+def bulk_write_connection(
+    orm_execute_state: ORMExecuteState, mapper: Mapper
+) -> Connection:
+    """Connection a bulk write runs on (the primary, under replica routing)."""
+    return orm_execute_state.session.connection(
+        bind_arguments={"clause": orm_execute_state.statement, "mapper": mapper}
+    )
+
+
+def table_available(connection: Connection, table_name: str) -> bool:
+    """Whether a table exists (positive answers are cached per connection)."""
+    cache_key = f"table_available:{table_name}"
+    if connection.info.get(cache_key):
+        return True
+    available = inspect(connection).has_table(table_name)
+    if available:
+        connection.info[cache_key] = True
+    return available
+
+
+def register_listeners(target: Any, listeners: dict[str, Any]) -> None:
+    """Install event listeners on ``target`` unless already installed."""
+    for name, listener in listeners.items():
+        if not event.contains(target, name, listener):
+            event.listen(target, name, listener)
@@ -8,7 +8,7 @@ import logging
 from datetime import date
 from typing import Any
 
-from sqlalchemy import and_, func, or_, select
+from sqlalchemy import and_, func, insert, or_, select, update
 from sqlalchemy.orm import Session, selectinload
 
 from app.models.absence import Absence
@@ -460,7 +460,8 @@ class OptimizedQueryBuilder:
         """
         Bulk create assignments efficiently.
 
-        Uses bulk insert for better performance.
+        Uses bulk insert for better performance. Bulk inserts bypass the
+        audit trail (no version rows), so incremental exports miss them.
 
         Args:
             assignments_data: List of assignment dictionaries
@@ -472,8 +473,9 @@ class OptimizedQueryBuilder:
             return []
 
         try:
-            # Use bulk_insert_mappings for better performance
-            self.db.bulk_insert_mappings(Assignment, assignments_data)
+            # ORM bulk INSERT (executemany); unlike bulk_insert_mappings it
+            # runs do_orm_execute, so rollups and schedule versions see it
+            self.db.execute(insert(Assignment), assignments_data)
             self.db.commit()
 
             # Fetch the created assignments
@@ -498,6 +500,9 @@ class OptimizedQueryBuilder:
         """
         Bulk update assignments efficiently.
 
+        Bulk updates bypass the audit trail (no version rows), so
+        incremental exports miss them.
+
         Args:
             updates: List of update dictionaries with 'id' and fields to update
         """
@@ -505,8 +510,8 @@ class OptimizedQueryBuilder:
             return
 
         try:
-            # Use bulk_update_mappings for better performance
-            self.db.bulk_update_mappings(Assignment, updates)
+            # ORM bulk UPDATE by primary key, seen by do_orm_execute
+            self.db.execute(update(Assignment), updates)
             self.db.commit()
 
         except Exception as e:
@@ -518,6 +523,9 @@ class OptimizedQueryBuilder:
         """
         Bulk delete assignments efficiently.
 
+        Bulk deletes bypass the audit trail (no version rows), so
+        incremental exports miss them.
+
         Args:
             assignment_ids: List of assignment IDs to delete
 
@@ -17,7 +17,7 @@ from functools import wraps
 from typing import Any, Callable, Dict, Optional, List
 from datetime import datetime, UTC
 
-from sqlalchemy import inspect, event, text
+from sqlalchemy import inspect, event, insert, text, update
 from sqlalchemy.orm import Session, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import select
@@ -296,7 +296,8 @@ class BulkOperations:
             return 0
 
         try:
-            session.bulk_insert_mappings(model, data_list)
+            # ORM bulk INSERT, seen by do_orm_execute listeners
+            session.execute(insert(model), data_list)
             session.commit()
             return len(data_list)
         except Exception as e:
@@ -321,7 +322,8 @@ class BulkOperations:
             return 0
 
         try:
-            session.bulk_update_mappings(model, data_list)
+            # ORM bulk UPDATE by primary key, seen by do_orm_execute listeners
+            session.execute(update(model), data_list)
             session.commit()
             return len(data_list)
         except Exception as e:
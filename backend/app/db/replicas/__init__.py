@@ -35,6 +35,9 @@ Usage:
         session.add(new_user)
         session.commit()
 
+Read-only API routes get replica sessions through
+``app.db.session.get_read_db``, backed by ``ReadReplicaRouter``.
+
 Features:
     - Automatic read/write splitting
     - Health monitoring and lag detection
@@ -47,12 +50,16 @@ Features:
 from app.db.replicas.balancer import LoadBalancer, StickySessionBalancer
 from app.db.replicas.health import HealthChecker, ReplicaHealth
 from app.db.replicas.router import QueryRouter, QueryType, RoutingPolicy
+from app.db.replicas.routing import ReadReplicaRouter, ReplicaReadSession
 from app.db.replicas.session import ReplicaAwareSession, ReplicaAwareSessionFactory
 
 __all__ = [
     # Session management
     "ReplicaAwareSessionFactory",
     "ReplicaAwareSession",
+    # Read-only route routing (get_read_db)
+    "ReadReplicaRouter",
+    "ReplicaReadSession",
     # Query routing
     "QueryRouter",
     "QueryType",
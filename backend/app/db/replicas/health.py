@@ -85,11 +85,12 @@ class HealthChecker:
             # Test connection with simple query
             with engine.connect() as conn:
                 # Set statement timeout for this connection
-                conn.execute(
-                    text(
-                        f"SET statement_timeout = {int(self.health_check_timeout * 1000)}"
+                if conn.dialect.name == "postgresql":
+                    conn.execute(
+                        text(
+                            f"SET statement_timeout = {int(self.health_check_timeout * 1000)}"
+                        )
                     )
-                )
 
                 # Verify connection is alive
                 conn.execute(text("SELECT 1"))
@@ -176,6 +177,9 @@ class HealthChecker:
         Returns:
             Lag in seconds, or None if not available (e.g., on primary)
         """
+        if connection.dialect.name != "postgresql":
+            return None
+
         try:
             # Check if this is a standby (replica)
             result = connection.execute(text("SELECT pg_is_in_recovery()")).scalar()
@@ -184,18 +188,20 @@ class HealthChecker:
                 # This is the primary, not a replica
                 return None
 
-                # Get replay lag (time between last WAL received and applied)
+                # Get replay lag (time between last WAL received and applied).
+                # A replica that has replayed everything it received is
+                # current, however long ago the last transaction was.
             lag_result = connection.execute(
                 text(
                     """
-                    SELECT EXTRACT(EPOCH FROM (
-                        pg_last_wal_receive_lsn() - pg_last_wal_replay_lsn()
-                    )) /
-                    NULLIF(
-                        (SELECT setting::int FROM pg_settings WHERE name = 'wal_block_size'),
-                        0
+                    SELECT pg_wal_lsn_diff(
+                        pg_last_wal_receive_lsn(), pg_last_wal_replay_lsn()
                     ) AS lag_bytes,
-                    EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp())) AS lag_seconds
+                    CASE
+                        WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn()
+                        THEN 0
+                        ELSE EXTRACT(EPOCH FROM (now() - pg_last_xact_replay_timestamp()))
+                    END AS lag_seconds
                 """
                 )
             ).first()
@@ -267,6 +273,24 @@ class HealthChecker:
         health = self.check_replica_health(engine, replica_name)
         return health.is_healthy
 
+    def mark_unhealthy(self, replica_name: str, error_message: str) -> None:
+        """Mark a replica unhealthy after a failure outside a health check.
+
+        The replica is skipped until its cached status expires and the next
+        health check succeeds.
+
+        Args:
+            replica_name: Identifier for the replica
+            error_message: Reason recorded on the health status
+        """
+        self._health_cache[replica_name] = ReplicaHealth(
+            is_healthy=False,
+            last_check=datetime.now(UTC),
+            error_message=error_message,
+            consecutive_failures=self.max_consecutive_failures,
+        )
+        logger.warning(f"Marked replica {replica_name} unhealthy: {error_message}")
+
     def reset_failures(self, replica_name: str) -> None:
         """Reset consecutive failure count for a replica.
 
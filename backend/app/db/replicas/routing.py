@@ -0,0 +1,261 @@
+"""Replica routing for read-only API routes.
+
+Routes that only read declare ``db: Session = Depends(get_read_db)`` instead
+of ``get_db``. Each request then gets a ``ReplicaReadSession`` whose reads
+go to a healthy replica, chosen by ``ReadReplicaRouter``:
+
+- Replicas whose measured lag exceeds the staleness budget, or that failed
+  a health check or connection, are skipped; with none left the session
+  reads from the primary.
+- A user who wrote recently (``record_write``) reads from the primary for a
+  short sticky window so they always see their own changes.
+- A session that flushes or executes DML is pinned to the primary for the
+  rest of its life.
+
+Every routing decision is counted per route in ``db_read_routing_total``.
+"""
+
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+from typing import Any
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import DBAPIError, OperationalError
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.db.replicas.balancer import LoadBalancer
+from app.db.replicas.health import HealthChecker
+
+logger = logging.getLogger(__name__)
+
+try:
+    from prometheus_client import Counter as PrometheusCounter
+
+    READ_ROUTING_TOTAL = PrometheusCounter(
+        "db_read_routing_total",
+        "Read-only route sessions by route, serving database and reason",
+        # target: replica/primary; reason: replica, sticky, lag, unhealthy,
+        # error, no_replicas
+        ["route", "target", "reason"],
+    )
+except ImportError:
+    READ_ROUTING_TOTAL = None
+
+# Cookie carrying the sticky-primary deadline (epoch seconds) so the window
+# also holds when the user's next request lands on another worker
+STICKY_PRIMARY_COOKIE = "db_primary_until"
+
+# Request state flag set for routes served through get_read_db; their
+# requests never start a read-your-writes window, whatever the HTTP method
+READ_ONLY_ROUTE_STATE_KEY = "read_only_route"
+
+# Bound on remembered writers between prunes
+_MAX_TRACKED_WRITERS = 4096
+
+
+class ReplicaReadSession(Session):
+    """Session that reads from a replica until it writes.
+
+    Statements go to ``replica_bind`` while ``using_primary`` is false. A
+    flush or DML statement pins the session to the primary (its configured
+    ``bind``) so the request reads its own writes.
+    """
+
+    def __init__(self, *args: Any, replica_bind: Engine | None = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replica_bind = replica_bind
+        self.using_primary = replica_bind is None
+
+    def get_bind(self, mapper=None, *, clause=None, **kwargs):
+        if not self.using_primary:
+            if not (self._flushing or getattr(clause, "is_dml", False)):
+                return self.replica_bind
+            self.using_primary = True
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+class ReadReplicaRouter:
+    """Chooses the database that serves each read-only route session.
+
+    Attributes:
+        primary_engine: Engine for the primary database
+        balancer: Round-robin balancer over replicas (None without replicas)
+        health_checker: Health and lag monitor shared with the balancer
+        sticky_seconds: Read-your-writes window after a user's write
+    """
+
+    def __init__(
+        self,
+        primary_engine: Engine,
+        replica_engines: dict[str, Engine] | None = None,
+        max_lag_seconds: float = 5.0,
+        sticky_seconds: float = 10.0,
+    ) -> None:
+        """Initialize the router.
+
+        Args:
+            primary_engine: Engine for the primary database
+            replica_engines: Dict of replica_name -> engine (optional)
+            max_lag_seconds: Staleness budget; more-lagged replicas are skipped
+            sticky_seconds: Seconds a writer keeps reading from the primary
+        """
+        self.primary_engine = primary_engine
+        self.health_checker = HealthChecker(max_lag_seconds=max_lag_seconds)
+        self.balancer = (
+            LoadBalancer(replica_engines, health_checker=self.health_checker)
+            if replica_engines
+            else None
+        )
+        self.sticky_seconds = sticky_seconds
+        self.session_maker = sessionmaker(
+            class_=ReplicaReadSession,
+            autocommit=False,
+            autoflush=False,
+            bind=primary_engine,
+        )
+
+        self._lock = threading.Lock()
+        self._recent_writers: dict[str, float] = {}  # user_id -> monotonic expiry
+        self._route_stats: dict[str, Counter] = defaultdict(Counter)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any replicas are configured."""
+        return self.balancer is not None
+
+    def record_write(self, user_id: str) -> float:
+        """Route a user's reads to the primary for the sticky window.
+
+        Args:
+            user_id: User who just wrote
+
+        Returns:
+            Epoch time at which the window ends (for the sticky cookie)
+        """
+        now = time.monotonic()
+        with self._lock:
+            if len(self._recent_writers) >= _MAX_TRACKED_WRITERS:
+                self._recent_writers = {
+                    user: expiry
+                    for user, expiry in self._recent_writers.items()
+                    if expiry > now
+                }
+            self._recent_writers[user_id] = now + self.sticky_seconds
+        return time.time() + self.sticky_seconds
+
+    def is_sticky(
+        self, user_id: str | None = None, primary_until: float | None = None
+    ) -> bool:
+        """Check whether a request falls inside a read-your-writes window.
+
+        Args:
+            user_id: Requesting user, if authenticated
+            primary_until: Deadline from the sticky cookie, if present
+
+        Returns:
+            True if the request must read from the primary
+        """
+        if primary_until is not None and primary_until > time.time():
+            return True
+        if user_id is None:
+            return False
+        expiry = self._recent_writers.get(user_id)
+        return expiry is not None and expiry > time.monotonic()
+
+    def select(
+        self, user_id: str | None = None, primary_until: float | None = None
+    ) -> tuple[str | None, Engine | None, str]:
+        """Choose the replica for a read-only session.
+
+        Args:
+            user_id: Requesting user, if authenticated
+            primary_until: Deadline from the sticky cookie, if present
+
+        Returns:
+            Tuple of (replica_name, engine, reason); name and engine are None
+            when the session should read from the primary
+        """
+        if self.balancer is None:
+            return None, None, "no_replicas"
+        if self.is_sticky(user_id, primary_until):
+            return None, None, "sticky"
+
+        selection = self.balancer.select_replica()
+        if selection is not None:
+            return selection[0], selection[1], "replica"
+
+        lagging = False
+        for name in self.balancer.replicas:
+            health = self.health_checker.get_cached_health(name)
+            if health and health.lag_seconds is not None:
+                lagging |= health.lag_seconds > self.health_checker.max_lag_seconds
+        return None, None, "lag" if lagging else "unhealthy"
+
+    def open_session(
+        self,
+        route: str,
+        user_id: str | None = None,
+        primary_until: float | None = None,
+    ) -> ReplicaReadSession:
+        """Open a session for one read-only route request.
+
+        The replica connection is opened eagerly so a failed replica falls
+        back to the primary before the route runs any query.
+
+        Args:
+            route: Route path template, for per-route metrics
+            user_id: Requesting user, if authenticated
+            primary_until: Deadline from the sticky cookie, if present
+
+        Returns:
+            Session reading from the chosen database
+        """
+        replica_name, replica_engine, reason = self.select(user_id, primary_until)
+        session = self.session_maker(replica_bind=replica_engine)
+
+        if replica_engine is not None:
+            try:
+                session.connection()
+            except (OperationalError, DBAPIError) as e:
+                logger.warning(
+                    f"Replica {replica_name} unavailable for {route}, "
+                    f"reading from primary: {e}"
+                )
+                self.health_checker.mark_unhealthy(replica_name, "Connection failed")
+                session.close()
+                session = self.session_maker()
+                reason = "error"
+
+        target = "primary" if session.using_primary else "replica"
+        with self._lock:
+            self._route_stats[route][(target, reason)] += 1
+        if READ_ROUTING_TOTAL is not None:
+            READ_ROUTING_TOTAL.labels(route=route, target=target, reason=reason).inc()
+        return session
+
+    def get_route_stats(self) -> dict[str, dict[str, Any]]:
+        """Get per-route routing counts and replica hit rates.
+
+        Returns:
+            Dict of route -> replica and primary counts, the reasons reads
+            went to the primary, and ``hit_rate`` (share served by replicas)
+        """
+        with self._lock:
+            snapshot = {route: dict(counts) for route, counts in self._route_stats.items()}
+
+        stats = {}
+        for route, counts in snapshot.items():
+            replica = sum(n for (target, _), n in counts.items() if target == "replica")
+            primary_reasons = {
+                reason: n for (target, reason), n in counts.items() if target == "primary"
+            }
+            primary = sum(primary_reasons.values())
+            stats[route] = {
+                "replica": replica,
+                "primary": primary,
+                "primary_reasons": primary_reasons,
+                "hit_rate": replica / (replica + primary),
+            }
+        return stats
@@ -0,0 +1,763 @@
+"""Incrementally maintained schedule rollups.
+
+Three rollup tables replace per-request aggregation of raw assignments:
+
+- ``person_workload_rollups``: assignments per person per day, split into the
+  fairness audit categories (FMIT, clinic, admin, academic)
+- ``rotation_coverage_rollups``: assignments per rotation template per day
+- ``block_assignment_rollups``: assignments per half-day block
+
+Maintenance happens in the writer's transaction. An ``after_flush`` listener
+collects the dates touched by inserted, updated or deleted ``Assignment``
+rows (and new ``Block`` rows) and recomputes just those dates with one
+``INSERT ... SELECT ... GROUP BY`` per rollup. Changes that cannot be mapped
+to dates cheaply - ORM bulk UPDATE/DELETE statements, block moves, template
+renames, person deletes - mark the rollups stale instead.
+
+Readers never write. When a rollup they need is stale or has never been
+built, they aggregate the raw tables for the requested range instead and
+ask for a refresh. Full rebuilds run only in the ``refresh_schedule_rollups``
+Celery task (on a short beat interval and on request), one short committed
+transaction per rollup. Each run also reconciles rollups marked fresh
+against the raw tables and rebuilds any that drifted.
+
+Writers recount dates under READ COMMITTED, so on PostgreSQL they take
+transaction-scoped advisory locks: a shared rebuild lock, then one lock per
+touched date (in date order). A second writer for the same date waits for
+the first to commit and recounts including its rows; a rebuild takes the
+rebuild lock exclusively, so it neither runs alongside writers nor marks
+their uncommitted changes fresh. SQLite serializes writers on its own.
+
+Unlike the PostgreSQL materialized views in ``app.db.materialized_views``,
+rollups work on every supported dialect and never block readers during a
+refresh.
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import (
+    Integer,
+    Table,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    or_,
+    select,
+    true,
+)
+from sqlalchemy.engine import Connection
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.batch_operations import _upsert_insert
+from app.db.change_tracking import (
+    attribute_changed,
+    bulk_write_connection,
+    bulk_write_mapper,
+    collect_flush_changes,
+    register_listeners,
+    table_available,
+)
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+from app.models.schedule_rollup import (
+    BlockAssignmentRollup,
+    PersonWorkloadRollup,
+    RotationCoverageRollup,
+    ScheduleRollupState,
+)
+
+logger = logging.getLogger(__name__)
+
+PERSON_WORKLOAD = "person_workload"
+ROTATION_COVERAGE = "rotation_coverage"
+BLOCK_COUNTS = "block_counts"
+ROLLUPS = (PERSON_WORKLOAD, ROTATION_COVERAGE, BLOCK_COUNTS)
+
+# Keep IN-lists well under driver bind-parameter limits
+_CHUNK_SIZE = 500
+
+# Assignment columns whose change moves counts between rollup rows
+_TRACKED_COLUMNS = ("block_id", "person_id", "rotation_template_id")
+
+# Models whose edits invalidate rollups wholesale
+_STRUCTURAL_MODELS = (Assignment, Block, Person, RotationTemplate)
+
+# pg_advisory_xact_lock(namespace, key) keys: dates lock by ordinal, the
+# rebuild lock uses 0 (never a date ordinal)
+_LOCK_NAMESPACE = 0x524F4C4C
+_REBUILD_LOCK_KEY = 0
+
+# Minimum gap between refresh requests from one process
+_REFRESH_REQUEST_INTERVAL_SECONDS = 30.0
+_refresh_lock = threading.Lock()
+_last_refresh_request = 0.0
+
+# Fairness audit classification of rotation templates, as SQL
+_TEMPLATE_NAME = func.upper(func.coalesce(RotationTemplate.name, ""))
+_TEMPLATE_TYPE = func.lower(func.coalesce(RotationTemplate.rotation_type, ""))
+_IS_FMIT = _TEMPLATE_NAME.like("%FMIT%")
+_IS_CLINIC = _TEMPLATE_TYPE == "outpatient"
+_IS_ADMIN = or_(
+    _TEMPLATE_NAME.like("%GME%"),
+    _TEMPLATE_NAME.like("%DFM%"),
+    _TEMPLATE_TYPE.in_(("admin", "gme", "dfm")),
+)
+_IS_ACADEMIC = or_(
+    _TEMPLATE_NAME.like("%LEC%"),
+    _TEMPLATE_NAME.like("%ADV%"),
+    _TEMPLATE_TYPE.in_(("academic", "lecture", "advising")),
+)
+
+
+def _count_where(condition: Any) -> Any:
+    # SUM over integers is NUMERIC on PostgreSQL
+    return cast(func.sum(case((condition, 1), else_=0)), Integer)
+
+
+def _person_workload_select(condition: Any) -> Any:
+    return (
+        select(
+            Assignment.person_id,
+            Block.date,
+            func.count(Assignment.id).label("assignment_count"),
+            _count_where(_IS_FMIT).label("fmit_count"),
+            _count_where(_IS_CLINIC).label("clinic_count"),
+            _count_where(_IS_ADMIN).label("admin_count"),
+            _count_where(_IS_ACADEMIC).label("academic_count"),
+        )
+        .join(Block, Assignment.block_id == Block.id)
+        .outerjoin(
+            RotationTemplate, Assignment.rotation_template_id == RotationTemplate.id
+        )
+        .where(condition)
+        .group_by(Assignment.person_id, Block.date)
+    )
+
+
+def _rotation_coverage_select(condition: Any) -> Any:
+    return (
+        select(
+            Assignment.rotation_template_id,
+            Block.date,
+            func.count(Assignment.id),
+            func.count(func.distinct(Assignment.person_id)),
+        )
+        .join(Block, Assignment.block_id == Block.id)
+        .where(Assignment.rotation_template_id.is_not(None), condition)
+        .group_by(Assignment.rotation_template_id, Block.date)
+    )
+
+
+def _block_counts_select(condition: Any) -> Any:
+    return (
+        select(Block.id, Block.date, Block.time_of_day, func.count(Assignment.id))
+        .outerjoin(Assignment, Assignment.block_id == Block.id)
+        .where(condition)
+        .group_by(Block.id, Block.date, Block.time_of_day)
+    )
+
+
+# name -> (table, key columns, value columns, source select builder)
+_DEFINITIONS: dict[str, tuple[Table, tuple[str, ...], tuple[str, ...], Any]] = {
+    PERSON_WORKLOAD: (
+        PersonWorkloadRollup.__table__,
+        ("person_id", "date"),
+        (
+            "assignment_count",
+            "fmit_count",
+            "clinic_count",
+            "admin_count",
+            "academic_count",
+        ),
+        _person_workload_select,
+    ),
+    ROTATION_COVERAGE: (
+        RotationCoverageRollup.__table__,
+        ("rotation_template_id", "date"),
+        ("assignment_count", "person_count"),
+        _rotation_coverage_select,
+    ),
+    BLOCK_COUNTS: (
+        BlockAssignmentRollup.__table__,
+        ("block_id",),
+        ("date", "time_of_day", "assignment_count"),
+        _block_counts_select,
+    ),
+}
+
+
+def _chunks(values: Iterable[Any]) -> Iterator[list[Any]]:
+    items = list(values)
+    for start in range(0, len(items), _CHUNK_SIZE):
+        yield items[start : start + _CHUNK_SIZE]
+
+
+def _refresh_statements(
+    session: Session | AsyncSession, name: str, dates: Sequence[date] | None
+) -> tuple[Any, Any]:
+    """
+    Build the DELETE and INSERT ... SELECT that recompute a rollup.
+
+    Args:
+        session: Session used to pick the dialect-specific INSERT
+        name: Rollup name
+        dates: Dates to recompute, or None for a full rebuild
+
+    Returns:
+        (delete statement, upsert statement)
+    """
+    table, keys, values, source = _DEFINITIONS[name]
+    if dates is None:
+        # SQLite needs a WHERE before ON CONFLICT in INSERT ... SELECT
+        condition = true()
+        delete_stmt = delete(table)
+    else:
+        condition = Block.date.in_(dates)
+        delete_stmt = delete(table).where(table.c.date.in_(dates))
+
+    insert_stmt = _upsert_insert(session, table).from_select(
+        [*keys, *values], source(condition)
+    )
+    # Writers lock their dates first (``_lock_rollups``), so this rarely
+    # conflicts; the upsert keeps a collision from failing the writer.
+    upsert_stmt = insert_stmt.on_conflict_do_update(
+        index_elements=list(keys),
+        set_={column: insert_stmt.excluded[column] for column in values},
+    )
+    return delete_stmt, upsert_stmt
+
+
+def _lock_rollups(
+    connection: Connection | Session, keys: Iterable[int], shared: bool = False
+) -> None:
+    """
+    Take transaction-scoped advisory locks on PostgreSQL (no-op elsewhere).
+
+    Args:
+        connection: Connection or session inside the writing transaction
+        keys: Lock keys, acquired in the given order
+        shared: Take shared rather than exclusive locks
+    """
+    bind = connection if isinstance(connection, Connection) else connection.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+    lock = func.pg_advisory_xact_lock_shared if shared else func.pg_advisory_xact_lock
+    for key in keys:
+        connection.execute(select(lock(_LOCK_NAMESPACE, key)))
+
+
+def _state_upsert(
+    session: Session | AsyncSession, name: str, row_count: int
+) -> Any:
+    now = datetime.now(UTC)
+    stmt = _upsert_insert(session, ScheduleRollupState.__table__).values(
+        name=name, refreshed_at=now, stale_since=None, row_count=row_count
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=["name"],
+        set_={"refreshed_at": now, "stale_since": None, "row_count": row_count},
+    )
+
+
+def _rollups_to_rebuild(
+    states: Iterable[Any], names: Sequence[str]
+) -> list[str]:
+    fresh = {state.name for state in states if state.stale_since is None}
+    return [name for name in names if name not in fresh]
+
+
+_STATE_QUERY = select(ScheduleRollupState.name, ScheduleRollupState.stale_since)
+
+
+def stale_rollups(session: Session, names: Sequence[str] = ROLLUPS) -> list[str]:
+    """
+    Names of the given rollups that are stale or were never built.
+
+    Args:
+        session: Synchronous database session
+        names: Rollups to check
+
+    Returns:
+        Rollup names that need a rebuild
+    """
+    return _rollups_to_rebuild(session.execute(_STATE_QUERY).all(), names)
+
+
+async def stale_rollups_async(
+    db: AsyncSession, names: Sequence[str] = ROLLUPS
+) -> list[str]:
+    """
+    Async variant of ``stale_rollups``.
+
+    Args:
+        db: Async database session
+        names: Rollups to check
+
+    Returns:
+        Rollup names that need a rebuild
+    """
+    result = await db.execute(_STATE_QUERY)
+    return _rollups_to_rebuild(result.all(), names)
+
+
+def rollups_fresh(session: Session, names: Sequence[str]) -> bool:
+    """
+    Whether readers can use the named rollups, requesting a refresh if not.
+
+    Args:
+        session: Synchronous database session
+        names: Rollups the caller is about to read
+
+    Returns:
+        True if every named rollup is built and current
+    """
+    if stale_rollups(session, names):
+        request_refresh()
+        return False
+    return True
+
+
+async def rollups_fresh_async(db: AsyncSession, names: Sequence[str]) -> bool:
+    """
+    Async variant of ``rollups_fresh``.
+
+    Args:
+        db: Async database session
+        names: Rollups the caller is about to read
+
+    Returns:
+        True if every named rollup is built and current
+    """
+    if await stale_rollups_async(db, names):
+        request_refresh()
+        return False
+    return True
+
+
+def rebuild_rollup(session: Session, name: str) -> int:
+    """
+    Rebuild one rollup from the raw tables and mark it fresh.
+
+    Only the refresh task calls this; it commits each rebuild in its own
+    transaction. Writers to the schedule tables wait until that commit.
+
+    Args:
+        session: Synchronous database session
+        name: Rollup name
+
+    Returns:
+        Number of rollup rows written
+    """
+    _lock_rollups(session, [_REBUILD_LOCK_KEY])
+    delete_stmt, upsert_stmt = _refresh_statements(session, name, None)
+    session.execute(delete_stmt)
+    row_count = session.execute(upsert_stmt).rowcount
+    session.execute(_state_upsert(session, name, row_count))
+    logger.info(f"Rebuilt schedule rollup {name} ({row_count} rows)")
+    return row_count
+
+
+def _drifted_rows(session: Session, name: str) -> int:
+    """Rows that differ between a rollup and a fresh aggregation."""
+    table, keys, values, source = _DEFINITIONS[name]
+    expected = source(true())
+    stored = select(*(table.c[column] for column in (*keys, *values)))
+    return sum(
+        session.scalar(select(func.count()).select_from(query.subquery()))
+        for query in (expected.except_(stored), stored.except_(expected))
+    )
+
+
+def reconcile_rollup(session: Session, name: str) -> bool:
+    """
+    Rebuild a rollup if it is stale, never built, or differs from raw rows.
+
+    Holds the rebuild lock for the whole comparison, so no writer changes
+    assignments between the comparison and the rebuild.
+
+    Args:
+        session: Synchronous database session
+        name: Rollup name
+
+    Returns:
+        Whether the rollup was rebuilt
+    """
+    _lock_rollups(session, [_REBUILD_LOCK_KEY])
+    if not stale_rollups(session, (name,)):
+        drifted = _drifted_rows(session, name)
+        if not drifted:
+            return False
+        logger.warning(
+            f"Schedule rollup {name} drifted from raw assignments "
+            f"({drifted} rows differ); rebuilding"
+        )
+    rebuild_rollup(session, name)
+    return True
+
+
+def request_refresh() -> None:
+    """
+    Enqueue ``refresh_schedule_rollups`` without blocking the caller.
+
+    Requests from one process are throttled, and the enqueue runs on a
+    background thread so an unreachable broker never delays a read.
+    """
+    global _last_refresh_request
+    with _refresh_lock:
+        now = time.monotonic()
+        if now - _last_refresh_request < _REFRESH_REQUEST_INTERVAL_SECONDS:
+            return
+        _last_refresh_request = now
+    threading.Thread(
+        target=_enqueue_refresh, name="rollup-refresh-request", daemon=True
+    ).start()
+
+
+def _enqueue_refresh() -> None:
+    try:
+        from app.tasks.schedule_metrics_tasks import refresh_schedule_rollups
+
+        refresh_schedule_rollups.apply_async(queue="metrics", retry=False)
+    except Exception as e:
+        logger.warning(f"Could not enqueue schedule rollup refresh: {e}")
+
+
+def mark_stale(connection: Connection | Session) -> None:
+    """
+    Flag every built rollup as stale until the refresh task rebuilds it.
+
+    Call this after writing assignments through Core statements that bypass
+    the ORM (for example ``connection.execute(insert(assignments_table))``).
+
+    Args:
+        connection: Connection or session inside the writing transaction
+    """
+    _lock_rollups(connection, [_REBUILD_LOCK_KEY], shared=True)
+    connection.execute(
+        ScheduleRollupState.__table__.update()
+        .where(ScheduleRollupState.stale_since.is_(None))
+        .values(stale_since=datetime.now(UTC))
+    )
+
+
+def get_rollup_status(session: Session) -> dict[str, dict[str, Any]]:
+    """
+    Report refresh time and staleness for each rollup.
+
+    Args:
+        session: Synchronous database session
+
+    Returns:
+        Rollup name -> refreshed_at, stale_since, row_count, age_seconds
+        (None values for rollups that were never built)
+    """
+    states = {
+        state.name: state
+        for state in session.execute(select(ScheduleRollupState)).scalars()
+    }
+    now = datetime.now(UTC).replace(tzinfo=None)
+    status: dict[str, dict[str, Any]] = {}
+    for name in ROLLUPS:
+        state = states.get(name)
+        refreshed_at = state.refreshed_at if state else None
+        status[name] = {
+            "refreshed_at": refreshed_at,
+            "stale_since": state.stale_since if state else None,
+            "row_count": state.row_count if state else None,
+            "age_seconds": (
+                (now - refreshed_at.replace(tzinfo=None)).total_seconds()
+                if refreshed_at
+                else None
+            ),
+        }
+    return status
+
+
+# ---------------------------------------------------------------------------
+# Readers
+# ---------------------------------------------------------------------------
+
+
+def _date_range(start_date: date, end_date: date) -> Any:
+    return and_(Block.date >= start_date, Block.date <= end_date)
+
+
+def person_day_counts(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    person_ids: Sequence[UUID] | None = None,
+) -> dict[tuple[UUID, date], int]:
+    """
+    Assignments per (person, date) in a date range.
+
+    Args:
+        session: Synchronous database session
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        person_ids: Optional person filter
+
+    Returns:
+        (person_id, date) -> assignment count, for non-zero cells only
+    """
+    query = person_workload_query(
+        start_date,
+        end_date,
+        person_ids,
+        from_rollup=rollups_fresh(session, (PERSON_WORKLOAD,)),
+    )
+    return {
+        (row.person_id, row.date): row.assignment_count
+        for row in session.execute(query)
+        if row.assignment_count
+    }
+
+
+def person_workload_query(
+    start_date: date,
+    end_date: date,
+    person_ids: Sequence[UUID] | None = None,
+    from_rollup: bool = True,
+) -> Any:
+    """
+    Query for per-person, per-day assignment counts by fairness category.
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        person_ids: Optional person filter
+        from_rollup: Read the rollup (False aggregates raw assignments,
+            for when ``rollups_fresh`` says the rollup is stale)
+
+    Returns:
+        SELECT yielding ``person_id``, ``date``, ``assignment_count``,
+        ``fmit_count``, ``clinic_count``, ``admin_count`` and
+        ``academic_count`` columns
+    """
+    if not from_rollup:
+        condition = _date_range(start_date, end_date)
+        if person_ids:
+            condition = and_(condition, Assignment.person_id.in_(person_ids))
+        return _person_workload_select(condition)
+
+    query = select(
+        PersonWorkloadRollup.person_id,
+        PersonWorkloadRollup.date,
+        PersonWorkloadRollup.assignment_count,
+        PersonWorkloadRollup.fmit_count,
+        PersonWorkloadRollup.clinic_count,
+        PersonWorkloadRollup.admin_count,
+        PersonWorkloadRollup.academic_count,
+    ).where(
+        PersonWorkloadRollup.date >= start_date,
+        PersonWorkloadRollup.date <= end_date,
+    )
+    if person_ids:
+        query = query.where(PersonWorkloadRollup.person_id.in_(person_ids))
+    return query
+
+
+def rotation_day_counts(
+    session: Session,
+    start_date: date,
+    end_date: date,
+    rotation_ids: Sequence[UUID] | None = None,
+) -> dict[tuple[UUID, date], int]:
+    """
+    Assignments per (rotation template, date) in a date range.
+
+    Args:
+        session: Synchronous database session
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        rotation_ids: Optional rotation template filter
+
+    Returns:
+        (rotation_template_id, date) -> assignment count, for non-zero cells
+    """
+    if rollups_fresh(session, (ROTATION_COVERAGE,)):
+        query = select(
+            RotationCoverageRollup.rotation_template_id,
+            RotationCoverageRollup.date,
+            RotationCoverageRollup.assignment_count,
+        ).where(
+            RotationCoverageRollup.date >= start_date,
+            RotationCoverageRollup.date <= end_date,
+        )
+        if rotation_ids:
+            query = query.where(
+                RotationCoverageRollup.rotation_template_id.in_(rotation_ids)
+            )
+    else:
+        condition = _date_range(start_date, end_date)
+        if rotation_ids:
+            condition = and_(
+                condition, Assignment.rotation_template_id.in_(rotation_ids)
+            )
+        query = _rotation_coverage_select(condition)
+    return {
+        (rotation_id, day): count
+        for rotation_id, day, count, *_ in session.execute(query)
+        if count
+    }
+
+
+def daily_assignment_query(
+    start_date: date, end_date: date, from_rollup: bool = True
+) -> Any:
+    """
+    Query for (date, assignment count) over every date that has blocks.
+
+    Args:
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+        from_rollup: Read the ``BLOCK_COUNTS`` rollup (False aggregates raw
+            assignments, for when ``rollups_fresh`` says it is stale)
+
+    Returns:
+        SELECT yielding ``date`` and ``count`` columns ordered by date
+    """
+    if not from_rollup:
+        return (
+            select(Block.date, func.count(Assignment.id).label("count"))
+            .outerjoin(Assignment, Assignment.block_id == Block.id)
+            .where(_date_range(start_date, end_date))
+            .group_by(Block.date)
+            .order_by(Block.date)
+        )
+    return (
+        select(
+            BlockAssignmentRollup.date,
+            # SUM over integers is NUMERIC on PostgreSQL
+            cast(func.sum(BlockAssignmentRollup.assignment_count), Integer).label(
+                "count"
+            ),
+        )
+        .where(
+            BlockAssignmentRollup.date >= start_date,
+            BlockAssignmentRollup.date <= end_date,
+        )
+        .group_by(BlockAssignmentRollup.date)
+        .order_by(BlockAssignmentRollup.date)
+    )
+
+
+def daily_assignment_counts(
+    session: Session, start_date: date, end_date: date
+) -> dict[date, int]:
+    """
+    Total assignments per date in a date range.
+
+    Args:
+        session: Synchronous database session
+        start_date: First date (inclusive)
+        end_date: Last date (inclusive)
+
+    Returns:
+        date -> assignment count, for dates that have blocks
+    """
+    query = daily_assignment_query(
+        start_date, end_date, from_rollup=rollups_fresh(session, (BLOCK_COUNTS,))
+    )
+    return {day: int(count) for day, count in session.execute(query)}
+
+
+# ---------------------------------------------------------------------------
+# Maintenance listeners
+# ---------------------------------------------------------------------------
+
+
+def _collect_changes(session: Session) -> tuple[set[Any], set[date], bool]:
+    """
+    Gather what a flush changed.
+
+    Returns:
+        (block ids of touched assignments, dates of new blocks,
+        whether a structural change requires a full rebuild)
+    """
+    changes = collect_flush_changes(
+        session, Assignment, ("block_id",), tracked=_TRACKED_COLUMNS
+    )
+    dates = {obj.date for obj in changes.new if isinstance(obj, Block)}
+    structural = (
+        changes.unresolved
+        or any(isinstance(obj, _STRUCTURAL_MODELS) for obj in changes.deleted)
+        or any(
+            isinstance(obj, Block) and attribute_changed(obj, "date")
+            for obj in changes.dirty
+        )
+        or any(
+            isinstance(obj, RotationTemplate)
+            and (
+                attribute_changed(obj, "name")
+                or attribute_changed(obj, "rotation_type")
+            )
+            for obj in changes.dirty
+        )
+    )
+    return changes.values("block_id"), dates, structural
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """Apply a flush's assignment changes to the rollups."""
+    block_ids, dates, structural = _collect_changes(session)
+    if not (block_ids or dates or structural):
+        return
+
+    connection = session.connection()
+    if not table_available(connection, ScheduleRollupState.__tablename__):
+        return
+    if structural:
+        mark_stale(connection)
+        return
+
+    # Held until commit: a rebuild waits for this transaction's rows
+    _lock_rollups(connection, [_REBUILD_LOCK_KEY], shared=True)
+    fresh = [
+        state.name
+        for state in connection.execute(_STATE_QUERY)
+        if state.stale_since is None
+    ]
+    if not fresh:
+        return  # Nothing built yet; the refresh task does a full build
+
+    for chunk in _chunks(block_ids):
+        dates.update(
+            connection.execute(select(Block.date).where(Block.id.in_(chunk))).scalars()
+        )
+    # Recount each date only once earlier writers to it have committed
+    _lock_rollups(connection, (day.toordinal() for day in sorted(dates)))
+    for name in fresh:
+        for chunk in _chunks(sorted(dates)):
+            for stmt in _refresh_statements(session, name, chunk):
+                connection.execute(stmt)
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Mark rollups stale before ORM bulk writes to schedule tables."""
+    mapper = bulk_write_mapper(orm_execute_state, _STRUCTURAL_MODELS)
+    if mapper is None:
+        return
+    # Bind by the statement so a replica-routed session marks the primary
+    connection = bulk_write_connection(orm_execute_state, mapper)
+    if table_available(connection, ScheduleRollupState.__tablename__):
+        mark_stale(connection)
+
+
+def register_rollup_listeners() -> None:
+    """Install the session listeners that keep rollups current (idempotent)."""
+    register_listeners(
+        Session,
+        {"after_flush": _after_flush, "do_orm_execute": _on_orm_execute},
+    )
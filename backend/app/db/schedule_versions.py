@@ -0,0 +1,196 @@
+"""Per-scope schedule version counters.
+
+Calendar feeds are validated with ETags derived from these counters instead
+of from the assignments they render, so an unchanged feed can answer
+``304 Not Modified`` after reading a couple of primary-key rows.
+
+Scopes:
+
+- ``person:<uuid>``: that person's assignments
+- ``program``: any assignment (whole-program and rotation feeds)
+- ``structure``: blocks, people and rotation templates, whose names, dates
+  and locations are rendered into every feed
+
+An ``after_flush`` listener collects the scopes touched by inserted,
+updated or deleted ``Assignment`` rows and by edits to the rendered columns
+of blocks, people and templates. ORM bulk UPDATE/DELETE statements cannot be
+mapped to people cheaply and collect ``structure`` instead, which
+invalidates every feed. The collected scopes are bumped once, just before
+the transaction commits, with a single upsert in sorted scope order. Writers
+therefore lock the shared ``program`` row only briefly at commit, always in
+the same order as other writers.
+"""
+
+from collections.abc import Iterable, Sequence
+from datetime import UTC, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.change_tracking import (
+    PendingChanges,
+    attribute_changed,
+    bulk_write_mapper,
+    collect_flush_changes,
+    register_listeners,
+    table_available,
+)
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+from app.models.schedule_version import ScheduleVersion
+
+PROGRAM = "program"
+STRUCTURE = "structure"
+
+# Columns rendered into calendar feeds; other edits leave feeds unchanged
+_RENDERED_COLUMNS: dict[type, tuple[str, ...]] = {
+    Block: ("date", "time_of_day"),
+    Person: ("name", "type", "pgy_level"),
+    RotationTemplate: ("name", "rotation_type", "clinic_location"),
+}
+
+_SCHEDULE_MODELS = (Assignment, Block, Person, RotationTemplate)
+
+_pending_scopes = PendingChanges("schedule_version_scopes")
+
+
+def person_scope(person_id: UUID | str) -> str:
+    """Version scope for one person's assignments."""
+    return f"person:{person_id}"
+
+
+def get_versions(
+    session: Session, scopes: Sequence[str]
+) -> dict[str, tuple[int, datetime | None]]:
+    """
+    Current version and last bump time for each scope.
+
+    Args:
+        session: Synchronous database session
+        scopes: Scopes to read
+
+    Returns:
+        Scope -> (version, updated_at); never-bumped scopes are (0, None)
+    """
+    rows = session.execute(
+        select(
+            ScheduleVersion.scope,
+            ScheduleVersion.version,
+            ScheduleVersion.updated_at,
+        ).where(ScheduleVersion.scope.in_(scopes))
+    )
+    found = {scope: (version, updated_at) for scope, version, updated_at in rows}
+    return {scope: found.get(scope, (0, None)) for scope in scopes}
+
+
+def bump_versions(connection: Connection | Session, scopes: Iterable[str]) -> None:
+    """
+    Increment the version of each scope inside the writing transaction.
+
+    Call this after writing assignments through Core statements that bypass
+    the ORM, with ``STRUCTURE`` when the affected people are unknown.
+
+    Args:
+        connection: Connection or session inside the writing transaction
+        scopes: Scopes to bump
+    """
+    now = datetime.now(UTC)
+    rows = [
+        {"scope": scope, "version": 1, "updated_at": now}
+        for scope in sorted(set(scopes))
+    ]
+    if not rows:
+        return
+    bind = connection.get_bind() if isinstance(connection, Session) else connection
+    table = ScheduleVersion.__table__
+    if bind.dialect.name == "postgresql":
+        stmt = pg_insert(table).values(rows)
+    elif bind.dialect.name == "sqlite":
+        stmt = sqlite_insert(table).values(rows)
+    else:
+        raise NotImplementedError(
+            f"ON CONFLICT upsert not supported for {bind.dialect.name}"
+        )
+    connection.execute(
+        stmt.on_conflict_do_update(
+            index_elements=["scope"],
+            set_={"version": table.c.version + 1, "updated_at": now},
+        )
+    )
+
+
+def _rendered_change(obj: Any) -> bool:
+    return any(attribute_changed(obj, key) for key in _RENDERED_COLUMNS[type(obj)])
+
+
+def _collect_scopes(session: Session) -> set[str]:
+    """Scopes whose feeds a flush changed."""
+    changes = collect_flush_changes(session, Assignment, ("person_id",))
+    structural = (
+        changes.unresolved
+        or any(isinstance(obj, _SCHEDULE_MODELS) for obj in changes.deleted)
+        or any(
+            type(obj) in _RENDERED_COLUMNS and _rendered_change(obj)
+            for obj in changes.dirty
+        )
+    )
+
+    scopes = {person_scope(person_id) for person_id in changes.values("person_id")}
+    if scopes:
+        scopes.add(PROGRAM)
+    if structural:
+        scopes.add(STRUCTURE)
+    return scopes
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """Collect the scopes a flush changed until the transaction commits."""
+    scopes = _collect_scopes(session)
+    if scopes:
+        _pending_scopes.add(session, scopes)
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Collect ``structure`` for ORM bulk writes to schedule tables."""
+    if bulk_write_mapper(orm_execute_state, _SCHEDULE_MODELS) is not None:
+        _pending_scopes.add(orm_execute_state.session, (PROGRAM, STRUCTURE))
+
+
+def _before_commit(session: Session) -> None:
+    """Bump every scope the transaction changed, once, before it commits."""
+    if session.in_nested_transaction():
+        return  # Savepoint release; the outer commit bumps
+    # Commit flushes after this hook; flush now so its scopes are included
+    session.flush()
+    scopes = _pending_scopes.pop(session)
+    if not scopes:
+        return
+    connection = session.connection()
+    if table_available(connection, ScheduleVersion.__tablename__):
+        bump_versions(connection, scopes)
+
+
+def _after_transaction_end(session: Session, transaction: Any) -> None:
+    """Drop scopes left by a rolled-back transaction."""
+    if transaction.parent is None:
+        _pending_scopes.pop(session)
+
+
+def register_schedule_version_listeners() -> None:
+    """Install the session listeners that bump schedule versions (idempotent)."""
+    register_listeners(
+        Session,
+        {
+            "after_flush": _after_flush,
+            "do_orm_execute": _on_orm_execute,
+            "before_commit": _before_commit,
+            "after_transaction_end": _after_transaction_end,
+        },
+    )
@@ -11,19 +11,42 @@ Pool settings are configurable via environment variables:
 - DB_POOL_TIMEOUT: Wait time for connection (default: 30s)
 - DB_POOL_RECYCLE: Connection lifetime (default: 1800s)
 - DB_POOL_PRE_PING: Verify connections (default: True)
+
+Read-only routes can read from replicas listed in DATABASE_REPLICA_URLS by
+depending on ``get_read_db`` (see ``app.db.replicas.routing``).
 """
 
 from collections.abc import AsyncGenerator, Generator
 from contextlib import asynccontextmanager, contextmanager
 
+from fastapi import Request
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
 
 from app.core.config import get_settings
+from app.db.replicas.routing import (
+    READ_ONLY_ROUTE_STATE_KEY,
+    STICKY_PRIMARY_COOKIE,
+    ReadReplicaRouter,
+)
+from app.db.rollups import register_rollup_listeners
+from app.db.schedule_versions import register_schedule_version_listeners
 
 settings = get_settings()
 
+
+def _driver_options(url: str) -> dict:
+    """Driver-specific engine options for the synchronous engine."""
+    if make_url(url).get_dialect().driver == "psycopg2":
+        # Page ORM UPDATE/DELETE flushes through execute_batch instead of one
+        # round-trip per row (schedule regeneration deletes thousands of
+        # versioned assignments through the unit of work).
+        return {"executemany_mode": "values_plus_batch"}
+    return {}
+
+
 # Synchronous engine (legacy support)
 engine = create_engine(
     settings.DATABASE_URL,
@@ -33,10 +56,34 @@ engine = create_engine(
     max_overflow=settings.DB_POOL_MAX_OVERFLOW,  # Allow burst connections
     pool_timeout=settings.DB_POOL_TIMEOUT,  # Wait for connection
     pool_recycle=settings.DB_POOL_RECYCLE,  # Prevent stale connections
+    **_driver_options(settings.DATABASE_URL),
 )
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Keep schedule rollups and feed versions in step with assignment writes
+register_rollup_listeners()
+register_schedule_version_listeners()
+
+# Read replicas for routes that depend on get_read_db
+read_router = ReadReplicaRouter(
+    engine,
+    {
+        f"replica{index}": create_engine(
+            url,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            **_driver_options(url),
+        )
+        for index, url in enumerate(settings.DATABASE_REPLICA_URLS, start=1)
+    },
+    max_lag_seconds=settings.DB_REPLICA_MAX_LAG_SECONDS,
+    sticky_seconds=settings.DB_REPLICA_STICKY_SECONDS,
+)
+
 # Async engine (preferred for all new code)
 async_engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
@@ -81,6 +128,44 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+def get_read_db(request: Request) -> Generator[Session, None, None]:
+    """
+    Get a read-mostly database session for read-only routes.
+
+    Reads go to a read replica when one is configured, healthy and within
+    the DB_REPLICA_MAX_LAG_SECONDS staleness budget. Otherwise, and for
+    DB_REPLICA_STICKY_SECONDS after the requesting user's last write, the
+    session reads from the primary. Anything the route writes goes to the
+    primary, and the session reads from the primary from then on.
+
+    Usage:
+        @router.get("/reports/summary")
+        def summary(db: Session = Depends(get_read_db)):
+            ...
+    """
+    # Deferred: the auth context imports models, which import app.db
+    from app.core.auth_context import get_request_auth_context
+
+    setattr(request.state, READ_ONLY_ROUTE_STATE_KEY, True)
+    route = request.scope.get("route")
+    try:
+        primary_until = float(request.cookies.get(STICKY_PRIMARY_COOKIE, ""))
+    except ValueError:
+        primary_until = None
+    db = read_router.open_session(
+        route=getattr(route, "path", request.url.path),
+        user_id=get_request_auth_context(request).user_id,
+        primary_until=primary_until,
+    )
+    try:
+        yield db
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
 async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
     """
     Get async database session dependency for FastAPI routes (PREFERRED).
@@ -9,6 +9,8 @@ from typing import Any
 
 from fastapi.openapi.utils import get_openapi
 
+from app.api.lazy_router import load_lazy_routers
+
 
 class OpenAPIEnhancer:
     """Enhances OpenAPI schemas with additional documentation and examples."""
@@ -86,7 +88,8 @@ class OpenAPIEnhancer:
         Returns:
             Enhanced OpenAPI schema dictionary
         """
-        # Get base OpenAPI schema
+        # Get base OpenAPI schema (with every lazily mounted router loaded)
+        load_lazy_routers(app)
         openapi_schema = get_openapi(
             title=app.title,
             version=app.version,
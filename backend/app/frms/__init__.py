@@ -6,6 +6,7 @@ residency scheduling, based on validated bio-mathematical models.
 
 Key Components:
 - Three-Process Model of Alertness (circadian, homeostatic, sleep inertia)
+- Roster-wide vectorized evaluation of the Three-Process Model
 - ML-based performance degradation prediction
 - Fatigue-aware constraint generation for schedule optimization
 - What-if scenario testing and impact analysis
@@ -31,6 +32,10 @@ from app.frms.three_process_model import (
     SleepInertiaState,
     EffectivenessScore,
 )
+from app.frms.roster_model import (
+    RosterFatigueModel,
+    RosterEffectiveness,
+)
 from app.frms.performance_predictor import (
     PerformancePredictor,
     PerformanceDegradation,
@@ -68,6 +73,8 @@ __all__ = [
     "CircadianPhase",
     "SleepInertiaState",
     "EffectivenessScore",
+    "RosterFatigueModel",
+    "RosterEffectiveness",
     # Performance Prediction
     "PerformancePredictor",
     "PerformanceDegradation",
@@ -28,6 +28,8 @@ from datetime import date, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
+import numpy as np
+
 from app.scheduling.constraints.base import (
     Constraint,
     ConstraintPriority,
@@ -38,11 +40,77 @@ from app.scheduling.constraints.base import (
     SchedulingContext,
     SoftConstraint,
 )
+from app.frms.roster_model import RosterEffectiveness, RosterFatigueModel, block_time
 from app.frms.three_process_model import ThreeProcessModel, AlertnessState
 
 logger = logging.getLogger(__name__)
 
 
+def evaluate_roster(
+    engine: RosterFatigueModel,
+    context: SchedulingContext,
+    assignments: list[Any] | None = None,
+) -> RosterEffectiveness | None:
+    """
+    Evaluate fatigue for every resident in a scheduling context at once.
+
+    Duty comes from the context's preassigned work blocks plus
+    ``assignments`` (default: the context's existing assignments).
+
+    Returns:
+        RosterEffectiveness covering the context's blocks, or None if there
+        are no blocks
+    """
+    if assignments is None:
+        assignments = context.existing_assignments
+    blocks_by_id = {block.id: block for block in context.blocks}
+
+    person_ids = [resident.id for resident in context.residents]
+    known = set(person_ids)
+    duties: list[tuple[UUID, date, str]] = []
+
+    def add_duty(person_id: UUID, block: Any) -> None:
+        if person_id not in known:
+            known.add(person_id)
+            person_ids.append(person_id)
+        duties.append((person_id, block.date, getattr(block, "time_of_day", "AM")))
+
+    for person_id, block_ids in context.preassigned_work_blocks.items():
+        for block_id in block_ids:
+            if block_id in blocks_by_id:
+                add_duty(person_id, blocks_by_id[block_id])
+    for assignment in assignments:
+        person_id = getattr(assignment, "person_id", None)
+        block = getattr(assignment, "block", None) or blocks_by_id.get(
+            getattr(assignment, "block_id", None)
+        )
+        if person_id and block:
+            add_duty(person_id, block)
+
+    dates = [block.date for block in context.blocks]
+    dates += [duty_date for _, duty_date, _ in duties]
+    if not dates:
+        return None
+    start_date = min(dates + [context.start_date] if context.start_date else dates)
+    end_date = max(dates + [context.end_date] if context.end_date else dates)
+
+    return engine.evaluate(person_ids, start_date, end_date, duties)
+
+
+def resident_block_effectiveness(
+    result: RosterEffectiveness,
+    context: SchedulingContext,
+) -> np.ndarray:
+    """Effectiveness matrix in (context.residents x context.blocks) order."""
+    return result.sample(
+        [resident.id for resident in context.residents],
+        [
+            block_time(block.date, getattr(block, "time_of_day", "AM"))
+            for block in context.blocks
+        ],
+    )
+
+
 # =============================================================================
 # Constraint Type Aliases (FRMS types now in base ConstraintType)
 # =============================================================================
@@ -137,6 +205,7 @@ class FatigueConstraint(HardConstraint):
         )
         self.threshold = threshold
         self.model = ThreeProcessModel()
+        self.roster_model = RosterFatigueModel(self.model)
         self._alertness_states: dict[UUID, AlertnessState] = {}
 
     def initialize_states(
@@ -213,8 +282,9 @@ class FatigueConstraint(HardConstraint):
         Uses indicator constraints: if assignment[r,b] = 1 and
         predicted_effectiveness < threshold, then constraint is violated.
 
-        For efficiency, pre-computes effectiveness predictions and only
-        adds constraints for assignments that could violate threshold.
+        Effectiveness for every resident x block is evaluated in one pass
+        over the roster, and constraints are only added for assignments
+        below the threshold.
 
         Args:
             model: OR-Tools CP-SAT model
@@ -234,50 +304,46 @@ class FatigueConstraint(HardConstraint):
             )
             return
 
-            # Initialize states if not done
-        if not self._alertness_states and context.start_date is not None:
-            self.initialize_states(
-                context, datetime.combine(context.start_date, datetime.min.time())
-            )
-
         blocked_count = 0
+        for key in self._blocked_variable_keys(context):
+            if key in x:
+                # Force variable to 0
+                model.Add(x[key] == 0)
+                blocked_count += 1
 
-        # For each potential assignment, check if it would violate fatigue limit
-        for resident in context.residents:
+        logger.info(f"Blocked {blocked_count} assignments due to fatigue constraints")
+
+    def _blocked_variable_keys(
+        self, context: SchedulingContext
+    ) -> list[tuple[int, int, int]]:
+        """(r, b, t) variable keys for resident-blocks below the threshold."""
+        result = evaluate_roster(self.roster_model, context)
+        if result is None:
+            return []
+        effectiveness = resident_block_effectiveness(result, context)
+
+        template_indices = [
+            t_idx
+            for template in context.templates
+            if (t_idx := context.template_idx.get(template.id)) is not None
+        ]
+        keys = []
+        for r, b in zip(*np.nonzero(effectiveness < self.threshold)):
+            resident = context.residents[r]
+            block = context.blocks[b]
             r_idx = context.resident_idx.get(resident.id)
-            if r_idx is None:
+            b_idx = context.block_idx.get(block.id)
+            if r_idx is None or b_idx is None:
                 continue
+            # Block all template assignments for this person-block
+            keys.extend((r_idx, b_idx, t_idx) for t_idx in template_indices)
 
-            for block in context.blocks:
-                b_idx = context.block_idx.get(block.id)
-                if b_idx is None:
-                    continue
-
-                    # Predict effectiveness for this assignment
-                effectiveness = self.predict_effectiveness(
-                    person_id=resident.id,
-                    block_date=block.date,
-                    time_of_day=getattr(block, "time_of_day", "AM"),
+            if effectiveness[r, b] < self.CRITICAL_THRESHOLD:
+                logger.warning(
+                    f"Critical fatigue risk for {resident.id} on {block.date}: "
+                    f"{effectiveness[r, b]:.1f}%"
                 )
-
-                # If below threshold, block assignment completely
-                if effectiveness < self.threshold:
-                    # Block all template assignments for this person-block
-                    for template in context.templates:
-                        t_idx = context.template_idx.get(template.id)
-                        if t_idx is not None and (r_idx, b_idx, t_idx) in x:
-                            # Force variable to 0
-                            model.Add(x[r_idx, b_idx, t_idx] == 0)
-                            blocked_count += 1
-
-                            # If below critical threshold, log warning
-                if effectiveness < self.CRITICAL_THRESHOLD:
-                    logger.warning(
-                        f"Critical fatigue risk for {resident.id} on {block.date}: "
-                        f"{effectiveness:.1f}%"
-                    )
-
-        logger.info(f"Blocked {blocked_count} assignments due to fatigue constraints")
+        return keys
 
     def add_to_pulp(
         self,
@@ -299,34 +365,15 @@ class FatigueConstraint(HardConstraint):
         if x is None:
             return
 
-        if not self._alertness_states and context.start_date is not None:
-            self.initialize_states(
-                context, datetime.combine(context.start_date, datetime.min.time())
-            )
-
-        for resident in context.residents:
-            r_idx = context.resident_idx.get(resident.id)
-            for block in context.blocks:
-                b_idx = context.block_idx.get(block.id)
-
-                effectiveness = self.predict_effectiveness(
-                    person_id=resident.id,
-                    block_date=block.date,
-                    time_of_day=getattr(block, "time_of_day", "AM"),
+        for key in self._blocked_variable_keys(context):
+            if key in x:
+                r_idx, b_idx, t_idx = key
+                # PuLP: x == 0 constraint
+                model += (
+                    x[key] == 0,
+                    f"fatigue_block_{r_idx}_{b_idx}_{t_idx}",
                 )
 
-                if effectiveness < self.threshold:
-                    for template in context.templates:
-                        t_idx = context.template_idx.get(template.id)
-                        if t_idx is not None:
-                            key = (r_idx, b_idx, t_idx)
-                            if key in x:
-                                # PuLP: x == 0 constraint
-                                model += (
-                                    x[key] == 0,
-                                    f"fatigue_block_{r_idx}_{b_idx}_{t_idx}",
-                                )
-
     def validate(
         self,
         assignments: list[Any],
@@ -346,18 +393,18 @@ class FatigueConstraint(HardConstraint):
             return ConstraintResult(satisfied=True)
 
         violations = []
+        result = evaluate_roster(self.roster_model, context, assignments)
 
         for assignment in assignments:
             person_id = getattr(assignment, "person_id", None)
             block = getattr(assignment, "block", None)
 
-            if not person_id or not block:
+            if not person_id or not block or result is None:
                 continue
 
-            effectiveness = self.predict_effectiveness(
-                person_id=person_id,
-                block_date=block.date,
-                time_of_day=getattr(block, "time_of_day", "AM"),
+            effectiveness = result.at(
+                person_id,
+                block_time(block.date, getattr(block, "time_of_day", "AM")),
             )
 
             if effectiveness < self.threshold:
@@ -421,6 +468,7 @@ class FatigueSoftConstraint(SoftConstraint):
             enabled=enabled,
         )
         self.model = ThreeProcessModel()
+        self.roster_model = RosterFatigueModel(self.model)
         self._alertness_states: dict[UUID, AlertnessState] = {}
 
     def calculate_penalty(self, effectiveness: float) -> float:
@@ -469,34 +517,23 @@ class FatigueSoftConstraint(SoftConstraint):
         if x is None:
             return
 
-        for resident in context.residents:
-            r_idx = context.resident_idx.get(resident.id)
-            if r_idx is None:
+        result = evaluate_roster(self.roster_model, context)
+        if result is None:
+            return
+        effectiveness = resident_block_effectiveness(result, context)
+
+        for r, b in zip(*np.nonzero(effectiveness < self.FAA_CAUTION_THRESHOLD)):
+            r_idx = context.resident_idx.get(context.residents[r].id)
+            b_idx = context.block_idx.get(context.blocks[b].id)
+            if r_idx is None or b_idx is None:
                 continue
 
-            for block in context.blocks:
-                b_idx = context.block_idx.get(block.id)
-                if b_idx is None:
-                    continue
-
-                    # Get or predict effectiveness
-                state = self._alertness_states.get(resident.id)
-                if not state:
-                    state = self.model.create_state(resident.id)
-                    self._alertness_states[resident.id] = state
-
-                tod = 8.0 if getattr(block, "time_of_day", "AM") == "AM" else 14.0
-                score = self.model.calculate_effectiveness(state, tod)
-                penalty = self.calculate_penalty(score.overall)
-
-                if penalty > 0:
-                    for template in context.templates:
-                        t_idx = context.template_idx.get(template.id)
-                        if t_idx is not None and (r_idx, b_idx, t_idx) in x:
-                            # Add penalty term: penalty * x[r,b,t]
-                            objective_terms.append(
-                                (int(penalty), x[r_idx, b_idx, t_idx])
-                            )
+            penalty = self.calculate_penalty(float(effectiveness[r, b]))
+            for template in context.templates:
+                t_idx = context.template_idx.get(template.id)
+                if t_idx is not None and (r_idx, b_idx, t_idx) in x:
+                    # Add penalty term: penalty * x[r,b,t]
+                    objective_terms.append((int(penalty), x[r_idx, b_idx, t_idx]))
 
         variables["objective_terms"] = objective_terms
 
@@ -525,32 +562,30 @@ class FatigueSoftConstraint(SoftConstraint):
 
         total_penalty = 0.0
         violations = []
+        result = evaluate_roster(self.roster_model, context, assignments)
 
         for assignment in assignments:
             person_id = getattr(assignment, "person_id", None)
             block = getattr(assignment, "block", None)
 
-            if not person_id or not block:
+            if not person_id or not block or result is None:
                 continue
 
-            state = self._alertness_states.get(person_id)
-            if not state:
-                state = self.model.create_state(person_id)
-                self._alertness_states[person_id] = state
-
-            tod = 8.0 if getattr(block, "time_of_day", "AM") == "AM" else 14.0
-            score = self.model.calculate_effectiveness(state, tod)
-            penalty = self.calculate_penalty(score.overall)
+            effectiveness = result.at(
+                person_id,
+                block_time(block.date, getattr(block, "time_of_day", "AM")),
+            )
+            penalty = self.calculate_penalty(effectiveness)
 
             total_penalty += penalty
 
-            if score.overall < self.FAA_CAUTION_THRESHOLD:
+            if effectiveness < self.FAA_CAUTION_THRESHOLD:
                 violations.append(
                     ConstraintViolation(
                         constraint_name=self.name,
                         constraint_type=self.constraint_type,
                         severity="MEDIUM",
-                        message=f"Fatigue warning: {score.overall:.1f}% effectiveness",
+                        message=f"Fatigue warning: {effectiveness:.1f}% effectiveness",
                         person_id=person_id,
                         block_id=block.id,
                     )
@@ -0,0 +1,346 @@
+"""
+Roster-wide Three-Process Model.
+
+Evaluates the Three-Process Model for a whole roster at once on a
+(people x time steps) grid instead of advancing one AlertnessState at a
+time. The equations and constants are those of ThreeProcessModel, so a
+grid cell matches stepping the scalar model through the same intervals.
+
+- Process C (circadian) is a closed-form sinusoid over the time axis.
+- Process W (sleep inertia) is closed form in the time since each person's
+  last wake.
+- Process S (homeostatic) and cumulative debt are clamped and
+  path-dependent, so they advance one time step at a time, vectorized
+  across people.
+
+Wake/sleep comes from a duty grid derived from half-day assignments: people
+are awake while on duty and outside a nightly sleep window, asleep otherwise.
+
+Usage:
+    engine = RosterFatigueModel()
+    result = engine.evaluate(person_ids, start_date, end_date, duties)
+    effectiveness = result.sample(person_ids, block_times)
+"""
+
+import logging
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+from uuid import UUID
+
+import numpy as np
+
+from app.frms.three_process_model import ThreeProcessModel
+
+logger = logging.getLogger(__name__)
+
+# Duty window (start hour, end hour) for each half-day block
+DEFAULT_DUTY_HOURS: dict[str, tuple[float, float]] = {
+    "AM": (7.0, 13.0),
+    "PM": (13.0, 19.0),
+}
+
+# Nightly sleep window (start hour, end hour) when not on duty
+DEFAULT_SLEEP_WINDOW = (23.0, 7.0)
+
+# Reservoir level below which waking time accrues cumulative debt
+DEBT_THRESHOLD = 85.0
+
+
+@dataclass
+class RosterEffectiveness:
+    """
+    Effectiveness matrices for a roster.
+
+    Column ``k`` is the state at ``start + k * step_hours``, before the
+    interval ``awake[:, k]`` describes.
+
+    Attributes:
+        person_ids: Row order of the matrices
+        start: Time of column 0
+        step_hours: Grid resolution in hours
+        overall: Combined effectiveness (people x steps, 0-100)
+        homeostatic: Process S after debt penalty (people x steps)
+        circadian: Process C (steps,), the same for everyone
+        sleep_inertia: Process W penalty (people x steps)
+        awake: Whether each person is awake during each step
+    """
+
+    person_ids: list[UUID]
+    start: datetime
+    step_hours: float
+    overall: np.ndarray
+    homeostatic: np.ndarray
+    circadian: np.ndarray
+    sleep_inertia: np.ndarray
+    awake: np.ndarray
+    person_idx: dict[UUID, int] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.person_idx = {pid: i for i, pid in enumerate(self.person_ids)}
+
+    @property
+    def steps(self) -> int:
+        return self.overall.shape[1]
+
+    def step_index(self, when: datetime) -> int:
+        """Grid column for a point in time, clamped to the grid."""
+        hours = (when - self.start).total_seconds() / 3600.0
+        return min(max(int(round(hours / self.step_hours)), 0), self.steps - 1)
+
+    def at(self, person_id: UUID, when: datetime) -> float:
+        """Effectiveness of one person at one time (100.0 if not on the roster)."""
+        row = self.person_idx.get(person_id)
+        if row is None:
+            return 100.0
+        return float(self.overall[row, self.step_index(when)])
+
+    def sample(
+        self, person_ids: Sequence[UUID], times: Sequence[datetime]
+    ) -> np.ndarray:
+        """
+        Effectiveness for every person at every time.
+
+        People not on the roster are treated as fully effective (100.0).
+
+        Returns:
+            Array of shape (len(person_ids), len(times))
+        """
+        rows = np.array([self.person_idx.get(pid, -1) for pid in person_ids])
+        cols = np.array([self.step_index(t) for t in times], dtype=np.int64)
+        values = np.full((len(rows), len(cols)), 100.0)
+        known = rows >= 0
+        if known.any() and len(cols):
+            values[known] = self.overall[np.ix_(rows[known], cols)]
+        return values
+
+    def minimum(self, awake_only: bool = True) -> np.ndarray:
+        """Lowest effectiveness per person, by default over waking steps."""
+        values = self.overall
+        if awake_only:
+            values = np.where(self.awake, values, np.inf)
+        lowest = values.min(axis=1, initial=np.inf)
+        return np.where(np.isinf(lowest), 100.0, lowest)
+
+
+class RosterFatigueModel:
+    """
+    Vectorized Three-Process Model over a roster.
+
+    Args:
+        model: Scalar model whose constants are used (default: a new one)
+        step_hours: Grid resolution in hours
+        duty_hours: Duty window per half-day time_of_day
+        sleep_window: Nightly sleep window when off duty (may wrap midnight)
+        sleep_quality: Sleep quality multiplier (0.5-1.0)
+    """
+
+    def __init__(
+        self,
+        model: ThreeProcessModel | None = None,
+        step_hours: float = 0.5,
+        duty_hours: dict[str, tuple[float, float]] | None = None,
+        sleep_window: tuple[float, float] = DEFAULT_SLEEP_WINDOW,
+        sleep_quality: float = 1.0,
+    ) -> None:
+        if step_hours <= 0:
+            raise ValueError("step_hours must be positive")
+        self.model = model or ThreeProcessModel()
+        self.step_hours = step_hours
+        self.duty_hours = duty_hours or DEFAULT_DUTY_HOURS
+        self.sleep_window = sleep_window
+        self.sleep_quality = max(0.5, min(1.0, sleep_quality))
+
+    def steps_for(self, start_date: date, end_date: date) -> int:
+        """Number of grid steps covering whole days from start to end."""
+        days = (end_date - start_date).days + 1
+        return int(round(max(days, 0) * 24.0 / self.step_hours))
+
+    def duty_grid(
+        self,
+        person_ids: Sequence[UUID],
+        start_date: date,
+        steps: int,
+        duties: Iterable[tuple[UUID, date, str]],
+    ) -> np.ndarray:
+        """
+        Boolean on-duty grid from (person_id, date, time_of_day) duties.
+
+        Duties for unknown people, unknown times of day or outside the grid
+        are ignored.
+        """
+        person_idx = {pid: i for i, pid in enumerate(person_ids)}
+        rows: list[int] = []
+        begins: list[float] = []
+        ends: list[float] = []
+        for person_id, duty_date, time_of_day in duties:
+            row = person_idx.get(person_id)
+            hours = self.duty_hours.get(time_of_day)
+            if row is None or hours is None:
+                continue
+            offset = (duty_date - start_date).days * 24.0
+            rows.append(row)
+            begins.append(offset + hours[0])
+            ends.append(offset + hours[1])
+
+        # Mark spans with +1/-1 at their edges and accumulate along time
+        edges = np.zeros((len(person_ids), steps + 1), dtype=np.int32)
+        if rows:
+            row_arr = np.array(rows)
+            first = np.clip(np.ceil(np.array(begins) / self.step_hours), 0, steps)
+            last = np.clip(np.ceil(np.array(ends) / self.step_hours), 0, steps)
+            np.add.at(edges, (row_arr, first.astype(np.int64)), 1)
+            np.add.at(edges, (row_arr, last.astype(np.int64)), -1)
+        return np.cumsum(edges[:, :steps], axis=1) > 0
+
+    def awake_grid(self, duty: np.ndarray, start: datetime) -> np.ndarray:
+        """Awake while on duty or outside the nightly sleep window."""
+        hour = self._time_of_day(start, duty.shape[1])
+        sleep_start, sleep_end = self.sleep_window
+        if sleep_start <= sleep_end:
+            in_window = (hour >= sleep_start) & (hour < sleep_end)
+        else:
+            in_window = (hour >= sleep_start) | (hour < sleep_end)
+        return duty | ~in_window[np.newaxis, :]
+
+    def evaluate(
+        self,
+        person_ids: Sequence[UUID],
+        start_date: date,
+        end_date: date,
+        duties: Iterable[tuple[UUID, date, str]],
+        initial_reservoir: float = 100.0,
+    ) -> RosterEffectiveness:
+        """
+        Effectiveness for a roster over whole days from half-day duties.
+
+        Args:
+            person_ids: People to evaluate (matrix rows)
+            start_date: First day (grid starts at midnight)
+            end_date: Last day, inclusive
+            duties: (person_id, date, time_of_day) for each duty half-day
+            initial_reservoir: Sleep reservoir at the start for everyone
+
+        Returns:
+            RosterEffectiveness over the range
+        """
+        start = datetime.combine(start_date, datetime.min.time())
+        steps = self.steps_for(start_date, end_date)
+        duty = self.duty_grid(person_ids, start_date, steps, duties)
+        return self.simulate(
+            person_ids, start, self.awake_grid(duty, start), initial_reservoir
+        )
+
+    def simulate(
+        self,
+        person_ids: Sequence[UUID],
+        start: datetime,
+        awake: np.ndarray,
+        initial_reservoir: float | np.ndarray = 100.0,
+    ) -> RosterEffectiveness:
+        """
+        Run the Three-Process Model over a wake/sleep grid.
+
+        Args:
+            person_ids: Row order of ``awake``
+            start: Time of the first step
+            awake: Boolean (people x steps), True where awake during the step
+            initial_reservoir: Starting reservoir, scalar or per person
+
+        Returns:
+            RosterEffectiveness with one column per step
+        """
+        m = self.model
+        dt = self.step_hours
+        people, steps = awake.shape
+
+        circadian = self._circadian(self._time_of_day(start, steps))
+
+        reservoir = np.broadcast_to(
+            np.asarray(initial_reservoir, dtype=float), (people,)
+        ).copy()
+        debt = np.zeros(people)
+        # Hours from start at which each person last woke (nan: not yet slept)
+        last_wake = np.full(people, np.nan)
+
+        homeostatic = np.empty((people, steps))
+        inertia = np.empty((people, steps))
+
+        wake_depletion = m.DEPLETION_RATE * dt / m.TAU_WAKE
+        effective_sleep = dt * self.sleep_quality
+        sleep_recovery = m.RECOVERY_RATE * effective_sleep / m.TAU_SLEEP
+
+        for k in range(steps):
+            # State at the start of step k
+            homeostatic[:, k] = np.where(
+                debt > 0,
+                np.maximum(0.0, reservoir - np.minimum(20.0, debt * 0.5)),
+                reservoir,
+            )
+            minutes = (k * dt - last_wake) * 60.0
+            active = minutes < m.INERTIA_DURATION  # False for nan
+            penalty = np.where(
+                active,
+                m.INERTIA_MAX_PENALTY * (1.0 - minutes / m.INERTIA_DURATION),
+                0.0,
+            )
+            inertia[:, k] = np.where(
+                debt > 0, penalty * (1.0 + np.minimum(0.5, debt * 0.05)), penalty
+            )
+
+            # Advance through step k
+            is_awake = awake[:, k]
+            woke = np.maximum(m.S_MIN, reservoir - wake_depletion)
+            slept = np.minimum(m.S_MAX, reservoir + sleep_recovery)
+            debt = np.where(
+                is_awake,
+                np.where(
+                    woke < DEBT_THRESHOLD,
+                    debt + (DEBT_THRESHOLD - woke) * (dt / 24.0),
+                    np.maximum(0.0, debt - dt * 0.5),
+                ),
+                np.maximum(0.0, debt - effective_sleep * 2.0),
+            )
+            reservoir = np.where(is_awake, woke, slept)
+            last_wake = np.where(is_awake, last_wake, (k + 1) * dt)
+
+        overall = np.clip(
+            m.WEIGHT_HOMEOSTATIC * homeostatic
+            + m.WEIGHT_CIRCADIAN * circadian[np.newaxis, :]
+            - inertia,
+            0.0,
+            100.0,
+        )
+
+        logger.debug(f"Evaluated fatigue for {people} people over {steps} steps")
+
+        return RosterEffectiveness(
+            person_ids=list(person_ids),
+            start=start,
+            step_hours=dt,
+            overall=overall,
+            homeostatic=homeostatic,
+            circadian=circadian,
+            sleep_inertia=inertia,
+            awake=awake,
+        )
+
+    def _time_of_day(self, start: datetime, steps: int) -> np.ndarray:
+        start_hour = start.hour + start.minute / 60.0
+        return (start_hour + np.arange(steps) * self.step_hours) % 24.0
+
+    def _circadian(self, time_of_day: np.ndarray) -> np.ndarray:
+        """Process C, the same sinusoid as ThreeProcessModel._circadian_component."""
+        m = self.model
+        mean = 75.0
+        amplitude = mean * m.CIRCADIAN_AMPLITUDE
+        phase = (
+            2 * np.pi * (time_of_day - m.CIRCADIAN_PHASE_SHIFT) / m.CIRCADIAN_PERIOD
+        )
+        return mean + amplitude * np.sin(phase - np.pi / 2)
+
+
+def block_time(block_date: date, time_of_day: str) -> datetime:
+    """Time at which a half-day block's effectiveness is evaluated."""
+    hour = 8 if time_of_day == "AM" else 14
+    return datetime.combine(block_date, datetime.min.time()) + timedelta(hours=hour)
@@ -31,6 +31,7 @@ import strawberry
 from strawberry.types import Info
 
 from app.core.config import get_settings
+from app.websocket.redis_hub import get_redis_fanout_hub
 
 logger = logging.getLogger(__name__)
 
@@ -184,7 +185,7 @@ class RedisSubscriptionManager:
 
     Handles:
     - Connection pooling
-    - Channel subscription/unsubscription
+    - Channel subscription/unsubscription (multiplexed via RedisFanoutHub)
     - Message broadcasting
     - Connection lifecycle
     """
@@ -192,8 +193,9 @@ class RedisSubscriptionManager:
     def __init__(self) -> None:
         """Initialize the subscription manager."""
         self._redis: redis.Redis | None = None
-        self._pubsub: redis.client.PubSub | None = None
         self._settings = get_settings()
+        # Hub queues of this manager's active subscriptions
+        self._subscriptions: set[asyncio.Queue] = set()
 
     async def get_redis(self) -> redis.Redis:
         """
@@ -211,23 +213,15 @@ class RedisSubscriptionManager:
 
         return self._redis
 
-    async def get_pubsub(self) -> redis.client.PubSub:
-        """
-        Get or create Redis pub/sub instance.
-
-        Returns:
-            Redis pub/sub instance
-        """
-        if self._pubsub is None:
-            redis_client = await self.get_redis()
-            self._pubsub = redis_client.pubsub()
-
-        return self._pubsub
-
     async def subscribe(self, *channels: str) -> AsyncGenerator[dict[str, Any], None]:
         """
         Subscribe to Redis channels and yield messages.
 
+        Subscriptions are multiplexed through the process-wide
+        ``RedisFanoutHub``: each channel is subscribed in Redis once and every
+        message is decoded once, no matter how many GraphQL clients (or
+        WebSocket relays) are listening.
+
         Args:
             *channels: Channel names to subscribe to
 
@@ -238,31 +232,19 @@ class RedisSubscriptionManager:
             async for message in manager.subscribe("schedule:updates"):
                 print(message)
         """
-        pubsub = await self.get_pubsub()
+        hub = get_redis_fanout_hub()
+        logger.info(f"Subscribed to channels: {', '.join(channels)}")
 
         try:
-            await pubsub.subscribe(*channels)
-            logger.info(f"Subscribed to channels: {', '.join(channels)}")
-
-            async for message in pubsub.listen():
-                if message["type"] == "message":
-                    try:
-                        # Parse JSON message data
-                        data = json.loads(message["data"])
-                        yield data
-                    except json.JSONDecodeError:
-                        logger.warning(f"Failed to decode message: {message['data']}")
-                        continue
-
+            async for message in hub.subscribe(
+                *channels, handles=self._subscriptions
+            ):
+                yield message
         except redis.ConnectionError as e:
             logger.error(f"Redis connection error in subscription: {e}")
             raise
         finally:
-            try:
-                await pubsub.unsubscribe(*channels)
-                logger.info(f"Unsubscribed from channels: {', '.join(channels)}")
-            except Exception as e:
-                logger.error(f"Error unsubscribing from channels: {e}")
+            logger.info(f"Unsubscribed from channels: {', '.join(channels)}")
 
     async def publish(self, channel: str, message: dict[str, Any]) -> int:
         """
@@ -296,10 +278,13 @@ class RedisSubscriptionManager:
             return 0
 
     async def close(self) -> None:
-        """Close Redis connections."""
-        if self._pubsub is not None:
-            await self._pubsub.close()
-            self._pubsub = None
+        """
+        End this manager's subscriptions and close its publish connection.
+
+        The process-wide fan-out hub is shared with other subscribers and is
+        closed at application shutdown instead.
+        """
+        get_redis_fanout_hub().end_subscriptions(self._subscriptions)
 
         if self._redis is not None:
             await self._redis.close()
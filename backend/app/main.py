@@ -11,17 +11,25 @@ from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse, RedirectResponse
 from slowapi.errors import RateLimitExceeded
-from slowapi.middleware import SlowAPIMiddleware
+from starlette.datastructures import URL
 from starlette.middleware.trustedhost import TrustedHostMiddleware
 
-from app.api.routes import api_router
+from app.api.lazy_router import install_lazy_routers
+from app.api.routes import LAZY_ROUTERS, api_router
 from app.core.config import get_settings
 from app.core.exceptions import AppException
 from app.core.logging import get_logger, setup_logging
 from app.core.secrets_loader import initialize_secrets_from_keychain
-from app.core.slowapi_limiter import limiter, rate_limit_exceeded_handler
+from app.core.slowapi_limiter import (
+    SlowAPIRateLimitMiddleware,
+    limiter,
+    rate_limit_exceeded_handler,
+)
 from app.middleware.audit import AuditContextMiddleware
+from app.middleware.auth_context import AuthContextMiddleware
 from app.middleware.phi_middleware import PHIMiddleware
+from app.middleware.pipeline import ASGIMiddleware, MiddlewarePipeline, RequestContext
+from app.middleware.read_your_writes import ReadYourWritesMiddleware
 from app.middleware.security_headers import SecurityHeadersMiddleware
 
 # Populate os.environ from macOS Keychain before Pydantic reads settings
@@ -210,6 +218,22 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.warning(f"Failed to initialize service cache: {e}")
 
+    # Keep the in-process revoked-token filter in sync across workers
+    try:
+        from app.core.token_revocation import get_revoked_token_cache
+
+        get_revoked_token_cache().start()
+    except Exception as e:
+        logger.warning(f"Failed to start revoked-token listener: {e}")
+
+    # Relay events published by other processes to WebSocket clients
+    try:
+        from app.websocket.manager import get_connection_manager
+
+        await get_connection_manager().start()
+    except Exception as e:
+        logger.warning(f"Failed to start WebSocket Redis relay: {e}")
+
     # Start certification scheduler for expiration reminders
     try:
         from app.services.certification_scheduler import start_scheduler
@@ -250,6 +274,24 @@ async def lifespan(app: FastAPI):
     except Exception:
         pass
 
+    # Stop revoked-token listener
+    try:
+        from app.core.token_revocation import get_revoked_token_cache
+
+        get_revoked_token_cache().stop()
+    except Exception:
+        pass
+
+    # Stop the WebSocket relay, then the shared Redis fan-out hub
+    try:
+        from app.websocket.manager import get_connection_manager
+        from app.websocket.redis_hub import close_redis_fanout_hub
+
+        await get_connection_manager().stop()
+        await close_redis_fanout_hub()
+    except Exception as e:
+        logger.warning(f"Failed to close Redis fan-out hub: {e}")
+
     # Stop certification scheduler
     try:
         from app.services.certification_scheduler import stop_scheduler
@@ -325,7 +367,7 @@ logger.info("Security headers middleware enabled")
 
 # Slowapi rate limiting middleware - applies global rate limits
 if settings.RATE_LIMIT_ENABLED:
-    app.add_middleware(SlowAPIMiddleware)
+    app.add_middleware(SlowAPIRateLimitMiddleware)
     logger.info("Slowapi rate limiting middleware enabled")
 else:
     logger.info("Slowapi rate limiting middleware DISABLED")
@@ -359,21 +401,6 @@ if settings.TRUSTED_HOSTS:
         f"Trusted hosts middleware enabled. {len(settings.TRUSTED_HOSTS)} host(s) configured."
     )
 
-# Audit context middleware - captures user for version history tracking
-app.add_middleware(AuditContextMiddleware)
-
-# PHI Middleware - adds warning headers and audits access
-app.add_middleware(PHIMiddleware)
-
-# Request ID middleware - adds X-Request-ID for distributed tracing
-try:
-    from app.core.observability import RequestIDMiddleware
-
-    app.add_middleware(RequestIDMiddleware)
-    logger.info("Request ID middleware enabled for distributed tracing")
-except ImportError:
-    logger.warning("observability module not available - X-Request-ID disabled")
-
 # Internal network IP ranges for metrics endpoint restriction
 INTERNAL_NETWORKS = [
     ip_network("127.0.0.0/8"),
@@ -383,43 +410,77 @@ INTERNAL_NETWORKS = [
 ]
 
 
-# Backwards compatibility redirect - redirect /api/... to /api/v1/...
-@app.middleware("http")
-async def redirect_old_api(request: Request, call_next):
-    """Redirect legacy /api routes to /api/v1 for backwards compatibility."""
-    if request.url.path.startswith("/api/") and not request.url.path.startswith(
-        "/api/v1/"
-    ):
-        # Skip redirect for OPTIONS requests to allow CORS preflight to work
-        # CORS middleware needs to handle OPTIONS requests before any redirect
-        if request.method == "OPTIONS":
-            return await call_next(request)
-        new_path = request.url.path.replace("/api/", "/api/v1/", 1)
-        new_url = request.url.replace(path=new_path)
-        return RedirectResponse(url=str(new_url), status_code=307)
-    return await call_next(request)
-
-
-# Metrics endpoint protection - restrict to internal IPs in production
-@app.middleware("http")
-async def restrict_metrics_endpoint(request: Request, call_next):
+class MetricsAccessMiddleware(ASGIMiddleware):
     """Restrict /metrics endpoint to internal networks in production."""
-    if request.url.path == "/metrics" and not settings.DEBUG:
-        try:
-            client_ip = ip_address(request.client.host)
-            is_internal = any(client_ip in network for network in INTERNAL_NETWORKS)
-            if not is_internal:
-                return JSONResponse(
-                    status_code=403, content={"detail": "Access denied"}
-                )
-        except (ValueError, TypeError):
-            # Invalid IP address
-            return JSONResponse(status_code=403, content={"detail": "Access denied"})
-    return await call_next(request)
+
+    async def before_request(self, context: RequestContext) -> JSONResponse | None:
+        if context.path == "/metrics" and not settings.DEBUG:
+            try:
+                client_ip = ip_address(context.client_host)
+                is_internal = any(client_ip in network for network in INTERNAL_NETWORKS)
+                if not is_internal:
+                    return JSONResponse(
+                        status_code=403, content={"detail": "Access denied"}
+                    )
+            except (ValueError, TypeError):
+                # Invalid IP address
+                return JSONResponse(status_code=403, content={"detail": "Access denied"})
+        return None
+
+
+class LegacyAPIRedirectMiddleware(ASGIMiddleware):
+    """Redirect legacy /api routes to /api/v1 for backwards compatibility."""
+
+    async def before_request(
+        self, context: RequestContext
+    ) -> RedirectResponse | None:
+        if context.path.startswith("/api/") and not context.path.startswith(
+            "/api/v1/"
+        ):
+            # Skip redirect for OPTIONS requests to allow CORS preflight to work
+            # CORS middleware needs to handle OPTIONS requests before any redirect
+            if context.method == "OPTIONS":
+                return None
+            new_path = context.path.replace("/api/", "/api/v1/", 1)
+            new_url = URL(scope=context.scope).replace(path=new_path)
+            return RedirectResponse(url=str(new_url), status_code=307)
+        return None
+
+
+# Request pipeline - one pure-ASGI layer; stages run outermost first and
+# share a single RequestContext:
+# - metrics access restriction and legacy /api redirects short-circuit first
+# - auth context decodes the bearer token once per request so downstream
+#   middleware and auth dependencies share the verified claims
+# - request ID adds X-Request-ID for distributed tracing
+# - PHI adds warning headers and audits access
+# - audit context captures the user for version history tracking
+# - read-your-writes pins a user's replica reads to the primary after writes
+pipeline_stages: list[ASGIMiddleware] = [
+    MetricsAccessMiddleware(),
+    LegacyAPIRedirectMiddleware(),
+    AuthContextMiddleware(),
+]
+try:
+    from app.core.observability import RequestIDMiddleware
+
+    pipeline_stages.append(RequestIDMiddleware())
+    logger.info("Request ID middleware enabled for distributed tracing")
+except ImportError:
+    logger.warning("observability module not available - X-Request-ID disabled")
+pipeline_stages += [
+    PHIMiddleware(),
+    AuditContextMiddleware(),
+    ReadYourWritesMiddleware(),
+]
+app.add_middleware(MiddlewarePipeline, stages=pipeline_stages)
 
 
 # Include API routes
 app.include_router(api_router, prefix="/api/v1")
+install_lazy_routers(
+    app, LAZY_ROUTERS, prefix="/api/v1", eager=not settings.LAZY_ROUTER_LOADING
+)
 
 # Include GraphQL endpoint
 try:
@@ -1,6 +1,7 @@
 """Middleware components for the application."""
 
 from app.middleware.audit import AuditContextMiddleware, get_audit_info
+from app.middleware.auth_context import AuthContextMiddleware
 from app.middleware.content import (
     AcceptHeader,
     ContentNegotiationMiddleware,
@@ -46,6 +47,7 @@ from app.middleware.versioning import (
 __all__ = [
     "AuditContextMiddleware",
     "get_audit_info",
+    "AuthContextMiddleware",
     "SecurityHeadersMiddleware",
     "RateLimitMiddleware",
     "ThrottlingMiddleware",
@@ -16,19 +16,16 @@ Usage:
     Version history will then include who made each change.
 """
 
-from collections.abc import Callable
-
-from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response
 
 from app.core.logging import get_logger
 from app.db.audit import clear_current_user_id, set_current_user_id
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
 
 logger = get_logger(__name__)
 
 
-class AuditContextMiddleware(BaseHTTPMiddleware):
+class AuditContextMiddleware(ASGIMiddleware):
     """
     Middleware that captures user context for audit logging.
 
@@ -36,48 +33,40 @@ class AuditContextMiddleware(BaseHTTPMiddleware):
     variable that SQLAlchemy-Continuum can access when recording changes.
     """
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        """Process request and set audit context."""
-        user_id = await self._extract_user_id(request)
-
-        try:
-            # Set user context for this request
-            set_current_user_id(user_id)
-
-            # Log audit context for significant operations
-            if request.method in ("POST", "PUT", "PATCH", "DELETE"):
-                logger.debug(
-                    f"Audit context: user={user_id or 'anonymous'}, "
-                    f"method={request.method}, path={request.url.path}"
-                )
-
-            # Process the request
-            response = await call_next(request)
-            return response
+    async def before_request(self, context: RequestContext) -> None:
+        """Set audit context for this request."""
+        user_id = self._extract_user_id(context)
+        set_current_user_id(user_id)
+
+        # Log audit context for significant operations
+        if context.method in ("POST", "PUT", "PATCH", "DELETE"):
+            logger.debug(
+                f"Audit context: user={user_id or 'anonymous'}, "
+                f"method={context.method}, path={context.path}"
+            )
+        return None
 
-        finally:
-            # Always clear context after request
-            clear_current_user_id()
+    def after_request(self, context: RequestContext) -> None:
+        """Always clear context after request."""
+        clear_current_user_id()
 
-    async def _extract_user_id(self, request: Request) -> str | None:
+    def _extract_user_id(self, context: RequestContext) -> str | None:
         """
         Extract user ID from the request.
 
         Attempts to get user from:
         1. request.state.user (set by auth dependency)
-        2. Authorization header (JWT token)
-        3. Returns None for anonymous requests
+        2. Returns None for anonymous requests
         """
         # Check if user was set by auth dependency
-        if hasattr(request.state, "user") and request.state.user:
-            user = request.state.user
+        user = context.state.get("user")
+        if user:
             # Handle both User object and dict
             if hasattr(user, "id"):
                 return str(user.id)
             if isinstance(user, dict) and "id" in user:
                 return str(user["id"])
 
-        # Could extend to decode JWT here if needed
         # For now, return None for anonymous requests
         return None
 
@@ -0,0 +1,19 @@
+"""
+Authentication context middleware.
+
+Decodes the request's bearer token once, before any other middleware runs,
+and stores the resulting ``AuthContext`` on ``request.state.auth_context``.
+"""
+
+from starlette.requests import HTTPConnection
+
+from app.core.auth_context import get_request_auth_context
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
+
+
+class AuthContextMiddleware(ASGIMiddleware):
+    """Attach a decoded ``AuthContext`` to every HTTP request."""
+
+    async def before_request(self, context: RequestContext) -> None:
+        get_request_auth_context(HTTPConnection(context.scope))
+        return None
@@ -4,24 +4,23 @@ This middleware adds warning headers to responses that may contain Protected Hea
 and logs access to these endpoints for audit purposes.
 """
 
-from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
-from starlette.requests import Request
-from starlette.responses import Response
+from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp
 
 from app.core.logging import get_logger
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
 
 logger = get_logger(__name__)
 
 
-class PHIMiddleware(BaseHTTPMiddleware):
+class PHIMiddleware(ASGIMiddleware):
     """Middleware for PHI tagging and auditing."""
 
-    def __init__(self, app: ASGIApp) -> None:
+    def __init__(self, app: ASGIApp | None = None) -> None:
         """Initialize the middleware."""
         super().__init__(app)
         # Endpoints that are known to return PHI
-        self.phi_prefixes = [
+        self.phi_prefixes = (
             "/api/v1/people",
             "/api/v1/export",
             "/api/v1/schedule",
@@ -31,24 +30,20 @@ class PHIMiddleware(BaseHTTPMiddleware):
             "/api/export",
             "/api/schedule",
             "/api/absences",
-        ]
-
-    async def dispatch(
-        self, request: Request, call_next: RequestResponseEndpoint
-    ) -> Response:
-        """Process the request."""
-        # Check if request targets a PHI endpoint
-        is_phi_endpoint = any(
-            request.url.path.startswith(prefix) for prefix in self.phi_prefixes
         )
 
-        if is_phi_endpoint:
+    def _is_phi_endpoint(self, context: RequestContext) -> bool:
+        return context.path.startswith(self.phi_prefixes)
+
+    async def before_request(self, context: RequestContext) -> None:
+        """Audit access to PHI endpoints."""
+        if self._is_phi_endpoint(context):
             # Audit logging
             # Note: valid user might not be set yet depending on middleware order,
             # but we log what we can.
             user_id = "anonymous"
-            if hasattr(request.state, "user") and request.state.user is not None:
-                user = request.state.user
+            user = context.state.get("user")
+            if user is not None:
                 # Handle different user representations (User object, dict, etc.)
                 if hasattr(user, "username"):
                     user_id = user.username
@@ -60,18 +55,18 @@ class PHIMiddleware(BaseHTTPMiddleware):
             logger.info(
                 "PHI_ACCESS_ATTEMPT",
                 user=user_id,
-                endpoint=request.url.path,
-                method=request.method,
-                ip=request.client.host if request.client else "unknown",
+                endpoint=context.path,
+                method=context.method,
+                ip=context.client_host or "unknown",
             )
+        return None
 
-        response = await call_next(request)
-
-        # Add warning headers if it was a PHI endpoint
-        if is_phi_endpoint:
-            response.headers["X-Contains-PHI"] = "true"
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
+        """Add warning headers if it was a PHI endpoint."""
+        if self._is_phi_endpoint(context):
+            headers["X-Contains-PHI"] = "true"
             # We don't list specific fields in the header to avoid leaking schema info,
             # just a general warning.
-            response.headers["X-PHI-Handling"] = "CONFIDENTIAL - DO NOT DISTRIBUTE"
-
-        return response
+            headers["X-PHI-Handling"] = "CONFIDENTIAL - DO NOT DISTRIBUTE"
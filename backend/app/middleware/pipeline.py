@@ -0,0 +1,211 @@
+"""
+Pure-ASGI middleware pipeline.
+
+Starlette's ``BaseHTTPMiddleware`` runs every layer's downstream call in a
+separate task connected through anyio memory streams and re-wraps the
+response body, so each layer adds scheduling overhead and streaming
+responses are relayed chunk by chunk through another queue. Middleware
+here is written against raw ASGI instead:
+
+- ``ASGIMiddleware`` is a stage with three hooks: ``before_request`` (may
+  short-circuit with a response), ``on_response_start`` (edit status and
+  headers before they are sent) and ``after_request`` (always runs).
+- A stage can be installed on its own with ``app.add_middleware`` or
+  grouped with others in a ``MiddlewarePipeline``, which runs any number
+  of stages as a single ASGI layer with a single ``send`` wrapper.
+- Every stage receives the same ``RequestContext``, stored in the ASGI
+  scope state and therefore also visible as ``request.state.request_context``.
+
+Response bodies are never buffered, so streaming responses flush each chunk
+as soon as the endpoint yields it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+REQUEST_CONTEXT_STATE_KEY = "request_context"
+
+
+class RequestContext:
+    """
+    Per-request data shared by every middleware stage.
+
+    Attributes:
+        scope: ASGI connection scope
+        method: HTTP method
+        path: Request path
+        headers: Request headers
+        client_host: Client address, if known
+        status_code: Response status once the response has started
+        extras: Free-form values stages hand to each other
+    """
+
+    def __init__(self, scope: Scope) -> None:
+        self.scope = scope
+        self.method: str = scope.get("method", "GET")
+        self.path: str = scope.get("path", "")
+        self.headers = Headers(raw=scope.get("headers") or [])
+        client = scope.get("client")
+        self.client_host: str | None = client[0] if client else None
+        self.status_code: int | None = None
+        self.extras: dict[str, Any] = {}
+
+    @property
+    def state(self) -> dict[str, Any]:
+        """The scope state dict backing ``request.state``."""
+        return self.scope.setdefault("state", {})
+
+
+def get_request_context(scope: Scope) -> RequestContext:
+    """
+    Get the request's shared context, creating it on first access.
+
+    Args:
+        scope: ASGI connection scope
+
+    Returns:
+        RequestContext shared by all stages handling this request
+    """
+    state = scope.setdefault("state", {})
+    context = state.get(REQUEST_CONTEXT_STATE_KEY)
+    if context is None:
+        context = RequestContext(scope)
+        state[REQUEST_CONTEXT_STATE_KEY] = context
+    return context
+
+
+class ASGIMiddleware:
+    """
+    Base class for pure-ASGI middleware stages.
+
+    Subclasses override any of the hooks. Non-HTTP scopes (lifespan,
+    websockets) pass straight through.
+    """
+
+    def __init__(self, app: ASGIApp | None = None) -> None:
+        """
+        Initialize the stage.
+
+        Args:
+            app: Downstream ASGI application when installed on its own; None
+                when the stage only runs inside a ``MiddlewarePipeline``
+        """
+        self.app = app
+
+    async def before_request(self, context: RequestContext) -> ASGIApp | None:
+        """
+        Run before the downstream application.
+
+        Args:
+            context: Shared request context
+
+        Returns:
+            An ASGI response to send instead of calling downstream, or None
+        """
+        return None
+
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
+        """
+        Edit the response before its status line and headers are sent.
+
+        Args:
+            context: Shared request context (``status_code`` is set)
+            headers: Mutable view of the outgoing response headers
+        """
+
+    def after_request(self, context: RequestContext) -> None:
+        """
+        Run after the response completes or the downstream call raises.
+
+        Args:
+            context: Shared request context
+        """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await run_stages(self.app, (self,), scope, receive, send)
+
+
+class MiddlewarePipeline:
+    """Run several stages as one ASGI layer (first stage is outermost)."""
+
+    def __init__(self, app: ASGIApp, stages: Sequence[ASGIMiddleware]) -> None:
+        """
+        Initialize the pipeline.
+
+        Args:
+            app: Downstream ASGI application
+            stages: Stages in outer-to-inner order
+        """
+        self.app = app
+        self.stages = tuple(stages)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        await run_stages(self.app, self.stages, scope, receive, send)
+
+
+def _response_start_hook(
+    send: Send, context: RequestContext, stages: Sequence[ASGIMiddleware]
+) -> Send:
+    if not stages:
+        return send
+
+    async def send_wrapper(message: Message) -> None:
+        if message["type"] == "http.response.start":
+            context.status_code = message["status"]
+            headers = MutableHeaders(scope=message)
+            # Innermost stage first, as with nested middleware
+            for stage in reversed(stages):
+                stage.on_response_start(context, headers)
+        await send(message)
+
+    return send_wrapper
+
+
+async def run_stages(
+    app: ASGIApp,
+    stages: Sequence[ASGIMiddleware],
+    scope: Scope,
+    receive: Receive,
+    send: Send,
+) -> None:
+    """
+    Run middleware stages around an ASGI application.
+
+    A stage that short-circuits in ``before_request`` skips the stages
+    inside it and the application; stages outside it still see the
+    response.
+
+    Args:
+        app: Downstream ASGI application
+        stages: Stages in outer-to-inner order
+        scope: ASGI connection scope
+        receive: ASGI receive callable
+        send: ASGI send callable
+    """
+    if scope["type"] != "http":
+        await app(scope, receive, send)
+        return
+
+    context = get_request_context(scope)
+    entered: list[ASGIMiddleware] = []
+    try:
+        for stage in stages:
+            response = await stage.before_request(context)
+            if response is not None:
+                await response(
+                    scope, receive, _response_start_hook(send, context, entered)
+                )
+                entered.append(stage)
+                return
+            entered.append(stage)
+        await app(scope, receive, _response_start_hook(send, context, stages))
+    finally:
+        for stage in reversed(entered):
+            stage.after_request(context)
@@ -17,10 +17,9 @@ import time
 import redis
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
-import jwt
-from jwt.exceptions import PyJWTError as JWTError
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from app.core.auth_context import get_request_auth_context
 from app.core.config import get_settings
 from app.core.rate_limit_tiers import (
     RateLimitTier,
@@ -31,7 +30,6 @@ from app.core.rate_limit_tiers import (
     get_tier_config,
     get_tier_for_role,
 )
-from app.core.security import ALGORITHM
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
@@ -85,7 +83,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
     def _extract_user_info(self, request: Request) -> tuple[str | None, str | None]:
         """
-        Extract user ID and role from JWT token.
+        Extract user ID and role from the request's decoded token.
 
         Args:
             request: FastAPI request
@@ -93,28 +91,8 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         Returns:
             Tuple of (user_id, role) or (None, None) if not authenticated
         """
-        # Check for Authorization header
-        auth_header = request.headers.get("Authorization")
-        token = None
-
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header.split(" ")[1]
-        else:
-            # Check for token in cookie
-            cookie = request.cookies.get("access_token")
-            if cookie and cookie.startswith("Bearer "):
-                token = cookie.split(" ")[1]
-
-        if not token:
-            return None, None
-
-        try:
-            payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-            user_id = payload.get("sub")
-            role = payload.get("role")
-            return user_id, role
-        except JWTError:
-            return None, None
+        context = get_request_auth_context(request)
+        return context.user_id, context.role
 
     def _get_client_identifier(self, request: Request, user_id: str | None) -> str:
         """
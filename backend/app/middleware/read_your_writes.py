@@ -0,0 +1,47 @@
+"""
+Read-your-writes middleware for replica routing.
+
+After a successful write request (POST/PUT/PATCH/DELETE outside the
+read-only routes), the writing user reads from the primary for
+DB_REPLICA_STICKY_SECONDS, so replica lag never hides their own change. The
+window is remembered in-process and in a short-lived cookie, which carries
+it to requests served by other workers.
+"""
+
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+
+from app.core.auth_context import get_request_auth_context
+from app.db.replicas.routing import READ_ONLY_ROUTE_STATE_KEY, STICKY_PRIMARY_COOKIE
+from app.db.session import read_router
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
+
+WRITE_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+
+
+class ReadYourWritesMiddleware(ASGIMiddleware):
+    """Pin a user's reads to the primary briefly after each write."""
+
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
+        if (
+            not read_router.enabled
+            or context.method not in WRITE_METHODS
+            or context.status_code is None
+            or context.status_code >= 400
+            or context.state.get(READ_ONLY_ROUTE_STATE_KEY)
+        ):
+            return
+
+        user_id = get_request_auth_context(HTTPConnection(context.scope)).user_id
+        if user_id is None:
+            return
+
+        primary_until = read_router.record_write(user_id)
+        headers.append(
+            "set-cookie",
+            f"{STICKY_PRIMARY_COOKIE}={primary_until:.3f}; "
+            f"Max-Age={int(read_router.sticky_seconds) + 1}; Path=/; "
+            "HttpOnly; SameSite=Lax",
+        )
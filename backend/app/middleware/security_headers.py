@@ -7,19 +7,18 @@ content-type sniffing attacks.
 """
 
 import logging
-from collections.abc import Callable
 
-from fastapi import Request, Response
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
 from starlette.types import ASGIApp
 
 from app.core.config import get_settings
+from app.middleware.pipeline import ASGIMiddleware, RequestContext
 
 logger = logging.getLogger(__name__)
 settings = get_settings()
 
 
-class SecurityHeadersMiddleware(BaseHTTPMiddleware):
+class SecurityHeadersMiddleware(ASGIMiddleware):
     """
     Middleware that adds security headers to all HTTP responses.
 
@@ -36,7 +35,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
 
     def __init__(
         self,
-        app: ASGIApp,
+        app: ASGIApp | None = None,
         hsts_max_age: int = 31536000,  # 1 year in seconds
         include_subdomains: bool = True,
         hsts_preload: bool = False,
@@ -61,33 +60,30 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
         self.content_security_policy = content_security_policy
         self.permissions_policy = permissions_policy
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
+    def on_response_start(
+        self, context: RequestContext, headers: MutableHeaders
+    ) -> None:
         """
-        Process request and add security headers to response.
+        Add security headers to the outgoing response.
 
         Args:
-            request: The incoming HTTP request.
-            call_next: The next middleware/handler in the chain.
-
-        Returns:
-            Response with security headers added.
+            context: The shared request context.
+            headers: The response headers about to be sent.
         """
-        response = await call_next(request)
-
         # Prevent MIME-type sniffing
-        response.headers["X-Content-Type-Options"] = "nosniff"
+        headers["X-Content-Type-Options"] = "nosniff"
 
         # Prevent clickjacking (use DENY for APIs, SAMEORIGIN for web apps)
-        response.headers["X-Frame-Options"] = "DENY"
+        headers["X-Frame-Options"] = "DENY"
 
         # Legacy XSS protection for older browsers
         # Modern browsers use CSP instead, but this helps older clients
-        response.headers["X-XSS-Protection"] = "1; mode=block"
+        headers["X-XSS-Protection"] = "1; mode=block"
 
         # Control referrer information
         # strict-origin-when-cross-origin: sends full URL to same origin,
         # only origin to cross-origin, nothing to less secure destination
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+        headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
 
         # HTTP Strict Transport Security (HSTS)
         # Only add in production (non-DEBUG mode) to avoid issues in development
@@ -97,7 +93,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 hsts_value += "; includeSubDomains"
             if self.hsts_preload:
                 hsts_value += "; preload"
-            response.headers["Strict-Transport-Security"] = hsts_value
+            headers["Strict-Transport-Security"] = hsts_value
 
             # Content Security Policy
             # Default is restrictive for API-only applications
@@ -111,7 +107,7 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 "base-uri 'none'; "
                 "form-action 'none'"
             )
-        response.headers["Content-Security-Policy"] = csp
+        headers["Content-Security-Policy"] = csp
 
         # Permissions Policy (formerly Feature-Policy)
         # Disable sensitive browser features that APIs don't need
@@ -128,17 +124,15 @@ class SecurityHeadersMiddleware(BaseHTTPMiddleware):
                 "payment=(), "
                 "usb=()"
             )
-        response.headers["Permissions-Policy"] = permissions
+        headers["Permissions-Policy"] = permissions
 
         # Cache-Control for sensitive API responses
         # Prevent caching of authenticated responses
         # Only set if not already set by the route handler
-        if "Cache-Control" not in response.headers:
-            response.headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
-            response.headers["Pragma"] = "no-cache"
-            response.headers["Expires"] = "0"
-
-        return response
+        if "Cache-Control" not in headers:
+            headers["Cache-Control"] = "no-store, no-cache, must-revalidate"
+            headers["Pragma"] = "no-cache"
+            headers["Expires"] = "0"
 
 
 def get_security_headers_middleware(
@@ -15,7 +15,7 @@ from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from app.core.logging.context import set_user_id, set_session_id, set_custom_field
-from app.core.security import decode_access_token  # type: ignore[attr-defined]
+from app.core.auth_context import get_request_auth_context
 from loguru import logger
 
 
@@ -106,28 +106,21 @@ class UserContextMiddleware(BaseHTTPMiddleware):
             "session_id": None,
         }
 
-        # Try to get user from JWT token
-        auth_header = request.headers.get("Authorization")
-        if auth_header and auth_header.startswith("Bearer "):
-            token = auth_header[7:]
-
-            try:
-                # Decode token (assuming you have this function)
-                payload = decode_access_token(token)
-
-                if payload:
-                    context["user_id"] = payload.get("sub")
-                    context["username"] = payload.get("username")
-                    context["role"] = payload.get("role")
-                    context["session_id"] = payload.get("session_id")
-                    context["user"] = {
-                        "id": payload.get("sub"),
-                        "username": payload.get("username"),
-                        "role": payload.get("role"),
-                    }
-
-            except Exception as e:
-                logger.debug(f"Failed to decode token: {e}")
+        # Reuse the token decoded once for this request
+        auth_context = get_request_auth_context(request)
+        payload = auth_context.claims
+        if payload:
+            context["user_id"] = payload.get("sub")
+            context["username"] = payload.get("username")
+            context["role"] = payload.get("role")
+            context["session_id"] = payload.get("session_id")
+            context["user"] = {
+                "id": payload.get("sub"),
+                "username": payload.get("username"),
+                "role": payload.get("role"),
+            }
+        elif auth_context.error:
+            logger.debug(f"Failed to decode token: {auth_context.error}")
 
                 # Alternative: Get from session cookie
         if not context["user_id"]:
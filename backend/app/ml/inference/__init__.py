@@ -4,6 +4,7 @@ ML Inference package for schedule scoring and optimization.
 Contains tools for using trained ML models to evaluate and optimize schedules.
 """
 
+from app.ml.inference.model_registry import ModelRegistry, get_model_registry
 from app.ml.inference.schedule_scorer import ScheduleScorer
 
-__all__ = ["ScheduleScorer"]
+__all__ = ["ModelRegistry", "ScheduleScorer", "get_model_registry"]
@@ -0,0 +1,176 @@
+"""
+Model Registry - process-wide cache of loaded ML models.
+
+``ScheduleScorer`` used to unpickle all three models from disk every time it
+was constructed. The registry loads each model version once per process and
+hands the same instance to every caller. A model's version is the latest
+modification time of its artifact files, so a retrain that writes new
+artifacts (``ml_tasks.train_ml_models``) is picked up on the next lookup in
+every process, and the training process can publish the fresh instance
+directly without a reload.
+
+Loaded models are shared; callers must only use their inference methods.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from app.ml.models.conflict_predictor import ConflictPredictor
+from app.ml.models.preference_predictor import PreferencePredictor
+from app.ml.models.workload_optimizer import WorkloadOptimizer
+
+logger = logging.getLogger(__name__)
+
+MODEL_CLASSES: dict[str, type] = {
+    "preference": PreferencePredictor,
+    "conflict": ConflictPredictor,
+    "workload": WorkloadOptimizer,
+}
+
+
+@dataclass
+class _RegistryEntry:
+    """A loaded model and the artifact version it was loaded from."""
+
+    model: Any
+    version: int | None
+
+
+def artifact_version(path: Path | None) -> int | None:
+    """
+    Get the version stamp of a model directory.
+
+    Args:
+        path: Model artifact directory
+
+    Returns:
+        Latest ``st_mtime_ns`` of the ``*.pkl`` artifacts, or None if the
+        directory does not exist
+    """
+    if path is None or not path.exists():
+        return None
+    stamps = [artifact.stat().st_mtime_ns for artifact in path.glob("*.pkl")]
+    return max(stamps) if stamps else None
+
+
+class ModelRegistry:
+    """
+    Loads each (model kind, artifact path, version) once per process.
+
+    Usage:
+        registry = get_model_registry()
+        predictor = registry.get("conflict", models_dir / "conflict_predictor")
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self._entries: dict[tuple[str, str | None], _RegistryEntry] = {}
+        self._lock = threading.Lock()
+        self.loads = 0
+        self.hits = 0
+
+    @staticmethod
+    def _key(kind: str, path: Path | None) -> tuple[str, str | None]:
+        if kind not in MODEL_CLASSES:
+            raise ValueError(f"Unknown model kind: {kind}")
+        return kind, str(path.resolve()) if path is not None else None
+
+    def get(self, kind: str, path: Path | None = None) -> Any:
+        """
+        Get a model, loading it only if its artifacts changed.
+
+        Args:
+            kind: One of "preference", "conflict", "workload"
+            path: Artifact directory; None (or a missing directory) yields an
+                untrained model, shared per kind
+
+        Returns:
+            Model instance
+        """
+        key = self._key(kind, path)
+        version = artifact_version(path)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == version:
+                self.hits += 1
+                return entry.model
+
+            model_path = path if version is not None else None
+            model = MODEL_CLASSES[kind](model_path=model_path)
+            self._entries[key] = _RegistryEntry(model=model, version=version)
+            self.loads += 1
+
+        if entry is not None:
+            logger.info(f"Hot-swapped {kind} model from {path} (version {version})")
+        return model
+
+    def publish(self, kind: str, path: Path, model: Any) -> None:
+        """
+        Install a freshly trained model without reloading it from disk.
+
+        Call after ``model.save(path)`` so the registry records the version
+        that was just written.
+
+        Args:
+            kind: Model kind
+            path: Directory the model was saved to
+            model: Trained model instance
+        """
+        key = self._key(kind, path)
+        with self._lock:
+            self._entries[key] = _RegistryEntry(
+                model=model, version=artifact_version(path)
+            )
+        logger.info(f"Published retrained {kind} model from {path}")
+
+    def invalidate(self, kind: str | None = None) -> None:
+        """
+        Drop cached models so the next lookup reloads them.
+
+        Args:
+            kind: Model kind to drop, or None for all
+        """
+        with self._lock:
+            if kind is None:
+                self._entries.clear()
+            else:
+                for key in [k for k in self._entries if k[0] == kind]:
+                    del self._entries[key]
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get registry statistics.
+
+        Returns:
+            Dictionary with cached entries and load/hit counters
+        """
+        with self._lock:
+            return {
+                "cached_models": len(self._entries),
+                "loads": self.loads,
+                "hits": self.hits,
+                "entries": [
+                    {"kind": kind, "path": path, "version": entry.version}
+                    for (kind, path), entry in self._entries.items()
+                ],
+            }
+
+
+_registry: ModelRegistry | None = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """
+    Get the process-wide ModelRegistry instance.
+
+    Returns:
+        ModelRegistry singleton
+    """
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry()
+    return _registry
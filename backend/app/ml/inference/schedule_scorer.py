@@ -12,6 +12,7 @@ from typing import Any
 import numpy as np
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.ml.inference.model_registry import get_model_registry
 from app.ml.models.conflict_predictor import ConflictPredictor
 from app.ml.models.preference_predictor import PreferencePredictor
 from app.ml.models.workload_optimizer import WorkloadOptimizer
@@ -49,12 +50,18 @@ class ScheduleScorer:
         """
         self.db = db
 
-        # Initialize ML models
-        self.preference_predictor = PreferencePredictor(
-            model_path=preference_model_path
+        # Models come from the process-wide registry, which loads each model
+        # version from disk once rather than once per scorer
+        registry = get_model_registry()
+        self.preference_predictor: PreferencePredictor = registry.get(
+            "preference", preference_model_path
+        )
+        self.workload_optimizer: WorkloadOptimizer = registry.get(
+            "workload", workload_model_path
+        )
+        self.conflict_predictor: ConflictPredictor = registry.get(
+            "conflict", conflict_model_path
         )
-        self.workload_optimizer = WorkloadOptimizer(model_path=workload_model_path)
-        self.conflict_predictor = ConflictPredictor(model_path=conflict_model_path)
 
         logger.info("Initialized ScheduleScorer with ML models")
 
@@ -130,16 +137,8 @@ class ScheduleScorer:
                 "low_preference_count": 0,
             }
 
-            # Score each assignment
-        scores = []
-        for assignment in assignments:
-            score = self.preference_predictor.predict(
-                person_data=assignment.get("person", {}),
-                rotation_data=assignment.get("rotation", {}),
-                block_data=assignment.get("block", {}),
-                historical_stats=assignment.get("historical_stats"),
-            )
-            scores.append(score)
+            # Score all assignments in one batch
+        scores = self.preference_predictor.predict_batch(assignments)
 
             # Calculate statistics
         avg_score = float(np.mean(scores))
@@ -226,23 +225,13 @@ class ScheduleScorer:
                 "average_risk": 0.0,
             }
 
-            # Identify high-risk assignments
-        high_risk = self.conflict_predictor.identify_high_risk_assignments(
-            assignments, threshold=0.7
+            # Score every assignment once, then derive high-risk and averages
+        risks = self.conflict_predictor.predict_conflict_probabilities(assignments)
+        high_risk = self.conflict_predictor.high_risk_from_probabilities(
+            assignments, risks, threshold=0.7
         )
 
-        # Calculate average risk across all assignments
-        risks = []
-        for assignment in assignments:
-            prob = self.conflict_predictor.predict_conflict_probability(
-                person_data=assignment.get("person", {}),
-                proposed_assignment=assignment.get("proposed", {}),
-                existing_assignments=assignment.get("existing", []),
-                context_data=assignment.get("context"),
-            )
-            risks.append(prob)
-
-        avg_risk = float(np.mean(risks)) if risks else 0.0
+        avg_risk = float(np.mean(risks)) if len(risks) else 0.0
 
         # Safety score is inverse of average risk
         safety_score = 1.0 - avg_risk
@@ -254,10 +243,10 @@ class ScheduleScorer:
 
             # Risk distribution
         risk_distribution = {
-            "critical": sum(1 for r in risks if r >= 0.8),
-            "high": sum(1 for r in risks if 0.6 <= r < 0.8),
-            "medium": sum(1 for r in risks if 0.4 <= r < 0.6),
-            "low": sum(1 for r in risks if r < 0.4),
+            "critical": int(np.count_nonzero(risks >= 0.8)),
+            "high": int(np.count_nonzero((risks >= 0.6) & (risks < 0.8))),
+            "medium": int(np.count_nonzero((risks >= 0.4) & (risks < 0.6))),
+            "low": int(np.count_nonzero(risks < 0.4)),
         }
 
         return {
@@ -327,14 +316,10 @@ class ScheduleScorer:
                 )
 
                 # 3. Low-preference assignments
-        for assignment in assignments:
-            score = self.preference_predictor.predict(
-                person_data=assignment.get("person", {}),
-                rotation_data=assignment.get("rotation", {}),
-                block_data=assignment.get("block", {}),
-                historical_stats=assignment.get("historical_stats"),
-            )
-
+        preference_scores = (
+            self.preference_predictor.predict_batch(assignments) if assignments else []
+        )
+        for assignment, score in zip(assignments, preference_scores):
             if score < 0.3:  # Very low preference
                 suggestions.append(
                     {
@@ -0,0 +1,69 @@
+"""
+Batch feature assembly for vectorized ML inference.
+
+Per-row inference builds a one-row DataFrame, pads missing columns, scales it
+and calls the estimator once per assignment. The helpers here let the models
+write per-row feature dicts straight into one preallocated NumPy matrix so a
+whole schedule is scaled and scored with a single ``transform``/``predict``
+call.
+"""
+
+from collections.abc import Iterable
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+
+def build_feature_matrix(
+    feature_rows: Iterable[dict[str, Any]],
+    feature_names: list[str],
+    n_rows: int,
+) -> np.ndarray:
+    """
+    Fill a preallocated matrix from per-row feature dicts.
+
+    Columns follow ``feature_names`` (the training column order). Features a
+    row does not produce are left at 0, matching the padding done by the
+    single-row predict methods; extra features are ignored.
+
+    Args:
+        feature_rows: Iterable of feature dicts, one per row
+        feature_names: Column order the model was trained with
+        n_rows: Number of rows ``feature_rows`` will yield
+
+    Returns:
+        Float matrix of shape (n_rows, len(feature_names))
+    """
+    column_index = {name: j for j, name in enumerate(feature_names)}
+    matrix = np.zeros((n_rows, len(feature_names)), dtype=np.float64)
+
+    for i, features in enumerate(feature_rows):
+        row = matrix[i]
+        for name, value in features.items():
+            j = column_index.get(name)
+            if j is not None:
+                row[j] = value
+
+    return matrix
+
+
+def scale_matrix(scaler: Any, matrix: np.ndarray, feature_names: list[str]) -> Any:
+    """
+    Apply a fitted scaler to a feature matrix in one call.
+
+    Scalers fitted on DataFrames record ``feature_names_in_`` and warn when
+    given a bare array, so the matrix is wrapped in a single DataFrame view
+    in that case.
+
+    Args:
+        scaler: Fitted scikit-learn transformer
+        matrix: Feature matrix in ``feature_names`` column order
+        feature_names: Column names for the matrix
+
+    Returns:
+        Scaled feature matrix
+    """
+    if hasattr(scaler, "feature_names_in_"):
+        return scaler.transform(pd.DataFrame(matrix, columns=feature_names, copy=False))
+    return scaler.transform(matrix)
@@ -18,6 +18,8 @@ import pandas as pd
 from sklearn.ensemble import GradientBoostingClassifier
 from sklearn.preprocessing import StandardScaler
 
+from app.ml.models.batch_features import build_feature_matrix, scale_matrix
+
 logger = logging.getLogger(__name__)
 
 
@@ -101,6 +103,22 @@ class ConflictPredictor:
         Returns:
             DataFrame with feature columns
         """
+        return pd.DataFrame(
+            [
+                self._feature_dict(
+                    person_data, proposed_assignment, existing_assignments, context_data
+                )
+            ]
+        )
+
+    def _feature_dict(
+        self,
+        person_data: dict[str, Any],
+        proposed_assignment: dict[str, Any],
+        existing_assignments: list[dict[str, Any]],
+        context_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build the raw feature dict for one proposed assignment."""
         features: dict[str, Any] = {}
 
         # Person characteristics
@@ -246,7 +264,7 @@ class ConflictPredictor:
         else:
             features["workload_diversity"] = 0
 
-        return pd.DataFrame([features])
+        return features
 
     def train(
         self,
@@ -354,26 +372,57 @@ class ConflictPredictor:
             logger.warning("Model not trained, returning default probability")
             return 0.0
 
-            # Extract features
-        X = self.extract_features(
-            person_data, proposed_assignment, existing_assignments, context_data
-        )
+        prob = self.predict_conflict_probabilities(
+            [
+                {
+                    "person": person_data,
+                    "proposed": proposed_assignment,
+                    "existing": existing_assignments,
+                    "context": context_data,
+                }
+            ]
+        )[0]
 
-        # Ensure all expected features are present
-        for col in self.feature_names:
-            if col not in X.columns:
-                X[col] = 0
+        return float(prob)
+
+    def predict_conflict_probabilities(
+        self,
+        assignments: list[dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Predict conflict probabilities for many assignments in one pass.
 
-                # Reorder columns
-        X = X[self.feature_names]
+        Features for every assignment are written into one matrix, which is
+        scaled and scored with a single ``predict_proba`` call.
 
-        # Scale and predict probability
-        X_scaled = self.scaler.transform(X)
-        prob = self.model.predict_proba(X_scaled)[0][
-            1
-        ]  # Probability of class 1 (conflict)
+        Args:
+            assignments: Assignment dictionaries with ``person``, ``proposed``,
+                ``existing`` and ``context`` keys
 
-        return float(prob)
+        Returns:
+            Array of conflict probabilities, aligned with ``assignments``
+        """
+        if self.model is None or self.scaler is None:
+            logger.warning("Model not trained, returning default probabilities")
+            return np.zeros(len(assignments))
+        if not assignments:
+            return np.zeros(0)
+
+        X = build_feature_matrix(
+            (
+                self._feature_dict(
+                    person_data=assignment.get("person", {}),
+                    proposed_assignment=assignment.get("proposed", {}),
+                    existing_assignments=assignment.get("existing", []),
+                    context_data=assignment.get("context"),
+                )
+                for assignment in assignments
+            ),
+            self.feature_names,
+            len(assignments),
+        )
+        X_scaled = scale_matrix(self.scaler, X, self.feature_names)
+        return self.model.predict_proba(X_scaled)[:, 1]
 
     def predict_conflict(
         self,
@@ -414,28 +463,44 @@ class ConflictPredictor:
             assignments: List of assignment dictionaries
             threshold: Risk threshold (default 0.7)
 
+        Returns:
+            List of high-risk assignments with details
+        """
+        probabilities = self.predict_conflict_probabilities(assignments)
+        return self.high_risk_from_probabilities(assignments, probabilities, threshold)
+
+    def high_risk_from_probabilities(
+        self,
+        assignments: list[dict[str, Any]],
+        probabilities: np.ndarray,
+        threshold: float = 0.7,
+    ) -> list[dict[str, Any]]:
+        """
+        Select high-risk assignments from precomputed probabilities.
+
+        Lets callers that already scored a schedule reuse the probabilities
+        instead of running inference again.
+
+        Args:
+            assignments: Assignment dictionaries
+            probabilities: Conflict probabilities aligned with ``assignments``
+            threshold: Risk threshold
+
         Returns:
             List of high-risk assignments with details
         """
         high_risk: list[dict[str, Any]] = []
 
-        for assignment in assignments:
-            prob = self.predict_conflict_probability(
-                person_data=assignment.get("person", {}),
-                proposed_assignment=assignment.get("proposed", {}),
-                existing_assignments=assignment.get("existing", []),
-                context_data=assignment.get("context"),
+        for index in np.flatnonzero(probabilities >= threshold):
+            prob = float(probabilities[index])
+            high_risk.append(
+                {
+                    "assignment": assignments[index],
+                    "conflict_probability": prob,
+                    "risk_level": self._risk_level(prob),
+                }
             )
 
-            if prob >= threshold:
-                high_risk.append(
-                    {
-                        "assignment": assignment,
-                        "conflict_probability": prob,
-                        "risk_level": self._risk_level(prob),
-                    }
-                )
-
                 # Sort by probability (highest risk first)
         high_risk.sort(key=lambda x: x["conflict_probability"], reverse=True)
 
@@ -17,6 +17,8 @@ import pandas as pd
 from sklearn.ensemble import RandomForestRegressor
 from sklearn.preprocessing import StandardScaler
 
+from app.ml.models.batch_features import build_feature_matrix, scale_matrix
+
 logger = logging.getLogger(__name__)
 
 
@@ -96,6 +98,22 @@ class PreferencePredictor:
         Returns:
             DataFrame with feature columns
         """
+        return pd.DataFrame(
+            [
+                self._feature_dict(
+                    person_data, rotation_data, block_data, historical_stats
+                )
+            ]
+        )
+
+    def _feature_dict(
+        self,
+        person_data: dict[str, Any],
+        rotation_data: dict[str, Any],
+        block_data: dict[str, Any],
+        historical_stats: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build the raw feature dict for one assignment."""
         features: dict[str, Any] = {}
 
         # Person features
@@ -165,9 +183,7 @@ class PreferencePredictor:
             features["swap_rate"] = 0.0
             features["workload_current"] = 0.0
 
-            # Convert to DataFrame
-        df = pd.DataFrame([features])
-        return df
+        return features
 
     def train(
         self,
@@ -254,25 +270,18 @@ class PreferencePredictor:
             logger.warning("Model not trained, returning default score")
             return 0.5
 
-            # Extract features
-        X = self.extract_features(
-            person_data, rotation_data, block_data, historical_stats
-        )
-
-        # Ensure all expected features are present
-        for col in self.feature_names:
-            if col not in X.columns:
-                X[col] = 0
-
-                # Reorder columns to match training
-        X = X[self.feature_names]
-
-        # Scale and predict
-        X_scaled = self.scaler.transform(X)
-        score = self.model.predict(X_scaled)[0]
+        score = self.predict_batch(
+            [
+                {
+                    "person": person_data,
+                    "rotation": rotation_data,
+                    "block": block_data,
+                    "historical_stats": historical_stats,
+                }
+            ]
+        )[0]
 
-        # Clip to valid range
-        return float(np.clip(score, 0.0, 1.0))
+        return score
 
     def predict_batch(
         self,
@@ -281,6 +290,9 @@ class PreferencePredictor:
         """
         Predict preference scores for multiple assignments.
 
+        All assignments are featurized into one matrix and scored with a
+        single ``predict`` call.
+
         Args:
             assignments: List of assignment dictionaries with person, rotation, block data
 
@@ -289,18 +301,27 @@ class PreferencePredictor:
         """
         if not assignments:
             return []
+        if self.model is None or self.scaler is None:
+            logger.warning("Model not trained, returning default scores")
+            return [0.5] * len(assignments)
+
+        X = build_feature_matrix(
+            (
+                self._feature_dict(
+                    person_data=assignment.get("person", {}),
+                    rotation_data=assignment.get("rotation", {}),
+                    block_data=assignment.get("block", {}),
+                    historical_stats=assignment.get("historical_stats"),
+                )
+                for assignment in assignments
+            ),
+            self.feature_names,
+            len(assignments),
+        )
+        X_scaled = scale_matrix(self.scaler, X, self.feature_names)
+        scores = np.clip(self.model.predict(X_scaled), 0.0, 1.0)
 
-        scores = []
-        for assignment in assignments:
-            score = self.predict(
-                person_data=assignment.get("person", {}),
-                rotation_data=assignment.get("rotation", {}),
-                block_data=assignment.get("block", {}),
-                historical_stats=assignment.get("historical_stats"),
-            )
-            scores.append(score)
-
-        return scores
+        return [float(score) for score in scores]
 
     def get_feature_importance(self) -> dict[str, float]:
         """
@@ -19,6 +19,8 @@ from sklearn.cluster import KMeans
 from sklearn.ensemble import GradientBoostingRegressor
 from sklearn.preprocessing import StandardScaler
 
+from app.ml.models.batch_features import build_feature_matrix, scale_matrix
+
 logger = logging.getLogger(__name__)
 
 
@@ -102,6 +104,17 @@ class WorkloadOptimizer:
         Returns:
             DataFrame with feature columns
         """
+        return pd.DataFrame(
+            [self._feature_dict(person_data, current_assignments, historical_data)]
+        )
+
+    def _feature_dict(
+        self,
+        person_data: dict[str, Any],
+        current_assignments: list[dict[str, Any]],
+        historical_data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Build the raw feature dict for one person."""
         features: dict[str, Any] = {}
 
         # Person characteristics
@@ -193,7 +206,7 @@ class WorkloadOptimizer:
         else:
             features["workload_utilization"] = 0.0
 
-        return pd.DataFrame([features])
+        return features
 
     def train(
         self,
@@ -283,23 +296,56 @@ class WorkloadOptimizer:
             logger.warning("Model not trained, returning default optimal workload")
             return 0.8  # Default to 80% utilization (resilience framework)
 
-            # Extract features
-        X = self.extract_features(person_data, current_assignments, historical_data)
+        workload = self.predict_optimal_workloads(
+            [
+                {
+                    "person": person_data,
+                    "assignments": current_assignments,
+                    "historical_data": historical_data,
+                }
+            ]
+        )[0]
 
-        # Ensure all expected features are present
-        for col in self.feature_names:
-            if col not in X.columns:
-                X[col] = 0
+        return float(workload)
 
-                # Reorder columns
-        X = X[self.feature_names]
+    def predict_optimal_workloads(
+        self,
+        people_data: list[dict[str, Any]],
+    ) -> np.ndarray:
+        """
+        Predict workload levels for many people in one pass.
 
-        # Scale and predict
-        X_scaled = self.scaler.transform(X)
-        optimal_workload = self.workload_model.predict(X_scaled)[0]
+        Args:
+            people_data: Person dictionaries with ``person``, ``assignments``
+                and ``historical_data`` keys
 
-        # Clip to valid range
-        return float(np.clip(optimal_workload, 0.0, 1.0))
+        Returns:
+            Array of workload scores (0-1), aligned with ``people_data``
+        """
+        if self.workload_model is None or self.scaler is None:
+            logger.warning("Model not trained, returning default optimal workload")
+            return np.full(len(people_data), 0.8)
+        if not people_data:
+            return np.zeros(0)
+
+        X_scaled = self._scaled_matrix(people_data)
+        return np.clip(self.workload_model.predict(X_scaled), 0.0, 1.0)
+
+    def _scaled_matrix(self, people_data: list[dict[str, Any]]) -> Any:
+        """Featurize and scale all people with one ``transform`` call."""
+        X = build_feature_matrix(
+            (
+                self._feature_dict(
+                    person_data=person.get("person", {}),
+                    current_assignments=person.get("assignments", []),
+                    historical_data=person.get("historical_data"),
+                )
+                for person in people_data
+            ),
+            self.feature_names,
+            len(people_data),
+        )
+        return scale_matrix(self.scaler, X, self.feature_names)
 
     def identify_overloaded(
         self,
@@ -317,14 +363,10 @@ class WorkloadOptimizer:
             List of overloaded people with details
         """
         overloaded = []
+        workloads = self.predict_optimal_workloads(people_data)
 
-        for person in people_data:
-            workload = self.predict_optimal_workload(
-                person_data=person.get("person", {}),
-                current_assignments=person.get("assignments", []),
-                historical_data=person.get("historical_data"),
-            )
-
+        for person, workload in zip(people_data, workloads):
+            workload = float(workload)
             if workload > threshold:
                 overloaded.append(
                     {
@@ -361,12 +403,9 @@ class WorkloadOptimizer:
 
         # Calculate current workload for everyone
         workloads: list[dict[str, Any]] = []
-        for person in people_data:
-            workload = self.predict_optimal_workload(
-                person_data=person.get("person", {}),
-                current_assignments=person.get("assignments", []),
-                historical_data=person.get("historical_data"),
-            )
+        predicted = self.predict_optimal_workloads(people_data)
+        for person, workload in zip(people_data, predicted):
+            workload = float(workload)
             workloads.append(
                 {
                     "person": person,
@@ -433,19 +472,15 @@ class WorkloadOptimizer:
         if self.clusterer is None or self.scaler is None:
             return 0
 
-            # Extract features
-        X = self.extract_features(person_data, current_assignments, historical_data)
-
-        # Ensure all expected features are present
-        for col in self.feature_names:
-            if col not in X.columns:
-                X[col] = 0
-
-                # Reorder columns
-        X = X[self.feature_names]
-
-        # Scale and predict cluster
-        X_scaled = self.scaler.transform(X)
+        X_scaled = self._scaled_matrix(
+            [
+                {
+                    "person": person_data,
+                    "assignments": current_assignments,
+                    "historical_data": historical_data,
+                }
+            ]
+        )
         cluster = self.clusterer.predict(X_scaled)[0]
 
         return int(cluster)
@@ -463,19 +498,10 @@ class WorkloadOptimizer:
         Returns:
             Fairness metrics (Gini coefficient, std deviation, etc.)
         """
-        workloads = []
-        for person in people_data:
-            workload = self.predict_optimal_workload(
-                person_data=person.get("person", {}),
-                current_assignments=person.get("assignments", []),
-                historical_data=person.get("historical_data"),
-            )
-            workloads.append(workload)
-
-        if not workloads:
+        if not people_data:
             return {"gini_coefficient": 0.0, "std_deviation": 0.0, "mean_workload": 0.0}
 
-        workloads = np.array(workloads)  # type: ignore[assignment]
+        workloads = self.predict_optimal_workloads(people_data)
 
         # Gini coefficient (measure of inequality)
         sorted_workloads = np.sort(workloads)
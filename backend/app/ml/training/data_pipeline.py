@@ -20,6 +20,7 @@ from app.models.block import Block
 from app.models.conflict_alert import ConflictAlert
 from app.models.person import Person
 from app.models.rotation_template import RotationTemplate
+from app.services.export.arrow_exporter import ArrowExporter
 
 
 def _to_date(dt):
@@ -60,6 +61,40 @@ class TrainingDataPipeline:
             return await self.db.execute(query)
         return self.db.execute(query)
 
+    async def load_assignment_frame(
+        self,
+        start_date: datetime | None = None,
+        end_date: datetime | None = None,
+        columns: list[str] | None = None,
+        since_version: int | None = None,
+    ) -> pd.DataFrame:
+        """
+        Load flattened assignments through the columnar exporter.
+
+        Rows are fetched in record batches from a server-side cursor and
+        converted once, so large histories avoid per-row ORM objects.
+        Person, rotation and activity columns come back as categoricals.
+
+        Args:
+            start_date: Start date for historical data
+            end_date: End date for historical data
+            columns: Columns to load (None = all exported columns)
+            since_version: Only assignments changed after this audit
+                transaction id (adds a ``change_type`` column)
+
+        Returns:
+            DataFrame with one row per assignment
+        """
+        table = await ArrowExporter(self.db).read_table(
+            "assignments",
+            start_date=_to_date(start_date) if start_date else None,
+            end_date=_to_date(end_date) if end_date else None,
+            fields=columns,
+            since_version=since_version,
+        )
+        logger.info(f"Loaded {table.num_rows} assignments as a columnar frame")
+        return table.to_pandas()
+
     async def extract_preference_training_data(
         self,
         start_date: datetime | None = None,
@@ -164,7 +164,14 @@ from app.models.rotation_halfday_requirement import RotationHalfDayRequirement
 from app.models.rotation_preference import PREFERENCE_DEFAULTS, RotationPreference
 from app.models.rotation_template import RotationTemplate
 from app.models.weekly_pattern import WeeklyPattern
+from app.models.schedule_rollup import (
+    BlockAssignmentRollup,
+    PersonWorkloadRollup,
+    RotationCoverageRollup,
+    ScheduleRollupState,
+)
 from app.models.schedule_run import ScheduleRun
+from app.models.schedule_version import ScheduleVersion
 from app.models.scheduled_job import JobExecution, ScheduledJob
 from app.models.schema_version import (
     SchemaChangeEvent,
@@ -236,6 +243,12 @@ __all__ = [
     "CallAssignment",
     "ScheduleRun",
     "User",
+    # Schedule rollups
+    "PersonWorkloadRollup",
+    "RotationCoverageRollup",
+    "BlockAssignmentRollup",
+    "ScheduleRollupState",
+    "ScheduleVersion",
     # Agent Memory models
     "ModelTier",
     "AgentEmbedding",
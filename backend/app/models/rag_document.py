@@ -35,6 +35,12 @@ class RAGDocument(Base):
         nullable=False,
         comment="384-dimensional embedding from sentence-transformers",
     )
+    content_hash: Mapped[str | None] = mapped_column(
+        String(64),
+        nullable=True,
+        index=True,
+        comment="SHA-256 of content; keys the embedding cache on re-ingest",
+    )
     doc_type: Mapped[str] = mapped_column(
         String(100),
         nullable=False,
@@ -63,6 +69,7 @@ class RAGDocument(Base):
         Index("ix_rag_documents_metadata", "metadata_", postgresql_using="gin"),
         # HNSW index for vector similarity search (optimal for RAG queries)
         # m=16: connections per layer, ef_construction=64: search candidates during build
+        # Only ORDER BY embedding <=> :query LIMIT k can use it (see RAGService)
         Index(
             "ix_rag_documents_embedding_hnsw",
             "embedding",
@@ -70,15 +77,6 @@ class RAGDocument(Base):
             postgresql_with={"m": 16, "ef_construction": 64},
             postgresql_ops={"embedding": "vector_cosine_ops"},
         ),
-        # IVFFlat index as alternative (faster build, slightly slower search)
-        # lists=100: number of clusters for inverted file
-        Index(
-            "ix_rag_documents_embedding_ivfflat",
-            "embedding",
-            postgresql_using="ivfflat",
-            postgresql_with={"lists": 100},
-            postgresql_ops={"embedding": "vector_cosine_ops"},
-        ),
     )
 
     def __repr__(self) -> str:
@@ -0,0 +1,104 @@
+"""Schedule rollup models - precomputed assignment aggregates.
+
+Heatmap, fairness and analytics endpoints read these tables instead of
+aggregating raw assignments on every request. Rows are maintained by
+``app.db.rollups`` from assignment changes; ``ScheduleRollupState`` records
+when each rollup was last rebuilt and whether it has gone stale.
+"""
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, String
+
+from app.db.base import Base
+from app.db.types import GUID
+
+
+class PersonWorkloadRollup(Base):
+    """
+    Assignment counts per person per day.
+
+    The category counts mirror the fairness audit classification of rotation
+    templates (FMIT, clinic, admin, academic) so workload reports never need
+    to load individual assignments.
+    """
+
+    __tablename__ = "person_workload_rollups"
+
+    person_id = Column(
+        GUID(), ForeignKey("people.id", ondelete="CASCADE"), primary_key=True
+    )
+    date = Column(Date, primary_key=True, index=True)
+    assignment_count = Column(Integer, nullable=False, default=0)
+    fmit_count = Column(Integer, nullable=False, default=0)
+    clinic_count = Column(Integer, nullable=False, default=0)
+    admin_count = Column(Integer, nullable=False, default=0)
+    academic_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<PersonWorkloadRollup(person_id='{self.person_id}', "
+            f"date='{self.date}', count={self.assignment_count})>"
+        )
+
+
+class RotationCoverageRollup(Base):
+    """Assignment and distinct-person counts per rotation template per day."""
+
+    __tablename__ = "rotation_coverage_rollups"
+
+    rotation_template_id = Column(
+        GUID(),
+        ForeignKey("rotation_templates.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    date = Column(Date, primary_key=True, index=True)
+    assignment_count = Column(Integer, nullable=False, default=0)
+    person_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<RotationCoverageRollup(rotation_template_id="
+            f"'{self.rotation_template_id}', date='{self.date}', "
+            f"count={self.assignment_count})>"
+        )
+
+
+class BlockAssignmentRollup(Base):
+    """Assignment count per half-day block (zero for blocks with none)."""
+
+    __tablename__ = "block_assignment_rollups"
+
+    block_id = Column(
+        GUID(), ForeignKey("blocks.id", ondelete="CASCADE"), primary_key=True
+    )
+    date = Column(Date, nullable=False, index=True)
+    time_of_day = Column(String(2), nullable=False)
+    assignment_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<BlockAssignmentRollup(date='{self.date}', "
+            f"time='{self.time_of_day}', count={self.assignment_count})>"
+        )
+
+
+class ScheduleRollupState(Base):
+    """
+    Refresh bookkeeping for one rollup table.
+
+    A missing row means the rollup has never been built. ``stale_since`` is
+    set when a change could not be applied incrementally (bulk UPDATE/DELETE,
+    template or block edits) and cleared by the next full rebuild.
+    """
+
+    __tablename__ = "schedule_rollup_states"
+
+    name = Column(String(64), primary_key=True)
+    refreshed_at = Column(DateTime, nullable=False)
+    stale_since = Column(DateTime, nullable=True)
+    row_count = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScheduleRollupState(name='{self.name}', "
+            f"refreshed_at='{self.refreshed_at}', stale_since='{self.stale_since}')>"
+        )
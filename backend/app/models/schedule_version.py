@@ -0,0 +1,28 @@
+"""Schedule version counters for conditional calendar feeds.
+
+Each row is a monotonically increasing counter for one scope of the
+schedule: ``person:<uuid>`` for one person's assignments, ``program`` for
+any assignment, ``structure`` for blocks, people and rotation templates.
+``app.db.schedule_versions`` bumps them in the writer's transaction so feed
+ETags can be computed without reading assignments.
+"""
+
+from sqlalchemy import Column, DateTime, Integer, String
+
+from app.db.base import Base
+
+
+class ScheduleVersion(Base):
+    """Change counter for one schedule scope (missing row = version 0)."""
+
+    __tablename__ = "schedule_versions"
+
+    scope = Column(String(64), primary_key=True)
+    version = Column(Integer, nullable=False, default=0)
+    updated_at = Column(DateTime, nullable=False)
+
+    def __repr__(self) -> str:
+        return (
+            f"<ScheduleVersion(scope='{self.scope}', version={self.version}, "
+            f"updated_at='{self.updated_at}')>"
+        )
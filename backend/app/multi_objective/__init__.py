@@ -7,6 +7,7 @@ with MOEA/D and advanced constraint handling.
 
 Modules:
     - core: Base types, objectives, solutions
+    - pareto: Vectorized Pareto toolkit (sorting, crowding, hypervolume)
     - moead: MOEA/D algorithm (decomposition-based)
     - constraints: Advanced constraint handling (penalty, repair, relaxation)
     - preferences: Preference articulation (a priori, a posteriori, interactive)
@@ -43,6 +44,15 @@ from .core import (
     Solution,
     SolutionArchive,
 )
+from .pareto import (
+    HypervolumeEstimate,
+    crowding_distance,
+    dominance_matrix,
+    hypervolume,
+    hypervolume_estimate,
+    non_dominated_mask,
+    non_dominated_sort,
+)
 from .moead import MOEADAlgorithm, DecompositionMethod, WeightVector
 from .constraints import (
     ConstraintHandler,
@@ -98,6 +108,14 @@ __all__ = [
     "ParetoFrontier",
     "Solution",
     "SolutionArchive",
+    # Pareto toolkit
+    "HypervolumeEstimate",
+    "crowding_distance",
+    "dominance_matrix",
+    "hypervolume",
+    "hypervolume_estimate",
+    "non_dominated_mask",
+    "non_dominated_sort",
     # MOEA/D
     "MOEADAlgorithm",
     "DecompositionMethod",
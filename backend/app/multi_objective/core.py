@@ -39,6 +39,8 @@ from uuid import UUID, uuid4
 
 import numpy as np
 
+from .pareto import crowding_distance
+
 
 class ObjectiveDirection(Enum):
     """Direction of optimization for an objective."""
@@ -524,56 +526,16 @@ class SolutionArchive:
 
     def _update_crowding_distances(self) -> None:
         """Calculate crowding distance for all solutions."""
-        if len(self.solutions) <= 2:
-            for sol in self.solutions:
-                sol.crowding_distance = float("inf")
-            return
-
-        n = len(self.solutions)
-        objective_names = [o.name for o in self.objectives if not o.is_constraint]
-
-        # Reset distances
-        for sol in self.solutions:
-            sol.crowding_distance = 0.0
-
-        for obj in self.objectives:
-            if obj.is_constraint:
-                continue
-
-            # Sort by this objective
-            sorted_indices = sorted(
-                range(n),
-                key=lambda i: self.solutions[i].objective_values.get(obj.name, 0.0),
-            )
-
-            # Boundary solutions get infinite distance
-            self.solutions[sorted_indices[0]].crowding_distance = float("inf")
-            self.solutions[sorted_indices[-1]].crowding_distance = float("inf")
-
-            # Calculate objective range
-            min_val = self.solutions[sorted_indices[0]].objective_values.get(
-                obj.name, 0.0
-            )
-            max_val = self.solutions[sorted_indices[-1]].objective_values.get(
-                obj.name, 0.0
-            )
-            obj_range = max_val - min_val
-
-            if obj_range == 0:
-                continue
-
-            # Calculate crowding for intermediate solutions
-            for i in range(1, n - 1):
-                idx = sorted_indices[i]
-                prev_val = self.solutions[sorted_indices[i - 1]].objective_values.get(
-                    obj.name, 0.0
-                )
-                next_val = self.solutions[sorted_indices[i + 1]].objective_values.get(
-                    obj.name, 0.0
-                )
-                self.solutions[idx].crowding_distance += (
-                    next_val - prev_val
-                ) / obj_range
+        names = [o.name for o in self.objectives if not o.is_constraint]
+        values = np.array(
+            [
+                [sol.objective_values.get(name, 0.0) for name in names]
+                for sol in self.solutions
+            ],
+            dtype=float,
+        ).reshape(len(self.solutions), len(names))
+        for sol, distance in zip(self.solutions, crowding_distance(values)):
+            sol.crowding_distance = float(distance)
 
     def get_frontier(self) -> ParetoFrontier:
         """Extract the Pareto frontier from the archive."""
@@ -50,6 +50,7 @@ from .core import (
     Solution,
     compare_dominance,
 )
+from .pareto import crowding_distance
 
 
 class DiversityMetric(Enum):
@@ -105,44 +106,15 @@ class CrowdingDistance:
         Args:
             solutions: List of solutions to calculate distances for
         """
-        n = len(solutions)
-        if n <= 2:
-            for sol in solutions:
-                sol.crowding_distance = float("inf")
-            return
-
-            # Reset distances
-        for sol in solutions:
-            sol.crowding_distance = 0.0
-
-            # Calculate for each objective
-        for obj in self.active_objectives:
-            # Sort by this objective
-            sorted_solutions = sorted(
-                solutions,
-                key=lambda s: s.objective_values.get(obj.name, 0.0),
-            )
-
-            # Boundary solutions get infinite distance
-            sorted_solutions[0].crowding_distance = float("inf")
-            sorted_solutions[-1].crowding_distance = float("inf")
-
-            # Calculate objective range
-            min_val = sorted_solutions[0].objective_values.get(obj.name, 0.0)
-            max_val = sorted_solutions[-1].objective_values.get(obj.name, 0.0)
-            obj_range = max_val - min_val
-
-            if obj_range == 0:
-                continue
-
-                # Calculate crowding for intermediate solutions
-            for i in range(1, n - 1):
-                prev_val = sorted_solutions[i - 1].objective_values.get(obj.name, 0.0)
-                next_val = sorted_solutions[i + 1].objective_values.get(obj.name, 0.0)
-
-                sorted_solutions[i].crowding_distance += (
-                    next_val - prev_val
-                ) / obj_range
+        values = np.array(
+            [
+                [s.objective_values.get(o.name, 0.0) for o in self.active_objectives]
+                for s in solutions
+            ],
+            dtype=float,
+        ).reshape(len(solutions), len(self.active_objectives))
+        for sol, distance in zip(solutions, crowding_distance(values)):
+            sol.crowding_distance = float(distance)
 
     def select_by_crowding(
         self,
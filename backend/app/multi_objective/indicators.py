@@ -48,6 +48,13 @@ from .core import (
     ParetoFrontier,
     Solution,
 )
+from .pareto import (
+    MONTE_CARLO_SAMPLES,
+    MONTE_CARLO_SEED,
+    HypervolumeEstimate,
+    hypervolume,
+    hypervolume_estimate,
+)
 
 
 class QualityIndicator(ABC):
@@ -104,15 +111,25 @@ class HypervolumeIndicator(QualityIndicator):
     meaning a front A has higher HV than B if and only if A dominates B.
     """
 
-    def __init__(self, reference_point: np.ndarray | None = None) -> None:
+    def __init__(
+        self,
+        reference_point: np.ndarray | None = None,
+        samples: int = MONTE_CARLO_SAMPLES,
+        seed: int = MONTE_CARLO_SEED,
+    ) -> None:
         """
         Initialize hypervolume indicator.
 
         Args:
             reference_point: Reference point for HV calculation.
                            If None, will be computed from the front.
+            samples: Monte Carlo samples for fronts with more than four
+                objectives
+            seed: Monte Carlo random seed
         """
         self._reference_point = reference_point
+        self.samples = samples
+        self.seed = seed
 
     @property
     def name(self) -> str:
@@ -140,6 +157,18 @@ class HypervolumeIndicator(QualityIndicator):
         # Calculate hypervolume
         return self._calculate_hv(points, ref_point)
 
+    def estimate(self, front: ParetoFrontier) -> HypervolumeEstimate:
+        """Hypervolume of the front with its Monte Carlo standard error."""
+        if not front.solutions:
+            return HypervolumeEstimate(0.0)
+        points = self._get_normalized_points(front)
+        return hypervolume_estimate(
+            points,
+            self._get_reference_point(points, front),
+            samples=self.samples,
+            seed=self.seed,
+        )
+
     def _get_normalized_points(self, front: ParetoFrontier) -> np.ndarray:
         """Get points as numpy array, normalized to minimization."""
         objective_names = [o.name for o in front.objectives if not o.is_constraint]
@@ -176,97 +205,8 @@ class HypervolumeIndicator(QualityIndicator):
         return result
 
     def _calculate_hv(self, points: np.ndarray, ref_point: np.ndarray) -> float:
-        """
-        Calculate hypervolume using WFG algorithm.
-
-        For efficiency, uses dimension-recursive approach.
-        """
-        n_points, n_dim = points.shape
-
-        if n_points == 0:
-            return 0.0
-
-        if n_dim == 1:
-            # 1D case: simple interval
-            return float(ref_point[0] - np.min(points))
-
-        if n_dim == 2:
-            # 2D case: efficient sweep algorithm
-            return self._hv_2d(points, ref_point)
-
-            # General case: WFG recursive algorithm
-        return self._hv_wfg(points, ref_point)
-
-    def _hv_2d(self, points: np.ndarray, ref_point: np.ndarray) -> float:
-        """Calculate 2D hypervolume using sweep algorithm."""
-        # Sort by first objective
-        sorted_indices = np.argsort(points[:, 0])
-        sorted_points = points[sorted_indices]
-
-        hv = 0.0
-        prev_x = ref_point[0]
-        prev_y = ref_point[1]
-
-        for point in reversed(sorted_points):
-            if point[0] < prev_x and point[1] < prev_y:
-                hv += (prev_x - point[0]) * (prev_y - point[1])
-                prev_x = point[0]
-
-        return hv
-
-    def _hv_wfg(self, points: np.ndarray, ref_point: np.ndarray) -> float:
-        """
-        Calculate hypervolume using WFG algorithm.
-
-        This is a simplified version for moderate dimensions.
-        """
-        n_points, n_dim = points.shape
-
-        # Filter points dominated by reference point
-        valid = np.all(points <= ref_point, axis=1)
-        points = points[valid]
-
-        if len(points) == 0:
-            return 0.0
-
-        if len(points) == 1:
-            return float(np.prod(ref_point - points[0]))
-
-            # Sort by first objective
-        sorted_indices = np.argsort(points[:, 0])
-        sorted_points = points[sorted_indices]
-
-        # Recursive calculation
-        hv = 0.0
-        while len(sorted_points) > 0:
-            # Get point with best first objective
-            p = sorted_points[0]
-            sorted_points = sorted_points[1:]
-
-            # Volume contributed by this point
-            if n_dim == 2:
-                contrib = (ref_point[0] - p[0]) * (ref_point[1] - p[1])
-            else:
-                # Recursive for remaining dimensions
-                remaining_ref = ref_point[1:]
-                remaining_points = sorted_points[:, 1:]
-                remaining_points = remaining_points[
-                    np.all(remaining_points <= remaining_ref, axis=1)
-                ]
-
-                if len(remaining_points) == 0:
-                    inner_hv = float(np.prod(remaining_ref - p[1:]))
-                else:
-                    inner_hv = self._hv_wfg(remaining_points, remaining_ref)
-
-                contrib = (ref_point[0] - p[0]) * inner_hv
-
-            hv += contrib
-
-            # Update reference for remaining points
-            ref_point = np.array([p[0]] + list(ref_point[1:]))
-
-        return hv
+        """Calculate hypervolume (exact up to four objectives, else Monte Carlo)."""
+        return hypervolume(points, ref_point, samples=self.samples, seed=self.seed)
 
 
 class GenerationalDistance(QualityIndicator):
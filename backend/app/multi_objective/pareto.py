@@ -0,0 +1,363 @@
+"""
+Pareto Toolkit on Objective Arrays.
+
+Shared, vectorized Pareto primitives used by NSGA-II, MOEA/D archives,
+quality indicators and the Pareto optimization service. Every function
+takes an (n x m) array of objective values to be MINIMIZED; negate
+maximized columns first (see ``to_minimization``).
+
+Functions:
+    - dominance_matrix: Pairwise Pareto dominance as a boolean matrix
+    - non_dominated_mask: Membership of the first front
+    - non_dominated_sort: Front rank of every point
+    - crowding_distance: NSGA-II crowding distance
+    - hypervolume / hypervolume_estimate: Dominated hypervolume
+
+Hypervolume:
+    Exact for up to EXACT_HV_MAX_OBJECTIVES objectives: a 2D sweep, a 3D
+    dimension sweep over an incrementally maintained 2D staircase, and for
+    higher dimensions a sweep over the last objective that adds each
+    point's exclusive contribution (box volume minus the volume of its
+    limit set). Beyond that the default is a seeded Monte Carlo estimate
+    reported with its standard error.
+"""
+
+from __future__ import annotations
+
+import bisect
+import math
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+# Largest objective count for which ``hypervolume`` is exact by default
+EXACT_HV_MAX_OBJECTIVES = 4
+
+# Monte Carlo hypervolume defaults
+MONTE_CARLO_SAMPLES = 20_000
+MONTE_CARLO_SEED = 0
+
+# Objective ranges at or below this are treated as flat for crowding
+CROWDING_FLAT_RANGE = 1e-10
+
+# Rows compared at once when building dominance matrices / MC samples
+_CHUNK_ROWS = 1024
+
+
+def to_minimization(values: np.ndarray, maximize: Sequence[bool]) -> np.ndarray:
+    """
+    Convert objective values to minimization form.
+
+    Args:
+        values: (n x m) objective values
+        maximize: Per-column flag, True where larger values are better
+
+    Returns:
+        Copy of ``values`` with maximized columns negated
+    """
+    signs = np.where(np.asarray(maximize, dtype=bool), -1.0, 1.0)
+    return np.asarray(values, dtype=float) * signs
+
+
+def dominance_matrix(points: np.ndarray) -> np.ndarray:
+    """
+    Pairwise Pareto dominance.
+
+    Returns:
+        Boolean (n x n) matrix D with D[i, j] True when point i dominates j
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    result = np.zeros((n, n), dtype=bool)
+    for start in range(0, n, _CHUNK_ROWS):
+        block = points[start : start + _CHUNK_ROWS, np.newaxis, :]
+        no_worse = np.all(block <= points[np.newaxis, :, :], axis=2)
+        better = np.any(block < points[np.newaxis, :, :], axis=2)
+        result[start : start + _CHUNK_ROWS] = no_worse & better
+    return result
+
+
+def non_dominated_mask(points: np.ndarray) -> np.ndarray:
+    """Boolean mask of points no other point dominates."""
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return np.zeros(0, dtype=bool)
+    return ~dominance_matrix(points).any(axis=0)
+
+
+def non_dominated_sort(points: np.ndarray) -> np.ndarray:
+    """
+    Rank points by non-dominated front (0 = Pareto front).
+
+    Fronts are peeled off a dominance matrix: a point joins the next front
+    once every point dominating it has been ranked.
+
+    Returns:
+        Integer array of front ranks
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    ranks = np.full(n, -1, dtype=np.int64)
+    if n == 0:
+        return ranks
+
+    dominates = dominance_matrix(points)
+    remaining = dominates.sum(axis=0)
+    current = np.flatnonzero(remaining == 0)
+    rank = 0
+    while current.size:
+        ranks[current] = rank
+        remaining[current] = -1
+        remaining -= dominates[current].sum(axis=0)
+        current = np.flatnonzero(remaining == 0)
+        rank += 1
+    return ranks
+
+
+def fronts_from_ranks(ranks: np.ndarray) -> list[np.ndarray]:
+    """Indices of each front, best first, from ``non_dominated_sort`` ranks."""
+    if len(ranks) == 0:
+        return []
+    order = np.argsort(ranks, kind="stable")
+    boundaries = np.flatnonzero(np.diff(ranks[order])) + 1
+    return list(np.split(order, boundaries))
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    """
+    NSGA-II crowding distance.
+
+    For each objective the extreme points get infinite distance and the
+    others add the normalized gap between their neighbours. Ties keep
+    input order, and objectives with no spread add nothing.
+
+    Returns:
+        Array of crowding distances (inf for boundary points)
+    """
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    if n <= 2:
+        return np.full(n, np.inf)
+
+    order = np.argsort(points, axis=0, kind="stable")
+    ordered = np.take_along_axis(points, order, axis=0)
+    spread = ordered[-1] - ordered[0]
+    flat = spread <= CROWDING_FLAT_RANGE
+
+    gaps = (ordered[2:] - ordered[:-2]) / np.where(flat, 1.0, spread)
+    gaps[:, flat] = 0.0
+    distance = np.zeros(n)
+    np.add.at(distance, order[1:-1].ravel(), gaps.ravel())
+    distance[order[0]] = np.inf
+    distance[order[-1]] = np.inf
+    return distance
+
+
+@dataclass
+class HypervolumeEstimate:
+    """
+    Hypervolume value with its uncertainty.
+
+    Attributes:
+        value: Hypervolume (exact or estimated)
+        std_error: Standard error of the estimate (0 when exact)
+        samples: Monte Carlo samples used (0 when exact)
+        exact: Whether the value is exact
+    """
+
+    value: float
+    std_error: float = 0.0
+    samples: int = 0
+    exact: bool = True
+
+    def interval(self, z: float = 1.96) -> tuple[float, float]:
+        """Confidence interval (default 95%) around the value."""
+        margin = z * self.std_error
+        return max(0.0, self.value - margin), self.value + margin
+
+
+def hypervolume(
+    points: np.ndarray,
+    reference_point: np.ndarray,
+    method: str = "auto",
+    samples: int = MONTE_CARLO_SAMPLES,
+    seed: int = MONTE_CARLO_SEED,
+) -> float:
+    """
+    Hypervolume dominated by ``points`` and bounded by ``reference_point``.
+
+    See ``hypervolume_estimate`` for the arguments.
+    """
+    return hypervolume_estimate(points, reference_point, method, samples, seed).value
+
+
+def hypervolume_estimate(
+    points: np.ndarray,
+    reference_point: np.ndarray,
+    method: str = "auto",
+    samples: int = MONTE_CARLO_SAMPLES,
+    seed: int = MONTE_CARLO_SEED,
+) -> HypervolumeEstimate:
+    """
+    Hypervolume dominated by ``points`` and bounded by ``reference_point``.
+
+    Args:
+        points: (n x m) objective values in minimization form
+        reference_point: Point every counted region must dominate
+        method: "exact", "monte_carlo", or "auto" (exact for
+            m <= EXACT_HV_MAX_OBJECTIVES)
+        samples: Monte Carlo sample count
+        seed: Monte Carlo random seed
+
+    Returns:
+        HypervolumeEstimate
+
+    Raises:
+        ValueError: If ``method`` is unknown
+    """
+    if method not in ("auto", "exact", "monte_carlo"):
+        raise ValueError(f"Unknown hypervolume method: {method}")
+
+    ref = np.asarray(reference_point, dtype=float)
+    points = np.asarray(points, dtype=float).reshape(-1, len(ref))
+    # Only points strictly better than the reference in every objective count
+    points = points[np.all(points < ref, axis=1)]
+    if len(points) == 0:
+        return HypervolumeEstimate(0.0)
+
+    use_exact = method == "exact" or (
+        method == "auto" and len(ref) <= EXACT_HV_MAX_OBJECTIVES
+    )
+    if use_exact:
+        points = np.unique(points[non_dominated_mask(points)], axis=0)
+        return HypervolumeEstimate(_hv_exact(points, ref))
+    return _hv_monte_carlo(points, ref, samples, seed)
+
+
+def _hv_exact(points: np.ndarray, ref: np.ndarray) -> float:
+    """Exact hypervolume of points that all strictly dominate ``ref``."""
+    n, m = points.shape
+    if n == 0:
+        return 0.0
+    if m == 1:
+        return float(ref[0] - points[:, 0].min())
+    if m == 2:
+        return _hv_2d(points, ref)
+    if m == 3:
+        return _hv_3d(points, ref)
+
+    # Sweep over the last objective. Each point adds its exclusive
+    # (m-1)-dimensional contribution to the running slice volume.
+    order = np.argsort(points[:, -1], kind="stable")
+    base = points[order, :-1]
+    levels = np.append(points[order, -1], ref[-1])
+    inner_ref = ref[:-1]
+
+    total = 0.0
+    slice_volume = 0.0
+    for k in range(len(base)):
+        point = base[k]
+        box = float(np.prod(inner_ref - point))
+        if k:
+            limited = np.maximum(base[:k], point)
+            limited = limited[np.all(limited < inner_ref, axis=1)]
+            if len(limited) and len(inner_ref) > 3:
+                limited = limited[non_dominated_mask(limited)]
+            if len(limited):
+                # The 3D sweep skips dominated points on its own
+                box -= _hv_exact(limited, inner_ref)
+        slice_volume += box
+        total += slice_volume * (levels[k + 1] - levels[k])
+    return total
+
+
+def _hv_2d(points: np.ndarray, ref: np.ndarray) -> float:
+    """2D hypervolume by a sweep over the first objective."""
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    x = points[order, 0]
+    lowest_y = np.minimum.accumulate(points[order, 1])
+    widths = np.diff(np.append(x, ref[0]))
+    return float(np.sum(widths * (ref[1] - lowest_y)))
+
+
+def _hv_3d(points: np.ndarray, ref: np.ndarray) -> float:
+    """
+    3D hypervolume by a sweep over the third objective.
+
+    The dominated area of the first two objectives is kept as a staircase
+    (x ascending, y descending) and grows by each point's exclusive area.
+    """
+    order = np.argsort(points[:, 2], kind="stable")
+    pts = points[order]
+    levels = np.append(pts[:, 2], ref[2])
+    ref_x, ref_y = float(ref[0]), float(ref[1])
+
+    xs: list[float] = []
+    ys: list[float] = []
+    area = 0.0
+    volume = 0.0
+    for k, (px, py, _) in enumerate(pts.tolist()):
+        i = bisect.bisect_left(xs, px)
+        dominated = (i > 0 and ys[i - 1] <= py) or (
+            i < len(xs) and xs[i] == px and ys[i] <= py
+        )
+        if not dominated:
+            # Walk the steps the new point covers, adding the area between
+            # the old boundary and py
+            start = px
+            height = ys[i - 1] if i > 0 else ref_y
+            j = i
+            while j < len(xs) and ys[j] >= py:
+                area += (xs[j] - start) * (height - py)
+                start, height = xs[j], ys[j]
+                j += 1
+            end = xs[j] if j < len(xs) else ref_x
+            area += (end - start) * (height - py)
+            xs[i:j] = [px]
+            ys[i:j] = [py]
+        volume += area * (levels[k + 1] - levels[k])
+    return volume
+
+
+def _hv_monte_carlo(
+    points: np.ndarray, ref: np.ndarray, samples: int, seed: int
+) -> HypervolumeEstimate:
+    """
+    Seeded Monte Carlo hypervolume over the box [ideal, ref].
+
+    For each objective, the points no worse than a sample form a prefix of
+    that objective's sort order, stored as a packed bitset. A sample is
+    covered when the AND of its per-objective prefixes is non-empty.
+    """
+    points = points[non_dominated_mask(points)]
+    n, m = points.shape
+    lower = points.min(axis=0)
+    box = float(np.prod(ref - lower))
+    rng = np.random.default_rng(seed)
+
+    columns = np.sort(points, axis=0)
+    ranks = np.argsort(np.argsort(points, axis=0, kind="stable"), axis=0)
+    steps = np.arange(n + 1)[:, np.newaxis]
+    prefixes = [np.packbits(ranks[:, j] < steps, axis=1) for j in range(m)]
+
+    hits = 0
+    for start in range(0, samples, _CHUNK_ROWS):
+        size = min(_CHUNK_ROWS, samples - start)
+        draws = rng.uniform(lower, ref, size=(size, m))
+        covered = prefixes[0][
+            np.searchsorted(columns[:, 0], draws[:, 0], side="right")
+        ]
+        for j in range(1, m):
+            covered = covered & prefixes[j][
+                np.searchsorted(columns[:, j], draws[:, j], side="right")
+            ]
+        hits += int(covered.any(axis=1).sum())
+
+    fraction = hits / samples
+    return HypervolumeEstimate(
+        value=box * fraction,
+        std_error=box * math.sqrt(fraction * (1.0 - fraction) / samples),
+        samples=samples,
+        exact=False,
+    )
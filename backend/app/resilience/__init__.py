@@ -31,223 +31,180 @@ Tier 3+ Cross-Disciplinary Concepts:
 20. Circadian Phase Response Curves (from chronobiology/sleep science)
 """
 
-# Circuit Breaker
-# Tier 1 imports
-from app.resilience.blast_radius import (
-    BlastRadiusManager,
-    BlastRadiusReport,
-    BorrowingPriority,
-    ContainmentLevel,
-    SchedulingZone,
-    ZoneHealthReport,
-    ZoneIncident,
-    ZoneStatus,
-    ZoneType,
-)
+from app.core.lazy_imports import lazy_exports
 
-# Tier 3+: Cross-Disciplinary imports
-from app.resilience.burnout_epidemiology import (
-    BurnoutEpidemiology,
-    BurnoutSIRModel,
-    BurnoutState,
-    EpiReport,
-)
-from app.resilience.burnout_fire_index import (
-    BurnoutCodeReport,
-    BurnoutDangerRating,
-    DangerClass,
-    FireDangerReport,
-)
-from app.resilience.catastrophe_detector import (
-    CatastropheAlert,
-    CatastropheDetector,
-    CatastropheRegion,
-    CuspAnalysis,
-    FailurePrediction,
-    FeasibilitySurface,
-    ParameterState,
-    SystemState,
-)
-from app.resilience.circuit_breaker import (
-    CircuitBreaker,
-    CircuitBreakerConfig,
-    CircuitBreakerError,
-    CircuitBreakerMetrics,
-    CircuitBreakerRegistry,
-    CircuitBreakerTimeoutError,
-    CircuitMetrics,
-    CircuitOpenError,
-    CircuitState,
-    MetricsCollector,
-    StateMachine,
-    StateTransition,
-    async_circuit_breaker,
-    circuit_breaker,
-    collect_metrics_for_all_breakers,
-    get_breaker_from_function,
-    get_breaker_name_from_function,
-)
-from app.resilience.circuit_breaker import get_metrics as get_circuit_breaker_metrics
-from app.resilience.circuit_breaker import (
-    get_registry,
-)
-from app.resilience.circuit_breaker import (
-    setup_metrics as setup_circuit_breaker_metrics,
-)
-from app.resilience.circuit_breaker import (
-    setup_registry,
-    with_async_circuit_breaker,
-    with_circuit_breaker,
-)
-
-# Tier 3 imports
-from app.resilience.cognitive_load import (
-    CognitiveLoadManager,
-    CognitiveLoadReport,
-    CognitiveSession,
-    CognitiveState,
-    Decision,
-    DecisionCategory,
-    DecisionComplexity,
-    DecisionOutcome,
-    DecisionQueueStatus,
-)
-from app.resilience.contingency import (
-    CascadeSimulation,
-    CentralityScore,
-    ContingencyAnalyzer,
-    VulnerabilityReport,
-)
-from app.resilience.recovery_distance import (
-    AssignmentEdit,
-    N1Event,
-    RecoveryDistanceCalculator,
-    RecoveryDistanceMetrics,
-    RecoveryResult,
-)
-from app.resilience.creep_fatigue import (
-    CreepAnalysis,
-    CreepFatigueModel,
-    CreepStage,
-    FatigueCurve,
-)
-from app.resilience.defense_in_depth import DefenseInDepth, DefenseLevel
-from app.resilience.erlang_coverage import (
-    ErlangCCalculator,
-    ErlangMetrics,
-    SpecialistCoverage,
-)
-
-# Tier 2 imports
-from app.resilience.homeostasis import (
-    AllostasisMetrics,
-    AllostasisState,
-    CorrectiveAction,
-    DeviationSeverity,
-    FeedbackLoop,
-    HomeostasisMonitor,
-    HomeostasisStatus,
-    PositiveFeedbackRisk,
-    Setpoint,
-)
-from app.resilience.hub_analysis import (
-    CrossTrainingPriority,
-    CrossTrainingRecommendation,
-    FacultyCentrality,
-    HubAnalyzer,
-    HubDistributionReport,
-    HubProfile,
-    HubProtectionPlan,
-    HubProtectionStatus,
-    HubRiskLevel,
-)
-from app.resilience.keystone_analysis import (
-    CascadeAnalysis,
-    EntityType,
-    KeystoneAnalyzer,
-    KeystoneResource,
-    KeystoneRiskLevel,
-    SuccessionPlan,
-    SuccessionStatus,
-)
-from app.resilience.le_chatelier import (
-    CompensationResponse,
-    CompensationType,
-    EquilibriumReport,
-    EquilibriumShift,
-    EquilibriumState,
-    LeChatelierAnalyzer,
-    StressResponsePrediction,
-    StressType,
-    SystemStress,
-)
-from app.resilience.metastability_detector import (
-    EscapeStrategy,
-    MetastabilityAnalysis,
-    MetastabilityDetector,
-    MetastableState,
-    SolverState,
-)
-from app.resilience.metastability_integration import (
-    EnrichedSolverResult,
-    MetastabilitySolutionCallback,
-    MetastabilitySolverWrapper,
-    apply_escape_strategy,
-    check_metastability_during_solve,
-    create_metastability_callback,
-)
-from app.resilience.process_capability import (
-    ProcessCapabilityReport,
-    ScheduleCapabilityAnalyzer,
-)
-from app.resilience.sacrifice_hierarchy import (
-    ActivityCategory,
-    LoadSheddingLevel,
-    SacrificeHierarchy,
-)
-from app.resilience.seismic_detection import (
-    BurnoutEarlyWarning,
-    PrecursorSignal,
-    SeismicAlert,
-)
-
-# Main service
-from app.resilience.service import ResilienceConfig, ResilienceService
-from app.resilience.spc_monitoring import (
-    SPCAlert,
-    WorkloadControlChart,
-    calculate_control_limits,
-    calculate_process_capability,
-)
-from app.resilience.static_stability import FallbackScenario, FallbackScheduler
-from app.resilience.stigmergy import (
-    CollectivePreference,
-    PreferenceTrail,
-    SignalType,
-    StigmergicScheduler,
-    StigmergyStatus,
-    SwapNetwork,
-    TrailStrength,
-    TrailType,
-)
-from app.resilience.utilization import UtilizationMonitor, UtilizationThreshold
-
-# Circadian Phase Response Curve
-from app.resilience.circadian_model import (
-    CircadianImpact,
-    CircadianOscillator,
-    CircadianQualityLevel,
-    CircadianScheduleAnalyzer,
-    CircadianShiftType,
-)
-from app.resilience.circadian_integration import (
-    CircadianConstraintResult,
-    CircadianObjective,
-    CircadianScheduleOptimizer,
-    classify_shift_type,
-    compute_schedule_regularity,
-    get_circadian_recommendations,
-)
+# Re-exports are imported on first access so that importing one resilience
+# module does not load every framework (and its numeric dependencies).
+_LAZY_EXPORTS = {
+    "BlastRadiusManager": "app.resilience.blast_radius",
+    "BlastRadiusReport": "app.resilience.blast_radius",
+    "BorrowingPriority": "app.resilience.blast_radius",
+    "ContainmentLevel": "app.resilience.blast_radius",
+    "SchedulingZone": "app.resilience.blast_radius",
+    "ZoneHealthReport": "app.resilience.blast_radius",
+    "ZoneIncident": "app.resilience.blast_radius",
+    "ZoneStatus": "app.resilience.blast_radius",
+    "ZoneType": "app.resilience.blast_radius",
+    # Tier 3+: Cross-Disciplinary imports
+    "BurnoutEpidemiology": "app.resilience.burnout_epidemiology",
+    "BurnoutSIRModel": "app.resilience.burnout_epidemiology",
+    "BurnoutState": "app.resilience.burnout_epidemiology",
+    "EpiReport": "app.resilience.burnout_epidemiology",
+    "BurnoutCodeReport": "app.resilience.burnout_fire_index",
+    "BurnoutDangerRating": "app.resilience.burnout_fire_index",
+    "DangerClass": "app.resilience.burnout_fire_index",
+    "FireDangerReport": "app.resilience.burnout_fire_index",
+    "CatastropheAlert": "app.resilience.catastrophe_detector",
+    "CatastropheDetector": "app.resilience.catastrophe_detector",
+    "CatastropheRegion": "app.resilience.catastrophe_detector",
+    "CuspAnalysis": "app.resilience.catastrophe_detector",
+    "FailurePrediction": "app.resilience.catastrophe_detector",
+    "FeasibilitySurface": "app.resilience.catastrophe_detector",
+    "ParameterState": "app.resilience.catastrophe_detector",
+    "SystemState": "app.resilience.catastrophe_detector",
+    "CircuitBreaker": "app.resilience.circuit_breaker",
+    "CircuitBreakerConfig": "app.resilience.circuit_breaker",
+    "CircuitBreakerError": "app.resilience.circuit_breaker",
+    "CircuitBreakerMetrics": "app.resilience.circuit_breaker",
+    "CircuitBreakerRegistry": "app.resilience.circuit_breaker",
+    "CircuitBreakerTimeoutError": "app.resilience.circuit_breaker",
+    "CircuitMetrics": "app.resilience.circuit_breaker",
+    "CircuitOpenError": "app.resilience.circuit_breaker",
+    "CircuitState": "app.resilience.circuit_breaker",
+    "MetricsCollector": "app.resilience.circuit_breaker",
+    "StateMachine": "app.resilience.circuit_breaker",
+    "StateTransition": "app.resilience.circuit_breaker",
+    "async_circuit_breaker": "app.resilience.circuit_breaker",
+    "circuit_breaker": "app.resilience.circuit_breaker",
+    "collect_metrics_for_all_breakers": "app.resilience.circuit_breaker",
+    "get_breaker_from_function": "app.resilience.circuit_breaker",
+    "get_breaker_name_from_function": "app.resilience.circuit_breaker",
+    "get_circuit_breaker_metrics": "app.resilience.circuit_breaker:get_metrics",
+    "get_registry": "app.resilience.circuit_breaker",
+    "setup_circuit_breaker_metrics": "app.resilience.circuit_breaker:setup_metrics",
+    "setup_registry": "app.resilience.circuit_breaker",
+    "with_async_circuit_breaker": "app.resilience.circuit_breaker",
+    "with_circuit_breaker": "app.resilience.circuit_breaker",
+    # Tier 3 imports
+    "CognitiveLoadManager": "app.resilience.cognitive_load",
+    "CognitiveLoadReport": "app.resilience.cognitive_load",
+    "CognitiveSession": "app.resilience.cognitive_load",
+    "CognitiveState": "app.resilience.cognitive_load",
+    "Decision": "app.resilience.cognitive_load",
+    "DecisionCategory": "app.resilience.cognitive_load",
+    "DecisionComplexity": "app.resilience.cognitive_load",
+    "DecisionOutcome": "app.resilience.cognitive_load",
+    "DecisionQueueStatus": "app.resilience.cognitive_load",
+    "CascadeSimulation": "app.resilience.contingency",
+    "CentralityScore": "app.resilience.contingency",
+    "ContingencyAnalyzer": "app.resilience.contingency",
+    "VulnerabilityReport": "app.resilience.contingency",
+    "AssignmentEdit": "app.resilience.recovery_distance",
+    "N1Event": "app.resilience.recovery_distance",
+    "RecoveryDistanceCalculator": "app.resilience.recovery_distance",
+    "RecoveryDistanceMetrics": "app.resilience.recovery_distance",
+    "RecoveryResult": "app.resilience.recovery_distance",
+    "CreepAnalysis": "app.resilience.creep_fatigue",
+    "CreepFatigueModel": "app.resilience.creep_fatigue",
+    "CreepStage": "app.resilience.creep_fatigue",
+    "FatigueCurve": "app.resilience.creep_fatigue",
+    "DefenseInDepth": "app.resilience.defense_in_depth",
+    "DefenseLevel": "app.resilience.defense_in_depth",
+    "ErlangCCalculator": "app.resilience.erlang_coverage",
+    "ErlangMetrics": "app.resilience.erlang_coverage",
+    "SpecialistCoverage": "app.resilience.erlang_coverage",
+    # Tier 2 imports
+    "AllostasisMetrics": "app.resilience.homeostasis",
+    "AllostasisState": "app.resilience.homeostasis",
+    "CorrectiveAction": "app.resilience.homeostasis",
+    "DeviationSeverity": "app.resilience.homeostasis",
+    "FeedbackLoop": "app.resilience.homeostasis",
+    "HomeostasisMonitor": "app.resilience.homeostasis",
+    "HomeostasisStatus": "app.resilience.homeostasis",
+    "PositiveFeedbackRisk": "app.resilience.homeostasis",
+    "Setpoint": "app.resilience.homeostasis",
+    "CentralityService": "app.resilience.centrality",
+    "get_centrality_service": "app.resilience.centrality",
+    "CrossTrainingPriority": "app.resilience.hub_analysis",
+    "CrossTrainingRecommendation": "app.resilience.hub_analysis",
+    "FacultyCentrality": "app.resilience.hub_analysis",
+    "HubAnalyzer": "app.resilience.hub_analysis",
+    "HubDistributionReport": "app.resilience.hub_analysis",
+    "HubProfile": "app.resilience.hub_analysis",
+    "HubProtectionPlan": "app.resilience.hub_analysis",
+    "HubProtectionStatus": "app.resilience.hub_analysis",
+    "HubRiskLevel": "app.resilience.hub_analysis",
+    "CascadeAnalysis": "app.resilience.keystone_analysis",
+    "EntityType": "app.resilience.keystone_analysis",
+    "KeystoneAnalyzer": "app.resilience.keystone_analysis",
+    "KeystoneResource": "app.resilience.keystone_analysis",
+    "KeystoneRiskLevel": "app.resilience.keystone_analysis",
+    "SuccessionPlan": "app.resilience.keystone_analysis",
+    "SuccessionStatus": "app.resilience.keystone_analysis",
+    "CompensationResponse": "app.resilience.le_chatelier",
+    "CompensationType": "app.resilience.le_chatelier",
+    "EquilibriumReport": "app.resilience.le_chatelier",
+    "EquilibriumShift": "app.resilience.le_chatelier",
+    "EquilibriumState": "app.resilience.le_chatelier",
+    "LeChatelierAnalyzer": "app.resilience.le_chatelier",
+    "StressResponsePrediction": "app.resilience.le_chatelier",
+    "StressType": "app.resilience.le_chatelier",
+    "SystemStress": "app.resilience.le_chatelier",
+    "EscapeStrategy": "app.resilience.metastability_detector",
+    "MetastabilityAnalysis": "app.resilience.metastability_detector",
+    "MetastabilityDetector": "app.resilience.metastability_detector",
+    "MetastableState": "app.resilience.metastability_detector",
+    "SolverState": "app.resilience.metastability_detector",
+    "EnrichedSolverResult": "app.resilience.metastability_integration",
+    "MetastabilitySolutionCallback": "app.resilience.metastability_integration",
+    "MetastabilitySolverWrapper": "app.resilience.metastability_integration",
+    "apply_escape_strategy": "app.resilience.metastability_integration",
+    "check_metastability_during_solve": "app.resilience.metastability_integration",
+    "create_metastability_callback": "app.resilience.metastability_integration",
+    "ProcessCapabilityReport": "app.resilience.process_capability",
+    "ScheduleCapabilityAnalyzer": "app.resilience.process_capability",
+    "ActivityCategory": "app.resilience.sacrifice_hierarchy",
+    "LoadSheddingLevel": "app.resilience.sacrifice_hierarchy",
+    "SacrificeHierarchy": "app.resilience.sacrifice_hierarchy",
+    "BurnoutEarlyWarning": "app.resilience.seismic_detection",
+    "PrecursorSignal": "app.resilience.seismic_detection",
+    "SeismicAlert": "app.resilience.seismic_detection",
+    # Main service
+    "ResilienceConfig": "app.resilience.service",
+    "ResilienceService": "app.resilience.service",
+    "SPCAlert": "app.resilience.spc_monitoring",
+    "WorkloadControlChart": "app.resilience.spc_monitoring",
+    "calculate_control_limits": "app.resilience.spc_monitoring",
+    "calculate_process_capability": "app.resilience.spc_monitoring",
+    "FallbackScenario": "app.resilience.static_stability",
+    "FallbackScheduler": "app.resilience.static_stability",
+    "FallbackFarm": "app.resilience.fallback_farm",
+    "FallbackRepair": "app.resilience.fallback_farm",
+    "LiveSchedule": "app.resilience.fallback_farm",
+    "CollectivePreference": "app.resilience.stigmergy",
+    "PreferenceTrail": "app.resilience.stigmergy",
+    "SignalType": "app.resilience.stigmergy",
+    "StigmergicScheduler": "app.resilience.stigmergy",
+    "StigmergyStatus": "app.resilience.stigmergy",
+    "SwapNetwork": "app.resilience.stigmergy",
+    "TrailStrength": "app.resilience.stigmergy",
+    "TrailType": "app.resilience.stigmergy",
+    "UtilizationMonitor": "app.resilience.utilization",
+    "UtilizationThreshold": "app.resilience.utilization",
+    # Circadian Phase Response Curve
+    "CircadianImpact": "app.resilience.circadian_model",
+    "CircadianOscillator": "app.resilience.circadian_model",
+    "CircadianQualityLevel": "app.resilience.circadian_model",
+    "CircadianScheduleAnalyzer": "app.resilience.circadian_model",
+    "CircadianShiftType": "app.resilience.circadian_model",
+    "CircadianConstraintResult": "app.resilience.circadian_integration",
+    "CircadianObjective": "app.resilience.circadian_integration",
+    "CircadianScheduleOptimizer": "app.resilience.circadian_integration",
+    "classify_shift_type": "app.resilience.circadian_integration",
+    "compute_schedule_regularity": "app.resilience.circadian_integration",
+    "get_circadian_recommendations": "app.resilience.circadian_integration",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     # Circuit Breaker
@@ -294,6 +251,9 @@ __all__ = [
     # Tier 1: Static Stability
     "FallbackScheduler",
     "FallbackScenario",
+    "FallbackFarm",
+    "FallbackRepair",
+    "LiveSchedule",
     # Tier 1: Sacrifice Hierarchy
     "SacrificeHierarchy",
     "ActivityCategory",
@@ -353,6 +313,8 @@ __all__ = [
     "SwapNetwork",
     "StigmergyStatus",
     # Tier 3: Hub Analysis
+    "CentralityService",
+    "get_centrality_service",
     "HubAnalyzer",
     "FacultyCentrality",
     "HubProfile",
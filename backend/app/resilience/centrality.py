@@ -0,0 +1,488 @@
+"""
+Shared Centrality Service (Network Theory).
+
+Hub analysis, contingency analysis, keystone analysis, burnout contagion and
+the unified critical index all rank entities by graph centrality. Computing
+betweenness independently in each module repeats an O(V·E) pass per module,
+and per entity where a score is computed one entity at a time.
+
+This module computes each measure once per graph version:
+
+- A graph version is identified by ``graph_digest``, a hash of its node set,
+  edge set and edge weights, so two analyses that build the same graph share
+  results and a mutated graph gets fresh ones.
+- The graph is converted once to a SciPy sparse adjacency matrix. PageRank
+  and eigenvector centrality are sparse power iterations; degree comes from
+  the row counts; betweenness runs Brandes' algorithm over the CSR arrays.
+- Results are memoized per (digest, measure) in a small LRU.
+
+Values match NetworkX's defaults (normalized, unweighted betweenness and
+eigenvector; weighted PageRank with alpha=0.85).
+
+Approximate betweenness:
+    For large graphs, betweenness can be estimated from ``k`` uniformly
+    sampled source nodes (Brandes & Pich, 2007). Each sampled source
+    contributes a dependency in [0, 1] after normalization, so by Hoeffding's
+    inequality (which also holds when sampling without replacement) and a
+    union bound over all ``n`` nodes:
+
+        P(max_v |b̂(v) - b(v)| >= epsilon) <= 2n · exp(-2(k - 1)·epsilon²)
+
+    ``betweenness_sample_size(n, epsilon, delta)`` returns the smallest ``k``
+    for which this is at most ``delta``. The ``- 1`` accounts for sampled
+    nodes, whose estimate uses the other ``k - 1`` sources.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import random
+import threading
+from collections import OrderedDict, deque
+from typing import Any
+
+import numpy as np
+from scipy import sparse
+
+try:
+    import networkx as nx
+
+    HAS_NETWORKX = True
+except ImportError:
+    HAS_NETWORKX = False
+    nx = None
+
+logger = logging.getLogger(__name__)
+
+# Graphs with more nodes than this use sampled betweenness by default
+DEFAULT_APPROXIMATE_ABOVE = 5000
+DEFAULT_EPSILON = 0.05  # Max absolute error of normalized betweenness
+DEFAULT_DELTA = 0.1  # Probability the error bound is exceeded
+DEFAULT_MAX_GRAPHS = 32
+
+MEASURES = ("degree", "betweenness", "eigenvector", "pagerank")
+
+
+def graph_digest(graph: Any) -> str:
+    """
+    Hash a graph's structure to identify its version.
+
+    Args:
+        graph: NetworkX Graph or DiGraph
+
+    Returns:
+        Hex digest of directedness, nodes, edges and edge weights
+    """
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(b"directed" if graph.is_directed() else b"undirected")
+    for node in sorted(repr(node) for node in graph.nodes()):
+        hasher.update(node.encode())
+        hasher.update(b"\x00")
+    hasher.update(b"\x01")
+
+    if graph.is_directed():
+        edges = (
+            f"{u!r}\x00{v!r}\x00{data.get('weight', 1)!r}"
+            for u, v, data in graph.edges(data=True)
+        )
+    else:
+        edges = (
+            "\x00".join(sorted((repr(u), repr(v)))) + f"\x00{data.get('weight', 1)!r}"
+            for u, v, data in graph.edges(data=True)
+        )
+    for edge in sorted(edges):
+        hasher.update(edge.encode())
+        hasher.update(b"\x01")
+    return hasher.hexdigest()
+
+
+def betweenness_sample_size(
+    n: int, epsilon: float = DEFAULT_EPSILON, delta: float = DEFAULT_DELTA
+) -> int:
+    """
+    Number of sampled sources for approximate betweenness.
+
+    Args:
+        n: Number of nodes
+        epsilon: Maximum absolute error of any normalized betweenness value
+        delta: Allowed probability of exceeding ``epsilon``
+
+    Returns:
+        Sample size ``k`` (``n`` means exact computation)
+    """
+    if n <= 2:
+        return n
+    k = math.ceil(math.log(2 * n / delta) / (2 * epsilon**2)) + 1
+    return min(max(k, 2), n)
+
+
+class _SparseGraph:
+    """CSR adjacency of a NetworkX graph over a deterministic node order."""
+
+    def __init__(self, graph: Any) -> None:
+        self.directed = graph.is_directed()
+        self.nodes = sorted(graph.nodes(), key=repr)
+        self.n = len(self.nodes)
+        index = {node: i for i, node in enumerate(self.nodes)}
+
+        rows: list[int] = []
+        cols: list[int] = []
+        weights: list[float] = []
+        self_loops = np.zeros(self.n, dtype=np.int64)
+        for u, v, data in graph.edges(data=True):
+            i, j = index[u], index[v]
+            weight = float(data.get("weight", 1))
+            rows.append(i)
+            cols.append(j)
+            weights.append(weight)
+            if i == j:
+                self_loops[i] += 1
+            elif not self.directed:
+                rows.append(j)
+                cols.append(i)
+                weights.append(weight)
+
+        shape = (self.n, self.n)
+        self.weighted = sparse.csr_matrix(
+            (np.asarray(weights, dtype=float), (rows, cols)), shape=shape
+        )
+        self.adjacency = sparse.csr_matrix(
+            (np.ones(len(rows)), (rows, cols)), shape=shape
+        )
+        self.adjacency.data[:] = 1.0  # Collapse duplicate entries
+        self.self_loops = self_loops
+        self._neighbors: list[list[int]] | None = None
+
+    @property
+    def neighbors(self) -> list[list[int]]:
+        """Successor lists (neighbor lists when undirected)."""
+        if self._neighbors is None:
+            indptr, indices = self.adjacency.indptr, self.adjacency.indices
+            self._neighbors = [
+                indices[indptr[i] : indptr[i + 1]].tolist() for i in range(self.n)
+            ]
+        return self._neighbors
+
+    def to_dict(self, values: np.ndarray) -> dict[Any, float]:
+        return {node: float(value) for node, value in zip(self.nodes, values)}
+
+
+def _degree(g: _SparseGraph) -> dict[Any, float]:
+    if g.n <= 1:
+        return dict.fromkeys(g.nodes, 1.0)
+    counts = np.diff(g.adjacency.indptr).astype(float)
+    if g.directed:
+        counts += np.bincount(g.adjacency.indices, minlength=g.n)
+    else:
+        counts += g.self_loops  # A self-loop adds 2 to an undirected degree
+    return g.to_dict(counts / (g.n - 1))
+
+
+def _pagerank(
+    g: _SparseGraph, alpha: float = 0.85, max_iter: int = 100, tol: float = 1.0e-6
+) -> dict[Any, float]:
+    if g.n == 0:
+        return {}
+    out_weight = np.asarray(g.weighted.sum(axis=1)).ravel()
+    inverse = np.divide(
+        1.0, out_weight, out=np.zeros_like(out_weight), where=out_weight != 0
+    )
+    transition = sparse.diags(inverse) @ g.weighted
+    dangling = out_weight == 0
+    uniform = np.full(g.n, 1.0 / g.n)
+
+    x = uniform.copy()
+    for _ in range(max_iter):
+        last = x
+        x = alpha * (x @ transition + last[dangling].sum() * uniform) + (
+            1 - alpha
+        ) * uniform
+        if np.abs(x - last).sum() < g.n * tol:
+            return g.to_dict(x)
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _eigenvector(
+    g: _SparseGraph, max_iter: int = 1000, tol: float = 1.0e-6
+) -> dict[Any, float]:
+    if g.n == 0:
+        raise nx.NetworkXPointlessConcept(
+            "cannot compute centrality for the null graph"
+        )
+    # Iterate with (A + I) over in-edges, as NetworkX does
+    transposed = g.adjacency.T.tocsr()
+    x = np.full(g.n, 1.0 / g.n)
+    for _ in range(max_iter):
+        last = x
+        x = last + transposed @ last
+        norm = np.linalg.norm(x) or 1.0
+        x = x / norm
+        if np.abs(x - last).sum() < g.n * tol:
+            return g.to_dict(x)
+    raise nx.PowerIterationFailedConvergence(max_iter)
+
+
+def _betweenness(
+    g: _SparseGraph, k: int | None = None, seed: int = 0
+) -> dict[Any, float]:
+    n = g.n
+    neighbors = g.neighbors
+    if k is None or k >= n:
+        sources = range(n)
+        sampled = None
+    else:
+        sampled = random.Random(seed).sample(range(n), k)
+        sources = sampled
+
+    betweenness = [0.0] * n
+    for s in sources:
+        # Brandes single-source shortest paths (unweighted)
+        order: list[int] = []
+        predecessors: list[list[int]] = [[] for _ in range(n)]
+        sigma = [0] * n
+        sigma[s] = 1
+        distance = [-1] * n
+        distance[s] = 0
+        queue = deque([s])
+        while queue:
+            v = queue.popleft()
+            order.append(v)
+            next_distance = distance[v] + 1
+            sigma_v = sigma[v]
+            for w in neighbors[v]:
+                if distance[w] < 0:
+                    queue.append(w)
+                    distance[w] = next_distance
+                if distance[w] == next_distance:
+                    sigma[w] += sigma_v
+                    predecessors[w].append(v)
+
+        dependency = [0.0] * n
+        while order:
+            w = order.pop()
+            coefficient = (1.0 + dependency[w]) / sigma[w]
+            for v in predecessors[w]:
+                dependency[v] += sigma[v] * coefficient
+            if w != s:
+                betweenness[w] += dependency[w]
+
+    values = np.asarray(betweenness)
+    if n > 2:
+        if sampled is None:
+            values /= (n - 1) * (n - 2)
+        else:
+            scale = np.full(n, 1.0 / (k * (n - 2)))
+            scale[sampled] = 1.0 / ((k - 1) * (n - 2))
+            values *= scale
+    return g.to_dict(values)
+
+
+class CentralityService:
+    """
+    Memoized centrality measures keyed by graph digest.
+
+    Thread-safe; concurrent requests for the same uncached measure may both
+    compute it, and the last result wins.
+    """
+
+    def __init__(
+        self,
+        max_graphs: int = DEFAULT_MAX_GRAPHS,
+        approximate_above: int | None = DEFAULT_APPROXIMATE_ABOVE,
+        epsilon: float = DEFAULT_EPSILON,
+        delta: float = DEFAULT_DELTA,
+        seed: int = 0,
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            max_graphs: Number of graph versions to keep results for
+            approximate_above: Node count above which betweenness is sampled
+                by default (None to always compute it exactly)
+            epsilon: Error bound for default sampled betweenness
+            delta: Failure probability for default sampled betweenness
+            seed: Seed for choosing sampled sources
+        """
+        if not HAS_NETWORKX:
+            raise ImportError(
+                "NetworkX is required for centrality analysis. "
+                "Install with: pip install networkx"
+            )
+        self.max_graphs = max_graphs
+        self.approximate_above = approximate_above
+        self.epsilon = epsilon
+        self.delta = delta
+        self.seed = seed
+
+        self._graphs: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.computations: dict[str, int] = dict.fromkeys(MEASURES, 0)
+
+    def _entry(self, graph: Any) -> dict[str, Any]:
+        digest = graph_digest(graph)
+        with self._lock:
+            entry = self._graphs.get(digest)
+            if entry is not None:
+                self._graphs.move_to_end(digest)
+                return entry
+        entry = {"digest": digest, "sparse": _SparseGraph(graph), "results": {}}
+        with self._lock:
+            entry = self._graphs.setdefault(digest, entry)
+            self._graphs.move_to_end(digest)
+            while len(self._graphs) > self.max_graphs:
+                self._graphs.popitem(last=False)
+        return entry
+
+    def _get(self, graph: Any, key: tuple, compute) -> dict[Any, float]:
+        entry = self._entry(graph)
+        results = entry["results"]
+        with self._lock:
+            cached = results.get(key)
+            if cached is not None:
+                self.hits += 1
+                return dict(cached)
+        values = compute(entry["sparse"])
+        with self._lock:
+            results[key] = values
+            self.computations[key[0]] += 1
+        return dict(values)
+
+    def degree(self, graph: Any) -> dict[Any, float]:
+        """
+        Degree centrality (in + out degree for directed graphs).
+
+        Args:
+            graph: NetworkX graph
+
+        Returns:
+            Dict of node -> centrality
+        """
+        return self._get(graph, ("degree",), _degree)
+
+    def pagerank(self, graph: Any, alpha: float = 0.85) -> dict[Any, float]:
+        """
+        PageRank using the ``weight`` edge attribute.
+
+        Args:
+            graph: NetworkX graph
+            alpha: Damping factor
+
+        Returns:
+            Dict of node -> PageRank
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: If it does not converge
+        """
+        return self._get(
+            graph, ("pagerank", alpha), lambda g: _pagerank(g, alpha=alpha)
+        )
+
+    def eigenvector(self, graph: Any) -> dict[Any, float]:
+        """
+        Eigenvector centrality (unweighted, in-edges for directed graphs).
+
+        Args:
+            graph: NetworkX graph
+
+        Returns:
+            Dict of node -> centrality
+
+        Raises:
+            networkx.PowerIterationFailedConvergence: If it does not converge
+        """
+        return self._get(graph, ("eigenvector",), _eigenvector)
+
+    def betweenness(self, graph: Any, k: int | None = None) -> dict[Any, float]:
+        """
+        Normalized betweenness centrality.
+
+        Exact unless ``k`` is given or the graph has more than
+        ``approximate_above`` nodes, in which case ``k`` defaults to
+        ``betweenness_sample_size(n, epsilon, delta)``.
+
+        Args:
+            graph: NetworkX graph
+            k: Number of sampled sources (None for the default)
+
+        Returns:
+            Dict of node -> centrality
+        """
+        n = graph.number_of_nodes()
+        if (
+            k is None
+            and self.approximate_above is not None
+            and n > self.approximate_above
+        ):
+            k = betweenness_sample_size(n, self.epsilon, self.delta)
+        if k is not None:
+            k = max(k, 2)
+            if k >= n:
+                k = None
+        return self._get(
+            graph,
+            ("betweenness", k),
+            lambda g: _betweenness(g, k=k, seed=self.seed),
+        )
+
+    def measures(self, graph: Any) -> dict[str, dict[Any, float]]:
+        """
+        All four measures, with zeros for eigenvector if it does not converge.
+
+        Args:
+            graph: NetworkX graph
+
+        Returns:
+            Dict of measure name -> (node -> value)
+        """
+        try:
+            eigenvector = self.eigenvector(graph)
+        except nx.NetworkXException:
+            eigenvector = dict.fromkeys(graph.nodes(), 0.0)
+        return {
+            "degree": self.degree(graph),
+            "betweenness": self.betweenness(graph),
+            "eigenvector": eigenvector,
+            "pagerank": self.pagerank(graph),
+        }
+
+    def clear(self) -> None:
+        """Drop all memoized results."""
+        with self._lock:
+            self._graphs.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with cached graph count, hits and per-measure computations
+        """
+        with self._lock:
+            return {
+                "graphs": len(self._graphs),
+                "hits": self.hits,
+                "computations": dict(self.computations),
+            }
+
+
+_centrality_service: CentralityService | None = None
+_centrality_service_lock = threading.Lock()
+
+
+def get_centrality_service() -> CentralityService:
+    """
+    Get the process-wide centrality service.
+
+    Returns:
+        Shared CentralityService
+    """
+    global _centrality_service
+    if _centrality_service is None:
+        with _centrality_service_lock:
+            if _centrality_service is None:
+                _centrality_service = CentralityService()
+    return _centrality_service
@@ -35,6 +35,8 @@ from uuid import UUID, uuid4
 
 import networkx as nx
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 # Try to import ndlib for diffusion modeling
@@ -717,18 +719,19 @@ class BurnoutContagionModel:
         logger.info("Calculating network centrality measures...")
 
         # Calculate different centrality measures
+        centrality_service = get_centrality_service()
         try:
-            degree_cent = nx.degree_centrality(self.social_graph)
+            degree_cent = centrality_service.degree(self.social_graph)
         except Exception:
             degree_cent = {}
 
         try:
-            between_cent = nx.betweenness_centrality(self.social_graph)
+            between_cent = centrality_service.betweenness(self.social_graph)
         except Exception:
             between_cent = {}
 
         try:
-            eigen_cent = nx.eigenvector_centrality(self.social_graph, max_iter=1000)
+            eigen_cent = centrality_service.eigenvector(self.social_graph)
         except Exception:
             eigen_cent = {}
 
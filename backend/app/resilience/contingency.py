@@ -39,6 +39,8 @@ except ImportError:
     NETWORKX_AVAILABLE = False
     nx = None
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -574,15 +576,11 @@ class ContingencyAnalyzer:
 
             # Calculate NetworkX centrality metrics
         try:
-            betweenness = nx.betweenness_centrality(G)
-            degree = nx.degree_centrality(G)
-            pagerank = nx.pagerank(G, alpha=0.85)
-
-            # Eigenvector can fail on disconnected graphs
-            try:
-                eigenvector = nx.eigenvector_centrality(G, max_iter=1000)
-            except nx.PowerIterationFailedConvergence:
-                eigenvector = dict.fromkeys(G.nodes(), 0.0)
+            measures = get_centrality_service().measures(G)
+            betweenness = measures["betweenness"]
+            degree = measures["degree"]
+            pagerank = measures["pagerank"]
+            eigenvector = measures["eigenvector"]
         except Exception as e:
             logger.error(f"NetworkX centrality calculation failed: {e}")
             return self.calculate_centrality(faculty, assignments, services)
@@ -0,0 +1,622 @@
+"""
+Fallback Farm: Pre-solved Repairs for Faculty Loss.
+
+Static stability needs a real schedule behind every fallback. During
+off-hours the farm solves one repaired schedule per faculty member (N-1),
+plus any configured multi-person loss sets, in worker processes.
+
+Each repair is a small CP-SAT model over the lost people's assignments
+only. Every other assignment stays locked (a substitute must be free in
+the block), and the solve is hinted with a greedy repair, so it finishes
+in well under a second.
+
+Repairs are stored as deltas (assignment -> substitute) against the live
+schedule. Activating a fallback after a real absence is a lookup, limited
+to the absence dates, followed by a per-move check against the current
+schedule: a move is applied only if its assignment still belongs to the
+lost person and its substitute is still free.
+
+Usage:
+    schedule = LiveSchedule.from_db(db, start_date, end_date)
+    farm = FallbackFarm(workers=4)
+    repairs = farm.precompute(
+        schedule, single_loss_sets(schedule) + [(dr_x_id, dr_y_id)]
+    )
+    save_repairs(schedule.fingerprint, repairs, start_date, end_date)
+
+    # Later, in any process, when Dr. X calls in sick
+    stored = load_repairs()
+    repair = lookup_repair(
+        stored.repairs, [dr_x_id], current_schedule, absence_start, absence_end
+    )
+    if repair:
+        apply_repair(db, repair, absence_start, absence_end)
+        db.commit()
+
+``FallbackScheduler.activate_for_absence`` does the lookup, loading the
+stored repairs on first use, and the ``/resilience/fallbacks/activate``
+route applies the result when given the absent faculty and dates.
+"""
+
+import hashlib
+import json
+import logging
+import time
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from datetime import UTC, date, datetime
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.orm import Session, contains_eager
+
+logger = logging.getLogger(__name__)
+
+# Per-repair CP-SAT time limit (each repair only touches one person's slots)
+REPAIR_TIME_LIMIT_SECONDS = 5.0
+
+# Redis key and TTL for stored repairs (task runs weekly)
+REPAIR_STORE_KEY = "resilience:fallback:repairs"
+REPAIR_STORE_TTL_SECONDS = 8 * 86400
+
+LossKey = tuple[UUID, ...]
+
+
+def loss_key(faculty_ids: Iterable[UUID]) -> LossKey:
+    """Order-independent key for a set of lost faculty."""
+    return tuple(sorted(set(faculty_ids), key=str))
+
+
+@dataclass(frozen=True)
+class ScheduleSlot:
+    """One faculty assignment in the live schedule."""
+
+    assignment_id: UUID
+    block_id: UUID
+    person_id: UUID
+
+
+@dataclass
+class LiveSchedule:
+    """
+    Picklable snapshot of the live faculty schedule.
+
+    Attributes:
+        faculty_ids: Faculty who can act as substitutes
+        slots: Faculty assignments in the period
+        unavailable: (person_id, block_id) pairs blocked by absences
+        block_dates: Date of each block in the period
+        fingerprint: Hash of the slots, identifying the snapshot a repair
+            was solved against
+    """
+
+    faculty_ids: list[UUID]
+    slots: list[ScheduleSlot]
+    unavailable: set[tuple[UUID, UUID]] = field(default_factory=set)
+    block_dates: dict[UUID, date] = field(default_factory=dict)
+    fingerprint: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        digest = hashlib.sha256()
+        for slot in sorted(self.slots, key=lambda s: str(s.assignment_id)):
+            digest.update(
+                f"{slot.assignment_id}:{slot.block_id}:{slot.person_id};".encode()
+            )
+        self.fingerprint = digest.hexdigest()[:16]
+
+    @classmethod
+    def from_db(cls, db: Session, start_date: date, end_date: date) -> "LiveSchedule":
+        """Load faculty assignments and absences for a period."""
+        from app.models.absence import Absence
+        from app.models.assignment import Assignment
+        from app.models.block import Block
+        from app.models.person import Person
+
+        faculty_ids = [
+            row.id for row in db.query(Person.id).filter(Person.type == "faculty")
+        ]
+        blocks = (
+            db.query(Block.id, Block.date)
+            .filter(Block.date >= start_date, Block.date <= end_date)
+            .all()
+        )
+        block_ids_by_date: dict[date, list[UUID]] = defaultdict(list)
+        for block in blocks:
+            block_ids_by_date[block.date].append(block.id)
+
+        slots = []
+        if blocks and faculty_ids:
+            rows = db.query(
+                Assignment.id, Assignment.block_id, Assignment.person_id
+            ).filter(
+                Assignment.block_id.in_([b.id for b in blocks]),
+                Assignment.person_id.in_(faculty_ids),
+            )
+            slots = [ScheduleSlot(r.id, r.block_id, r.person_id) for r in rows]
+
+        unavailable: set[tuple[UUID, UUID]] = set()
+        absences = db.query(
+            Absence.person_id, Absence.start_date, Absence.end_date
+        ).filter(Absence.start_date <= end_date, Absence.end_date >= start_date)
+        for absence in absences:
+            for day, block_ids in block_ids_by_date.items():
+                if absence.start_date <= day <= absence.end_date:
+                    unavailable.update((absence.person_id, b) for b in block_ids)
+
+        return cls(
+            faculty_ids=faculty_ids,
+            slots=slots,
+            unavailable=unavailable,
+            block_dates={block.id: block.date for block in blocks},
+        )
+
+
+def single_loss_sets(schedule: LiveSchedule) -> list[LossKey]:
+    """One loss set per faculty member with assignments (N-1)."""
+    assigned = {s.person_id for s in schedule.slots}
+    return [(f,) for f in schedule.faculty_ids if f in assigned]
+
+
+@dataclass(frozen=True)
+class Reassignment:
+    """Delta for one slot of a lost faculty member."""
+
+    assignment_id: UUID
+    block_id: UUID
+    from_person_id: UUID
+    to_person_id: UUID | None  # None: nobody could take the slot
+
+
+@dataclass
+class FallbackRepair:
+    """Repaired schedule for one loss set, as deltas against the live schedule."""
+
+    lost_faculty: LossKey
+    base_fingerprint: str
+    reassignments: list[Reassignment] = field(default_factory=list)
+    status: str = "empty"
+    solve_seconds: float = 0.0
+
+    @property
+    def uncovered(self) -> list[Reassignment]:
+        return [r for r in self.reassignments if r.to_person_id is None]
+
+    @property
+    def coverage_rate(self) -> float:
+        if not self.reassignments:
+            return 1.0
+        covered = len(self.reassignments) - len(self.uncovered)
+        return covered / len(self.reassignments)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compact JSON-serializable form."""
+        return {
+            "lost": [str(pid) for pid in self.lost_faculty],
+            "fingerprint": self.base_fingerprint,
+            "status": self.status,
+            "seconds": round(self.solve_seconds, 4),
+            "moves": [
+                [
+                    str(r.assignment_id),
+                    str(r.block_id),
+                    str(r.from_person_id),
+                    str(r.to_person_id) if r.to_person_id else None,
+                ]
+                for r in self.reassignments
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "FallbackRepair":
+        return cls(
+            lost_faculty=tuple(UUID(pid) for pid in data["lost"]),
+            base_fingerprint=data["fingerprint"],
+            status=data["status"],
+            solve_seconds=data["seconds"],
+            reassignments=[
+                Reassignment(
+                    assignment_id=UUID(assignment_id),
+                    block_id=UUID(block_id),
+                    from_person_id=UUID(from_id),
+                    to_person_id=UUID(to_id) if to_id else None,
+                )
+                for assignment_id, block_id, from_id, to_id in data["moves"]
+            ],
+        )
+
+
+def solve_repair(
+    schedule: LiveSchedule,
+    lost: Sequence[UUID],
+    time_limit_seconds: float = REPAIR_TIME_LIMIT_SECONDS,
+) -> FallbackRepair:
+    """
+    Reassign the lost faculty's slots with everything else locked.
+
+    Maximizes covered slots, then minimizes the largest number of extra
+    slots any substitute takes. The greedy repair is used as the solver
+    hint and as the answer if CP-SAT finds nothing better in time.
+
+    Args:
+        schedule: Live schedule snapshot
+        lost: Faculty to remove
+        time_limit_seconds: CP-SAT time limit
+
+    Returns:
+        FallbackRepair with one Reassignment per lost slot
+    """
+    from ortools.sat.python import cp_model
+
+    started = time.perf_counter()
+    key = loss_key(lost)
+    lost_set = set(key)
+    affected = [s for s in schedule.slots if s.person_id in lost_set]
+    repair = FallbackRepair(lost_faculty=key, base_fingerprint=schedule.fingerprint)
+    if not affected:
+        return repair
+
+    busy = {(s.person_id, s.block_id) for s in schedule.slots}
+    load = Counter(s.person_id for s in schedule.slots)
+    pool = [f for f in schedule.faculty_ids if f not in lost_set]
+    candidates = [
+        [
+            f
+            for f in pool
+            if (f, slot.block_id) not in busy
+            and (f, slot.block_id) not in schedule.unavailable
+        ]
+        for slot in affected
+    ]
+
+    choice = _greedy_repair(affected, candidates, load)
+    repair.status = "greedy"
+
+    if any(candidates):
+        model = cp_model.CpModel()
+        x = {
+            (i, f): model.NewBoolVar(f"x_{i}_{f}")
+            for i, options in enumerate(candidates)
+            for f in options
+        }
+        by_person_block: dict[tuple[UUID, UUID], list] = defaultdict(list)
+        by_person: dict[UUID, list] = defaultdict(list)
+        for (i, f), var in x.items():
+            by_person_block[(f, affected[i].block_id)].append(var)
+            by_person[f].append(var)
+        for i, options in enumerate(candidates):
+            if options:
+                model.Add(sum(x[i, f] for f in options) <= 1)
+        for variables in by_person_block.values():
+            if len(variables) > 1:
+                model.Add(sum(variables) <= 1)
+        max_extra = model.NewIntVar(0, len(affected), "max_extra")
+        for variables in by_person.values():
+            model.Add(sum(variables) <= max_extra)
+
+        # Coverage dominates balance: one more covered slot outweighs any
+        # change in the largest extra load
+        model.Maximize((len(affected) + 1) * sum(x.values()) - max_extra)
+        for (i, f), var in x.items():
+            model.AddHint(var, 1 if choice[i] == f else 0)
+
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = time_limit_seconds
+        solver.parameters.num_workers = 1  # Parallelism is across repairs
+        status = solver.Solve(model)
+        if status in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            choice = [
+                next((f for f in options if solver.Value(x[i, f])), None)
+                for i, options in enumerate(candidates)
+            ]
+            repair.status = "optimal" if status == cp_model.OPTIMAL else "feasible"
+
+    repair.reassignments = [
+        Reassignment(slot.assignment_id, slot.block_id, slot.person_id, substitute)
+        for slot, substitute in zip(affected, choice)
+    ]
+    repair.solve_seconds = time.perf_counter() - started
+    return repair
+
+
+def _greedy_repair(
+    affected: list[ScheduleSlot],
+    candidates: list[list[UUID]],
+    load: Counter,
+) -> list[UUID | None]:
+    """Most-constrained slot first, least-loaded free substitute."""
+    extra: Counter = Counter()
+    taken: set[tuple[UUID, UUID]] = set()
+    choice: list[UUID | None] = [None] * len(affected)
+    for i in sorted(range(len(affected)), key=lambda i: len(candidates[i])):
+        block_id = affected[i].block_id
+        options = [f for f in candidates[i] if (f, block_id) not in taken]
+        if options:
+            best = min(options, key=lambda f: (extra[f], load[f]))
+            choice[i] = best
+            extra[best] += 1
+            taken.add((best, block_id))
+    return choice
+
+
+# Worker-process state: the schedule is sent once per worker, not per repair
+_worker_schedule: LiveSchedule | None = None
+_worker_time_limit = REPAIR_TIME_LIMIT_SECONDS
+
+
+def _init_worker(schedule: LiveSchedule, time_limit_seconds: float) -> None:
+    global _worker_schedule, _worker_time_limit
+    _worker_schedule = schedule
+    _worker_time_limit = time_limit_seconds
+
+
+def _solve_in_worker(lost: LossKey) -> FallbackRepair:
+    if _worker_schedule is None:
+        raise RuntimeError("Fallback worker was not initialized")
+    return solve_repair(_worker_schedule, lost, _worker_time_limit)
+
+
+class FallbackFarm:
+    """
+    Solves fallback repairs for many loss sets in parallel.
+
+    Args:
+        workers: Worker processes (1 solves in-process)
+        time_limit_seconds: CP-SAT time limit per repair
+    """
+
+    def __init__(
+        self,
+        workers: int = 1,
+        time_limit_seconds: float = REPAIR_TIME_LIMIT_SECONDS,
+    ) -> None:
+        self.workers = max(1, workers)
+        self.time_limit_seconds = time_limit_seconds
+
+    def precompute(
+        self,
+        schedule: LiveSchedule,
+        loss_sets: Iterable[Sequence[UUID]] | None = None,
+    ) -> dict[LossKey, FallbackRepair]:
+        """
+        Solve one repair per loss set.
+
+        Args:
+            schedule: Live schedule snapshot
+            loss_sets: Faculty to remove together; defaults to every faculty
+                member with assignments on their own (N-1)
+
+        Returns:
+            Repairs keyed by ``loss_key``
+        """
+        if loss_sets is None:
+            loss_sets = single_loss_sets(schedule)
+        keys = list(dict.fromkeys(loss_key(lost) for lost in loss_sets))
+
+        started = time.perf_counter()
+        if self.workers == 1 or len(keys) < 2:
+            repairs = [
+                solve_repair(schedule, key, self.time_limit_seconds) for key in keys
+            ]
+        else:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(keys)),
+                initializer=_init_worker,
+                initargs=(schedule, self.time_limit_seconds),
+            ) as pool:
+                chunksize = max(1, len(keys) // (4 * self.workers))
+                repairs = list(pool.map(_solve_in_worker, keys, chunksize=chunksize))
+
+        uncovered = sum(len(r.uncovered) for r in repairs)
+        logger.info(
+            f"Precomputed {len(repairs)} fallback repairs in "
+            f"{time.perf_counter() - started:.1f}s with {self.workers} workers "
+            f"({uncovered} slots left uncovered)"
+        )
+        return {repair.lost_faculty: repair for repair in repairs}
+
+
+def lookup_repair(
+    repairs: dict[LossKey, FallbackRepair],
+    lost: Iterable[UUID],
+    schedule: LiveSchedule,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> FallbackRepair | None:
+    """
+    Find a stored repair and check it against the current schedule.
+
+    Only moves for blocks between start_date and end_date are kept. Each
+    move is checked on its own, so changes elsewhere in the schedule do
+    not invalidate the repair. A move whose assignment no longer belongs
+    to the lost person is dropped. A move whose substitute is now absent
+    or busy in that block becomes uncovered.
+
+    Returns:
+        The repair limited to the window, or None if there is none
+    """
+    repair = repairs.get(loss_key(lost))
+    if repair is None:
+        return None
+
+    owners = {slot.assignment_id: slot.person_id for slot in schedule.slots}
+    busy = {(slot.person_id, slot.block_id) for slot in schedule.slots}
+    moves = []
+    moved = conflicts = 0
+    for move in repair.reassignments:
+        day = schedule.block_dates.get(move.block_id)
+        if not _in_window(day, start_date, end_date):
+            continue
+        if owners.get(move.assignment_id) != move.from_person_id:
+            moved += 1
+            continue
+        substitute = (move.to_person_id, move.block_id)
+        if move.to_person_id and (
+            substitute in schedule.unavailable or substitute in busy
+        ):
+            move = replace(move, to_person_id=None)
+            conflicts += 1
+        moves.append(move)
+
+    if moved or conflicts:
+        logger.warning(
+            f"Fallback repair partly stale: {moved} assignments changed hands, "
+            f"{conflicts} substitutes no longer free"
+        )
+    return replace(repair, reassignments=moves)
+
+
+def apply_repair(
+    db: Session,
+    repair: FallbackRepair,
+    start_date: date | None = None,
+    end_date: date | None = None,
+) -> int:
+    """
+    Apply a repair's reassignments for blocks in a date window.
+
+    Each move is re-checked against the database before it is applied:
+    the assignment must still belong to the lost person and the substitute
+    must have no assignment or absence in that block. Changes go through
+    the ORM, so they are versioned, and are flushed but not committed.
+
+    Uncovered and skipped slots are left as they are for manual follow-up.
+
+    Returns:
+        Number of assignments reassigned
+    """
+    from app.models.absence import Absence
+    from app.models.assignment import Assignment
+    from app.models.block import Block
+
+    moves = {
+        r.assignment_id: r for r in repair.reassignments if r.to_person_id is not None
+    }
+    if not moves:
+        return 0
+
+    query = (
+        db.query(Assignment)
+        .join(Assignment.block)
+        .options(contains_eager(Assignment.block))
+        .filter(Assignment.id.in_(list(moves)))
+    )
+    if start_date is not None:
+        query = query.filter(Block.date >= start_date)
+    if end_date is not None:
+        query = query.filter(Block.date <= end_date)
+    assignments = query.all()
+    if not assignments:
+        return 0
+
+    substitutes = {moves[a.id].to_person_id for a in assignments}
+    busy = set(
+        db.query(Assignment.person_id, Assignment.block_id).filter(
+            Assignment.person_id.in_(substitutes),
+            Assignment.block_id.in_({a.block_id for a in assignments}),
+        )
+    )
+    days = [a.block.date for a in assignments]
+    absences = db.query(
+        Absence.person_id, Absence.start_date, Absence.end_date
+    ).filter(
+        Absence.person_id.in_(substitutes),
+        Absence.start_date <= max(days),
+        Absence.end_date >= min(days),
+    )
+    absent = defaultdict(list)
+    for absence in absences:
+        absent[absence.person_id].append((absence.start_date, absence.end_date))
+
+    applied = skipped = 0
+    for assignment in assignments:
+        move = moves[assignment.id]
+        day = assignment.block.date
+        if (
+            assignment.person_id != move.from_person_id
+            or (move.to_person_id, assignment.block_id) in busy
+            or any(start <= day <= end for start, end in absent[move.to_person_id])
+        ):
+            skipped += 1
+            continue
+        assignment.person_id = move.to_person_id
+        busy.add((move.to_person_id, assignment.block_id))
+        applied += 1
+    db.flush()
+
+    logger.info(
+        f"Applied fallback repair: {applied} reassigned, {skipped} skipped as "
+        f"stale, {len(repair.uncovered)} uncovered"
+    )
+    return applied
+
+
+def _in_window(
+    day: date | None, start_date: date | None, end_date: date | None
+) -> bool:
+    if start_date is None and end_date is None:
+        return True
+    if day is None:
+        return False
+    return (start_date is None or day >= start_date) and (
+        end_date is None or day <= end_date
+    )
+
+
+@dataclass
+class StoredRepairs:
+    """Repairs as saved by the precompute task, with the period they cover."""
+
+    fingerprint: str
+    start_date: date
+    end_date: date
+    repairs: dict[LossKey, FallbackRepair]
+
+
+def save_repairs(
+    fingerprint: str,
+    repairs: dict[LossKey, FallbackRepair],
+    start_date: date,
+    end_date: date,
+    redis_client: Any | None = None,
+) -> None:
+    """Store repairs in Redis for activation from any process."""
+    client = redis_client or _get_redis_client()
+    payload = {
+        "fingerprint": fingerprint,
+        "created_at": datetime.now(UTC).isoformat(),
+        "start_date": start_date.isoformat(),
+        "end_date": end_date.isoformat(),
+        "repairs": [repair.to_dict() for repair in repairs.values()],
+    }
+    client.setex(REPAIR_STORE_KEY, REPAIR_STORE_TTL_SECONDS, json.dumps(payload))
+
+
+def load_repairs(redis_client: Any | None = None) -> StoredRepairs | None:
+    """Load stored repairs (None if none or unreadable)."""
+    try:
+        client = redis_client or _get_redis_client()
+        raw = client.get(REPAIR_STORE_KEY)
+        if not raw:
+            return None
+        payload = json.loads(raw)
+        repairs = (FallbackRepair.from_dict(d) for d in payload["repairs"])
+        return StoredRepairs(
+            fingerprint=payload["fingerprint"],
+            start_date=date.fromisoformat(payload["start_date"]),
+            end_date=date.fromisoformat(payload["end_date"]),
+            repairs={repair.lost_faculty: repair for repair in repairs},
+        )
+    except Exception as e:
+        logger.error(f"Failed to load fallback repairs: {e}")
+        return None
+
+
+def _get_redis_client() -> Any:
+    from redis import Redis
+
+    from app.core.config import get_settings
+
+    settings = get_settings()
+    return Redis.from_url(settings.redis_url_with_password, decode_responses=True)
@@ -232,6 +232,17 @@ class FRMSService:
             # Get work history
         work_data = await self._get_work_history(resident_id, target_time)
 
+        return self._build_profile(resident, work_data, target_time)
+
+    def _build_profile(
+        self,
+        resident: Person,
+        work_data: dict,
+        target_time: datetime,
+    ) -> FatigueProfile:
+        """Build a fatigue profile from already-loaded work history."""
+        resident_id = resident.id
+
         # Calculate fatigue metrics
         hours_awake = self._estimate_hours_awake(work_data, target_time)
         sleep_debt = self._estimate_sleep_debt(work_data)
@@ -312,7 +323,8 @@ class FRMSService:
 
         for resident in residents:
             try:
-                profile = await self.get_resident_profile(resident.id, target_time)
+                work_data = await self._get_work_history(resident.id, target_time)
+                profile = self._build_profile(resident, work_data, target_time)
                 if profile.hazard_level.value >= hazard_threshold.value:
                     profiles.append(profile)
             except Exception as e:
@@ -433,6 +445,7 @@ class FRMSService:
             "hours": list(range(24)),
         }
 
+        day_start = datetime.combine(target_date, datetime.min.time())
         for resident in residents:
             resident_data = {
                 "resident_id": str(resident.id),
@@ -441,12 +454,25 @@ class FRMSService:
                 "hourly_alertness": [],
             }
 
+            # Work history is keyed by date, so one lookup serves all 24 hours
+            work_data: dict | None
+            try:
+                work_data = await self._get_work_history(resident.id, day_start)
+            except Exception as e:
+                logger.error(f"Error loading work history for {resident.id}: {e}")
+                work_data = None
+
             for hour in range(24):
-                target_time = datetime.combine(target_date, datetime.min.time())
-                target_time = target_time.replace(hour=hour)
+                target_time = day_start.replace(hour=hour)
+
+                profile = None
+                if work_data is not None:
+                    try:
+                        profile = self._build_profile(resident, work_data, target_time)
+                    except Exception:
+                        profile = None
 
-                try:
-                    profile = await self.get_resident_profile(resident.id, target_time)
+                if profile is not None:
                     resident_data["hourly_alertness"].append(
                         {
                             "hour": hour,
@@ -454,7 +480,7 @@ class FRMSService:
                             "hazard_level": profile.hazard_level.value,
                         }
                     )
-                except Exception:
+                else:
                     resident_data["hourly_alertness"].append(
                         {
                             "hour": hour,
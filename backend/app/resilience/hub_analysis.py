@@ -29,6 +29,8 @@ from datetime import date, datetime
 from enum import Enum
 from uuid import UUID, uuid4
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 # Try to import NetworkX for advanced analysis
@@ -325,23 +327,24 @@ class HubAnalyzer:
             assignment_counts[key] = assignment_counts.get(key, 0) + 1
 
             # Calculate centrality measures
+        centrality_service = get_centrality_service()
         try:
-            degree_cent = nx.degree_centrality(G)
+            degree_cent = centrality_service.degree(G)
         except Exception:
             degree_cent = {}
 
         try:
-            betweenness_cent = nx.betweenness_centrality(G)
+            betweenness_cent = centrality_service.betweenness(G)
         except Exception:
             betweenness_cent = {}
 
         try:
-            eigenvector_cent = nx.eigenvector_centrality(G, max_iter=1000)
+            eigenvector_cent = centrality_service.eigenvector(G)
         except Exception:
             eigenvector_cent = {}
 
         try:
-            pagerank_cent = nx.pagerank(G)
+            pagerank_cent = centrality_service.pagerank(G)
         except Exception:
             pagerank_cent = {}
 
@@ -38,6 +38,8 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 # Try to import NetworkX for graph analysis
@@ -411,9 +413,12 @@ class KeystoneAnalyzer:
         out_degree = graph.out_degree(entity_id)  # What depends on this
         in_degree = graph.in_degree(entity_id)  # What this depends on
 
-        # Betweenness centrality: how often on critical paths
+        # Betweenness centrality: how often on critical paths (computed once
+        # per graph version, not once per scored entity)
         try:
-            betweenness = nx.betweenness_centrality(graph).get(entity_id, 0.0)
+            betweenness = (
+                get_centrality_service().betweenness(graph).get(entity_id, 0.0)
+            )
         except Exception:
             betweenness = 0.0
 
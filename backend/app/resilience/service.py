@@ -84,6 +84,11 @@ from app.resilience.homeostasis import (
     HomeostasisMonitor,
     HomeostasisStatus,
 )
+from app.resilience.fallback_farm import (
+    FallbackRepair,
+    LiveSchedule,
+    apply_repair,
+)
 from app.resilience.hub_analysis import (
     CrossTrainingRecommendation,
     FacultyCentrality,
@@ -600,6 +605,52 @@ class ResilienceService:
 
         return fallback
 
+    def activate_fallback_for_absence(
+        self,
+        faculty_ids: list[UUID],
+        start_date: date,
+        end_date: date,
+        approved_by: str | None = None,
+    ) -> tuple[FallbackRepair, int] | None:
+        """
+        Activate and apply the pre-solved repair for a faculty absence.
+
+        Looks up the stored repair for exactly these faculty, checks it
+        against the current schedule and reassigns their slots between
+        start_date and end_date. Changes are flushed, not committed.
+
+        Args:
+            faculty_ids: Faculty who are now unavailable
+            start_date: First day of the absence
+            end_date: Last day of the absence
+            approved_by: Who approved the activation
+
+        Returns:
+            (repair, number of assignments reassigned), or None if no repair
+            was precomputed for these faculty
+        """
+        if self.db is None:
+            raise ValueError("Activating a repair needs a database session")
+
+        schedule = LiveSchedule.from_db(self.db, start_date, end_date)
+        repair = self.fallback.activate_for_absence(
+            faculty_ids, schedule, start_date, end_date
+        )
+        if repair is None:
+            return None
+
+        applied = apply_repair(self.db, repair, start_date, end_date)
+        self._emit_event(
+            "fallback_activated",
+            {
+                "faculty_ids": [str(pid) for pid in repair.lost_faculty],
+                "approved_by": approved_by,
+                "assignments_count": applied,
+                "uncovered_count": len(repair.uncovered),
+            },
+        )
+        return repair, applied
+
     def get_centrality_report(
         self,
         faculty: list,
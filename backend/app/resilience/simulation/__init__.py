@@ -19,6 +19,7 @@ Key Components:
     - metrics: Metrics collection and time-series analysis
     - n2_scenario: N-2 contingency scenario implementation
     - cascade_scenario: Burnout cascade scenario implementation
+    - replication: Parallel Monte Carlo replications with confidence intervals
 
 Example:
     >>> from backend.app.resilience.simulation import N2ContingencyScenario
@@ -67,10 +68,16 @@ __all__ = [
     "N2ScenarioConfig",
     "N2ScenarioResult",
     "N2ContingencyScenario",
+    "n2_replication",
     # Burnout cascade scenario
     "CascadeConfig",
     "CascadeResult",
     "BurnoutCascadeScenario",
+    "cascade_replication",
+    # Monte Carlo replications
+    "ReplicationRunner",
+    "ReplicationSummary",
+    "run_replications",
 ]
 
 
@@ -86,6 +93,7 @@ from app.resilience.simulation.cascade_scenario import (
     BurnoutCascadeScenario,
     CascadeConfig,
     CascadeResult,
+    cascade_replication,
 )
 
 # Event types and definitions
@@ -110,4 +118,12 @@ from app.resilience.simulation.n2_scenario import (
     N2ContingencyScenario,
     N2ScenarioConfig,
     N2ScenarioResult,
+    n2_replication,
+)
+
+# Monte Carlo replications
+from app.resilience.simulation.replication import (
+    ReplicationRunner,
+    ReplicationSummary,
+    run_replications,
 )
@@ -43,6 +43,9 @@ class SimulationConfig:
         pcs_probability: Annual probability of PCS (Permanent Change of Station)
         recovery_time_hours: Average hours until faculty returns from sick call
         borrowing_enabled: Whether cross-zone faculty borrowing is allowed
+        workers: Processes used for Monte Carlo replications (1 runs inline)
+        ci_target: Stop replicating once the confidence interval half-width
+            of the target metric falls below this (None runs all replications)
     """
 
     seed: int = 42
@@ -56,6 +59,8 @@ class SimulationConfig:
     pcs_probability: float = 0.0027  # annual ~1% chance
     recovery_time_hours: float = 4.0
     borrowing_enabled: bool = True
+    workers: int = 1
+    ci_target: float | None = None
 
     def __post_init__(self) -> None:
         """Validate configuration parameters."""
@@ -77,6 +82,10 @@ class SimulationConfig:
             raise ValueError("pcs_probability must be between 0 and 1")
         if self.recovery_time_hours < 0:
             raise ValueError("recovery_time_hours cannot be negative")
+        if self.workers < 1:
+            raise ValueError("workers must be at least 1")
+        if self.ci_target is not None and self.ci_target <= 0:
+            raise ValueError("ci_target must be positive")
 
 
 @dataclass
@@ -133,6 +142,8 @@ class SimulationResult:
                 "pcs_probability": self.config.pcs_probability,
                 "recovery_time_hours": self.config.recovery_time_hours,
                 "borrowing_enabled": self.config.borrowing_enabled,
+                "workers": self.config.workers,
+                "ci_target": self.config.ci_target,
             },
             "started_at": self.started_at.isoformat(),
             "completed_at": self.completed_at.isoformat(),
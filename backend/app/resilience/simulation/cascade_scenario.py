@@ -27,7 +27,7 @@ Example:
 
 import math
 import random
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 
 @dataclass
@@ -493,3 +493,25 @@ class BurnoutCascadeScenario:
             snapshots=self._snapshots,
             recommendations=recommendations,
         )
+
+
+def cascade_replication(config: CascadeConfig, seed: int) -> dict[str, float]:
+    """
+    Run one independent cascade replication for ``ReplicationRunner``.
+
+    Args:
+        config: Scenario configuration (its seed is replaced)
+        seed: Replication seed
+
+    Returns:
+        Dict of metric values for this replication
+    """
+    result = BurnoutCascadeScenario(replace(config, seed=seed)).run()
+    return {
+        "collapsed": float(result.collapsed),
+        "entered_vortex": float(result.entered_vortex),
+        "final_faculty_count": float(result.final_faculty_count),
+        "peak_workload": result.peak_workload,
+        "total_departures": float(result.total_departures),
+        "time_in_burnout_zone": float(result.time_in_burnout_zone),
+    }
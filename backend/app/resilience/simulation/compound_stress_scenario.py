@@ -20,8 +20,12 @@ This answers: "What if everything happens all at once?"
 """
 
 import random
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from enum import Enum
+from functools import partial
+
+from app.resilience.simulation.base import SimulationConfig
+from app.resilience.simulation.replication import ReplicationRunner
 
 
 class StaffType(Enum):
@@ -729,36 +733,65 @@ class CompoundStressScenario:
         )
 
 
-def run_compound_monte_carlo(config: CompoundStressConfig, n_runs: int = 100) -> dict:
-    """Run Monte Carlo for compound stress scenario."""
-    results = []
-
-    for seed in range(n_runs):
-        cfg = CompoundStressConfig(
-            initial_faculty=config.initial_faculty,
-            expected_faculty=config.expected_faculty,
-            initial_screeners_dedicated=config.initial_screeners_dedicated,
-            initial_screeners_rn=config.initial_screeners_rn,
-            initial_screeners_emt=config.initial_screeners_emt,
-            initial_interns=config.initial_interns,
-            initial_seniors=config.initial_seniors,
-            seed=seed,
-        )
-        scenario = CompoundStressScenario(cfg)
-        results.append(scenario.run())
+def compound_replication(config: CompoundStressConfig, seed: int) -> dict[str, float]:
+    """
+    Run one independent compound stress replication for ``ReplicationRunner``.
+
+    Args:
+        config: Scenario configuration (its seed is replaced)
+        seed: Replication seed
 
-        # Aggregate
-    survived_count = sum(1 for r in results if r.survived)
-    fmit_survived_count = sum(1 for r in results if r.fmit_survived)
+    Returns:
+        Dict of metric values for this replication
+    """
+    result = CompoundStressScenario(replace(config, seed=seed)).run()
+    return {
+        "survived": float(result.survived),
+        "fmit_survived": float(result.fmit_survived),
+        "days_survived": float(result.days_survived),
+        "fmit_weeks_turfed": float(result.fmit_weeks_turfed),
+        "fmit_weeks_failed": float(result.fmit_weeks_failed),
+        "total_burnout_departures": float(result.total_burnout_departures),
+        "days_in_crisis": float(result.days_in_crisis),
+    }
+
+
+def run_compound_monte_carlo(
+    config: CompoundStressConfig,
+    n_runs: int = 100,
+    workers: int = 1,
+    ci_target: float | None = None,
+) -> dict:
+    """
+    Run Monte Carlo for compound stress scenario.
+
+    Args:
+        config: Scenario configuration; its seed roots the replication seeds
+        n_runs: Maximum number of replications
+        workers: Worker processes
+        ci_target: Stop once the FMIT survival rate's confidence interval
+            half-width is below this
+
+    Returns:
+        Dict of survival rates and averages across replications
+    """
+    runner = ReplicationRunner(
+        SimulationConfig(seed=config.seed, workers=workers, ci_target=ci_target),
+        max_replications=n_runs,
+    )
+    summary = runner.run(
+        partial(compound_replication, config), target_metric="fmit_survived"
+    )
+    means = summary.means
 
     return {
-        "n_runs": n_runs,
-        "survival_rate": survived_count / n_runs,
-        "fmit_survival_rate": fmit_survived_count / n_runs,  # THE METRIC
-        "avg_days_survived": sum(r.days_survived for r in results) / n_runs,
-        "avg_fmit_turfed": sum(r.fmit_weeks_turfed for r in results) / n_runs,
-        "avg_fmit_failed": sum(r.fmit_weeks_failed for r in results) / n_runs,
-        "avg_burnout_departures": sum(r.total_burnout_departures for r in results)
-        / n_runs,
-        "avg_days_crisis": sum(r.days_in_crisis for r in results) / n_runs,
+        "n_runs": summary.replications,
+        "survival_rate": means["survived"],
+        "fmit_survival_rate": means["fmit_survived"],  # THE METRIC
+        "fmit_survival_ci": summary.confidence_interval("fmit_survived"),
+        "avg_days_survived": means["days_survived"],
+        "avg_fmit_turfed": means["fmit_weeks_turfed"],
+        "avg_fmit_failed": means["fmit_weeks_failed"],
+        "avg_burnout_departures": means["total_burnout_departures"],
+        "avg_days_crisis": means["days_in_crisis"],
     }
@@ -9,13 +9,36 @@ The simulation:
 2. Tests all (or random sample of) faculty pairs being unavailable
 3. Checks if zones can maintain minimum coverage through borrowing
 4. Identifies vulnerable pairs and failure patterns
+
+Faculty availability, zone membership and skills are stored as integer
+bitmasks (bit ``i`` = faculty ``i`` or skill ``i``), so each iteration's zone
+checks are a few AND/OR operations and popcounts instead of set copies.
 """
 
 from collections import Counter, defaultdict
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from itertools import combinations
 from random import Random
 
+SKILLS = ("surgery", "emergency", "pediatrics", "ob_gyn", "general")
+SKILL_BITS = {skill: 1 << i for i, skill in enumerate(SKILLS)}
+
+
+def _skill_mask(skills: set[str]) -> int:
+    """Encode a skill set as a bitmask over ``SKILLS``."""
+    mask = 0
+    for skill in skills:
+        mask |= SKILL_BITS[skill]
+    return mask
+
+
+def _bits(mask: int):
+    """Yield the indices of set bits in ascending order."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
 
 @dataclass
 class N2ScenarioConfig:
@@ -85,6 +108,13 @@ class N2ContingencyScenario:
         self._results: list[N2IterationResult] = []
         self._rng = Random(config.seed)
 
+        # Bitmask views of the structures above, built at the end of setup()
+        self._faculty_skill_masks: list[int] = []
+        self._zone_faculty_masks: list[int] = []
+        self._zone_skill_providers: list[list[int]] = []  # per required skill
+        self._zone_borrow_masks: list[int] = []  # faculty with any needed skill
+        self._all_pairs: list[tuple[int, int]] | None = None
+
     def setup(self) -> None:
         """
         Initialize faculty and zone structures with overlapping assignments.
@@ -130,6 +160,34 @@ class N2ContingencyScenario:
                 # Ensure each zone has at least minimum_zone_coverage + 1 faculty
                 # (otherwise any 2 losses could trivially fail it)
         self._ensure_minimum_redundancy()
+        self._build_masks()
+
+    def _build_masks(self) -> None:
+        """Encode zone membership and skills as bitmasks."""
+        self._faculty_skill_masks = [_skill_mask(f["skills"]) for f in self._faculty]
+        self._zone_faculty_masks = []
+        self._zone_skill_providers = []
+        self._zone_borrow_masks = []
+        for zone in self._zones:
+            faculty_mask = 0
+            for fac_id in zone["faculty"]:
+                faculty_mask |= 1 << fac_id
+            skill_mask = _skill_mask(zone["required_skills"])
+            borrow_mask = 0
+            for fac_id, fac_skills in enumerate(self._faculty_skill_masks):
+                if fac_skills & skill_mask:
+                    borrow_mask |= 1 << fac_id
+            # For each required skill, the zone's faculty who have it
+            providers = []
+            for skill in zone["required_skills"]:
+                skill_providers = 0
+                for fac_id in _bits(faculty_mask):
+                    if self._faculty_skill_masks[fac_id] & SKILL_BITS[skill]:
+                        skill_providers |= 1 << fac_id
+                providers.append(skill_providers)
+            self._zone_faculty_masks.append(faculty_mask)
+            self._zone_skill_providers.append(providers)
+            self._zone_borrow_masks.append(borrow_mask)
 
     def _generate_zone_skills(self, zone_id: int) -> set[str]:
         """Generate required skills for a zone."""
@@ -146,10 +204,9 @@ class N2ContingencyScenario:
 
     def _generate_faculty_skills(self, faculty_id: int) -> set[str]:
         """Generate skills for a faculty member."""
-        all_skills = ["surgery", "emergency", "pediatrics", "ob_gyn", "general"]
         # Each faculty has 2-3 skills
         num_skills = self._rng.randint(2, 3)
-        return set(self._rng.sample(all_skills, num_skills))
+        return set(self._rng.sample(SKILLS, num_skills))
 
     def _ensure_minimum_redundancy(self) -> None:
         """
@@ -171,51 +228,52 @@ class N2ContingencyScenario:
                         zone["faculty"].add(faculty["id"])
                         break
 
-    def _check_zone_sufficiency(self, available_faculty: set[int]) -> dict[int, str]:
+    def _check_zone_sufficiency(self, available_faculty: int) -> dict[int, str]:
         """
         Check each zone's status with available faculty.
 
         Args:
-            available_faculty: Set of faculty IDs that are available
+            available_faculty: Bitmask of faculty that are available
 
         Returns:
             Dict mapping zone_idx -> status
             Status can be: "ok", "degraded", "failed", "skill_gap"
         """
         zone_status = {}
+        minimum = self.config.minimum_zone_coverage
 
-        for zone in self._zones:
+        for zone_id, zone_mask in enumerate(self._zone_faculty_masks):
             # Count available faculty for this zone
-            zone_available = zone["faculty"] & available_faculty
-            available_count = len(zone_available)
-
-            if available_count >= self.config.minimum_zone_coverage:
-                # Check if skills are covered
-                available_skills = set()
-                for fac_id in zone_available:
-                    available_skills.update(self._faculty[fac_id]["skills"])
-
-                if zone["required_skills"].issubset(available_skills):
-                    zone_status[zone["id"]] = "ok"
+            zone_available = zone_mask & available_faculty
+            available_count = zone_available.bit_count()
+
+            if available_count >= minimum:
+                # Skills are covered if every required skill has an available
+                # provider in the zone
+                if all(
+                    providers & zone_available
+                    for providers in self._zone_skill_providers[zone_id]
+                ):
+                    zone_status[zone_id] = "ok"
                 else:
                     # Enough people but missing critical skills
-                    zone_status[zone["id"]] = "skill_gap"
-            elif available_count == self.config.minimum_zone_coverage - 1:
-                zone_status[zone["id"]] = "degraded"
+                    zone_status[zone_id] = "skill_gap"
+            elif available_count == minimum - 1:
+                zone_status[zone_id] = "degraded"
             else:
-                zone_status[zone["id"]] = "failed"
+                zone_status[zone_id] = "failed"
 
         return zone_status
 
     def _attempt_borrowing(
-        self, failed_zones: list[int], available_faculty: set[int]
+        self, failed_zones: list[int], available_faculty: int
     ) -> tuple[int, int]:
         """
         Attempt to borrow faculty from other zones to cover failures.
 
         Args:
             failed_zones: List of zone IDs that failed or are degraded
-            available_faculty: Set of available faculty IDs
+            available_faculty: Bitmask of available faculty
 
         Returns:
             Tuple of (attempts, successes)
@@ -227,28 +285,25 @@ class N2ContingencyScenario:
         successes = 0
 
         for zone_id in failed_zones:
-            zone = self._zones[zone_id]
-            zone_available = zone["faculty"] & available_faculty
-            shortfall = self.config.minimum_zone_coverage - len(zone_available)
+            zone_mask = self._zone_faculty_masks[zone_id]
+            shortfall = self.config.minimum_zone_coverage - (
+                (zone_mask & available_faculty).bit_count()
+            )
 
             if shortfall <= 0:
                 continue
 
-                # Try to find faculty from other zones who have the needed skills
-            needed_skills = zone["required_skills"]
-
             for _ in range(shortfall):
                 attempts += 1
 
-                # Find faculty not assigned to this zone but with relevant skills
-                candidates = []
-                for fac_id in available_faculty:
-                    faculty = self._faculty[fac_id]
-                    if (
-                        zone_id not in faculty["zones"]
-                        and faculty["skills"] & needed_skills
-                    ):
-                        candidates.append(fac_id)
+                # Faculty not assigned to this zone but with a needed skill
+                candidates = list(
+                    _bits(
+                        available_faculty
+                        & ~zone_mask
+                        & self._zone_borrow_masks[zone_id]
+                    )
+                )
 
                 if (
                     candidates
@@ -257,7 +312,7 @@ class N2ContingencyScenario:
                     # Successfully borrowed
                     successes += 1
                     borrowed_fac = self._rng.choice(candidates)
-                    available_faculty.remove(borrowed_fac)
+                    available_faculty &= ~(1 << borrowed_fac)
 
         return attempts, successes
 
@@ -276,7 +331,11 @@ class N2ContingencyScenario:
 
         if self.config.iterations >= total_pairs:
             # Test all pairs systematically
-            all_pairs = list(combinations(range(self.config.faculty_count), 2))
+            if self._all_pairs is None:
+                self._all_pairs = list(
+                    combinations(range(self.config.faculty_count), 2)
+                )
+            all_pairs = self._all_pairs
             if iteration < len(all_pairs):
                 faculty_pair = all_pairs[iteration]
             else:
@@ -290,8 +349,10 @@ class N2ContingencyScenario:
                 sorted(self._rng.sample(range(self.config.faculty_count), 2))
             )
 
-            # Create available faculty set (all except the lost pair)
-        available_faculty = set(range(self.config.faculty_count)) - set(faculty_pair)
+            # Create available faculty mask (all except the lost pair)
+        available_faculty = (1 << self.config.faculty_count) - 1
+        for fac_id in faculty_pair:
+            available_faculty &= ~(1 << fac_id)
 
         # Check zone sufficiency
         zone_status = self._check_zone_sufficiency(available_faculty)
@@ -311,10 +372,8 @@ class N2ContingencyScenario:
         borrowing_successes = 0
 
         if failed_zones or degraded_zones:
-            # Make a copy of available faculty for borrowing simulation
-            available_for_borrowing = available_faculty.copy()
             borrowing_attempts, borrowing_successes = self._attempt_borrowing(
-                failed_zones + degraded_zones, available_for_borrowing
+                failed_zones + degraded_zones, available_faculty
             )
 
             # Determine if this iteration passed
@@ -408,12 +467,12 @@ class N2ContingencyScenario:
         for result in self._results:
             if not result.passed:
                 # Determine which zones were affected
-                for zone in self._zones:
-                    lost_faculty_in_zone = (
-                        set(result.faculty_pair_lost) & zone["faculty"]
-                    )
-                    if lost_faculty_in_zone:
-                        zones_affected[zone["id"]] += 1
+                lost_mask = 0
+                for fac_id in result.faculty_pair_lost:
+                    lost_mask |= 1 << fac_id
+                for zone_id, zone_mask in enumerate(self._zone_faculty_masks):
+                    if lost_mask & zone_mask:
+                        zones_affected[zone_id] += 1
 
                         # Generate recommendations
         recommendations = self._generate_recommendations(
@@ -528,3 +587,25 @@ class N2ContingencyScenario:
                 )
 
         return recommendations
+
+
+def n2_replication(config: N2ScenarioConfig, seed: int) -> dict[str, float]:
+    """
+    Run one independent N-2 replication for ``ReplicationRunner``.
+
+    Each replication draws a fresh faculty-zone layout from ``seed``.
+
+    Args:
+        config: Scenario configuration (its seed is replaced)
+        seed: Replication seed
+
+    Returns:
+        Dict of metric values for this replication
+    """
+    result = N2ContingencyScenario(replace(config, seed=seed)).run()
+    return {
+        "zone_failure_probability": 1.0 - result.pass_rate,
+        "any_zone_failure": float(result.failures > 0),
+        "cascade_rate": result.cascade_rate,
+        "average_recovery_time": result.average_recovery_time,
+    }
@@ -0,0 +1,320 @@
+"""
+Monte Carlo replication runner for resilience scenarios.
+
+Scenario classes (N-2 contingency, burnout cascade, compound stress) simulate
+one stochastic trajectory per run. Confidence intervals on outcomes such as
+zone-failure probability need thousands of independent replications, so this
+module runs them across a process pool:
+
+- Each replication gets its own seed from ``numpy.random.SeedSequence.spawn``
+  rooted at ``SimulationConfig.seed``. Replication ``i`` always receives the
+  same seed, so results are reproducible regardless of ``workers``.
+- Replications are submitted in fixed-size chunks and folded into running
+  statistics in replication order as chunks complete.
+- Once at least ``min_replications`` have run, the runner stops as soon as the
+  target metric's confidence interval half-width falls below
+  ``SimulationConfig.ci_target``. The check happens at chunk boundaries, so
+  the stopping point is also independent of ``workers``.
+
+Example:
+    >>> from functools import partial
+    >>> from app.resilience.simulation.n2_scenario import (
+    ...     N2ScenarioConfig, n2_replication,
+    ... )
+    >>> runner = ReplicationRunner(
+    ...     SimulationConfig(seed=7, workers=4, ci_target=0.01),
+    ...     max_replications=5000,
+    ... )
+    >>> summary = runner.run(
+    ...     partial(n2_replication, N2ScenarioConfig(iterations=45)),
+    ...     target_metric="zone_failure_probability",
+    ... )
+    >>> low, high = summary.confidence_interval("zone_failure_probability")
+"""
+
+import logging
+import math
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from statistics import NormalDist
+
+import numpy as np
+
+from app.resilience.simulation.base import SimulationConfig
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_REPLICATIONS = 1000
+DEFAULT_MIN_REPLICATIONS = 30
+DEFAULT_CHUNK_SIZE = 25
+DEFAULT_CONFIDENCE = 0.95
+
+Replicate = Callable[[int], dict[str, float]]
+
+
+class RunningStatistic:
+    """
+    Streaming mean and variance (Welford) with a confidence half-width.
+
+    Metrics whose observations are all 0 or 1 are treated as proportions and
+    use the Wilson score interval, which stays meaningful when no failures
+    (or no successes) have been observed yet.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+        self.is_proportion = True
+
+    def add(self, value: float) -> None:
+        """
+        Fold one observation into the statistic.
+
+        Args:
+            value: Observed value
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value not in (0.0, 1.0):
+            self.is_proportion = False
+
+    @property
+    def variance(self) -> float:
+        """Sample variance (0.0 until two observations exist)."""
+        return self._m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def half_width(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        """
+        Confidence interval half-width for the mean.
+
+        Args:
+            confidence: Confidence level (e.g. 0.95)
+
+        Returns:
+            Half-width (infinity before two observations)
+        """
+        if self.count < 2:
+            return math.inf
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        n = self.count
+        if self.is_proportion:
+            p = self.mean
+            return (z / (1 + z * z / n)) * math.sqrt(
+                p * (1 - p) / n + z * z / (4 * n * n)
+            )
+        return z * math.sqrt(self.variance / n)
+
+    def center(self, confidence: float = DEFAULT_CONFIDENCE) -> float:
+        """Interval center (the Wilson center for proportions, else the mean)."""
+        if not self.is_proportion or self.count == 0:
+            return self.mean
+        z = NormalDist().inv_cdf((1 + confidence) / 2)
+        n = self.count
+        return (self.mean + z * z / (2 * n)) / (1 + z * z / n)
+
+
+@dataclass
+class ReplicationSummary:
+    """
+    Aggregated outcome of a batch of replications.
+
+    Attributes:
+        target_metric: Metric the stopping rule was evaluated on
+        replications: Number of replications folded into the statistics
+        confidence: Confidence level of the intervals
+        converged: Whether the target half-width was reached
+        stopped_early: Whether the runner stopped before max_replications
+        means: Metric -> mean across replications
+        std_devs: Metric -> sample standard deviation
+        ci_half_widths: Metric -> confidence interval half-width
+    """
+
+    target_metric: str
+    replications: int
+    confidence: float
+    converged: bool
+    stopped_early: bool
+    means: dict[str, float] = field(default_factory=dict)
+    std_devs: dict[str, float] = field(default_factory=dict)
+    ci_half_widths: dict[str, float] = field(default_factory=dict)
+    _centers: dict[str, float] = field(default_factory=dict, repr=False)
+
+    def confidence_interval(self, metric: str) -> tuple[float, float]:
+        """
+        Confidence interval for a metric's mean.
+
+        Args:
+            metric: Metric name
+
+        Returns:
+            (lower, upper) bounds
+        """
+        center = self._centers.get(metric, self.means[metric])
+        half_width = self.ci_half_widths[metric]
+        return center - half_width, center + half_width
+
+
+def _run_chunk(replicate: Replicate, seeds: list[int]) -> list[dict[str, float]]:
+    """Run replications for a chunk of seeds (executed in worker processes)."""
+    return [replicate(seed) for seed in seeds]
+
+
+class ReplicationRunner:
+    """
+    Runs independent scenario replications, optionally across processes.
+
+    ``replicate`` must be picklable when ``workers > 1``: a module-level
+    function or a ``functools.partial`` of one, such as ``n2_replication``,
+    ``cascade_replication`` or ``compound_replication``.
+    """
+
+    def __init__(
+        self,
+        config: SimulationConfig | None = None,
+        max_replications: int = DEFAULT_MAX_REPLICATIONS,
+        min_replications: int = DEFAULT_MIN_REPLICATIONS,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        confidence: float = DEFAULT_CONFIDENCE,
+    ) -> None:
+        """
+        Initialize the runner.
+
+        Args:
+            config: Supplies ``seed``, ``workers`` and ``ci_target``
+            max_replications: Upper bound on replications
+            min_replications: Replications required before stopping early
+            chunk_size: Replications per task sent to a worker
+            confidence: Confidence level for the intervals
+        """
+        if max_replications < 1:
+            raise ValueError("max_replications must be at least 1")
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if not (0 < confidence < 1):
+            raise ValueError("confidence must be between 0 and 1")
+
+        self.config = config or SimulationConfig()
+        self.max_replications = max_replications
+        self.min_replications = min_replications
+        self.chunk_size = chunk_size
+        self.confidence = confidence
+
+    def _seed_chunks(self):
+        """Yield per-chunk lists of replication seeds, in replication order."""
+        root = np.random.SeedSequence(self.config.seed)
+        remaining = self.max_replications
+        while remaining > 0:
+            size = min(self.chunk_size, remaining)
+            yield [
+                int(child.generate_state(1, dtype=np.uint64)[0])
+                for child in root.spawn(size)
+            ]
+            remaining -= size
+
+    def _converged(self, stats: dict[str, RunningStatistic], metric: str) -> bool:
+        statistic = stats.get(metric)
+        return (
+            self.config.ci_target is not None
+            and statistic is not None
+            and statistic.count >= self.min_replications
+            and statistic.half_width(self.confidence) < self.config.ci_target
+        )
+
+    def run(self, replicate: Replicate, target_metric: str) -> ReplicationSummary:
+        """
+        Run replications until converged or ``max_replications`` is reached.
+
+        Args:
+            replicate: Callable mapping a seed to a dict of metric values
+            target_metric: Metric whose confidence interval drives early stopping
+
+        Returns:
+            ReplicationSummary with per-metric statistics
+        """
+        stats: dict[str, RunningStatistic] = {}
+        converged = False
+
+        def fold(results: list[dict[str, float]]) -> bool:
+            for metrics in results:
+                for name, value in metrics.items():
+                    stats.setdefault(name, RunningStatistic()).add(float(value))
+            return self._converged(stats, target_metric)
+
+        seed_chunks = self._seed_chunks()
+        workers = self.config.workers
+
+        if workers <= 1:
+            for seeds in seed_chunks:
+                if fold(_run_chunk(replicate, seeds)):
+                    converged = True
+                    break
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pending: deque = deque()
+                try:
+                    while True:
+                        # Keep every worker busy with one queued chunk behind it
+                        while len(pending) < 2 * workers:
+                            seeds = next(seed_chunks, None)
+                            if seeds is None:
+                                break
+                            pending.append(pool.submit(_run_chunk, replicate, seeds))
+                        if not pending:
+                            break
+                        # Fold in submission order so results don't depend on
+                        # which worker finishes first
+                        if fold(pending.popleft().result()):
+                            converged = True
+                            break
+                finally:
+                    for future in pending:
+                        future.cancel()
+
+        replications = stats[target_metric].count if target_metric in stats else 0
+        summary = ReplicationSummary(
+            target_metric=target_metric,
+            replications=replications,
+            confidence=self.confidence,
+            converged=converged,
+            stopped_early=converged and replications < self.max_replications,
+            means={name: s.mean for name, s in stats.items()},
+            std_devs={name: math.sqrt(s.variance) for name, s in stats.items()},
+            ci_half_widths={
+                name: s.half_width(self.confidence) for name, s in stats.items()
+            },
+            _centers={name: s.center(self.confidence) for name, s in stats.items()},
+        )
+        logger.info(
+            f"Ran {replications} replications of {target_metric} "
+            f"(mean={summary.means.get(target_metric, 0.0):.4f}, "
+            f"half-width={summary.ci_half_widths.get(target_metric, math.inf):.4f}, "
+            f"converged={converged})"
+        )
+        return summary
+
+
+def run_replications(
+    replicate: Replicate,
+    target_metric: str,
+    config: SimulationConfig | None = None,
+    max_replications: int = DEFAULT_MAX_REPLICATIONS,
+) -> ReplicationSummary:
+    """
+    Convenience wrapper around ``ReplicationRunner``.
+
+    Args:
+        replicate: Callable mapping a seed to a dict of metric values
+        target_metric: Metric whose confidence interval drives early stopping
+        config: Supplies ``seed``, ``workers`` and ``ci_target``
+        max_replications: Upper bound on replications
+
+    Returns:
+        ReplicationSummary with per-metric statistics
+    """
+    runner = ReplicationRunner(config, max_replications=max_replications)
+    return runner.run(replicate, target_metric)
@@ -19,8 +19,17 @@ from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
 from enum import Enum
+from typing import Any
 from uuid import UUID, uuid4
 
+from app.resilience.fallback_farm import (
+    FallbackRepair,
+    LiveSchedule,
+    LossKey,
+    load_repairs,
+    lookup_repair,
+)
+
 logger = logging.getLogger(__name__)
 
 
@@ -97,6 +106,7 @@ class FallbackScheduler:
     def __init__(self) -> None:
         self.fallback_schedules: dict[FallbackScenario, FallbackSchedule] = {}
         self.zones: dict[UUID, SchedulingZone] = {}
+        self.repairs: dict[LossKey, FallbackRepair] = {}
         self._schedule_generator: Callable | None = None
 
     def register_schedule_generator(
@@ -238,6 +248,129 @@ class FallbackScheduler:
         logger.info(f"Pre-computed {len(results)} fallback schedules")
         return results
 
+    def install_repairs(
+        self,
+        repairs: dict[LossKey, FallbackRepair],
+        start_date: date,
+        end_date: date,
+    ) -> dict[FallbackScenario, FallbackSchedule]:
+        """
+        Back the faculty-loss fallbacks with pre-solved repairs.
+
+        One-person repairs back SINGLE_FACULTY_LOSS and two-person repairs
+        back DOUBLE_FACULTY_LOSS. Each fallback's assignments are the repair
+        deltas, and its coverage rate is the mean share of lost slots the
+        repairs cover.
+
+        Args:
+            repairs: Repairs from FallbackFarm.precompute, keyed by loss set
+            start_date: First day the repairs cover
+            end_date: Last day the repairs cover
+
+        Returns:
+            The fallback schedules created
+        """
+        self.repairs = dict(repairs)
+        by_scenario = {
+            FallbackScenario.SINGLE_FACULTY_LOSS: [
+                r for r in repairs.values() if len(r.lost_faculty) == 1
+            ],
+            FallbackScenario.DOUBLE_FACULTY_LOSS: [
+                r for r in repairs.values() if len(r.lost_faculty) == 2
+            ],
+        }
+
+        installed = {}
+        for scenario, scenario_repairs in by_scenario.items():
+            if not scenario_repairs:
+                continue
+            fallback = FallbackSchedule(
+                id=uuid4(),
+                scenario=scenario,
+                name=self._get_scenario_name(scenario),
+                description=self._get_scenario_description(scenario),
+                created_at=datetime.now(),
+                valid_from=start_date,
+                valid_until=end_date,
+                assignments=[r.to_dict() for r in scenario_repairs],
+                assumptions=[
+                    f"Repairs solved against schedule "
+                    f"{scenario_repairs[0].base_fingerprint}",
+                ],
+                services_reduced=self._get_reduced_services(scenario),
+                coverage_rate=sum(r.coverage_rate for r in scenario_repairs)
+                / len(scenario_repairs),
+            )
+            self.fallback_schedules[scenario] = fallback
+            installed[scenario] = fallback
+            logger.info(
+                f"Installed {len(scenario_repairs)} repairs for {scenario.value} "
+                f"({fallback.coverage_rate:.0%} mean coverage)"
+            )
+        return installed
+
+    def load_stored_repairs(self, redis_client: Any | None = None) -> bool:
+        """
+        Install the repairs the precompute task stored, unless some are loaded.
+
+        The weekly task solves repairs in a Celery worker; other processes
+        (the API) pick them up from Redis here.
+
+        Args:
+            redis_client: Redis client (defaults to the configured one)
+
+        Returns:
+            True if repairs are available
+        """
+        if self.repairs:
+            return True
+        stored = load_repairs(redis_client)
+        if stored is None or not stored.repairs:
+            return False
+        self.install_repairs(stored.repairs, stored.start_date, stored.end_date)
+        return True
+
+    def activate_for_absence(
+        self,
+        faculty_ids: list[UUID],
+        schedule: LiveSchedule,
+        start_date: date,
+        end_date: date,
+    ) -> FallbackRepair | None:
+        """
+        Activate the pre-solved repair for a real faculty absence.
+
+        Activation is a lookup: the repair for exactly these faculty is
+        limited to the absence dates and checked move by move against the
+        current schedule. Stored repairs are loaded first if none are
+        installed. Apply the result with ``fallback_farm.apply_repair``
+        using the same dates.
+
+        Args:
+            faculty_ids: Faculty who are now unavailable
+            schedule: Current live schedule (for the per-move checks)
+            start_date: First day of the absence
+            end_date: Last day of the absence
+
+        Returns:
+            FallbackRepair for the absence, or None if none exists
+        """
+        self.load_stored_repairs()
+        repair = lookup_repair(
+            self.repairs, faculty_ids, schedule, start_date, end_date
+        )
+        if repair is None:
+            return None
+
+        scenario = (
+            FallbackScenario.SINGLE_FACULTY_LOSS
+            if len(repair.lost_faculty) == 1
+            else FallbackScenario.DOUBLE_FACULTY_LOSS
+        )
+        if scenario in self.fallback_schedules:
+            self.activate_fallback(scenario)
+        return repair
+
     def activate_fallback(
         self,
         scenario: FallbackScenario,
@@ -12,6 +12,7 @@ Tasks integrate with the ResilienceService and update Prometheus metrics.
 """
 
 from datetime import date, datetime, timedelta
+from uuid import UUID
 
 from celery import shared_task
 from sqlalchemy.orm import Session
@@ -250,15 +251,22 @@ def run_contingency_analysis(
 def precompute_fallback_schedules(
     self,
     days_ahead: int = 90,
+    workers: int = 4,
+    loss_sets: list[list[str]] | None = None,
 ) -> dict:
     """
     Precompute fallback schedules for all scenarios.
 
     Runs weekly on Sunday at 3 AM (configured in celery_app.py).
 
-    Generates fallback schedules for:
-    - Single faculty loss
-    - Double faculty loss
+    Faculty loss is backed by the fallback farm: one repaired schedule per
+    faculty member, plus one per multi-person loss set (``loss_sets``,
+    defaulting to the RESILIENCE_FALLBACK_LOSS_SETS setting), solved in
+    ``workers`` processes against the live schedule and stored in Redis as
+    deltas for instant activation. Two-person sets back double faculty loss.
+
+    The remaining scenarios use the registered schedule generator:
+    - Double faculty loss (when no two-person loss set is configured)
     - PCS season (50% capacity)
     - Holiday skeleton
     - Pandemic essential only
@@ -267,6 +275,13 @@ def precompute_fallback_schedules(
 
     These pre-computed schedules enable instant crisis response.
     """
+    from app.core.config import get_settings
+    from app.resilience.fallback_farm import (
+        FallbackFarm,
+        LiveSchedule,
+        save_repairs,
+        single_loss_sets,
+    )
     from app.resilience.static_stability import FallbackScenario, FallbackScheduler
 
     logger.info(f"Starting fallback precomputation for next {days_ahead} days")
@@ -277,10 +292,41 @@ def precompute_fallback_schedules(
         end_date = today + timedelta(days=days_ahead)
 
         scheduler = FallbackScheduler()
-
-        # Precompute all scenarios
         results = {}
+
+        if loss_sets is None:
+            loss_sets = get_settings().RESILIENCE_FALLBACK_LOSS_SETS
+
+        # N-1 and configured multi-person repairs against the live schedule
+        try:
+            schedule = LiveSchedule.from_db(db, today, end_date)
+            repairs = FallbackFarm(workers=workers).precompute(
+                schedule,
+                single_loss_sets(schedule)
+                + [[UUID(str(pid)) for pid in group] for group in loss_sets],
+            )
+            save_repairs(schedule.fingerprint, repairs, today, end_date)
+            for scenario, fallback in scheduler.install_repairs(
+                repairs, today, end_date
+            ).items():
+                results[scenario.value] = {
+                    "id": str(fallback.id),
+                    "valid_until": fallback.valid_until.isoformat(),
+                    "coverage_rate": fallback.coverage_rate,
+                    "services_reduced": fallback.services_reduced,
+                    "repairs": len(fallback.assignments),
+                    "schedule_fingerprint": schedule.fingerprint,
+                }
+        except Exception:
+            logger.error("Failed to precompute fallback repairs", exc_info=True)
+            results[FallbackScenario.SINGLE_FACULTY_LOSS.value] = {
+                "error": "Operation failed"
+            }
+
+        # Precompute the remaining scenarios
         for scenario in FallbackScenario:
+            if scenario.value in results:
+                continue
             try:
                 fallback = scheduler.precompute_fallback(
                     scenario=scenario,
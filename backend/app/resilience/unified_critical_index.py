@@ -35,6 +35,8 @@ from enum import Enum
 from typing import Any, Optional
 from uuid import UUID
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 # Try to import NetworkX for graph analysis
@@ -563,16 +565,11 @@ class UnifiedCriticalIndexAnalyzer:
 
         # Compute various centrality measures
         try:
-            degree = nx.degree_centrality(self._network)
-            betweenness = nx.betweenness_centrality(self._network)
-            # Eigenvector may fail for disconnected graphs
-            try:
-                eigenvector = nx.eigenvector_centrality(
-                    self._network, max_iter=1000, tol=1e-06
-                )
-            except nx.PowerIterationFailedConvergence:
-                eigenvector = dict.fromkeys(self._network.nodes(), 0.0)
-            pagerank = nx.pagerank(self._network)
+            measures = get_centrality_service().measures(self._network)
+            degree = measures["degree"]
+            betweenness = measures["betweenness"]
+            eigenvector = measures["eigenvector"]
+            pagerank = measures["pagerank"]
 
             for node in self._network.nodes():
                 self._centrality_cache[node] = {
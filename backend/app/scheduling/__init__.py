@@ -1,64 +1,56 @@
 # Scheduling module
-from app.scheduling.anderson_localization import (
-    AndersonLocalizer,
-    Disruption,
-    DisruptionType,
-    LocalizationRegion,
-    PropagationAnalyzer,
-)
-from app.scheduling.engine import SchedulingEngine
-from app.scheduling.free_energy_integration import (
-    ForecastGenerator,
-    FreeEnergySolverAdapter,
-    HybridFreeEnergySolver,
-    create_free_energy_solver,
-    create_hybrid_solver,
-    get_default_forecast,
-)
-from app.scheduling.free_energy_scheduler import (
-    DemandForecast,
-    FreeEnergyScheduler,
-    GenerativeModel,
-    ScheduleOutcome,
-    SurpriseMetric,
-)
-from app.scheduling.localization_metrics import (
-    LocalizationMetricsTracker,
-    LocalizationQuality,
-)
-from app.scheduling.penrose_efficiency import (
-    ErgospherePeriod,
-    PenroseEfficiencyExtractor,
-    PenroseSwap,
-    PhaseComponent,
-    RotationEnergyTracker,
-)
-from app.scheduling.penrose_visualization import PenroseVisualizer, VisualizationConfig
-from app.scheduling.spin_glass_model import (
-    FrustrationCluster,
-    LandscapeAnalysis,
-    ReplicaSchedule,
-    ReplicaSymmetryAnalysis,
-    SpinGlassScheduler,
-)
-from app.scheduling.spin_glass_visualizer import (
-    export_landscape_summary,
-    plot_energy_landscape,
-    plot_frustration_network,
-    plot_overlap_distribution,
-    plot_parisi_overlap_matrix,
-    plot_solution_basins,
-)
-from app.scheduling.validator import ACGMEValidator
-from app.scheduling.zeno_dashboard import ZenoDashboard
-from app.scheduling.zeno_governor import (
-    HumanIntervention,
-    InterventionPolicy,
-    OptimizationFreedomWindow,
-    ZenoGovernor,
-    ZenoMetrics,
-    ZenoRisk,
-)
+from app.core.lazy_imports import lazy_exports
+
+# Re-exports are imported on first access; several pull in matplotlib,
+# networkx or OR-Tools and most importers only need one submodule.
+_LAZY_EXPORTS = {
+    "AndersonLocalizer": "app.scheduling.anderson_localization",
+    "Disruption": "app.scheduling.anderson_localization",
+    "DisruptionType": "app.scheduling.anderson_localization",
+    "LocalizationRegion": "app.scheduling.anderson_localization",
+    "PropagationAnalyzer": "app.scheduling.anderson_localization",
+    "SchedulingEngine": "app.scheduling.engine",
+    "ForecastGenerator": "app.scheduling.free_energy_integration",
+    "FreeEnergySolverAdapter": "app.scheduling.free_energy_integration",
+    "HybridFreeEnergySolver": "app.scheduling.free_energy_integration",
+    "create_free_energy_solver": "app.scheduling.free_energy_integration",
+    "create_hybrid_solver": "app.scheduling.free_energy_integration",
+    "get_default_forecast": "app.scheduling.free_energy_integration",
+    "DemandForecast": "app.scheduling.free_energy_scheduler",
+    "FreeEnergyScheduler": "app.scheduling.free_energy_scheduler",
+    "GenerativeModel": "app.scheduling.free_energy_scheduler",
+    "ScheduleOutcome": "app.scheduling.free_energy_scheduler",
+    "SurpriseMetric": "app.scheduling.free_energy_scheduler",
+    "LocalizationMetricsTracker": "app.scheduling.localization_metrics",
+    "LocalizationQuality": "app.scheduling.localization_metrics",
+    "ErgospherePeriod": "app.scheduling.penrose_efficiency",
+    "PenroseEfficiencyExtractor": "app.scheduling.penrose_efficiency",
+    "PenroseSwap": "app.scheduling.penrose_efficiency",
+    "PhaseComponent": "app.scheduling.penrose_efficiency",
+    "RotationEnergyTracker": "app.scheduling.penrose_efficiency",
+    "PenroseVisualizer": "app.scheduling.penrose_visualization",
+    "VisualizationConfig": "app.scheduling.penrose_visualization",
+    "FrustrationCluster": "app.scheduling.spin_glass_model",
+    "LandscapeAnalysis": "app.scheduling.spin_glass_model",
+    "ReplicaSchedule": "app.scheduling.spin_glass_model",
+    "ReplicaSymmetryAnalysis": "app.scheduling.spin_glass_model",
+    "SpinGlassScheduler": "app.scheduling.spin_glass_model",
+    "export_landscape_summary": "app.scheduling.spin_glass_visualizer",
+    "plot_energy_landscape": "app.scheduling.spin_glass_visualizer",
+    "plot_frustration_network": "app.scheduling.spin_glass_visualizer",
+    "plot_overlap_distribution": "app.scheduling.spin_glass_visualizer",
+    "plot_parisi_overlap_matrix": "app.scheduling.spin_glass_visualizer",
+    "plot_solution_basins": "app.scheduling.spin_glass_visualizer",
+    "ACGMEValidator": "app.scheduling.validator",
+    "ZenoDashboard": "app.scheduling.zeno_dashboard",
+    "HumanIntervention": "app.scheduling.zeno_governor",
+    "InterventionPolicy": "app.scheduling.zeno_governor",
+    "OptimizationFreedomWindow": "app.scheduling.zeno_governor",
+    "ZenoGovernor": "app.scheduling.zeno_governor",
+    "ZenoMetrics": "app.scheduling.zeno_governor",
+    "ZenoRisk": "app.scheduling.zeno_governor",
+}
+__getattr__, __dir__ = lazy_exports(__name__, _LAZY_EXPORTS)
 
 __all__ = [
     "SchedulingEngine",
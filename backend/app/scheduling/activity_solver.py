@@ -28,11 +28,14 @@ import json
 import os
 import time
 from collections import defaultdict
+from dataclasses import dataclass
+from functools import cache
 from datetime import UTC, date, datetime
 from pathlib import Path
 from typing import Any
 from uuid import UUID
 
+import numpy as np
 from sqlalchemy import or_, select, text
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session, selectinload
@@ -131,6 +134,44 @@ VAS_ALLOWED_WEEKDAY_TIMES = {(3, "AM"), (3, "PM"), (4, "AM")}
 VAS_OVERRIDE_PENALTY = 8  # Cost of pulling faculty from AT/C to VAS supervision
 
 
+@dataclass
+class ActivityEligibility:
+    """
+    Compiled slot x activity eligibility for one activity solve.
+
+    Slots that share every eligibility input (one faculty member, or one
+    resident template and PGY level) share a row, and each row has one
+    allowed list for VAS half-days and one for the rest. Predicates run once
+    per row; slot eligibility is gathered from the row masks by index.
+    """
+
+    activity_ids: list[UUID]
+    columns: dict[UUID, int]
+    slot_rows: np.ndarray  # (n_slots,) row index
+    slot_vas: np.ndarray  # (n_slots,) 1 if VAS is allowed in the half-day
+    row_allowed: list[tuple[list[UUID], list[UUID]]]  # ordered, by VAS bit
+    row_masks: np.ndarray  # (n_rows, 2, n_activities) bool
+    uncredentialed: np.ndarray  # (n_rows, n_activities) bool
+    capacity: np.ndarray  # (n_rows, n_activities) bool
+    vas_penalty: np.ndarray  # (n_rows, 2) int
+    cv_penalty: np.ndarray  # (n_rows,) int
+    oic: np.ndarray  # (n_rows,) bool
+    admin_activity: list[UUID | None]  # per row, faculty admin/SM bonus
+
+    @property
+    def allowed(self) -> np.ndarray:
+        """(n_slots, n_activities) boolean eligibility matrix."""
+        return self.row_masks[self.slot_rows, self.slot_vas]
+
+    def allowed_ids(self, s_i: int) -> list[UUID]:
+        """Ordered allowed activity IDs for a slot (a fresh list)."""
+        return list(self.row_allowed[self.slot_rows[s_i]][self.slot_vas[s_i]])
+
+    def slot_mask(self, s_i: int) -> np.ndarray:
+        """Boolean activity mask for a slot."""
+        return self.row_masks[self.slot_rows[s_i], self.slot_vas[s_i]]
+
+
 class CPSATActivitySolver:
     """
     CP-SAT solver for assigning activities to half-day slots.
@@ -311,6 +352,228 @@ class CPSATActivitySolver:
             return VAS_RESIDENT_PENALTY_POCUS
         return VAS_RESIDENT_PENALTY_OTHER
 
+    def _faculty_allowed_activities(
+        self,
+        faculty: Person,
+        assignable_ids: set[UUID],
+        at_activity: Activity | None,
+        clinic_activity: Activity | None,
+        cv_activity: Activity | None,
+        vas_activity_ids: set[UUID],
+    ) -> tuple[list[UUID], UUID | None]:
+        """Return (allowed activity IDs, admin bonus activity) for a faculty."""
+        allowed: list[UUID] = []
+        admin_id: UUID | None = None
+        if at_activity and at_activity.id in assignable_ids:
+            allowed.append(at_activity.id)
+
+        admin_activity = self._get_admin_activity_for_faculty(
+            faculty, self._activity_cache
+        )
+        if (
+            admin_activity
+            and admin_activity.id in assignable_ids
+            and admin_activity.id not in allowed
+        ):
+            allowed.append(admin_activity.id)
+            admin_id = admin_activity.id
+
+        if self._is_sports_medicine_faculty(faculty):
+            sm_activity = self._get_activity_by_code(
+                "sm_clinic"
+            ) or self._get_activity_by_code("SM")
+            if (
+                sm_activity
+                and sm_activity.id in assignable_ids
+                and sm_activity.id not in allowed
+            ):
+                allowed.append(sm_activity.id)
+                admin_id = sm_activity.id
+
+        min_c, max_c = self._get_faculty_clinic_caps(faculty)
+        if clinic_activity and (max_c > 0 or min_c > 0):
+            if clinic_activity.id in assignable_ids:
+                allowed.append(clinic_activity.id)
+                if (
+                    cv_activity
+                    and cv_activity.id in assignable_ids
+                    and cv_activity.id not in allowed
+                ):
+                    allowed.append(cv_activity.id)
+        if vas_activity_ids and self._is_vas_faculty(faculty):
+            for vas_id in vas_activity_ids:
+                if vas_id in assignable_ids and vas_id not in allowed:
+                    allowed.append(vas_id)
+        return allowed, admin_id
+
+    def _compile_eligibility(
+        self,
+        slots: list[HalfDayAssignment],
+        slot_meta: dict[int, dict[str, Any]],
+        templates_by_id: dict[UUID, RotationTemplate],
+        activity_by_id: dict[UUID, Activity],
+        assignable_ids: set[UUID],
+        allowed_by_template: dict[UUID, list[UUID]],
+        fallback_allowed: list[UUID],
+        faculty_allowed_ids: list[UUID],
+        at_activity: Activity | None,
+        clinic_activity: Activity | None,
+        cv_activity: Activity | None,
+        vas_activity_ids: set[UUID],
+    ) -> ActivityEligibility:
+        """
+        Evaluate eligibility predicates once per row instead of per slot.
+
+        A row is one faculty member, or one (template, PGY level) for
+        residents. Each row is resolved for VAS and non-VAS half-days,
+        reproducing the per-slot rules: template requirements with fallback,
+        CV for PGY-2+ on FMC clinic templates, VAS credential/template and
+        weekday gates, credential mismatches, and FMC capacity counting.
+        """
+        activity_ids = list(activity_by_id)
+        columns = {act_id: col for col, act_id in enumerate(activity_ids)}
+        cv_id = (
+            cv_activity.id if cv_activity and cv_activity.id in assignable_ids else None
+        )
+
+        row_index: dict[tuple[Any, ...], int] = {}
+        row_slots: list[int] = []  # a representative slot per row
+        slot_rows = np.empty(len(slots), dtype=np.intp)
+        slot_vas = np.empty(len(slots), dtype=np.intp)
+        vas_by_time: dict[tuple[date, str], bool] = {}
+        for s_i, slot in enumerate(slots):
+            meta = slot_meta[s_i]
+            if meta.get("person_type") == "faculty":
+                key: tuple[Any, ...] = ("faculty", slot.person_id)
+            else:
+                key = ("resident", meta["template_id"], meta.get("pgy_level") or 0)
+            row = row_index.get(key)
+            if row is None:
+                row = row_index[key] = len(row_slots)
+                row_slots.append(s_i)
+            slot_rows[s_i] = row
+            time_key = (slot.date, slot.time_of_day)
+            vas_ok = vas_by_time.get(time_key)
+            if vas_ok is None:
+                vas_ok = vas_by_time[time_key] = self._is_vas_allowed_slot(*time_key)
+            slot_vas[s_i] = int(vas_ok)
+
+        n_rows, n_acts = len(row_slots), len(activity_ids)
+        row_allowed: list[tuple[list[UUID], list[UUID]]] = []
+        row_masks = np.zeros((n_rows, 2, n_acts), dtype=bool)
+        uncredentialed = np.zeros((n_rows, n_acts), dtype=bool)
+        capacity = np.zeros((n_rows, n_acts), dtype=bool)
+        vas_penalty = np.zeros((n_rows, 2), dtype=np.int64)
+        cv_penalty = np.zeros(n_rows, dtype=np.int64)
+        oic = np.zeros(n_rows, dtype=bool)
+        admin_activity: list[UUID | None] = [None] * n_rows
+
+        for row, s_i in enumerate(row_slots):
+            meta = slot_meta[s_i]
+            is_faculty = meta.get("person_type") == "faculty"
+            person = slots[s_i].person
+            template = templates_by_id.get(meta["template_id"])
+            pgy_level = meta.get("pgy_level") or 0
+            allow_cv = False
+
+            if is_faculty:
+                base, admin_activity[row] = self._faculty_allowed_activities(
+                    person,
+                    assignable_ids,
+                    at_activity,
+                    clinic_activity,
+                    cv_activity,
+                    vas_activity_ids,
+                )
+                if not base:
+                    base = list(faculty_allowed_ids)
+                for act_id in self._uncredentialed_activity_ids(
+                    person, base, activity_by_id
+                ):
+                    uncredentialed[row, columns[act_id]] = True
+                role = (getattr(person, "faculty_role", "") or "").lower()
+                oic[row] = role == "oic"
+                vas_allowed = self._is_vas_faculty(person)
+                vas_weight = self._vas_faculty_penalty(person) if vas_allowed else 0
+            else:
+                base = list(allowed_by_template.get(meta["template_id"]) or [])
+                if not base:
+                    if meta["template_id"]:
+                        logger.warning(
+                            f"No activity requirements for template "
+                            f"{meta['template_id']}, falling back to all "
+                            "assignable activities"
+                        )
+                    base = list(fallback_allowed)
+                allow_cv = bool(
+                    cv_id and template and template_is_fmc_clinic(template)
+                ) and (pgy_level >= 2)
+                if cv_activity and cv_activity.id in base and not allow_cv:
+                    base = [act_id for act_id in base if act_id != cv_activity.id]
+                if allow_cv and cv_activity.id not in base:
+                    base.append(cv_activity.id)
+                if not base:
+                    base = list(fallback_allowed)
+                    if cv_activity and cv_activity.id in base and not allow_cv:
+                        base = [act_id for act_id in base if act_id != cv_activity.id]
+                if pgy_level >= 3:
+                    cv_penalty[row] = CV_PENALTY_BY_ROLE["pgy3"]
+                elif pgy_level == 2:
+                    cv_penalty[row] = CV_PENALTY_BY_ROLE["pgy2"]
+                vas_allowed = self._is_vas_resident_template(template)
+                vas_weight = self._vas_resident_penalty(template) if vas_allowed else 0
+
+            variants: list[list[UUID]] = []
+            for vas_bit in (0, 1):
+                allowed = list(base)
+                if vas_activity_ids and any(
+                    act_id in vas_activity_ids for act_id in allowed
+                ):
+                    if not (vas_bit and vas_allowed):
+                        allowed = [
+                            act_id
+                            for act_id in allowed
+                            if act_id not in vas_activity_ids
+                        ]
+                    else:
+                        vas_penalty[row, vas_bit] = vas_weight
+                if not allowed:
+                    allowed = [
+                        act_id
+                        for act_id in fallback_allowed
+                        if act_id not in vas_activity_ids
+                        and (
+                            is_faculty
+                            or allow_cv
+                            or not cv_activity
+                            or act_id != cv_activity.id
+                        )
+                    ]
+                variants.append(allowed)
+                for act_id in allowed:
+                    row_masks[row, vas_bit, columns[act_id]] = True
+            row_allowed.append((variants[0], variants[1]))
+
+            for col in np.flatnonzero(row_masks[row].any(axis=0)):
+                capacity[row, col] = activity_counts_toward_fmc_capacity_for_template(
+                    activity_by_id[activity_ids[col]], template
+                )
+
+        return ActivityEligibility(
+            activity_ids=activity_ids,
+            columns=columns,
+            slot_rows=slot_rows,
+            slot_vas=slot_vas,
+            row_allowed=row_allowed,
+            row_masks=row_masks,
+            uncredentialed=uncredentialed,
+            capacity=capacity,
+            vas_penalty=vas_penalty,
+            cv_penalty=cv_penalty,
+            oic=oic,
+            admin_activity=admin_activity,
+        )
+
     def solve(
         self,
         block_number: int,
@@ -344,6 +607,15 @@ class CPSATActivitySolver:
             }
 
         start_time = time.time()
+        stage_timings: dict[str, float] = {}
+        stage_start = time.perf_counter()
+
+        def mark_stage(stage: str) -> None:
+            """Record seconds spent since the previous stage boundary."""
+            nonlocal stage_start
+            now = time.perf_counter()
+            stage_timings[stage] = round(now - stage_start, 4)
+            stage_start = now
 
         # Get block date range
         block_dates = get_block_dates(block_number, academic_year)
@@ -820,200 +1092,89 @@ class CPSATActivitySolver:
         clinic_preference_terms: list[tuple[Any, int]] = []
         credential_penalty_weight = self._get_credential_mismatch_penalty()
 
+        mark_stage("load")
+        eligibility = self._compile_eligibility(
+            slots,
+            slot_meta,
+            templates_by_id,
+            activity_by_id,
+            assignable_ids,
+            allowed_by_template,
+            fallback_allowed,
+            faculty_allowed_ids,
+            at_activity,
+            clinic_activity,
+            cv_activity,
+            vas_activity_ids,
+        )
+        mark_stage("compile_eligibility")
+        logger.info(
+            f"Compiled eligibility for {len(slots)} slots into "
+            f"{len(eligibility.row_allowed)} rows x "
+            f"{len(eligibility.activity_ids)} activities "
+            f"({int(eligibility.allowed.sum())} candidate variables)"
+        )
+
+        activity_ids = eligibility.activity_ids
+        var_codes = [
+            (activity_by_id[act_id].code or "act").replace("-", "_")
+            for act_id in activity_ids
+        ]
+        vas_mask = np.array([act_id in vas_activity_ids for act_id in activity_ids])
+        clinical_mask = np.array(
+            [act_id in clinic_preference_activity_ids for act_id in activity_ids]
+        )
+        cv_col = (
+            eligibility.columns.get(cv_activity.id) if cv_activity is not None else None
+        )
+
         for s_i, slot in enumerate(slots):
-            person_type = slot_meta[s_i].get("person_type")
-            template_id = slot_meta[s_i]["template_id"]
-            if person_type == "faculty":
-                allowed: list[UUID] = []
-                faculty = slot.person
-                uncredentialed_ids: set[UUID] = set()
-                if faculty:
-                    if at_activity and at_activity.id in assignable_ids:
-                        allowed.append(at_activity.id)
-
-                    admin_activity = self._get_admin_activity_for_faculty(
-                        faculty, self._activity_cache
-                    )
-                    if (
-                        admin_activity
-                        and admin_activity.id in assignable_ids
-                        and admin_activity.id not in allowed
-                    ):
-                        allowed.append(admin_activity.id)
-                        faculty_admin_activity_by_slot[s_i] = admin_activity.id
-
-                    if self._is_sports_medicine_faculty(faculty):
-                        sm_activity = self._get_activity_by_code(
-                            "sm_clinic"
-                        ) or self._get_activity_by_code("SM")
-                        if (
-                            sm_activity
-                            and sm_activity.id in assignable_ids
-                            and sm_activity.id not in allowed
-                        ):
-                            allowed.append(sm_activity.id)
-                            faculty_admin_activity_by_slot[s_i] = sm_activity.id
-
-                    min_c, max_c = self._get_faculty_clinic_caps(faculty)
-                    if clinic_activity and (max_c > 0 or min_c > 0):
-                        if clinic_activity.id in assignable_ids:
-                            allowed.append(clinic_activity.id)
-                            if (
-                                cv_activity
-                                and cv_activity.id in assignable_ids
-                                and cv_activity.id not in allowed
-                            ):
-                                allowed.append(cv_activity.id)
-                    if vas_activity_ids and faculty and self._is_vas_faculty(faculty):
-                        for vas_id in vas_activity_ids:
-                            if vas_id in assignable_ids and vas_id not in allowed:
-                                allowed.append(vas_id)
-                if not allowed:
-                    allowed = list(faculty_allowed_ids)
-                if faculty:
-                    uncredentialed_ids = self._uncredentialed_activity_ids(
-                        faculty, allowed, activity_by_id
-                    )
-            else:
-                allowed = list(allowed_by_template.get(template_id) or [])
-                if not allowed:
-                    if template_id:
-                        logger.warning(
-                            f"No activity requirements for template {template_id}, "
-                            "falling back to all assignable activities"
-                        )
-                    allowed = list(fallback_allowed)
-                template = templates_by_id.get(template_id)
-                pgy_level = slot_meta[s_i].get("pgy_level") or 0
-                allow_cv = False
-                if (
-                    cv_activity
-                    and cv_activity.id in assignable_ids
-                    and template
-                    and template_is_fmc_clinic(template)
-                    and pgy_level >= 2
-                ):
-                    allow_cv = True
-                if cv_activity and cv_activity.id in allowed and not allow_cv:
-                    allowed = [act_id for act_id in allowed if act_id != cv_activity.id]
-                if allow_cv and cv_activity and cv_activity.id not in allowed:
-                    allowed.append(cv_activity.id)
-                if not allowed:
-                    allowed = list(fallback_allowed)
-                    if cv_activity and cv_activity.id in allowed and not allow_cv:
-                        allowed = [
-                            act_id for act_id in allowed if act_id != cv_activity.id
-                        ]
-            vas_penalty_weight: int | None = None
-            if vas_activity_ids and any(
-                act_id in vas_activity_ids for act_id in allowed
-            ):
-                if not self._is_vas_allowed_slot(slot.date, slot.time_of_day):
-                    allowed = [
-                        act_id for act_id in allowed if act_id not in vas_activity_ids
-                    ]
-                elif person_type == "faculty":
-                    if not self._is_vas_faculty(slot.person):
-                        allowed = [
-                            act_id
-                            for act_id in allowed
-                            if act_id not in vas_activity_ids
-                        ]
-                    else:
-                        vas_penalty_weight = self._vas_faculty_penalty(slot.person)
-                else:
-                    template = templates_by_id.get(template_id)
-                    if not self._is_vas_resident_template(template):
-                        allowed = [
-                            act_id
-                            for act_id in allowed
-                            if act_id not in vas_activity_ids
-                        ]
-                    else:
-                        vas_penalty_weight = self._vas_resident_penalty(template)
-            if not allowed:
-                allowed = list(fallback_allowed)
-                if cv_activity and cv_activity.id in allowed:
-                    if person_type != "faculty":
-                        template = templates_by_id.get(template_id)
-                        pgy_level = slot_meta[s_i].get("pgy_level") or 0
-                        allow_cv = bool(
-                            cv_activity
-                            and cv_activity.id in assignable_ids
-                            and template
-                            and template_is_fmc_clinic(template)
-                            and pgy_level >= 2
-                        )
-                        if not allow_cv:
-                            allowed = [
-                                act_id for act_id in allowed if act_id != cv_activity.id
-                            ]
-                if vas_activity_ids and any(
-                    act_id in vas_activity_ids for act_id in allowed
-                ):
-                    allowed = [
-                        act_id for act_id in allowed if act_id not in vas_activity_ids
-                    ]
+            row = eligibility.slot_rows[s_i]
+            vas_bit = eligibility.slot_vas[s_i]
+            mask = eligibility.row_masks[row, vas_bit]
+            allowed = eligibility.allowed_ids(s_i)
             slot_allowed[s_i] = allowed
 
             for act_id in allowed:
-                act_code = (
-                    activity_by_id[act_id].code if act_id in activity_by_id else "act"
-                )
-                safe_code = act_code.replace("-", "_")
-                a[s_i, act_id] = model.NewBoolVar(f"a_{s_i}_{safe_code}")
-                if (
-                    person_type == "faculty"
-                    and credential_penalty_weight > 0
-                    and act_id in uncredentialed_ids
-                    and (s_i, act_id) in a
-                ):
+                col = eligibility.columns[act_id]
+                a[s_i, act_id] = model.NewBoolVar(f"a_{s_i}_{var_codes[col]}")
+
+            if credential_penalty_weight > 0:
+                for col in np.flatnonzero(mask & eligibility.uncredentialed[row]):
                     credential_penalty_terms.append(
-                        (a[s_i, act_id], credential_penalty_weight)
+                        (a[s_i, activity_ids[col]], credential_penalty_weight)
                     )
 
-            if vas_penalty_weight and vas_penalty_weight > 0:
-                for act_id in allowed:
-                    if act_id in vas_activity_ids and (s_i, act_id) in a:
-                        vas_penalty_terms.append((a[s_i, act_id], vas_penalty_weight))
-
-            if cv_activity and cv_activity.id in allowed:
-                if (s_i, cv_activity.id) in a:
-                    penalty_weight = 0
-                    if person_type == "faculty":
-                        penalty_weight = CV_PENALTY_BY_ROLE["faculty"]
-                    else:
-                        pgy_level = slot_meta[s_i].get("pgy_level") or 0
-                        if pgy_level >= 3:
-                            penalty_weight = CV_PENALTY_BY_ROLE["pgy3"]
-                        elif pgy_level == 2:
-                            penalty_weight = CV_PENALTY_BY_ROLE["pgy2"]
-                        if penalty_weight > 0:
-                            cv_penalty_terms.append(
-                                (a[s_i, cv_activity.id], penalty_weight)
-                            )
+            vas_penalty_weight = int(eligibility.vas_penalty[row, vas_bit])
+            if vas_penalty_weight > 0:
+                for col in np.flatnonzero(mask & vas_mask):
+                    vas_penalty_terms.append(
+                        (a[s_i, activity_ids[col]], vas_penalty_weight)
+                    )
+
+            cv_weight = int(eligibility.cv_penalty[row])
+            if cv_col is not None and cv_weight > 0 and mask[cv_col]:
+                cv_penalty_terms.append((a[s_i, cv_activity.id], cv_weight))
 
-            if person_type == "faculty" and slot.person:
-                role = (getattr(slot.person, "faculty_role", "") or "").lower()
+            admin_id = eligibility.admin_activity[row]
+            if admin_id is not None:
+                faculty_admin_activity_by_slot[s_i] = admin_id
+
+            if slot_meta[s_i].get("person_type") == "faculty" and slot.person:
                 if (
-                    role == "oic"
+                    eligibility.oic[row]
                     and slot_meta[s_i]["date"].weekday() in OIC_CLINIC_AVOID_DAYS
                 ):
-                    for act_id in allowed:
-                        activity = activity_by_id.get(act_id)  # type: ignore[assignment]
-                        if not activity or activity.activity_category != "clinical":
-                            continue
-                        if activity.provides_supervision:
-                            continue
-                        if (s_i, act_id) in a:
-                            oic_clinical_avoid_terms.append(
-                                (a[s_i, act_id], OIC_CLINICAL_AVOID_PENALTY)
-                            )
+                    for col in np.flatnonzero(mask & clinical_mask):
+                        oic_clinical_avoid_terms.append(
+                            (a[s_i, activity_ids[col]], OIC_CLINICAL_AVOID_PENALTY)
+                        )
 
                 preferences = clinic_preferences_by_person.get(slot.person.id, [])
                 if preferences:
                     slot_weekday = slot_meta[s_i]["date"].weekday()
                     slot_time = slot_meta[s_i]["time_of_day"]
+                    preferred_cols = np.flatnonzero(mask & clinical_mask)
                     for pref in preferences:
                         if pref.day_of_week != slot_weekday:
                             continue
@@ -1029,28 +1190,28 @@ class CPSATActivitySolver:
                             if pref.direction == FacultyPreferenceDirection.PREFER
                             else pref_weight
                         )
-                        for act_id in allowed:
-                            if act_id not in clinic_preference_activity_ids:
-                                continue
-                            if (s_i, act_id) in a:
-                                clinic_preference_terms.append((a[s_i, act_id], weight))
+                        for col in preferred_cols:
+                            clinic_preference_terms.append(
+                                (a[s_i, activity_ids[col]], weight)
+                            )
 
+        sm_capacity_mask = np.array(
+            [act_id in sm_capacity_ids for act_id in activity_ids]
+        )
         slot_capacity_ids: dict[int, list[UUID]] = {}
         slot_sm_capacity_ids: dict[int, list[UUID]] = {}
         for s_i, allowed in slot_allowed.items():
-            template = templates_by_id.get(slot_meta[s_i]["template_id"])
-            capacity_ids: list[UUID] = []
-            sm_ids: list[UUID] = []
-            for act_id in allowed:
-                activity = activity_by_id.get(act_id)  # type: ignore[assignment]
-                if not activity:
-                    continue
-                if activity_counts_toward_fmc_capacity_for_template(activity, template):
-                    capacity_ids.append(act_id)
-                    if activity_is_sm_capacity(activity):
-                        sm_ids.append(act_id)
-            slot_capacity_ids[s_i] = capacity_ids
-            slot_sm_capacity_ids[s_i] = sm_ids
+            capacity_row = eligibility.capacity[eligibility.slot_rows[s_i]]
+            slot_capacity_ids[s_i] = [
+                act_id
+                for act_id in allowed
+                if capacity_row[eligibility.columns[act_id]]
+            ]
+            slot_sm_capacity_ids[s_i] = [
+                act_id
+                for act_id in slot_capacity_ids[s_i]
+                if sm_capacity_mask[eligibility.columns[act_id]]
+            ]
 
             # ==================================================
             # CONSTRAINTS
@@ -1140,6 +1301,27 @@ class CPSATActivitySolver:
             defaultdict(lambda: {"clinic": 0, "cv": 0})
         )
 
+        # Per-activity / per-person predicates, evaluated once for all locked slots
+        cv_code_ids = {act.id for act in all_activities if self._is_cv_activity(act)}
+        fmc_clinic_ids = {
+            act.id for act in all_activities if self._is_fmc_clinic_activity(act)
+        }
+        sm_faculty_by_person: dict[UUID, bool] = {}
+        vas_faculty_by_person: dict[UUID, bool] = {}
+        is_vas_slot = cache(self._is_vas_allowed_slot)
+
+        def is_sm_faculty(person: Person) -> bool:
+            if person.id not in sm_faculty_by_person:
+                sm_faculty_by_person[person.id] = self._is_sports_medicine_faculty(
+                    person
+                )
+            return sm_faculty_by_person[person.id]
+
+        def is_vas_faculty(person: Person) -> bool:
+            if person.id not in vas_faculty_by_person:
+                vas_faculty_by_person[person.id] = self._is_vas_faculty(person)
+            return vas_faculty_by_person[person.id]
+
         for locked in locked_slots:
             if not locked.activity_id:
                 continue
@@ -1147,9 +1329,8 @@ class CPSATActivitySolver:
             day_of_week = locked.date.weekday()
             person_type = locked.person.type if locked.person else None
             slot_key = (locked.date, locked.time_of_day)
-            activity = activity_by_id.get(locked.activity_id)  # type: ignore[assignment]
-            is_cv = self._is_cv_activity(activity)
-            is_clinic = self._is_fmc_clinic_activity(activity)
+            is_cv = locked.activity_id in cv_code_ids
+            is_clinic = locked.activity_id in fmc_clinic_ids
             pgy_level = (
                 locked.person.pgy_level
                 if locked.person and locked.person.pgy_level
@@ -1188,7 +1369,7 @@ class CPSATActivitySolver:
                     sm_clinic_activity
                     and locked.activity_id == sm_clinic_activity.id
                     and locked.person
-                    and self._is_sports_medicine_faculty(locked.person)
+                    and is_sm_faculty(locked.person)
                 ):
                     baseline_sm_faculty_coverage[slot_key] += 1
                 # Identify VAS override candidates: VAS-credentialed faculty
@@ -1196,8 +1377,8 @@ class CPSATActivitySolver:
                 if (
                     vas_activity_ids
                     and locked.person
-                    and self._is_vas_faculty(locked.person)
-                    and self._is_vas_allowed_slot(locked.date, locked.time_of_day)
+                    and is_vas_faculty(locked.person)
+                    and is_vas_slot(locked.date, locked.time_of_day)
                 ):
                     override_idx = len(vas_override_candidates)
                     vas_override_candidates.append((override_idx, locked))
@@ -2068,7 +2249,7 @@ class CPSATActivitySolver:
                     slot_person = slots[s_i].person
                     if (
                         slot_person
-                        and self._is_sports_medicine_faculty(slot_person)
+                        and is_sm_faculty(slot_person)
                         and sm_clinic_activity.id in slot_allowed[s_i]
                     ):
                         sm_faculty_vars_by_slot[sm_key].append(
@@ -2293,7 +2474,7 @@ class CPSATActivitySolver:
                     a[s_i, act_id] * activity_capacity_units(activity_by_id.get(act_id))
                     for s_i in slot_indices
                     for act_id in slot_capacity_ids[s_i]
-                    if act_id not in set(slot_sm_capacity_ids[s_i])
+                    if act_id not in sm_capacity_ids
                 )
 
                 sm_vars = [
@@ -2709,11 +2890,17 @@ class CPSATActivitySolver:
         solver.parameters.max_time_in_seconds = self.timeout_seconds
         solver.parameters.num_search_workers = self.num_workers
 
+        mark_stage("build_model")
         status = solver.Solve(model)
+        mark_stage("solve")
         runtime = time.time() - start_time
 
         status_name = solver.StatusName(status)
         logger.info(f"Activity solver status: {status_name} ({runtime:.2f}s)")
+        logger.info(
+            "Activity solver stage timings: "
+            + ", ".join(f"{stage}={secs:.3f}s" for stage, secs in stage_timings.items())
+        )
 
         if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
             coverage_diagnostics = self._build_at_coverage_diagnostics(
@@ -2783,6 +2970,7 @@ class CPSATActivitySolver:
                     "status": "infeasible",
                     "solver_status": status_name,
                     "runtime_seconds": runtime,
+                    "stage_timings": stage_timings,
                     "block_number": block_number,
                     "academic_year": academic_year,
                     "start_date": str(start_date),
@@ -2846,6 +3034,7 @@ class CPSATActivitySolver:
                 "status": "infeasible",
                 "solver_status": status_name,
                 "runtime_seconds": runtime,
+                "stage_timings": stage_timings,
             }
 
             # ==================================================
@@ -2973,12 +3162,14 @@ class CPSATActivitySolver:
             )
             logger.info(f"Resident clinic equity range total: {res_eq_total}")
 
+        mark_stage("extract")
         return {
             "success": True,
             "assignments_updated": updated,
             "status": "optimal" if status == cp_model.OPTIMAL else "feasible",
             "solver_status": status_name,
             "runtime_seconds": runtime,
+            "stage_timings": stage_timings,
         }
 
     def _load_activities(self) -> list[Activity]:
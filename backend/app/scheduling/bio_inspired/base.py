@@ -164,6 +164,7 @@ from uuid import UUID
 import numpy as np
 
 from app.models.assignment import Assignment
+from app.multi_objective import pareto
 from app.scheduling.constraints import ConstraintManager, SchedulingContext
 from app.scheduling.solvers import BaseSolver, SolverResult
 from app.scheduling.bio_inspired.constants import (
@@ -529,6 +530,7 @@ class PopulationStats:
     pareto_front_size: int
     hypervolume: float  # Volume of dominated objective space
     convergence: float  # Distance to reference Pareto front
+    front_hypervolume: float = 0.0  # Hypervolume over all six objectives
 
     # Objective-specific statistics
     best_coverage: float = 0.0
@@ -553,6 +555,7 @@ class PopulationStats:
             "pareto_front_size": self.pareto_front_size,
             "hypervolume": self.hypervolume,
             "convergence": self.convergence,
+            "front_hypervolume": self.front_hypervolume,
             "best_coverage": self.best_coverage,
             "best_fairness": self.best_fairness,
             "best_acgme": self.best_acgme,
@@ -859,33 +862,28 @@ class BioInspiredSolver(BaseSolver, ABC):
         Args:
             population: Current population
         """
-        candidates = population + self.pareto_front
-
-        # Find non-dominated solutions
-        non_dominated = []
-        for ind in candidates:
-            if ind.fitness is None:
-                continue
-
-            dominated = False
-            for other in candidates:
-                if other.fitness is None or ind is other:
-                    continue
-                if other.fitness.dominates(ind.fitness):
-                    dominated = True
-                    break
-
-            if not dominated:
-                # Check if already in non_dominated (by fitness)
-                is_duplicate = any(
-                    np.allclose(ind.fitness.to_array(), nd.fitness.to_array())
-                    for nd in non_dominated
-                    if nd.fitness is not None
-                )
-                if not is_duplicate:
-                    non_dominated.append(ind.copy())
-
-        self.pareto_front = non_dominated
+        candidates = [
+            ind for ind in population + self.pareto_front if ind.fitness is not None
+        ]
+        if not candidates:
+            self.pareto_front = []
+            return
+
+        # Find non-dominated solutions (objectives are maximized)
+        values = np.array([ind.fitness.to_array() for ind in candidates])
+        front = np.flatnonzero(pareto.non_dominated_mask(-values))
+
+        # Drop duplicates by fitness, keeping the first occurrence
+        close = np.all(
+            np.isclose(values[front, np.newaxis, :], values[np.newaxis, front, :]),
+            axis=2,
+        )
+        kept: list[int] = []
+        for i in range(len(front)):
+            if not close[i, kept].any():
+                kept.append(i)
+
+        self.pareto_front = [candidates[front[i]].copy() for i in kept]
 
     def compute_population_stats(
         self,
@@ -971,8 +969,10 @@ class BioInspiredSolver(BaseSolver, ABC):
                 ],
                 ref_point,
             )
+            front_hypervolume = self._compute_front_hypervolume(self.pareto_front)
         else:
             hypervolume = 0.0
+            front_hypervolume = 0.0
 
         return PopulationStats(
             generation=generation,
@@ -985,6 +985,7 @@ class BioInspiredSolver(BaseSolver, ABC):
             pareto_front_size=len(self.pareto_front),
             hypervolume=hypervolume,
             convergence=1.0 - diversity,  # Inverse of diversity
+            front_hypervolume=front_hypervolume,
             best_coverage=best_coverage,
             best_fairness=best_fairness,
             best_acgme=best_acgme,
@@ -1011,18 +1012,27 @@ class BioInspiredSolver(BaseSolver, ABC):
         if not points:
             return 0.0
 
-            # Sort by first objective
-        sorted_points = sorted(points, key=lambda p: p[0], reverse=True)
+        # Objectives are maximized; the toolkit works in minimization form
+        return pareto.hypervolume(-np.array(points, dtype=float), -ref_point)
+
+    def _compute_front_hypervolume(self, front: list[Individual]) -> float:
+        """
+        Hypervolume of a front over all six objectives.
 
-        hypervolume = 0.0
-        prev_y: float = float(ref_point[1])
+        Uses the origin as reference point (objectives are in [0, 1]) and
+        the seeded Monte Carlo estimate, so it is cheap enough to track
+        every generation.
 
-        for x, y in sorted_points:
-            if y > prev_y:
-                hypervolume += (x - float(ref_point[0])) * (y - prev_y)
-                prev_y = y
+        Args:
+            front: Non-dominated individuals
 
-        return hypervolume
+        Returns:
+            Hypervolume value
+        """
+        values = [ind.fitness.to_array() for ind in front if ind.fitness]
+        if not values:
+            return 0.0
+        return pareto.hypervolume(-np.array(values), np.zeros(len(values[0])))
 
     def get_evolution_data(self) -> dict:
         """
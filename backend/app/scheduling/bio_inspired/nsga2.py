@@ -19,7 +19,6 @@ Key Features:
 from __future__ import annotations
 
 import logging
-import math
 import random
 import time
 from dataclasses import dataclass, field
@@ -27,6 +26,7 @@ from typing import Callable
 
 import numpy as np
 
+from app.multi_objective import pareto
 from app.scheduling.bio_inspired.base import (
     BioInspiredSolver,
     Chromosome,
@@ -255,42 +255,17 @@ class CrowdingDistance:
                 "continuity",
             ]
 
-            # Initialize distances
-        for ind in individuals:
-            ind.crowding_distance = 0.0
-
-            # Compute for each objective
-        for obj in objectives:
-            # Sort by this objective
-            sorted_inds = sorted(
-                individuals,
-                key=lambda ind: getattr(ind.fitness, obj) if ind.fitness else 0,
-            )
-
-            # Boundary points get infinite distance
-            sorted_inds[0].crowding_distance = float("inf")
-            sorted_inds[-1].crowding_distance = float("inf")
-
-            # Get objective range
-            if sorted_inds[0].fitness and sorted_inds[-1].fitness:
-                obj_min = getattr(sorted_inds[0].fitness, obj)
-                obj_max = getattr(sorted_inds[-1].fitness, obj)
-                obj_range = obj_max - obj_min
-            else:
-                obj_range = 0
-
-            if obj_range < 1e-10:
-                continue
-
-                # Compute distances for middle points
-            for i in range(1, len(sorted_inds) - 1):
-                if not math.isinf(sorted_inds[i].crowding_distance):
-                    if sorted_inds[i - 1].fitness and sorted_inds[i + 1].fitness:
-                        obj_prev = getattr(sorted_inds[i - 1].fitness, obj)
-                        obj_next = getattr(sorted_inds[i + 1].fitness, obj)
-                        sorted_inds[i].crowding_distance += (
-                            obj_next - obj_prev
-                        ) / obj_range
+        values = np.array(
+            [
+                [getattr(ind.fitness, obj) for obj in objectives]
+                if ind.fitness
+                else [0.0] * len(objectives)
+                for ind in individuals
+            ],
+            dtype=float,
+        ).reshape(len(individuals), len(objectives))
+        for ind, distance in zip(individuals, pareto.crowding_distance(values)):
+            ind.crowding_distance = float(distance)
 
         return individuals
 
@@ -481,8 +456,8 @@ class NSGA2Solver(BioInspiredSolver):
         """
         Perform fast non-dominated sorting.
 
-        Assigns rank to each individual based on Pareto dominance.
-        Time complexity: O(MN²) where M=objectives, N=population size.
+        Assigns rank to each individual based on Pareto dominance, using the
+        vectorized dominance matrix of the shared Pareto toolkit.
 
         Args:
             population: Population to sort
@@ -490,45 +465,26 @@ class NSGA2Solver(BioInspiredSolver):
         Returns:
             List of fronts (front 0 = non-dominated)
         """
-        n = len(population)
-        dominated_by: dict[int, list[int]] = {i: [] for i in range(n)}
-        domination_count: dict[int, int] = dict.fromkeys(range(n), 0)
-        fronts: list[list[Individual]] = [[]]
-
-        # Compare all pairs
-        for i, ind_i in enumerate(population):
-            for j, ind_j in enumerate(population):
-                if i == j:
-                    continue
-                if ind_i.fitness and ind_j.fitness:
-                    if ind_i.fitness.dominates(ind_j.fitness):
-                        dominated_by[i].append(j)
-                    elif ind_j.fitness.dominates(ind_i.fitness):
-                        domination_count[i] += 1
-
-                        # If not dominated by anyone, it's in front 0
-            if domination_count[i] == 0:
-                population[i].rank = 0
-                fronts[0].append(population[i])
-
-                # Build subsequent fronts
-        current_front = 0
-        while fronts[current_front]:
-            next_front = []
-            for ind in fronts[current_front]:
-                ind_idx = population.index(ind)
-                for dominated_idx in dominated_by[ind_idx]:
-                    domination_count[dominated_idx] -= 1
-                    if domination_count[dominated_idx] == 0:
-                        population[dominated_idx].rank = current_front + 1
-                        next_front.append(population[dominated_idx])
-            current_front += 1
-            fronts.append(next_front)
-
-            # Remove empty last front
-        if not fronts[-1]:
-            fronts.pop()
-
+        # Objectives are maximized; individuals without fitness compare as
+        # NaN, so they neither dominate nor are dominated
+        n_objectives = len(FitnessVector().to_array())
+        values = np.array(
+            [
+                -ind.fitness.to_array()
+                if ind.fitness
+                else np.full(n_objectives, np.nan)
+                for ind in population
+            ],
+            dtype=float,
+        ).reshape(len(population), n_objectives)
+        ranks = pareto.non_dominated_sort(values)
+
+        fronts: list[list[Individual]] = []
+        for indices in pareto.fronts_from_ranks(ranks):
+            front = [population[i] for i in indices]
+            for ind in front:
+                ind.rank = int(ranks[indices[0]])
+            fronts.append(front)
         return fronts
 
     def _assign_crowding_distance(self) -> None:
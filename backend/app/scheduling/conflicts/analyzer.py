@@ -6,6 +6,7 @@ It identifies time overlaps, resource contentions, ACGME violations, and other
 scheduling issues.
 """
 
+import asyncio
 import hashlib
 import logging
 import math
@@ -15,14 +16,10 @@ from datetime import date, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
-from app.models.activity import Activity
 from app.models.assignment import Assignment
-from app.models.block import Block
-from app.models.half_day_assignment import HalfDayAssignment
+from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
 from app.models.person import Person
 from app.utils.fmc_capacity import activity_is_proc_or_vas
 from app.utils.supervision import (
@@ -39,6 +36,7 @@ from app.scheduling.conflicts.types import (
     SupervisionConflict,
     TimeOverlapConflict,
 )
+from app.scheduling.conflicts.snapshot import ScheduleSnapshot, load_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -82,6 +80,7 @@ class ConflictAnalyzer:
         start_date: date,
         end_date: date,
         person_id: UUID | None = None,
+        use_cache: bool = True,
     ) -> list[Conflict]:
         """
         Comprehensive schedule conflict analysis.
@@ -90,10 +89,14 @@ class ConflictAnalyzer:
         types of conflicts. If person_id is provided, only analyze conflicts
         affecting that person.
 
+        Results are cached per range; after an edit only the people and
+        dates it touched are re-checked (see ``conflicts.cache``).
+
         Args:
             start_date: Start of analysis period
             end_date: End of analysis period
             person_id: Optional person to focus analysis on
+            use_cache: Reuse and update the per-range result cache
 
         Returns:
             List of detected conflicts, sorted by severity and urgency
@@ -103,26 +106,20 @@ class ConflictAnalyzer:
             + (f" for person {person_id}" if person_id else "")
         )
 
-        conflicts: list[Conflict] = []
-
-        # Detect different types of conflicts
-        time_overlaps = await self._detect_time_overlaps(
-            start_date, end_date, person_id
-        )
-        conflicts.extend(time_overlaps)
-
-        supervision_issues = await self._detect_supervision_issues(start_date, end_date)
-        conflicts.extend(supervision_issues)
-
-        acgme_violations = await self._detect_acgme_violations(
-            start_date, end_date, person_id
-        )
-        conflicts.extend(acgme_violations)
+        if use_cache:
+            from app.scheduling.conflicts.cache import conflict_cache
 
-        resource_contentions = await self._detect_resource_contentions(
-            start_date, end_date
-        )
-        conflicts.extend(resource_contentions)
+            conflicts = await conflict_cache.analyze(
+                self, start_date, end_date, person_id
+            )
+        else:
+            snapshot = await load_snapshot(
+                self.db,
+                start_date,
+                end_date,
+                people={person_id} if person_id else None,
+            )
+            conflicts = await self.run_detectors(snapshot)
 
         # Sort by severity and urgency
         conflicts = self._sort_conflicts(conflicts)
@@ -130,11 +127,32 @@ class ConflictAnalyzer:
         logger.info(f"Detected {len(conflicts)} total conflicts")
         return conflicts
 
-    async def _detect_time_overlaps(
+    async def run_detectors(self, snapshot: ScheduleSnapshot) -> list[Conflict]:
+        """
+        Run every detector against one loaded snapshot.
+
+        The detectors only read the snapshot, so they run concurrently in
+        worker threads and keep the event loop free.
+
+        Args:
+            snapshot: Schedule data for the analysis period
+
+        Returns:
+            Unsorted list of detected conflicts
+        """
+        self._time_off_slots = self._time_off_slots_from(snapshot.half_days)
+
+        results = await asyncio.gather(
+            asyncio.to_thread(self._detect_time_overlaps, snapshot),
+            asyncio.to_thread(self._detect_supervision_issues, snapshot),
+            asyncio.to_thread(self._detect_acgme_violations, snapshot),
+            asyncio.to_thread(self._detect_resource_contentions, snapshot),
+        )
+        return [conflict for detected in results for conflict in detected]
+
+    def _detect_time_overlaps(
         self,
-        start_date: date,
-        end_date: date,
-        person_id: UUID | None = None,
+        snapshot: ScheduleSnapshot,
     ) -> list[TimeOverlapConflict]:
         """
         Detect time overlap conflicts (double booking).
@@ -142,33 +160,13 @@ class ConflictAnalyzer:
         Finds cases where a person is assigned to multiple blocks at the same time.
 
         Args:
-            start_date: Start of analysis period
-            end_date: End of analysis period
-            person_id: Optional person to focus on
+            snapshot: Schedule data for the analysis period
 
         Returns:
             List of time overlap conflicts
         """
         conflicts: list[TimeOverlapConflict] = []
-
-        # Build query
-        query = (
-            select(Assignment)
-            .join(Block)
-            .options(selectinload(Assignment.person), selectinload(Assignment.block))
-            .where(
-                and_(
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-        )
-
-        if person_id:
-            query = query.where(Assignment.person_id == person_id)
-
-        result = await self.db.execute(query)
-        assignments = result.scalars().all()
+        assignments = snapshot.assignments
 
         # Group assignments by person and block
         by_person_and_block: dict[tuple[UUID, UUID], list[Assignment]] = defaultdict(
@@ -221,53 +219,29 @@ class ConflictAnalyzer:
 
         return conflicts
 
-    async def _detect_supervision_issues(
+    def _detect_supervision_issues(
         self,
-        start_date: date,
-        end_date: date,
+        snapshot: ScheduleSnapshot,
     ) -> list[SupervisionConflict]:
         """
         Detect supervision ratio violations.
 
         Checks each block to ensure adequate faculty-to-resident ratios
-        based on PGY levels.
+        based on PGY levels. Only slots whose half-day assignments are all
+        in the snapshot are checked.
 
         Args:
-            start_date: Start of analysis period
-            end_date: End of analysis period
+            snapshot: Schedule data for the analysis period
 
         Returns:
             List of supervision conflicts
         """
         conflicts: list[SupervisionConflict] = []
 
-        # Load blocks for date/time lookup
-        block_result = await self.db.execute(
-            select(Block).where(
-                and_(
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-        )
-        blocks = block_result.scalars().all()
-        blocks_by_key = {(b.date, b.time_of_day): b for b in blocks}
-
-        # Get half-day assignments with activity context
-        result = await self.db.execute(
-            select(HalfDayAssignment)
-            .options(
-                selectinload(HalfDayAssignment.person),
-                selectinload(HalfDayAssignment.activity),
-            )
-            .where(
-                and_(
-                    HalfDayAssignment.date >= start_date,
-                    HalfDayAssignment.date <= end_date,
-                )
-            )
-        )
-        assignments = result.scalars().all()
+        blocks_by_key = {(b.date, b.time_of_day): b for b in snapshot.blocks}
+        assignments = [
+            a for a in snapshot.half_days if snapshot.covers_slot_date(a.date)
+        ]
 
         by_slot: dict[tuple[date, str], dict[str, Any]] = defaultdict(
             lambda: {
@@ -365,11 +339,9 @@ class ConflictAnalyzer:
 
         return conflicts
 
-    async def _detect_acgme_violations(
+    def _detect_acgme_violations(
         self,
-        start_date: date,
-        end_date: date,
-        person_id: UUID | None = None,
+        snapshot: ScheduleSnapshot,
     ) -> list[ACGMEViolationConflict]:
         """
         Detect ACGME compliance violations.
@@ -380,48 +352,42 @@ class ConflictAnalyzer:
         - Excessive consecutive days
 
         Args:
-            start_date: Start of analysis period
-            end_date: End of analysis period
-            person_id: Optional person to focus on
+            snapshot: Schedule data for the analysis period
 
         Returns:
             List of ACGME violation conflicts
         """
         conflicts: list[ACGMEViolationConflict] = []
 
-        # Preload time-off slots (source of truth for duty hour exclusions)
-        self._time_off_slots = await self._load_time_off_slots(
-            start_date, end_date, person_id
-        )
-
-        # Get residents
-        query = select(Person).where(Person.type == "resident")
-        if person_id:
-            query = query.where(Person.id == person_id)
-
-        result = await self.db.execute(query)
-        residents = result.scalars().all()
+        for resident in snapshot.residents:
+            assignments = snapshot.assignments_by_person.get(resident.id, [])
+            fixed_blocks_by_date = self._fixed_half_day_blocks_by_date(
+                snapshot.half_days_by_person.get(resident.id, [])
+            )
 
-        for resident in residents:
             # Check 80-hour rule
-            hour_violations = await self._check_eighty_hour_rule(
-                resident, start_date, end_date
+            hour_violations = self._check_eighty_hour_rule(
+                resident, assignments, fixed_blocks_by_date
             )
             conflicts.extend(hour_violations)
 
             # Check 1-in-7 rule
-            consecutive_violations = await self._check_one_in_seven_rule(
-                resident, start_date, end_date
+            consecutive_violations = self._check_one_in_seven_rule(
+                resident,
+                assignments,
+                fixed_blocks_by_date,
+                snapshot.start_date,
+                snapshot.end_date,
             )
             conflicts.extend(consecutive_violations)
 
         return conflicts
 
-    async def _check_eighty_hour_rule(
+    def _check_eighty_hour_rule(
         self,
         resident: Person,
-        start_date: date,
-        end_date: date,
+        assignments: list[Assignment],
+        fixed_blocks_by_date: dict[date, int],
     ) -> list[ACGMEViolationConflict]:
         """
         Check for 80-hour work week violations.
@@ -430,32 +396,14 @@ class ConflictAnalyzer:
 
         Args:
             resident: Resident to check
-            start_date: Start of analysis period
-            end_date: End of analysis period
+            assignments: Resident's block assignments in the period
+            fixed_blocks_by_date: Resident's fixed workload blocks per date
 
         Returns:
             List of 80-hour violations
         """
         violations: list[ACGMEViolationConflict] = []
 
-        # Get assignments
-        result = await self.db.execute(
-            select(Assignment)
-            .join(Block)
-            .where(
-                and_(
-                    Assignment.person_id == resident.id,
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-            .options(
-                selectinload(Assignment.block),
-                selectinload(Assignment.rotation_template),
-            )
-        )
-        assignments = result.scalars().all()
-
         # Group by date
         blocks_by_date: dict[date, int] = defaultdict(int)
         for assignment in assignments:
@@ -463,10 +411,6 @@ class ConflictAnalyzer:
                 continue
             blocks_by_date[assignment.block.date] += 1
 
-        fixed_blocks_by_date = await self._fixed_half_day_blocks_by_date(
-            resident.id, start_date, end_date
-        )
-
         if not blocks_by_date:
             return violations
 
@@ -546,9 +490,11 @@ class ConflictAnalyzer:
 
         return violations
 
-    async def _check_one_in_seven_rule(
+    def _check_one_in_seven_rule(
         self,
         resident: Person,
+        assignments: list[Assignment],
+        fixed_blocks_by_date: dict[date, int],
         start_date: date,
         end_date: date,
     ) -> list[ACGMEViolationConflict]:
@@ -559,6 +505,8 @@ class ConflictAnalyzer:
 
         Args:
             resident: Resident to check
+            assignments: Resident's block assignments in the period
+            fixed_blocks_by_date: Resident's fixed workload blocks per date
             start_date: Start of analysis period
             end_date: End of analysis period
 
@@ -567,37 +515,13 @@ class ConflictAnalyzer:
         """
         violations: list[ACGMEViolationConflict] = []
 
-        # Get assignments
-        result = await self.db.execute(
-            select(Assignment)
-            .join(Block)
-            .where(
-                and_(
-                    Assignment.person_id == resident.id,
-                    Block.date >= start_date,
-                    Block.date <= end_date,
-                )
-            )
-            .options(
-                selectinload(Assignment.block),
-                selectinload(Assignment.rotation_template),
-            )
-        )
-        assignments = result.scalars().all()
-
         # Get unique dates worked
         dates_worked = set(
             assignment.block.date
             for assignment in assignments
             if self._counts_toward_duty_hours(assignment)
         )
-        fixed_dates_worked = set(
-            (
-                await self._fixed_half_day_blocks_by_date(
-                    resident.id, start_date, end_date
-                )
-            ).keys()
-        )
+        fixed_dates_worked = set(fixed_blocks_by_date.keys())
 
         if len(dates_worked) < self.MAX_CONSECUTIVE_DAYS + 1:
             return violations
@@ -666,10 +590,9 @@ class ConflictAnalyzer:
 
         return violations
 
-    async def _detect_resource_contentions(
+    def _detect_resource_contentions(
         self,
-        start_date: date,
-        end_date: date,
+        snapshot: ScheduleSnapshot,
     ) -> list[ResourceContentionConflict]:
         """
         Detect resource contention issues.
@@ -678,8 +601,7 @@ class ConflictAnalyzer:
         (rooms, equipment, etc.)
 
         Args:
-            start_date: Start of analysis period
-            end_date: End of analysis period
+            snapshot: Schedule data for the analysis period
 
         Returns:
             List of resource contention conflicts
@@ -687,36 +609,21 @@ class ConflictAnalyzer:
         # Placeholder - to be implemented based on resource tracking requirements
         return []
 
-    async def _fixed_half_day_blocks_by_date(
-        self, resident_id: UUID, start_date: date, end_date: date
+    def _fixed_half_day_blocks_by_date(
+        self, half_days: list[HalfDayAssignment]
     ) -> dict[date, int]:
         """Return fixed workload blocks per date from preload/manual half-day assignments."""
-        from app.models.half_day_assignment import HalfDayAssignment, AssignmentSource
-        from app.models.activity import Activity
-
-        result = await self.db.execute(
-            select(
-                HalfDayAssignment.date,
-                Activity.code,
-                Activity.display_abbreviation,
-                Activity.activity_category,
-            )
-            .join(Activity, HalfDayAssignment.activity_id == Activity.id)
-            .where(
-                and_(
-                    HalfDayAssignment.person_id == resident_id,
-                    HalfDayAssignment.date >= start_date,
-                    HalfDayAssignment.date <= end_date,
-                    HalfDayAssignment.source.in_(
-                        [
-                            AssignmentSource.PRELOAD.value,
-                            AssignmentSource.MANUAL.value,
-                        ]
-                    ),
-                )
+        fixed_sources = {AssignmentSource.PRELOAD.value, AssignmentSource.MANUAL.value}
+        rows = [
+            (
+                half_day.date,
+                half_day.activity.code,
+                half_day.activity.display_abbreviation,
+                half_day.activity.activity_category,
             )
-        )
-        rows = result.all()
+            for half_day in half_days
+            if half_day.activity and half_day.source in fixed_sources
+        ]
         fixed_prefixes = ("FMIT", "ICU", "NICU", "NIC", "LAD", "NBN", "IM", "PEDW")
         offsite_prefixes = ("HILO", "OKI", "KAP", "KAPI", "TDY")
         fixed_exact = {"TAMC-LD", "TAMC_LD"}
@@ -785,49 +692,24 @@ class ConflictAnalyzer:
 
         return rotation_type in {"inpatient", "off"}
 
-    async def _load_time_off_slots(
-        self,
-        start_date: date,
-        end_date: date,
-        person_id: UUID | None = None,
+    def _time_off_slots_from(
+        self, half_days: list[HalfDayAssignment]
     ) -> set[tuple[str, date, str]]:
-        """Load time-off slots from half-day assignments."""
-        query = (
-            select(
-                HalfDayAssignment.person_id,
-                HalfDayAssignment.date,
-                HalfDayAssignment.time_of_day,
-                Activity.code,
-                Activity.display_abbreviation,
-                Activity.activity_category,
-            )
-            .join(Activity, HalfDayAssignment.activity_id == Activity.id)
-            .where(
-                and_(
-                    HalfDayAssignment.date >= start_date,
-                    HalfDayAssignment.date <= end_date,
-                )
-            )
-        )
-
-        if person_id:
-            query = query.where(HalfDayAssignment.person_id == person_id)
-
-        result = await self.db.execute(query)
-        rows = result.all()
-
+        """Collect time-off slots from half-day assignments."""
         slots: set[tuple[str, date, str]] = set()
-        for row in rows:
-            person_id_val, slot_date, time_of_day, code, display, category = row
-            cat = (category or "").lower()
-            code_norm = (code or "").strip().upper()
-            display_norm = (display or "").strip().upper()
+        for half_day in half_days:
+            activity = half_day.activity
+            if not activity:
+                continue
+            cat = (activity.activity_category or "").lower()
+            code_norm = (activity.code or "").strip().upper()
+            display_norm = (activity.display_abbreviation or "").strip().upper()
             if (
                 cat == "time_off"
                 or code_norm in self._time_off_codes
                 or display_norm in self._time_off_codes
             ):
-                slots.add((str(person_id_val), slot_date, time_of_day))
+                slots.add((str(half_day.person_id), half_day.date, half_day.time_of_day))
 
         return slots
 
@@ -0,0 +1,405 @@
+"""
+Incremental per-range cache of conflict analysis results.
+
+``ConflictAnalyzer.analyze_schedule`` keeps its results here, keyed by
+(start_date, end_date, person_id) per database engine. Conflicts are stored
+by what they depend on:
+
+- double bookings and ACGME violations by person
+- supervision ratio violations by date
+
+Session listeners turn committed ``Assignment`` and ``HalfDayAssignment``
+changes into (person, date) events. The next analysis of a cached range
+reloads only the touched people and dates, re-runs the detectors on that
+partial snapshot, and merges the result. The cached result is reused as is
+when nothing changed.
+
+Each read also compares a cheap per-person fingerprint of the range (row
+counts and latest ``updated_at``). People with events are expected to
+differ; a difference for anyone else is a change that arrived without an
+event, such as another worker's write, and forces a full re-analysis.
+Entries also expire after ``CONFLICT_CACHE_TTL_SECONDS``.
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+from weakref import WeakKeyDictionary
+
+from sqlalchemy import func, select
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from app.db.base import Base
+from app.db.change_tracking import (
+    PendingChanges,
+    bulk_write_mapper,
+    collect_flush_changes,
+    register_listeners,
+)
+from app.models.activity import Activity
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.half_day_assignment import HalfDayAssignment
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+from app.scheduling.conflicts.snapshot import load_snapshot
+from app.scheduling.conflicts.types import (
+    ACGMEViolationConflict,
+    Conflict,
+    SupervisionConflict,
+    TimeOverlapConflict,
+)
+
+if TYPE_CHECKING:
+    from app.scheduling.conflicts.analyzer import ConflictAnalyzer
+
+logger = logging.getLogger(__name__)
+
+CONFLICT_CACHE_TTL_SECONDS = 300.0
+
+# Cached ranges kept per engine (least recently used are dropped)
+_MAX_ENTRIES = 64
+
+# Models whose edits can change any cached result
+_STRUCTURAL_MODELS = (Activity, Block, Person, RotationTemplate)
+
+_pending_changes = PendingChanges("conflict_cache_changes")
+
+# A change whose date could not be resolved
+_UNKNOWN = object()
+
+
+@dataclass
+class _Entry:
+    """Cached conflicts for one range, grouped by what they depend on."""
+
+    fingerprint: dict[tuple, tuple]
+    built_at: float
+    by_person: dict[UUID, list[Conflict]] = field(default_factory=dict)
+    by_date: dict[date, list[Conflict]] = field(default_factory=dict)
+    other: list[Conflict] = field(default_factory=list)
+    dirty_people: set[UUID] = field(default_factory=set)
+    dirty_dates: set[date] = field(default_factory=set)
+
+    def add(self, conflicts: list[Conflict]) -> None:
+        for conflict in conflicts:
+            if isinstance(conflict, SupervisionConflict):
+                self.by_date.setdefault(conflict.start_date, []).append(conflict)
+            elif (
+                isinstance(conflict, (TimeOverlapConflict, ACGMEViolationConflict))
+                and conflict.affected_people
+            ):
+                self.by_person.setdefault(conflict.affected_people[0], []).append(
+                    conflict
+                )
+            else:
+                self.other.append(conflict)
+
+    def conflicts(self) -> list[Conflict]:
+        merged = list(self.other)
+        for group in self.by_person.values():
+            merged.extend(group)
+        for group in self.by_date.values():
+            merged.extend(group)
+        return merged
+
+
+class ConflictCache:
+    """
+    Per-range conflict results kept current by assignment-change events.
+
+    Attributes:
+        ttl_seconds: Age after which an entry is rebuilt from scratch
+    """
+
+    def __init__(self, ttl_seconds: float = CONFLICT_CACHE_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._entries: WeakKeyDictionary[Engine, OrderedDict[tuple, _Entry]] = (
+            WeakKeyDictionary()
+        )
+        self._stats = {"hits": 0, "incremental": 0, "full": 0}
+
+    async def analyze(
+        self,
+        analyzer: "ConflictAnalyzer",
+        start_date: date,
+        end_date: date,
+        person_id: UUID | None = None,
+    ) -> list[Conflict]:
+        """
+        Get conflicts for a range, re-checking only what changed.
+
+        Args:
+            analyzer: Analyzer whose session and detectors to use
+            start_date: Start of analysis period
+            end_date: End of analysis period
+            person_id: Optional person to focus analysis on
+
+        Returns:
+            Unsorted list of conflicts for the range
+        """
+        db = analyzer.db
+        bind = _engine_of(db)
+        key = (start_date, end_date, person_id)
+        fingerprint = await _fingerprint(db, start_date, end_date)
+
+        with self._lock:
+            entries = self._entries.get(bind) if bind is not None else None
+            entry = entries.get(key) if entries is not None else None
+            if entry is not None:
+                entries.move_to_end(key)
+                people, dates = entry.dirty_people, entry.dirty_dates
+                entry.dirty_people, entry.dirty_dates = set(), set()
+
+        if entry is not None and time.monotonic() - entry.built_at < self.ttl_seconds:
+            if not (people or dates):
+                if entry.fingerprint == fingerprint:
+                    self._stats["hits"] += 1
+                    return entry.conflicts()
+            elif _unchanged_except(entry.fingerprint, fingerprint, people):
+                await self._refresh(analyzer, entry, key, people, dates)
+                entry.fingerprint = fingerprint
+                self._stats["incremental"] += 1
+                return entry.conflicts()
+
+        # Missing, expired, or changed without an event: rebuild
+        snapshot = await load_snapshot(
+            db, start_date, end_date, people={person_id} if person_id else None
+        )
+        entry = _Entry(fingerprint=fingerprint, built_at=time.monotonic())
+        entry.add(await analyzer.run_detectors(snapshot))
+        self._stats["full"] += 1
+
+        if bind is not None:
+            with self._lock:
+                entries = self._entries.setdefault(bind, OrderedDict())
+                entries[key] = entry
+                while len(entries) > _MAX_ENTRIES:
+                    entries.popitem(last=False)
+        return entry.conflicts()
+
+    async def _refresh(
+        self,
+        analyzer: "ConflictAnalyzer",
+        entry: _Entry,
+        key: tuple,
+        people: set[UUID],
+        dates: set[date],
+    ) -> None:
+        """Re-check the touched people and dates and merge into ``entry``."""
+        start_date, end_date, person_id = key
+        if person_id is not None:
+            people = people & {person_id}
+
+        snapshot = await load_snapshot(
+            analyzer.db, start_date, end_date, people=people, dates=dates
+        )
+        conflicts = await analyzer.run_detectors(snapshot)
+
+        for touched in people:
+            entry.by_person.pop(touched, None)
+        for touched in dates:
+            entry.by_date.pop(touched, None)
+        entry.add(conflicts)
+        logger.debug(
+            f"Refreshed conflicts for {start_date} to {end_date}: "
+            f"{len(people)} people, {len(dates)} dates"
+        )
+
+    def record_changes(self, bind: Engine, changes: set[tuple[Any, Any]]) -> None:
+        """
+        Mark the cached results a commit's changes affect.
+
+        Args:
+            bind: Engine the changes were committed to
+            changes: (person_id, date) pairs; a date of ``_UNKNOWN``
+                invalidates every range for the engine
+        """
+        with self._lock:
+            entries = self._entries.get(bind)
+            if not entries:
+                return
+            if any(changed_date is _UNKNOWN for _, changed_date in changes):
+                entries.clear()
+                return
+            for (start_date, end_date, _), entry in entries.items():
+                for person_id, changed_date in changes:
+                    if start_date <= changed_date <= end_date:
+                        entry.dirty_people.add(person_id)
+                        entry.dirty_dates.add(changed_date)
+
+    def has_entries(self, bind: Engine | None) -> bool:
+        """Whether any results are cached for an engine."""
+        return bind is not None and bool(self._entries.get(bind))
+
+    def invalidate(self, bind: Engine | None = None) -> None:
+        """Drop cached results for one engine, or for all engines."""
+        with self._lock:
+            if bind is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(bind, None)
+
+    def get_stats(self) -> dict[str, int]:
+        """Get hit, incremental-refresh and full-rebuild counts."""
+        with self._lock:
+            return {
+                **self._stats,
+                "entries": sum(len(e) for e in self._entries.values()),
+            }
+
+
+conflict_cache = ConflictCache()
+
+
+def _engine_of(session: Any) -> Engine | None:
+    """The engine a (sync or async) session writes to, if unambiguous."""
+    try:
+        bind = session.get_bind()
+    except Exception:
+        return None
+    return getattr(bind, "engine", bind)
+
+
+async def _fingerprint(db: Any, start_date: date, end_date: date) -> dict[tuple, tuple]:
+    """Per person, row counts and latest update times of the range's assignments."""
+    assignments = (
+        select(
+            Assignment.person_id,
+            func.count(Assignment.id),
+            func.max(Assignment.updated_at),
+        )
+        .join(Block, Assignment.block_id == Block.id)
+        .where(Block.date >= start_date, Block.date <= end_date)
+        .group_by(Assignment.person_id)
+    )
+    half_days = (
+        select(
+            HalfDayAssignment.person_id,
+            func.count(HalfDayAssignment.id),
+            func.max(HalfDayAssignment.updated_at),
+        )
+        .where(
+            HalfDayAssignment.date >= start_date, HalfDayAssignment.date <= end_date
+        )
+        .group_by(HalfDayAssignment.person_id)
+    )
+    fingerprint: dict[tuple, tuple] = {}
+    for table, query in (("assignments", assignments), ("half_days", half_days)):
+        for person_id, count, updated_at in await db.execute(query):
+            fingerprint[(table, person_id)] = (count, updated_at)
+    return fingerprint
+
+
+def _unchanged_except(
+    cached: dict[tuple, tuple], current: dict[tuple, tuple], people: set[UUID]
+) -> bool:
+    """
+    Whether only ``people``'s rows changed since ``cached`` was taken.
+
+    The incremental refresh reloads the changed people, so their rows may
+    differ. A difference for anyone else is a change that arrived without an
+    event and requires a full rebuild.
+    """
+
+    def others(fingerprint: dict[tuple, tuple]) -> dict[tuple, tuple]:
+        return {
+            key: value for key, value in fingerprint.items() if key[1] not in people
+        }
+
+    return others(cached) == others(current)
+
+
+def _after_flush(session: Session, flush_context: Any) -> None:
+    """Collect the (person, date) pairs a flush touched until commit."""
+    bind = _engine_of(session)
+    if not conflict_cache.has_entries(bind):
+        return
+
+    half_days = collect_flush_changes(session, HalfDayAssignment, ("person_id", "date"))
+    assignments = collect_flush_changes(session, Assignment, ("person_id", "block_id"))
+    pending: set[tuple[Any, Any]] = {
+        (person_id, slot_date)
+        for row in half_days.rows
+        for person_id in row["person_id"]
+        for slot_date in row["date"]
+    }
+    if (
+        half_days.unresolved
+        or assignments.unresolved
+        or any(
+            isinstance(obj, _STRUCTURAL_MODELS)
+            for obj in (*assignments.dirty, *assignments.deleted)
+        )
+    ):
+        pending.add((None, _UNKNOWN))
+
+    block_people: dict[Any, set[Any]] = {}
+    for row in assignments.rows:
+        for block_id in row["block_id"]:
+            block_people.setdefault(block_id, set()).update(row["person_id"])
+    if block_people:
+        rows = session.connection().execute(
+            select(Block.id, Block.date).where(Block.id.in_(list(block_people)))
+        )
+        dates = {block_id: block_date for block_id, block_date in rows}
+        for block_id, people in block_people.items():
+            block_date = dates.get(block_id, _UNKNOWN)
+            pending.update((person_id, block_date) for person_id in people)
+
+    if pending:
+        _pending_changes.add(session, pending)
+
+
+def _after_commit(session: Session) -> None:
+    """Apply a committed transaction's changes to the cache."""
+    changes = _pending_changes.pop(session)
+    if changes:
+        bind = _engine_of(session)
+        if bind is not None:
+            conflict_cache.record_changes(bind, changes)
+
+
+def _after_transaction_end(session: Session, transaction: Any) -> None:
+    """Drop changes left by a rolled-back transaction."""
+    if transaction.parent is None:
+        _pending_changes.pop(session)
+
+
+def _on_orm_execute(orm_execute_state: ORMExecuteState) -> None:
+    """Drop cached results before ORM bulk writes to schedule tables."""
+    if bulk_write_mapper(
+        orm_execute_state, (Assignment, HalfDayAssignment, *_STRUCTURAL_MODELS)
+    ):
+        conflict_cache.invalidate(_engine_of(orm_execute_state.session))
+
+
+def _after_create(target: Any, connection: Any, **kwargs: Any) -> None:
+    """A (re)created schema invalidates everything cached for it."""
+    conflict_cache.invalidate(connection.engine)
+
+
+def register_conflict_cache_listeners() -> None:
+    """Install the listeners that keep cached conflicts current (idempotent)."""
+    register_listeners(
+        Session,
+        {
+            "after_flush": _after_flush,
+            "after_commit": _after_commit,
+            "after_transaction_end": _after_transaction_end,
+            "do_orm_execute": _on_orm_execute,
+        },
+    )
+    register_listeners(Base.metadata, {"after_create": _after_create})
+
+
+# Nothing is cached before this module is imported, so registering here is
+# early enough to see every change to a cached range
+register_conflict_cache_listeners()
@@ -0,0 +1,157 @@
+"""
+Shared schedule snapshot for conflict detection.
+
+Every conflict detector reads from one ``ScheduleSnapshot`` loaded with a
+handful of queries, instead of each detector (and each resident) issuing
+its own queries over the same date range. Snapshots can also be loaded for
+just the people and dates an edit touched, which is what incremental
+re-analysis uses.
+"""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date
+from functools import cached_property
+from uuid import UUID
+
+from sqlalchemy import and_, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.half_day_assignment import HalfDayAssignment
+from app.models.person import Person
+
+
+@dataclass
+class ScheduleSnapshot:
+    """
+    Schedule data for one conflict analysis.
+
+    All relationships the detectors touch are eagerly loaded, so detectors
+    can run off the event loop without lazy loads.
+
+    Attributes:
+        start_date: First date covered
+        end_date: Last date covered
+        people: People whose assignments were loaded (None = everyone)
+        dates: Dates whose half-day slots were fully loaded (None = all)
+        assignments: Block assignments of ``people`` in range
+        half_days: Half-day assignments of ``people`` or on ``dates``
+        blocks: Blocks on ``dates`` in range
+        residents: Residents among ``people``
+    """
+
+    start_date: date
+    end_date: date
+    people: set[UUID] | None
+    dates: set[date] | None
+    assignments: list[Assignment] = field(default_factory=list)
+    half_days: list[HalfDayAssignment] = field(default_factory=list)
+    blocks: list[Block] = field(default_factory=list)
+    residents: list[Person] = field(default_factory=list)
+
+    @cached_property
+    def assignments_by_person(self) -> dict[UUID, list[Assignment]]:
+        """Block assignments grouped by person."""
+        grouped: dict[UUID, list[Assignment]] = defaultdict(list)
+        for assignment in self.assignments:
+            grouped[assignment.person_id].append(assignment)
+        return grouped
+
+    @cached_property
+    def half_days_by_person(self) -> dict[UUID, list[HalfDayAssignment]]:
+        """Half-day assignments grouped by person."""
+        grouped: dict[UUID, list[HalfDayAssignment]] = defaultdict(list)
+        for half_day in self.half_days:
+            grouped[half_day.person_id].append(half_day)
+        return grouped
+
+    def covers_slot_date(self, slot_date: date) -> bool:
+        """Whether every half-day assignment on ``slot_date`` was loaded."""
+        return self.dates is None or slot_date in self.dates
+
+
+def _in(column, values: set | None):
+    """``column IN values``, or no restriction when ``values`` is None."""
+    if values is None:
+        return true()
+    return column.in_(list(values))
+
+
+async def load_snapshot(
+    db: AsyncSession,
+    start_date: date,
+    end_date: date,
+    people: set[UUID] | None = None,
+    dates: set[date] | None = None,
+) -> ScheduleSnapshot:
+    """
+    Load the schedule data conflict detectors need for a date range.
+
+    Args:
+        db: Async database session
+        start_date: Start of analysis period
+        end_date: End of analysis period
+        people: Only load person-level data (assignments, residents) for
+            these people; None loads everyone
+        dates: Only load slot-level data (blocks, everyone's half-days) for
+            these dates; None loads every date in range
+
+    Returns:
+        ScheduleSnapshot for the range
+    """
+    snapshot = ScheduleSnapshot(
+        start_date=start_date, end_date=end_date, people=people, dates=dates
+    )
+    in_range = and_(Block.date >= start_date, Block.date <= end_date)
+
+    if people is None or people:
+        result = await db.execute(
+            select(Assignment)
+            .join(Block, Assignment.block_id == Block.id)
+            .options(
+                selectinload(Assignment.person),
+                selectinload(Assignment.block),
+                selectinload(Assignment.rotation_template),
+            )
+            .where(in_range, _in(Assignment.person_id, people))
+        )
+        snapshot.assignments = list(result.scalars().all())
+
+        result = await db.execute(
+            select(Person).where(
+                Person.type == "resident", _in(Person.id, people)
+            )
+        )
+        snapshot.residents = list(result.scalars().all())
+
+    if dates is None or dates:
+        result = await db.execute(
+            select(Block).where(in_range, _in(Block.date, dates))
+        )
+        snapshot.blocks = list(result.scalars().all())
+
+    if people is None or dates is None:
+        half_day_scope = true()
+    else:
+        half_day_scope = or_(
+            _in(HalfDayAssignment.person_id, people),
+            _in(HalfDayAssignment.date, dates),
+        )
+    result = await db.execute(
+        select(HalfDayAssignment)
+        .options(
+            selectinload(HalfDayAssignment.person),
+            selectinload(HalfDayAssignment.activity),
+        )
+        .where(
+            HalfDayAssignment.date >= start_date,
+            HalfDayAssignment.date <= end_date,
+            half_day_scope,
+        )
+    )
+    snapshot.half_days = list(result.scalars().all())
+
+    return snapshot
@@ -60,6 +60,9 @@ class AvailabilityConstraint(HardConstraint):
     are forbidden.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability",)
+
     def __init__(self) -> None:
         """Initialize availability constraint."""
         super().__init__(
@@ -206,6 +209,10 @@ class EightyHourRuleConstraint(SoftConstraint):
     ROLLING_WEEKS = 4
     ROLLING_DAYS = 28  # 4 weeks * 7 days = 28 days (STRICT)
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("MAX_WEEKLY_HOURS",)
+    run_inputs = ("preassigned_work_blocks",)
+
     def __init__(self, settings=None) -> None:
         """Initialize the 80-hour rule constraint.
 
@@ -513,6 +520,10 @@ class OneInSevenRuleConstraint(SoftConstraint):
         and clinical responsibilities, averaged over four weeks."
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("MAX_CONSECUTIVE_DAYS",)
+    run_inputs = ("preassigned_work_days",)
+
     def __init__(self, settings=None) -> None:
         """Initialize 1-in-7 rule constraint."""
         super().__init__(
@@ -799,6 +810,9 @@ class SupervisionRatioConstraint(SoftConstraint):
         is in place for all residents who care for patients."
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("PGY1_RATIO", "OTHER_RATIO")
+
     def __init__(self, settings=None) -> None:
         """Initialize supervision ratio constraint."""
         super().__init__(
@@ -76,6 +76,9 @@ class ActivityRequirementConstraint(SoftConstraint):
     # Bonus/penalty for day preferences
     DAY_PREFERENCE_FACTOR = 0.5
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_requirements",)
+
     def __init__(
         self,
         weight: float = 50.0,
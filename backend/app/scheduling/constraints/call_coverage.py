@@ -375,6 +375,9 @@ class CallAvailabilityConstraint(HardConstraint):
     blocking assignments that would prevent overnight call.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability",)
+
     def __init__(self) -> None:
         super().__init__(
             name="CallAvailability",
@@ -1333,6 +1333,9 @@ class CallNightBeforeLeaveConstraint(SoftConstraint):
     It remains soft to avoid infeasibility when coverage is tight.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability",)
+
     def __init__(self, weight: float = 2.0) -> None:
         """
         Initialize call-before-leave preference constraint.
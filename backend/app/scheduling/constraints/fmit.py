@@ -157,6 +157,9 @@ class FMITWeekBlockingConstraint(SoftConstraint):
     (name/abbreviation/display_abbreviation) containing 'FMIT'.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(self) -> None:
         """Initialize the FMIT week blocking constraint."""
         super().__init__(
@@ -375,6 +378,9 @@ class FMITMandatoryCallConstraint(SoftConstraint):
     when FMIT attending is already on-site.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(self) -> None:
         """Initialize FMIT mandatory call constraint."""
         super().__init__(
@@ -590,6 +596,9 @@ class PostFMITRecoveryConstraint(SoftConstraint):
     This ensures adequate recovery time after a demanding inpatient week.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(self) -> None:
         """Initialize post-FMIT recovery constraint."""
         super().__init__(
@@ -795,6 +804,9 @@ class PostFMITSundayBlockingConstraint(SoftConstraint):
     Timeline: Thu FMIT ends → Fri PC (blocked) → Sat OK → Sun penalized for call
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(self, weight: float = 80.0) -> None:
         """Initialize post-FMIT Sunday blocking constraint."""
         super().__init__(
@@ -49,6 +49,9 @@ class WeekendWorkConstraint(HardConstraint):
     Night Float, FMIT) can be assigned on weekends.
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_weekend_config",)
+
     def __init__(
         self,
         template_weekend_config: dict[UUID, bool] | None = None,
@@ -230,6 +233,9 @@ class HalfDayRequirementConstraint(SoftConstraint):
     the ideal distribution.
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_requirements",)
+
     def __init__(
         self,
         weight: float = 50.0,
@@ -283,9 +283,12 @@ class ConstraintManager:
         model: Any,
         variables: dict[str, Any],
         context: SchedulingContext,
+        constraints: list[Constraint] | None = None,
     ) -> None:
-        """Apply all enabled constraints to CP-SAT model."""
-        for constraint in sorted(self.get_enabled(), key=lambda c: -c.priority.value):
+        """Apply all enabled constraints (or the given subset) to CP-SAT model."""
+        if constraints is None:
+            constraints = sorted(self.get_enabled(), key=lambda c: -c.priority.value)
+        for constraint in constraints:
             try:
                 constraint.add_to_cpsat(model, variables, context)
                 logger.debug(f"Applied constraint to CP-SAT: {constraint.name}")
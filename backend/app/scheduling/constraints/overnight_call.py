@@ -81,6 +81,9 @@ class OvernightCallGenerationConstraint(SoftConstraint):  # @archetype-ok
         5. Absence blocking respected
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability", "existing_assignments")
+
     def __init__(self) -> None:
         """Initialize overnight call generation constraint."""
         super().__init__(
@@ -683,6 +686,9 @@ class FMITCallProximityConstraint(SoftConstraint):
     handles cross-block FMIT visibility via eagerly loaded assignment.block.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(
         self,
         base_weight: float = 10_000.0,
@@ -58,6 +58,9 @@ class PostCallAutoAssignmentConstraint(SoftConstraint):
     - Validates existing schedules for compliance
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability", "locked_blocks")
+
     # Activity type identifiers
     PCAT_ACTIVITY = "PCAT"  # Post-Call Attending
     DO_ACTIVITY = "DO"  # Direct Observation
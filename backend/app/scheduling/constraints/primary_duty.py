@@ -196,6 +196,9 @@ class FacultyPrimaryDutyClinicConstraint(SoftConstraint):
     this constraint uses per-faculty duty configurations which can vary.
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_duty_configs",)
+
     def __init__(
         self,
         duty_configs: dict[str, PrimaryDutyConfig] | None = None,
@@ -506,6 +509,9 @@ class FacultyDayAvailabilityConstraint(SoftConstraint):
     This prevents scheduling conflicts with administrative duties, teaching, etc.
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_duty_configs",)
+
     def __init__(
         self,
         duty_configs: dict[str, PrimaryDutyConfig] | None = None,
@@ -706,6 +712,9 @@ class FacultyClinicEquitySoftConstraint(SoftConstraint):
     from target. Use when you want to optimize but not strictly require.
     """
 
+    # Settings digested by the CP-SAT model cache
+    structure_settings = ("_duty_configs",)
+
     def __init__(
         self,
         weight: float = 15.0,
@@ -50,6 +50,9 @@ class ResidentWeeklyClinicConstraint(SoftConstraint):
     weekly_requirements relationship and cached in the scheduling context.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(
         self,
         weekly_requirements: dict[UUID, dict[str, Any]] | None = None,
@@ -897,6 +897,9 @@ class N1VulnerabilityConstraint(SoftConstraint):
     - Identifies faculty who are sole coverage providers
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("availability",)
+
     def __init__(self, weight: float = 25.0) -> None:
         super().__init__(
             name="N1Vulnerability",
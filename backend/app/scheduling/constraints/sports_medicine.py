@@ -57,6 +57,9 @@ class SMResidentFacultyAlignmentConstraint(SoftConstraint):
         This is not a violation - it's expected behavior.
     """
 
+    # Run inputs read while emitting, applied over the cached CP-SAT template
+    run_inputs = ("existing_assignments",)
+
     def __init__(self) -> None:
         """Initialize SM alignment constraint."""
         super().__init__(
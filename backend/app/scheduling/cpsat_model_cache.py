@@ -0,0 +1,657 @@
+"""
+Compiled CP-SAT model templates reused across schedule regenerations.
+
+Building the CP-SAT model in Python (decision variables, the 2D indicator
+views, every constraint's ``add_to_cpsat`` and the objective) dominates the
+wall time of small and medium solves, and the structure is identical every
+time the same inputs are re-solved: retries with a different timeout or
+worker count, and what-if reruns.
+
+``CPSATModelCache`` keys a compiled model on a digest of everything the
+structure is built from:
+
+- the scheduling context: horizon, roster, templates, requirements and the
+  other declared ``SchedulingContext`` fields except the run inputs below,
+  and
+- the enabled constraints in application order, including their settings.
+
+Domain objects in the context are digested through an explicit list of
+scalar fields and primary keys per input type (``_ENTITY_FIELDS``);
+dataclasses and ORM objects elsewhere through their declared fields or
+mapped columns. Constraints are digested through their constructor
+parameters, or a ``structure_settings`` class attribute naming the
+attributes that hold their settings. A value that cannot be digested this
+way makes the solve uncacheable rather than risking a false hit.
+
+Per-run deltas are applied to a clone of the template instead of rebuilding.
+The template is compiled from the context with its run inputs
+(``RUN_INPUT_FIELDS``: availability, preserved assignments and the locked or
+preloaded slots derived from them) left empty, and those inputs are not part
+of the structure digest, so an absence or preserved-assignment edit still
+hits the cache:
+
+- unavailable and locked slots are closed by narrowing variable domains
+  (each slot's 2D indicator is pinned open or closed, and the faculty
+  activity variables of closed slots are pinned to zero),
+- the assignments passed to ``CPSATSolver.solve`` are pinned the same way,
+  and solution hints are written onto the clone.
+
+Constraints that read run inputs while emitting (call availability, FMIT
+weeks detected from preserved assignments, ACGME windows counting preloaded
+work) declare them in a ``run_inputs`` class attribute. They are left out of
+the template and applied on top of the clone as a run layer, keyed by
+``run_digest`` over only the inputs they declare, so the layered model is
+reused too until one of those inputs changes. The template model itself is
+never mutated.
+"""
+
+from __future__ import annotations
+
+import copy
+import dataclasses
+import hashlib
+import inspect
+import json
+import logging
+import threading
+from collections import OrderedDict
+from datetime import date, datetime, timedelta
+from datetime import time as dt_time
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+from uuid import UUID
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL_CACHE_SIZE = 4
+
+# Context fields applied per run on a clone of the template rather than
+# compiled into it
+RUN_INPUT_FIELDS = (
+    "availability",
+    "existing_assignments",
+    "locked_blocks",
+    "preassigned_work_blocks",
+    "preassigned_work_days",
+    "preassigned_off_days",
+)
+
+_PERSON_FIELDS = (
+    "id",
+    "name",
+    "type",
+    "pgy_level",
+    "target_clinical_blocks",
+    "performs_procedures",
+    "specialties",
+    "primary_duty",
+    "faculty_role",
+    "min_clinic_halfdays_per_week",
+    "max_clinic_halfdays_per_week",
+    "admin_type",
+    "clinic_min",
+    "clinic_max",
+    "at_min",
+    "at_max",
+    "gme_min",
+    "gme_max",
+    "dfm_min",
+    "dfm_max",
+    "is_sm_faculty",
+    "has_split_admin",
+    "sm_min",
+    "sm_max",
+    "requires_fmit",
+    "sunday_call_count",
+    "weekday_call_count",
+    "fmit_weeks_count",
+)
+_BLOCK_FIELDS = (
+    "id",
+    "date",
+    "time_of_day",
+    "block_number",
+    "is_weekend",
+    "is_holiday",
+    "day_type",
+    "operational_intent",
+    "actual_date",
+)
+_TEMPLATE_FIELDS = (
+    "id",
+    "name",
+    "rotation_type",
+    "template_category",
+    "abbreviation",
+    "display_abbreviation",
+    "leave_eligible",
+    "clinic_location",
+    "max_residents",
+    "requires_specialty",
+    "requires_procedure_credential",
+    "supervision_required",
+    "max_supervision_ratio",
+    "is_block_half_rotation",
+    "first_half_component_id",
+    "second_half_component_id",
+    "includes_weekend_work",
+    "is_offsite",
+    "is_lec_exempt",
+    "is_continuity_exempt",
+    "is_saturday_off",
+    "preload_activity_code",
+)
+_ASSIGNMENT_FIELDS = (
+    "id",
+    "person_id",
+    "block_id",
+    "rotation_template_id",
+    "role",
+    "call_type",
+    "date",
+    "time_of_day",
+    "track_id",
+    "parent_assignment_id",
+)
+_ACTIVITY_FIELDS = (
+    "id",
+    "name",
+    "code",
+    "display_abbreviation",
+    "activity_category",
+    "requires_supervision",
+    "is_protected",
+    "counts_toward_clinical_hours",
+    "provides_supervision",
+    "counts_toward_physical_capacity",
+    "capacity_units",
+)
+_ACTIVITY_REQUIREMENT_FIELDS = (
+    "id",
+    "rotation_template_id",
+    "activity_id",
+    "min_halfdays",
+    "max_halfdays",
+    "target_halfdays",
+    "applicable_weeks",
+    "prefer_full_days",
+    "preferred_days",
+    "avoid_days",
+    "priority",
+)
+_PREFERENCE_FIELDS = (
+    "id",
+    "person_id",
+    "preference_type",
+    "direction",
+    "rank",
+    "day_of_week",
+    "time_of_day",
+    "weight",
+    "is_active",
+)
+_GRADUATION_REQUIREMENT_FIELDS = (
+    "id",
+    "pgy_level",
+    "rotation_template_id",
+    "min_halves",
+    "target_halves",
+    "by_date",
+)
+
+# Domain objects, by the context field (or constraint parameter) holding
+# them, and the scalar fields and keys that identify their content
+_ENTITY_FIELDS: dict[str, tuple[str, ...]] = {
+    "residents": _PERSON_FIELDS,
+    "faculty": _PERSON_FIELDS,
+    "call_eligible_faculty": _PERSON_FIELDS,
+    "blocks": _BLOCK_FIELDS,
+    "blocks_by_date": _BLOCK_FIELDS,
+    "templates": _TEMPLATE_FIELDS,
+    "existing_assignments": _ASSIGNMENT_FIELDS,
+    "activities": _ACTIVITY_FIELDS,
+    "activity_requirements": _ACTIVITY_REQUIREMENT_FIELDS,
+    "activity_req_by_template": _ACTIVITY_REQUIREMENT_FIELDS,
+    "faculty_schedule_preferences": _PREFERENCE_FIELDS,
+    "faculty_preferences_by_person": _PREFERENCE_FIELDS,
+    "graduation_requirements": _GRADUATION_REQUIREMENT_FIELDS,
+}
+
+# Settings every constraint carries (weight only on soft constraints)
+_BASE_CONSTRAINT_SETTINGS = ("name", "constraint_type", "priority", "enabled")
+
+
+class UndigestableInputError(TypeError):
+    """An input has no explicit digest representation; the solve is uncached."""
+
+
+def _canonical(value: Any, fields: tuple[str, ...] | None = None) -> Any:
+    """
+    Convert a value into a JSON-serializable, order-stable structure.
+
+    Args:
+        value: Value to convert
+        fields: Scalar fields to read from domain objects found in ``value``
+            (dataclasses and ORM objects default to their declared fields)
+
+    Raises:
+        UndigestableInputError: If ``value`` holds an object with no
+            explicit representation
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, (UUID, date, datetime, dt_time, timedelta, Decimal)):
+        return str(value)
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, dict):
+        return [
+            [_canonical(key), _canonical(value[key], fields)]
+            for key in sorted(value, key=str)
+        ]
+    if isinstance(value, (list, tuple)):
+        return [_canonical(item, fields) for item in value]
+    if isinstance(value, (set, frozenset)):
+        return sorted(
+            (_canonical(item, fields) for item in value),
+            key=lambda item: json.dumps(item, sort_keys=True, default=str),
+        )
+    if fields is not None:
+        return [_canonical(getattr(value, name, None)) for name in fields]
+    if dataclasses.is_dataclass(value):
+        return [
+            [f.name, _canonical(getattr(value, f.name))]
+            for f in dataclasses.fields(value)
+        ]
+    mapper = getattr(type(value), "__mapper__", None)
+    if mapper is not None:
+        return [
+            [attr.key, _canonical(getattr(value, attr.key))]
+            for attr in mapper.column_attrs
+        ]
+    raise UndigestableInputError(
+        f"No digest fields for {type(value).__module__}.{type(value).__qualname__}"
+    )
+
+
+def _constraint_settings(constraint: Any) -> list[Any]:
+    """
+    Digest a constraint's class and the settings it was built with.
+
+    Settings are the base constraint attributes plus either the class's
+    ``structure_settings`` or its constructor parameters, each read from
+    the attribute of the same name (or its underscore-prefixed form).
+
+    Raises:
+        UndigestableInputError: If a constructor parameter is not kept as
+            an attribute, so the constraint's settings cannot be read back
+    """
+    cls = type(constraint)
+    names = getattr(cls, "structure_settings", None)
+    if names is None:
+        names = [
+            param.name
+            for param in inspect.signature(cls.__init__).parameters.values()
+            if param.name != "self"
+            and param.kind not in (param.VAR_POSITIONAL, param.VAR_KEYWORD)
+        ]
+
+    settings = []
+    for name in dict.fromkeys([*_BASE_CONSTRAINT_SETTINGS, "weight", *names]):
+        for attr in (name, f"_{name}"):
+            if hasattr(constraint, attr):
+                value = getattr(constraint, attr)
+                break
+        else:
+            if name in _BASE_CONSTRAINT_SETTINGS or name == "weight":
+                continue
+            raise UndigestableInputError(
+                f"{cls.__qualname__} does not keep its {name!r} setting"
+            )
+        settings.append([name, _canonical(value, _ENTITY_FIELDS.get(name))])
+    return [f"{cls.__module__}.{cls.__qualname__}", settings]
+
+
+def split_constraints(constraint_manager: Any) -> tuple[list[Any], list[Any]]:
+    """
+    Split the enabled constraints into template and run-layer constraints.
+
+    Args:
+        constraint_manager: ConstraintManager holding the constraints
+
+    Returns:
+        ``(template, run_layer)`` lists, each in application order; run-layer
+        constraints are those declaring ``run_inputs``
+    """
+    template, run_layer = [], []
+    for constraint in sorted(
+        constraint_manager.get_enabled(), key=lambda c: -c.priority.value
+    ):
+        if getattr(type(constraint), "run_inputs", ()):
+            run_layer.append(constraint)
+        else:
+            template.append(constraint)
+    return template, run_layer
+
+
+def template_context(context: Any) -> Any:
+    """
+    Copy a scheduling context with its run inputs emptied.
+
+    The template is compiled from this copy, so nothing in it can depend on
+    an input that is excluded from ``structure_digest``.
+
+    Args:
+        context: SchedulingContext passed to the solver
+
+    Returns:
+        Shallow copy of ``context`` with every ``RUN_INPUT_FIELDS`` entry reset
+        to its default
+    """
+    blank = copy.copy(context)
+    for f in dataclasses.fields(context):
+        if f.name in RUN_INPUT_FIELDS:
+            if f.default_factory is not dataclasses.MISSING:
+                setattr(blank, f.name, f.default_factory())
+            else:
+                setattr(blank, f.name, f.default)
+    return blank
+
+
+def _digest(payload: Any) -> str:
+    """Hash a canonical payload."""
+    encoded = json.dumps(payload, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def structure_digest(context: Any, constraint_manager: Any) -> str | None:
+    """
+    Digest the inputs that determine a CP-SAT model template's structure.
+
+    Args:
+        context: SchedulingContext passed to the solver
+        constraint_manager: ConstraintManager whose enabled constraints are
+            applied to the model
+
+    Returns:
+        Hex digest identifying the compiled template, or None if an input
+        has no explicit digest representation (the solve is not cached)
+    """
+    constraints = sorted(
+        constraint_manager.get_enabled(), key=lambda c: -c.priority.value
+    )
+    try:
+        payload = [
+            [
+                [
+                    f.name,
+                    _canonical(getattr(context, f.name), _ENTITY_FIELDS.get(f.name)),
+                ]
+                for f in dataclasses.fields(context)
+                if f.name not in RUN_INPUT_FIELDS
+            ],
+            [_constraint_settings(constraint) for constraint in constraints],
+        ]
+    except UndigestableInputError as e:
+        logger.debug(f"CP-SAT model not cacheable: {e}")
+        return None
+    return _digest(payload)
+
+
+def run_digest(context: Any, run_constraints: list[Any]) -> str | None:
+    """
+    Digest the run inputs read by the run-layer constraints.
+
+    Args:
+        context: SchedulingContext passed to the solver
+        run_constraints: Run-layer constraints from ``split_constraints``
+
+    Returns:
+        Hex digest identifying the run layer, or None if a run input has no
+        explicit digest representation
+    """
+    try:
+        payload = [
+            [
+                _constraint_settings(constraint),
+                [
+                    [name, _canonical(getattr(context, name), _ENTITY_FIELDS.get(name))]
+                    for name in type(constraint).run_inputs
+                ],
+            ]
+            for constraint in run_constraints
+        ]
+    except UndigestableInputError as e:
+        logger.debug(f"CP-SAT run layer not cacheable: {e}")
+        return None
+    return _digest(payload)
+
+
+@dataclasses.dataclass
+class CompiledCPSATModel:
+    """
+    A fully built CP-SAT model plus the variable handles the solver reads.
+
+    Variable handles refer to proto indices, so they are valid for every
+    clone returned by ``instantiate``.
+    """
+
+    model: Any  # cp_model.CpModel, never mutated after compilation
+    x: dict
+    f: dict
+    call: dict
+    fac_clinic: dict
+    fac_supervise: dict
+    fac_pcat: dict
+    fac_do: dict
+    template_idx: dict
+    clinic_template_ids: set
+    x_2d: dict
+    f_2d: dict
+    variables: dict  # Handles passed to constraints, for the run layer
+    objective: Any  # Objective expression the template maximizes
+    build_seconds: float = 0.0
+
+    def instantiate(self) -> Any:
+        """
+        Return a private copy of the model for a single solve.
+
+        Returns:
+            cp_model.CpModel that can be pinned, hinted and solved
+        """
+        return self.model.Clone()
+
+    @property
+    def num_variables(self) -> int:
+        """Number of variables in the compiled model."""
+        return len(self.model.Proto().variables)
+
+
+def fix_variable(model: Any, var: Any, value: int) -> None:
+    """
+    Pin a variable of an instantiated model by narrowing its domain.
+
+    Equivalent to ``model.Add(var == value)`` without adding a constraint.
+
+    Args:
+        model: cp_model.CpModel returned by ``CompiledCPSATModel.instantiate``
+        var: Variable handle from the compiled model
+        value: Value to pin the variable to
+    """
+    domain = model.Proto().variables[var.Index()].domain
+    domain[:] = [value, value]
+
+
+def apply_slot_deltas(
+    model: Any, compiled: CompiledCPSATModel, context: Any
+) -> set[tuple[int, int]]:
+    """
+    Open or close every slot of an instantiated model for this run.
+
+    A resident slot's 2D indicator is pinned to 1 (exactly one rotation) or,
+    if the resident is unavailable or the slot is locked, to 0 (none). Closed
+    faculty slots have their 2D indicator and activity variables pinned to 0.
+
+    Args:
+        model: cp_model.CpModel returned by ``CompiledCPSATModel.instantiate``
+        compiled: Template the model was instantiated from
+        context: SchedulingContext carrying this run's availability and
+            locked slots
+
+    Returns:
+        ``(r_i, b_i)`` keys of the closed resident slots
+    """
+    locked_blocks = getattr(context, "locked_blocks", set()) or set()
+    availability = getattr(context, "availability", {}) or {}
+
+    def is_closed(person_id: Any, block_id: Any) -> bool:
+        if (person_id, block_id) in locked_blocks:
+            return True
+        block_avail = availability.get(person_id, {}).get(block_id)
+        return bool(block_avail) and not block_avail.get("available", True)
+
+    closed: set[tuple[int, int]] = set()
+    for resident in context.residents:
+        r_i = context.resident_idx[resident.id]
+        for block in context.blocks:
+            key = (r_i, context.block_idx[block.id])
+            if key not in compiled.x_2d:
+                continue
+            if is_closed(resident.id, block.id):
+                fix_variable(model, compiled.x_2d[key], 0)
+                closed.add(key)
+            else:
+                fix_variable(model, compiled.x_2d[key], 1)
+
+    faculty_vars = (
+        compiled.f_2d,
+        compiled.fac_clinic,
+        compiled.fac_supervise,
+        compiled.fac_pcat,
+        compiled.fac_do,
+    )
+    for faculty in context.faculty:
+        f_i = context.faculty_idx[faculty.id]
+        for block in context.blocks:
+            if not is_closed(faculty.id, block.id):
+                continue
+            key = (f_i, context.block_idx[block.id])
+            for var_map in faculty_vars:
+                if key in var_map:
+                    fix_variable(model, var_map[key], 0)
+    return closed
+
+
+class CPSATModelCache:
+    """Thread-safe LRU cache of compiled CP-SAT models keyed by structure digest."""
+
+    def __init__(self, max_entries: int = DEFAULT_MODEL_CACHE_SIZE) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum compiled models kept in memory (0 disables)
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CompiledCPSATModel] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.build_seconds_saved = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether compiled models are retained."""
+        return self.max_entries > 0
+
+    def get(self, digest: str) -> CompiledCPSATModel | None:
+        """
+        Look up a compiled model.
+
+        Args:
+            digest: Result of ``structure_digest``
+
+        Returns:
+            The compiled model, or None on a miss
+        """
+        with self._lock:
+            compiled = self._entries.get(digest)
+            if compiled is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(digest)
+            self.hits += 1
+            self.build_seconds_saved += compiled.build_seconds
+            return compiled
+
+    def put(self, digest: str, compiled: CompiledCPSATModel) -> None:
+        """
+        Store a compiled model, evicting the least recently used entries.
+
+        Args:
+            digest: Result of ``structure_digest``
+            compiled: Model to retain
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[digest] = compiled
+            self._entries.move_to_end(digest)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every compiled model."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hit/miss counters and build time saved
+        """
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": self.enabled,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "build_seconds_saved": round(self.build_seconds_saved, 3),
+            }
+
+
+_model_cache: CPSATModelCache | None = None
+_model_cache_lock = threading.Lock()
+
+
+def get_cpsat_model_cache() -> CPSATModelCache:
+    """
+    Get the process-wide compiled model cache.
+
+    Returns:
+        CPSATModelCache sized from ``settings.CPSAT_MODEL_CACHE_SIZE``
+    """
+    global _model_cache
+    if _model_cache is None:
+        with _model_cache_lock:
+            if _model_cache is None:
+                try:
+                    from app.core.config import settings
+
+                    size = getattr(
+                        settings, "CPSAT_MODEL_CACHE_SIZE", DEFAULT_MODEL_CACHE_SIZE
+                    )
+                except Exception:
+                    size = DEFAULT_MODEL_CACHE_SIZE
+                _model_cache = CPSATModelCache(max_entries=size)
+    return _model_cache
+
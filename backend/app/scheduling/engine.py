@@ -33,6 +33,7 @@ from sqlalchemy.orm import Session, selectinload
 from app.core.config import get_settings
 from app.core.exceptions import ActivityNotFoundError
 from app.core.logging import get_logger
+from app.db.batch_operations import upsert_half_day_assignments
 from app.schemas.schedule import (
     NFPCAudit,
     NFPCAuditViolation,
@@ -3436,22 +3437,31 @@ class SchedulingEngine:
 
         if block_ids:
             # Lock and delete existing assignments for these blocks
-            # We select first to acquire locks, then delete
-            existing_assignments = (
-                self.db.query(Assignment)
-                .filter(Assignment.block_id.in_(block_ids))
-                .with_for_update(nowait=False)
-                .all()
+            # We select first to acquire locks, then delete. Deletes go through
+            # the unit of work (not a bulk DELETE) so SQLAlchemy-Continuum
+            # records version rows; the flush below batches them.
+            query = self.db.query(Assignment).filter(
+                Assignment.block_id.in_(block_ids)
             )
+            if preserve_ids:
+                # Skip preserved assignments (e.g., FMIT) in SQL
+                query = query.filter(Assignment.id.notin_(preserve_ids))
+            existing_assignments = query.with_for_update(nowait=False).all()
 
-            deleted_count = 0
-            preserved_count = 0
             for assignment in existing_assignments:
-                if assignment.id in preserve_ids:
-                    preserved_count += 1
-                    continue  # Skip preserved assignments (e.g., FMIT)
                 self.db.delete(assignment)
-                deleted_count += 1
+            deleted_count = len(existing_assignments)
+            preserved_count = 0
+            if preserve_ids:
+                # preserve_ids may include assignments outside these blocks
+                preserved_count = (
+                    self.db.query(func.count(Assignment.id))
+                    .filter(
+                        Assignment.block_id.in_(block_ids),
+                        Assignment.id.in_(preserve_ids),
+                    )
+                    .scalar()
+                )
 
             logger.info(
                 f"Deleted {deleted_count} existing assignments for date range "
@@ -4391,8 +4401,7 @@ class SchedulingEngine:
         for person_id, slot_date, time_of_day in locked_query:
             existing_locked.add((person_id, slot_date, time_of_day))
 
-        created = 0
-        updated = 0
+        rows: list[dict[str, Any]] = []
         skipped_locked = 0
 
         skipped_adjunct = 0
@@ -4442,47 +4451,29 @@ class SchedulingEngine:
                     )
                     activity_id = self._get_off_activity_id()
 
-            # Check for existing row (solver/template source)
-            existing = (
-                self.db.query(HalfDayAssignment)
-                .filter(
-                    HalfDayAssignment.person_id == faculty_id,
-                    HalfDayAssignment.date == block.date,
-                    HalfDayAssignment.time_of_day == block.time_of_day,
-                )
-                .first()
+            rows.append(
+                {
+                    "person_id": faculty_id,
+                    "date": block.date,
+                    "time_of_day": block.time_of_day,
+                    "activity_id": activity_id,
+                    "source": AssignmentSource.SOLVER.value,
+                }
             )
 
-            if existing:
-                # Update existing row if it's not locked
-                if existing.is_locked:
-                    skipped_locked += 1
-                    continue
-                existing.activity_id = activity_id
-                existing.source = AssignmentSource.SOLVER.value
-                updated += 1
-            else:
-                # Create new row
-                self.db.add(
-                    HalfDayAssignment(
-                        person_id=faculty_id,
-                        date=block.date,
-                        time_of_day=block.time_of_day,
-                        activity_id=activity_id,
-                        source=AssignmentSource.SOLVER.value,
-                    )
-                )
-                created += 1
+        # One multi-row upsert instead of a SELECT + add/update per slot;
+        # rows locked since the pre-read are skipped by the upsert itself
+        upsert = upsert_half_day_assignments(self.db, rows)
+        skipped_locked += upsert.skipped_locked
 
-        if created or updated:
-            self.db.flush()
+        if upsert.written:
             logger.info(
                 f"Persisted faculty half-day assignments from solver: "
-                f"created={created}, updated={updated}, skipped_locked={skipped_locked}, "
-                f"skipped_adjunct={skipped_adjunct}"
+                f"created={upsert.created}, updated={upsert.updated}, "
+                f"skipped_locked={skipped_locked}, skipped_adjunct={skipped_adjunct}"
             )
 
-        return created + updated
+        return upsert.written
 
     def _get_blocking_half_day_slots(self) -> set[tuple[UUID, date, str]]:
         """
@@ -4612,53 +4603,35 @@ class SchedulingEngine:
         - preload/manual: never overwritten
         - solver/template: overwritten by solver
         """
-        from app.models.half_day_assignment import HalfDayAssignment, AssignmentSource
+        from app.models.half_day_assignment import AssignmentSource
 
         off_activity_id = self._get_off_activity_id()
         block_by_id = {b.id: b for b in blocks}
-        updated = 0
+        rows: list[dict[str, Any]] = []
 
         for assignment in assignments:
             block = block_by_id.get(cast(UUID, assignment.block_id))
             if not block:
                 continue
-
-            existing = (
-                self.db.query(HalfDayAssignment)
-                .filter(
-                    HalfDayAssignment.person_id == assignment.person_id,
-                    HalfDayAssignment.date == block.date,
-                    HalfDayAssignment.time_of_day == block.time_of_day,
-                )
-                .first()
-            )
-
-            if existing:
-                if existing.is_locked:
-                    continue
-                existing.activity_id = off_activity_id
-                existing.source = AssignmentSource.SOLVER.value
-                updated += 1
-                continue
-
-            self.db.add(
-                HalfDayAssignment(
-                    person_id=assignment.person_id,
-                    date=block.date,
-                    time_of_day=block.time_of_day,
-                    activity_id=off_activity_id,
-                    source=AssignmentSource.SOLVER.value,
-                )
+            rows.append(
+                {
+                    "person_id": assignment.person_id,
+                    "date": block.date,
+                    "time_of_day": block.time_of_day,
+                    "activity_id": off_activity_id,
+                    "source": AssignmentSource.SOLVER.value,
+                }
             )
-            updated += 1
 
-        if updated:
-            self.db.flush()
+        upsert = upsert_half_day_assignments(self.db, rows)
+        if upsert.written:
             logger.info(
-                f"Persisted {updated} solver half-day assignments (source=solver)"
+                f"Persisted {upsert.written} solver half-day assignments "
+                f"(source=solver, created={upsert.created}, updated={upsert.updated}, "
+                f"skipped_locked={upsert.skipped_locked})"
             )
 
-        return updated
+        return upsert.written
 
     def _ensure_faculty_half_day_slots(
         self,
@@ -4687,7 +4660,7 @@ class SchedulingEngine:
             "Global solver now handles faculty half-day assignments."
         )
 
-        from app.models.half_day_assignment import HalfDayAssignment, AssignmentSource
+        from app.models.half_day_assignment import AssignmentSource
 
         if not faculty:
             return 0
@@ -4696,43 +4669,23 @@ class SchedulingEngine:
         eligible_faculty = [
             f for f in faculty if getattr(f, "faculty_role", None) != "adjunct"
         ]
-        faculty_ids = [cast(UUID, f.id) for f in eligible_faculty]
-        existing = (
-            self.db.query(
-                HalfDayAssignment.person_id,
-                HalfDayAssignment.date,
-                HalfDayAssignment.time_of_day,
-            )
-            .filter(
-                HalfDayAssignment.person_id.in_(faculty_ids),
-                HalfDayAssignment.date >= self.start_date,
-                HalfDayAssignment.date <= self.end_date,
-            )
-            .all()
-        )
-        existing_keys = {(p, d, t) for p, d, t in existing}
+        rows = [
+            {
+                "person_id": fac.id,
+                "date": block.date,
+                "time_of_day": block.time_of_day,
+                "activity_id": off_activity_id,
+                "source": AssignmentSource.SOLVER.value,
+            }
+            for block in blocks
+            if not block.is_weekend
+            for fac in eligible_faculty
+        ]
 
-        created = 0
-        for block in blocks:
-            if block.is_weekend:
-                continue
-            for fac in eligible_faculty:
-                key = (cast(UUID, fac.id), block.date, block.time_of_day)
-                if key in existing_keys:
-                    continue
-                self.db.add(
-                    HalfDayAssignment(
-                        person_id=fac.id,
-                        date=block.date,
-                        time_of_day=block.time_of_day,
-                        activity_id=off_activity_id,
-                        source=AssignmentSource.SOLVER.value,
-                    )
-                )
-                created += 1
+        # Existing slots (any source) are left untouched
+        created = upsert_half_day_assignments(self.db, rows, overwrite=False).created
 
         if created:
-            self.db.flush()
             logger.info(f"Created {created} faculty half-day slots for solver")
 
         return created
@@ -48,11 +48,13 @@ All four fixes applied 2025-12-24, filter corrected 2025-12-26. Solvers should n
 
 from __future__ import annotations
 
+import dataclasses
 import json
 import logging
 import time
 from abc import ABC, abstractmethod
 from collections import defaultdict
+from functools import partial
 from typing import Any
 from uuid import UUID
 
@@ -63,6 +65,17 @@ from app.scheduling.constraints import (
     ConstraintManager,
     SchedulingContext,
 )
+from app.scheduling.cpsat_model_cache import (
+    CompiledCPSATModel,
+    CPSATModelCache,
+    apply_slot_deltas,
+    fix_variable,
+    get_cpsat_model_cache,
+    run_digest,
+    split_constraints,
+    structure_digest,
+    template_context,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -751,11 +764,14 @@ class CPSATSolver(BaseSolver):
         num_workers: int = 0,  # 0 = auto-detect all cores
         task_id: str | None = None,
         redis_client=None,
+        model_cache: CPSATModelCache | None = None,
     ) -> None:
         super().__init__(constraint_manager, timeout_seconds)
         self.num_workers = num_workers
         self.task_id = task_id
         self.redis_client = redis_client
+        # Compiled model templates shared across solver instances
+        self.model_cache = model_cache or get_cpsat_model_cache()
 
     def solve(
         self,
@@ -839,110 +855,84 @@ class CPSATSolver(BaseSolver):
                 solver_status="No blocks, residents, or rotation templates",
             )
 
-        # Create the CP model
-        model = cp_model.CpModel()
-
         # ==================================================
-        # DECISION VARIABLES
-        # x[r_i, b_i, t_i] = 1 if resident r assigned to rotation t during block b
+        # MODEL TEMPLATE
+        # Reuse a compiled model when the structure (context minus its run
+        # inputs + constraint configuration) is unchanged. Constraints that
+        # read run inputs are layered onto a clone, keyed by those inputs.
         # ==================================================
-        x = {}
-        template_idx = {t.id: i for i, t in enumerate(context.templates)}
-
-        locked_blocks = getattr(context, "locked_blocks", set())
-        availability = getattr(context, "availability", {}) or {}
-        resident_template_map = getattr(context, "resident_template_map", {}) or {}
-        active_template_ids = {t.id for t in context.templates}
-        for resident in context.residents:
-            r_i = context.resident_idx[resident.id]
-            raw_assigned = resident_template_map.get(resident.id, set())
-            # Only restrict to assigned templates that are actually active;
-            # if none match (e.g. archived template), allow all templates
-            # so the resident still gets solver variables.
-            assigned_template_ids = raw_assigned & active_template_ids
-            for block in workday_blocks:
-                if (resident.id, block.id) in locked_blocks:
-                    continue
-                # Also skip blocks where resident is unavailable (leave, TDY, etc.)
-                # Prevents conflict between Availability constraint and OneAssignmentPerBlock
-                block_avail = availability.get(resident.id, {}).get(block.id)
-                if block_avail and not block_avail.get("available", True):
-                    continue
-                b_i = context.block_idx[block.id]
-                for template in context.templates:
-                    # If resident has BlockAssignment(s), only create vars for those rotations
-                    if (
-                        assigned_template_ids
-                        and template.id not in assigned_template_ids
-                    ):
-                        continue
-                    t_i = template_idx[template.id]
-                    x[r_i, b_i, t_i] = model.NewBoolVar(f"x_{r_i}_{b_i}_{t_i}")
-
-        # Store both 2D (for legacy constraints) and 3D variables
-        # 2D view: x_2d[r_i, b_i] = OR of all rotations
-        x_2d = {}
-        for resident in context.residents:
-            r_i = context.resident_idx[resident.id]
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
-                rotation_vars = [
-                    x[r_i, b_i, t_i]
-                    for t_i in range(len(context.templates))
-                    if (r_i, b_i, t_i) in x
-                ]
-                if rotation_vars:
-                    # Create a 2D indicator: 1 if assigned to any rotation in this block
-                    x_2d[r_i, b_i] = model.NewBoolVar(f"x_2d_{r_i}_{b_i}")
-                    # x_2d = 1 iff at least one rotation is selected
-                    model.Add(sum(rotation_vars) >= 1).OnlyEnforceIf(x_2d[r_i, b_i])
-                    model.Add(sum(rotation_vars) == 0).OnlyEnforceIf(
-                        x_2d[r_i, b_i].Not()
+        _, run_constraints = split_constraints(self.constraint_manager)
+        template_key = None
+        layer_key = None
+        if self.model_cache.enabled:
+            template_key = structure_digest(context, self.constraint_manager)
+            if template_key is not None:
+                layer_key = template_key
+                if run_constraints:
+                    layer = run_digest(context, run_constraints)
+                    layer_key = f"{template_key}:{layer}" if layer else None
+
+        compiled = self.model_cache.get(layer_key) if layer_key else None
+        if compiled is not None:
+            model_cache_status = "hit"
+            logger.info(
+                f"Reusing compiled CP-SAT model ({compiled.num_variables} vars, "
+                f"saved {compiled.build_seconds:.2f}s of model construction)"
+            )
+            model = compiled.instantiate()
+        else:
+            template = None
+            if run_constraints and template_key is not None:
+                template = self.model_cache.get(template_key)
+            if template is not None:
+                model_cache_status = "template"
+                logger.info(
+                    f"Reusing compiled CP-SAT template ({template.num_variables} "
+                    f"vars), rebuilding {len(run_constraints)} run-layer constraints"
+                )
+            else:
+                template = self._compile_model(
+                    cp_model, template_context(context), workday_blocks
+                )
+                if template_key is not None:
+                    model_cache_status = "miss"
+                    self.model_cache.put(template_key, template)
+                else:
+                    model_cache_status = (
+                        "uncacheable" if self.model_cache.enabled else "disabled"
                     )
 
-        # ==================================================
-        # FACULTY DECISION VARIABLES
-        # f[f_i, b_i, t_i] = 1 if faculty f assigned to rotation t during block b
-        # ==================================================
-        f = {}
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in workday_blocks:
-                if (faculty.id, block.id) in locked_blocks:
-                    continue
-                # Skip blocks where faculty is unavailable (mirrors resident filtering)
-                block_avail = availability.get(faculty.id, {}).get(block.id)
-                if block_avail and not block_avail.get("available", True):
-                    continue
-                b_i = context.block_idx[block.id]
-                for template in context.templates:
-                    t_i = template_idx[template.id]
-                    f[f_i, b_i, t_i] = model.NewBoolVar(f"f_{f_i}_{b_i}_{t_i}")
-
-        # 2D view for faculty
-        f_2d = {}
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
-                rotation_vars = [
-                    f[f_i, b_i, t_i]
-                    for t_i in range(len(context.templates))
-                    if (f_i, b_i, t_i) in f
-                ]
-                if rotation_vars:
-                    f_2d[f_i, b_i] = model.NewBoolVar(f"f_2d_{f_i}_{b_i}")
-                    model.Add(sum(rotation_vars) >= 1).OnlyEnforceIf(f_2d[f_i, b_i])
-                    model.Add(sum(rotation_vars) == 0).OnlyEnforceIf(
-                        f_2d[f_i, b_i].Not()
-                    )
+            if run_constraints:
+                compiled = self._apply_run_layer(
+                    template,
+                    context,
+                    run_constraints,
+                    in_place=template_key is None,
+                )
+                retained = layer_key is not None
+                if retained:
+                    self.model_cache.put(layer_key, compiled)
+            else:
+                compiled = template
+                retained = template_key is not None
+            model = compiled.instantiate() if retained else compiled.model
 
         # ==================================================
-        # OVERNIGHT CALL DECISION VARIABLES
-        # call[f_i, b_i, "overnight"] = 1 if faculty f on call for block b's date
-        # Only Sun-Thurs nights (weekday 0,1,2,3,6)
+        # AVAILABILITY AND LOCKED SLOTS
+        # Closed on the per-run model by narrowing variable domains
         # ==================================================
-        call = {}
+        closed_slots = apply_slot_deltas(model, compiled, context)
+        logger.info(f"Closed {len(closed_slots)} unavailable or locked resident slots")
+
+        x = compiled.x
+        f = compiled.f
+        call = compiled.call
+        fac_clinic = compiled.fac_clinic
+        fac_supervise = compiled.fac_supervise
+        fac_pcat = compiled.fac_pcat
+        fac_do = compiled.fac_do
+        template_idx = compiled.template_idx
+        clinic_template_ids = compiled.clinic_template_ids
         call_eligible = getattr(context, "call_eligible_faculty", [])
         call_idx = getattr(
             context,
@@ -950,885 +940,1065 @@ class CPSATSolver(BaseSolver):
             {fac.id: i for i, fac in enumerate(call_eligible)},
         )
 
-        if call_eligible:
-            # Track dates already processed (one call per date, not per block)
-            call_dates_processed = set()
-            from app.scheduling.calendar_policy import is_overnight_call_day
-
-            call_blocks = [
-                block for block in context.blocks if is_overnight_call_day(block.date)
-            ]
-            for block in call_blocks:
-                if block.date in call_dates_processed:
-                    continue
-                call_dates_processed.add(block.date)
-
-                b_i = context.block_idx[block.id]
-                for faculty in call_eligible:
-                    call_f_i = call_idx.get(faculty.id)
-                    if call_f_i is not None:
-                        call[call_f_i, b_i, "overnight"] = model.NewBoolVar(
-                            f"call_{call_f_i}_{b_i}"
-                        )
-            logger.info(
-                f"Created {len(call)} call variables for {len(call_eligible)} "
-                f"eligible faculty across {len(call_dates_processed)} nights"
-            )
-
         # ==================================================
-        # FACULTY ACTIVITY DECISION VARIABLES (Half-Day Level)
-        # These determine what each faculty does in each half-day slot:
-        # - clinic: Faculty primary clinic session
-        # - supervise: Faculty supervising residents
-        # - pcat: Post-call attending (morning after overnight call)
-        # - do: Day off (afternoon after overnight call)
-        # If none selected, slot defaults to OFF
+        # PRESERVE EXISTING ASSIGNMENTS
+        # Pinned on the per-run clone by narrowing variable domains
         # ==================================================
-        fac_clinic = {}  # fac_clinic[f_i, b_i] = 1 if faculty f does clinic in block b
-        fac_supervise = {}  # fac_supervise[f_i, b_i] = 1 if faculty f supervises
-        fac_pcat = {}  # fac_pcat[f_i, b_i] = 1 if faculty f has PCAT
-        fac_do = {}  # fac_do[f_i, b_i] = 1 if faculty f has DO
+        if existing_assignments:
+            for assignment in existing_assignments:
+                if assignment.person_id in context.resident_idx:
+                    r_i = context.resident_idx[assignment.person_id]
+                    if assignment.block_id in context.block_idx:
+                        b_i = context.block_idx[assignment.block_id]
+                        if (
+                            assignment.rotation_template_id
+                            and assignment.rotation_template_id in template_idx
+                        ):
+                            t_i = template_idx[assignment.rotation_template_id]
+                            if (r_i, b_i) in closed_slots:
+                                continue  # Locked or unavailable this run
+                            if (r_i, b_i, t_i) in x:
+                                fix_variable(model, x[r_i, b_i, t_i], 1)
 
-        # Track which blocks are AM vs PM for PCAT/DO assignment
-        am_blocks = {b.id: b for b in context.blocks if b.time_of_day == "AM"}
-        pm_blocks = {b.id: b for b in context.blocks if b.time_of_day == "PM"}
+        # ==================================================
+        # SOLUTION HINTING (warm start)
+        # Provide a greedy initial solution so the solver starts with a
+        # feasible bound and prunes the search space faster.
+        # ==================================================
+        # Closed slots count as hinted, so greedy fill hints their vars to 0
+        hinted_resident_blocks: set[tuple[int, int]] = set(closed_slots)
+        hinted_vars: set[int] = set()  # Track var IDs already hinted
+        hint_count = 0
 
-        # Create variables for all faculty across all blocks (including weekends for PCAT/DO)
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in context.blocks:  # All blocks, not just workdays
-                b_i = context.block_idx[block.id]
+        # Priority 1: hint existing (locked) assignments
+        for assignment in existing_assignments:
+            if assignment.person_id in context.resident_idx:
+                r_i = context.resident_idx[assignment.person_id]
+                if assignment.block_id in context.block_idx:
+                    b_i = context.block_idx[assignment.block_id]
+                    if (
+                        assignment.rotation_template_id
+                        and assignment.rotation_template_id in template_idx
+                    ):
+                        t_i = template_idx[assignment.rotation_template_id]
+                        if (r_i, b_i) in closed_slots:
+                            continue
+                        if (r_i, b_i, t_i) in x:
+                            model.AddHint(x[r_i, b_i, t_i], 1)
+                            hinted_resident_blocks.add((r_i, b_i))
+                            hinted_vars.add(id(x[r_i, b_i, t_i]))
+                            hint_count += 1
 
-                # Clinic only on workdays (not weekends/holidays)
-                if not block.is_weekend and not getattr(block, "is_holiday", False):
-                    fac_clinic[f_i, b_i] = model.NewBoolVar(f"fac_clinic_{f_i}_{b_i}")
-                    fac_supervise[f_i, b_i] = model.NewBoolVar(
-                        f"fac_supervise_{f_i}_{b_i}"
-                    )
+        # Priority 2: greedy fill — for each unhinted (resident, block),
+        # hint the first available template to 1, rest to 0.
+        # Skip vars already hinted in Priority 1 to avoid overriding.
+        for (r_i, b_i, t_i), var in x.items():
+            if id(var) in hinted_vars:
+                continue  # Already hinted to 1 in Priority 1
+            if (r_i, b_i) not in hinted_resident_blocks:
+                model.AddHint(var, 1)
+                hinted_resident_blocks.add((r_i, b_i))
+                hint_count += 1
+            else:
+                model.AddHint(var, 0)
 
-                # PCAT/DO can happen any day (after overnight call)
-                fac_pcat[f_i, b_i] = model.NewBoolVar(f"fac_pcat_{f_i}_{b_i}")
-                fac_do[f_i, b_i] = model.NewBoolVar(f"fac_do_{f_i}_{b_i}")
+        logger.info(f"Solution hints: {hint_count} vars hinted to 1")
 
+        # ==================================================
+        # PRE-SOLVE DEBUGGING
+        # ==================================================
+        proto = model.Proto()
+        logger.info("=" * 60)
+        logger.info("PRE-SOLVE STATE")
+        logger.info("=" * 60)
         logger.info(
-            f"Created faculty activity variables: "
-            f"{len(fac_clinic)} clinic, {len(fac_supervise)} supervise, "
-            f"{len(fac_pcat)} pcat, {len(fac_do)} do"
+            f"Model: {len(proto.variables)} vars, {len(proto.constraints)} constraints"
+        )
+        logger.info(
+            f"Residents: {len(context.residents)}, Faculty: {len(context.faculty)}"
         )
+        logger.info(
+            f"Templates: {len(context.templates)}, Workday blocks: {len(workday_blocks)}"
+        )
+        logger.info(f"Resident decision vars (x): {len(x)}")
+        logger.info(f"Faculty decision vars (f): {len(f)}")
+        logger.info(f"Existing assignments to preserve: {len(existing_assignments)}")
 
-        # ==================================================
-        # RESIDENT CLINIC INDICATORS (for supervision constraints)
-        # ==================================================
-        resident_clinic = {}
-        clinic_template_ids = set()
-        for template in context.templates:
-            if getattr(template, "rotation_type", "") == "outpatient":
-                clinic_template_ids.add(template.id)
+        # Count locked assignments by person
+        locked_by_person = {}
+        for a in existing_assignments:
+            name = "unknown"
+            if a.person_id in context.resident_idx:
+                name = f"R:{context.residents[context.resident_idx[a.person_id]].name}"
+            elif a.person_id in context.faculty_idx:
+                name = f"F:{context.faculty[context.faculty_idx[a.person_id]].name}"
+            locked_by_person[name] = locked_by_person.get(name, 0) + 1
+        for name, count in sorted(locked_by_person.items(), key=lambda x: -x[1])[:10]:
+            logger.info(f"  Locked: {name} = {count}")
 
-        if clinic_template_ids:
-            clinic_template_indices = [
-                template_idx[tid] for tid in clinic_template_ids if tid in template_idx
-            ]
-            for resident in context.residents:
-                r_i = context.resident_idx[resident.id]
-                for block in workday_blocks:
-                    b_i = context.block_idx[block.id]
-                    clinic_vars = [
-                        x[r_i, b_i, t_i]
-                        for t_i in clinic_template_indices
-                        if (r_i, b_i, t_i) in x
-                    ]
-                    if clinic_vars:
-                        resident_clinic[
-                            (resident.id, block.date, block.time_of_day)
-                        ] = (
-                            clinic_vars[0]
-                            if len(clinic_vars) == 1
-                            else sum(clinic_vars)
-                        )
+        # Log hard constraints from constraint manager
+        hard_constraints = []
+        soft_constraints = []
+        for c in self.constraint_manager.constraints:
+            is_hard = (
+                hasattr(c, "is_hard")
+                and c.is_hard
+                or c.__class__.__name__.endswith("HardConstraint")
+            )
+            from app.scheduling.constraints.base import HardConstraint
 
-        # Re-key faculty activity vars from (int, int) to (UUID, date, slot)
-        # so constraints can look them up by faculty ID + date + AM/PM
-        faculty_at_by_slot: dict[tuple, Any] = {}
-        faculty_pcat_by_slot: dict[tuple, Any] = {}
-        faculty_clinic_by_slot: dict[tuple, Any] = {}
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
-                slot_key = (faculty.id, block.date, block.time_of_day)
-                if (f_i, b_i) in fac_supervise:
-                    faculty_at_by_slot[slot_key] = fac_supervise[f_i, b_i]
-                if (f_i, b_i) in fac_pcat:
-                    faculty_pcat_by_slot[slot_key] = fac_pcat[f_i, b_i]
-                if (f_i, b_i) in fac_clinic:
-                    faculty_clinic_by_slot[slot_key] = fac_clinic[f_i, b_i]
+            if isinstance(c, HardConstraint):
+                hard_constraints.append(c.name)
+            else:
+                soft_constraints.append(c.name)
+        logger.info(f"Hard constraints from manager: {hard_constraints}")
+        logger.info(f"Soft constraints from manager: {soft_constraints}")
 
-        variables = {
-            "assignments": x_2d,  # For legacy constraints (residents)
-            "template_assignments": x,  # For rotation-specific constraints (residents)
-            "faculty_assignments": f_2d,  # Faculty 2D view
-            "faculty_template_assignments": f,  # Faculty 3D view
-            "call_assignments": call,  # Overnight call assignments
-            # Faculty activity variables (index-keyed, for objective function)
-            "fac_clinic": fac_clinic,
-            "fac_supervise": fac_supervise,
-            "fac_pcat": fac_pcat,
-            "fac_do": fac_do,
-            # Constraint wiring (UUID-date-slot keyed)
-            "faculty_at": faculty_at_by_slot,
-            "faculty_pcat": faculty_pcat_by_slot,
-            "faculty_clinic": faculty_clinic_by_slot,
-            "resident_clinic": resident_clinic,
-        }
+        # Log built-in hard constraints in this solver
+        logger.info("Built-in hard constraints in solver:")
+        logger.info(
+            "  - OneAssignmentPerBlock: each (resident, block) has exactly 1 template"
+        )
+        logger.info(
+            "  - FacultyAtMostOnePerBlock: each (faculty, block) has at most 1 template"
+        )
+        logger.info("  - FacultySupervision: 4*supervisors >= supervision_load")
+        logger.info("  - OneCallPerNight: exactly 1 faculty per night")
+        logger.info("  - FacultyClinicCap: faculty clinic <= weekly max")
+        logger.info(
+            "  - PCAT/DO linkage: call[f,n]=1 => pcat[f,n+1,AM]=1, do[f,n+1,PM]=1"
+        )
+        logger.info(
+            "  - ExistingAssignmentPreservation: locked assignments forced to 1"
+        )
+        logger.info(f"  - Locked existing assignments: {len(existing_assignments)}")
+        logger.info("=" * 60)
 
         # ==================================================
-        # CONSTRAINT: At most one rotation per resident per block
+        # SOLVE (sandboxed — resource limits enforced)
+        # ==================================================
+        from app.scheduling.solver_sandbox import (
+            MemoryWatchdog,
+            SandboxMetrics,
+            SolverResourceLimits,
+            clamp_workers,
+            create_sandboxed_callback,
+        )
+
+        try:
+            from app.core.config import settings
+
+            limits = SolverResourceLimits.from_settings(settings)
+        except Exception:
+            limits = SolverResourceLimits()
+
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = min(
+            self.timeout_seconds, limits.max_wall_time_seconds
+        )
+        solver.parameters.num_search_workers = clamp_workers(
+            self.num_workers, limits.max_workers
+        )
+        # Disable symmetry detection — residents/faculty have heterogeneous
+        # PGY levels, templates, and availability so few symmetries exist.
+        # Saves O(n^2) presolve overhead.
+        solver.parameters.symmetry_level = 0
+        # Minimal linearization — constraints are already linear or use
+        # AddAbsEquality; deeper levels add overhead for no benefit.
+        solver.parameters.linearization_level = 1
+        solver.parameters.log_search_progress = True
+
+        # Create progress callback if Redis client is available
+        inner_callback = None
+        if self.task_id and self.redis_client:
+            try:
+                # Publish to the WebSocket broadcast channel for real-time
+                # visualization; the API processes relay it to clients
+                from app.websocket.manager import publish_solver_event
+
+                callback_wrapper = SolverProgressCallback(
+                    self.task_id,
+                    self.redis_client,
+                    broadcast_callback=partial(
+                        publish_solver_event, self.redis_client
+                    ),
+                )
+                inner_callback = callback_wrapper.get_callback()
+                logger.info(f"Progress tracking enabled for task {self.task_id}")
+            except Exception as e:
+                logger.warning(f"Failed to create progress callback: {e}")
+
+        # Start memory watchdog and wrap callback with resource checks
+        watchdog = MemoryWatchdog(max_memory_mb=limits.max_memory_mb)
+        sandbox_callback = create_sandboxed_callback(watchdog, inner_callback)
+        sandbox_metrics = SandboxMetrics()
+
+        watchdog.start()
+        try:
+            status = solver.Solve(model, sandbox_callback)
+        finally:
+            watchdog.stop()
+            watchdog.join(timeout=2.0)
+            sandbox_metrics.peak_memory_mb = watchdog.peak_mb
+            sandbox_metrics.wall_time_seconds = time.time() - start_time
+
+        if sandbox_callback.memory_aborted:
+            sandbox_metrics.aborted = True
+            sandbox_metrics.abort_reason = (
+                f"memory exceeded {limits.max_memory_mb}MB "
+                f"(peak: {watchdog.peak_mb:.0f}MB)"
+            )
+            logger.warning(f"Solver aborted by sandbox: {sandbox_metrics.abort_reason}")
+        else:
+            logger.info(
+                f"Solver sandbox metrics: peak_memory={sandbox_metrics.peak_memory_mb:.0f}MB, "
+                f"wall_time={sandbox_metrics.wall_time_seconds:.1f}s, "
+                f"solutions={sandbox_callback.solution_count}"
+            )
+
+        runtime = time.time() - start_time
+
+        # Store final status in Redis if callback was used
+        if self.task_id and self.redis_client:
+            try:
+                status_name = solver.StatusName(status)
+                final_data = {
+                    "solutions_found": sandbox_callback.solution_count
+                    if sandbox_callback
+                    else 0,
+                    "current_objective": (
+                        solver.ObjectiveValue()
+                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+                        else 0
+                    ),
+                    "best_bound": (
+                        solver.BestObjectiveBound()
+                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+                        else 0
+                    ),
+                    "optimality_gap_pct": 0.0 if status == cp_model.OPTIMAL else None,
+                    "progress_pct": 100.0 if status == cp_model.OPTIMAL else 99.0,
+                    "elapsed_seconds": round(runtime, 2),
+                    "status": (
+                        "completed"
+                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
+                        else "failed"
+                    ),
+                    "solver_status": status_name,
+                    "timestamp": time.time(),
+                }
+                self.redis_client.setex(
+                    f"solver_progress:{self.task_id}",
+                    SOLVER_PROGRESS_TTL_SECONDS,
+                    json.dumps(final_data),
+                )
+            except Exception as e:
+                logger.error(f"Failed to store final status in Redis: {e}")
+
+        # Check solution status
+        status_name = solver.StatusName(status)
+        if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
+            logger.warning(f"CP-SAT solver status: {status_name}")
+
+            # Enhanced debugging for INFEASIBLE
+            logger.error("=" * 60)
+            logger.error("INFEASIBLE SOLVER DEBUGGING")
+            logger.error("=" * 60)
+
+            # Log model statistics
+            proto = model.Proto()
+            logger.error(
+                f"Model stats: {len(proto.variables)} vars, {len(proto.constraints)} constraints"
+            )
+
+            # Log resident/faculty counts
+            logger.error(f"Residents: {len(context.residents)}")
+            logger.error(f"Faculty: {len(context.faculty)}")
+            logger.error(f"Templates: {len(context.templates)}")
+            logger.error(f"Workday blocks: {len(workday_blocks)}")
+
+            # Log locked assignment counts
+            locked_resident_count = sum(
+                1 for a in existing_assignments if a.person_id in context.resident_idx
+            )
+            locked_faculty_count = sum(
+                1 for a in existing_assignments if a.person_id in context.faculty_idx
+            )
+            logger.error(f"Locked resident assignments: {locked_resident_count}")
+            logger.error(f"Locked faculty assignments: {locked_faculty_count}")
+
+            # Log template usage
+            template_usage = {}
+            for a in existing_assignments:
+                if a.rotation_template_id:
+                    template_usage[a.rotation_template_id] = (
+                        template_usage.get(a.rotation_template_id, 0) + 1
+                    )
+            logger.error(
+                f"Template usage in locked assignments: {len(template_usage)} unique templates"
+            )
+            for tid, count in sorted(template_usage.items(), key=lambda x: -x[1])[:10]:
+                tname = next(
+                    (t.name for t in context.templates if t.id == tid), str(tid)
+                )
+                logger.error(f"  {tname}: {count}")
+
+            # Log x variable counts by type
+            resident_vars = sum(1 for k in x if k[0] < len(context.residents))
+            logger.error(f"Resident decision vars (x): {resident_vars}")
+            logger.error(f"Faculty decision vars (f): {len(f)}")
+
+            # Check for over-constrained blocks
+            block_constraint_counts = {}
+            for r_i, b_i, t_i in x:
+                block_constraint_counts[b_i] = block_constraint_counts.get(b_i, 0) + 1
+            if block_constraint_counts:
+                max_block = max(block_constraint_counts.values())
+                min_block = min(block_constraint_counts.values())
+                logger.error(f"Vars per block: min={min_block}, max={max_block}")
+
+            # Log supervision constraint info
+            logger.error(f"Clinic template IDs found: {len(clinic_template_ids)}")
+            logger.error(f"Faculty supervise vars: {len(fac_supervise)}")
+
+            logger.error("=" * 60)
+
+            return SolverResult(
+                success=False,
+                assignments=[],
+                status="infeasible",
+                solver_status=status_name,
+                runtime_seconds=runtime,
+            )
+
+        # ==================================================
+        # EXTRACT SOLUTION - Residents
         # ==================================================
+        assignments = []
         for resident in context.residents:
             r_i = context.resident_idx[resident.id]
             for block in workday_blocks:
                 b_i = context.block_idx[block.id]
-                rotation_vars = [
-                    x[r_i, b_i, t_i]
-                    for t_i in range(len(context.templates))
-                    if (r_i, b_i, t_i) in x
-                ]
-                if rotation_vars:
-                    model.Add(sum(rotation_vars) == 1)
+                for template in context.templates:
+                    t_i = template_idx[template.id]
+                    if (r_i, b_i, t_i) in x and solver.Value(x[r_i, b_i, t_i]) == 1:
+                        assignments.append(
+                            (
+                                resident.id,
+                                block.id,
+                                template.id,
+                            )
+                        )
 
         # ==================================================
-        # CONSTRAINT: At most one rotation per faculty per block
+        # EXTRACT SOLUTION - Faculty
         # ==================================================
+        faculty_assignment_count = 0
         for faculty in context.faculty:
             f_i = context.faculty_idx[faculty.id]
             for block in workday_blocks:
                 b_i = context.block_idx[block.id]
-                rotation_vars = [
-                    f[f_i, b_i, t_i]
-                    for t_i in range(len(context.templates))
-                    if (f_i, b_i, t_i) in f
-                ]
-                if rotation_vars:
-                    model.Add(sum(rotation_vars) <= 1)
+                for template in context.templates:
+                    t_i = template_idx[template.id]
+                    if (f_i, b_i, t_i) in f and solver.Value(f[f_i, b_i, t_i]) == 1:
+                        assignments.append(
+                            (
+                                faculty.id,
+                                block.id,
+                                template.id,
+                            )
+                        )
+                        faculty_assignment_count += 1
 
         # ==================================================
-        # FACULTY ACTIVITY CONSTRAINTS
+        # EXTRACT SOLUTION - Overnight Call Assignments
         # ==================================================
+        call_assignments_result = []
+        if call_eligible and call:
+            block_id_by_idx = {context.block_idx[b.id]: b.id for b in context.blocks}
+            for (f_i, b_i, call_type), var in call.items():
+                if solver.Value(var) == 1:
+                    # Find the faculty and block for this variable
+                    faculty_id = None
+                    block_id = block_id_by_idx.get(b_i)
+                    for fac in call_eligible:
+                        if call_idx.get(fac.id) == f_i:
+                            faculty_id = fac.id
+                            break
+                    if faculty_id and block_id:
+                        call_assignments_result.append(
+                            (faculty_id, block_id, call_type)
+                        )
 
-        # Hard-block faculty activity on locked/unavailable slots
-        availability = getattr(context, "availability", {}) or {}
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in context.blocks:
-                b_i = context.block_idx[block.id]
-                is_locked = (faculty.id, block.id) in locked_blocks
-                block_avail = availability.get(faculty.id, {}).get(block.id)
-                is_unavailable = bool(block_avail) and not block_avail.get(
-                    "available", True
-                )
-                if not (is_locked or is_unavailable):
-                    continue
-                if (f_i, b_i) in fac_clinic:
-                    model.Add(fac_clinic[f_i, b_i] == 0)
-                if (f_i, b_i) in fac_supervise:
-                    model.Add(fac_supervise[f_i, b_i] == 0)
-                if (f_i, b_i) in fac_pcat:
-                    model.Add(fac_pcat[f_i, b_i] == 0)
-                if (f_i, b_i) in fac_do:
-                    model.Add(fac_do[f_i, b_i] == 0)
-
-        # Constraint: At most one activity per faculty per slot
-        # (clinic, supervise, pcat, do) are mutually exclusive
-        # If none selected, slot is implicitly OFF
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in context.blocks:
-                b_i = context.block_idx[block.id]
-                activity_vars = []
-                if (f_i, b_i) in fac_clinic:
-                    activity_vars.append(fac_clinic[f_i, b_i])
-                if (f_i, b_i) in fac_supervise:
-                    activity_vars.append(fac_supervise[f_i, b_i])
-                if (f_i, b_i) in fac_pcat:
-                    activity_vars.append(fac_pcat[f_i, b_i])
-                if (f_i, b_i) in fac_do:
-                    activity_vars.append(fac_do[f_i, b_i])
-                if activity_vars:
-                    model.Add(sum(activity_vars) <= 1)
-
-        # Constraint: Faculty clinic limits from DB (clinic_min/clinic_max per week)
-        from collections import defaultdict
-        from datetime import timedelta
-
-        blocks_by_week: dict[tuple, list] = defaultdict(list)
-        for block in workday_blocks:
-            week_start = block.date - timedelta(days=block.date.weekday())
-            blocks_by_week[week_start].append(block)
-
-        # Soft penalty weight for clinic minimum shortfall
-        CLINIC_MIN_PENALTY = 200  # Strong incentive to meet minimum clinic
+            logger.info(
+                f"CP-SAT found {len(call_assignments_result)} overnight call assignments"
+            )
 
+        # ==================================================
+        # EXTRACT SOLUTION - Faculty Half-Day Assignments
+        # For each faculty, for each block, determine activity:
+        # clinic, supervise, pcat, do, or off (default)
+        # ==================================================
+        faculty_half_day_result = []
         for faculty in context.faculty:
             f_i = context.faculty_idx[faculty.id]
-            weekly_min = getattr(faculty, "min_clinic_halfdays_per_week", 0) or 0
-            weekly_max = getattr(faculty, "max_clinic_halfdays_per_week", 4) or 4
-
-            for week_start, week_blocks in blocks_by_week.items():
-                clinic_vars = [
-                    fac_clinic[f_i, context.block_idx[b.id]]
-                    for b in week_blocks
-                    if (f_i, context.block_idx[b.id]) in fac_clinic
-                ]
-                if clinic_vars:
-                    model.Add(sum(clinic_vars) <= weekly_max)
-                    # MIN is soft to avoid infeasibility with supervision demand
-                    if weekly_min > 0:
-                        shortfall = model.NewIntVar(
-                            0,
-                            weekly_min,
-                            f"clinic_shortfall_{f_i}_{week_start}",
-                        )
-                        model.Add(shortfall >= weekly_min - sum(clinic_vars))
-                        obj_terms: Any = variables.setdefault("objective_terms", [])
-                        obj_terms.append((shortfall, CLINIC_MIN_PENALTY))
-
-        # Constraint: PCAT/DO linked to overnight call
-        # If call[f, date] = 1, then pcat[f, date+1, AM] = 1 and do[f, date+1, PM] = 1
-        allowed_pcat: set[tuple[int, int]] = set()
-        allowed_do: set[tuple[int, int]] = set()
-        if call_eligible and call:
-            # Build date->block mapping
-            date_am_block = {}
-            date_pm_block = {}
-            for block in context.blocks:
-                if block.time_of_day == "AM":
-                    date_am_block[block.date] = block
-                else:
-                    date_pm_block[block.date] = block
-
-            # Pre-build reverse lookups for O(1) access (avoids O(N*B) inner loops)
-            block_by_idx = {context.block_idx[b.id]: b for b in context.blocks}
-            faculty_id_by_call_idx = {
-                call_idx[fac.id]: fac.id for fac in call_eligible if fac.id in call_idx
-            }
-
-            for (f_i_call, b_i_call, call_type), call_var in call.items():
-                call_block = block_by_idx.get(b_i_call)
-                if not call_block:
-                    continue
-
-                next_day = call_block.date + timedelta(days=1)
-
-                faculty_id = faculty_id_by_call_idx.get(f_i_call)
-                if not faculty_id or faculty_id not in context.faculty_idx:
-                    continue
-
-                f_i = context.faculty_idx[faculty_id]
+            for block in context.blocks:  # All blocks (56 per 4-week period)
+                b_i = context.block_idx[block.id]
 
-                # Link PCAT to next day AM (bidirectional)
-                if next_day in date_am_block:
-                    next_am = date_am_block[next_day]
-                    next_am_b_i = context.block_idx[next_am.id]
-                    if (f_i, next_am_b_i) in fac_pcat:
-                        allowed_pcat.add((f_i, next_am_b_i))
-                        # call <=> pcat (bidirectional: PCAT iff call)
-                        model.Add(fac_pcat[f_i, next_am_b_i] == call_var)
+                # Determine activity for this slot
+                activity = "OFF"  # Default
 
-                # Link DO to next day PM (bidirectional)
-                if next_day in date_pm_block:
-                    next_pm = date_pm_block[next_day]
-                    next_pm_b_i = context.block_idx[next_pm.id]
-                    if (f_i, next_pm_b_i) in fac_do:
-                        allowed_do.add((f_i, next_pm_b_i))
-                        # call <=> do (bidirectional: DO iff call)
-                        model.Add(fac_do[f_i, next_pm_b_i] == call_var)
+                if (f_i, b_i) in fac_clinic and solver.Value(fac_clinic[f_i, b_i]) == 1:
+                    activity = "C"  # Clinic
+                elif (f_i, b_i) in fac_supervise and solver.Value(
+                    fac_supervise[f_i, b_i]
+                ) == 1:
+                    activity = "AT"  # Attending/Supervision
+                elif (f_i, b_i) in fac_pcat and solver.Value(fac_pcat[f_i, b_i]) == 1:
+                    activity = "PCAT"  # Post-Call Attending Time
+                elif (f_i, b_i) in fac_do and solver.Value(fac_do[f_i, b_i]) == 1:
+                    activity = "DO"  # Day Off (post-call)
 
-        # If no call mapping exists for a slot, PCAT/DO must be 0
-        for (f_i, b_i), var in fac_pcat.items():
-            if (f_i, b_i) not in allowed_pcat:
-                model.Add(var == 0)
-        for (f_i, b_i), var in fac_do.items():
-            if (f_i, b_i) not in allowed_do:
-                model.Add(var == 0)
+                faculty_half_day_result.append((faculty.id, block.id, activity))
 
-        # Constraint: Supervision ratio (ACGME)
-        # For each slot with residents in clinic, need enough faculty supervisors
-        # PGY-1: 1 faculty per 2 residents (ratio 0.5)
-        # PGY-2/3: 1 faculty per 4 residents (ratio 0.25)
-        # Find clinic template(s)
-        clinic_template_ids = set()
-        for template in context.templates:
-            name_lower = template.name.lower()
-            if (
-                "clinic" in name_lower
-                or "fm" in name_lower
-                or "outpatient" in name_lower
-            ):
-                clinic_template_ids.add(template.id)
+        # Count by activity type for logging
+        activity_counts = {}
+        for _, _, act in faculty_half_day_result:
+            activity_counts[act] = activity_counts.get(act, 0) + 1
 
-        if clinic_template_ids:
-            clinic_template_indices = [
-                template_idx[tid] for tid in clinic_template_ids if tid in template_idx
-            ]
+        logger.info(
+            f"CP-SAT generated {len(faculty_half_day_result)} faculty half-day assignments "
+            f"({len(context.faculty)} faculty × {len(context.blocks)} blocks): "
+            f"C={activity_counts.get('C', 0)}, AT={activity_counts.get('AT', 0)}, "
+            f"PCAT={activity_counts.get('PCAT', 0)}, DO={activity_counts.get('DO', 0)}, "
+            f"OFF={activity_counts.get('OFF', 0)}"
+        )
 
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
+        logger.info(
+            f"CP-SAT found {len(assignments)} assignments "
+            f"({len(assignments) - faculty_assignment_count} residents, "
+            f"{faculty_assignment_count} faculty) in {runtime:.2f}s (status: {status_name})"
+        )
 
-                # Count PGY-1 residents in clinic
-                pgy1_in_clinic = []
-                pgy23_in_clinic = []
-                for resident in context.residents:
-                    r_i = context.resident_idx[resident.id]
-                    pgy = getattr(resident, "pgy_level", 2)
-                    for t_i in clinic_template_indices:
-                        if (r_i, b_i, t_i) in x:
-                            if pgy == 1:
-                                pgy1_in_clinic.append(x[r_i, b_i, t_i])
-                            else:
-                                pgy23_in_clinic.append(x[r_i, b_i, t_i])
+        return SolverResult(
+            success=True,
+            assignments=assignments,
+            status="optimal" if status == cp_model.OPTIMAL else "feasible",
+            objective_value=solver.ObjectiveValue(),
+            runtime_seconds=runtime,
+            solver_status=status_name,
+            statistics={
+                "total_blocks": len(workday_blocks),
+                "total_residents": len(context.residents),
+                "total_faculty": len(context.faculty),
+                "total_templates": len(context.templates),
+                "resident_assignments": len(assignments) - faculty_assignment_count,
+                "faculty_assignments": faculty_assignment_count,
+                "call_assignments": len(call_assignments_result),
+                "faculty_half_day_assignments": len(faculty_half_day_result),
+                "faculty_activity_breakdown": activity_counts,
+                "coverage_rate": (
+                    len(assignments) / len(workday_blocks) if workday_blocks else 0
+                ),
+                "branches": solver.NumBranches(),
+                "conflicts": solver.NumConflicts(),
+                "model_cache": model_cache_status,
+                "model_build_seconds": round(compiled.build_seconds, 3),
+            },
+            call_assignments=call_assignments_result,
+            faculty_half_day_assignments=faculty_half_day_result,
+        )
 
-                if not pgy1_in_clinic and not pgy23_in_clinic:
-                    continue
+    def _compile_model(
+        self,
+        cp_model: Any,
+        context: SchedulingContext,
+        workday_blocks: list,
+    ) -> CompiledCPSATModel:
+        """
+        Build the CP-SAT model structure: variables, constraints and objective.
 
-                # Calculate supervision load (multiply by 4 to avoid fractions)
-                # PGY-1: 2 per faculty (load = 2), PGY-2/3: 4 per faculty (load = 1)
-                # supervision_load = pgy1 * 2 + pgy23 * 1
-                # supervision_needed * 4 >= supervision_load
-                pgy1_sum = sum(pgy1_in_clinic) if pgy1_in_clinic else 0
-                pgy23_sum = sum(pgy23_in_clinic) if pgy23_in_clinic else 0
-                supervision_load = pgy1_sum * 2 + pgy23_sum
+        Everything here depends only on the context and the constraint
+        configuration, so the result can be cached and reused across runs.
+        Per-run state (availability, locked slots, preserved assignments,
+        run-layer constraints, hints) is applied by ``solve``.
 
-                # Faculty supervising in this block
-                faculty_supervising = [
-                    fac_supervise[context.faculty_idx[fac.id], b_i]
-                    for fac in context.faculty
-                    if (context.faculty_idx[fac.id], b_i) in fac_supervise
-                ]
+        Args:
+            cp_model: The ``ortools.sat.python.cp_model`` module
+            context: SchedulingContext with residents, blocks, templates and
+                its run inputs emptied (see ``template_context``)
+            workday_blocks: Non-weekend blocks from the context
 
-                if faculty_supervising:
-                    # supervision_needed >= ceil(supervision_load / 4)
-                    # Linearized: 4 * sum(supervisors) >= supervision_load
-                    model.Add(4 * sum(faculty_supervising) >= supervision_load)
+        Returns:
+            CompiledCPSATModel holding the model and its variable handles
+        """
+        build_start = time.perf_counter()
 
-        logger.info(
-            "Added faculty activity constraints (clinic limits, PCAT/DO, supervision)"
-        )
+        # Create the CP model
+        model = cp_model.CpModel()
 
         # ==================================================
-        # APPLY CONSTRAINTS FROM MANAGER
+        # DECISION VARIABLES
+        # x[r_i, b_i, t_i] = 1 if resident r assigned to rotation t during block b
         # ==================================================
-        self.constraint_manager.apply_to_cpsat(model, variables, context)
+        x = {}
+        template_idx = {t.id: i for i, t in enumerate(context.templates)}
 
-        # ==================================================
-        # PRESERVE EXISTING ASSIGNMENTS
-        # ==================================================
-        if existing_assignments:
-            for assignment in existing_assignments:
-                if assignment.person_id in context.resident_idx:
-                    r_i = context.resident_idx[assignment.person_id]
-                    if assignment.block_id in context.block_idx:
-                        b_i = context.block_idx[assignment.block_id]
-                        if (
-                            assignment.rotation_template_id
-                            and assignment.rotation_template_id in template_idx
-                        ):
-                            t_i = template_idx[assignment.rotation_template_id]
-                            if (r_i, b_i, t_i) in x:
-                                model.Add(x[r_i, b_i, t_i] == 1)
+        resident_template_map = getattr(context, "resident_template_map", {}) or {}
+        active_template_ids = {t.id for t in context.templates}
+        for resident in context.residents:
+            r_i = context.resident_idx[resident.id]
+            raw_assigned = resident_template_map.get(resident.id, set())
+            # Only restrict to assigned templates that are actually active;
+            # if none match (e.g. archived template), allow all templates
+            # so the resident still gets solver variables.
+            assigned_template_ids = raw_assigned & active_template_ids
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                for template in context.templates:
+                    # If resident has BlockAssignment(s), only create vars for those rotations
+                    if (
+                        assigned_template_ids
+                        and template.id not in assigned_template_ids
+                    ):
+                        continue
+                    t_i = template_idx[template.id]
+                    x[r_i, b_i, t_i] = model.NewBoolVar(f"x_{r_i}_{b_i}_{t_i}")
+
+        # Store both 2D (for legacy constraints) and 3D variables
+        # 2D view: x_2d[r_i, b_i] = OR of all rotations
+        x_2d = {}
+        for resident in context.residents:
+            r_i = context.resident_idx[resident.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                rotation_vars = [
+                    x[r_i, b_i, t_i]
+                    for t_i in range(len(context.templates))
+                    if (r_i, b_i, t_i) in x
+                ]
+                if rotation_vars:
+                    # Create a 2D indicator: 1 if assigned to any rotation in this block
+                    x_2d[r_i, b_i] = model.NewBoolVar(f"x_2d_{r_i}_{b_i}")
+                    # x_2d = 1 iff at least one rotation is selected
+                    model.Add(sum(rotation_vars) >= 1).OnlyEnforceIf(x_2d[r_i, b_i])
+                    model.Add(sum(rotation_vars) == 0).OnlyEnforceIf(
+                        x_2d[r_i, b_i].Not()
+                    )
 
         # ==================================================
-        # OBJECTIVE FUNCTION
-        # Maximize: coverage * 1000 - equity_penalty - template_balance_penalty
-        #
-        # Template balance ensures assignments are distributed across rotation
-        # types, not concentrated in a single rotation (e.g., all Night Float).
+        # FACULTY DECISION VARIABLES
+        # f[f_i, b_i, t_i] = 1 if faculty f assigned to rotation t during block b
         # ==================================================
-        coverage = sum(x.values())
-
-        # Calculate template assignment counts for balance penalty
-        template_counts = {}
-        for t_i, template in enumerate(context.templates):
-            template_vars = [
-                x[r_i, b_i, t_i]
-                for r_i in range(len(context.residents))
-                for b_i in range(len(workday_blocks))
-                if (r_i, b_i, t_i) in x
-            ]
-            if template_vars:
-                template_counts[t_i] = sum(template_vars)
+        f = {}
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                for template in context.templates:
+                    t_i = template_idx[template.id]
+                    f[f_i, b_i, t_i] = model.NewBoolVar(f"f_{f_i}_{b_i}_{t_i}")
 
-        # Template balance penalty: penalize max template count to encourage distribution
-        # This prevents all assignments going to one rotation type
-        template_balance_penalty = None
-        if len(template_counts) > 1:
-            max_template_count = model.NewIntVar(
-                0, len(context.residents) * len(workday_blocks), "max_template_count"
-            )
-            for t_i, count_expr in template_counts.items():
-                model.Add(max_template_count >= count_expr)
-            template_balance_penalty = max_template_count
+        # 2D view for faculty
+        f_2d = {}
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                rotation_vars = [
+                    f[f_i, b_i, t_i]
+                    for t_i in range(len(context.templates))
+                    if (f_i, b_i, t_i) in f
+                ]
+                if rotation_vars:
+                    f_2d[f_i, b_i] = model.NewBoolVar(f"f_2d_{f_i}_{b_i}")
+                    model.Add(sum(rotation_vars) >= 1).OnlyEnforceIf(f_2d[f_i, b_i])
+                    model.Add(sum(rotation_vars) == 0).OnlyEnforceIf(
+                        f_2d[f_i, b_i].Not()
+                    )
 
-        # Build objective with all penalties
-        equity_penalty_cpsat: Any = variables.get("equity_penalty")
-        objective_terms_cpsat: Any = variables.get("objective_terms", [])
+        # ==================================================
+        # OVERNIGHT CALL DECISION VARIABLES
+        # call[f_i, b_i, "overnight"] = 1 if faculty f on call for block b's date
+        # Only Sun-Thurs nights (weekday 0,1,2,3,6)
+        # ==================================================
+        call = {}
+        call_eligible = getattr(context, "call_eligible_faculty", [])
+        call_idx = getattr(
+            context,
+            "call_eligible_faculty_idx",
+            {fac.id: i for i, fac in enumerate(call_eligible)},
+        )
 
-        objective_expr = coverage * COVERAGE_WEIGHT
-        if equity_penalty_cpsat is not None:
-            objective_expr -= equity_penalty_cpsat * EQUITY_PENALTY_WEIGHT
-        if template_balance_penalty is not None:
-            objective_expr -= template_balance_penalty * TEMPLATE_BALANCE_WEIGHT
-        if objective_terms_cpsat:
-            for term_var, weight in objective_terms_cpsat:
-                objective_expr -= term_var * int(weight)
+        if call_eligible:
+            # Track dates already processed (one call per date, not per block)
+            call_dates_processed = set()
+            from app.scheduling.calendar_policy import is_overnight_call_day
 
-        # Discourage unneeded faculty supervision (phantom AT)
-        # Without this, the solver may arbitrarily assign AT to fill empty slots
-        # even when there are no residents in clinic (e.g. final Wednesday PM LEC).
-        if fac_supervise:
-            objective_expr -= sum(fac_supervise.values())
+            call_blocks = [
+                block for block in context.blocks if is_overnight_call_day(block.date)
+            ]
+            for block in call_blocks:
+                if block.date in call_dates_processed:
+                    continue
+                call_dates_processed.add(block.date)
 
-        model.Maximize(objective_expr)
+                b_i = context.block_idx[block.id]
+                for faculty in call_eligible:
+                    call_f_i = call_idx.get(faculty.id)
+                    if call_f_i is not None:
+                        call[call_f_i, b_i, "overnight"] = model.NewBoolVar(
+                            f"call_{call_f_i}_{b_i}"
+                        )
+            logger.info(
+                f"Created {len(call)} call variables for {len(call_eligible)} "
+                f"eligible faculty across {len(call_dates_processed)} nights"
+            )
 
         # ==================================================
-        # SOLUTION HINTING (warm start)
-        # Provide a greedy initial solution so the solver starts with a
-        # feasible bound and prunes the search space faster.
+        # FACULTY ACTIVITY DECISION VARIABLES (Half-Day Level)
+        # These determine what each faculty does in each half-day slot:
+        # - clinic: Faculty primary clinic session
+        # - supervise: Faculty supervising residents
+        # - pcat: Post-call attending (morning after overnight call)
+        # - do: Day off (afternoon after overnight call)
+        # If none selected, slot defaults to OFF
         # ==================================================
-        hinted_resident_blocks: set[tuple[int, int]] = set()
-        hinted_vars: set[int] = set()  # Track var IDs already hinted
-        hint_count = 0
+        fac_clinic = {}  # fac_clinic[f_i, b_i] = 1 if faculty f does clinic in block b
+        fac_supervise = {}  # fac_supervise[f_i, b_i] = 1 if faculty f supervises
+        fac_pcat = {}  # fac_pcat[f_i, b_i] = 1 if faculty f has PCAT
+        fac_do = {}  # fac_do[f_i, b_i] = 1 if faculty f has DO
 
-        # Priority 1: hint existing (locked) assignments
-        for assignment in existing_assignments:
-            if assignment.person_id in context.resident_idx:
-                r_i = context.resident_idx[assignment.person_id]
-                if assignment.block_id in context.block_idx:
-                    b_i = context.block_idx[assignment.block_id]
-                    if (
-                        assignment.rotation_template_id
-                        and assignment.rotation_template_id in template_idx
-                    ):
-                        t_i = template_idx[assignment.rotation_template_id]
-                        if (r_i, b_i, t_i) in x:
-                            model.AddHint(x[r_i, b_i, t_i], 1)
-                            hinted_resident_blocks.add((r_i, b_i))
-                            hinted_vars.add(id(x[r_i, b_i, t_i]))
-                            hint_count += 1
+        # Track which blocks are AM vs PM for PCAT/DO assignment
+        am_blocks = {b.id: b for b in context.blocks if b.time_of_day == "AM"}
+        pm_blocks = {b.id: b for b in context.blocks if b.time_of_day == "PM"}
 
-        # Priority 2: greedy fill — for each unhinted (resident, block),
-        # hint the first available template to 1, rest to 0.
-        # Skip vars already hinted in Priority 1 to avoid overriding.
-        for (r_i, b_i, t_i), var in x.items():
-            if id(var) in hinted_vars:
-                continue  # Already hinted to 1 in Priority 1
-            if (r_i, b_i) not in hinted_resident_blocks:
-                model.AddHint(var, 1)
-                hinted_resident_blocks.add((r_i, b_i))
-                hint_count += 1
-            else:
-                model.AddHint(var, 0)
+        # Create variables for all faculty across all blocks (including weekends for PCAT/DO)
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in context.blocks:  # All blocks, not just workdays
+                b_i = context.block_idx[block.id]
 
-        logger.info(f"Solution hints: {hint_count} vars hinted to 1")
+                # Clinic only on workdays (not weekends/holidays)
+                if not block.is_weekend and not getattr(block, "is_holiday", False):
+                    fac_clinic[f_i, b_i] = model.NewBoolVar(f"fac_clinic_{f_i}_{b_i}")
+                    fac_supervise[f_i, b_i] = model.NewBoolVar(
+                        f"fac_supervise_{f_i}_{b_i}"
+                    )
+
+                # PCAT/DO can happen any day (after overnight call)
+                fac_pcat[f_i, b_i] = model.NewBoolVar(f"fac_pcat_{f_i}_{b_i}")
+                fac_do[f_i, b_i] = model.NewBoolVar(f"fac_do_{f_i}_{b_i}")
 
-        # ==================================================
-        # PRE-SOLVE DEBUGGING
-        # ==================================================
-        proto = model.Proto()
-        logger.info("=" * 60)
-        logger.info("PRE-SOLVE STATE")
-        logger.info("=" * 60)
-        logger.info(
-            f"Model: {len(proto.variables)} vars, {len(proto.constraints)} constraints"
-        )
-        logger.info(
-            f"Residents: {len(context.residents)}, Faculty: {len(context.faculty)}"
-        )
         logger.info(
-            f"Templates: {len(context.templates)}, Workday blocks: {len(workday_blocks)}"
+            f"Created faculty activity variables: "
+            f"{len(fac_clinic)} clinic, {len(fac_supervise)} supervise, "
+            f"{len(fac_pcat)} pcat, {len(fac_do)} do"
         )
-        logger.info(f"Resident decision vars (x): {len(x)}")
-        logger.info(f"Faculty decision vars (f): {len(f)}")
-        logger.info(f"Existing assignments to preserve: {len(existing_assignments)}")
 
-        # Count locked assignments by person
-        locked_by_person = {}
-        for a in existing_assignments:
-            name = "unknown"
-            if a.person_id in context.resident_idx:
-                name = f"R:{context.residents[context.resident_idx[a.person_id]].name}"
-            elif a.person_id in context.faculty_idx:
-                name = f"F:{context.faculty[context.faculty_idx[a.person_id]].name}"
-            locked_by_person[name] = locked_by_person.get(name, 0) + 1
-        for name, count in sorted(locked_by_person.items(), key=lambda x: -x[1])[:10]:
-            logger.info(f"  Locked: {name} = {count}")
+        # ==================================================
+        # RESIDENT CLINIC INDICATORS (for supervision constraints)
+        # ==================================================
+        resident_clinic = {}
+        clinic_template_ids = set()
+        for template in context.templates:
+            if getattr(template, "rotation_type", "") == "outpatient":
+                clinic_template_ids.add(template.id)
 
-        # Log hard constraints from constraint manager
-        hard_constraints = []
-        soft_constraints = []
-        for c in self.constraint_manager.constraints:
-            is_hard = (
-                hasattr(c, "is_hard")
-                and c.is_hard
-                or c.__class__.__name__.endswith("HardConstraint")
-            )
-            from app.scheduling.constraints.base import HardConstraint
+        if clinic_template_ids:
+            clinic_template_indices = [
+                template_idx[tid] for tid in clinic_template_ids if tid in template_idx
+            ]
+            for resident in context.residents:
+                r_i = context.resident_idx[resident.id]
+                for block in workday_blocks:
+                    b_i = context.block_idx[block.id]
+                    clinic_vars = [
+                        x[r_i, b_i, t_i]
+                        for t_i in clinic_template_indices
+                        if (r_i, b_i, t_i) in x
+                    ]
+                    if clinic_vars:
+                        resident_clinic[
+                            (resident.id, block.date, block.time_of_day)
+                        ] = (
+                            clinic_vars[0]
+                            if len(clinic_vars) == 1
+                            else sum(clinic_vars)
+                        )
 
-            if isinstance(c, HardConstraint):
-                hard_constraints.append(c.name)
-            else:
-                soft_constraints.append(c.name)
-        logger.info(f"Hard constraints from manager: {hard_constraints}")
-        logger.info(f"Soft constraints from manager: {soft_constraints}")
+        # Re-key faculty activity vars from (int, int) to (UUID, date, slot)
+        # so constraints can look them up by faculty ID + date + AM/PM
+        faculty_at_by_slot: dict[tuple, Any] = {}
+        faculty_pcat_by_slot: dict[tuple, Any] = {}
+        faculty_clinic_by_slot: dict[tuple, Any] = {}
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                slot_key = (faculty.id, block.date, block.time_of_day)
+                if (f_i, b_i) in fac_supervise:
+                    faculty_at_by_slot[slot_key] = fac_supervise[f_i, b_i]
+                if (f_i, b_i) in fac_pcat:
+                    faculty_pcat_by_slot[slot_key] = fac_pcat[f_i, b_i]
+                if (f_i, b_i) in fac_clinic:
+                    faculty_clinic_by_slot[slot_key] = fac_clinic[f_i, b_i]
 
-        # Log built-in hard constraints in this solver
-        logger.info("Built-in hard constraints in solver:")
-        logger.info(
-            "  - OneAssignmentPerBlock: each (resident, block) has exactly 1 template"
-        )
-        logger.info(
-            "  - FacultyAtMostOnePerBlock: each (faculty, block) has at most 1 template"
-        )
-        logger.info("  - FacultySupervision: 4*supervisors >= supervision_load")
-        logger.info("  - OneCallPerNight: exactly 1 faculty per night")
-        logger.info("  - FacultyClinicCap: faculty clinic <= weekly max")
-        logger.info(
-            "  - PCAT/DO linkage: call[f,n]=1 => pcat[f,n+1,AM]=1, do[f,n+1,PM]=1"
-        )
-        logger.info(
-            "  - ExistingAssignmentPreservation: locked assignments forced to 1"
-        )
-        logger.info(f"  - Locked existing assignments: {len(existing_assignments)}")
-        logger.info("=" * 60)
+        variables = {
+            "assignments": x_2d,  # For legacy constraints (residents)
+            "template_assignments": x,  # For rotation-specific constraints (residents)
+            "faculty_assignments": f_2d,  # Faculty 2D view
+            "faculty_template_assignments": f,  # Faculty 3D view
+            "call_assignments": call,  # Overnight call assignments
+            # Faculty activity variables (index-keyed, for objective function)
+            "fac_clinic": fac_clinic,
+            "fac_supervise": fac_supervise,
+            "fac_pcat": fac_pcat,
+            "fac_do": fac_do,
+            # Constraint wiring (UUID-date-slot keyed)
+            "faculty_at": faculty_at_by_slot,
+            "faculty_pcat": faculty_pcat_by_slot,
+            "faculty_clinic": faculty_clinic_by_slot,
+            "resident_clinic": resident_clinic,
+        }
+
+        # ==================================================
+        # CONSTRAINT: At most one rotation per resident per block
+        # Exactly one once ``solve`` pins the slot's 2D indicator open;
+        # unavailable and locked slots are pinned closed instead.
+        # ==================================================
+        for resident in context.residents:
+            r_i = context.resident_idx[resident.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                rotation_vars = [
+                    x[r_i, b_i, t_i]
+                    for t_i in range(len(context.templates))
+                    if (r_i, b_i, t_i) in x
+                ]
+                if rotation_vars:
+                    model.Add(sum(rotation_vars) <= 1)
 
         # ==================================================
-        # SOLVE (sandboxed — resource limits enforced)
+        # CONSTRAINT: At most one rotation per faculty per block
         # ==================================================
-        from app.scheduling.solver_sandbox import (
-            MemoryWatchdog,
-            SandboxMetrics,
-            SolverResourceLimits,
-            clamp_workers,
-            create_sandboxed_callback,
-        )
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
+                rotation_vars = [
+                    f[f_i, b_i, t_i]
+                    for t_i in range(len(context.templates))
+                    if (f_i, b_i, t_i) in f
+                ]
+                if rotation_vars:
+                    model.Add(sum(rotation_vars) <= 1)
 
-        try:
-            from app.core.config import settings
+        # ==================================================
+        # FACULTY ACTIVITY CONSTRAINTS
+        # ==================================================
 
-            limits = SolverResourceLimits.from_settings(settings)
-        except Exception:
-            limits = SolverResourceLimits()
+        # Constraint: At most one activity per faculty per slot
+        # (clinic, supervise, pcat, do) are mutually exclusive
+        # If none selected, slot is implicitly OFF
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            for block in context.blocks:
+                b_i = context.block_idx[block.id]
+                activity_vars = []
+                if (f_i, b_i) in fac_clinic:
+                    activity_vars.append(fac_clinic[f_i, b_i])
+                if (f_i, b_i) in fac_supervise:
+                    activity_vars.append(fac_supervise[f_i, b_i])
+                if (f_i, b_i) in fac_pcat:
+                    activity_vars.append(fac_pcat[f_i, b_i])
+                if (f_i, b_i) in fac_do:
+                    activity_vars.append(fac_do[f_i, b_i])
+                if activity_vars:
+                    model.Add(sum(activity_vars) <= 1)
 
-        solver = cp_model.CpSolver()
-        solver.parameters.max_time_in_seconds = min(
-            self.timeout_seconds, limits.max_wall_time_seconds
-        )
-        solver.parameters.num_search_workers = clamp_workers(
-            self.num_workers, limits.max_workers
-        )
-        # Disable symmetry detection — residents/faculty have heterogeneous
-        # PGY levels, templates, and availability so few symmetries exist.
-        # Saves O(n^2) presolve overhead.
-        solver.parameters.symmetry_level = 0
-        # Minimal linearization — constraints are already linear or use
-        # AddAbsEquality; deeper levels add overhead for no benefit.
-        solver.parameters.linearization_level = 1
-        solver.parameters.log_search_progress = True
+        # Constraint: Faculty clinic limits from DB (clinic_min/clinic_max per week)
+        from collections import defaultdict
+        from datetime import timedelta
 
-        # Create progress callback if Redis client is available
-        inner_callback = None
-        if self.task_id and self.redis_client:
-            try:
-                # Import broadcast function for real-time visualization
-                from app.websocket.manager import broadcast_solver_event
+        blocks_by_week: dict[tuple, list] = defaultdict(list)
+        for block in workday_blocks:
+            week_start = block.date - timedelta(days=block.date.weekday())
+            blocks_by_week[week_start].append(block)
 
-                callback_wrapper = SolverProgressCallback(
-                    self.task_id,
-                    self.redis_client,
-                    broadcast_callback=broadcast_solver_event,
-                )
-                inner_callback = callback_wrapper.get_callback()
-                logger.info(f"Progress tracking enabled for task {self.task_id}")
-            except Exception as e:
-                logger.warning(f"Failed to create progress callback: {e}")
+        # Soft penalty weight for clinic minimum shortfall
+        CLINIC_MIN_PENALTY = 200  # Strong incentive to meet minimum clinic
 
-        # Start memory watchdog and wrap callback with resource checks
-        watchdog = MemoryWatchdog(max_memory_mb=limits.max_memory_mb)
-        sandbox_callback = create_sandboxed_callback(watchdog, inner_callback)
-        sandbox_metrics = SandboxMetrics()
+        for faculty in context.faculty:
+            f_i = context.faculty_idx[faculty.id]
+            weekly_min = getattr(faculty, "min_clinic_halfdays_per_week", 0) or 0
+            weekly_max = getattr(faculty, "max_clinic_halfdays_per_week", 4) or 4
 
-        watchdog.start()
-        try:
-            status = solver.Solve(model, sandbox_callback)
-        finally:
-            watchdog.stop()
-            watchdog.join(timeout=2.0)
-            sandbox_metrics.peak_memory_mb = watchdog.peak_mb
-            sandbox_metrics.wall_time_seconds = time.time() - start_time
+            for week_start, week_blocks in blocks_by_week.items():
+                clinic_vars = [
+                    fac_clinic[f_i, context.block_idx[b.id]]
+                    for b in week_blocks
+                    if (f_i, context.block_idx[b.id]) in fac_clinic
+                ]
+                if clinic_vars:
+                    model.Add(sum(clinic_vars) <= weekly_max)
+                    # MIN is soft to avoid infeasibility with supervision demand
+                    if weekly_min > 0:
+                        shortfall = model.NewIntVar(
+                            0,
+                            weekly_min,
+                            f"clinic_shortfall_{f_i}_{week_start}",
+                        )
+                        model.Add(shortfall >= weekly_min - sum(clinic_vars))
+                        obj_terms: Any = variables.setdefault("objective_terms", [])
+                        obj_terms.append((shortfall, CLINIC_MIN_PENALTY))
 
-        if sandbox_callback.memory_aborted:
-            sandbox_metrics.aborted = True
-            sandbox_metrics.abort_reason = (
-                f"memory exceeded {limits.max_memory_mb}MB "
-                f"(peak: {watchdog.peak_mb:.0f}MB)"
-            )
-            logger.warning(f"Solver aborted by sandbox: {sandbox_metrics.abort_reason}")
-        else:
-            logger.info(
-                f"Solver sandbox metrics: peak_memory={sandbox_metrics.peak_memory_mb:.0f}MB, "
-                f"wall_time={sandbox_metrics.wall_time_seconds:.1f}s, "
-                f"solutions={sandbox_callback.solution_count}"
-            )
+        # Constraint: PCAT/DO linked to overnight call
+        # If call[f, date] = 1, then pcat[f, date+1, AM] = 1 and do[f, date+1, PM] = 1
+        allowed_pcat: set[tuple[int, int]] = set()
+        allowed_do: set[tuple[int, int]] = set()
+        if call_eligible and call:
+            # Build date->block mapping
+            date_am_block = {}
+            date_pm_block = {}
+            for block in context.blocks:
+                if block.time_of_day == "AM":
+                    date_am_block[block.date] = block
+                else:
+                    date_pm_block[block.date] = block
 
-        runtime = time.time() - start_time
+            # Pre-build reverse lookups for O(1) access (avoids O(N*B) inner loops)
+            block_by_idx = {context.block_idx[b.id]: b for b in context.blocks}
+            faculty_id_by_call_idx = {
+                call_idx[fac.id]: fac.id for fac in call_eligible if fac.id in call_idx
+            }
 
-        # Store final status in Redis if callback was used
-        if self.task_id and self.redis_client:
-            try:
-                status_name = solver.StatusName(status)
-                final_data = {
-                    "solutions_found": sandbox_callback.solution_count
-                    if sandbox_callback
-                    else 0,
-                    "current_objective": (
-                        solver.ObjectiveValue()
-                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
-                        else 0
-                    ),
-                    "best_bound": (
-                        solver.BestObjectiveBound()
-                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
-                        else 0
-                    ),
-                    "optimality_gap_pct": 0.0 if status == cp_model.OPTIMAL else None,
-                    "progress_pct": 100.0 if status == cp_model.OPTIMAL else 99.0,
-                    "elapsed_seconds": round(runtime, 2),
-                    "status": (
-                        "completed"
-                        if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]
-                        else "failed"
-                    ),
-                    "solver_status": status_name,
-                    "timestamp": time.time(),
-                }
-                self.redis_client.setex(
-                    f"solver_progress:{self.task_id}",
-                    SOLVER_PROGRESS_TTL_SECONDS,
-                    json.dumps(final_data),
-                )
-            except Exception as e:
-                logger.error(f"Failed to store final status in Redis: {e}")
+            for (f_i_call, b_i_call, call_type), call_var in call.items():
+                call_block = block_by_idx.get(b_i_call)
+                if not call_block:
+                    continue
 
-        # Check solution status
-        status_name = solver.StatusName(status)
-        if status not in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-            logger.warning(f"CP-SAT solver status: {status_name}")
+                next_day = call_block.date + timedelta(days=1)
 
-            # Enhanced debugging for INFEASIBLE
-            logger.error("=" * 60)
-            logger.error("INFEASIBLE SOLVER DEBUGGING")
-            logger.error("=" * 60)
+                faculty_id = faculty_id_by_call_idx.get(f_i_call)
+                if not faculty_id or faculty_id not in context.faculty_idx:
+                    continue
 
-            # Log model statistics
-            proto = model.Proto()
-            logger.error(
-                f"Model stats: {len(proto.variables)} vars, {len(proto.constraints)} constraints"
-            )
+                f_i = context.faculty_idx[faculty_id]
 
-            # Log resident/faculty counts
-            logger.error(f"Residents: {len(context.residents)}")
-            logger.error(f"Faculty: {len(context.faculty)}")
-            logger.error(f"Templates: {len(context.templates)}")
-            logger.error(f"Workday blocks: {len(workday_blocks)}")
+                # Link PCAT to next day AM (bidirectional)
+                if next_day in date_am_block:
+                    next_am = date_am_block[next_day]
+                    next_am_b_i = context.block_idx[next_am.id]
+                    if (f_i, next_am_b_i) in fac_pcat:
+                        allowed_pcat.add((f_i, next_am_b_i))
+                        # call <=> pcat (bidirectional: PCAT iff call)
+                        model.Add(fac_pcat[f_i, next_am_b_i] == call_var)
+
+                # Link DO to next day PM (bidirectional)
+                if next_day in date_pm_block:
+                    next_pm = date_pm_block[next_day]
+                    next_pm_b_i = context.block_idx[next_pm.id]
+                    if (f_i, next_pm_b_i) in fac_do:
+                        allowed_do.add((f_i, next_pm_b_i))
+                        # call <=> do (bidirectional: DO iff call)
+                        model.Add(fac_do[f_i, next_pm_b_i] == call_var)
+
+        # If no call mapping exists for a slot, PCAT/DO must be 0
+        for (f_i, b_i), var in fac_pcat.items():
+            if (f_i, b_i) not in allowed_pcat:
+                model.Add(var == 0)
+        for (f_i, b_i), var in fac_do.items():
+            if (f_i, b_i) not in allowed_do:
+                model.Add(var == 0)
+
+        # Constraint: Supervision ratio (ACGME)
+        # For each slot with residents in clinic, need enough faculty supervisors
+        # PGY-1: 1 faculty per 2 residents (ratio 0.5)
+        # PGY-2/3: 1 faculty per 4 residents (ratio 0.25)
+        # Find clinic template(s)
+        clinic_template_ids = set()
+        for template in context.templates:
+            name_lower = template.name.lower()
+            if (
+                "clinic" in name_lower
+                or "fm" in name_lower
+                or "outpatient" in name_lower
+            ):
+                clinic_template_ids.add(template.id)
+
+        if clinic_template_ids:
+            clinic_template_indices = [
+                template_idx[tid] for tid in clinic_template_ids if tid in template_idx
+            ]
 
-            # Log locked assignment counts
-            locked_resident_count = sum(
-                1 for a in existing_assignments if a.person_id in context.resident_idx
-            )
-            locked_faculty_count = sum(
-                1 for a in existing_assignments if a.person_id in context.faculty_idx
-            )
-            logger.error(f"Locked resident assignments: {locked_resident_count}")
-            logger.error(f"Locked faculty assignments: {locked_faculty_count}")
+            for block in workday_blocks:
+                b_i = context.block_idx[block.id]
 
-            # Log template usage
-            template_usage = {}
-            for a in existing_assignments:
-                if a.rotation_template_id:
-                    template_usage[a.rotation_template_id] = (
-                        template_usage.get(a.rotation_template_id, 0) + 1
-                    )
-            logger.error(
-                f"Template usage in locked assignments: {len(template_usage)} unique templates"
-            )
-            for tid, count in sorted(template_usage.items(), key=lambda x: -x[1])[:10]:
-                tname = next(
-                    (t.name for t in context.templates if t.id == tid), str(tid)
-                )
-                logger.error(f"  {tname}: {count}")
+                # Count PGY-1 residents in clinic
+                pgy1_in_clinic = []
+                pgy23_in_clinic = []
+                for resident in context.residents:
+                    r_i = context.resident_idx[resident.id]
+                    pgy = getattr(resident, "pgy_level", 2)
+                    for t_i in clinic_template_indices:
+                        if (r_i, b_i, t_i) in x:
+                            if pgy == 1:
+                                pgy1_in_clinic.append(x[r_i, b_i, t_i])
+                            else:
+                                pgy23_in_clinic.append(x[r_i, b_i, t_i])
 
-            # Log x variable counts by type
-            resident_vars = sum(1 for k in x if k[0] < len(context.residents))
-            logger.error(f"Resident decision vars (x): {resident_vars}")
-            logger.error(f"Faculty decision vars (f): {len(f)}")
+                if not pgy1_in_clinic and not pgy23_in_clinic:
+                    continue
 
-            # Check for over-constrained blocks
-            block_constraint_counts = {}
-            for r_i, b_i, t_i in x:
-                block_constraint_counts[b_i] = block_constraint_counts.get(b_i, 0) + 1
-            if block_constraint_counts:
-                max_block = max(block_constraint_counts.values())
-                min_block = min(block_constraint_counts.values())
-                logger.error(f"Vars per block: min={min_block}, max={max_block}")
+                # Calculate supervision load (multiply by 4 to avoid fractions)
+                # PGY-1: 2 per faculty (load = 2), PGY-2/3: 4 per faculty (load = 1)
+                # supervision_load = pgy1 * 2 + pgy23 * 1
+                # supervision_needed * 4 >= supervision_load
+                pgy1_sum = sum(pgy1_in_clinic) if pgy1_in_clinic else 0
+                pgy23_sum = sum(pgy23_in_clinic) if pgy23_in_clinic else 0
+                supervision_load = pgy1_sum * 2 + pgy23_sum
 
-            # Log supervision constraint info
-            logger.error(f"Clinic template IDs found: {len(clinic_template_ids)}")
-            logger.error(f"Faculty supervise vars: {len(fac_supervise)}")
+                # Faculty supervising in this block
+                faculty_supervising = [
+                    fac_supervise[context.faculty_idx[fac.id], b_i]
+                    for fac in context.faculty
+                    if (context.faculty_idx[fac.id], b_i) in fac_supervise
+                ]
 
-            logger.error("=" * 60)
+                if faculty_supervising:
+                    # supervision_needed >= ceil(supervision_load / 4)
+                    # Linearized: 4 * sum(supervisors) >= supervision_load
+                    model.Add(4 * sum(faculty_supervising) >= supervision_load)
 
-            return SolverResult(
-                success=False,
-                assignments=[],
-                status="infeasible",
-                solver_status=status_name,
-                runtime_seconds=runtime,
-            )
+        logger.info(
+            "Added faculty activity constraints (clinic limits, PCAT/DO, supervision)"
+        )
 
         # ==================================================
-        # EXTRACT SOLUTION - Residents
+        # APPLY CONSTRAINTS FROM MANAGER
+        # Constraints reading run inputs are applied per run by ``solve``
         # ==================================================
-        assignments = []
-        for resident in context.residents:
-            r_i = context.resident_idx[resident.id]
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
-                for template in context.templates:
-                    t_i = template_idx[template.id]
-                    if (r_i, b_i, t_i) in x and solver.Value(x[r_i, b_i, t_i]) == 1:
-                        assignments.append(
-                            (
-                                resident.id,
-                                block.id,
-                                template.id,
-                            )
-                        )
+        template_constraints, _ = split_constraints(self.constraint_manager)
+        self.constraint_manager.apply_to_cpsat(
+            model, variables, context, template_constraints
+        )
 
         # ==================================================
-        # EXTRACT SOLUTION - Faculty
+        # OBJECTIVE FUNCTION
+        # Maximize: coverage * 1000 - equity_penalty - template_balance_penalty
+        #
+        # Template balance ensures assignments are distributed across rotation
+        # types, not concentrated in a single rotation (e.g., all Night Float).
         # ==================================================
-        faculty_assignment_count = 0
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in workday_blocks:
-                b_i = context.block_idx[block.id]
-                for template in context.templates:
-                    t_i = template_idx[template.id]
-                    if (f_i, b_i, t_i) in f and solver.Value(f[f_i, b_i, t_i]) == 1:
-                        assignments.append(
-                            (
-                                faculty.id,
-                                block.id,
-                                template.id,
-                            )
-                        )
-                        faculty_assignment_count += 1
+        coverage = sum(x.values())
 
-        # ==================================================
-        # EXTRACT SOLUTION - Overnight Call Assignments
-        # ==================================================
-        call_assignments_result = []
-        if call_eligible and call:
-            block_id_by_idx = {context.block_idx[b.id]: b.id for b in context.blocks}
-            for (f_i, b_i, call_type), var in call.items():
-                if solver.Value(var) == 1:
-                    # Find the faculty and block for this variable
-                    faculty_id = None
-                    block_id = block_id_by_idx.get(b_i)
-                    for fac in call_eligible:
-                        if call_idx.get(fac.id) == f_i:
-                            faculty_id = fac.id
-                            break
-                    if faculty_id and block_id:
-                        call_assignments_result.append(
-                            (faculty_id, block_id, call_type)
-                        )
+        # Calculate template assignment counts for balance penalty
+        template_counts = {}
+        for t_i, template in enumerate(context.templates):
+            template_vars = [
+                x[r_i, b_i, t_i]
+                for r_i in range(len(context.residents))
+                for b_i in range(len(workday_blocks))
+                if (r_i, b_i, t_i) in x
+            ]
+            if template_vars:
+                template_counts[t_i] = sum(template_vars)
 
-            logger.info(
-                f"CP-SAT found {len(call_assignments_result)} overnight call assignments"
+        # Template balance penalty: penalize max template count to encourage distribution
+        # This prevents all assignments going to one rotation type
+        template_balance_penalty = None
+        if len(template_counts) > 1:
+            max_template_count = model.NewIntVar(
+                0, len(context.residents) * len(workday_blocks), "max_template_count"
             )
+            for t_i, count_expr in template_counts.items():
+                model.Add(max_template_count >= count_expr)
+            template_balance_penalty = max_template_count
 
-        # ==================================================
-        # EXTRACT SOLUTION - Faculty Half-Day Assignments
-        # For each faculty, for each block, determine activity:
-        # clinic, supervise, pcat, do, or off (default)
-        # ==================================================
-        faculty_half_day_result = []
-        for faculty in context.faculty:
-            f_i = context.faculty_idx[faculty.id]
-            for block in context.blocks:  # All blocks (56 per 4-week period)
-                b_i = context.block_idx[block.id]
-
-                # Determine activity for this slot
-                activity = "OFF"  # Default
+        # Build objective with all penalties
+        equity_penalty_cpsat: Any = variables.get("equity_penalty")
+        objective_terms_cpsat: Any = variables.get("objective_terms", [])
 
-                if (f_i, b_i) in fac_clinic and solver.Value(fac_clinic[f_i, b_i]) == 1:
-                    activity = "C"  # Clinic
-                elif (f_i, b_i) in fac_supervise and solver.Value(
-                    fac_supervise[f_i, b_i]
-                ) == 1:
-                    activity = "AT"  # Attending/Supervision
-                elif (f_i, b_i) in fac_pcat and solver.Value(fac_pcat[f_i, b_i]) == 1:
-                    activity = "PCAT"  # Post-Call Attending Time
-                elif (f_i, b_i) in fac_do and solver.Value(fac_do[f_i, b_i]) == 1:
-                    activity = "DO"  # Day Off (post-call)
+        objective_expr = coverage * COVERAGE_WEIGHT
+        if equity_penalty_cpsat is not None:
+            objective_expr -= equity_penalty_cpsat * EQUITY_PENALTY_WEIGHT
+        if template_balance_penalty is not None:
+            objective_expr -= template_balance_penalty * TEMPLATE_BALANCE_WEIGHT
+        if objective_terms_cpsat:
+            for term_var, weight in objective_terms_cpsat:
+                objective_expr -= term_var * int(weight)
 
-                faculty_half_day_result.append((faculty.id, block.id, activity))
+        # Discourage unneeded faculty supervision (phantom AT)
+        # Without this, the solver may arbitrarily assign AT to fill empty slots
+        # even when there are no residents in clinic (e.g. final Wednesday PM LEC).
+        if fac_supervise:
+            objective_expr -= sum(fac_supervise.values())
 
-        # Count by activity type for logging
-        activity_counts = {}
-        for _, _, act in faculty_half_day_result:
-            activity_counts[act] = activity_counts.get(act, 0) + 1
+        model.Maximize(objective_expr)
 
-        logger.info(
-            f"CP-SAT generated {len(faculty_half_day_result)} faculty half-day assignments "
-            f"({len(context.faculty)} faculty × {len(context.blocks)} blocks): "
-            f"C={activity_counts.get('C', 0)}, AT={activity_counts.get('AT', 0)}, "
-            f"PCAT={activity_counts.get('PCAT', 0)}, DO={activity_counts.get('DO', 0)}, "
-            f"OFF={activity_counts.get('OFF', 0)}"
+        return CompiledCPSATModel(
+            model=model,
+            x=x,
+            f=f,
+            call=call,
+            fac_clinic=fac_clinic,
+            fac_supervise=fac_supervise,
+            fac_pcat=fac_pcat,
+            fac_do=fac_do,
+            template_idx=template_idx,
+            clinic_template_ids=clinic_template_ids,
+            x_2d=x_2d,
+            f_2d=f_2d,
+            variables=variables,
+            objective=objective_expr,
+            build_seconds=time.perf_counter() - build_start,
         )
 
-        logger.info(
-            f"CP-SAT found {len(assignments)} assignments "
-            f"({len(assignments) - faculty_assignment_count} residents, "
-            f"{faculty_assignment_count} faculty) in {runtime:.2f}s (status: {status_name})"
+    def _apply_run_layer(
+        self,
+        compiled: CompiledCPSATModel,
+        context: SchedulingContext,
+        run_constraints: list,
+        in_place: bool = False,
+    ) -> CompiledCPSATModel:
+        """
+        Apply the constraints that read run inputs on top of a template.
+
+        Args:
+            compiled: Template from ``_compile_model``
+            context: SchedulingContext with this run's inputs
+            run_constraints: Run-layer constraints from ``split_constraints``
+            in_place: Apply to ``compiled.model`` itself (the template is not
+                retained) instead of a clone
+
+        Returns:
+            CompiledCPSATModel sharing the template's variable handles, with
+            the run-layer constraints and objective terms added
+        """
+        layer_start = time.perf_counter()
+        model = compiled.model if in_place else compiled.instantiate()
+
+        variables = dict(compiled.variables)
+        base_terms = list(variables.get("objective_terms", []))
+        variables["objective_terms"] = list(base_terms)
+        self.constraint_manager.apply_to_cpsat(
+            model, variables, context, run_constraints
         )
 
-        return SolverResult(
-            success=True,
-            assignments=assignments,
-            status="optimal" if status == cp_model.OPTIMAL else "feasible",
-            objective_value=solver.ObjectiveValue(),
-            runtime_seconds=runtime,
-            solver_status=status_name,
-            statistics={
-                "total_blocks": len(workday_blocks),
-                "total_residents": len(context.residents),
-                "total_faculty": len(context.faculty),
-                "total_templates": len(context.templates),
-                "resident_assignments": len(assignments) - faculty_assignment_count,
-                "faculty_assignments": faculty_assignment_count,
-                "call_assignments": len(call_assignments_result),
-                "faculty_half_day_assignments": len(faculty_half_day_result),
-                "faculty_activity_breakdown": activity_counts,
-                "coverage_rate": (
-                    len(assignments) / len(workday_blocks) if workday_blocks else 0
-                ),
-                "branches": solver.NumBranches(),
-                "conflicts": solver.NumConflicts(),
-            },
-            call_assignments=call_assignments_result,
-            faculty_half_day_assignments=faculty_half_day_result,
+        objective = compiled.objective
+        for term_var, weight in variables["objective_terms"][len(base_terms) :]:
+            objective -= term_var * int(weight)
+        model.Maximize(objective)
+
+        return dataclasses.replace(
+            compiled,
+            model=model,
+            variables=variables,
+            objective=objective,
+            build_seconds=compiled.build_seconds
+            + time.perf_counter()
+            - layer_start,
         )
 
     @staticmethod
@@ -88,6 +88,7 @@ class AuditLogResponse(BaseModel):
     page: int
     page_size: int = Field(alias="pageSize")
     total_pages: int = Field(alias="totalPages")
+    next_cursor: str | None = Field(default=None, alias="nextCursor")
 
     model_config = ConfigDict(populate_by_name=True)
 
@@ -125,6 +125,18 @@ class CircuitBreakerState(BaseModel):
     )
 
 
+class ProviderQueueStats(BaseModel):
+    """Concurrency and queueing statistics for one provider."""
+
+    max_concurrent: int = Field(..., description="Concurrent request limit")
+    in_flight: int = Field(0, description="Requests currently running")
+    waiting: int = Field(0, description="Requests currently queued")
+    peak_waiting: int = Field(0, description="Largest queue length observed")
+    queued_total: int = Field(0, description="Requests that had to queue")
+    timeouts: int = Field(0, description="Requests that timed out while queued")
+    avg_wait_ms: float = Field(0.0, description="Average queue wait in milliseconds")
+
+
 class LLMRouterStats(BaseModel):
     """Statistics for LLM Router usage."""
 
@@ -139,6 +151,16 @@ class LLMRouterStats(BaseModel):
     total_tokens_used: int = Field(0, description="Total tokens used across providers")
     avg_latency_ms: float = Field(0.0, description="Average latency in milliseconds")
     error_count: int = Field(0, description="Total errors encountered")
+    cache_hits: int = Field(0, description="Requests answered from the cache")
+    cache_misses: int = Field(0, description="Cacheable requests not in the cache")
+    cache_evictions: int = Field(0, description="Entries evicted for size")
+    cache_size: int = Field(0, description="Entries currently cached")
+    deduplicated_requests: int = Field(
+        0, description="Requests that joined an identical in-flight request"
+    )
+    queues: dict[str, ProviderQueueStats] = Field(
+        default_factory=dict, description="Concurrency statistics per provider"
+    )
     uptime_start: datetime = Field(
         default_factory=lambda: datetime.now(UTC),
         description="Statistics collection start time",
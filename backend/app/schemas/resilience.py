@@ -16,7 +16,7 @@ from datetime import date, datetime
 from enum import Enum
 from uuid import UUID
 
-from pydantic import ConfigDict, BaseModel, Field
+from pydantic import ConfigDict, BaseModel, Field, model_validator
 
 
 class UtilizationLevel(str, Enum):
@@ -108,10 +108,33 @@ class CrisisDeactivationRequest(BaseModel):
 
 
 class FallbackActivationRequest(BaseModel):
-    """Request to activate a fallback schedule."""
+    """Request to activate a fallback schedule.
+
+    For faculty-loss scenarios, ``faculty_ids`` with the absence dates
+    applies the pre-solved repair for exactly those faculty.
+    """
 
     scenario: FallbackScenario
     reason: str = Field(..., min_length=10, max_length=500)
+    faculty_ids: list[UUID] | None = Field(None, min_length=1)
+    start_date: date | None = None
+    end_date: date | None = None
+
+    @model_validator(mode="after")
+    def validate_absence(self) -> "FallbackActivationRequest":
+        """Faculty-specific activation needs a faculty-loss scenario and dates."""
+        if self.faculty_ids is None:
+            return self
+        if self.scenario not in (
+            FallbackScenario.SINGLE_FACULTY_LOSS,
+            FallbackScenario.DOUBLE_FACULTY_LOSS,
+        ):
+            raise ValueError("faculty_ids only apply to faculty-loss scenarios")
+        if self.start_date is None or self.end_date is None:
+            raise ValueError("faculty_ids require start_date and end_date")
+        if self.end_date < self.start_date:
+            raise ValueError("end_date must not be before start_date")
+        return self
 
 
 class FallbackDeactivationRequest(BaseModel):
@@ -7,6 +7,7 @@ from __future__ import annotations
 
 import logging
 import time
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import HTTPException, status
@@ -24,7 +25,9 @@ from app.scheduling.annual.pgy_config import (
     FIXED_ASSIGNMENTS,
     PGY_ROTATIONS,
 )
-from app.scheduling.annual.solver import SolverResult, solve
+
+if TYPE_CHECKING:
+    from app.scheduling.annual.solver import SolverResult
 
 logger = logging.getLogger(__name__)
 
@@ -153,7 +156,9 @@ async def optimize_plan(
     # No leave requests for now — can be added later via leave import
     context.build_indices()
 
-    # Run solver
+    # Run solver (OR-Tools is imported on first optimize, not at startup)
+    from app.scheduling.annual.solver import solve
+
     time_limit = solver_time_limit_override or plan.solver_time_limit or 30.0
     start_ms = time.monotonic()
     solver_result = solve(context, timeout_seconds=time_limit)
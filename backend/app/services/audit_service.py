@@ -16,27 +16,56 @@ Usage:
         entity_types=["assignment", "absence"],
         start_date="2025-01-01",
     )
+
+    # Keyset pagination: pass the previous page's cursor
+    page = query_audit_logs(db, page_size=25)
+    page = query_audit_logs(db, page_size=25, after=page.next_cursor)
 """
 
 from __future__ import annotations
 
+import base64
+import binascii
+import heapq
+import json
+import re
+from collections import defaultdict
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
 from datetime import datetime, UTC
+from functools import cache
+from itertools import islice
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import text
-from sqlalchemy.orm import Session
-from sqlalchemy.sql import quoted_name
-from sqlalchemy_continuum import version_class
+from sqlalchemy import (
+    ColumnElement,
+    FromClause,
+    Select,
+    String,
+    Table,
+    and_,
+    case,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+)
+from sqlalchemy.orm import Session, configure_mappers
+from sqlalchemy_continuum import version_class, versioning_manager
 
 from app.core.logging import get_logger
 from app.core.types import AuditStatistics
 from app.models.absence import Absence
 from app.models.assignment import Assignment
+from app.models.person import Person
 from app.models.schedule_run import ScheduleRun
 from app.models.swap import SwapRecord
 from app.models.user import User
-from app.schemas.audit import AuditLogEntry, AuditUser, FieldChange
+from app.schemas.audit import AuditLogEntry as AuditLogEntrySchema
+from app.schemas.audit import AuditUser, FieldChange
 
 logger = get_logger(__name__)
 
@@ -49,35 +78,684 @@ ENTITY_MODEL_MAP = {
     "swap_record": SwapRecord,
 }
 
-# Map entity types to version table names
-VERSION_TABLE_MAP = {
-    "assignment": "assignment_version",
-    "absence": "absence_version",
-    "schedule_run": "schedule_run_version",
-    "swap_record": "swap_record_version",
-}
+# Continuum operation types
+_OPERATIONS = {0: "create", 1: "update", 2: "delete"}
+
+# Version columns that are bookkeeping rather than entity fields
+_VERSION_META_COLUMNS = {"transaction_id", "operation_type", "end_transaction_id"}
+
+# Version rows fetched per keyset query and entries built per batch
+AUDIT_BATCH_SIZE = 500
+
+
+@dataclass(frozen=True)
+class AuditCursor:
+    """
+    Keyset position in the newest-first audit stream.
+
+    Entries are ordered by (issued_at, transaction_id, entity_type, entity_id)
+    descending; a cursor points at the last entry of a page, and the next
+    page starts strictly after it.
+    """
+
+    issued_at: datetime
+    transaction_id: int
+    entity_type: str
+    entity_id: UUID
+
+    def encode(self) -> str:
+        """Opaque URL-safe token for API clients."""
+        payload = json.dumps(
+            [
+                self.issued_at.isoformat(),
+                self.transaction_id,
+                self.entity_type,
+                str(self.entity_id),
+            ]
+        )
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    @classmethod
+    def decode(cls, token: str) -> AuditCursor:
+        """
+        Parse a token produced by ``encode``.
+
+        Raises:
+            ValueError: If the token is malformed
+        """
+        try:
+            padded = token + "=" * (-len(token) % 4)
+            issued_at, transaction_id, entity_type, entity_id = json.loads(
+                base64.urlsafe_b64decode(padded.encode())
+            )
+            cursor = cls(
+                issued_at=datetime.fromisoformat(issued_at),
+                transaction_id=int(transaction_id),
+                entity_type=str(entity_type),
+                entity_id=UUID(entity_id),
+            )
+        except (TypeError, ValueError, binascii.Error) as e:
+            raise ValueError(f"Invalid audit cursor: {token}") from e
+        if cursor.entity_type not in ENTITY_MODEL_MAP:
+            raise ValueError(f"Invalid audit cursor: {token}")
+        return cursor
+
+
+@dataclass
+class AuditLogPage:
+    """One page of audit entries."""
+
+    entries: list[AuditLogEntrySchema]
+    total: int | None
+    next_cursor: AuditCursor | None
+
+
+@dataclass(frozen=True)
+class _AuditFilters:
+    """Audit filters, parsed once and pushed into every version-table query."""
+
+    start: datetime | None = None
+    end: datetime | None = None
+    entity_types: tuple[str, ...] = tuple(ENTITY_MODEL_MAP)
+    actions: tuple[str, ...] = ()
+    user_ids: tuple[str, ...] = ()
+    severity: tuple[str, ...] = ()
+    search: str | None = None
+    entity_id: UUID | None = None
+    acgme_overrides_only: bool = False
+
+    @classmethod
+    def parse(
+        cls,
+        start_date: str | None = None,
+        end_date: str | None = None,
+        entity_types: list[str] | None = None,
+        actions: list[str] | None = None,
+        user_ids: list[str] | None = None,
+        severity: list[str] | None = None,
+        search: str | None = None,
+        entity_id: str | None = None,
+        acgme_overrides_only: bool = False,
+    ) -> _AuditFilters:
+        """
+        Build filters from API parameters.
+
+        Raises:
+            ValueError: If a date or entity ID is malformed
+        """
+        return cls(
+            start=_parse_datetime(start_date) if start_date else None,
+            end=_parse_datetime(end_date) if end_date else None,
+            entity_types=tuple(
+                t for t in (entity_types or ENTITY_MODEL_MAP) if t in ENTITY_MODEL_MAP
+            ),
+            actions=tuple(actions or ()),
+            user_ids=tuple(user_ids or ()),
+            severity=tuple(severity or ()),
+            search=search.lower() if search else None,
+            entity_id=UUID(entity_id) if entity_id else None,
+            acgme_overrides_only=acgme_overrides_only,
+        )
+
+
+@dataclass(frozen=True)
+class _AuditKey:
+    """Transaction-level data of one version row; enough to order and page."""
+
+    issued_at: datetime
+    transaction_id: int
+    entity_type: str
+    entity_id: UUID
+    operation_type: int
+    user_id: str | None
+    remote_addr: str | None
+
+    @property
+    def sort_key(self) -> tuple[datetime, int, str, UUID]:
+        return (self.issued_at, self.transaction_id, self.entity_type, self.entity_id)
+
+    @property
+    def cursor(self) -> AuditCursor:
+        return AuditCursor(
+            self.issued_at, self.transaction_id, self.entity_type, self.entity_id
+        )
+
+
+@dataclass
+class _EntitySource:
+    """Current entity rows joined to a version table, for names and search."""
+
+    version: Table
+    source: FromClause
+    columns: list[ColumnElement]
+    search_text: ColumnElement
+    override_reason: ColumnElement | None = None
+
+
+def _parse_datetime(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", ""))
+
+
+@cache
+def _entity_source(entity_type: str) -> _EntitySource:
+    """
+    Outer-join the current entity to its version table.
+
+    The label columns are what entry names are built from, and
+    ``search_text`` is the lowercased entry name, so search filters can be
+    evaluated in SQL.
+    """
+    # Continuum builds version classes when mappers are configured
+    configure_mappers()
+    version = version_class(ENTITY_MODEL_MAP[entity_type]).__table__
+
+    if entity_type == "assignment":
+        entity = Assignment.__table__
+        person = Person.__table__.alias("entity_person")
+        return _EntitySource(
+            version=version,
+            source=version.outerjoin(entity, entity.c.id == version.c.id).outerjoin(
+                person, person.c.id == entity.c.person_id
+            ),
+            columns=[
+                person.c.name.label("entity_person_name"),
+                entity.c.override_reason.label("entity_override_reason"),
+            ],
+            search_text=case(
+                (
+                    person.c.id.is_not(None),
+                    literal("assignment - ", String) + func.lower(person.c.name),
+                ),
+                else_="assignment",
+            ),
+            override_reason=entity.c.override_reason,
+        )
+
+    if entity_type == "absence":
+        entity = Absence.__table__
+        person = Person.__table__.alias("entity_person")
+        return _EntitySource(
+            version=version,
+            source=version.outerjoin(entity, entity.c.id == version.c.id).outerjoin(
+                person, person.c.id == entity.c.person_id
+            ),
+            columns=[
+                person.c.name.label("entity_person_name"),
+                entity.c.absence_type.label("entity_absence_type"),
+            ],
+            search_text=case(
+                (
+                    person.c.id.is_not(None),
+                    func.lower(entity.c.absence_type)
+                    + literal(" - ", String)
+                    + func.lower(person.c.name),
+                ),
+                else_="absence",
+            ),
+        )
+
+    if entity_type == "schedule_run":
+        entity = ScheduleRun.__table__
+        return _EntitySource(
+            version=version,
+            source=version.outerjoin(entity, entity.c.id == version.c.id),
+            columns=[
+                entity.c.id.label("entity_id"),
+                entity.c.start_date.label("entity_start_date"),
+                entity.c.end_date.label("entity_end_date"),
+            ],
+            search_text=case(
+                (
+                    entity.c.id.is_not(None),
+                    literal("schedule run - ", String)
+                    + cast(entity.c.start_date, String)
+                    + literal(" to ", String)
+                    + cast(entity.c.end_date, String),
+                ),
+                else_="schedule run",
+            ),
+        )
+
+    entity = SwapRecord.__table__
+    return _EntitySource(
+        version=version,
+        source=version.outerjoin(entity, entity.c.id == version.c.id),
+        columns=[entity.c.id.label("entity_id"), entity.c.status.label("entity_status")],
+        # Names format the status enum member, e.g. "SwapStatus.PENDING"
+        search_text=case(
+            (
+                entity.c.id.is_not(None),
+                literal("swap request - swapstatus.", String)
+                + func.lower(cast(entity.c.status, String)),
+            ),
+            else_="swap request",
+        ),
+    )
+
+
+def _entity_name(entity_type: str, labels: Any) -> str:
+    """Human-readable entity name from ``_EntitySource`` label columns."""
+    if entity_type == "assignment":
+        if labels is not None and labels.entity_person_name is not None:
+            return f"Assignment - {labels.entity_person_name}"
+        return "Assignment"
+    if entity_type == "absence":
+        if labels is not None and labels.entity_person_name is not None:
+            return f"{labels.entity_absence_type.title()} - {labels.entity_person_name}"
+        return "Absence"
+    if entity_type == "schedule_run":
+        if labels is not None and labels.entity_id is not None:
+            return f"Schedule Run - {labels.entity_start_date} to {labels.entity_end_date}"
+        return "Schedule Run"
+    if labels is not None and labels.entity_id is not None:
+        return f"Swap Request - {labels.entity_status}"
+    return "Swap Request"
+
+
+def _allowed_operations(entity_type: str, filters: _AuditFilters) -> set[int]:
+    """Operation types that can pass the action and severity filters."""
+    operations = set(_OPERATIONS)
+    if filters.actions:
+        operations = {op for op in operations if _OPERATIONS[op] in filters.actions}
+    if filters.severity:
+        operations = {
+            op
+            for op in operations
+            if _determine_severity(entity_type, _OPERATIONS[op], op)
+            in filters.severity
+        }
+    return operations
+
+
+def _after_cursor(
+    entity_type: str, version: Table, transaction: Table, cursor: AuditCursor
+) -> ColumnElement:
+    """Rows of one version table that sort strictly after ``cursor``."""
+    issued_at, transaction_id = transaction.c.issued_at, version.c.transaction_id
+    earlier = or_(
+        issued_at < cursor.issued_at,
+        and_(issued_at == cursor.issued_at, transaction_id < cursor.transaction_id),
+    )
+    same = and_(
+        issued_at == cursor.issued_at, transaction_id == cursor.transaction_id
+    )
+    if entity_type < cursor.entity_type:
+        return or_(earlier, same)
+    if entity_type > cursor.entity_type:
+        return earlier
+    return or_(earlier, and_(same, version.c.id < cursor.entity_id))
+
+
+def _audit_key_query(
+    entity_type: str,
+    filters: _AuditFilters,
+    after: AuditCursor | None = None,
+) -> Select | None:
+    """
+    Newest-first query over one version table with all filters in SQL.
+
+    Returns:
+        The query, or None if the filters exclude the whole table
+    """
+    if filters.acgme_overrides_only and entity_type != "assignment":
+        return None
+    operations = _allowed_operations(entity_type, filters)
+    if not operations:
+        return None
+
+    source = _entity_source(entity_type)
+    version = source.version
+    transaction = versioning_manager.transaction_cls.__table__
+    needs_labels = filters.search is not None or filters.acgme_overrides_only
+    joined = (source.source if needs_labels else version).join(
+        transaction, version.c.transaction_id == transaction.c.id
+    )
+
+    conditions: list[ColumnElement] = []
+    if operations != set(_OPERATIONS):
+        conditions.append(version.c.operation_type.in_(sorted(operations)))
+    if filters.entity_id:
+        conditions.append(version.c.id == filters.entity_id)
+    if filters.start:
+        conditions.append(transaction.c.issued_at >= filters.start)
+    if filters.end:
+        conditions.append(transaction.c.issued_at <= filters.end)
+    if filters.user_ids:
+        conditions.append(transaction.c.user_id.in_(filters.user_ids))
+    if filters.acgme_overrides_only:
+        conditions.append(
+            and_(
+                source.override_reason.is_not(None), source.override_reason != ""
+            )
+        )
+    if filters.search:
+        pattern = "%" + re.sub(r"([\\%_])", r"\\\1", filters.search) + "%"
+        matching_actions = [
+            op for op, action in _OPERATIONS.items() if filters.search in action
+        ]
+        conditions.append(
+            or_(
+                source.search_text.like(pattern, escape="\\"),
+                version.c.operation_type.in_(matching_actions),
+            )
+        )
+    if after is not None:
+        conditions.append(_after_cursor(entity_type, version, transaction, after))
+
+    return (
+        select(
+            transaction.c.issued_at,
+            version.c.transaction_id,
+            version.c.id,
+            version.c.operation_type,
+            transaction.c.user_id,
+            transaction.c.remote_addr,
+        )
+        .select_from(joined)
+        .where(*conditions)
+        .order_by(
+            transaction.c.issued_at.desc(),
+            version.c.transaction_id.desc(),
+            version.c.id.desc(),
+        )
+    )
 
 
-def _validate_and_quote_table_name(table_name: str) -> str:
+def _stream_version_table(
+    db: Session,
+    entity_type: str,
+    filters: _AuditFilters,
+    after: AuditCursor | None,
+    batch_size: int,
+) -> Iterator[_AuditKey]:
+    """Yield one version table's matching rows newest-first, a keyset batch at a time."""
+    while True:
+        query = _audit_key_query(entity_type, filters, after)
+        if query is None:
+            return
+        rows = db.execute(query.limit(batch_size)).all()
+        for row in rows:
+            key = _AuditKey(
+                issued_at=row.issued_at,
+                transaction_id=row.transaction_id,
+                entity_type=entity_type,
+                entity_id=UUID(str(row.id)),
+                operation_type=row.operation_type,
+                user_id=row.user_id,
+                remote_addr=row.remote_addr,
+            )
+            yield key
+        if len(rows) < batch_size:
+            return
+        after = key.cursor
+
+
+def _stream_audit_keys(
+    db: Session,
+    filters: _AuditFilters,
+    after: AuditCursor | None = None,
+    batch_size: int = AUDIT_BATCH_SIZE,
+) -> Iterator[_AuditKey]:
+    """K-way merge of every version table's stream, newest first."""
+    streams = [
+        _stream_version_table(db, entity_type, filters, after, batch_size)
+        for entity_type in filters.entity_types
+    ]
+    return heapq.merge(*streams, key=lambda key: key.sort_key, reverse=True)
+
+
+def _count_audit_entries(db: Session, filters: _AuditFilters) -> int:
+    """Total matching entries, counted in SQL."""
+    total = 0
+    for entity_type in filters.entity_types:
+        query = _audit_key_query(entity_type, filters)
+        if query is not None:
+            total += db.execute(
+                select(func.count()).select_from(query.order_by(None).subquery())
+            ).scalar_one()
+    return total
+
+
+def _load_versions(
+    db: Session, entity_type: str, keys: list[_AuditKey]
+) -> tuple[dict[tuple[UUID, int], Any], dict[tuple[UUID, int], Any]]:
     """
-    Validate table name against allowlist and return quoted identifier.
+    Load the version rows behind ``keys`` and the versions they replaced.
+
+    Returns:
+        (current, previous): rows with entity labels keyed by (entity ID,
+        transaction ID), and the prior version of each keyed the same way
+    """
+    source = _entity_source(entity_type)
+    version = source.version
+    entity_ids = list({key.entity_id for key in keys})
+    transaction_ids = list({key.transaction_id for key in keys})
+
+    current = {
+        (UUID(str(row.id)), row.transaction_id): row
+        for row in db.execute(
+            select(version, *source.columns)
+            .select_from(source.source)
+            .where(
+                version.c.id.in_(entity_ids),
+                version.c.transaction_id.in_(transaction_ids),
+            )
+        )
+    }
+    # With the validity strategy a version's end_transaction_id is the
+    # transaction that replaced it
+    previous = {
+        (UUID(str(row.id)), row.end_transaction_id): row
+        for row in db.execute(
+            select(version).where(
+                version.c.id.in_(entity_ids),
+                version.c.end_transaction_id.in_(transaction_ids),
+            )
+        )
+    }
+    return current, previous
+
+
+def _get_field_changes(version: Table, current: Any, previous: Any) -> list[FieldChange] | None:
+    """Field changes between two version rows of the same entity."""
+    if current is None or previous is None:
+        return None
+
+    changes = []
+    for column in version.columns:
+        col_name = column.name
+
+        # Skip internal and property-mod tracking columns
+        if col_name in _VERSION_META_COLUMNS or col_name.endswith("_mod"):
+            continue
+
+        old_value = previous._mapping[column]
+        new_value = current._mapping[column]
+
+        if old_value != new_value:
+            # Convert to string for display
+            old_str = str(old_value) if old_value is not None else None
+            new_str = str(new_value) if new_value is not None else None
+
+            changes.append(
+                FieldChange(  # type: ignore[call-arg]
+                    field=col_name,
+                    oldValue=old_str,
+                    newValue=new_str,
+                    displayName=_format_field_name(col_name),
+                )
+            )
+
+    return changes if changes else None
+
+
+def _build_audit_entries(db: Session, keys: list[_AuditKey]) -> list[AuditLogEntrySchema]:
+    """
+    Build entries for a batch of keys with a fixed number of queries.
+
+    Users are resolved in one lookup, and each entity type needs two: the
+    version rows joined to their current entities, and the prior versions.
+    """
+    users = _get_audit_users(db, [key.user_id for key in keys])
+
+    by_type: dict[str, list[_AuditKey]] = defaultdict(list)
+    for key in keys:
+        by_type[key.entity_type].append(key)
+    versions = {
+        entity_type: (_entity_source(entity_type).version, *_load_versions(db, entity_type, group))
+        for entity_type, group in by_type.items()
+    }
+
+    entries = []
+    for key in keys:
+        try:
+            version, current, previous = versions[key.entity_type]
+            row = current.get((key.entity_id, key.transaction_id))
+            entries.append(
+                _build_audit_entry(
+                    key,
+                    user=users.get(key.user_id) or _get_audit_user(db, None),
+                    labels=row,
+                    changes=_get_field_changes(
+                        version, row, previous.get((key.entity_id, key.transaction_id))
+                    ),
+                )
+            )
+        except Exception as e:
+            logger.warning(f"Error building audit entry: {e}")
+            continue
+    return entries
+
+
+def _build_audit_entry(
+    key: _AuditKey,
+    user: AuditUser,
+    labels: Any,
+    changes: list[FieldChange] | None,
+) -> AuditLogEntrySchema:
+    """Build an AuditLogEntrySchema from version data."""
+    # Map operation type to action
+    action = _OPERATIONS.get(key.operation_type, "unknown")
+
+    # Check if this is an ACGME override
+    override_reason = (
+        labels.entity_override_reason
+        if labels is not None and key.entity_type == "assignment"
+        else None
+    )
+
+    return AuditLogEntrySchema(  # type: ignore[call-arg]
+        id=f"{key.entity_type}-{key.transaction_id}",
+        timestamp=key.issued_at.isoformat() + "Z",
+        entityType=key.entity_type,
+        entityId=str(key.entity_id),
+        entityName=_entity_name(key.entity_type, labels),
+        action=action,
+        severity=_determine_severity(key.entity_type, action, key.operation_type),
+        user=user,
+        changes=changes,
+        metadata={
+            "transaction_id": key.transaction_id,
+            "operation_type": key.operation_type,
+        },
+        ipAddress=key.remote_addr,
+        userAgent=None,
+        acgmeOverride=bool(override_reason),
+        acgmeJustification=override_reason or None,
+    )
+
+
+def query_audit_logs(
+    db: Session,
+    page: int = 1,
+    page_size: int = 25,
+    after: AuditCursor | None = None,
+    include_total: bool = True,
+    **filter_params: Any,
+) -> AuditLogPage:
+    """
+    Get one page of audit logs from SQLAlchemy-Continuum version tables.
+
+    Filters, ordering and limits run in SQL per version table, and the
+    per-table streams are merged by timestamp. With ``after`` the page
+    starts right after that cursor (keyset pagination) and ``page`` is
+    ignored; otherwise ``page`` skips earlier pages by reading only their
+    keys. Only the returned page's entries are built.
 
     Args:
-        table_name: The table name to validate and quote
+        db: Database session
+        page: Page number (1-indexed), used when ``after`` is None
+        page_size: Number of results per page
+        after: Cursor of the last entry of the previous page
+        include_total: Count all matching entries (one COUNT per table)
+        **filter_params: Filters accepted by ``get_audit_logs``
 
     Returns:
-        Properly quoted table name for use in SQL
+        AuditLogPage with the entries, total and the next page's cursor
 
     Raises:
-        ValueError: If table name is not in allowlist
+        ValueError: If a filter value is malformed
+    """
+    filters = _AuditFilters.parse(**filter_params)
+    page_size = max(page_size, 0)
+    offset = 0 if after is not None else max(page - 1, 0) * page_size
+
+    keys = list(
+        islice(
+            _stream_audit_keys(
+                db,
+                filters,
+                after=after,
+                batch_size=max(1, min(offset + page_size + 1, AUDIT_BATCH_SIZE)),
+            ),
+            offset,
+            offset + page_size + 1,
+        )
+    )
+    has_more = len(keys) > page_size
+    keys = keys[:page_size]
+
+    return AuditLogPage(
+        entries=_build_audit_entries(db, keys) if keys else [],
+        total=_count_audit_entries(db, filters) if include_total else None,
+        next_cursor=keys[-1].cursor if has_more and keys else None,
+    )
+
+
+def iter_audit_logs(
+    db: Session,
+    batch_size: int = AUDIT_BATCH_SIZE,
+    **filter_params: Any,
+) -> Iterator[AuditLogEntrySchema]:
     """
-    # Validate against allowlist
-    if table_name not in VERSION_TABLE_MAP.values():
-        raise ValueError(f"Invalid table name: {table_name}")
+    Stream every matching audit entry, newest first.
 
-    # Return quoted identifier (PostgreSQL uses double quotes)
-    # This prevents SQL injection even if allowlist is bypassed
-    return f'"{table_name}"'
+    Entries are built a batch at a time, so memory stays bounded by
+    ``batch_size`` however long the history is.
+
+    Args:
+        db: Database session
+        batch_size: Entries fetched and built per round trip
+        **filter_params: Filters accepted by ``get_audit_logs``
+
+    Raises:
+        ValueError: If a filter value is malformed
+    """
+    filters = _AuditFilters.parse(**filter_params)
+    keys = _stream_audit_keys(db, filters, batch_size=batch_size)
+    while batch := list(islice(keys, batch_size)):
+        yield from _build_audit_entries(db, batch)
+
+
+def has_acgme_overrides(db: Session, **filter_params: Any) -> bool:
+    """Whether any entry matching the filters is an ACGME override."""
+    filters = replace(
+        _AuditFilters.parse(**filter_params), acgme_overrides_only=True
+    )
+    query = _audit_key_query("assignment", filters)
+    if query is None or "assignment" not in filters.entity_types:
+        return False
+    return db.execute(query.limit(1)).first() is not None
 
 
 def get_audit_logs(
@@ -93,7 +771,7 @@ def get_audit_logs(
     search: str | None = None,
     entity_id: str | None = None,
     acgme_overrides_only: bool = False,
-) -> tuple[list[AuditLogEntry], int]:
+) -> tuple[list[AuditLogEntrySchema], int]:
     """
     Get audit logs from SQLAlchemy-Continuum version tables.
 
@@ -112,205 +790,79 @@ def get_audit_logs(
         acgme_overrides_only: Only show ACGME overrides
 
     Returns:
-        Tuple of (list of AuditLogEntry, total count)
+        Tuple of (list of AuditLogEntrySchema, total count)
     """
     try:
-        # Determine which tables to query
-        tables_to_query = (
-            entity_types if entity_types else list(VERSION_TABLE_MAP.keys())
-        )
-
-        all_entries = []
-
-        # Query each version table
-        for entity_type in tables_to_query:
-            if entity_type not in VERSION_TABLE_MAP:
-                continue
-
-            try:
-                entries = _query_version_table(
-                    db,
-                    entity_type=entity_type,
-                    start_date=start_date,
-                    end_date=end_date,
-                    entity_id=entity_id,
-                    user_ids=user_ids,
-                )
-                all_entries.extend(entries)
-            except Exception as e:
-                logger.warning(f"Error querying {entity_type} versions: {e}")
-                continue
-
-        # Apply filters
-        filtered_entries = _apply_filters(
-            all_entries,
+        result = query_audit_logs(
+            db,
+            page=page,
+            page_size=page_size,
+            start_date=start_date,
+            end_date=end_date,
+            entity_types=entity_types,
             actions=actions,
+            user_ids=user_ids,
             severity=severity,
             search=search,
+            entity_id=entity_id,
             acgme_overrides_only=acgme_overrides_only,
         )
-
-        # Sort by timestamp descending
-        filtered_entries.sort(key=lambda x: x.timestamp, reverse=True)
-
-        # Apply pagination
-        total = len(filtered_entries)
-        start_idx = (page - 1) * page_size
-        end_idx = start_idx + page_size
-        paginated_entries = filtered_entries[start_idx:end_idx]
-
-        return paginated_entries, total
+        return result.entries, result.total or 0
 
     except Exception as e:
         logger.error(f"Error getting audit logs: {e}")
         return [], 0
 
 
-def _query_version_table(
-    db: Session,
-    entity_type: str,
-    start_date: str | None = None,
-    end_date: str | None = None,
-    entity_id: str | None = None,
-    user_ids: list[str] | None = None,
-) -> list[AuditLogEntry]:
-    """Query a specific version table and convert to AuditLogEntry format."""
-    table_name = VERSION_TABLE_MAP[entity_type]
-    model_class = ENTITY_MODEL_MAP[entity_type]
-
-    # Validate and quote table name to prevent SQL injection
-    quoted_table = _validate_and_quote_table_name(table_name)
-
-    # Build query
-    where_clauses = ["1=1"]
-    params: dict[str, Any] = {}
-
-    if entity_id:
-        where_clauses.append("v.id = :entity_id")
-        params["entity_id"] = entity_id
-
-    if start_date:
-        where_clauses.append("t.issued_at >= :start_date")
-        params["start_date"] = datetime.fromisoformat(start_date.replace("Z", ""))
-
-    if end_date:
-        where_clauses.append("t.issued_at <= :end_date")
-        params["end_date"] = datetime.fromisoformat(end_date.replace("Z", ""))
-
-    if user_ids:
-        placeholders = ",".join([f":user_{i}" for i in range(len(user_ids))])
-        where_clauses.append(f"t.user_id IN ({placeholders})")
-        for i, user_id in enumerate(user_ids):
-            params[f"user_{i}"] = user_id
-
-    where_sql = " AND ".join(where_clauses)
-
-    # Table name validated and quoted.
-    query = text(
-        f"SELECT\n"  # nosec B608
-        "    v.id,\n"
-        "    v.transaction_id,\n"
-        "    v.operation_type,\n"
-        "    t.issued_at,\n"
-        "    t.user_id,\n"
-        "    t.remote_addr\n"
-        f"FROM {quoted_table} v\n"
-        "LEFT JOIN transaction t ON v.transaction_id = t.id\n"
-        f"WHERE {where_sql}\n"
-        "ORDER BY t.issued_at DESC\n"
-        "LIMIT 1000\n"
-    )
+def _get_audit_users(db: Session, user_ids: list[str | None]) -> dict[str, AuditUser]:
+    """Resolve audit users for many transaction user IDs in one query."""
+    wanted = {user_id for user_id in user_ids if user_id}
+    if not wanted:
+        return {}
 
-    rows = db.execute(query, params).fetchall()
-
-    entries = []
-    for row in rows:
+    uuids: dict[UUID, str] = {}
+    usernames = set()
+    for user_id in wanted:
         try:
-            entry = _build_audit_entry(
-                db,
-                entity_type=entity_type,
-                entity_id=str(row[0]),
-                transaction_id=row[1],
-                operation_type=row[2],
-                issued_at=row[3],
-                user_id=row[4],
-                remote_addr=row[5],
-            )
-            if entry:
-                entries.append(entry)
-        except Exception as e:
-            logger.warning(f"Error building audit entry: {e}")
-            continue
-
-    return entries
-
+            uuids[UUID(user_id)] = user_id
+        except (ValueError, AttributeError):
+            usernames.add(user_id)
 
-def _build_audit_entry(
-    db: Session,
-    entity_type: str,
-    entity_id: str,
-    transaction_id: int,
-    operation_type: int,
-    issued_at: datetime | None,
-    user_id: str | None,
-    remote_addr: str | None,
-) -> AuditLogEntry | None:
-    """Build an AuditLogEntry from version data."""
+    found: dict[str, AuditUser] = {}
     try:
-        # Map operation type to action
-        operation_map = {0: "create", 1: "update", 2: "delete"}
-        action = operation_map.get(operation_type, "unknown")
-
-        # Determine severity based on action and entity type
-        severity = _determine_severity(entity_type, action, operation_type)
-
-        # Get user info
-        audit_user = _get_audit_user(db, user_id)
-
-        # Get entity name
-        entity_name = _get_entity_name(db, entity_type, entity_id)
-
-        # Get field changes
-        changes = _get_field_changes(db, entity_type, entity_id, transaction_id)
-
-        # Check if this is an ACGME override
-        acgme_override = False
-        acgme_justification = None
-        if entity_type == "assignment":
-            acgme_override, acgme_justification = _check_acgme_override(
-                db, entity_id, transaction_id
+        conditions = []
+        if uuids:
+            conditions.append(User.id.in_(list(uuids)))
+        if usernames:
+            conditions.append(User.username.in_(usernames))
+        for user in db.execute(select(User).where(or_(*conditions))).scalars():
+            audit_user = AuditUser(
+                id=str(user.id),
+                name=user.username,
+                email=user.email,
+                role=user.role,
             )
+            if user.id in uuids:
+                found[uuids[user.id]] = audit_user
+            if user.username in usernames:
+                found[user.username] = audit_user
+    except Exception as e:
+        logger.warning(f"Error getting audit users: {e}")
 
-        # Build the entry
-        timestamp = (
-            issued_at.isoformat() + "Z"
-            if issued_at
-            else datetime.now(UTC).isoformat() + "Z"
-        )
+    return {
+        user_id: found.get(user_id) or _unknown_audit_user(user_id)
+        for user_id in wanted
+    }
 
-        return AuditLogEntry(  # type: ignore[call-arg]
-            id=f"{entity_type}-{transaction_id}",
-            timestamp=timestamp,
-            entityType=entity_type,
-            entityId=entity_id,
-            entityName=entity_name,
-            action=action,
-            severity=severity,
-            user=audit_user,
-            changes=changes,
-            metadata={
-                "transaction_id": transaction_id,
-                "operation_type": operation_type,
-            },
-            ipAddress=remote_addr,
-            userAgent=None,
-            acgmeOverride=acgme_override,
-            acgmeJustification=acgme_justification,
-        )
 
-    except Exception as e:
-        logger.warning(f"Error building audit entry: {e}")
-        return None
+def _unknown_audit_user(user_id: str) -> AuditUser:
+    """Fallback for a transaction user that no longer exists."""
+    return AuditUser(
+        id=user_id,
+        name=f"User {user_id[:8]}",
+        email=None,
+        role="unknown",
+    )
 
 
 def _get_audit_user(db: Session, user_id: str | None) -> AuditUser:
@@ -351,133 +903,6 @@ def _get_audit_user(db: Session, user_id: str | None) -> AuditUser:
     )
 
 
-def _get_entity_name(db: Session, entity_type: str, entity_id: str) -> str | None:
-    """Get a human-readable name for the entity."""
-    try:
-        if entity_type == "assignment":
-            assignment = db.query(Assignment).filter(Assignment.id == entity_id).first()
-            if assignment and assignment.person:
-                return f"Assignment - {assignment.person.name}"
-            return "Assignment"
-
-        elif entity_type == "absence":
-            absence = db.query(Absence).filter(Absence.id == entity_id).first()
-            if absence and absence.person:
-                return f"{absence.absence_type.title()} - {absence.person.name}"
-            return "Absence"
-
-        elif entity_type == "schedule_run":
-            schedule_run = (
-                db.query(ScheduleRun).filter(ScheduleRun.id == entity_id).first()
-            )
-            if schedule_run:
-                return f"Schedule Run - {schedule_run.start_date} to {schedule_run.end_date}"
-            return "Schedule Run"
-
-        elif entity_type == "swap_record":
-            swap = db.query(SwapRecord).filter(SwapRecord.id == entity_id).first()
-            if swap:
-                return f"Swap Request - {swap.status}"
-            return "Swap Request"
-
-    except Exception as e:
-        logger.warning(f"Error getting entity name: {e}")
-
-    return None
-
-
-def _get_field_changes(
-    db: Session,
-    entity_type: str,
-    entity_id: str,
-    transaction_id: int,
-) -> list[FieldChange] | None:
-    """Get field changes for this version."""
-    try:
-        model_class = ENTITY_MODEL_MAP.get(entity_type)
-        if not model_class:
-            return None
-
-        # Get the version class
-        VersionClass = version_class(model_class)
-
-        # Get current and previous versions
-        current_version = (
-            db.query(VersionClass)
-            .filter(
-                VersionClass.id == entity_id,
-                VersionClass.transaction_id == transaction_id,
-            )
-            .first()
-        )
-
-        if not current_version:
-            return None
-
-        # Get previous version
-        previous_version = (
-            db.query(VersionClass)
-            .filter(
-                VersionClass.id == entity_id,
-                VersionClass.transaction_id < transaction_id,
-            )
-            .order_by(VersionClass.transaction_id.desc())
-            .first()
-        )
-
-        if not previous_version:
-            # This is the first version (create), no changes to show
-            return None
-
-        # Compare versions
-        changes = []
-        for column in current_version.__table__.columns:
-            col_name = column.name
-
-            # Skip internal columns
-            if col_name in ("transaction_id", "operation_type", "end_transaction_id"):
-                continue
-
-            old_value = getattr(previous_version, col_name, None)
-            new_value = getattr(current_version, col_name, None)
-
-            if old_value != new_value:
-                # Convert to string for display
-                old_str = str(old_value) if old_value is not None else None
-                new_str = str(new_value) if new_value is not None else None
-
-                changes.append(
-                    FieldChange(  # type: ignore[call-arg]
-                        field=col_name,
-                        oldValue=old_str,
-                        newValue=new_str,
-                        displayName=_format_field_name(col_name),
-                    )
-                )
-
-        return changes if changes else None
-
-    except Exception as e:
-        logger.warning(f"Error getting field changes: {e}")
-        return None
-
-
-def _check_acgme_override(
-    db: Session,
-    entity_id: str,
-    transaction_id: int,
-) -> tuple[bool, str | None]:
-    """Check if this assignment has an ACGME override."""
-    try:
-        assignment = db.query(Assignment).filter(Assignment.id == entity_id).first()
-        if assignment and assignment.override_reason:
-            return True, assignment.override_reason
-    except Exception as e:
-        logger.warning(f"Error checking ACGME override: {e}")
-
-    return False, None
-
-
 def _determine_severity(entity_type: str, action: str, operation_type: int) -> str:
     """Determine severity level for an audit entry."""
     # Delete operations are warnings
@@ -503,38 +928,6 @@ def _format_field_name(field_name: str) -> str:
     return " ".join(word.capitalize() for word in field_name.split("_"))
 
 
-def _apply_filters(
-    entries: list[AuditLogEntry],
-    actions: list[str] | None = None,
-    severity: list[str] | None = None,
-    search: str | None = None,
-    acgme_overrides_only: bool = False,
-) -> list[AuditLogEntry]:
-    """Apply additional filters to audit entries."""
-    filtered = entries
-
-    if actions:
-        filtered = [e for e in filtered if e.action in actions]
-
-    if severity:
-        filtered = [e for e in filtered if e.severity in severity]
-
-    if search:
-        search_lower = search.lower()
-        filtered = [
-            e
-            for e in filtered
-            if (e.entity_name and search_lower in e.entity_name.lower())
-            or (e.reason and search_lower in e.reason.lower())
-            or search_lower in e.action.lower()
-        ]
-
-    if acgme_overrides_only:
-        filtered = [e for e in filtered if e.acgme_override]
-
-    return filtered
-
-
 def get_audit_users(db: Session) -> list[AuditUser]:
     """Get list of users who have audit activity."""
     try:
@@ -588,39 +981,27 @@ def get_audit_statistics(
         - uniqueUsers: Number of unique users
     """
     try:
-        # Get all entries for date range
-        entries, total = get_audit_logs(
-            db,
-            page=1,
-            page_size=10000,
-            start_date=start_date,
-            end_date=end_date,
-        )
-
-        # Count by action
-        entries_by_action = {}
-        for entry in entries:
+        # Stream all entries for date range
+        total = 0
+        entries_by_action: dict[str, int] = {}
+        entries_by_entity_type: dict[str, int] = {}
+        entries_by_severity: dict[str, int] = {}
+        acgme_override_count = 0
+        users = set()
+        for entry in iter_audit_logs(db, start_date=start_date, end_date=end_date):
+            total += 1
             entries_by_action[entry.action] = entries_by_action.get(entry.action, 0) + 1
-
-        # Count by entity type
-        entries_by_entity_type = {}
-        for entry in entries:
             entries_by_entity_type[entry.entity_type] = (
                 entries_by_entity_type.get(entry.entity_type, 0) + 1
             )
-
-        # Count by severity
-        entries_by_severity = {}
-        for entry in entries:
             entries_by_severity[entry.severity] = (
                 entries_by_severity.get(entry.severity, 0) + 1
             )
-
-        # Count ACGME overrides
-        acgme_override_count = sum(1 for entry in entries if entry.acgme_override)
+            acgme_override_count += entry.acgme_override
+            users.add(entry.user.id)
 
         # Count unique users
-        unique_users = len({entry.user.id for entry in entries})
+        unique_users = len(users)
 
         return {
             "totalEntries": total,
@@ -1,20 +1,146 @@
-"""Calendar service for ICS export and subscription."""
-
+"""Calendar service for ICS export and subscription.
+
+Feeds are streamed event by event from a server-side cursor rather than
+built as one document in memory. Each feed has a strong ETag derived from
+the schedule version counters in ``app.db.schedule_versions``, so routes can
+answer conditional requests without reading assignments, and rendered
+VEVENT fragments are cached per assignment version.
+"""
+
+import threading
+from collections import OrderedDict
+from collections.abc import Hashable, Iterator
+from dataclasses import dataclass
 from datetime import date, datetime, timedelta, UTC
+from typing import Any
 from uuid import UUID
 
 from icalendar import Calendar, Event, Timezone, TimezoneStandard
-from sqlalchemy.orm import Session, joinedload
-
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.caching.etag import ETagGenerator
+from app.db.schedule_versions import (
+    PROGRAM,
+    STRUCTURE,
+    get_versions,
+    person_scope,
+)
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.calendar_subscription import CalendarSubscription
 from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+
+# Bump when rendered output changes so clients drop feeds cached by ETag
+RENDER_VERSION = 2
+
+# Rows fetched per round-trip from the server-side cursor
+STREAM_BATCH_SIZE = 500
+
+_FOOTER = "END:VCALENDAR\r\n"
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_etags = ETagGenerator()
+
+
+@dataclass(frozen=True)
+class FeedVersion:
+    """Validators for one calendar feed."""
+
+    etag: str
+    last_modified: datetime | None
+
+
+class FragmentCache:
+    """
+    Thread-safe LRU cache of rendered VEVENT fragments.
+
+    Keys include the assignment's ``updated_at`` and the ``structure``
+    version, so edits make old entries unreachable rather than stale.
+
+    Args:
+        max_entries: Fragments kept before least recently used are evicted
+    """
+
+    def __init__(self, max_entries: int = 20_000) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> str | None:
+        with self._lock:
+            fragment = self._entries.get(key)
+            if fragment is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return fragment
+
+    def put(self, key: Hashable, fragment: str) -> None:
+        with self._lock:
+            self._entries[key] = fragment
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+def _utc(value: datetime | None) -> datetime | None:
+    """Naive database timestamps are UTC."""
+    if value is None or value.tzinfo is not None:
+        return value
+    return value.replace(tzinfo=UTC)
+
+
+def _event_query(*conditions: Any, include_types: list[str] | None = None) -> Any:
+    """Column-only SELECT of everything a VEVENT renders, in feed order."""
+    query = (
+        select(
+            Assignment.id,
+            Assignment.role,
+            Assignment.notes,
+            Assignment.activity_override,
+            Assignment.created_at,
+            Assignment.updated_at,
+            Block.date,
+            Block.time_of_day,
+            Person.name.label("person_name"),
+            Person.type.label("person_type"),
+            Person.pgy_level,
+            RotationTemplate.id.label("template_id"),
+            RotationTemplate.name.label("template_name"),
+            RotationTemplate.rotation_type,
+            RotationTemplate.clinic_location,
+        )
+        .join(Block, Assignment.block_id == Block.id)
+        .outerjoin(Person, Assignment.person_id == Person.id)
+        .outerjoin(
+            RotationTemplate, Assignment.rotation_template_id == RotationTemplate.id
+        )
+        .where(*conditions)
+        .order_by(Block.date, Block.time_of_day, Assignment.id)
+        .execution_options(yield_per=STREAM_BATCH_SIZE)
+    )
+    if include_types:
+        query = query.where(RotationTemplate.rotation_type.in_(include_types))
+    return query
 
 
 class CalendarService:
     """Service for generating ICS calendar files."""
 
+    fragment_cache = FragmentCache()
+
     @staticmethod
     def _create_timezone() -> Timezone:
         """
@@ -45,8 +171,14 @@ class CalendarService:
         AM blocks: 8:00 AM - 12:00 PM
         PM blocks: 1:00 PM - 5:00 PM
         """
-        block_date = block.date
-        if block.time_of_day == "AM":
+        return CalendarService._block_times(block.date, block.time_of_day)
+
+    @staticmethod
+    def _block_times(
+        block_date: date, time_of_day: str
+    ) -> tuple[datetime, datetime]:
+        """Start and end datetime for a half-day block."""
+        if time_of_day == "AM":
             start_time = datetime.combine(
                 block_date, datetime.min.time().replace(hour=8)
             )
@@ -62,16 +194,37 @@ class CalendarService:
             )
         return start_time, end_time
 
+    # ------------------------------------------------------------------
+    # Feed versions
+    # ------------------------------------------------------------------
+
     @staticmethod
-    def generate_ics_for_person(
+    def _feed_version(db: Session, scopes: list[str], *params: Any) -> FeedVersion:
+        """Hash scope versions and feed parameters into validators."""
+        versions = get_versions(db, scopes)
+        key = "|".join(
+            [
+                str(RENDER_VERSION),
+                *(str(param) for param in params),
+                *(f"{scope}={versions[scope][0]}" for scope in sorted(versions)),
+            ]
+        )
+        stamps = [stamp for _, stamp in versions.values() if stamp is not None]
+        return FeedVersion(
+            etag=_etags.generate(key),
+            last_modified=_utc(max(stamps)) if stamps else None,
+        )
+
+    @staticmethod
+    def person_feed_version(
         db: Session,
         person_id: UUID,
         start_date: date,
         end_date: date,
         include_types: list[str] | None = None,
-    ) -> str:
+    ) -> FeedVersion:
         """
-        Generate ICS calendar file for a person's assignments.
+        Validators for a person's feed, read from version counters only.
 
         Args:
             db: Database session
@@ -81,115 +234,234 @@ class CalendarService:
             include_types: Optional list of rotation types to include
 
         Returns:
-            ICS file content as string
+            ETag and Last-Modified for the feed
         """
-        # Get person
-        person = db.query(Person).filter(Person.id == person_id).first()
-        if not person:
-            raise ValueError(f"Person not found: {person_id}")
+        return CalendarService._feed_version(
+            db,
+            [person_scope(person_id), STRUCTURE],
+            "person",
+            person_id,
+            start_date,
+            end_date,
+            sorted(include_types or []),
+        )
 
-        # Query assignments with blocks and rotation templates
-        query = (
-            db.query(Assignment)
-            .options(
-                joinedload(Assignment.block),
-                joinedload(Assignment.rotation_template),
-                joinedload(Assignment.person),
-            )
-            .join(Block)
-            .filter(
-                Assignment.person_id == person_id,
-                Block.date >= start_date,
-                Block.date <= end_date,
-            )
+    @staticmethod
+    def rotation_feed_version(
+        db: Session, rotation_id: UUID, start_date: date, end_date: date
+    ) -> FeedVersion:
+        """
+        Validators for a rotation's feed, read from version counters only.
+
+        Args:
+            db: Database session
+            rotation_id: Rotation template UUID
+            start_date: Start date for export
+            end_date: End date for export
+
+        Returns:
+            ETag and Last-Modified for the feed
+        """
+        return CalendarService._feed_version(
+            db,
+            [PROGRAM, STRUCTURE],
+            "rotation",
+            rotation_id,
+            start_date,
+            end_date,
         )
 
-        # Filter by rotation types if specified
-        if include_types:
-            query = query.filter(
-                Assignment.rotation_template.has(rotation_type=include_types)
-            )
+    @staticmethod
+    def all_feed_version(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        person_ids: list[UUID] | None = None,
+        rotation_ids: list[UUID] | None = None,
+        include_types: list[str] | None = None,
+    ) -> FeedVersion:
+        """
+        Validators for the complete schedule feed.
 
-        assignments = query.all()
+        Args:
+            db: Database session
+            start_date: Start date for export
+            end_date: End date for export
+            person_ids: Optional list of person UUIDs to filter
+            rotation_ids: Optional list of rotation UUIDs to filter
+            include_types: Optional list of rotation types to include
+
+        Returns:
+            ETag and Last-Modified for the feed
+        """
+        return CalendarService._feed_version(
+            db,
+            [PROGRAM, STRUCTURE],
+            "all",
+            start_date,
+            end_date,
+            sorted(map(str, person_ids or [])),
+            sorted(map(str, rotation_ids or [])),
+            sorted(include_types or []),
+        )
+
+    # ------------------------------------------------------------------
+    # Rendering
+    # ------------------------------------------------------------------
 
-        # Create calendar
+    @staticmethod
+    def _header(calendar_name: str) -> str:
+        """VCALENDAR properties and VTIMEZONE, without the closing line."""
         cal = Calendar()
         cal.add("prodid", "-//Residency Scheduler//Calendar Export//EN")
         cal.add("version", "2.0")
         cal.add("calscale", "GREGORIAN")
         cal.add("method", "PUBLISH")
-        cal.add("x-wr-calname", f"{person.name} - Schedule")
+        cal.add("x-wr-calname", calendar_name)
         cal.add("x-wr-timezone", "Pacific/Honolulu")
 
         # Add proper VTIMEZONE component
         cal.add_component(CalendarService._create_timezone())
 
-        # Add events for each assignment
-        for assignment in assignments:
-            event = Event()
+        return cal.to_ical().decode("utf-8")[: -len(_FOOTER)]
 
-            # Get activity name
-            activity_name = assignment.activity_name
-            if assignment.role == "supervising":
-                activity_name = f"{activity_name} (Supervising)"
-            elif assignment.role == "backup":
-                activity_name = f"{activity_name} (Backup)"
-
-            event.add("summary", activity_name)
+    @staticmethod
+    def _render_event(row: Any, kind: str) -> str:
+        """
+        Render one VEVENT.
 
-            # Get block times
-            start_time, end_time = CalendarService._get_block_time(assignment.block)
-            event.add("dtstart", start_time)
-            event.add("dtend", end_time)
+        Args:
+            row: Row from ``_event_query``
+            kind: Feed kind ("person", "rotation" or "all")
 
-            # Add unique identifier
-            uid = f"{assignment.id}@residency-scheduler"
-            event.add("uid", uid)
+        Returns:
+            Serialized VEVENT component
+        """
+        event = Event()
 
-            # Add description with details
-            description_parts = [
-                f"Role: {assignment.role.title()}",
-                f"Block: {assignment.block.display_name}",
-            ]
+        activity_name = row.activity_override or row.template_name or "Unassigned"
+        person_name = row.person_name or "Unknown"
+        if kind == "person":
+            summary = activity_name
+        else:
+            summary = f"{person_name} - {activity_name}"
+        if kind == "rotation" and row.role != "primary":
+            summary += f" ({row.role.title()})"
+        elif kind != "rotation" and row.role in ("supervising", "backup"):
+            summary += f" ({row.role.title()})"
+        event.add("summary", summary)
+
+        # Get block times
+        start_time, end_time = CalendarService._block_times(row.date, row.time_of_day)
+        event.add("dtstart", start_time)
+        event.add("dtend", end_time)
+
+        # Add unique identifier
+        event.add("uid", f"{row.id}@residency-scheduler")
+
+        # Add description with details
+        description_parts = []
+        if kind != "person":
+            description_parts.append(f"Person: {person_name}")
+        description_parts += [
+            f"Role: {row.role.title()}",
+            f"Block: {row.date.strftime('%Y-%m-%d')} {row.time_of_day}",
+        ]
+
+        if kind != "rotation" and row.template_id is not None:
+            description_parts.append(f"Type: {row.rotation_type}")
+            if row.clinic_location:
+                description_parts.append(f"Location: {row.clinic_location}")
+
+        if kind != "person" and row.person_type == "resident" and row.pgy_level:
+            description_parts.append(f"PGY Level: {row.pgy_level}")
+
+        if row.notes:
+            description_parts.append(f"Notes: {row.notes}")
+
+        event.add("description", "\n".join(description_parts))
+
+        # Add location if available
+        if row.template_id is not None and row.clinic_location:
+            event.add("location", row.clinic_location)
+
+        # Stamp with the last revision (not the request time) so the
+        # rendered feed, and therefore its strong ETag, is reproducible
+        updated_at = _utc(row.updated_at)
+        event.add("dtstamp", updated_at or _utc(row.created_at) or _EPOCH)
+        if updated_at is not None:
+            event.add("last-modified", updated_at)
+
+        return event.to_ical().decode("utf-8")
 
-            if assignment.rotation_template:
-                description_parts.append(
-                    f"Type: {assignment.rotation_template.rotation_type}"
-                )
-                if assignment.rotation_template.clinic_location:
-                    description_parts.append(
-                        f"Location: {assignment.rotation_template.clinic_location}"
-                    )
+    @staticmethod
+    def _stream(db: Session, header: str, query: Any, kind: str) -> Iterator[str]:
+        """Yield the header, one fragment per assignment, then the footer."""
+        structure = get_versions(db, [STRUCTURE])[STRUCTURE][0]
+        cache = CalendarService.fragment_cache
+
+        yield header
+        for row in db.execute(query):
+            key = (kind, row.id, row.updated_at, structure)
+            fragment = cache.get(key)
+            if fragment is None:
+                fragment = CalendarService._render_event(row, kind)
+                cache.put(key, fragment)
+            yield fragment
+        yield _FOOTER
 
-            if assignment.notes:
-                description_parts.append(f"Notes: {assignment.notes}")
+    @staticmethod
+    def stream_ics_for_person(
+        db: Session,
+        person_id: UUID,
+        start_date: date,
+        end_date: date,
+        include_types: list[str] | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream the ICS calendar for a person's assignments.
 
-            event.add("description", "\n".join(description_parts))
+        The person is looked up eagerly; assignments are read lazily as the
+        returned iterator is consumed.
 
-            # Add location if available
-            if (
-                assignment.rotation_template
-                and assignment.rotation_template.clinic_location
-            ):
-                event.add("location", assignment.rotation_template.clinic_location)
+        Args:
+            db: Database session
+            person_id: Person UUID
+            start_date: Start date for export
+            end_date: End date for export
+            include_types: Optional list of rotation types to include
 
-            # Add last modified timestamp
-            event.add("dtstamp", datetime.now(UTC))
-            event.add("last-modified", assignment.updated_at)
+        Returns:
+            Iterator of ICS text chunks
 
-            cal.add_component(event)
+        Raises:
+            ValueError: If the person does not exist
+        """
+        person_name = db.execute(
+            select(Person.name).where(Person.id == person_id)
+        ).scalar_one_or_none()
+        if person_name is None:
+            raise ValueError(f"Person not found: {person_id}")
 
-        return cal.to_ical().decode("utf-8")
+        query = _event_query(
+            Assignment.person_id == person_id,
+            Block.date >= start_date,
+            Block.date <= end_date,
+            include_types=include_types,
+        )
+        return CalendarService._stream(
+            db, CalendarService._header(f"{person_name} - Schedule"), query, "person"
+        )
 
     @staticmethod
-    def generate_ics_for_rotation(
+    def stream_ics_for_rotation(
         db: Session,
         rotation_id: UUID,
         start_date: date,
         end_date: date,
-    ) -> str:
+    ) -> Iterator[str]:
         """
-        Generate ICS calendar file for all assignments in a rotation.
+        Stream the ICS calendar for all assignments in a rotation.
 
         Args:
             db: Database session
@@ -198,101 +470,114 @@ class CalendarService:
             end_date: End date for export
 
         Returns:
-            ICS file content as string
+            Iterator of ICS text chunks
+
+        Raises:
+            ValueError: If the rotation has no assignments in the range
         """
-        # Query assignments for this rotation
-        assignments = (
-            db.query(Assignment)
-            .options(
-                joinedload(Assignment.block),
-                joinedload(Assignment.rotation_template),
-                joinedload(Assignment.person),
-            )
-            .join(Block)
-            .filter(
-                Assignment.rotation_template_id == rotation_id,
-                Block.date >= start_date,
-                Block.date <= end_date,
-            )
-            .all()
+        conditions = (
+            Assignment.rotation_template_id == rotation_id,
+            Block.date >= start_date,
+            Block.date <= end_date,
         )
-
-        if not assignments:
+        found = db.execute(
+            select(Assignment.id).join(Block).where(*conditions).limit(1)
+        ).first()
+        if found is None:
             raise ValueError(f"No assignments found for rotation: {rotation_id}")
 
-        # Get rotation template name
-        rotation_name = (
-            assignments[0].rotation_template.name
-            if assignments[0].rotation_template
-            else "Unknown"
+        rotation_name = db.execute(
+            select(RotationTemplate.name).where(RotationTemplate.id == rotation_id)
+        ).scalar_one_or_none()
+        header = CalendarService._header(f"{rotation_name or 'Unknown'} - Schedule")
+        return CalendarService._stream(
+            db, header, _event_query(*conditions), "rotation"
         )
 
-        # Create calendar
-        cal = Calendar()
-        cal.add("prodid", "-//Residency Scheduler//Calendar Export//EN")
-        cal.add("version", "2.0")
-        cal.add("calscale", "GREGORIAN")
-        cal.add("method", "PUBLISH")
-        cal.add("x-wr-calname", f"{rotation_name} - Schedule")
-        cal.add("x-wr-timezone", "Pacific/Honolulu")
-
-        # Add proper VTIMEZONE component
-        cal.add_component(CalendarService._create_timezone())
-
-        # Add events for each assignment
-        for assignment in assignments:
-            event = Event()
-
-            # Summary includes person name and role
-            person_name = assignment.person.name if assignment.person else "Unknown"
-            summary = f"{person_name} - {assignment.activity_name}"
-            if assignment.role != "primary":
-                summary += f" ({assignment.role.title()})"
-
-            event.add("summary", summary)
-
-            # Get block times
-            start_time, end_time = CalendarService._get_block_time(assignment.block)
-            event.add("dtstart", start_time)
-            event.add("dtend", end_time)
+    @staticmethod
+    def stream_ics_all(
+        db: Session,
+        start_date: date,
+        end_date: date,
+        person_ids: list[UUID] | None = None,
+        rotation_ids: list[UUID] | None = None,
+        include_types: list[str] | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream the ICS calendar for all schedules or filtered schedules.
 
-            # Add unique identifier
-            uid = f"{assignment.id}@residency-scheduler"
-            event.add("uid", uid)
+        Args:
+            db: Database session
+            start_date: Start date for export
+            end_date: End date for export
+            person_ids: Optional list of person UUIDs to filter
+            rotation_ids: Optional list of rotation UUIDs to filter
+            include_types: Optional list of rotation types to include
 
-            # Add description
-            description_parts = [
-                f"Person: {person_name}",
-                f"Role: {assignment.role.title()}",
-                f"Block: {assignment.block.display_name}",
-            ]
+        Returns:
+            Iterator of ICS text chunks
+        """
+        conditions = [Block.date >= start_date, Block.date <= end_date]
+        if person_ids:
+            conditions.append(Assignment.person_id.in_(person_ids))
+        if rotation_ids:
+            conditions.append(Assignment.rotation_template_id.in_(rotation_ids))
 
-            if (
-                assignment.person
-                and assignment.person.is_resident
-                and assignment.person.pgy_level
-            ):
-                description_parts.append(f"PGY Level: {assignment.person.pgy_level}")
+        query = _event_query(*conditions, include_types=include_types)
+        header = CalendarService._header("Complete Schedule Export")
+        return CalendarService._stream(db, header, query, "all")
 
-            if assignment.notes:
-                description_parts.append(f"Notes: {assignment.notes}")
+    @staticmethod
+    def generate_ics_for_person(
+        db: Session,
+        person_id: UUID,
+        start_date: date,
+        end_date: date,
+        include_types: list[str] | None = None,
+    ) -> str:
+        """
+        Generate ICS calendar file for a person's assignments.
 
-            event.add("description", "\n".join(description_parts))
+        Args:
+            db: Database session
+            person_id: Person UUID
+            start_date: Start date for export
+            end_date: End date for export
+            include_types: Optional list of rotation types to include
 
-            # Add location if available
-            if (
-                assignment.rotation_template
-                and assignment.rotation_template.clinic_location
-            ):
-                event.add("location", assignment.rotation_template.clinic_location)
+        Returns:
+            ICS file content as string
+        """
+        return "".join(
+            CalendarService.stream_ics_for_person(
+                db, person_id, start_date, end_date, include_types
+            )
+        )
 
-            # Add timestamps
-            event.add("dtstamp", datetime.now(UTC))
-            event.add("last-modified", assignment.updated_at)
+    @staticmethod
+    def generate_ics_for_rotation(
+        db: Session,
+        rotation_id: UUID,
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        """
+        Generate ICS calendar file for all assignments in a rotation.
 
-            cal.add_component(event)
+        Args:
+            db: Database session
+            rotation_id: Rotation template UUID
+            start_date: Start date for export
+            end_date: End date for export
 
-        return cal.to_ical().decode("utf-8")
+        Returns:
+            ICS file content as string
+        """
+        return "".join(
+            CalendarService.stream_ics_for_rotation(
+                db, rotation_id, start_date, end_date
+            )
+        )
 
     @staticmethod
     def generate_ics_all(
@@ -317,118 +602,12 @@ class CalendarService:
         Returns:
             ICS file content as string
         """
-        # Query assignments with blocks, rotation templates, and persons
-        query = (
-            db.query(Assignment)
-            .options(
-                joinedload(Assignment.block),
-                joinedload(Assignment.rotation_template),
-                joinedload(Assignment.person),
-            )
-            .join(Block)
-            .filter(
-                Block.date >= start_date,
-                Block.date <= end_date,
+        return "".join(
+            CalendarService.stream_ics_all(
+                db, start_date, end_date, person_ids, rotation_ids, include_types
             )
         )
 
-        # Filter by person IDs if specified
-        if person_ids:
-            query = query.filter(Assignment.person_id.in_(person_ids))
-
-        # Filter by rotation IDs if specified
-        if rotation_ids:
-            query = query.filter(Assignment.rotation_template_id.in_(rotation_ids))
-
-        # Filter by rotation types if specified
-        if include_types:
-            query = query.filter(
-                Assignment.rotation_template.has(rotation_type=include_types)
-            )
-
-        assignments = query.all()
-
-        # Create calendar
-        cal = Calendar()
-        cal.add("prodid", "-//Residency Scheduler//Calendar Export//EN")
-        cal.add("version", "2.0")
-        cal.add("calscale", "GREGORIAN")
-        cal.add("method", "PUBLISH")
-        cal.add("x-wr-calname", "Complete Schedule Export")
-        cal.add("x-wr-timezone", "Pacific/Honolulu")
-
-        # Add proper VTIMEZONE component
-        cal.add_component(CalendarService._create_timezone())
-
-        # Add events for each assignment
-        for assignment in assignments:
-            event = Event()
-
-            # Get person name
-            person_name = assignment.person.name if assignment.person else "Unknown"
-
-            # Get activity name with role
-            activity_name = assignment.activity_name
-            summary = f"{person_name} - {activity_name}"
-            if assignment.role == "supervising":
-                summary = f"{person_name} - {activity_name} (Supervising)"
-            elif assignment.role == "backup":
-                summary = f"{person_name} - {activity_name} (Backup)"
-
-            event.add("summary", summary)
-
-            # Get block times
-            start_time, end_time = CalendarService._get_block_time(assignment.block)
-            event.add("dtstart", start_time)
-            event.add("dtend", end_time)
-
-            # Add unique identifier
-            uid = f"{assignment.id}@residency-scheduler"
-            event.add("uid", uid)
-
-            # Add description with details
-            description_parts = [
-                f"Person: {person_name}",
-                f"Role: {assignment.role.title()}",
-                f"Block: {assignment.block.display_name}",
-            ]
-
-            if assignment.rotation_template:
-                description_parts.append(
-                    f"Type: {assignment.rotation_template.rotation_type}"
-                )
-                if assignment.rotation_template.clinic_location:
-                    description_parts.append(
-                        f"Location: {assignment.rotation_template.clinic_location}"
-                    )
-
-            if (
-                assignment.person
-                and assignment.person.is_resident
-                and assignment.person.pgy_level
-            ):
-                description_parts.append(f"PGY Level: {assignment.person.pgy_level}")
-
-            if assignment.notes:
-                description_parts.append(f"Notes: {assignment.notes}")
-
-            event.add("description", "\n".join(description_parts))
-
-            # Add location if available
-            if (
-                assignment.rotation_template
-                and assignment.rotation_template.clinic_location
-            ):
-                event.add("location", assignment.rotation_template.clinic_location)
-
-            # Add last modified timestamp
-            event.add("dtstamp", datetime.now(UTC))
-            event.add("last-modified", assignment.updated_at)
-
-            cal.add_component(event)
-
-        return cal.to_ical().decode("utf-8")
-
     @staticmethod
     def create_subscription(
         db: Session,
@@ -855,25 +855,20 @@ class CallAssignmentService:
         if not pcat_template or not do_template:
             return
 
-        am_block = await self._find_block_for_date_time(next_day, "AM")
-        if am_block:
-            await self.db.execute(
-                delete(Assignment).where(
-                    Assignment.person_id == person_id,
-                    Assignment.block_id == am_block.id,
-                    Assignment.rotation_template_id == pcat_template.id,
-                )
-            )
-
-        pm_block = await self._find_block_for_date_time(next_day, "PM")
-        if pm_block:
-            await self.db.execute(
-                delete(Assignment).where(
+        # Delete through the ORM so the audit trail records the removals
+        for time_of_day, template in (("AM", pcat_template), ("PM", do_template)):
+            block = await self._find_block_for_date_time(next_day, time_of_day)
+            if not block:
+                continue
+            result = await self.db.execute(
+                select(Assignment).where(
                     Assignment.person_id == person_id,
-                    Assignment.block_id == pm_block.id,
-                    Assignment.rotation_template_id == do_template.id,
+                    Assignment.block_id == block.id,
+                    Assignment.rotation_template_id == template.id,
                 )
             )
+            for assignment in result.scalars():
+                await self.db.delete(assignment)
 
         await self.db.flush()
 
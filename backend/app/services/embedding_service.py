@@ -8,6 +8,7 @@ Tier 3: sentence-transformers on CPU (fallback, works everywhere)
 import hashlib
 import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from typing import Any
 
@@ -149,6 +150,34 @@ class EmbeddingService:
         embeddings = model.encode(texts, convert_to_numpy=True, show_progress_bar=False)
         return [emb.tolist() for emb in embeddings]
 
+    @classmethod
+    def embed_batches(
+        cls, texts: list[str], batch_size: int = 64, workers: int = 1
+    ) -> list[list[float]]:
+        """Embed many texts in fixed-size batches, optionally in parallel.
+
+        Batches run on a thread pool: MLX calls are HTTP round trips and
+        sentence-transformers releases the GIL while encoding.
+
+        Args:
+            texts: Texts to embed
+            batch_size: Texts per embed_batch call
+            workers: Concurrent batches
+
+        Returns:
+            Embeddings in input order
+        """
+        batches = [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+        if workers <= 1 or len(batches) <= 1:
+            results = [cls.embed_batch(batch) for batch in batches]
+        else:
+            # Pick the tier and load the model once, not once per thread
+            if not cls._check_mlx_available():
+                cls.get_model()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(cls.embed_batch, batches))
+        return [embedding for batch in results for embedding in batch]
+
     @staticmethod
     def hash_text(text: str) -> str:
         """Generate SHA256 hash of text for change detection.
@@ -1,8 +1,8 @@
 """
 Export services package.
 
-Provides data export functionality in multiple formats (CSV, JSON, XML)
-with support for streaming, compression, and scheduled exports.
+Provides data export functionality in multiple formats (CSV, JSON, XML,
+Parquet, Arrow IPC) with support for streaming, compression, and scheduled exports.
 
 Examples:
     Basic usage with factory:
@@ -43,7 +43,9 @@ Examples:
     ...     )
 
 Features:
-    - Multiple export formats: CSV, JSON, XML
+    - Multiple export formats: CSV, JSON, XML, Parquet, Arrow IPC
+    - Columnar exports with projection, predicate pushdown and
+      incremental (changed-since-version) mode
     - Streaming support for large datasets
     - Gzip compression option
     - Custom field selection
@@ -53,6 +55,7 @@ Features:
     - Scheduled export configuration
 """
 
+from app.services.export.arrow_exporter import PYARROW_AVAILABLE, ArrowExporter
 from app.services.export.csv_exporter import CSVExporter
 from app.services.export.tamc_block_exporter import TAMCBlockExporter
 from app.services.export.export_factory import (
@@ -69,10 +72,12 @@ from app.services.export.xml_exporter import XMLExporter
 
 __all__ = [
     # Exporters
+    "ArrowExporter",
     "CSVExporter",
     "JSONExporter",
     "TAMCBlockExporter",
     "XMLExporter",
+    "PYARROW_AVAILABLE",
     # Factory and enums
     "ExportFactory",
     "ExportFormat",
@@ -0,0 +1,800 @@
+"""
+Columnar (Arrow/Parquet) export service.
+
+Streams assignment, half-day, people and block data as Arrow record batches
+straight from a server-side cursor (``yield_per``), without building a dict
+per row. Low-cardinality columns (people, rotations, activities, roles) are
+dictionary-encoded; dates and timestamps keep their native types.
+
+Requests can project columns and push predicates down to SQL. The
+assignment datasets also support incremental exports of the rows changed
+since an audit transaction id (``since_version``), with tombstones for
+deleted rows. Every file records the transaction id it is current to under
+the ``snapshot_version`` schema metadata key, which is the value the next
+incremental run passes back.
+
+Audit transaction ids are allocated when a transaction starts writing, not
+when it commits, so a transaction with a lower id can commit after a
+snapshot has already recorded a higher one. Incremental exports therefore
+also re-read every transaction issued within ``INCREMENTAL_OVERLAP`` before
+the ``since_version`` transaction. Rows in that window may repeat across
+files, so consumers must apply changes as idempotent upserts and deletes.
+Transactions that stay open for longer than the overlap can still be
+missed.
+
+Only writes through the ORM unit of work are audited. Core statements
+(``insert``/``update``/``delete``), ``Query.update``/``Query.delete`` and
+``bulk_*_mappings`` write no version rows, so incremental exports do not
+see them. This includes the ``QueryBuilder`` batch helpers. Take a full
+export after such writes.
+"""
+
+import io
+import operator
+from collections.abc import AsyncIterator, Callable, Iterator, Sequence
+from dataclasses import dataclass
+from datetime import UTC, date, datetime, timedelta
+from typing import Any
+
+from sqlalchemy import func, literal, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, configure_mappers
+from sqlalchemy_continuum import transaction_class, version_class
+
+from app.models.activity import Activity
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.half_day_assignment import HalfDayAssignment
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    pa = None  # type: ignore
+    pq = None  # type: ignore
+    PYARROW_AVAILABLE = False
+
+# Column kinds
+UUID_KIND = "uuid"  # UUID as string
+KEY_KIND = "key"  # repeated UUID, dictionary-encoded
+CATEGORY_KIND = "category"  # repeated string, dictionary-encoded
+STRING_KIND = "string"
+DATE_KIND = "date"
+TIMESTAMP_KIND = "timestamp"
+INT_KIND = "int"
+FLOAT_KIND = "float"
+BOOL_KIND = "bool"
+
+# Continuum operation_type for deletes
+_DELETE_OPERATION = 2
+
+# Incremental exports re-read transactions issued this long before the
+# since_version transaction, to catch ones that committed after it
+INCREMENTAL_OVERLAP = timedelta(minutes=15)
+
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "=": operator.eq,
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "in": lambda column, value: column.in_(value),
+    "not in": lambda column, value: column.not_in(value),
+}
+
+
+@dataclass(frozen=True)
+class ColumnSpec:
+    """One exported column: its SQL expression and Arrow kind."""
+
+    name: str
+    expression: Any
+    kind: str
+
+
+@dataclass(frozen=True)
+class Dataset:
+    """Exportable table: columns, joins and default ordering."""
+
+    name: str
+    columns: tuple[ColumnSpec, ...]
+    select_from: Callable[[Any], Any]
+    order_by: tuple[Any, ...]
+
+    def column(self, name: str) -> ColumnSpec:
+        for spec in self.columns:
+            if spec.name == name:
+                return spec
+        raise ValueError(
+            f"Unknown column for {self.name} export: {name}. "
+            f"Available columns: {', '.join(c.name for c in self.columns)}"
+        )
+
+
+ASSIGNMENTS = Dataset(
+    name="assignments",
+    columns=(
+        ColumnSpec("assignment_id", Assignment.id, UUID_KIND),
+        ColumnSpec("block_id", Assignment.block_id, KEY_KIND),
+        ColumnSpec("date", Block.date, DATE_KIND),
+        ColumnSpec("time_of_day", Block.time_of_day, CATEGORY_KIND),
+        ColumnSpec("block_number", Block.block_number, INT_KIND),
+        ColumnSpec("is_weekend", Block.is_weekend, BOOL_KIND),
+        ColumnSpec("is_holiday", Block.is_holiday, BOOL_KIND),
+        ColumnSpec("person_id", Assignment.person_id, KEY_KIND),
+        ColumnSpec("person_name", Person.name, CATEGORY_KIND),
+        ColumnSpec("person_type", Person.type, CATEGORY_KIND),
+        ColumnSpec("pgy_level", Person.pgy_level, INT_KIND),
+        ColumnSpec("faculty_role", Person.faculty_role, CATEGORY_KIND),
+        ColumnSpec("role", Assignment.role, CATEGORY_KIND),
+        ColumnSpec("rotation_template_id", Assignment.rotation_template_id, KEY_KIND),
+        ColumnSpec("rotation_name", RotationTemplate.name, CATEGORY_KIND),
+        ColumnSpec("rotation_type", RotationTemplate.rotation_type, CATEGORY_KIND),
+        ColumnSpec(
+            "activity_name",
+            func.coalesce(
+                Assignment.activity_override, RotationTemplate.name, "Unassigned"
+            ),
+            CATEGORY_KIND,
+        ),
+        ColumnSpec("notes", Assignment.notes, STRING_KIND),
+        ColumnSpec("confidence", Assignment.confidence, FLOAT_KIND),
+        ColumnSpec("score", Assignment.score, FLOAT_KIND),
+        ColumnSpec("created_at", Assignment.created_at, TIMESTAMP_KIND),
+        ColumnSpec("updated_at", Assignment.updated_at, TIMESTAMP_KIND),
+    ),
+    select_from=lambda query: query.select_from(Assignment)
+    .join(Block, Assignment.block_id == Block.id)
+    .outerjoin(Person, Assignment.person_id == Person.id)
+    .outerjoin(
+        RotationTemplate, Assignment.rotation_template_id == RotationTemplate.id
+    ),
+    order_by=(Block.date, Block.time_of_day, Assignment.id),
+)
+
+HALF_DAY_ASSIGNMENTS = Dataset(
+    name="half_day_assignments",
+    columns=(
+        ColumnSpec("half_day_id", HalfDayAssignment.id, UUID_KIND),
+        ColumnSpec("date", HalfDayAssignment.date, DATE_KIND),
+        ColumnSpec("time_of_day", HalfDayAssignment.time_of_day, CATEGORY_KIND),
+        ColumnSpec("person_id", HalfDayAssignment.person_id, KEY_KIND),
+        ColumnSpec("person_name", Person.name, CATEGORY_KIND),
+        ColumnSpec("person_type", Person.type, CATEGORY_KIND),
+        ColumnSpec("pgy_level", Person.pgy_level, INT_KIND),
+        ColumnSpec("activity_id", HalfDayAssignment.activity_id, KEY_KIND),
+        ColumnSpec("activity_code", Activity.code, CATEGORY_KIND),
+        ColumnSpec("activity_name", Activity.name, CATEGORY_KIND),
+        ColumnSpec("activity_category", Activity.activity_category, CATEGORY_KIND),
+        ColumnSpec(
+            "rotation_template_id", HalfDayAssignment.rotation_template_id, KEY_KIND
+        ),
+        ColumnSpec("rotation_name", RotationTemplate.name, CATEGORY_KIND),
+        ColumnSpec("source", HalfDayAssignment.source, CATEGORY_KIND),
+        ColumnSpec(
+            "counts_toward_fmc_capacity",
+            HalfDayAssignment.counts_toward_fmc_capacity,
+            BOOL_KIND,
+        ),
+        ColumnSpec("is_override", HalfDayAssignment.is_override, BOOL_KIND),
+        ColumnSpec("created_at", HalfDayAssignment.created_at, TIMESTAMP_KIND),
+        ColumnSpec("updated_at", HalfDayAssignment.updated_at, TIMESTAMP_KIND),
+    ),
+    select_from=lambda query: query.select_from(HalfDayAssignment)
+    .outerjoin(Person, HalfDayAssignment.person_id == Person.id)
+    .outerjoin(Activity, HalfDayAssignment.activity_id == Activity.id)
+    .outerjoin(
+        RotationTemplate, HalfDayAssignment.rotation_template_id == RotationTemplate.id
+    ),
+    order_by=(HalfDayAssignment.date, HalfDayAssignment.time_of_day, Person.id),
+)
+
+PEOPLE = Dataset(
+    name="people",
+    columns=(
+        ColumnSpec("person_id", Person.id, UUID_KIND),
+        ColumnSpec("name", Person.name, STRING_KIND),
+        ColumnSpec("type", Person.type, CATEGORY_KIND),
+        ColumnSpec("pgy_level", Person.pgy_level, INT_KIND),
+        ColumnSpec("faculty_role", Person.faculty_role, CATEGORY_KIND),
+        ColumnSpec("created_at", Person.created_at, TIMESTAMP_KIND),
+        ColumnSpec("updated_at", Person.updated_at, TIMESTAMP_KIND),
+    ),
+    select_from=lambda query: query.select_from(Person),
+    order_by=(Person.name, Person.id),
+)
+
+BLOCKS = Dataset(
+    name="blocks",
+    columns=(
+        ColumnSpec("block_id", Block.id, UUID_KIND),
+        ColumnSpec("date", Block.date, DATE_KIND),
+        ColumnSpec("time_of_day", Block.time_of_day, CATEGORY_KIND),
+        ColumnSpec("block_number", Block.block_number, INT_KIND),
+        ColumnSpec("is_weekend", Block.is_weekend, BOOL_KIND),
+        ColumnSpec("is_holiday", Block.is_holiday, BOOL_KIND),
+    ),
+    select_from=lambda query: query.select_from(Block),
+    order_by=(Block.date, Block.time_of_day),
+)
+
+DATASETS = {
+    dataset.name: dataset
+    for dataset in (ASSIGNMENTS, HALF_DAY_ASSIGNMENTS, PEOPLE, BLOCKS)
+}
+
+
+def _require_pyarrow() -> None:
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for Arrow/Parquet exports. "
+            "Install with: pip install pyarrow"
+        )
+
+
+def _arrow_type(kind: str) -> Any:
+    if kind in (KEY_KIND, CATEGORY_KIND):
+        return pa.dictionary(pa.int32(), pa.string())
+    return {
+        UUID_KIND: pa.string(),
+        STRING_KIND: pa.string(),
+        DATE_KIND: pa.date32(),
+        TIMESTAMP_KIND: pa.timestamp("us", tz="UTC"),
+        INT_KIND: pa.int32(),
+        FLOAT_KIND: pa.float64(),
+        BOOL_KIND: pa.bool_(),
+    }[kind]
+
+
+def _to_array(kind: str, values: Sequence[Any]) -> Any:
+    """Convert one column of a partition to an Arrow array."""
+    if kind in (UUID_KIND, KEY_KIND):
+        values = [None if value is None else str(value) for value in values]
+    if kind in (KEY_KIND, CATEGORY_KIND):
+        return pa.array(values, type=pa.string()).dictionary_encode()
+    return pa.array(values, type=_arrow_type(kind))
+
+
+def _record_batch(schema: Any, kinds: Sequence[str], rows: Sequence[Any]) -> Any:
+    columns = list(zip(*rows)) if rows else [()] * len(kinds)
+    return pa.RecordBatch.from_arrays(
+        [_to_array(kind, values) for kind, values in zip(kinds, columns)],
+        schema=schema,
+    )
+
+
+class _ChunkSink(io.RawIOBase):
+    """Write-only file that hands written bytes back in chunks.
+
+    Writers need ``tell()`` to keep counting from the start of the file, so
+    draining cannot just truncate a BytesIO.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        chunk = bytes(data)
+        self._chunks.append(chunk)
+        self._position += len(chunk)
+        return len(chunk)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+class ArrowExporter:
+    """
+    Arrow IPC stream / Parquet export service.
+
+    Accepts async or sync sessions, so batch jobs and the ML training
+    pipeline can use it outside the request cycle.
+    """
+
+    def __init__(
+        self, db: AsyncSession | Session, file_format: str = "parquet"
+    ) -> None:
+        """
+        Initialize columnar exporter.
+
+        Args:
+            db: Async or sync database session
+            file_format: "parquet" or "arrow" (Arrow IPC stream)
+        """
+        if file_format not in ("parquet", "arrow"):
+            raise ValueError(f"Unsupported columnar format: {file_format}")
+        self.db = db
+        self.file_format = file_format
+
+    # ------------------------------------------------------------------
+    # Exporter interface
+    # ------------------------------------------------------------------
+
+    async def export_assignments(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fields: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        since_version: int | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Export assignments (flattened with block, person and rotation).
+
+        Args:
+            start_date: Filter assignments from this date
+            end_date: Filter assignments to this date
+            fields: Columns to include (None = all)
+            filters: Extra (column, operator, value) predicates
+            since_version: Only rows changed after this audit transaction id
+            compress: Use zstd instead of the format's default compression
+            batch_size: Rows per record batch (and Parquet row group)
+
+        Returns:
+            File contents as bytes
+        """
+        return b"".join(
+            [
+                chunk
+                async for chunk in self.stream_export(
+                    "assignments",
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields=fields,
+                    filters=filters,
+                    since_version=since_version,
+                    compress=compress,
+                    batch_size=batch_size,
+                )
+            ]
+        )
+
+    async def export_schedule(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        person_ids: list[str] | None = None,
+        fields: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        since_version: int | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Export the schedule (the assignments dataset, optionally per person).
+
+        Args:
+            start_date: Filter schedule from this date
+            end_date: Filter schedule to this date
+            person_ids: Filter to specific people
+            fields: Columns to include (None = all)
+            filters: Extra (column, operator, value) predicates
+            since_version: Only rows changed after this audit transaction id
+            compress: Use zstd instead of the format's default compression
+            batch_size: Rows per record batch (and Parquet row group)
+
+        Returns:
+            File contents as bytes
+        """
+        if person_ids:
+            filters = [*(filters or []), ("person_id", "in", person_ids)]
+        return await self.export_assignments(
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            filters=filters,
+            since_version=since_version,
+            compress=compress,
+            batch_size=batch_size,
+        )
+
+    async def export_half_day_assignments(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fields: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> bytes:
+        """
+        Export half-day assignments.
+
+        Half-day rows are not audited, so there is no ``since_version``;
+        filter on ``updated_at`` to pick up recent inserts and edits.
+
+        Args:
+            start_date: Filter from this date
+            end_date: Filter to this date
+            fields: Columns to include (None = all)
+            filters: Extra (column, operator, value) predicates
+            compress: Use zstd instead of the format's default compression
+            batch_size: Rows per record batch (and Parquet row group)
+
+        Returns:
+            File contents as bytes
+        """
+        return b"".join(
+            [
+                chunk
+                async for chunk in self.stream_export(
+                    "half_day_assignments",
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields=fields,
+                    filters=filters,
+                    compress=compress,
+                    batch_size=batch_size,
+                )
+            ]
+        )
+
+    async def export_people(
+        self,
+        person_type: str | None = None,
+        fields: list[str] | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> bytes:
+        """Export the people directory."""
+        filters = [("type", "=", person_type)] if person_type else None
+        return b"".join(
+            [
+                chunk
+                async for chunk in self.stream_export(
+                    "people",
+                    fields=fields,
+                    filters=filters,
+                    compress=compress,
+                    batch_size=batch_size,
+                )
+            ]
+        )
+
+    async def export_blocks(
+        self,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fields: list[str] | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> bytes:
+        """Export blocks."""
+        return b"".join(
+            [
+                chunk
+                async for chunk in self.stream_export(
+                    "blocks",
+                    start_date=start_date,
+                    end_date=end_date,
+                    fields=fields,
+                    compress=compress,
+                    batch_size=batch_size,
+                )
+            ]
+        )
+
+    async def export_analytics(
+        self,
+        metrics_data: list[dict[str, Any]],
+        compress: bool = False,
+    ) -> bytes:
+        """
+        Export precomputed analytics rows (types inferred from the values).
+
+        Args:
+            metrics_data: List of dictionaries containing analytics metrics
+            compress: Use zstd instead of the format's default compression
+
+        Returns:
+            File contents as bytes
+        """
+        _require_pyarrow()
+        table = pa.Table.from_pylist(metrics_data)
+        sink = _ChunkSink()
+        writer = self._open_writer(sink, table.schema, compress)
+        writer.write_table(table)
+        writer.close()
+        return sink.drain()
+
+    async def stream_export(
+        self,
+        export_type: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fields: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        since_version: int | None = None,
+        compress: bool = False,
+        batch_size: int = 50_000,
+        **kwargs: Any,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream a file, one chunk per record batch.
+
+        Args:
+            export_type: Dataset name ('assignments', 'schedule',
+                'half_day_assignments', 'people', 'blocks')
+            start_date: Filter from this date (datasets with a date column)
+            end_date: Filter to this date
+            fields: Columns to include (None = all)
+            filters: Extra (column, operator, value) predicates
+            since_version: Only rows changed after this audit transaction id
+            compress: Use zstd instead of the format's default compression
+            batch_size: Rows per record batch (and Parquet row group)
+
+        Yields:
+            Chunks of the output file
+        """
+        schema, batches = await self.record_batches(
+            export_type,
+            start_date=start_date,
+            end_date=end_date,
+            fields=fields,
+            filters=filters,
+            since_version=since_version,
+            batch_size=batch_size,
+        )
+        sink = _ChunkSink()
+        writer = self._open_writer(sink, schema, compress)
+        async for batch in batches:
+            writer.write_batch(batch)
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+        writer.close()
+        yield sink.drain()
+
+    # ------------------------------------------------------------------
+    # Record batches
+    # ------------------------------------------------------------------
+
+    async def record_batches(
+        self,
+        export_type: str,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        fields: list[str] | None = None,
+        filters: list[tuple[str, str, Any]] | None = None,
+        since_version: int | None = None,
+        batch_size: int = 50_000,
+    ) -> tuple[Any, AsyncIterator[Any]]:
+        """
+        Schema and lazily fetched record batches for a dataset.
+
+        Args:
+            export_type: Dataset name (see ``stream_export``)
+            start_date: Filter from this date (datasets with a date column)
+            end_date: Filter to this date
+            fields: Columns to include (None = all)
+            filters: Extra (column, operator, value) predicates, pushed
+                down to SQL. Columns need not be among ``fields``.
+            since_version: Only rows changed after this audit transaction
+                id (assignments only), plus those changed by transactions
+                issued up to ``INCREMENTAL_OVERLAP`` before it. Adds a
+                ``change_type`` column and tombstone rows for deleted
+                assignments.
+            batch_size: Rows per record batch
+
+        Returns:
+            (schema with ``snapshot_version`` metadata, async batch iterator)
+
+        Raises:
+            ValueError: For unknown datasets, columns or operators
+            ImportError: If pyarrow is not installed
+        """
+        _require_pyarrow()
+        name = "assignments" if export_type == "schedule" else export_type
+        dataset = DATASETS.get(name)
+        if dataset is None:
+            raise ValueError(f"Unknown export type: {export_type}")
+        if since_version is not None and dataset is not ASSIGNMENTS:
+            raise ValueError(
+                f"Incremental export is only supported for assignments, "
+                f"not {dataset.name}"
+            )
+
+        columns = (
+            [dataset.column(field) for field in fields]
+            if fields
+            else list(dataset.columns)
+        )
+        predicates = list(filters or [])
+        if start_date:
+            predicates.append(("date", ">=", start_date))
+        if end_date:
+            predicates.append(("date", "<=", end_date))
+
+        query = dataset.select_from(select(*(c.expression for c in columns)))
+        for name, op, value in predicates:
+            if op not in _OPERATORS:
+                raise ValueError(f"Unsupported filter operator: {op}")
+            expression = dataset.column(name).expression
+            query = query.where(_OPERATORS[op](expression, value))
+        query = query.order_by(*dataset.order_by)
+
+        metadata = {"dataset": dataset.name}
+        tombstones = None
+        if dataset is ASSIGNMENTS:
+            version = _assignment_versions()
+            snapshot = await self._scalar(select(func.max(version.c.transaction_id)))
+            metadata["snapshot_version"] = str(snapshot or 0)
+            if since_version is not None:
+                metadata["since_version"] = str(since_version)
+                changed = version.c.transaction_id > since_version
+                transactions = _audit_transactions()
+                issued_at = await self._scalar(
+                    select(transactions.c.issued_at).where(
+                        transactions.c.id == since_version
+                    )
+                )
+                if issued_at is not None:
+                    overlap = select(transactions.c.id).where(
+                        transactions.c.issued_at >= issued_at - INCREMENTAL_OVERLAP
+                    )
+                    changed = or_(changed, version.c.transaction_id.in_(overlap))
+                query = query.where(
+                    Assignment.id.in_(select(version.c.id).where(changed))
+                ).add_columns(literal("upsert"))
+                tombstones = (
+                    select(version.c.id)
+                    .where(
+                        changed,
+                        version.c.operation_type == _DELETE_OPERATION,
+                        version.c.id.not_in(select(Assignment.id)),
+                    )
+                    .distinct()
+                )
+                columns.append(ColumnSpec("change_type", None, CATEGORY_KIND))
+
+        kinds = [c.kind for c in columns]
+        schema = pa.schema(
+            [pa.field(c.name, _arrow_type(c.kind)) for c in columns],
+            metadata=metadata,
+        )
+
+        async def batches() -> AsyncIterator[Any]:
+            async for rows in self._partitions(query, batch_size):
+                yield _record_batch(schema, kinds, rows)
+            if tombstones is not None:
+                names = [c.name for c in columns]
+                async for ids in self._partitions(tombstones, batch_size):
+                    rows = [_tombstone(names, row[0]) for row in ids]
+                    yield _record_batch(schema, kinds, rows)
+
+        return schema, batches()
+
+    async def read_table(self, export_type: str, **kwargs: Any) -> Any:
+        """
+        Collect a dataset into an in-memory ``pyarrow.Table``.
+
+        Args:
+            export_type: Dataset name (see ``stream_export``)
+            **kwargs: Arguments accepted by ``record_batches``
+
+        Returns:
+            pyarrow Table (``to_pandas()`` gives categorical columns for
+            the dictionary-encoded ones)
+        """
+        schema, batches = await self.record_batches(export_type, **kwargs)
+        return pa.Table.from_batches([batch async for batch in batches], schema=schema)
+
+    # ------------------------------------------------------------------
+    # Helpers
+    # ------------------------------------------------------------------
+
+    async def _scalar(self, query: Any) -> Any:
+        if isinstance(self.db, AsyncSession):
+            return (await self.db.execute(query)).scalar()
+        return self.db.execute(query).scalar()
+
+    async def _partitions(self, query: Any, batch_size: int) -> AsyncIterator[Any]:
+        """Fetch rows in partitions from a server-side cursor."""
+        query = query.execution_options(yield_per=batch_size)
+        if isinstance(self.db, AsyncSession):
+            result = await self.db.stream(query)
+            async for rows in result.partitions():
+                yield rows
+        else:
+            for rows in self.db.execute(query).partitions():
+                yield rows
+
+    def _open_writer(self, sink: _ChunkSink, schema: Any, compress: bool) -> Any:
+        if self.file_format == "parquet":
+            return pq.ParquetWriter(
+                sink, schema, compression="zstd" if compress else "snappy"
+            )
+        options = pa.ipc.IpcWriteOptions(compression="zstd" if compress else None)
+        return pa.ipc.new_stream(sink, schema, options=options)
+
+    def get_content_type(self, compress: bool = False) -> str:
+        """
+        Get content type for the export (compression is internal).
+
+        Args:
+            compress: Whether output is compressed
+
+        Returns:
+            MIME type string
+        """
+        if self.file_format == "parquet":
+            return "application/vnd.apache.parquet"
+        return "application/vnd.apache.arrow.stream"
+
+    def get_filename(
+        self, base_name: str, compress: bool = False, timestamp: bool = True
+    ) -> str:
+        """
+        Generate filename for the export.
+
+        Args:
+            base_name: Base name for file (e.g., 'schedule', 'people')
+            compress: Whether output is compressed
+            timestamp: Whether to include timestamp in filename
+
+        Returns:
+            Filename string
+        """
+        filename = base_name
+
+        if timestamp:
+            ts = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
+            filename = f"{base_name}_{ts}"
+
+        if self.file_format == "parquet":
+            return f"{filename}.parquet"
+        return f"{filename}.arrows"
+
+
+def _assignment_versions() -> Any:
+    # Continuum builds version classes when mappers are configured
+    configure_mappers()
+    return version_class(Assignment).__table__
+
+
+def _audit_transactions() -> Any:
+    configure_mappers()
+    return transaction_class(Assignment).__table__
+
+
+def _tombstone(names: Sequence[str], assignment_id: Any) -> tuple[Any, ...]:
+    """Row for a deleted assignment: only its id and change type are set."""
+    values = {"assignment_id": assignment_id, "change_type": "delete"}
+    return tuple(values.get(name) for name in names)
+
+
+def iter_parquet_batches(source: Any, **kwargs: Any) -> Iterator[Any]:
+    """
+    Read record batches back from a Parquet export.
+
+    Args:
+        source: Path, file object or ``pyarrow.Buffer``
+        **kwargs: Passed to ``ParquetFile.iter_batches`` (columns, batch_size)
+
+    Yields:
+        Record batches
+    """
+    _require_pyarrow()
+    yield from pq.ParquetFile(source).iter_batches(**kwargs)
@@ -12,6 +12,7 @@ from typing import Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.services.export.arrow_exporter import ArrowExporter
 from app.services.export.csv_exporter import CSVExporter
 from app.services.export.json_exporter import JSONExporter
 from app.services.export.xml_exporter import XMLExporter
@@ -23,6 +24,8 @@ class ExportFormat(str, Enum):
     CSV = "csv"
     JSON = "json"
     XML = "xml"
+    PARQUET = "parquet"
+    ARROW = "arrow"
 
 
 class ExportType(str, Enum):
@@ -33,6 +36,7 @@ class ExportType(str, Enum):
     PEOPLE = "people"
     BLOCKS = "blocks"
     ANALYTICS = "analytics"
+    HALF_DAY_ASSIGNMENTS = "half_day_assignments"
 
 
 class ExportFactory:
@@ -52,21 +56,23 @@ class ExportFactory:
         """
         self.db = db
         self._exporters: dict[
-            ExportFormat, CSVExporter | JSONExporter | XMLExporter
+            ExportFormat, CSVExporter | JSONExporter | XMLExporter | ArrowExporter
         ] = {
             ExportFormat.CSV: CSVExporter(db),
             ExportFormat.JSON: JSONExporter(db),
             ExportFormat.XML: XMLExporter(db),
+            ExportFormat.PARQUET: ArrowExporter(db, file_format="parquet"),
+            ExportFormat.ARROW: ArrowExporter(db, file_format="arrow"),
         }
 
     def get_exporter(
         self, format: ExportFormat | str
-    ) -> CSVExporter | JSONExporter | XMLExporter:
+    ) -> CSVExporter | JSONExporter | XMLExporter | ArrowExporter:
         """
         Get exporter for specified format.
 
         Args:
-            format: Export format (csv, json, xml)
+            format: Export format (csv, json, xml, parquet, arrow)
 
         Returns:
             Exporter instance
@@ -126,6 +132,12 @@ class ExportFactory:
             return await exporter.export_blocks(**kwargs)
         elif export_type == ExportType.ANALYTICS:
             return await exporter.export_analytics(**kwargs)
+        elif export_type == ExportType.HALF_DAY_ASSIGNMENTS:
+            if not isinstance(exporter, ArrowExporter):
+                raise ValueError(
+                    "Half-day assignment exports require the parquet or arrow format"
+                )
+            return await exporter.export_half_day_assignments(**kwargs)
         else:
             raise ValueError(f"Unknown export type: {export_type}")
 
@@ -158,6 +170,12 @@ class ExportFactory:
 
         # Get appropriate exporter
         exporter = self.get_exporter(format)
+        if export_type == ExportType.HALF_DAY_ASSIGNMENTS and not isinstance(
+            exporter, ArrowExporter
+        ):
+            raise ValueError(
+                "Half-day assignment exports require the parquet or arrow format"
+            )
 
         # Stream export
         async for chunk in exporter.stream_export(export_type.value, **kwargs):
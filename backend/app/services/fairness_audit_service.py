@@ -9,18 +9,22 @@ per category and identify workload imbalances.
 """
 
 import logging
+from collections.abc import Sequence
 from dataclasses import dataclass
 from datetime import date
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.assignment import Assignment
+from app.db.rollups import (
+    PERSON_WORKLOAD,
+    person_workload_query,
+    rollups_fresh_async,
+)
 from app.models.block import Block
 from app.models.person import Person
-from app.models.rotation_template import RotationTemplate
 from app.scheduling.constraints.integrated_workload import (
     ADMIN_WEIGHT,
     ACADEMIC_WEIGHT,
@@ -150,36 +154,29 @@ class FairnessAuditService:
         if not eligible_faculty:
             return self._empty_report(start_date, end_date)
 
-            # Get blocks in date range
-        block_query = select(Block).where(
-            Block.date >= start_date,
-            Block.date <= end_date,
+        # Reports over a range with no blocks are empty
+        block_count = await self.db.execute(
+            select(func.count(Block.id)).where(
+                Block.date >= start_date,
+                Block.date <= end_date,
+            )
         )
-        block_result = await self.db.execute(block_query)
-        blocks = block_result.scalars().all()
-        block_ids = [b.id for b in blocks]
-
-        if not block_ids:
+        if not block_count.scalar():
             return self._empty_report(start_date, end_date)
 
-            # Get rotation templates for classification
-        template_query = select(RotationTemplate)
-        template_result = await self.db.execute(template_query)
-        templates = {t.id: t for t in template_result.scalars().all()}
-
-        # Get assignments for eligible faculty in date range
-        faculty_ids = [f.id for f in eligible_faculty]
-        assignment_query = select(Assignment).where(
-            Assignment.person_id.in_(faculty_ids),
-            Assignment.block_id.in_(block_ids),
+        # Per-day category counts come from the person workload rollup
+        # (or the raw assignments while it is stale)
+        fresh = await rollups_fresh_async(self.db, (PERSON_WORKLOAD,))
+        workload_query = person_workload_query(
+            start_date,
+            end_date,
+            [f.id for f in eligible_faculty],
+            from_rollup=fresh,
         )
-        assignment_result = await self.db.execute(assignment_query)
-        assignments = assignment_result.scalars().all()
+        days = (await self.db.execute(workload_query)).all()
 
         # Calculate workload per faculty
-        workloads = self._calculate_workloads(
-            eligible_faculty, assignments, templates, blocks
-        )
+        workloads = self._calculate_workloads(eligible_faculty, days)
 
         # Calculate statistics
         report = self._build_report(start_date, end_date, workloads)
@@ -201,12 +198,9 @@ class FairnessAuditService:
     def _calculate_workloads(
         self,
         faculty: list[Person],
-        assignments: list[Assignment],
-        templates: dict[UUID, RotationTemplate],
-        blocks: list[Block],
+        days: Sequence[Row],
     ) -> list[FacultyWorkload]:
-        """Calculate workload for each faculty member."""
-        block_by_id = {b.id: b for b in blocks}
+        """Calculate workload for each faculty member from daily category counts."""
         workloads: dict[UUID, FacultyWorkload] = {}
         fmit_weeks_seen: dict[UUID, set] = {}
 
@@ -218,54 +212,22 @@ class FairnessAuditService:
             )
             fmit_weeks_seen[f.id] = set()
 
-            # Process assignments
-        for a in assignments:
-            if a.person_id not in workloads:
+        for day in days:
+            if day.person_id not in workloads:
                 continue
 
-            workload = workloads[a.person_id]
-            template = (
-                templates.get(a.rotation_template_id)
-                if a.rotation_template_id
-                else None
-            )
-            block = block_by_id.get(a.block_id)
-
-            # Count call
-            if hasattr(a, "call_type") and a.call_type == "overnight":
-                workload.call_count += 1
-
-            if template:
-                template_name = (template.name or "").upper()
-                rotation_type = (template.rotation_type or "").lower()
-
-                # Count FMIT (by week)
-                if "FMIT" in template_name:
-                    if block:
-                        iso_week = block.date.isocalendar()[:2]
-                        if iso_week not in fmit_weeks_seen[a.person_id]:
-                            fmit_weeks_seen[a.person_id].add(iso_week)
-                            workload.fmit_weeks += 1
-
-                            # Count clinic
-                if rotation_type == "outpatient":
-                    workload.clinic_halfdays += 1
-
-                    # Count admin
-                if (
-                    "GME" in template_name
-                    or "DFM" in template_name
-                    or rotation_type in ("admin", "gme", "dfm")
-                ):
-                    workload.admin_halfdays += 1
-
-                    # Count academic
-                if (
-                    "LEC" in template_name
-                    or "ADV" in template_name
-                    or rotation_type in ("academic", "lecture", "advising")
-                ):
-                    workload.academic_halfdays += 1
+            workload = workloads[day.person_id]
+
+            # Count FMIT (by week)
+            if day.fmit_count:
+                fmit_weeks_seen[day.person_id].add(day.date.isocalendar()[:2])
+
+            workload.clinic_halfdays += day.clinic_count
+            workload.admin_halfdays += day.admin_count
+            workload.academic_halfdays += day.academic_count
+
+        for person_id, weeks in fmit_weeks_seen.items():
+            workloads[person_id].fmit_weeks = len(weeks)
 
         return list(workloads.values())
 
@@ -9,6 +9,11 @@ import plotly.graph_objects as go
 import plotly.io as pio
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.rollups import (
+    daily_assignment_counts,
+    person_day_counts,
+    rotation_day_counts,
+)
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.person import Person
@@ -158,10 +163,66 @@ class HeatmapService:
             .all()
         )
 
+    def _get_assignment_counts(
+        self,
+        db: Session,
+        start_date: date,
+        end_date: date,
+        group_by: str,
+        person_ids: list[UUID] | None = None,
+        rotation_ids: list[UUID] | None = None,
+    ) -> tuple[dict[tuple[Any, date], int], int]:
+        """
+        Count assignments per (entity, date) from the schedule rollups.
+
+        The entity is the person ID for 'person' grouping, the rotation
+        template ID for 'rotation' grouping and None for 'daily'/'weekly'.
+        Filtering by people and rotations at once needs assignment-level
+        detail the rollups do not keep, so that case aggregates raw rows.
+
+        Returns:
+            Tuple of ((entity, date) -> count, total assignments in range)
+        """
+        by_date = group_by in ("daily", "weekly")
+        if person_ids and rotation_ids:
+            counts: dict[tuple[Any, date], int] = {}
+            for assignment in self._get_assignments_in_range(
+                db, start_date, end_date, person_ids, rotation_ids
+            ):
+                if group_by == "person":
+                    entity = assignment.person_id
+                elif group_by == "rotation":
+                    entity = assignment.rotation_template_id
+                else:
+                    entity = None
+                key = (entity, assignment.block.date)
+                counts[key] = counts.get(key, 0) + 1
+            return counts, sum(counts.values())
+
+        if group_by == "person" or (by_date and person_ids):
+            counts = person_day_counts(db, start_date, end_date, person_ids)
+        elif group_by == "rotation" or (by_date and rotation_ids):
+            counts = rotation_day_counts(db, start_date, end_date, rotation_ids)
+        else:
+            daily = daily_assignment_counts(db, start_date, end_date)
+            counts = {(None, day): count for day, count in daily.items() if count}
+        total = sum(counts.values())
+
+        if by_date:
+            collapsed: dict[tuple[Any, date], int] = {}
+            for (_, day), count in counts.items():
+                collapsed[(None, day)] = collapsed.get((None, day), 0) + count
+            counts = collapsed
+        elif group_by == "rotation" and not rotation_ids:
+            # Assignments without a rotation template still count toward the
+            # total, matching an unfiltered assignment query
+            total = sum(daily_assignment_counts(db, start_date, end_date).values())
+        return counts, total
+
     def _generate_daily_heatmap(
         self,
         db: Session,
-        assignments: list[Assignment],
+        daily_counts: dict[date, int],
         start_date: date,
         end_date: date,
         include_fmit: bool = True,
@@ -170,15 +231,8 @@ class HeatmapService:
         dates = self._get_date_range(start_date, end_date)
         x_labels = [d.strftime("%Y-%m-%d") for d in dates]
 
-        # Count assignments per day
-        daily_counts = dict.fromkeys(dates, 0)
-        for assignment in assignments:
-            block_date = assignment.block.date
-            if block_date in daily_counts:
-                daily_counts[block_date] += 1
-
         # Create single row with daily counts
-        z_values = [[float(daily_counts[d]) for d in dates]]
+        z_values = [[float(daily_counts.get(d, 0)) for d in dates]]
         y_labels = ["Total Assignments"]
 
         heatmap_data = HeatmapData(
@@ -190,7 +244,7 @@ class HeatmapService:
         )
 
         metadata: dict[str, Any] = {
-            "total_assignments": len(assignments),
+            "total_assignments": sum(daily_counts.values()),
             "date_range_days": len(dates),
             "grouping_type": "daily",
         }
@@ -208,7 +262,7 @@ class HeatmapService:
     def _generate_weekly_heatmap(
         self,
         db: Session,
-        assignments: list[Assignment],
+        daily_counts: dict[date, int],
         start_date: date,
         end_date: date,
         include_fmit: bool = True,
@@ -225,12 +279,11 @@ class HeatmapService:
 
         # Count assignments per week
         weekly_counts = dict.fromkeys(weeks, 0)
-        for assignment in assignments:
-            block_date = assignment.block.date
-            # Find the week this assignment belongs to
+        for block_date, count in daily_counts.items():
+            # Find the week this date belongs to
             week_start = block_date - timedelta(days=block_date.weekday())
             if week_start in weekly_counts:
-                weekly_counts[week_start] += 1
+                weekly_counts[week_start] += count
 
         # Create single row with weekly counts
         z_values = [[float(weekly_counts[w]) for w in weeks]]
@@ -245,7 +298,7 @@ class HeatmapService:
         )
 
         metadata: dict[str, Any] = {
-            "total_assignments": len(assignments),
+            "total_assignments": sum(daily_counts.values()),
             "weeks_count": len(weeks),
             "grouping_type": "weekly",
         }
@@ -285,44 +338,32 @@ class HeatmapService:
         Returns:
             HeatmapResponse with data and metadata
         """
-        # Get assignments
-        assignments = self._get_assignments_in_range(
-            db, start_date, end_date, person_ids, rotation_ids
+        assignment_map, total_assignments = self._get_assignment_counts(
+            db, start_date, end_date, group_by, person_ids, rotation_ids
         )
 
         # Handle daily and weekly grouping (group by date instead of entity)
-        if group_by == "daily":
-            return self._generate_daily_heatmap(
-                db, assignments, start_date, end_date, include_fmit
-            )
-        elif group_by == "weekly":
+        if group_by in ("daily", "weekly"):
+            daily_counts = {day: count for (_, day), count in assignment_map.items()}
+            if group_by == "daily":
+                return self._generate_daily_heatmap(
+                    db, daily_counts, start_date, end_date, include_fmit
+                )
             return self._generate_weekly_heatmap(
-                db, assignments, start_date, end_date, include_fmit
+                db, daily_counts, start_date, end_date, include_fmit
             )
 
         # Original person/rotation grouping logic
         dates = self._get_date_range(start_date, end_date)
         x_labels = [d.strftime("%Y-%m-%d") for d in dates]
 
-        # Build assignment map: (person_id or rotation_id, date) -> count
-        assignment_map: dict[tuple[Any, date], int] = {}
-
-        for assignment in assignments:
-            block_date = assignment.block.date
-            if group_by == "person":
-                key = (assignment.person_id, block_date)
-            else:  # group_by == "rotation"
-                key = (assignment.rotation_template_id, block_date)
-
-            assignment_map[key] = assignment_map.get(key, 0) + 1
-
         # Get unique entities (people or rotations)
         if group_by == "person":
             if person_ids:
                 entities = db.query(Person).filter(Person.id.in_(person_ids)).all()
             else:
                 # Get all people with assignments in range
-                entity_ids = {a.person_id for a in assignments}
+                entity_ids = {entity for entity, _ in assignment_map}
                 entities = (
                     db.query(Person).filter(Person.id.in_(entity_ids)).all()
                     if entity_ids
@@ -339,11 +380,7 @@ class HeatmapService:
                 )
             else:
                 # Get all rotation templates with assignments in range
-                entity_ids = {
-                    a.rotation_template_id
-                    for a in assignments
-                    if a.rotation_template_id
-                }
+                entity_ids = {entity for entity, _ in assignment_map if entity}
                 entities = (
                     db.query(RotationTemplate)
                     .filter(RotationTemplate.id.in_(entity_ids))
@@ -365,7 +402,7 @@ class HeatmapService:
 
         # Include FMIT swap data if requested
         metadata: dict[str, Any] = {
-            "total_assignments": len(assignments),
+            "total_assignments": total_assignments,
             "date_range_days": len(dates),
             "entities_count": len(y_labels),
         }
@@ -412,16 +449,8 @@ class HeatmapService:
         y_labels = [r.name for r in rotations]
         rotation_ids = [r.id for r in rotations]
 
-        # Get all blocks and assignments in range
-        self._get_blocks_in_range(db, start_date, end_date)
-        assignments = self._get_assignments_in_range(db, start_date, end_date)
-
         # Build coverage map: (rotation_id, date) -> assignment count
-        coverage_map: dict[tuple[UUID, date], int] = {}
-        for assignment in assignments:
-            if assignment.rotation_template_id:
-                key = (assignment.rotation_template_id, assignment.block.date)
-                coverage_map[key] = coverage_map.get(key, 0) + 1
+        coverage_map = rotation_day_counts(db, start_date, end_date)
 
         # Build z_values matrix (coverage level: 0 = no coverage, 1+ = covered)
         # Normalize to 0-1 scale for visualization
@@ -509,16 +538,8 @@ class HeatmapService:
         people = db.query(Person).filter(Person.id.in_(person_ids)).all()
         y_labels = [p.name for p in people]
 
-        # Get assignments for these people
-        assignments = self._get_assignments_in_range(
-            db, start_date, end_date, person_ids=person_ids
-        )
-
         # Build workload map: (person_id, date) -> block count
-        workload_map: dict[tuple[UUID, date], int] = {}
-        for assignment in assignments:
-            key = (assignment.person_id, assignment.block.date)
-            workload_map[key] = workload_map.get(key, 0) + 1
+        workload_map = person_day_counts(db, start_date, end_date, person_ids)
 
         # Build z_values matrix
         z_values = []
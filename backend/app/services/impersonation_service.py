@@ -23,8 +23,8 @@ from sqlalchemy.orm import Session
 
 from app.core.config import get_settings
 from app.core.security import ALGORITHM, blacklist_token
+from app.core.token_revocation import get_revoked_token_cache
 from app.models.activity_log import ActivityActionType, ActivityLog
-from app.models.token_blacklist import TokenBlacklist
 from app.models.user import User
 from app.schemas.impersonation import (
     ImpersonateResponse,
@@ -212,7 +212,7 @@ class ImpersonationService:
                 raise ImpersonationTokenError("Invalid token structure")
 
             # Check if already blacklisted
-            if TokenBlacklist.is_blacklisted(self.db, jti):
+            if get_revoked_token_cache().is_revoked(self.db, jti):
                 logger.warning(
                     f"Attempted to end already-ended impersonation: jti={jti}"
                 )
@@ -273,7 +273,7 @@ class ImpersonationService:
             target_user_id = payload.get("target_user_id")
 
             # Check if token is blacklisted
-            if jti and TokenBlacklist.is_blacklisted(self.db, jti):
+            if jti and get_revoked_token_cache().is_revoked(self.db, jti):
                 return ImpersonationStatus(is_impersonating=False)
 
             # Get user details
@@ -332,7 +332,7 @@ class ImpersonationService:
                 return None
 
             # Check if token is blacklisted
-            if TokenBlacklist.is_blacklisted(self.db, jti):
+            if get_revoked_token_cache().is_revoked(self.db, jti):
                 logger.debug(f"Impersonation token is blacklisted: jti={jti}")
                 return None
 
@@ -4,11 +4,16 @@ Provides unified interface for local (Ollama) and cloud (Anthropic) LLM provider
 with intelligent routing, fallback chains, and circuit breaker patterns.
 """
 
+import asyncio
+import hashlib
 import json
 import logging
 import os
 import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, UTC
 from typing import Any, AsyncGenerator, Optional
 
@@ -22,6 +27,7 @@ from app.schemas.llm import (
     LLMRouterStats,
     LLMUsage,
     ProviderHealth,
+    ProviderQueueStats,
     StreamChunk,
     TaskClassification,
     ToolCall,
@@ -42,6 +48,10 @@ class ProviderUnavailableError(LLMProviderError):
     pass
 
 
+class _LeaderCancelled(Exception):
+    """The request that deduplicated callers were waiting on was cancelled."""
+
+
 class LLMProvider(ABC):
     """Abstract base class for LLM providers."""
 
@@ -1042,6 +1052,207 @@ class CircuitBreaker:
             )
 
 
+def _normalize_text(text: str) -> str:
+    """Collapse whitespace runs so formatting-only differences share a key."""
+    return " ".join(text.split())
+
+
+class ResponseCache:
+    """
+    Exact-match response cache with TTL expiry and LRU eviction.
+
+    Keys cover only the request content (normalized prompt and system
+    prompt, model, sampling parameters and tools), never the provider, so a
+    request answered by any provider in the fallback chain is reused.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600.0,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize response cache.
+
+        Args:
+            ttl_seconds: Seconds an entry stays valid
+            max_entries: Entries kept before least recently used are evicted
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, LLMResponse]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def make_key(request: LLMRequest) -> str:
+        """
+        Provider-independent cache key for a request.
+
+        Args:
+            request: LLM request
+
+        Returns:
+            Hex digest identifying the request content
+        """
+        tools = sorted(
+            json.dumps(tool, sort_keys=True, default=str)
+            for tool in request.tools or []
+        )
+        payload = {
+            "prompt": _normalize_text(request.prompt),
+            "system": _normalize_text(request.system) if request.system else None,
+            "model": request.model or None,
+            "max_tokens": request.max_tokens,
+            "temperature": round(request.temperature, 4),
+            "tools": tools,
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode()).hexdigest()
+
+    def get(self, key: str) -> LLMResponse | None:
+        """Return a live entry and mark it recently used, or None."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= self._clock():
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, response: LLMResponse) -> None:
+        """Store a response, evicting least recently used entries over the limit."""
+        self._entries[key] = (self._clock() + self.ttl_seconds, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries (counters are kept)."""
+        self._entries.clear()
+
+
+class _ProviderSlots:
+    """Semaphore and queue counters for one provider."""
+
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.semaphore = asyncio.Semaphore(limit)
+        self.in_flight = 0
+        self.waiting = 0
+        self.peak_waiting = 0
+        self.queued_total = 0
+        self.timeouts = 0
+        self.wait_ms_total = 0.0
+
+
+class ConcurrencyLimiter:
+    """
+    Per-provider concurrency limits with bounded queue waits.
+
+    Requests beyond a provider's limit queue on its semaphore; a request
+    still queued after ``queue_timeout`` seconds fails with
+    ProviderUnavailableError so the router can fall back.
+    """
+
+    # Local servers serve one or two generations at a time; the API scales out
+    DEFAULT_LIMITS = {"mlx": 1, "ollama": 2, "anthropic": 8}
+
+    def __init__(
+        self,
+        limits: dict[str, int] | None = None,
+        default_limit: int = 4,
+        queue_timeout: float = 30.0,
+    ) -> None:
+        """
+        Initialize concurrency limiter.
+
+        Args:
+            limits: Concurrent requests allowed per provider name
+            default_limit: Limit for providers not in ``limits``
+            queue_timeout: Seconds a request may wait for a slot
+        """
+        self.limits = {**self.DEFAULT_LIMITS, **(limits or {})}
+        self.default_limit = default_limit
+        self.queue_timeout = queue_timeout
+        self._slots: dict[str, _ProviderSlots] = {}
+
+    def _get_slots(self, provider: str) -> _ProviderSlots:
+        if provider not in self._slots:
+            limit = self.limits.get(provider, self.default_limit)
+            self._slots[provider] = _ProviderSlots(max(1, limit))
+        return self._slots[provider]
+
+    @asynccontextmanager
+    async def acquire(self, provider: str) -> AsyncIterator[None]:
+        """
+        Hold one of the provider's slots, queueing if all are busy.
+
+        Args:
+            provider: Provider name
+
+        Raises:
+            ProviderUnavailableError: If no slot frees up within queue_timeout
+        """
+        slots = self._get_slots(provider)
+        if slots.semaphore.locked():
+            slots.waiting += 1
+            slots.queued_total += 1
+            slots.peak_waiting = max(slots.peak_waiting, slots.waiting)
+            started = time.perf_counter()
+            try:
+                await asyncio.wait_for(
+                    slots.semaphore.acquire(), timeout=self.queue_timeout
+                )
+            except TimeoutError:
+                slots.timeouts += 1
+                raise ProviderUnavailableError(
+                    f"Timed out after {self.queue_timeout}s queued for {provider}"
+                )
+            finally:
+                slots.waiting -= 1
+                slots.wait_ms_total += (time.perf_counter() - started) * 1000
+        else:
+            await slots.semaphore.acquire()
+
+        slots.in_flight += 1
+        try:
+            yield
+        finally:
+            slots.in_flight -= 1
+            slots.semaphore.release()
+
+    def get_stats(self) -> dict[str, ProviderQueueStats]:
+        """Queue statistics for every provider that has been used."""
+        return {
+            name: ProviderQueueStats(
+                max_concurrent=slots.limit,
+                in_flight=slots.in_flight,
+                waiting=slots.waiting,
+                peak_waiting=slots.peak_waiting,
+                queued_total=slots.queued_total,
+                timeouts=slots.timeouts,
+                avg_wait_ms=(
+                    slots.wait_ms_total / slots.queued_total
+                    if slots.queued_total
+                    else 0.0
+                ),
+            )
+            for name, slots in self._slots.items()
+        }
+
+
 class LLMRouter:
     """
     Multi-provider LLM router with intelligent routing and fallback.
@@ -1051,6 +1262,8 @@ class LLMRouter:
     - Intelligent task-based routing
     - Fallback chain on provider failure
     - Circuit breaker pattern
+    - Exact-match response cache with single-flight deduplication
+    - Per-provider concurrency limits with queue timeouts
     - Health monitoring
     - Usage statistics
     """
@@ -1060,6 +1273,11 @@ class LLMRouter:
         default_provider: str = "ollama",
         enable_fallback: bool = True,
         airgap_mode: bool = False,
+        enable_cache: bool = True,
+        cache_ttl_seconds: float = 3600.0,
+        cache_max_entries: int = 1024,
+        provider_concurrency: dict[str, int] | None = None,
+        queue_timeout: float = 30.0,
     ) -> None:
         """
         Initialize LLM Router.
@@ -1068,10 +1286,16 @@ class LLMRouter:
             default_provider: Default provider to use ("ollama", "anthropic")
             enable_fallback: Enable fallback to other providers on failure
             airgap_mode: Disable all cloud providers (local only)
+            enable_cache: Reuse responses for identical requests
+            cache_ttl_seconds: Seconds a cached response stays valid
+            cache_max_entries: Cached responses kept before LRU eviction
+            provider_concurrency: Concurrent requests allowed per provider
+            queue_timeout: Seconds a request may queue for a provider slot
         """
         self.default_provider = default_provider
         self.enable_fallback = enable_fallback
         self.airgap_mode = airgap_mode
+        self.enable_cache = enable_cache
 
         # Initialize providers (local-first: MLX → Ollama → Anthropic)
         self.providers: dict[str, LLMProvider] = {
@@ -1091,6 +1315,15 @@ class LLMRouter:
         # Circuit breaker
         self.circuit_breaker = CircuitBreaker()
 
+        # Response cache, in-flight requests by cache key, provider slots
+        self.cache = ResponseCache(
+            ttl_seconds=cache_ttl_seconds, max_entries=cache_max_entries
+        )
+        self._inflight: dict[str, asyncio.Future[LLMResponse]] = {}
+        self.limiter = ConcurrencyLimiter(
+            limits=provider_concurrency, queue_timeout=queue_timeout
+        )
+
         # Statistics
         self.stats = LLMRouterStats()
 
@@ -1105,6 +1338,72 @@ class LLMRouter:
         """
         Generate text with automatic provider routing.
 
+        Identical requests are answered from the response cache, and
+        concurrent identical requests share a single provider call. Set
+        ``request.metadata["cache"] = False`` to bypass both.
+
+        Args:
+            request: LLM request with prompt and parameters
+
+        Returns:
+            LLMResponse from selected provider
+
+        Raises:
+            LLMProviderError: If all providers fail
+        """
+        if not self.enable_cache or request.metadata.get("cache") is False:
+            return await self._route(request)
+
+        key = ResponseCache.make_key(request)
+        while True:
+            cached = self.cache.get(key)
+            if cached is not None:
+                self.stats.total_requests += 1
+                return cached.model_copy(
+                    update={"metadata": {**cached.metadata, "cache_hit": True}}
+                )
+
+            pending = self._inflight.get(key)
+            if pending is None:
+                return await self._lead(key, request)
+            try:
+                response = await asyncio.shield(pending)
+            except _LeaderCancelled:
+                continue  # Retry, possibly as the new leader
+            self.stats.deduplicated_requests += 1
+            return response.model_copy(
+                update={"metadata": {**response.metadata, "deduplicated": True}}
+            )
+
+    async def _lead(self, key: str, request: LLMRequest) -> LLMResponse:
+        """Make the provider call that concurrent identical requests share."""
+        future: asyncio.Future[LLMResponse] = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._inflight[key] = future
+        try:
+            response = await self._route(request)
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; waiters retry without it
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Retrieved here in case nobody joined
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # Retrieved here in case nobody joined
+            raise
+        else:
+            if response.content or response.tool_calls:
+                self.cache.put(key, response)
+            future.set_result(response)
+            return response
+        finally:
+            del self._inflight[key]
+
+    async def _route(self, request: LLMRequest) -> LLMResponse:
+        """
+        Route one request to a provider, falling back on failure.
+
         Args:
             request: LLM request with prompt and parameters
 
@@ -1170,8 +1469,9 @@ class LLMRouter:
         Generate with specific provider.
 
         Internal method that handles circuit breaker checks, provider
-        selection, and appropriate method dispatch (with/without tools).
-        Updates circuit breaker state based on success/failure.
+        selection, concurrency slots, and appropriate method dispatch
+        (with/without tools). Updates circuit breaker state based on
+        success/failure.
 
         Args:
             provider_name: Name of provider to use
@@ -1186,7 +1486,8 @@ class LLMRouter:
             LLMResponse from the provider
 
         Raises:
-            ProviderUnavailableError: If circuit breaker is open or provider unavailable
+            ProviderUnavailableError: If circuit breaker is open, provider
+                unavailable, or no concurrency slot frees up in time
             LLMProviderError: If provider is unknown
             Exception: Any provider-specific errors (updates circuit breaker)
         """
@@ -1201,30 +1502,32 @@ class LLMRouter:
         if not provider.is_available():
             raise ProviderUnavailableError(f"Provider {provider_name} unavailable")
 
-        try:
-            # Choose method based on tools
-            if tools:
-                response = await provider.generate_with_tools(
-                    prompt=prompt,
-                    tools=tools,
-                    system=system,
-                    model=model,
-                )
-            else:
-                response = await provider.generate(
-                    prompt=prompt,
-                    system=system,
-                    model=model,
-                    max_tokens=max_tokens,
-                    temperature=temperature,
-                )
+        # Queue timeouts mean overload, not failure, so they skip the breaker
+        async with self.limiter.acquire(provider_name):
+            try:
+                # Choose method based on tools
+                if tools:
+                    response = await provider.generate_with_tools(
+                        prompt=prompt,
+                        tools=tools,
+                        system=system,
+                        model=model,
+                    )
+                else:
+                    response = await provider.generate(
+                        prompt=prompt,
+                        system=system,
+                        model=model,
+                        max_tokens=max_tokens,
+                        temperature=temperature,
+                    )
 
-            self.circuit_breaker.record_success(provider_name)
-            return response
+                self.circuit_breaker.record_success(provider_name)
+                return response
 
-        except Exception as e:
-            self.circuit_breaker.record_failure(provider_name)
-            raise
+            except Exception as e:
+                self.circuit_breaker.record_failure(provider_name)
+                raise
 
     async def _fallback_generate(
         self, request: LLMRequest, failed_provider: str
@@ -1405,11 +1708,17 @@ class LLMRouter:
         Get router statistics.
 
         Returns cumulative statistics including total requests, requests
-        per provider, error counts, and fallback usage.
+        per provider, error counts, fallback usage, cache counters, and
+        per-provider queue state.
 
         Returns:
             LLMRouterStats with usage metrics
         """
+        self.stats.cache_hits = self.cache.hits
+        self.stats.cache_misses = self.cache.misses
+        self.stats.cache_evictions = self.cache.evictions
+        self.stats.cache_size = len(self.cache)
+        self.stats.queues = self.limiter.get_stats()
         return self.stats
 
     def get_circuit_breaker_states(self) -> dict[str, CircuitBreakerState]:
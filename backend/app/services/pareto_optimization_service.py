@@ -7,7 +7,6 @@ from uuid import UUID
 import numpy as np
 from pymoo.algorithms.moo.nsga2 import NSGA2
 from pymoo.core.problem import Problem
-from pymoo.indicators.hv import HV
 from pymoo.operators.crossover.sbx import SBX
 from pymoo.operators.mutation.pm import PM
 from pymoo.operators.sampling.rnd import FloatRandomSampling
@@ -17,6 +16,7 @@ from sqlalchemy.orm import Session
 
 from app.models.block import Block
 from app.models.person import Person
+from app.multi_objective import pareto
 from app.repositories.assignment import AssignmentRepository
 from app.repositories.block import BlockRepository
 from app.repositories.person import PersonRepository
@@ -659,40 +659,17 @@ class ParetoOptimizationService:
         if not solutions:
             return []
 
-        n_solutions = len(solutions)
-        is_dominated = [False] * n_solutions
-
-        # Extract objective values
+        # Objective values are stored in minimization form
         objective_names = list(solutions[0].objective_values.keys())
-        obj_matrix = np.zeros((n_solutions, len(objective_names)))
-
-        for i, sol in enumerate(solutions):
-            for j, obj_name in enumerate(objective_names):
-                obj_matrix[i, j] = sol.objective_values[obj_name]
-
-        # Check dominance
-        for i in range(n_solutions):
-            for j in range(n_solutions):
-                if i == j:
-                    continue
-
-                # Check if j dominates i (all objectives better or equal, at least one strictly better)
-                dominates = True
-                strictly_better = False
-
-                for k in range(len(objective_names)):
-                    if obj_matrix[j, k] < obj_matrix[i, k]:  # Assuming minimization
-                        strictly_better = True
-                    elif obj_matrix[j, k] > obj_matrix[i, k]:
-                        dominates = False
-                        break
-
-                if dominates and strictly_better:
-                    is_dominated[i] = True
-                    break
+        obj_matrix = np.array(
+            [
+                [sol.objective_values[name] for name in objective_names]
+                for sol in solutions
+            ],
+            dtype=float,
+        )
 
-        # Return non-dominated indices
-        return [i for i in range(n_solutions) if not is_dominated[i]]
+        return np.flatnonzero(pareto.non_dominated_mask(obj_matrix)).tolist()
 
     def _calculate_hypervolume(
         self, solutions: list[ParetoSolution], frontier_indices: list[int]
@@ -718,8 +695,7 @@ class ParetoOptimizationService:
                 np.max(F, axis=0) + 1.0
             )  # Reference point slightly worse than worst
 
-            hv = HV(ref_point=ref_point)
-            return float(hv(F))
+            return pareto.hypervolume(F, ref_point)
 
         except Exception:
             return None
@@ -1,6 +1,7 @@
 """Preload sub-package — shared logic for sync and async preload services."""
 
 from .activity_cache import ActivityCache
+from .batch import LoaderTimer, PreloadBatch, PreloadLoaderStats, PreloadRunStats
 from .constants import (
     CLINIC_PATTERN_CODES,
     INTERN_CONTINUITY_EXEMPT_ROTATIONS,
@@ -32,8 +33,12 @@ __all__ = [
     "INTERN_CONTINUITY_EXEMPT_ROTATIONS",
     "KAP_ROTATIONS",
     "LEC_EXEMPT_ROTATIONS",
+    "LoaderTimer",
     "NIGHT_FLOAT_ROTATIONS",
     "OFFSITE_ROTATIONS",
+    "PreloadBatch",
+    "PreloadLoaderStats",
+    "PreloadRunStats",
     "ROTATION_ALIASES",
     "ROTATION_TO_ACTIVITY",
     "SATURDAY_OFF_ROTATIONS",
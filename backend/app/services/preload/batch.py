@@ -0,0 +1,356 @@
+"""In-memory preload batch shared by the sync and async preload services.
+
+A batch reads the existing half-day slots for a date range once into an
+occupancy index. Loaders propose preloads against that index, precedence is
+resolved in memory, and the result is written with two bulk statements: an
+``INSERT ... ON CONFLICT DO NOTHING`` for new slots and a primary-key bulk
+``UPDATE`` for overwritten ones.
+
+The batch does no I/O itself; the services execute the statements it builds
+on their own (sync or async) sessions.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Collection, Iterable, Iterator
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import Select, select, update
+
+from app.core.exceptions import ActivityNotFoundError
+from app.db.batch_operations import _upsert_insert
+from app.models.activity import Activity
+from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
+from app.utils.fmc_capacity import activity_counts_toward_fmc_capacity
+
+# Rows per bulk INSERT/UPDATE statement
+WRITE_BATCH_SIZE = 1000
+
+SlotKey = tuple[UUID, date, str]
+
+
+@dataclass
+class _ActivityTraits:
+    """What precedence resolution needs to know about an activity."""
+
+    is_time_off: bool
+    counts_toward_fmc_capacity: bool
+
+
+@dataclass
+class _Slot:
+    """Index entry for one (person, date, time_of_day) slot."""
+
+    id: UUID | None
+    source: str
+    activity_id: UUID | None
+    counts_toward_fmc_capacity: bool | None
+    changed: bool = False
+
+
+@dataclass
+class PreloadLoaderStats:
+    """Cost of one preload loader."""
+
+    name: str
+    seconds: float = 0.0
+    rows: int = 0
+    candidates: int = 0
+
+
+@dataclass
+class PreloadRunStats:
+    """Per-loader cost of preloading one block."""
+
+    block_number: int | None = None
+    academic_year: int | None = None
+    loaders: list[PreloadLoaderStats] = field(default_factory=list)
+    index_seconds: float = 0.0
+    write_seconds: float = 0.0
+    slots_indexed: int = 0
+    inserted: int = 0
+    updated: int = 0
+
+    @property
+    def total_seconds(self) -> float:
+        return (
+            self.index_seconds
+            + self.write_seconds
+            + sum(loader.seconds for loader in self.loaders)
+        )
+
+    def summary(self) -> str:
+        """One-line breakdown for logs."""
+        loaders = ", ".join(
+            f"{loader.name}={loader.rows}/{loader.candidates} "
+            f"in {loader.seconds * 1000:.0f}ms"
+            for loader in self.loaders
+        )
+        return (
+            f"Preload Block {self.block_number} ({self.academic_year}): "
+            f"{self.total_seconds:.2f}s, indexed {self.slots_indexed} slots in "
+            f"{self.index_seconds * 1000:.0f}ms, wrote {self.inserted} new + "
+            f"{self.updated} updated in {self.write_seconds * 1000:.0f}ms; "
+            f"loaders (rows/candidates): {loaders}"
+        )
+
+
+class PreloadBatch:
+    """
+    Occupancy index for preloading a date range.
+
+    Precedence when a slot is already taken:
+    - template/solver slots are overwritten (preloads are locked)
+    - preload slots without an activity take the new activity
+    - time-off preloads replace non-time-off preloads
+    - matching preloads refresh a stale FMC capacity flag
+    - anything else (including manual slots) is kept
+    """
+
+    def __init__(
+        self,
+        start_date: date,
+        end_date: date,
+        person_ids: Collection[UUID] | None = None,
+        context: str = "preload",
+    ) -> None:
+        self.start_date = start_date
+        self.end_date = end_date
+        self.person_ids = set(person_ids) if person_ids is not None else None
+        self.context = context
+        self.candidates = 0
+        self._slots: dict[SlotKey, _Slot] = {}
+        self._activities: dict[UUID, _ActivityTraits] = {}
+
+    # ------------------------------------------------------------------
+    # Index
+    # ------------------------------------------------------------------
+
+    def slot_query(self) -> Select:
+        """Existing half-day slots in the batch range."""
+        stmt = select(
+            HalfDayAssignment.id,
+            HalfDayAssignment.person_id,
+            HalfDayAssignment.date,
+            HalfDayAssignment.time_of_day,
+            HalfDayAssignment.source,
+            HalfDayAssignment.activity_id,
+            HalfDayAssignment.counts_toward_fmc_capacity,
+        ).where(
+            HalfDayAssignment.date >= self.start_date,
+            HalfDayAssignment.date <= self.end_date,
+        )
+        if self.person_ids is not None:
+            stmt = stmt.where(HalfDayAssignment.person_id.in_(self.person_ids))
+        return stmt
+
+    @staticmethod
+    def activity_query() -> Select:
+        """All activities (a small reference table)."""
+        return select(Activity)
+
+    def load(self, slots: Iterable[Any], activities: Iterable[Activity]) -> None:
+        """Fill the index from ``slot_query`` rows and ``activity_query`` results."""
+        for row in slots:
+            self._slots[(row.person_id, row.date, row.time_of_day)] = _Slot(
+                id=row.id,
+                source=row.source,
+                activity_id=row.activity_id,
+                counts_toward_fmc_capacity=row.counts_toward_fmc_capacity,
+            )
+        for activity in activities:
+            self._activities[activity.id] = _ActivityTraits(
+                is_time_off=_is_time_off(activity),
+                counts_toward_fmc_capacity=activity_counts_toward_fmc_capacity(
+                    activity
+                ),
+            )
+
+    @property
+    def slots_indexed(self) -> int:
+        return len(self._slots)
+
+    def covers(self, person_id: UUID, date_val: date) -> bool:
+        """Whether the slot is inside the indexed range."""
+        return self.start_date <= date_val <= self.end_date and (
+            self.person_ids is None or person_id in self.person_ids
+        )
+
+    # ------------------------------------------------------------------
+    # Precedence
+    # ------------------------------------------------------------------
+
+    def propose(
+        self,
+        person_id: UUID,
+        date_val: date,
+        time_of_day: str,
+        activity_id: UUID | None,
+    ) -> bool:
+        """
+        Offer a preload for a slot.
+
+        Returns:
+            True if the slot was created or changed, False if it was kept
+
+        Raises:
+            ActivityNotFoundError: If ``activity_id`` is missing
+        """
+        if not activity_id:
+            raise ActivityNotFoundError("<missing activity_id>", context=self.context)
+        self.candidates += 1
+
+        traits = self._activities.get(activity_id)
+        capacity_flag = traits.counts_toward_fmc_capacity if traits else None
+        key = (person_id, date_val, time_of_day)
+        slot = self._slots.get(key)
+
+        if slot is None:
+            self._slots[key] = _Slot(
+                id=None,
+                source=AssignmentSource.PRELOAD.value,
+                activity_id=activity_id,
+                counts_toward_fmc_capacity=capacity_flag,
+                changed=True,
+            )
+            return True
+
+        if slot.source in (
+            AssignmentSource.TEMPLATE.value,
+            AssignmentSource.SOLVER.value,
+        ):
+            return self._set(slot, activity_id, capacity_flag)
+        if slot.source != AssignmentSource.PRELOAD.value:
+            return False
+        if slot.activity_id is None:
+            return self._set(slot, activity_id, capacity_flag)
+
+        existing = self._activities.get(slot.activity_id)
+        new_is_time_off = traits is not None and traits.is_time_off
+        existing_is_time_off = existing is not None and existing.is_time_off
+        if new_is_time_off and not existing_is_time_off:
+            return self._set(slot, activity_id, capacity_flag)
+        if (
+            slot.activity_id == activity_id
+            and capacity_flag is not None
+            and slot.counts_toward_fmc_capacity != capacity_flag
+        ):
+            return self._set(slot, activity_id, capacity_flag)
+        return False
+
+    def _set(
+        self, slot: _Slot, activity_id: UUID, capacity_flag: bool | None
+    ) -> bool:
+        slot.source = AssignmentSource.PRELOAD.value
+        slot.activity_id = activity_id
+        slot.counts_toward_fmc_capacity = capacity_flag
+        slot.changed = True
+        return True
+
+    # ------------------------------------------------------------------
+    # Write
+    # ------------------------------------------------------------------
+
+    @property
+    def pending_writes(self) -> tuple[int, int]:
+        """(new slots, changed existing slots) waiting to be written."""
+        inserted = updated = 0
+        for _, slot in self._changed():
+            if slot.id is None:
+                inserted += 1
+            else:
+                updated += 1
+        return inserted, updated
+
+    def _changed(self) -> Iterator[tuple[SlotKey, _Slot]]:
+        return ((key, slot) for key, slot in self._slots.items() if slot.changed)
+
+    def insert_rows(self) -> list[dict[str, Any]]:
+        """New preload rows."""
+        return [
+            {
+                "person_id": person_id,
+                "date": date_val,
+                "time_of_day": time_of_day,
+                "activity_id": slot.activity_id,
+                "counts_toward_fmc_capacity": slot.counts_toward_fmc_capacity,
+                "source": slot.source,
+            }
+            for (person_id, date_val, time_of_day), slot in self._changed()
+            if slot.id is None
+        ]
+
+    def update_rows(self) -> list[dict[str, Any]]:
+        """Primary-key updates for existing slots the batch changed."""
+        return [
+            {
+                "id": slot.id,
+                "activity_id": slot.activity_id,
+                "counts_toward_fmc_capacity": slot.counts_toward_fmc_capacity,
+                "source": slot.source,
+            }
+            for _, slot in self._changed()
+            if slot.id is not None
+        ]
+
+    def write_statements(
+        self, session: Any
+    ) -> Iterator[tuple[Any, list[dict[str, Any]]]]:
+        """
+        Bulk statements that persist the batch, as (statement, rows) pairs.
+
+        New slots use ON CONFLICT DO NOTHING so a slot inserted concurrently
+        since the index was read is kept, as the per-slot insert did.
+        Pending ORM objects for these slots must be flushed first.
+        """
+        inserts = self.insert_rows()
+        for i in range(0, len(inserts), WRITE_BATCH_SIZE):
+            stmt = _upsert_insert(session, HalfDayAssignment).on_conflict_do_nothing(
+                index_elements=["person_id", "date", "time_of_day"]
+            )
+            yield stmt, inserts[i : i + WRITE_BATCH_SIZE]
+
+        updates = self.update_rows()
+        for i in range(0, len(updates), WRITE_BATCH_SIZE):
+            yield update(HalfDayAssignment), updates[i : i + WRITE_BATCH_SIZE]
+
+    def expire_updated(self, session: Any) -> None:
+        """Expire in-session copies of slots rewritten by the bulk UPDATE."""
+        updated = {slot.id for _, slot in self._changed() if slot.id is not None}
+        if not updated:
+            return
+        for obj in list(session.identity_map.values()):
+            if isinstance(obj, HalfDayAssignment) and obj.id in updated:
+                session.expire(obj)
+
+
+class LoaderTimer:
+    """Context manager that records one loader's cost into run stats."""
+
+    def __init__(
+        self, stats: PreloadRunStats, name: str, batch: PreloadBatch | None
+    ) -> None:
+        self.loader = PreloadLoaderStats(name=name)
+        self._stats = stats
+        self._batch = batch
+
+    def __enter__(self) -> PreloadLoaderStats:
+        self._start = time.perf_counter()
+        self._candidates = self._batch.candidates if self._batch else 0
+        return self.loader
+
+    def __exit__(self, *exc: object) -> None:
+        self.loader.seconds = time.perf_counter() - self._start
+        if self._batch:
+            self.loader.candidates = self._batch.candidates - self._candidates
+        self._stats.loaders.append(self.loader)
+
+
+def _is_time_off(activity: Activity) -> bool:
+    return (
+        activity.activity_category or ""
+    ).lower() == "time_off" or activity.counts_toward_clinical_hours is False
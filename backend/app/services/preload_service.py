@@ -18,11 +18,13 @@ Order of Operations (per TAMC skill):
 
 """
 
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
 from datetime import date, timedelta
 from uuid import UUID
 
 from sqlalchemy import select, and_, or_, case
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
@@ -32,7 +34,6 @@ from app.models.absence import Absence
 from app.models.activity import Activity
 from app.models.block_assignment import BlockAssignment
 from app.models.call_assignment import CallAssignment
-from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
 from app.models.inpatient_preload import InpatientPreload, InpatientRotationType
 from app.models.institutional_event import InstitutionalEvent, InstitutionalEventScope
 from app.models.person import Person
@@ -46,6 +47,9 @@ from app.services.preload import (
     CLINIC_PATTERN_CODES as _CLINIC_PATTERN_CODES,
     INTERN_CONTINUITY_EXEMPT_ROTATIONS as _INTERN_CONTINUITY_EXEMPT_ROTATIONS,
     KAP_ROTATIONS as _KAP_ROTATIONS,
+    LoaderTimer,
+    PreloadBatch,
+    PreloadRunStats,
     LEC_EXEMPT_ROTATIONS as _LEC_EXEMPT_ROTATIONS,
     NIGHT_FLOAT_ROTATIONS as _NIGHT_FLOAT_ROTATIONS,
     OFFSITE_ROTATIONS as _OFFSITE_ROTATIONS,
@@ -74,12 +78,18 @@ class PreloadService:
 
     All preloaded assignments have source='preload' and are locked
     (cannot be overwritten by solver).
+
+    Shares ``PreloadBatch`` with SyncPreloadService: existing slots are
+    indexed once per block and preloads are written in bulk.
     """
 
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
         self._activity_cache: dict[str, UUID] = {}
         self._template_cache: dict[str, RotationTemplate | None] = {}
+        self._batch: PreloadBatch | None = None
+        self._activities: list[Activity] | None = None
+        self.last_run_stats: PreloadRunStats | None = None
 
     async def load_all_preloads(
         self,
@@ -102,28 +112,88 @@ class PreloadService:
         )
 
         total = 0
+        stats = PreloadRunStats(block_number=block_number, academic_year=academic_year)
+        self.last_run_stats = stats
 
         # Order of operations (per TAMC skill)
-        total += await self._load_absences(
-            start_date, end_date, block_number, academic_year
-        )
-        total += await self._load_institutional_events(start_date, end_date)
-        total += await self._load_rotation_protected_preloads(
-            block_number, academic_year
-        )
-        total += await self._load_inpatient_preloads(start_date, end_date)
-        total += await self._load_fmit_call(start_date, end_date)
-        total += await self._load_inpatient_clinic(block_number, academic_year)
-        total += await self._load_resident_call(start_date, end_date)
-        total += await self._load_faculty_call(start_date, end_date)
-        total += await self._load_sm_preloads(start_date, end_date)
-        total += await self._load_conferences(start_date, end_date)
-        total += await self._load_protected_time(start_date, end_date)
+        # PCAT/DO after a call on the block's last day fall on the next day
+        async with self._preload_batch(
+            start_date, end_date + timedelta(days=1), stats=stats
+        ):
+            run = self._run_loader
+            total += await run(
+                stats,
+                "absences",
+                self._load_absences,
+                start_date,
+                end_date,
+                block_number,
+                academic_year,
+            )
+            total += await run(
+                stats,
+                "institutional_events",
+                self._load_institutional_events,
+                start_date,
+                end_date,
+            )
+            total += await run(
+                stats,
+                "rotation_protected",
+                self._load_rotation_protected_preloads,
+                block_number,
+                academic_year,
+            )
+            total += await run(
+                stats, "inpatient", self._load_inpatient_preloads, start_date, end_date
+            )
+            total += await run(
+                stats, "fmit_call", self._load_fmit_call, start_date, end_date
+            )
+            total += await run(
+                stats,
+                "inpatient_clinic",
+                self._load_inpatient_clinic,
+                block_number,
+                academic_year,
+            )
+            total += await run(
+                stats, "resident_call", self._load_resident_call, start_date, end_date
+            )
+            total += await run(
+                stats, "faculty_call", self._load_faculty_call, start_date, end_date
+            )
+            total += await run(
+                stats, "sm", self._load_sm_preloads, start_date, end_date
+            )
+            total += await run(
+                stats, "conferences", self._load_conferences, start_date, end_date
+            )
+            total += await run(
+                stats,
+                "protected_time",
+                self._load_protected_time,
+                start_date,
+                end_date,
+            )
 
         await self.session.commit()
         logger.info(f"Loaded {total} preload assignments")
+        logger.info(stats.summary())
         return total
 
+    async def _run_loader(
+        self,
+        stats: PreloadRunStats,
+        name: str,
+        loader: Callable[..., Awaitable[int]],
+        *args: object,
+    ) -> int:
+        """Run one loader and record its time, rows and candidate slots."""
+        with LoaderTimer(stats, name, self._batch) as loader_stats:
+            loader_stats.rows = await loader(*args)
+        return loader_stats.rows
+
     async def _load_absences(
         self,
         start_date: date,
@@ -1252,18 +1322,63 @@ class PreloadService:
         logger.warning(f"Optional activity not found during preload: {code}")
         return None
 
+    @asynccontextmanager
+    async def _preload_batch(
+        self,
+        start_date: date,
+        end_date: date,
+        person_ids: list[UUID] | None = None,
+        stats: PreloadRunStats | None = None,
+    ) -> AsyncIterator[PreloadBatch]:
+        """
+        Open a preload batch over a date range and write it on exit.
+
+        Existing slots in the range are indexed with one query; preloads
+        proposed while the batch is open are resolved against the index and
+        written in bulk when the block exits without error.
+        """
+        started = time.perf_counter()
+        batch = PreloadBatch(start_date, end_date, person_ids, context="preload_service")
+        if self._activities is None:
+            result = await self.session.execute(PreloadBatch.activity_query())
+            self._activities = list(result.scalars().all())
+        slots = await self.session.execute(batch.slot_query())
+        batch.load(slots.all(), self._activities)
+        if stats:
+            stats.index_seconds += time.perf_counter() - started
+            stats.slots_indexed += batch.slots_indexed
+
+        previous, self._batch = self._batch, batch
+        try:
+            yield batch
+        finally:
+            self._batch = previous
+
+        started = time.perf_counter()
+        inserted, updated = batch.pending_writes
+        await self.session.flush()
+        for stmt, rows in batch.write_statements(self.session):
+            await self.session.execute(stmt, rows)
+        batch.expire_updated(self.session)
+        if stats:
+            stats.write_seconds += time.perf_counter() - started
+            stats.inserted += inserted
+            stats.updated += updated
+
     async def _create_preload(
         self,
         person_id: UUID,
         date_val: date,
         time_of_day: str,
         activity_id: UUID | None,
-    ) -> HalfDayAssignment | None:
+    ) -> bool:
         """
-        Create a preload assignment (idempotent - skips if exists).
+        Propose a preload assignment to the open batch.
+
+        Loaders called on their own (outside ``load_all_preloads``) write
+        the slot through a single-slot batch.
 
-        Race condition safe: uses check-then-insert with IntegrityError handling
-        for the unique constraint on (person_id, date, time_of_day).
+        Returns True if the slot was created or changed, False if kept.
         """
         if not activity_id:
             logger.error(
@@ -1273,74 +1388,14 @@ class PreloadService:
             raise ActivityNotFoundError(
                 "<missing activity_id>", context="preload_service"
             )
-            # Build query for checking existence (reused after IntegrityError)
-        stmt = select(HalfDayAssignment).where(
-            and_(
-                HalfDayAssignment.person_id == person_id,
-                HalfDayAssignment.date == date_val,
-                HalfDayAssignment.time_of_day == time_of_day,
-            )
-        )
 
-        # Check if already exists
-        result = await self.session.execute(stmt)
-        existing = result.scalar_one_or_none()
-
-        if existing:
-            # Already exists - allow time-off override for existing preloads
-            new_activity = await self.session.get(Activity, activity_id)
-            existing_activity = (
-                await self.session.get(Activity, existing.activity_id)
-                if existing.activity_id
-                else None
-            )
-            new_is_time_off = new_activity and (
-                (new_activity.activity_category or "").lower() == "time_off"
-                or new_activity.counts_toward_clinical_hours is False
-            )
-            existing_is_time_off = existing_activity and (
-                (existing_activity.activity_category or "").lower() == "time_off"
-                or existing_activity.counts_toward_clinical_hours is False
-            )
-            if (
-                existing.source == AssignmentSource.PRELOAD.value
-                and new_is_time_off
-                and not existing_is_time_off
-            ):
-                existing.activity_id = activity_id
-                existing.source = AssignmentSource.PRELOAD.value
-                await self.session.flush()
-            return existing
-
-            # Create new preload
-        assignment = HalfDayAssignment(
-            person_id=person_id,
-            date=date_val,
-            time_of_day=time_of_day,
-            activity_id=activity_id,
-            source=AssignmentSource.PRELOAD.value,
-        )
-        self.session.add(assignment)
-
-        try:
-            # Flush to trigger constraint check
-            await self.session.flush()
-        except IntegrityError:
-            # Race condition - another process inserted first
-            await self.session.rollback()
-            # Re-fetch the existing record
-            result = await self.session.execute(stmt)
-            existing = result.scalar_one_or_none()
-            if existing:
-                logger.debug(
-                    f"Race condition handled for preload: "
-                    f"person={person_id}, date={date_val}, time={time_of_day}"
-                )
-                return existing
-                # Re-raise if still not found (different integrity error)
-            raise
+        if self._batch is not None and self._batch.covers(person_id, date_val):
+            return self._batch.propose(person_id, date_val, time_of_day, activity_id)
 
-        return assignment
+        async with self._preload_batch(
+            date_val, date_val, person_ids=[person_id]
+        ) as batch:
+            return batch.propose(person_id, date_val, time_of_day, activity_id)
 
     async def _is_on_fmit(self, person_id: UUID, date_val: date) -> bool:
         """Check if person is on FMIT on given date."""
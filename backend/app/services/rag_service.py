@@ -2,15 +2,22 @@
 
 This service provides semantic search capabilities for scheduling documentation,
 ACGME rules, and other reference materials using pgvector and sentence-transformers.
+Without pgvector (SQLite, test runs) retrieval uses an in-process VectorIndex.
 """
 
 import logging
 import re
 import time
-from typing import Any
-from uuid import UUID
-
-from sqlalchemy import delete, func, select, text
+import weakref
+from collections import Counter
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, TypeVar
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import DBAPIError, InterfaceError, OperationalError
 from sqlalchemy.orm import Session
 
@@ -26,9 +33,26 @@ from app.schemas.rag import (
     RetrievedDocument,
 )
 from app.services.embedding_service import EmbeddingService
+from app.services.vector_index import VectorIndex
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+
+@dataclass
+class SourceDocument:
+    """A source file to (re)index, keyed by filename in chunk metadata."""
+
+    filename: str
+    content: str
+    doc_type: str
+    metadata: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def chunk_metadata(self) -> dict[str, Any]:
+        return {**self.metadata, "filename": self.filename}
+
 
 class RAGService:
     """Service for RAG document ingestion and retrieval.
@@ -36,8 +60,8 @@ class RAGService:
     Handles:
     - Document chunking with configurable size and overlap
     - Embedding generation using sentence-transformers
-    - Vector storage in pgvector
-    - Semantic similarity search
+    - Vector storage in pgvector, with embeddings reused by content hash
+    - Semantic similarity search (HNSW on PostgreSQL, VectorIndex elsewhere)
     - Context building for LLM injection
     """
 
@@ -50,6 +74,9 @@ class RAGService:
     MAX_TRANSIENT_DB_RETRIES = 3
     INITIAL_RETRY_DELAY_SECONDS = 0.25
     MAX_RETRY_DELAY_SECONDS = 2.0
+    EMBED_BATCH_SIZE = 64
+    HASH_LOOKUP_BATCH_SIZE = 500
+    HNSW_EF_SEARCH = 40  # pgvector default; raised for filtered or large-k queries
     TRANSIENT_PG_ERROR_CODES = {
         "08000",  # connection_exception
         "08001",  # sqlclient_unable_to_establish_sqlconnection
@@ -72,6 +99,14 @@ class RAGService:
         "database is locked",
     )
 
+    # In-process indexes for databases without pgvector, one per engine.
+    # Writes through this class bump _write_count so a changed table is seen
+    # even when row count and max(updated_at) (second resolution) are not.
+    _local_indexes: "weakref.WeakKeyDictionary[Engine, VectorIndex]" = (
+        weakref.WeakKeyDictionary()
+    )
+    _write_count = 0
+
     def __init__(self, db: Session) -> None:
         """Initialize RAG service.
 
@@ -119,8 +154,9 @@ class RAGService:
                 f"Chunked document into {len(chunks)} chunks (type: {doc_type})"
             )
 
-            # Generate embeddings for all chunks (batch for efficiency)
-            embeddings = self.embedding_service.embed_batch(chunks)
+            # Reuse stored embeddings for known chunks, embed the rest in a batch
+            by_hash = self._embeddings_by_hash(chunks)
+            embeddings = [by_hash[EmbeddingService.hash_text(c)] for c in chunks]
 
         except Exception as e:
             self.db.rollback()
@@ -133,65 +169,118 @@ class RAGService:
                 message="Operation failed",
             )
 
-        retry_count = 0
-        while True:
-            try:
-                # Create RAGDocument records
-                chunk_ids = []
-                for chunk_text, embedding in zip(chunks, embeddings):
-                    rag_doc = RAGDocument(
-                        content=chunk_text,
-                        embedding=embedding,
-                        doc_type=doc_type,
-                        metadata_=metadata,
-                    )
-                    self.db.add(rag_doc)
-                    self.db.flush()  # Get ID without committing
-                    chunk_ids.append(rag_doc.id)
+        try:
+            chunk_ids = self._write_with_retry(
+                partial(self._insert_chunks, chunks, embeddings, doc_type, metadata),
+                doc_type,
+            )
+        except Exception as e:
+            logger.error("Error ingesting document", exc_info=True)
+            return IngestResponse(
+                status="error",
+                chunks_created=0,
+                chunk_ids=[],
+                doc_type=doc_type,
+                message="Operation failed",
+            )
 
-                # Commit all chunks
-                self.db.commit()
+        logger.info(
+            f"Successfully ingested {len(chunk_ids)} chunks for doc_type={doc_type}"
+        )
 
-                logger.info(
-                    f"Successfully ingested {len(chunk_ids)} chunks for doc_type={doc_type}"
-                )
+        return IngestResponse(
+            status="success",
+            chunks_created=len(chunk_ids),
+            chunk_ids=chunk_ids,
+            doc_type=doc_type,
+            message=f"Successfully ingested {len(chunk_ids)} chunks",
+        )
 
-                return IngestResponse(
-                    status="success",
-                    chunks_created=len(chunk_ids),
-                    chunk_ids=chunk_ids,
-                    doc_type=doc_type,
-                    message=f"Successfully ingested {len(chunk_ids)} chunks",
-                )
-            except Exception as e:
-                self.db.rollback()
+    async def reindex_sources(
+        self,
+        sources: Sequence[SourceDocument],
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
+        workers: int = 4,
+    ) -> list[IngestResponse]:
+        """Re-ingest source files, touching only chunks that changed.
 
-                if (
-                    retry_count < self.MAX_TRANSIENT_DB_RETRIES
-                    and self._is_transient_db_error(e)
-                ):
-                    delay_seconds = self._retry_delay_seconds(retry_count)
-                    logger.warning(
-                        "Transient DB error during RAG ingest for doc_type=%s "
-                        "(attempt %s/%s): %s. Retrying in %.2fs",
-                        doc_type,
-                        retry_count + 1,
-                        self.MAX_TRANSIENT_DB_RETRIES,
-                        "Operation failed",
-                        delay_seconds,
-                    )
-                    time.sleep(delay_seconds)
-                    retry_count += 1
-                    continue
+        Chunks whose text is unchanged keep their rows and embeddings, chunks
+        that disappeared are deleted, and new chunk text from all sources is
+        embedded together in parallel batches.
 
-                logger.error("Error ingesting document", exc_info=True)
-                return IngestResponse(
+        Args:
+            sources: Source files; existing chunks are matched by filename
+            chunk_size: Target chunk size in tokens
+            chunk_overlap: Overlap between chunks in tokens
+            workers: Concurrent embedding batches
+
+        Returns:
+            One IngestResponse per source, in order
+
+        Raises:
+            ValueError: If parameters are invalid
+        """
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be less than chunk_size")
+
+        try:
+            chunked = [
+                self._chunk_text(source.content, chunk_size, chunk_overlap)
+                for source in sources
+            ]
+            by_hash = self._embeddings_by_hash(
+                [chunk for chunks in chunked for chunk in chunks], workers=workers
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.error("Error embedding sources for reindex", exc_info=True)
+            return [
+                IngestResponse(
                     status="error",
                     chunks_created=0,
-                    chunk_ids=[],
-                    doc_type=doc_type,
+                    doc_type=source.doc_type,
                     message="Operation failed",
                 )
+                for source in sources
+            ]
+
+        responses = []
+        for source, chunks in zip(sources, chunked):
+            try:
+                chunk_ids, kept, removed = self._write_with_retry(
+                    partial(self._sync_source, source, chunks, by_hash),
+                    source.doc_type,
+                )
+            except Exception as e:
+                logger.error(f"Error reindexing {source.filename}", exc_info=True)
+                responses.append(
+                    IngestResponse(
+                        status="error",
+                        chunks_created=0,
+                        doc_type=source.doc_type,
+                        message="Operation failed",
+                    )
+                )
+                continue
+
+            logger.info(
+                f"Reindexed {source.filename}: {len(chunk_ids)} new, "
+                f"{kept} unchanged, {removed} removed"
+            )
+            responses.append(
+                IngestResponse(
+                    status="success",
+                    chunks_created=len(chunk_ids),
+                    chunk_ids=chunk_ids,
+                    doc_type=source.doc_type,
+                    message=(
+                        f"Created {len(chunk_ids)} chunks, kept {kept} unchanged, "
+                        f"removed {removed}"
+                    ),
+                )
+            )
+        return responses
 
     async def retrieve(
         self,
@@ -228,50 +317,24 @@ class RAGService:
             # Generate query embedding
             query_embedding = self.embedding_service.embed_text(query)
 
-            # Build query with vector similarity search
-            # Using cosine distance: 1 - cosine_similarity
-            # So similarity = 1 - distance
-            stmt = select(
-                RAGDocument,
-                (1 - RAGDocument.embedding.cosine_distance(query_embedding)).label(
-                    "similarity"
-                ),
-            )
-
-            # Apply filters
-            if doc_type:
-                stmt = stmt.where(RAGDocument.doc_type == doc_type)
-
-            # Apply metadata filters
-            if metadata_filters:
-                for key, value in metadata_filters.items():
-                    # Use PostgreSQL JSON operators for metadata filtering
-                    stmt = stmt.where(RAGDocument.metadata_[key].astext == str(value))
-
-            # Filter by minimum similarity
-            # Note: This is done in SQL for efficiency
-            stmt = stmt.where(
-                (1 - RAGDocument.embedding.cosine_distance(query_embedding))
-                >= min_similarity
-            )
-
-            # Order by similarity (highest first) and limit
-            stmt = stmt.order_by(text("similarity DESC")).limit(top_k)
-
-            # Execute query
-            results = self.db.execute(stmt).all()
+            if self._uses_pgvector():
+                search = self._search_pgvector
+            else:
+                search = self._search_local
+            matches = search(query_embedding, top_k, doc_type, metadata_filters)
 
-            # Convert to RetrievedDocument schema
+            # Convert to RetrievedDocument schema (matches are nearest first)
             documents = [
                 RetrievedDocument(
-                    id=row.RAGDocument.id,
-                    content=row.RAGDocument.content,
-                    doc_type=row.RAGDocument.doc_type,
-                    metadata=row.RAGDocument.metadata_,
-                    similarity_score=float(row.similarity),
-                    created_at=row.RAGDocument.created_at,
+                    id=doc.id,
+                    content=doc.content,
+                    doc_type=doc.doc_type,
+                    metadata=doc.metadata_,
+                    similarity_score=min(1.0, max(0.0, similarity)),
+                    created_at=doc.created_at,
                 )
-                for row in results
+                for doc, similarity in matches
+                if similarity >= min_similarity
             ]
 
             execution_time_ms = (time.time() - start_time) * 1000
@@ -462,6 +525,263 @@ class RAGService:
                 recommendations=["Operation failed"],
             )
 
+    def _uses_pgvector(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def _search_pgvector(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        doc_type: str | None,
+        metadata_filters: dict[str, Any] | None,
+    ) -> list[tuple[RAGDocument, float]]:
+        """Nearest chunks through the HNSW index.
+
+        The index only serves ``ORDER BY embedding <=> :query LIMIT k``, so the
+        query orders by raw distance and leaves the similarity threshold to the
+        caller instead of filtering on a derived expression.
+        """
+        distance = RAGDocument.embedding.cosine_distance(query_embedding).label(
+            "distance"
+        )
+        stmt = select(RAGDocument, distance)
+
+        if doc_type:
+            stmt = stmt.where(RAGDocument.doc_type == doc_type)
+
+        if metadata_filters:
+            for key, value in metadata_filters.items():
+                # Use PostgreSQL JSON operators for metadata filtering
+                stmt = stmt.where(RAGDocument.metadata_[key].astext == str(value))
+
+        stmt = stmt.order_by(distance).limit(top_k)
+
+        # Filters discard candidates after the index scan, so widen the scan
+        widen = 4 if doc_type or metadata_filters else 1
+        ef_search = max(self.HNSW_EF_SEARCH, top_k * widen)
+        self.db.execute(
+            select(func.set_config("hnsw.ef_search", str(ef_search), True))
+        )
+
+        return [
+            (row.RAGDocument, 1.0 - float(row.distance))
+            for row in self.db.execute(stmt).all()
+        ]
+
+    def _search_local(
+        self,
+        query_embedding: list[float],
+        top_k: int,
+        doc_type: str | None,
+        metadata_filters: dict[str, Any] | None,
+    ) -> list[tuple[RAGDocument, float]]:
+        """Nearest chunks through the in-process index (no pgvector)."""
+        hits = self._local_index().search(
+            query_embedding,
+            top_k=top_k,
+            doc_type=doc_type,
+            metadata_filters=metadata_filters,
+        )
+        if not hits:
+            return []
+        docs = {
+            doc.id: doc
+            for doc in self.db.scalars(
+                select(RAGDocument).where(RAGDocument.id.in_([i for i, _ in hits]))
+            )
+        }
+        return [(docs[i], similarity) for i, similarity in hits if i in docs]
+
+    def _local_index(self) -> VectorIndex:
+        """In-process index for this engine, reloaded when the table changes."""
+        engine = self.db.get_bind()
+        signature = (
+            *self.db.execute(
+                select(func.count(), func.max(RAGDocument.updated_at))
+            ).one(),
+            RAGService._write_count,
+        )
+        index = self._local_indexes.get(engine)
+        if index is not None and index.signature == signature:
+            return index
+
+        rows = self.db.execute(
+            select(
+                RAGDocument.id,
+                RAGDocument.embedding,
+                RAGDocument.doc_type,
+                RAGDocument.metadata_,
+            )
+        ).all()
+        index = VectorIndex(dim=self.embedding_service.EMBEDDING_DIM)
+        index.add(
+            [row.id for row in rows],
+            [row.embedding for row in rows],
+            [row.doc_type for row in rows],
+            [row.metadata_ or {} for row in rows],
+        )
+        index.signature = signature
+        self._local_indexes[engine] = index
+        logger.info(f"Loaded {len(rows)} chunks into the in-process vector index")
+        return index
+
+    def _embeddings_by_hash(
+        self, chunks: Sequence[str], workers: int = 1
+    ) -> dict[str, list[float]]:
+        """Embeddings for chunks keyed by EmbeddingService.hash_text.
+
+        Chunks already stored reuse their embedding; the rest are embedded
+        once per distinct text, in one batch or in parallel batches.
+        """
+        pending: dict[str, str] = {}
+        for chunk in chunks:
+            pending.setdefault(EmbeddingService.hash_text(chunk), chunk)
+
+        found = self._stored_embeddings(list(pending))
+        missing = [chunk for key, chunk in pending.items() if key not in found]
+        if missing:
+            if workers > 1:
+                embeddings = self.embedding_service.embed_batches(
+                    missing, batch_size=self.EMBED_BATCH_SIZE, workers=workers
+                )
+            else:
+                embeddings = self.embedding_service.embed_batch(missing)
+            for chunk, embedding in zip(missing, embeddings):
+                found[EmbeddingService.hash_text(chunk)] = embedding
+        logger.debug(f"Embedded {len(missing)} of {len(pending)} distinct chunks")
+        return found
+
+    def _stored_embeddings(self, hashes: list[str]) -> dict[str, list[float]]:
+        """Embeddings of stored chunks by content hash (best effort)."""
+        found: dict[str, list[float]] = {}
+        try:
+            with self.db.no_autoflush:
+                for i in range(0, len(hashes), self.HASH_LOOKUP_BATCH_SIZE):
+                    batch = hashes[i : i + self.HASH_LOOKUP_BATCH_SIZE]
+                    rows = self.db.execute(
+                        select(RAGDocument.content_hash, RAGDocument.embedding).where(
+                            RAGDocument.content_hash.in_(batch)
+                        )
+                    ).all()
+                    for content_hash, embedding in rows:
+                        found[content_hash] = [float(x) for x in embedding]
+        except Exception as e:
+            logger.warning("Embedding cache lookup failed", exc_info=True)
+            return {}
+        return found
+
+    def _insert_chunks(
+        self,
+        chunks: Sequence[str],
+        embeddings: Sequence[list[float]],
+        doc_type: str,
+        metadata: dict[str, Any],
+    ) -> list[UUID]:
+        """Stage chunk rows and write them in a single flush.
+
+        IDs are assigned up front so the unit of work batches the rows into
+        one multi-row INSERT instead of a round trip per chunk.
+        """
+        docs = [
+            RAGDocument(
+                id=uuid4(),
+                content=chunk,
+                content_hash=EmbeddingService.hash_text(chunk),
+                embedding=embedding,
+                doc_type=doc_type,
+                metadata_=metadata,
+            )
+            for chunk, embedding in zip(chunks, embeddings)
+        ]
+        self.db.add_all(docs)
+        self.db.flush()
+        return [doc.id for doc in docs]
+
+    def _sync_source(
+        self,
+        source: SourceDocument,
+        chunks: Sequence[str],
+        embeddings: dict[str, list[float]],
+    ) -> tuple[list[UUID], int, int]:
+        """Bring a source's stored chunks in line with its current chunks.
+
+        Returns:
+            (IDs of inserted chunks, unchanged count, removed count)
+        """
+        metadata = source.chunk_metadata
+        existing = self.db.execute(
+            select(
+                RAGDocument.id,
+                RAGDocument.content_hash,
+                RAGDocument.doc_type,
+                RAGDocument.metadata_,
+            ).where(RAGDocument.metadata_["filename"].astext == source.filename)
+        ).all()
+
+        wanted = Counter(EmbeddingService.hash_text(chunk) for chunk in chunks)
+        kept, stale = [], []
+        for row in existing:
+            if wanted[row.content_hash] > 0 and row.doc_type == source.doc_type:
+                wanted[row.content_hash] -= 1
+                kept.append(row)
+            else:
+                stale.append(row.id)
+
+        if stale:
+            self.db.execute(delete(RAGDocument).where(RAGDocument.id.in_(stale)))
+        outdated = [row.id for row in kept if row.metadata_ != metadata]
+        if outdated:
+            self.db.execute(
+                update(RAGDocument)
+                .where(RAGDocument.id.in_(outdated))
+                .values(metadata_=metadata)
+            )
+
+        new_chunks = []
+        for chunk in chunks:
+            key = EmbeddingService.hash_text(chunk)
+            if wanted[key] > 0:
+                wanted[key] -= 1
+                new_chunks.append(chunk)
+        chunk_ids = self._insert_chunks(
+            new_chunks,
+            [embeddings[EmbeddingService.hash_text(c)] for c in new_chunks],
+            source.doc_type,
+            metadata,
+        )
+        return chunk_ids, len(kept), len(stale)
+
+    def _write_with_retry(self, write: Callable[[], T], doc_type: str) -> T:
+        """Run a write and commit, retrying transient DB errors with backoff."""
+        retry_count = 0
+        while True:
+            try:
+                result = write()
+                self.db.commit()
+                RAGService._write_count += 1
+                return result
+            except Exception as e:
+                self.db.rollback()
+
+                if (
+                    retry_count < self.MAX_TRANSIENT_DB_RETRIES
+                    and self._is_transient_db_error(e)
+                ):
+                    delay_seconds = self._retry_delay_seconds(retry_count)
+                    logger.warning(
+                        "Transient DB error during RAG ingest for doc_type=%s "
+                        "(attempt %s/%s): %s. Retrying in %.2fs",
+                        doc_type,
+                        retry_count + 1,
+                        self.MAX_TRANSIENT_DB_RETRIES,
+                        "Operation failed",
+                        delay_seconds,
+                    )
+                    time.sleep(delay_seconds)
+                    retry_count += 1
+                    continue
+                raise
+
     def _is_transient_db_error(self, error: Exception) -> bool:
         """Return True when an error likely represents a temporary DB connection issue."""
         if isinstance(error, InterfaceError):
@@ -595,6 +915,7 @@ class RAGService:
                 .delete()
             )
             self.db.commit()
+            RAGService._write_count += 1
             logger.info(f"Deleted {count} documents of type {doc_type}")
             return count
         except Exception as e:
@@ -611,6 +932,7 @@ class RAGService:
         try:
             result = self.db.execute(delete(RAGDocument))
             self.db.commit()
+            RAGService._write_count += 1
             deleted_count = result.rowcount or 0
             logger.info(f"Deleted {deleted_count} documents (full clear)")
             return deleted_count
@@ -640,6 +962,7 @@ class RAGService:
             )
             result = self.db.execute(stmt)
             self.db.commit()
+            RAGService._write_count += 1
             deleted_count = result.rowcount or 0
             logger.info(
                 f"Deleted {deleted_count} documents for source filename {filename}"
@@ -669,6 +992,7 @@ class RAGService:
             if doc:
                 self.db.delete(doc)
                 self.db.commit()
+                RAGService._write_count += 1
                 logger.info(f"Deleted document {document_id}")
                 return True
             return False
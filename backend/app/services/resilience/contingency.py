@@ -28,6 +28,8 @@ from uuid import UUID
 from sqlalchemy import and_, desc
 from sqlalchemy.orm import Session, joinedload
 
+from app.resilience.centrality import get_centrality_service
+
 logger = logging.getLogger(__name__)
 
 # Try importing NetworkX for graph analysis
@@ -1046,22 +1048,7 @@ class ContingencyService:
                         f"service:{service_id}",
                     )
 
-            # Calculate metrics
-            betweenness = nx.betweenness_centrality(G)
-            degree = nx.degree_centrality(G)
-            pagerank = nx.pagerank(G, alpha=0.85)
-
-            try:
-                eigenvector = nx.eigenvector_centrality(G, max_iter=1000)
-            except nx.PowerIterationFailedConvergence:
-                eigenvector = dict.fromkeys(G.nodes(), 0.0)
-
-            return {
-                "betweenness": betweenness,
-                "degree": degree,
-                "eigenvector": eigenvector,
-                "pagerank": pagerank,
-            }
+            return get_centrality_service().measures(G)
 
         except Exception as e:
             logger.warning(f"NetworkX centrality calculation failed: {e}")
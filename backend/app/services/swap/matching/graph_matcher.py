@@ -3,22 +3,50 @@ Graph-based swap matching using maximum weight matching algorithms.
 
 Uses graph theory to find optimal swap assignments when multiple
 compatible swaps are possible.
+
+Only plausible pairs are scored. Requests are blocked by source week (pairs
+at most ``CANDIDATE_WINDOW_DAYS`` apart) within the same rotation type and
+eligibility class (the source faculty's role), and by reciprocity (one
+request targets the other's source faculty). Candidate pairs are scored in
+one vectorized pass and matched with a sparse assignment solver on the
+bipartite double cover of the candidate graph, so matching a thousand
+pending requests never touches the full n x n pair space.
 """
 
 import logging
+from collections import Counter, defaultdict
+from collections.abc import Hashable
 from dataclasses import dataclass
+from datetime import timedelta
+from functools import cached_property
 from typing import Any
 from uuid import UUID
 
 import networkx as nx
+import numpy as np
+from scipy.sparse import coo_matrix, csr_matrix
+from scipy.sparse.csgraph import connected_components, min_weight_full_bipartite_matching
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
 from app.models.swap import SwapRecord, SwapStatus
 
 
 logger = logging.getLogger(__name__)
 
+# Pairs scoring at or below this are not worth matching
+MIN_EDGE_SCORE = 0.3
+
+# Source weeks further apart than this only pair up if one names the other
+CANDIDATE_WINDOW_DAYS = 60
+
+# Largest odd-cycle component re-solved exactly with the blossom algorithm
+EXACT_REPAIR_MAX_EDGES = 20_000
+
 
 @dataclass
 class GraphMatchResult:
@@ -30,12 +58,466 @@ class GraphMatchResult:
     graph_stats: dict[str, Any]
 
 
+@dataclass
+class SwapCandidateGraph:
+    """
+    Sparse compatibility graph over swap requests.
+
+    Attributes:
+        request_ids: Node index -> request ID
+        first: First endpoint of each edge (node index, ``first < second``)
+        second: Second endpoint of each edge
+        weights: Compatibility score of each edge
+        pairs_scored: Candidate pairs scored before thresholding
+    """
+
+    request_ids: list[UUID]
+    first: np.ndarray
+    second: np.ndarray
+    weights: np.ndarray
+    pairs_scored: int = 0
+
+    @property
+    def nodes(self) -> int:
+        """Number of requests."""
+        return len(self.request_ids)
+
+    @property
+    def edges(self) -> int:
+        """Number of compatible pairs."""
+        return len(self.weights)
+
+    @cached_property
+    def _edge_order(self) -> tuple[np.ndarray, np.ndarray]:
+        keys = self.first * self.nodes + self.second
+        order = np.argsort(keys)
+        return keys[order], order
+
+    def weights_of(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """Weights of the edges (a[i], b[i]), in either orientation."""
+        a, b = np.asarray(a, dtype=np.int64), np.asarray(b, dtype=np.int64)
+        sorted_keys, order = self._edge_order
+        found = np.searchsorted(sorted_keys, np.minimum(a, b) * self.nodes + np.maximum(a, b))
+        return self.weights[order[found]]
+
+
+def _expand_ranges(lo: np.ndarray, hi: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """(owner, position) for every position in each half-open range."""
+    counts = np.maximum(hi - lo, 0)
+    owners = np.repeat(np.arange(len(lo)), counts)
+    starts = np.cumsum(counts) - counts
+    positions = np.arange(counts.sum()) - np.repeat(starts, counts) + lo[owners]
+    return owners, positions
+
+
+def _encode_requests(
+    requests: list[SwapRecord],
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Source week ordinals, source faculty codes and target codes (-1 = any)."""
+    codes: dict[UUID, int] = {}
+    weeks = np.fromiter(
+        (r.source_week.toordinal() for r in requests), dtype=np.int64, count=len(requests)
+    )
+    sources = np.fromiter(
+        (codes.setdefault(r.source_faculty_id, len(codes)) for r in requests),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    targets = np.fromiter(
+        (
+            codes.get(r.target_faculty_id, -2) if r.target_faculty_id else -1
+            for r in requests
+        ),
+        dtype=np.int64,
+        count=len(requests),
+    )
+    return weeks, sources, targets
+
+
+def _encode_block_keys(
+    requests: list[SwapRecord], block_keys: dict[UUID, Hashable] | None
+) -> np.ndarray:
+    """Blocking key codes per request (-1 = no key, pairs with any key)."""
+    block_keys = block_keys or {}
+    codes: dict[Hashable, int] = {}
+    return np.fromiter(
+        (
+            codes.setdefault(block_keys[r.id], len(codes))
+            if block_keys.get(r.id) is not None
+            else -1
+            for r in requests
+        ),
+        dtype=np.int64,
+        count=len(requests),
+    )
+
+
+def candidate_pairs(
+    requests: list[SwapRecord],
+    block_keys: dict[UUID, Hashable] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Generate the request pairs worth scoring.
+
+    A pair is a candidate when the source weeks are within
+    ``CANDIDATE_WINDOW_DAYS`` of each other and the requests share a blocking
+    key (or either has none), or when either request targets the other's
+    source faculty. Pairs from the same source faculty are never candidates.
+
+    Args:
+        requests: Pending swap requests
+        block_keys: Blocking key (rotation type, eligibility class) by
+            request ID; requests without one pair with any key
+
+    Returns:
+        Arrays (first, second) of request indices with ``first < second``
+    """
+    n = len(requests)
+    if n < 2:
+        empty = np.zeros(0, dtype=np.int64)
+        return empty, empty
+    weeks, sources, targets = _encode_requests(requests)
+    keys = _encode_block_keys(requests, block_keys)
+
+    # Week window within each key: sort by (key, week), each request pairs
+    # with the ones after it; the stride keeps keys' windows apart
+    offsets = weeks - weeks.min()
+    stride = int(offsets.max()) + CANDIDATE_WINDOW_DAYS + 1
+    blocked = keys * stride + offsets
+    by_key = np.argsort(blocked, kind="stable")
+    sorted_blocked = blocked[by_key]
+    hi = np.searchsorted(
+        sorted_blocked, sorted_blocked + CANDIDATE_WINDOW_DAYS, "right"
+    )
+    owners, positions = _expand_ranges(np.arange(1, n + 1), hi)
+    window_a, window_b = by_key[owners], by_key[positions]
+
+    # Requests without a key pair with every request in their week window
+    unkeyed = np.nonzero(keys < 0)[0]
+    if 0 < len(unkeyed) < n:
+        by_week = np.argsort(weeks, kind="stable")
+        sorted_weeks = weeks[by_week]
+        unkeyed_weeks = weeks[unkeyed]
+        lo = np.searchsorted(
+            sorted_weeks, unkeyed_weeks - CANDIDATE_WINDOW_DAYS, "left"
+        )
+        hi = np.searchsorted(
+            sorted_weeks, unkeyed_weeks + CANDIDATE_WINDOW_DAYS, "right"
+        )
+        owners, positions = _expand_ranges(lo, hi)
+        window_a = np.concatenate([window_a, unkeyed[owners]])
+        window_b = np.concatenate([window_b, by_week[positions]])
+
+    # Reciprocity: each targeted request pairs with every request from its target
+    by_source = np.argsort(sources, kind="stable")
+    sorted_sources = sources[by_source]
+    lo = np.searchsorted(sorted_sources, targets, "left")
+    hi = np.searchsorted(sorted_sources, targets, "right")
+    owners, positions = _expand_ranges(lo, hi)
+    named_a, named_b = owners, by_source[positions]
+
+    a = np.concatenate([window_a, named_a])
+    b = np.concatenate([window_b, named_b])
+    keep = sources[a] != sources[b]
+    a, b = np.minimum(a[keep], b[keep]), np.maximum(a[keep], b[keep])
+    keys = np.unique(a * n + b)
+    return keys // n, keys % n
+
+
+def score_pairs(
+    requests: list[SwapRecord], first: np.ndarray, second: np.ndarray
+) -> np.ndarray:
+    """
+    Vectorized ``GraphMatcher._calculate_basic_compatibility`` over pairs.
+
+    Returns:
+        Scores from 0.0 to 1.0, one per pair
+    """
+    weeks, sources, targets = _encode_requests(requests)
+    days_apart = np.abs(weeks[first] - weeks[second])
+    scores = 0.5 + np.select(
+        [days_apart <= 7, days_apart <= 30, days_apart <= 60], [0.3, 0.2, 0.1], 0.0
+    )
+    scores += 0.2 * (targets[first] == sources[second])
+    scores += 0.2 * (targets[second] == sources[first])
+    scores = np.minimum(scores, 1.0)
+    scores[sources[first] == sources[second]] = 0.0
+    return scores
+
+
+def build_candidate_graph(
+    requests: list[SwapRecord],
+    compatibility_scores: dict[tuple[UUID, UUID], float] | None = None,
+    block_keys: dict[UUID, Hashable] | None = None,
+) -> SwapCandidateGraph:
+    """
+    Build the sparse compatibility graph for a set of requests.
+
+    Args:
+        requests: Pending swap requests
+        compatibility_scores: Pre-computed scores keyed by request ID pairs
+            (either order); when given, these pairs are the candidates
+        block_keys: Blocking keys by request ID (see ``candidate_pairs``)
+
+    Returns:
+        SwapCandidateGraph with edges scoring above ``MIN_EDGE_SCORE``
+    """
+    request_ids = [r.id for r in requests]
+    if compatibility_scores:
+        index = {request_id: i for i, request_id in enumerate(request_ids)}
+        best: dict[tuple[int, int], float] = {}
+        for (id_a, id_b), score in compatibility_scores.items():
+            a, b = index.get(id_a), index.get(id_b)
+            if a is None or b is None or a == b:
+                continue
+            key = (min(a, b), max(a, b))
+            best[key] = max(score, best.get(key, score))
+        first = np.fromiter((a for a, _ in best), dtype=np.int64, count=len(best))
+        second = np.fromiter((b for _, b in best), dtype=np.int64, count=len(best))
+        weights = np.fromiter(best.values(), dtype=np.float64, count=len(best))
+    else:
+        first, second = candidate_pairs(requests, block_keys)
+        weights = score_pairs(requests, first, second)
+
+    keep = weights > MIN_EDGE_SCORE
+    return SwapCandidateGraph(
+        request_ids=request_ids,
+        first=first[keep],
+        second=second[keep],
+        weights=weights[keep],
+        pairs_scored=len(weights),
+    )
+
+
+def _best_path_matching(weights: list[float]) -> tuple[float, list[int]]:
+    """Max-weight matching on a path given its edge weights (edge indices)."""
+    best = [(0.0, []), (0.0, [])]
+    for i, weight in enumerate(weights):
+        skip, take = best[-1], (best[-2][0] + weight, best[-2][1] + [i])
+        best.append(take if take[0] > skip[0] else skip)
+    return best[-1]
+
+
+def max_weight_matching(graph: SwapCandidateGraph) -> tuple[list[tuple[int, int]], bool]:
+    """
+    Maximum weight matching on a sparse candidate graph.
+
+    The general matching is relaxed to an assignment problem on the
+    bipartite double cover: node i may be assigned to a neighbour j at cost
+    ``2 - w(i, j)`` or to itself (unmatched) at cost 2, solved with SciPy's
+    sparse ``min_weight_full_bipartite_matching``. The optimal assignment is
+    a cycle cover; 2-cycles are matched pairs and even cycles split into
+    their better alternating half without loss. Only odd cycles need repair:
+    their components are re-solved exactly with the blossom algorithm, or,
+    beyond ``EXACT_REPAIR_MAX_EDGES``, matched along the cycle and greedily.
+
+    Returns:
+        (pairs of node indices, whether the matching is provably optimal)
+    """
+    n = graph.nodes
+    if graph.edges == 0:
+        return [], True
+
+    diagonal = np.arange(n)
+    costs = csr_matrix(
+        (
+            np.concatenate([2.0 - graph.weights, 2.0 - graph.weights, np.full(n, 2.0)]),
+            (
+                np.concatenate([graph.first, graph.second, diagonal]),
+                np.concatenate([graph.second, graph.first, diagonal]),
+            ),
+        ),
+        shape=(n, n),
+    )
+    _, successor = min_weight_full_bipartite_matching(costs)
+
+    partner = np.full(n, -1, dtype=np.int64)
+    two_cycles = (successor != diagonal) & (successor[successor] == diagonal)
+    partner[two_cycles] = successor[two_cycles]
+
+    odd_nodes: list[int] = []
+    in_long_cycle = (successor != diagonal) & ~two_cycles
+    if in_long_cycle.any():
+        seen = np.zeros(n, dtype=bool)
+        for start in np.nonzero(in_long_cycle)[0]:
+            if seen[start]:
+                continue
+            cycle = [int(start)]
+            seen[start] = True
+            while (node := int(successor[cycle[-1]])) != start:
+                cycle.append(node)
+                seen[node] = True
+            if len(cycle) % 2:
+                odd_nodes.extend(cycle)
+                continue
+            # Even cycle: either alternating half is at least as good
+            halves = [
+                [
+                    (cycle[i], cycle[(i + 1) % len(cycle)])
+                    for i in range(offset, len(cycle), 2)
+                ]
+                for offset in (0, 1)
+            ]
+            best_half = max(
+                halves, key=lambda half: graph.weights_of(*zip(*half)).sum()
+            )
+            for a, b in best_half:
+                partner[a], partner[b] = b, a
+
+    exact = True
+    if odd_nodes:
+        adjacency = coo_matrix(
+            (np.ones(graph.edges), (graph.first, graph.second)), shape=(n, n)
+        )
+        _, labels = connected_components(adjacency, directed=False)
+        odd_labels = set(labels[odd_nodes].tolist())
+        for label in odd_labels:
+            members = labels == label
+            edge_mask = members[graph.first]
+            if edge_mask.sum() > EXACT_REPAIR_MAX_EDGES:
+                continue
+            partner[members] = -1
+            component = nx.Graph()
+            component.add_weighted_edges_from(
+                zip(
+                    graph.first[edge_mask].tolist(),
+                    graph.second[edge_mask].tolist(),
+                    graph.weights[edge_mask].tolist(),
+                )
+            )
+            for a, b in nx.max_weight_matching(component):
+                partner[a], partner[b] = b, a
+            odd_nodes = [node for node in odd_nodes if labels[node] != label]
+
+    if odd_nodes:
+        # Components too large for blossom: best matching along each cycle,
+        # then fill in greedily with the remaining candidate edges
+        exact = False
+        odd_set = set(odd_nodes)
+        for start in odd_nodes:
+            if start not in odd_set:
+                continue
+            cycle = [start]
+            while (node := int(successor[cycle[-1]])) != start:
+                cycle.append(node)
+            odd_set.difference_update(cycle)
+            edges = [(cycle[i], cycle[(i + 1) % len(cycle)]) for i in range(len(cycle))]
+            weights = graph.weights_of(*zip(*edges)).tolist()
+            # Drop either the closing edge or the first one, keep the better path
+            drop_last = _best_path_matching(weights[:-1])
+            drop_first = _best_path_matching(weights[1:])
+            if drop_first[0] > drop_last[0]:
+                chosen = [edges[i + 1] for i in drop_first[1]]
+            else:
+                chosen = [edges[i] for i in drop_last[1]]
+            for a, b in chosen:
+                partner[a], partner[b] = b, a
+
+        free = (partner[graph.first] < 0) & (partner[graph.second] < 0)
+        for i in np.nonzero(free)[0][np.argsort(-graph.weights[free], kind="stable")]:
+            a, b = int(graph.first[i]), int(graph.second[i])
+            if partner[a] < 0 and partner[b] < 0:
+                partner[a], partner[b] = b, a
+
+    pairs = [(a, int(partner[a])) for a in range(n) if a < partner[a]]
+    return pairs, exact
+
+
+def stable_roommates(preferences: list[list[int]]) -> list[tuple[int, int]] | None:
+    """
+    Irving's stable roommates algorithm with incomplete preference lists.
+
+    Args:
+        preferences: Ranked acceptable partners of each node; acceptability
+            must be mutual
+
+    Returns:
+        Stable pairs of node indices (people with no stable partner stay
+        unmatched), or None if no stable matching exists
+    """
+    n = len(preferences)
+    rank = [{other: r for r, other in enumerate(prefs)} for prefs in preferences]
+    dead = [[False] * len(prefs) for prefs in preferences]
+    sizes = [len(prefs) for prefs in preferences]
+    # Every entry outside [head, tail] is dead; entries inside may be too
+    head = [0] * n
+    tail = [len(prefs) - 1 for prefs in preferences]
+    emptied: list[int] = []
+
+    def delete(x: int, y: int) -> None:
+        for a, b in ((x, y), (y, x)):
+            dead[a][rank[a][b]] = True
+            sizes[a] -= 1
+            if not sizes[a]:
+                emptied.append(a)
+
+    def first(x: int) -> int:
+        while dead[x][head[x]]:
+            head[x] += 1
+        return preferences[x][head[x]]
+
+    def second(x: int) -> int:
+        first(x)
+        i = head[x] + 1
+        while dead[x][i]:
+            i += 1
+        return preferences[x][i]
+
+    def last(x: int) -> int:
+        while dead[x][tail[x]]:
+            tail[x] -= 1
+        return preferences[x][tail[x]]
+
+    def truncate(holder: int, kept: int) -> None:
+        """``holder`` drops everyone it ranks below ``kept``."""
+        cut = rank[holder][kept]
+        for i in range(cut + 1, tail[holder] + 1):
+            if not dead[holder][i]:
+                delete(holder, preferences[holder][i])
+        tail[holder] = min(tail[holder], cut)
+
+    # Phase 1: proposals; accepting one drops everyone the receiver likes less
+    held: list[int | None] = [None] * n
+    free = list(range(n))
+    while free:
+        proposer = free.pop()
+        if not sizes[proposer]:
+            continue
+        receiver = first(proposer)
+        displaced = held[receiver]
+        held[receiver] = proposer
+        truncate(receiver, proposer)
+        if displaced is not None:
+            free.append(displaced)
+
+    # Phase 2: eliminate rotations until every list has at most one entry;
+    # a list emptied here means there is no stable matching
+    emptied.clear()
+    for start in range(n):
+        while sizes[start] > 1:
+            sequence: list[int] = []
+            position: dict[int, int] = {}
+            p = start
+            while p not in position:
+                position[p] = len(sequence)
+                sequence.append(p)
+                p = last(second(p))
+            rotation = sequence[position[p] :]
+            seconds = [second(x) for x in rotation]
+            for x, q in zip(rotation, seconds):
+                truncate(q, x)
+            if emptied:
+                return None
+
+    return [(x, first(x)) for x in range(n) if sizes[x] and x < first(x)]
+
+
 class GraphMatcher:
     """
     Uses graph algorithms to find optimal swap matches.
 
-    Models swap requests as a weighted bipartite graph and uses
-    maximum weight matching to find the best overall pairing.
+    Models swap requests as a sparse weighted graph of plausible pairs and
+    finds the best overall pairing with a sparse assignment solver.
     """
 
     def __init__(self, db: AsyncSession) -> None:
@@ -47,6 +529,64 @@ class GraphMatcher:
         """
         self.db = db
 
+    async def _pending_requests(self) -> list[SwapRecord]:
+        result = await self.db.execute(
+            select(SwapRecord).where(SwapRecord.status == SwapStatus.PENDING)
+        )
+        return list(result.scalars().all())
+
+    async def _block_keys(
+        self, requests: list[SwapRecord]
+    ) -> dict[UUID, tuple[str, str | None]]:
+        """
+        Blocking key of each request: (rotation type, eligibility class).
+
+        The rotation type is the one the source faculty covers most in the
+        source week, and the eligibility class is their faculty role.
+        Requests whose source week has no rotation assignments get no key.
+        """
+        if not requests:
+            return {}
+        faculty_ids = {r.source_faculty_id for r in requests}
+        first_day = min(r.source_week for r in requests)
+        last_day = max(r.source_week for r in requests) + timedelta(days=6)
+
+        result = await self.db.execute(
+            select(Assignment.person_id, Block.date, RotationTemplate.rotation_type)
+            .join(Block, Assignment.block_id == Block.id)
+            .join(
+                RotationTemplate,
+                Assignment.rotation_template_id == RotationTemplate.id,
+            )
+            .where(
+                Assignment.person_id.in_(faculty_ids),
+                Block.date >= first_day,
+                Block.date <= last_day,
+            )
+        )
+        worked: dict[UUID, list[tuple[Any, str]]] = defaultdict(list)
+        for person_id, day, rotation_type in result.all():
+            if rotation_type:
+                worked[person_id].append((day, rotation_type))
+
+        result = await self.db.execute(
+            select(Person.id, Person.faculty_role).where(Person.id.in_(faculty_ids))
+        )
+        roles = dict(result.all())
+
+        keys: dict[UUID, tuple[str, str | None]] = {}
+        for request in requests:
+            week_end = request.source_week + timedelta(days=6)
+            counts = Counter(
+                rotation_type
+                for day, rotation_type in worked.get(request.source_faculty_id, [])
+                if request.source_week <= day <= week_end
+            )
+            if counts:
+                rotation_type = min(counts, key=lambda rt: (-counts[rt], rt))
+                keys[request.id] = (rotation_type, roles.get(request.source_faculty_id))
+        return keys
+
     async def find_optimal_matching(
         self,
         compatibility_scores: dict[tuple[UUID, UUID], float] | None = None,
@@ -61,78 +601,50 @@ class GraphMatcher:
         Returns:
             GraphMatchResult with optimal matches
         """
-        # Get all pending requests
-        result = await self.db.execute(
-            select(SwapRecord).where(SwapRecord.status == SwapStatus.PENDING)
-        )
-        requests = list(result.scalars().all())
-
-        if len(requests) < 2:
-            return GraphMatchResult(
-                matched_pairs=[],
-                total_weight=0.0,
-                unmatched_requests=[r.id for r in requests],
-                graph_stats={
-                    "nodes": len(requests),
-                    "edges": 0,
-                },
-            )
+        requests = await self._pending_requests()
+        block_keys = None if compatibility_scores else await self._block_keys(requests)
+        return self.match_requests(requests, compatibility_scores, block_keys)
+
+    def match_requests(
+        self,
+        requests: list[SwapRecord],
+        compatibility_scores: dict[tuple[UUID, UUID], float] | None = None,
+        block_keys: dict[UUID, Hashable] | None = None,
+    ) -> GraphMatchResult:
+        """
+        Maximum weight matching over the given requests.
 
-            # Build weighted graph
-        graph = nx.Graph()
+        Args:
+            requests: Swap requests to pair up
+            compatibility_scores: Pre-computed compatibility scores
+                                If None, will compute basic scores
+            block_keys: Blocking keys by request ID (see ``candidate_pairs``)
 
-        # Add nodes
-        for request in requests:
-            graph.add_node(str(request.id), request=request)
-
-            # Add edges with weights
-        for i, request_a in enumerate(requests):
-            for request_b in requests[i + 1 :]:
-                # Calculate compatibility score
-                if compatibility_scores:
-                    score = compatibility_scores.get(
-                        (request_a.id, request_b.id),
-                        0.0,
-                    )
-                else:
-                    score = self._calculate_basic_compatibility(
-                        request_a,
-                        request_b,
-                    )
-
-                if score > 0.3:  # Only add edge if reasonably compatible
-                    graph.add_edge(
-                        str(request_a.id),
-                        str(request_b.id),
-                        weight=score,
-                    )
-
-                    # Find maximum weight matching
-        matching = nx.max_weight_matching(graph, maxcardinality=False)
-
-        # Convert matching to result format
-        matched_pairs = []
-        total_weight = 0.0
-        matched_request_ids = set()
-
-        for edge in matching:
-            req_a_id = UUID(edge[0])
-            req_b_id = UUID(edge[1])
-
-            matched_pairs.append((req_a_id, req_b_id))
-            matched_request_ids.add(req_a_id)
-            matched_request_ids.add(req_b_id)
-
-            # Get edge weight
-            weight = graph[edge[0]][edge[1]]["weight"]
-            total_weight += weight
-
-            # Find unmatched requests
-        unmatched = [r.id for r in requests if r.id not in matched_request_ids]
+        Returns:
+            GraphMatchResult with optimal matches
+        """
+        graph = build_candidate_graph(requests, compatibility_scores, block_keys)
+        pairs, exact = max_weight_matching(graph)
+
+        matched_pairs = [
+            (graph.request_ids[a], graph.request_ids[b]) for a, b in pairs
+        ]
+        total_weight = float(graph.weights_of(*zip(*pairs)).sum()) if pairs else 0.0
+        matched = np.zeros(graph.nodes, dtype=bool)
+        matched[[node for pair in pairs for node in pair]] = True
+        unmatched = [
+            request_id
+            for request_id, is_matched in zip(graph.request_ids, matched)
+            if not is_matched
+        ]
 
         graph_stats = {
-            "nodes": graph.number_of_nodes(),
-            "edges": graph.number_of_edges(),
+            "algorithm": "sparse_assignment",
+            "exact": exact,
+            "nodes": graph.nodes,
+            "edges": graph.edges,
+            "pairs_scored": graph.pairs_scored,
+            "dense_pairs": graph.nodes * (graph.nodes - 1) // 2,
             "matched_pairs": len(matched_pairs),
             "unmatched": len(unmatched),
             "average_weight": total_weight / len(matched_pairs)
@@ -157,7 +669,7 @@ class GraphMatcher:
         preferences: dict[UUID, list[UUID]] | None = None,
     ) -> GraphMatchResult:
         """
-        Find stable matching using Gale-Shapley algorithm.
+        Find stable matching using Irving's stable roommates algorithm.
 
         Args:
             preferences: Preference lists for each request
@@ -166,36 +678,60 @@ class GraphMatcher:
         Returns:
             GraphMatchResult with stable matches
         """
-        # Get all pending requests
-        result = await self.db.execute(
-            select(SwapRecord).where(SwapRecord.status == SwapStatus.PENDING)
-        )
-        requests = list(result.scalars().all())
-
-        if not preferences:
-            preferences = await self._build_preference_lists(requests)
-
-            # Implement Gale-Shapley algorithm
-            # (Simplified version for demonstration)
+        requests = await self._pending_requests()
+        block_keys = await self._block_keys(requests)
+        return self.stable_match_requests(requests, preferences, block_keys)
 
-        matched_pairs = []
-        matched = set()
-
-        # Greedy matching based on preferences
-        for request in requests:
-            if request.id in matched:
-                continue
+    def stable_match_requests(
+        self,
+        requests: list[SwapRecord],
+        preferences: dict[UUID, list[UUID]] | None = None,
+        block_keys: dict[UUID, Hashable] | None = None,
+    ) -> GraphMatchResult:
+        """
+        Stable matching over the given requests.
 
-            pref_list = preferences.get(request.id, [])
+        Two requests are acceptable to each other only if each appears on
+        the other's preference list. Since a stable matching need not exist
+        among roommates, the maximum weight matching is returned (with
+        ``graph_stats["stable"]`` False) when there is none.
 
-            for preferred_id in pref_list:
-                if preferred_id not in matched:
-                    matched_pairs.append((request.id, preferred_id))
-                    matched.add(request.id)
-                    matched.add(preferred_id)
-                    break
+        Args:
+            requests: Swap requests to pair up
+            preferences: Preference lists for each request
+                       If None, will use compatibility scores
+            block_keys: Blocking keys by request ID (see ``candidate_pairs``)
 
-        unmatched = [r.id for r in requests if r.id not in matched]
+        Returns:
+            GraphMatchResult with stable matches
+        """
+        if not preferences:
+            preferences = self._build_preference_lists(requests, block_keys)
+
+        request_ids = [r.id for r in requests]
+        index = {request_id: i for i, request_id in enumerate(request_ids)}
+        listed = [
+            [index[other] for other in preferences.get(request_id, []) if other in index]
+            for request_id in request_ids
+        ]
+        acceptable = [set(prefs) for prefs in listed]
+        ranked = [
+            list(dict.fromkeys(y for y in prefs if x in acceptable[y] and y != x))
+            for x, prefs in enumerate(listed)
+        ]
+
+        pairs = stable_roommates(ranked)
+        if pairs is None:
+            logger.info("No stable matching exists; using maximum weight matching")
+            result = self.match_requests(requests, block_keys=block_keys)
+            result.graph_stats.update(algorithm="stable_matching", stable=False)
+            return result
+
+        matched_pairs = [(request_ids[a], request_ids[b]) for a, b in pairs]
+        matched = {i for pair in pairs for i in pair}
+        unmatched = [
+            request_id for i, request_id in enumerate(request_ids) if i not in matched
+        ]
 
         return GraphMatchResult(
             matched_pairs=matched_pairs,
@@ -203,6 +739,7 @@ class GraphMatcher:
             unmatched_requests=unmatched,
             graph_stats={
                 "algorithm": "stable_matching",
+                "stable": True,
                 "matched": len(matched_pairs),
                 "unmatched": len(unmatched),
             },
@@ -234,7 +771,7 @@ class GraphMatcher:
         elif days_apart <= 60:
             score += 0.1
 
-            # Check if specific target matches
+        # Check if specific target matches
         if request_a.target_faculty_id == request_b.source_faculty_id:
             score += 0.2
 
@@ -243,29 +780,21 @@ class GraphMatcher:
 
         return min(score, 1.0)
 
-    async def _build_preference_lists(
+    def _build_preference_lists(
         self,
         requests: list[SwapRecord],
+        block_keys: dict[UUID, Hashable] | None = None,
     ) -> dict[UUID, list[UUID]]:
-        """Build preference lists for stable matching."""
-        preferences = {}
-
-        for request in requests:
-            # Build ordered list of other requests by compatibility
-            other_requests = [r for r in requests if r.id != request.id]
-
-            scored_others = [
-                (
-                    r.id,
-                    self._calculate_basic_compatibility(request, r),
-                )
-                for r in other_requests
-            ]
-
-            # Sort by score (highest first)
-            scored_others.sort(key=lambda x: x[1], reverse=True)
-
-            # Extract IDs
-            preferences[request.id] = [r_id for r_id, _ in scored_others]
+        """Build preference lists for stable matching from candidate pairs."""
+        graph = build_candidate_graph(requests, block_keys=block_keys)
+        owners = np.concatenate([graph.first, graph.second])
+        others = np.concatenate([graph.second, graph.first])
+        weights = np.concatenate([graph.weights, graph.weights])
+
+        # Group by owner, highest score first, ties broken by request order
+        order = np.lexsort((others, -weights, owners))
+        preferences: dict[UUID, list[UUID]] = {r.id: [] for r in requests}
+        for owner, other in zip(owners[order].tolist(), others[order].tolist()):
+            preferences[graph.request_ids[owner]].append(graph.request_ids[other])
 
         return preferences
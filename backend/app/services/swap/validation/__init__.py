@@ -7,6 +7,14 @@ ACGME compliance, coverage requirements, and skill matching.
 
 from .pre_swap_validator import PreSwapValidator
 from .compliance_checker import ACGMEComplianceChecker
+from .batch_compliance import (
+    CandidateCompliance,
+    RuleViolation,
+    Shift,
+    SwapDelta,
+    evaluate_swap_deltas,
+    evaluate_swaps,
+)
 from .coverage_validator import CoverageValidator
 from .skill_validator import SkillValidator
 
@@ -15,4 +23,10 @@ __all__ = [
     "ACGMEComplianceChecker",
     "CoverageValidator",
     "SkillValidator",
+    "CandidateCompliance",
+    "RuleViolation",
+    "Shift",
+    "SwapDelta",
+    "evaluate_swap_deltas",
+    "evaluate_swaps",
 ]
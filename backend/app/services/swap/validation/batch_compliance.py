@@ -0,0 +1,395 @@
+"""
+Batch ACGME what-if evaluation for swap candidates.
+
+Ranking swap candidates used to re-derive each affected person's duty hours
+from assignments once per candidate. Here the affected people's half-day
+timelines are loaded once, each candidate is a ``SwapDelta`` of removed and
+added shifts, and all deltas are checked against the rolling windows in a
+single vectorized pass:
+
+- 80-hour rule: at most 80 hours/week averaged over any 28 days
+  (6 hours per half-day block, so at most 53 blocks per window)
+- 1-in-7 rule: no more than 6 consecutive worked days
+- Double booking: no more than one assignment per half-day
+
+A candidate only fails a rule when its delta adds work to a window that
+ends up over the limit, so pre-existing violations are not blamed on it.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.assignment import Assignment
+from app.models.block import Block
+
+logger = logging.getLogger(__name__)
+
+# Mirrors EightyHourRuleConstraint / OneInSevenRuleConstraint
+HOURS_PER_BLOCK = 6
+MAX_WEEKLY_HOURS = 80
+ROLLING_DAYS = 28
+MAX_BLOCKS_PER_WINDOW = MAX_WEEKLY_HOURS * (ROLLING_DAYS // 7) // HOURS_PER_BLOCK
+MAX_CONSECUTIVE_DAYS = 6
+
+EIGHTY_HOUR = "EIGHTY_HOUR"
+ONE_IN_SEVEN = "ONE_IN_SEVEN"
+DOUBLE_BOOKED = "DOUBLE_BOOKED"
+
+_SLOTS = {"AM": 0, "PM": 1}
+
+
+@dataclass(frozen=True)
+class Shift:
+    """One half-day assignment of a person."""
+
+    person_id: UUID
+    date: date
+    time_of_day: str
+
+
+@dataclass
+class SwapDelta:
+    """Shifts a candidate swap removes and adds."""
+
+    key: Any
+    removed: list[Shift] = field(default_factory=list)
+    added: list[Shift] = field(default_factory=list)
+
+    @property
+    def shifts(self) -> list[Shift]:
+        """Every shift the swap touches."""
+        return self.removed + self.added
+
+
+@dataclass
+class RuleViolation:
+    """A rule a candidate swap would break for one person."""
+
+    rule: str
+    person_id: UUID
+    window_start: date
+    value: float
+    limit: float
+    message: str
+
+
+@dataclass
+class CandidateCompliance:
+    """What-if compliance verdict for one candidate swap."""
+
+    key: Any
+    compliant: bool
+    violations: list[RuleViolation]
+
+    @property
+    def violated_rules(self) -> list[str]:
+        """Distinct violated rule codes, in first-seen order."""
+        return list(dict.fromkeys(v.rule for v in self.violations))
+
+
+@dataclass
+class DutyHourTimelines:
+    """
+    Half-day assignment counts for a set of people over a date range.
+
+    Attributes:
+        start: First date covered
+        person_index: Person ID -> row in ``slots``
+        slots: Array of shape (people, days, 2) with AM/PM assignment counts
+    """
+
+    start: date
+    person_index: dict[UUID, int]
+    slots: np.ndarray
+
+    @property
+    def days(self) -> int:
+        """Number of days covered."""
+        return self.slots.shape[1]
+
+    def day_offset(self, day: date) -> int:
+        """Column of ``day`` in the timeline.
+
+        Raises:
+            ValueError: If the date is outside the loaded range
+        """
+        offset = (day - self.start).days
+        if not 0 <= offset < self.days:
+            raise ValueError(f"{day} is outside the loaded duty-hour timeline")
+        return offset
+
+
+def swap_delta(key: Any, first: Shift, second: Shift) -> SwapDelta:
+    """Delta for two people trading one half-day shift each."""
+    return SwapDelta(
+        key=key,
+        removed=[first, second],
+        added=[
+            Shift(first.person_id, second.date, second.time_of_day),
+            Shift(second.person_id, first.date, first.time_of_day),
+        ],
+    )
+
+
+async def load_duty_timelines(
+    db: AsyncSession,
+    person_ids: list[UUID],
+    start_date: date,
+    end_date: date,
+) -> DutyHourTimelines:
+    """
+    Load half-day timelines for the people a batch of swaps affects.
+
+    The range is padded by a rolling window on each side so every window
+    containing a changed day is fully covered.
+
+    Args:
+        db: Async database session
+        person_ids: People whose shifts change
+        start_date: Earliest changed date
+        end_date: Latest changed date
+
+    Returns:
+        DutyHourTimelines for the padded range
+    """
+    start = start_date - timedelta(days=ROLLING_DAYS - 1)
+    end = end_date + timedelta(days=ROLLING_DAYS - 1)
+    person_index = {person_id: row for row, person_id in enumerate(dict.fromkeys(person_ids))}
+    slots = np.zeros(
+        (len(person_index), (end - start).days + 1, len(_SLOTS)), dtype=np.int16
+    )
+
+    if person_index:
+        result = await db.execute(
+            select(Assignment.person_id, Block.date, Block.time_of_day)
+            .join(Block, Assignment.block_id == Block.id)
+            .where(
+                and_(
+                    Assignment.person_id.in_(list(person_index)),
+                    Block.date >= start,
+                    Block.date <= end,
+                )
+            )
+        )
+        rows = result.all()
+        if rows:
+            np.add.at(
+                slots,
+                (
+                    np.array([person_index[person_id] for person_id, _, _ in rows]),
+                    np.array([(day - start).days for _, day, _ in rows]),
+                    np.array([_SLOTS.get(tod, 0) for _, _, tod in rows]),
+                ),
+                1,
+            )
+
+    return DutyHourTimelines(start=start, person_index=person_index, slots=slots)
+
+
+def _window_sums(values: np.ndarray, width: int) -> np.ndarray:
+    """Sums over every ``width``-day window along axis 1."""
+    cumulative = np.zeros((values.shape[0], values.shape[1] + 1), dtype=np.int32)
+    np.cumsum(values, axis=1, out=cumulative[:, 1:])
+    return cumulative[:, width:] - cumulative[:, :-width]
+
+
+def _touched_windows(
+    rows: np.ndarray,
+    days: np.ndarray,
+    changes: np.ndarray,
+    width: int,
+    windows: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Net change to every ``width``-day window containing a changed day.
+
+    Args:
+        rows: Row of each changed (row, day)
+        days: Day offset of each changed (row, day)
+        changes: Net change on that day
+        width: Window width in days
+        windows: Number of windows in the timeline
+
+    Returns:
+        (rows, window starts, net changes), ordered by row then window
+    """
+    starts = np.repeat(days, width) - np.tile(np.arange(width), len(days))
+    valid = (starts >= 0) & (starts < windows)
+    keys = np.repeat(rows, width)[valid] * windows + starts[valid]
+    touched, inverse = np.unique(keys, return_inverse=True)
+    totals = np.bincount(
+        inverse, weights=np.repeat(changes, width)[valid], minlength=len(touched)
+    ).astype(np.int32)
+    touched_rows, touched_starts = np.divmod(touched, windows)
+    return touched_rows, touched_starts, totals
+
+
+def evaluate_swap_deltas(
+    timelines: DutyHourTimelines, deltas: list[SwapDelta]
+) -> list[CandidateCompliance]:
+    """
+    Check every candidate swap against the rolling-window rules at once.
+
+    Each (candidate, affected person) pair becomes one row. Baseline window
+    sums are computed once per person; a row only re-evaluates the days its
+    shifts change and the windows containing them, so the cost is one pass
+    over people x days plus the shifts the candidates touch.
+
+    Args:
+        timelines: Timelines covering every affected person and date
+        deltas: Candidate swaps
+
+    Returns:
+        One CandidateCompliance per delta, in input order
+    """
+    row_keys: dict[tuple[int, UUID], int] = {}
+    rows, days, slots, changes = [], [], [], []
+    for index, delta in enumerate(deltas):
+        for shift, change in [(s, -1) for s in delta.removed] + [
+            (s, 1) for s in delta.added
+        ]:
+            if shift.person_id not in timelines.person_index:
+                raise ValueError(f"No duty-hour timeline loaded for {shift.person_id}")
+            rows.append(row_keys.setdefault((index, shift.person_id), len(row_keys)))
+            days.append(timelines.day_offset(shift.date))
+            slots.append(_SLOTS.get(shift.time_of_day, 0))
+            changes.append(change)
+
+    violations: list[list[RuleViolation]] = [[] for _ in deltas]
+    if row_keys:
+        row_info = list(row_keys)
+        people = np.array([timelines.person_index[person] for _, person in row_info])
+
+        # Before/after AM/PM counts of each changed (row, day) only
+        day_keys = np.array(rows, dtype=np.int64) * timelines.days + np.array(days)
+        touched, inverse = np.unique(day_keys, return_inverse=True)
+        touched_rows, touched_days = np.divmod(touched, timelines.days)
+        before = timelines.slots[people[touched_rows], touched_days].astype(np.int32)
+        after = before.copy()
+        np.add.at(after, (inverse, np.array(slots)), changes)
+        np.maximum(after, 0, out=after)
+
+        blocks_before, blocks_after = before.sum(axis=1), after.sum(axis=1)
+        checks = [
+            (
+                DOUBLE_BOOKED,
+                touched_rows,
+                touched_days,
+                after.max(axis=1),
+                after.max(axis=1) - before.max(axis=1),
+                1,
+                "{value:.0f} assignments in one half-day",
+            ),
+        ]
+        baseline_blocks = timelines.slots.sum(axis=2, dtype=np.int32)
+        if timelines.days >= ROLLING_DAYS:
+            baseline = _window_sums(baseline_blocks, ROLLING_DAYS)
+            window_rows, starts, delta_sums = _touched_windows(
+                touched_rows,
+                touched_days,
+                blocks_after - blocks_before,
+                ROLLING_DAYS,
+                baseline.shape[1],
+            )
+            checks.append(
+                (
+                    EIGHTY_HOUR,
+                    window_rows,
+                    starts,
+                    baseline[people[window_rows], starts] + delta_sums,
+                    delta_sums,
+                    MAX_BLOCKS_PER_WINDOW,
+                    "{hours:.1f} hours/week averaged over 4 weeks",
+                )
+            )
+        if timelines.days > MAX_CONSECUTIVE_DAYS:
+            width = MAX_CONSECUTIVE_DAYS + 1
+            baseline = _window_sums((baseline_blocks > 0).astype(np.int32), width)
+            window_rows, starts, delta_sums = _touched_windows(
+                touched_rows,
+                touched_days,
+                (blocks_after > 0).astype(np.int32) - (blocks_before > 0),
+                width,
+                baseline.shape[1],
+            )
+            checks.append(
+                (
+                    ONE_IN_SEVEN,
+                    window_rows,
+                    starts,
+                    baseline[people[window_rows], starts] + delta_sums,
+                    delta_sums,
+                    MAX_CONSECUTIVE_DAYS,
+                    "{value:.0f} consecutive days without a day off",
+                )
+            )
+
+        for rule, check_rows, starts, value_after, added, limit, template in checks:
+            # Over the limit, and made worse by this candidate's delta; entries
+            # are ordered by row then window, so the first hit is the earliest
+            failing = (value_after > limit) & (added > 0)
+            reported: set[int] = set()
+            for entry in np.nonzero(failing)[0]:
+                row = int(check_rows[entry])
+                if row in reported:
+                    continue
+                reported.add(row)
+                value = float(value_after[entry])
+                index, person_id = row_info[row]
+                violations[index].append(
+                    RuleViolation(
+                        rule=rule,
+                        person_id=person_id,
+                        window_start=timelines.start
+                        + timedelta(days=int(starts[entry])),
+                        value=value,
+                        limit=float(limit),
+                        message=template.format(
+                            value=value,
+                            hours=value * HOURS_PER_BLOCK / (ROLLING_DAYS // 7),
+                        ),
+                    )
+                )
+
+    return [
+        CandidateCompliance(
+            key=delta.key, compliant=not found, violations=found
+        )
+        for delta, found in zip(deltas, violations)
+    ]
+
+
+async def evaluate_swaps(
+    db: AsyncSession, deltas: list[SwapDelta]
+) -> list[CandidateCompliance]:
+    """
+    Load the affected timelines once and evaluate every candidate swap.
+
+    Args:
+        db: Async database session
+        deltas: Candidate swaps
+
+    Returns:
+        One CandidateCompliance per delta, in input order
+    """
+    shifts = [shift for delta in deltas for shift in delta.shifts]
+    if not shifts:
+        return [CandidateCompliance(delta.key, True, []) for delta in deltas]
+
+    dates = [shift.date for shift in shifts]
+    timelines = await load_duty_timelines(
+        db, [shift.person_id for shift in shifts], min(dates), max(dates)
+    )
+    results = evaluate_swap_deltas(timelines, deltas)
+    logger.debug(
+        f"Evaluated {len(deltas)} swap candidates over "
+        f"{len(timelines.person_index)} people x {timelines.days} days"
+    )
+    return results
@@ -19,11 +19,13 @@ Order of Operations (per TAMC skill):
 10. Load protected time (SIM, PI, MM)
 """
 
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from datetime import date, timedelta
 from uuid import UUID
 
 from sqlalchemy import or_, select
-from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.exceptions import ActivityNotFoundError
@@ -40,7 +42,6 @@ from app.models.rotation_template import RotationTemplate
 from app.models.weekly_pattern import WeeklyPattern
 from app.models.resident_call_preload import ResidentCallPreload
 from app.utils.academic_blocks import get_block_dates, get_block_number_for_date
-from app.utils.fmc_capacity import activity_counts_toward_fmc_capacity
 
 # Shared preload logic — extracted to eliminate duplication with async service
 from app.services.preload import (
@@ -49,6 +50,9 @@ from app.services.preload import (
     NIGHT_FLOAT_ROTATIONS,
     OFFSITE_ROTATIONS,
     ROTATION_TO_ACTIVITY,
+    LoaderTimer,
+    PreloadBatch,
+    PreloadRunStats,
     TemplateCache,
     canonical_rotation_code,
     get_rotation_codes,
@@ -66,12 +70,18 @@ class SyncPreloadService:
 
     All preloaded assignments have source='preload' and are locked
     (cannot be overwritten by solver).
+
+    Loaders propose slots to a ``PreloadBatch`` that indexes the block's
+    existing half-day slots once and writes the result in bulk.
     """
 
     def __init__(self, session: Session) -> None:
         self.session = session
         self._activity_cache = ActivityCache(session)
         self._template_cache = TemplateCache(session)
+        self._batch: PreloadBatch | None = None
+        self._activities: list[Activity] | None = None
+        self.last_run_stats: PreloadRunStats | None = None
 
     # ------------------------------------------------------------------
     # Orchestrator
@@ -107,41 +117,134 @@ class SyncPreloadService:
         )
 
         total = 0
+        stats = PreloadRunStats(block_number=block_number, academic_year=academic_year)
+        self.last_run_stats = stats
 
         if skip_faculty_call:
             cleared = self._clear_faculty_call_preloads(start_date, end_date)
             if cleared:
                 logger.info(f"Cleared {cleared} stale faculty call PCAT/DO preloads")
 
-        total += self._load_absences(start_date, end_date, block_number, academic_year)
-        total += self._load_institutional_events(start_date, end_date)
-        total += self._load_rotation_protected_preloads(block_number, academic_year)
-        total += self._load_inpatient_preloads(start_date, end_date)
-        total += self._load_fmit_call(start_date, end_date)
-        total += self._load_post_fmit_recovery(start_date, end_date)
-        total += self._load_inpatient_clinic(block_number, academic_year)
-        total += self._load_resident_call(start_date, end_date)
-
-        if not skip_faculty_call:
-            total += self._load_faculty_call(start_date, end_date)
-        else:
-            logger.info("Skipping faculty call PCAT/DO (engine creates from NEW call)")
-
-        total += self._load_sm_preloads(start_date, end_date)
-        total += self._load_nf_continuity(
-            block_number, academic_year, start_date, end_date
-        )
-        total += self._load_faculty_sm_clinic(start_date, end_date)
-        total += self._load_faculty_wednesday_pm_lec(start_date, end_date)
+        # PCAT/DO after a call on the block's last day fall on the next day
+        with self._preload_batch(
+            start_date, end_date + timedelta(days=1), stats=stats
+        ):
+            run = self._run_loader
+            total += run(
+                stats,
+                "absences",
+                self._load_absences,
+                start_date,
+                end_date,
+                block_number,
+                academic_year,
+            )
+            total += run(
+                stats,
+                "institutional_events",
+                self._load_institutional_events,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats,
+                "rotation_protected",
+                self._load_rotation_protected_preloads,
+                block_number,
+                academic_year,
+            )
+            total += run(
+                stats,
+                "inpatient",
+                self._load_inpatient_preloads,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats, "fmit_call", self._load_fmit_call, start_date, end_date
+            )
+            total += run(
+                stats,
+                "post_fmit_recovery",
+                self._load_post_fmit_recovery,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats,
+                "inpatient_clinic",
+                self._load_inpatient_clinic,
+                block_number,
+                academic_year,
+            )
+            total += run(
+                stats, "resident_call", self._load_resident_call, start_date, end_date
+            )
 
-        total += self._load_compound_rotation_weekends(
-            block_number, academic_year, start_date, end_date
-        )
+            if not skip_faculty_call:
+                total += run(
+                    stats,
+                    "faculty_call",
+                    self._load_faculty_call,
+                    start_date,
+                    end_date,
+                )
+            else:
+                logger.info(
+                    "Skipping faculty call PCAT/DO (engine creates from NEW call)"
+                )
+
+            total += run(stats, "sm", self._load_sm_preloads, start_date, end_date)
+            total += run(
+                stats,
+                "nf_continuity",
+                self._load_nf_continuity,
+                block_number,
+                academic_year,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats,
+                "faculty_sm_clinic",
+                self._load_faculty_sm_clinic,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats,
+                "faculty_wednesday_pm_lec",
+                self._load_faculty_wednesday_pm_lec,
+                start_date,
+                end_date,
+            )
+            total += run(
+                stats,
+                "compound_rotation_weekends",
+                self._load_compound_rotation_weekends,
+                block_number,
+                academic_year,
+                start_date,
+                end_date,
+            )
 
         self.session.flush()
         logger.info(f"Loaded {total} preload assignments")
+        logger.info(stats.summary())
         return total
 
+    def _run_loader(
+        self,
+        stats: PreloadRunStats,
+        name: str,
+        loader: Callable[..., int],
+        *args: object,
+    ) -> int:
+        """Run one loader and record its time, rows and candidate slots."""
+        with LoaderTimer(stats, name, self._batch) as loader_stats:
+            loader_stats.rows = loader(*args)
+        return loader_stats.rows
+
     # ------------------------------------------------------------------
     # Phase loaders (DB-dependent)
     # ------------------------------------------------------------------
@@ -308,22 +411,23 @@ class SyncPreloadService:
             )
 
         count = 0
-        for absence in absences:
-            if not getattr(absence, "should_block_assignment", True):
-                continue
-            current = max(absence.start_date, start_date)
-            end = min(absence.end_date, end_date)
-            while current <= end:
-                if current not in ineligible_dates:
-                    if lv_am_id and self._create_preload(
-                        person_id, current, "AM", lv_am_id
-                    ):
-                        count += 1
-                    if lv_pm_id and self._create_preload(
-                        person_id, current, "PM", lv_pm_id
-                    ):
-                        count += 1
-                current += timedelta(days=1)
+        with self._preload_batch(start_date, end_date, person_ids=[person_id]):
+            for absence in absences:
+                if not getattr(absence, "should_block_assignment", True):
+                    continue
+                current = max(absence.start_date, start_date)
+                end = min(absence.end_date, end_date)
+                while current <= end:
+                    if current not in ineligible_dates:
+                        if lv_am_id and self._create_preload(
+                            person_id, current, "AM", lv_am_id
+                        ):
+                            count += 1
+                        if lv_pm_id and self._create_preload(
+                            person_id, current, "PM", lv_pm_id
+                        ):
+                            count += 1
+                    current += timedelta(days=1)
 
         self.session.flush()
         logger.info(
@@ -1288,6 +1392,51 @@ class SyncPreloadService:
     # DB helpers
     # ------------------------------------------------------------------
 
+    @contextmanager
+    def _preload_batch(
+        self,
+        start_date: date,
+        end_date: date,
+        person_ids: list[UUID] | None = None,
+        stats: PreloadRunStats | None = None,
+    ) -> Iterator[PreloadBatch]:
+        """
+        Open a preload batch over a date range and write it on exit.
+
+        Existing slots in the range are indexed with one query; preloads
+        proposed while the batch is open are resolved against the index and
+        written in bulk when the block exits without error.
+        """
+        started = time.perf_counter()
+        batch = PreloadBatch(
+            start_date, end_date, person_ids, context="sync_preload_service"
+        )
+        if self._activities is None:
+            self._activities = list(
+                self.session.execute(PreloadBatch.activity_query()).scalars().all()
+            )
+        batch.load(self.session.execute(batch.slot_query()).all(), self._activities)
+        if stats:
+            stats.index_seconds += time.perf_counter() - started
+            stats.slots_indexed += batch.slots_indexed
+
+        previous, self._batch = self._batch, batch
+        try:
+            yield batch
+        finally:
+            self._batch = previous
+
+        started = time.perf_counter()
+        inserted, updated = batch.pending_writes
+        self.session.flush()
+        for stmt, rows in batch.write_statements(self.session):
+            self.session.execute(stmt, rows)
+        batch.expire_updated(self.session)
+        if stats:
+            stats.write_seconds += time.perf_counter() - started
+            stats.inserted += inserted
+            stats.updated += updated
+
     def _create_preload(
         self,
         person_id: UUID,
@@ -1296,9 +1445,12 @@ class SyncPreloadService:
         activity_id: UUID,
     ) -> bool:
         """
-        Create a preload assignment (race-condition safe).
+        Propose a preload assignment to the open batch.
+
+        Loaders called on their own (outside ``load_all_preloads``) write
+        the slot through a single-slot batch.
 
-        Returns True if created, False if already exists.
+        Returns True if the slot was created or changed, False if kept.
         """
         if not activity_id:
             logger.error(
@@ -1308,97 +1460,12 @@ class SyncPreloadService:
             raise ActivityNotFoundError(
                 "<missing activity_id>", context="sync_preload_service"
             )
-        activity = self.session.get(Activity, activity_id) if activity_id else None
-        capacity_flag = (
-            activity_counts_toward_fmc_capacity(activity) if activity else None
-        )
 
-        stmt = select(HalfDayAssignment).where(
-            HalfDayAssignment.person_id == person_id,
-            HalfDayAssignment.date == date_val,
-            HalfDayAssignment.time_of_day == time_of_day,
-        )
-        existing = self.session.execute(stmt).scalars().first()
+        if self._batch is not None and self._batch.covers(person_id, date_val):
+            return self._batch.propose(person_id, date_val, time_of_day, activity_id)
 
-        if existing:
-            if existing.source in (
-                AssignmentSource.TEMPLATE.value,
-                AssignmentSource.SOLVER.value,
-            ):
-                existing.activity_id = activity_id
-                existing.source = AssignmentSource.PRELOAD.value
-                existing.counts_toward_fmc_capacity = capacity_flag
-                return True
-            if (
-                existing.source == AssignmentSource.PRELOAD.value
-                and existing.activity_id is None
-                and activity_id
-            ):
-                existing.activity_id = activity_id
-                existing.counts_toward_fmc_capacity = capacity_flag
-                return True
-            if existing.source == AssignmentSource.PRELOAD.value:
-                existing_activity = (
-                    self.session.get(Activity, existing.activity_id)
-                    if existing.activity_id
-                    else None
-                )
-                new_is_time_off = activity is not None and (
-                    (activity.activity_category or "").lower() == "time_off"
-                    or activity.counts_toward_clinical_hours is False
-                )
-                existing_is_time_off = existing_activity and (
-                    (existing_activity.activity_category or "").lower() == "time_off"
-                    or existing_activity.counts_toward_clinical_hours is False
-                )
-                if new_is_time_off and not existing_is_time_off:
-                    existing.activity_id = activity_id
-                    existing.counts_toward_fmc_capacity = capacity_flag
-                    return True
-            if existing.source == AssignmentSource.PRELOAD.value:
-                if (
-                    existing.activity_id == activity_id
-                    and capacity_flag is not None
-                    and existing.counts_toward_fmc_capacity != capacity_flag
-                ):
-                    existing.counts_toward_fmc_capacity = capacity_flag
-                    return True
-            return False
-
-        assignment = HalfDayAssignment(
-            person_id=person_id,
-            date=date_val,
-            time_of_day=time_of_day,
-            activity_id=activity_id,
-            counts_toward_fmc_capacity=capacity_flag,
-            source=AssignmentSource.PRELOAD.value,
-        )
-        self.session.add(assignment)
-
-        try:
-            self.session.flush()
-            return True
-        except IntegrityError as e:
-            self.session.rollback()
-            error_str = str(e.orig).lower() if e.orig else str(e).lower()
-            is_duplicate = (
-                (hasattr(e.orig, "pgcode") and e.orig.pgcode == "23505")
-                or "unique constraint" in error_str
-                or "uq_half_day_assignment_person_date_time" in error_str
-            )
-            if is_duplicate:
-                logger.debug(
-                    f"Preload already exists for person_id={person_id}, "
-                    f"date={date_val}, time_of_day={time_of_day}"
-                )
-                return False
-            pgcode = getattr(e.orig, "pgcode", "unknown")
-            logger.error(
-                f"Unexpected IntegrityError (pgcode={pgcode}): {e.orig}. "
-                f"person_id={person_id}, date={date_val}, time_of_day={time_of_day}, "
-                f"activity_id={activity_id}"
-            )
-            raise
+        with self._preload_batch(date_val, date_val, person_ids=[person_id]) as batch:
+            return batch.propose(person_id, date_val, time_of_day, activity_id)
 
     def _is_on_fmit(self, person_id: UUID, date_val: date) -> bool:
         stmt = select(InpatientPreload).where(
@@ -9,6 +9,7 @@ import plotly.graph_objects as go
 import plotly.io as pio
 from sqlalchemy.orm import Session
 
+from app.db.rollups import person_day_counts, rotation_day_counts
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.call_assignment import CallAssignment
@@ -75,30 +76,12 @@ class UnifiedHeatmapService:
         rotation_ids = [r.id for r in rotations]
 
         # Build coverage map: (rotation_id, date) -> count of people assigned
-        coverage_map: dict[tuple[UUID, date], int] = defaultdict(int)
-
-        # Get all assignments in range
-        assignments = (
-            db.query(Assignment)
-            .join(Block, Assignment.block_id == Block.id)
-            .filter(
-                Block.date >= start_date,
-                Block.date <= end_date,
-                (
-                    Assignment.rotation_template_id.in_(rotation_ids)
-                    if rotation_ids
-                    else False
-                ),
-            )
-            .all()
+        coverage_map = (
+            rotation_day_counts(db, start_date, end_date, rotation_ids)
+            if rotation_ids
+            else {}
         )
 
-        # Count assignments per rotation per date
-        for assignment in assignments:
-            if assignment.rotation_template_id:
-                key = (assignment.rotation_template_id, assignment.block.date)
-                coverage_map[key] += 1
-
         # Build z_values matrix (coverage count per day per rotation)
         z_values = []
         total_assignments = 0
@@ -326,22 +309,10 @@ class UnifiedHeatmapService:
 
         # Build assignment map: (person_id, date) -> count
         assignment_map: dict[tuple[UUID, date], float] = defaultdict(float)
-
-        # Get regular assignments
-        assignments = (
-            db.query(Assignment)
-            .join(Block, Assignment.block_id == Block.id)
-            .filter(
-                Block.date >= start_date,
-                Block.date <= end_date,
-                Assignment.person_id.in_(person_id_list) if person_id_list else False,
+        if person_id_list:
+            assignment_map.update(
+                person_day_counts(db, start_date, end_date, person_ids)
             )
-            .all()
-        )
-
-        for assignment in assignments:
-            key = (assignment.person_id, assignment.block.date)
-            assignment_map[key] += 1
 
         # Add call assignments if requested
         if include_call:
@@ -0,0 +1,249 @@
+"""In-process approximate nearest-neighbour index for RAG embeddings.
+
+Used by RAGService when the database has no pgvector (SQLite, test runs).
+Vectors are L2-normalized so inner product equals cosine similarity.
+
+Small corpora are searched exactly with one matrix-vector product. Once the
+index grows past ``train_threshold`` rows it trains an inverted-file (IVF)
+partition with spherical k-means and only scores the ``nprobe`` closest
+lists, the same scheme as pgvector's IVFFlat and FAISS ``IndexIVFFlat``.
+Searches that come back short (selective filters, high thresholds) widen
+``nprobe`` until enough hits are found or every list has been scanned.
+"""
+
+import logging
+from collections.abc import Sequence
+from typing import Any
+from uuid import UUID
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class VectorIndex:
+    """Cosine-similarity index over document chunk embeddings.
+
+    Args:
+        dim: Embedding dimensions
+        nprobe: IVF lists scanned per query before widening
+        train_threshold: Rows at which the IVF partition is first trained
+        seed: Seed for k-means initialization
+    """
+
+    def __init__(
+        self,
+        dim: int = 384,
+        nprobe: int = 8,
+        train_threshold: int = 20_000,
+        seed: int = 0,
+    ) -> None:
+        self.dim = dim
+        self.nprobe = nprobe
+        self.train_threshold = train_threshold
+        self.seed = seed
+        self.signature: Any = None
+
+        self._vectors = np.empty((0, dim), dtype=np.float32)
+        self._ids: list[UUID] = []
+        self._row_of: dict[UUID, int] = {}
+        self._type_codes = np.empty(0, dtype=np.int32)
+        self._type_code_of: dict[str, int] = {}
+        self._metadata: list[dict[str, Any]] = []
+        self._alive = np.empty(0, dtype=bool)
+        self._size = 0
+
+        self._centroids: np.ndarray | None = None
+        self._lists = np.empty(0, dtype=np.int32)
+        self._trained_at = 0
+
+    def __len__(self) -> int:
+        return int(self._alive[: self._size].sum())
+
+    @property
+    def is_trained(self) -> bool:
+        return self._centroids is not None
+
+    def add(
+        self,
+        ids: Sequence[UUID],
+        embeddings: Sequence[Sequence[float]] | np.ndarray,
+        doc_types: Sequence[str],
+        metadata: Sequence[dict[str, Any]] | None = None,
+    ) -> None:
+        """Add (or replace) chunks.
+
+        Args:
+            ids: Chunk IDs
+            embeddings: One embedding per chunk
+            doc_types: Document type per chunk
+            metadata: Metadata per chunk (for metadata filters)
+        """
+        if not ids:
+            return
+        self.remove([i for i in ids if i in self._row_of])
+
+        vectors = _normalize(np.asarray(embeddings, dtype=np.float32))
+        n = len(ids)
+        self._reserve(self._size + n)
+        rows = slice(self._size, self._size + n)
+        self._vectors[rows] = vectors
+        self._alive[rows] = True
+        self._type_codes[rows] = [self._type_code(t) for t in doc_types]
+        self._metadata.extend(metadata or [{} for _ in range(n)])
+        for offset, chunk_id in enumerate(ids):
+            self._row_of[chunk_id] = self._size + offset
+        self._ids.extend(ids)
+        if self.is_trained:
+            self._lists[rows] = self._assign(vectors)
+        self._size += n
+
+        # Retrain as the corpus outgrows the partition
+        if len(self) >= max(self.train_threshold, 4 * self._trained_at):
+            self.train()
+
+    def remove(self, ids: Sequence[UUID]) -> int:
+        """Drop chunks by ID, returning how many were present."""
+        removed = 0
+        for chunk_id in ids:
+            row = self._row_of.pop(chunk_id, None)
+            if row is not None:
+                self._alive[row] = False
+                removed += 1
+        return removed
+
+    def train(self, iterations: int = 10) -> None:
+        """Partition the live vectors into ~sqrt(n) lists with spherical k-means."""
+        live = np.flatnonzero(self._alive[: self._size])
+        nlist = max(1, int(np.sqrt(len(live))))
+        rng = np.random.default_rng(self.seed)
+        sample = live[rng.permutation(len(live))[: nlist * 64]]
+        data = self._vectors[sample]
+        centroids = data[rng.choice(len(data), nlist, replace=False)]
+        for _ in range(iterations):
+            assign = np.argmax(data @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assign, data)
+            empty = np.bincount(assign, minlength=nlist) == 0
+            sums[empty] = centroids[empty]
+            centroids = _normalize(sums)
+
+        self._centroids = centroids
+        self._lists[: self._size] = self._assign(self._vectors[: self._size])
+        self._trained_at = len(live)
+        logger.info(f"Trained IVF index with {nlist} lists over {len(live)} vectors")
+
+    def search(
+        self,
+        query: Sequence[float] | np.ndarray,
+        top_k: int = 5,
+        doc_type: str | None = None,
+        metadata_filters: dict[str, Any] | None = None,
+        min_similarity: float = 0.0,
+    ) -> list[tuple[UUID, float]]:
+        """Most similar chunks to a query embedding.
+
+        Args:
+            query: Query embedding
+            top_k: Maximum results
+            doc_type: Only chunks of this document type
+            metadata_filters: Only chunks whose metadata values match
+                (compared as strings, like the SQL path)
+            min_similarity: Minimum cosine similarity
+
+        Returns:
+            (chunk ID, similarity) pairs, most similar first
+        """
+        if top_k <= 0 or not self._size:
+            return []
+        q = _normalize(np.asarray(query, dtype=np.float32)[np.newaxis, :])[0]
+
+        type_code = None
+        if doc_type is not None:
+            type_code = self._type_code_of.get(doc_type)
+            if type_code is None:
+                return []
+
+        if not self.is_trained:
+            rows = np.arange(self._size)
+            return self._search_rows(
+                q, rows, top_k, type_code, metadata_filters, min_similarity
+            )
+
+        # Widen the probe until enough hits are found or all lists are scanned
+        order = np.argsort(-(self._centroids @ q))
+        nprobe = min(self.nprobe, len(order))
+        while True:
+            rows = np.flatnonzero(np.isin(self._lists[: self._size], order[:nprobe]))
+            hits = self._search_rows(
+                q, rows, top_k, type_code, metadata_filters, min_similarity
+            )
+            if len(hits) >= top_k or nprobe >= len(order):
+                return hits
+            nprobe = min(2 * nprobe, len(order))
+
+    def _search_rows(
+        self,
+        q: np.ndarray,
+        rows: np.ndarray,
+        top_k: int,
+        type_code: int | None,
+        metadata_filters: dict[str, Any] | None,
+        min_similarity: float,
+    ) -> list[tuple[UUID, float]]:
+        keep = self._alive[rows]
+        if type_code is not None:
+            keep &= self._type_codes[rows] == type_code
+        rows = rows[keep]
+        scores = self._vectors[rows] @ q
+        passing = scores >= min_similarity
+        rows, scores = rows[passing], scores[passing]
+
+        if not metadata_filters and len(rows) > top_k:
+            best = np.argpartition(-scores, top_k - 1)[:top_k]
+            rows, scores = rows[best], scores[best]
+        order = np.argsort(-scores, kind="stable")
+
+        hits: list[tuple[UUID, float]] = []
+        for i in order:
+            row = rows[i]
+            if metadata_filters and not _matches(self._metadata[row], metadata_filters):
+                continue
+            hits.append((self._ids[row], float(min(1.0, scores[i]))))
+            if len(hits) == top_k:
+                break
+        return hits
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        return np.argmax(vectors @ self._centroids.T, axis=1).astype(np.int32)
+
+    def _type_code(self, doc_type: str) -> int:
+        return self._type_code_of.setdefault(doc_type, len(self._type_code_of))
+
+    def _reserve(self, rows: int) -> None:
+        capacity = len(self._vectors)
+        if rows <= capacity:
+            return
+        capacity = max(rows, 2 * capacity, 1024)
+        self._vectors = _grow(self._vectors, capacity)
+        self._type_codes = _grow(self._type_codes, capacity)
+        self._alive = _grow(self._alive, capacity)
+        self._lists = _grow(self._lists, capacity)
+
+
+def _normalize(vectors: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+    return vectors / np.where(norms > 0, norms, 1.0)
+
+
+def _grow(array: np.ndarray, capacity: int) -> np.ndarray:
+    grown = np.zeros((capacity,) + array.shape[1:], dtype=array.dtype)
+    grown[: len(array)] = array
+    return grown
+
+
+def _matches(metadata: dict[str, Any], filters: dict[str, Any]) -> bool:
+    return all(
+        key in metadata and str(metadata[key]) == str(value)
+        for key, value in filters.items()
+    )
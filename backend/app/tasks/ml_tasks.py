@@ -88,6 +88,7 @@ def train_ml_models(
             TrainingDataPipeline,
             WorkloadOptimizer,
         )
+        from app.ml.inference.model_registry import get_model_registry
 
         # Determine which models to train
         if model_types is None:
@@ -117,6 +118,7 @@ def train_ml_models(
                     metrics = predictor.train(X, y)
                     model_path = models_dir / "preference_predictor"
                     predictor.save(model_path)
+                    get_model_registry().publish("preference", model_path, predictor)
                     results["preference"] = {
                         "status": "trained",
                         "samples": len(X),
@@ -151,6 +153,7 @@ def train_ml_models(
                     metrics = predictor.train(X, y)
                     model_path = models_dir / "conflict_predictor"
                     predictor.save(model_path)
+                    get_model_registry().publish("conflict", model_path, predictor)
                     results["conflict"] = {
                         "status": "trained",
                         "samples": len(X),
@@ -182,6 +185,7 @@ def train_ml_models(
                     metrics = optimizer.train(X, y)
                     model_path = models_dir / "workload_optimizer"
                     optimizer.save(model_path)
+                    get_model_registry().publish("workload", model_path, optimizer)
                     results["workload"] = {
                         "status": "trained",
                         "samples": len(X),
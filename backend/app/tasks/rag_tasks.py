@@ -183,92 +183,69 @@ def initialize_embeddings(
 
         logger.info(f"Processing {len(files)} document(s)")
 
-        # Process each document
-        results = []
-        total_chunks = 0
+        # Reindex all documents together: unchanged chunks keep their rows and
+        # embeddings, and new chunks are embedded in parallel batches.
+        # Only chunks of each source file are touched, so other files that
+        # share a doc_type bucket are left alone.
+        from app.services.rag_service import SourceDocument
 
+        results = []
+        sources = []
         for filepath in files:
             filename = filepath.name
-            doc_type = DOC_TYPE_MAP.get(filename, filename.replace(".md", ""))
-
-            logger.info(f"Processing {filename} (type: {doc_type})")
-
-            try:
-                # Read content
-                content = filepath.read_text(encoding="utf-8")
-
-                if not content.strip():
-                    logger.warning(f"Document {filename} is empty, skipping")
-                    results.append(
-                        {
-                            "filename": filename,
-                            "status": "skipped",
-                            "reason": "empty_content",
-                        }
-                    )
-                    continue
-
-                # Clear existing chunks for this source file only (idempotent).
-                # Avoid deleting other files that share the same doc_type bucket.
-                if not force_refresh:  # Already cleared if force_refresh
-                    existing_count = rag_service.delete_by_source_filename(filename)
-                    if existing_count > 0:
-                        logger.info(
-                            f"Cleared {existing_count} existing chunks for {filename}"
-                        )
-
-                # Ingest document
-                metadata = {
-                    "filename": filename,
-                    "source": "docs/rag-knowledge",
-                    "file_size": len(content),
-                    "task_id": self.request.id,
-                }
-
-                ingest_result = _run_async(
-                    rag_service.ingest_document(
-                        content=content,
-                        doc_type=doc_type,
-                        metadata=metadata,
-                        chunk_size=chunk_size,
-                        chunk_overlap=chunk_overlap,
-                    )
+            content = filepath.read_text(encoding="utf-8")
+            if not content.strip():
+                logger.warning(f"Document {filename} is empty, skipping")
+                results.append(
+                    {
+                        "filename": filename,
+                        "status": "skipped",
+                        "reason": "empty_content",
+                    }
+                )
+                continue
+            sources.append(
+                SourceDocument(
+                    filename=filename,
+                    content=content,
+                    doc_type=DOC_TYPE_MAP.get(filename, filename.replace(".md", "")),
+                    metadata={
+                        "source": "docs/rag-knowledge",
+                        "file_size": len(content),
+                        "task_id": self.request.id,
+                    },
                 )
+            )
 
-                if ingest_result.status == "success":
-                    logger.info(
-                        f"✓ Created {ingest_result.chunks_created} chunks for {filename}"
-                    )
-                    results.append(
-                        {
-                            "filename": filename,
-                            "status": "success",
-                            "chunks_created": ingest_result.chunks_created,  # type: ignore[dict-item]
-                            "doc_type": doc_type,
-                        }
-                    )
-                    total_chunks += ingest_result.chunks_created
-                else:
-                    logger.error(
-                        f"✗ Failed to ingest {filename}: {ingest_result.message}"
-                    )
-                    results.append(
-                        {
-                            "filename": filename,
-                            "status": "error",
-                            "error": ingest_result.message,
-                            "doc_type": doc_type,
-                        }
-                    )
-
-            except Exception as e:
-                logger.error(f"Error processing {filename}", exc_info=True)
+        ingest_results = _run_async(
+            rag_service.reindex_sources(
+                sources, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+            )
+        )
+
+        total_chunks = 0
+        for source, ingest_result in zip(sources, ingest_results):
+            if ingest_result.status == "success":
+                logger.info(f"✓ {source.filename}: {ingest_result.message}")
                 results.append(
                     {
-                        "filename": filename,
+                        "filename": source.filename,
+                        "status": "success",
+                        "chunks_created": ingest_result.chunks_created,  # type: ignore[dict-item]
+                        "doc_type": source.doc_type,
+                    }
+                )
+                total_chunks += ingest_result.chunks_created
+            else:
+                logger.error(
+                    f"✗ Failed to ingest {source.filename}: {ingest_result.message}"
+                )
+                results.append(
+                    {
+                        "filename": source.filename,
                         "status": "error",
-                        "error": "Operation failed",
-                        "doc_type": doc_type,
+                        "error": ingest_result.message,
+                        "doc_type": source.doc_type,
                     }
                 )
 
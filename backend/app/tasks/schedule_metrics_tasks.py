@@ -6,6 +6,7 @@ Provides automated background tasks for:
 - Computing version diffs between schedule versions
 - Taking periodic metrics snapshots
 - Cleaning up old snapshot data
+- Rebuilding stale schedule rollups
 
 Tasks integrate with AnalyticsEngine and StabilityMetricsComputer.
 """
@@ -379,6 +380,67 @@ def cleanup_old_snapshots(
         db.close()
 
 
+@shared_task(
+    bind=True,
+    name="app.tasks.schedule_metrics_tasks.refresh_schedule_rollups",
+    max_retries=2,
+    default_retry_delay=60,
+)
+def refresh_schedule_rollups(self) -> dict[str, Any]:
+    """
+    Reconcile every schedule rollup with the raw assignments.
+
+    Assignment edits keep the rollups current in their own transaction; this
+    task picks up the changes that only mark them stale (bulk updates and
+    deletes, template renames), debouncing bursts into one rebuild per beat.
+    Rollups marked fresh are compared with a fresh aggregation too, and
+    rebuilt if they drifted. Readers never rebuild; they enqueue this task
+    when they find a stale rollup.
+
+    Returns:
+        Dict with the rebuilt rollup names and their refresh status
+
+    Raises:
+        Retries on failure up to max_retries
+    """
+    from app.db.rollups import ROLLUPS, get_rollup_status, reconcile_rollup
+    from app.db.session import task_session_scope
+
+    try:
+        rebuilt = []
+        # One short transaction per rollup keeps the rebuild lock brief
+        for name in ROLLUPS:
+            with task_session_scope() as db:
+                if reconcile_rollup(db, name):
+                    rebuilt.append(name)
+        with task_session_scope() as db:
+            status = get_rollup_status(db)
+
+        if rebuilt:
+            logger.info(f"Rebuilt schedule rollups: {', '.join(rebuilt)}")
+
+        return {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "rebuilt": rebuilt,
+            "rollups": {
+                name: {
+                    "refreshed_at": (
+                        state["refreshed_at"].isoformat()
+                        if state["refreshed_at"]
+                        else None
+                    ),
+                    "row_count": state["row_count"],
+                }
+                for name, state in status.items()
+            },
+            "task_status": "completed",
+        }
+
+    except Exception as e:
+        logger.error(f"Schedule rollup refresh failed: {e}", exc_info=True)
+        raise self.retry(exc=e)
+
+
 @shared_task(
     bind=True,
     name="app.tasks.schedule_metrics_tasks.generate_fairness_trend_report",
@@ -10,10 +10,15 @@ from app.websocket.events import (
     SwapRequestedEvent,
     WebSocketEvent,
 )
+from app.websocket.fanout import EncodedEvent, OverflowPolicy, SendQueue, encode_event
 from app.websocket.manager import ConnectionManager
 
 __all__ = [
     "ConnectionManager",
+    "EncodedEvent",
+    "OverflowPolicy",
+    "SendQueue",
+    "encode_event",
     "EventType",
     "WebSocketEvent",
     "ScheduleUpdatedEvent",
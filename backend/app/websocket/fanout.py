@@ -0,0 +1,194 @@
+"""Serialize-once fan-out primitives for WebSocket broadcasts.
+
+Broadcasting an event used to re-run ``model_dump`` and JSON encoding for
+every connection and to await each send in turn, so one slow client delayed
+everyone queued behind it. The primitives here split that work in two:
+
+- ``encode_event`` serializes an event exactly once into an ``EncodedEvent``
+  that is shared by every recipient.
+- ``SendQueue`` is a bounded per-connection buffer drained by a dedicated
+  writer task (see ``Connection`` in ``manager.py``). Enqueueing never
+  blocks the broadcaster; when a client falls behind, the queue applies an
+  ``OverflowPolicy`` instead of applying back-pressure to the whole fan-out.
+"""
+
+import asyncio
+import json
+import logging
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any
+
+from pydantic import BaseModel
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEND_QUEUE_SIZE = 256
+
+
+class OverflowPolicy(str, Enum):
+    """What a full send queue does with a new event."""
+
+    DROP_OLDEST = "drop_oldest"  # Evict the oldest queued event
+    DROP_NEWEST = "drop_newest"  # Discard the incoming event
+    COALESCE = "coalesce"  # Replace a queued event with the same key, else drop oldest
+    DISCONNECT = "disconnect"  # Mark the consumer as too slow and stop delivering
+
+
+@dataclass(frozen=True, slots=True)
+class EncodedEvent:
+    """
+    An event serialized once for delivery to many connections.
+
+    Attributes:
+        payload: JSON text frame sent verbatim to every recipient
+        coalesce_key: Events sharing a key supersede each other in a queue
+            (e.g. full solver snapshots for one task). ``None`` disables
+            coalescing for this event.
+    """
+
+    payload: str
+    coalesce_key: str | None = None
+
+
+def encode_event(
+    event: BaseModel | dict[str, Any] | EncodedEvent,
+    coalesce_key: str | None = None,
+) -> EncodedEvent:
+    """
+    Serialize an event to its wire format once.
+
+    Pydantic models are dumped with ``by_alias=True`` so clients receive
+    camelCase keys, matching ``Connection.send_event``.
+
+    Args:
+        event: Pydantic event model, raw dict, or an already-encoded event
+        coalesce_key: Optional key used by ``OverflowPolicy.COALESCE``
+
+    Returns:
+        EncodedEvent ready to be enqueued on any number of connections
+    """
+    if isinstance(event, EncodedEvent):
+        return event
+    if isinstance(event, BaseModel):
+        data = event.model_dump(mode="json", by_alias=True)
+    else:
+        data = event
+    return EncodedEvent(
+        payload=json.dumps(data, default=str, separators=(",", ":")),
+        coalesce_key=coalesce_key,
+    )
+
+
+class SendQueue:
+    """
+    Bounded, non-blocking outbound queue for a single connection.
+
+    ``put_nowait`` is called by broadcasters and never awaits; ``get`` is
+    awaited by the connection's writer task.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_SEND_QUEUE_SIZE,
+        policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        """
+        Initialize the queue.
+
+        Args:
+            maxsize: Maximum number of queued events
+            policy: Overflow policy applied when the queue is full
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self._items: deque[EncodedEvent] = deque()
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.overflowed = False
+        self.enqueued = 0
+        self.dropped = 0
+        self.coalesced = 0
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def put_nowait(self, event: EncodedEvent) -> bool:
+        """
+        Enqueue an event without blocking.
+
+        Args:
+            event: Encoded event to deliver
+
+        Returns:
+            True if the event was queued (possibly replacing an older one),
+            False if it was dropped or the queue is closed
+        """
+        if self.closed:
+            return False
+
+        if event.coalesce_key is not None and self.policy == OverflowPolicy.COALESCE:
+            # Supersede an undelivered event with the same key in place so
+            # ordering relative to other events is preserved.
+            for index, queued in enumerate(self._items):
+                if queued.coalesce_key == event.coalesce_key:
+                    self._items[index] = event
+                    self.coalesced += 1
+                    return True
+
+        if len(self._items) >= self.maxsize:
+            if self.policy == OverflowPolicy.DROP_NEWEST:
+                self.dropped += 1
+                return False
+            if self.policy == OverflowPolicy.DISCONNECT:
+                self.dropped += 1
+                self.overflowed = True
+                self._items.clear()
+                self.close()
+                return False
+            # DROP_OLDEST, and COALESCE with nothing to coalesce into
+            self._items.popleft()
+            self.dropped += 1
+
+        self._items.append(event)
+        self.enqueued += 1
+        self._ready.set()
+        return True
+
+    async def get(self) -> EncodedEvent | None:
+        """
+        Wait for the next event.
+
+        Returns:
+            The next event, or None once the queue is closed and drained
+        """
+        while not self._items:
+            if self.closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._items.popleft()
+
+    def close(self) -> None:
+        """Stop accepting events and wake the writer so it can exit."""
+        self.closed = True
+        self._ready.set()
+
+    def get_stats(self) -> dict[str, int | str]:
+        """
+        Get queue statistics.
+
+        Returns:
+            Dictionary with depth and drop/coalesce counters
+        """
+        return {
+            "depth": len(self._items),
+            "maxsize": self.maxsize,
+            "policy": self.policy.value,
+            "enqueued": self.enqueued,
+            "dropped": self.dropped,
+            "coalesced": self.coalesced,
+        }
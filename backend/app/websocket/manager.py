@@ -1,8 +1,10 @@
 """WebSocket connection manager for real-time updates."""
 
 import asyncio
+import json
 import logging
 from collections import defaultdict
+from typing import TYPE_CHECKING
 from uuid import UUID
 
 from fastapi import WebSocket, WebSocketDisconnect
@@ -18,25 +20,103 @@ from app.websocket.events import (
     SwapApprovedEvent,
     SwapRequestedEvent,
 )
+from app.websocket.fanout import (
+    DEFAULT_SEND_QUEUE_SIZE,
+    EncodedEvent,
+    OverflowPolicy,
+    SendQueue,
+    encode_event,
+)
+
+if TYPE_CHECKING:
+    from app.websocket.redis_hub import MessageListener, RedisFanoutHub
 
 logger = logging.getLogger(__name__)
 
+# Redis channel relayed to every connected client; processes without
+# WebSocket connections (e.g. Celery workers) publish event dicts here
+BROADCAST_CHANNEL = "websocket:broadcast"
+
 
 class Connection:
     """Represents a single WebSocket connection."""
 
-    def __init__(self, websocket: WebSocket, user_id: UUID) -> None:
+    def __init__(
+        self,
+        websocket: WebSocket,
+        user_id: UUID,
+        queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
         """
         Initialize a WebSocket connection.
 
         Args:
             websocket: FastAPI WebSocket instance
             user_id: ID of authenticated user
+            queue_size: Maximum number of undelivered broadcast events
+            overflow_policy: What to do when the client falls behind
         """
         self.websocket = websocket
         self.user_id = user_id
         self.connected_at = asyncio.get_event_loop().time()
         self.subscriptions: set[str] = set()
+        self.send_queue = SendQueue(maxsize=queue_size, policy=overflow_policy)
+        self._writer_task: asyncio.Task | None = None
+
+    def start_writer(self) -> None:
+        """Start the background task that drains the send queue."""
+        if self._writer_task is None:
+            self._writer_task = asyncio.create_task(self._drain_send_queue())
+
+    async def stop_writer(self) -> None:
+        """Close the send queue and wait for the writer task to exit."""
+        self.send_queue.close()
+        if self._writer_task is not None:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+    def enqueue(self, event: EncodedEvent) -> bool:
+        """
+        Queue a pre-encoded event for delivery without blocking.
+
+        Args:
+            event: Event encoded once by the broadcaster
+
+        Returns:
+            True if queued, False if dropped or the connection is closing
+        """
+        return self.send_queue.put_nowait(event)
+
+    async def _drain_send_queue(self) -> None:
+        """Writer loop: send queued frames until the queue is closed."""
+        while True:
+            event = await self.send_queue.get()
+            if event is None:
+                if self.send_queue.overflowed:
+                    # Too slow to keep up; make the client reconnect and resync
+                    logger.warning(
+                        f"Closing slow WebSocket consumer for user {self.user_id}"
+                    )
+                    try:
+                        await self.websocket.close(code=1013)
+                    except Exception:
+                        pass
+                return
+            try:
+                await self.websocket.send_text(event.payload)
+            except WebSocketDisconnect:
+                logger.info(f"WebSocket disconnected for user {self.user_id}")
+                self.send_queue.close()
+                return
+            except Exception as e:
+                logger.error(f"Error sending message to user {self.user_id}: {e}")
+                self.send_queue.close()
+                return
 
     async def send_json(self, data: dict) -> bool:
         """
@@ -81,10 +161,26 @@ class ConnectionManager:
     - Broadcast to all clients watching a schedule
     - Targeted messages to specific users
     - Graceful connection/disconnection handling
+
+    Broadcasts are serialized once and pushed into each connection's bounded
+    send queue, so a slow client never delays delivery to the others.
     """
 
-    def __init__(self) -> None:
-        """Initialize the connection manager."""
+    def __init__(
+        self,
+        queue_size: int = DEFAULT_SEND_QUEUE_SIZE,
+        overflow_policy: OverflowPolicy = OverflowPolicy.COALESCE,
+    ) -> None:
+        """
+        Initialize the connection manager.
+
+        Args:
+            queue_size: Per-connection send queue bound
+            overflow_policy: Slow-consumer policy for new connections
+        """
+        self._queue_size = queue_size
+        self._overflow_policy = overflow_policy
+
         # Map of user_id -> list of connections (supports multiple tabs)
         self._connections: dict[UUID, list[Connection]] = defaultdict(list)
 
@@ -97,6 +193,9 @@ class ConnectionManager:
         # Lock for thread-safe operations
         self._lock = asyncio.Lock()
 
+        # Redis channel -> (hub, listener) for active relays
+        self._relays: dict[str, tuple["RedisFanoutHub", "MessageListener"]] = {}
+
     async def connect(self, websocket: WebSocket, user_id: UUID) -> Connection:
         """
         Register a new WebSocket connection.
@@ -110,7 +209,12 @@ class ConnectionManager:
         """
         await websocket.accept()
 
-        connection = Connection(websocket, user_id)
+        connection = Connection(
+            websocket,
+            user_id,
+            queue_size=self._queue_size,
+            overflow_policy=self._overflow_policy,
+        )
 
         async with self._lock:
             self._connections[user_id].append(connection)
@@ -123,6 +227,7 @@ class ConnectionManager:
         # Send connection acknowledgment
         ack_event = ConnectionAckEvent(user_id=user_id)
         await connection.send_event(ack_event)
+        connection.start_writer()
 
         return connection
 
@@ -134,6 +239,7 @@ class ConnectionManager:
             connection: Connection instance to remove
         """
         user_id = connection.user_id
+        await connection.stop_writer()
 
         async with self._lock:
             if user_id in self._connections:
@@ -205,25 +311,43 @@ class ConnectionManager:
 
         logger.debug(f"User {user_id} unsubscribed from person {person_id}")
 
-    async def send_to_user(self, user_id: UUID, event: BaseModel) -> int:
+    async def send_to_user(
+        self, user_id: UUID, event: BaseModel | EncodedEvent
+    ) -> int:
         """
         Send an event to all connections of a specific user.
 
+        The event is queued on each connection's writer; this never waits
+        for the client to read it.
+
         Args:
             user_id: Target user ID
-            event: Event to send
+            event: Event to send (model or pre-encoded)
 
         Returns:
-            Number of connections successfully sent to
+            Number of connections the event was queued on
         """
-        connections = self._connections.get(user_id, [])
-        sent_count = 0
+        return self._enqueue_for_user(user_id, encode_event(event))
 
-        for connection in connections:
-            success = await connection.send_event(event)
-            if success:
+    def _enqueue_for_user(self, user_id: UUID, encoded: EncodedEvent) -> int:
+        """Queue an encoded event on every connection of a user."""
+        sent_count = 0
+        for connection in self._connections.get(user_id, []):
+            if connection.enqueue(encoded):
                 sent_count += 1
+        return sent_count
 
+    def _fan_out(self, user_ids: list[UUID] | set[UUID], encoded: EncodedEvent) -> int:
+        """
+        Queue one encoded event for many users.
+
+        Returns:
+            Number of users with at least one connection that accepted it
+        """
+        sent_count = 0
+        for user_id in user_ids:
+            if self._enqueue_for_user(user_id, encoded) > 0:
+                sent_count += 1
         return sent_count
 
     async def broadcast_to_schedule(self, schedule_id: UUID, event: BaseModel) -> int:
@@ -238,12 +362,7 @@ class ConnectionManager:
             Number of users successfully sent to
         """
         watchers = self._schedule_watchers.get(schedule_id, set()).copy()
-        sent_count = 0
-
-        for user_id in watchers:
-            count = await self.send_to_user(user_id, event)
-            if count > 0:
-                sent_count += 1
+        sent_count = self._fan_out(watchers, encode_event(event))
 
         logger.debug(
             f"Broadcast schedule event to {sent_count} users "
@@ -264,12 +383,7 @@ class ConnectionManager:
             Number of users successfully sent to
         """
         watchers = self._person_watchers.get(person_id, set()).copy()
-        sent_count = 0
-
-        for user_id in watchers:
-            count = await self.send_to_user(user_id, event)
-            if count > 0:
-                sent_count += 1
+        sent_count = self._fan_out(watchers, encode_event(event))
 
         logger.debug(
             f"Broadcast person event to {sent_count} users (person_id={person_id})"
@@ -287,13 +401,7 @@ class ConnectionManager:
         Returns:
             Number of users successfully sent to
         """
-        all_user_ids = list(self._connections.keys())
-        sent_count = 0
-
-        for user_id in all_user_ids:
-            count = await self.send_to_user(user_id, event)
-            if count > 0:
-                sent_count += 1
+        sent_count = self._fan_out(list(self._connections.keys()), encode_event(event))
 
         logger.debug(f"Broadcast event to {sent_count} users")
 
@@ -304,7 +412,9 @@ class ConnectionManager:
         Broadcast a solver event (raw dict) to all connected users.
 
         Used for real-time solver visualization where events are plain dicts
-        with camelCase keys (solver_solution, solver_complete).
+        with camelCase keys (solver_solution, solver_complete). Full solution
+        snapshots for the same task coalesce in a slow client's queue; deltas
+        never do, because the frontend applies them cumulatively.
 
         Args:
             data: Event data dict with eventType, taskId, etc.
@@ -312,19 +422,16 @@ class ConnectionManager:
         Returns:
             Number of users successfully sent to
         """
-        all_user_ids = list(self._connections.keys())
-        sent_count = 0
-
-        for user_id in all_user_ids:
-            connections = self._connections.get(user_id, [])
-            for connection in connections:
-                success = await connection.send_json(data)
-                if success:
-                    sent_count += 1
-                    break  # Only count once per user
-
         event_type = data.get("eventType", "unknown")
         task_id = data.get("taskId", "unknown")
+
+        coalesce_key = None
+        if event_type == "solver_solution" and data.get("solutionType") == "full":
+            coalesce_key = f"solver:{task_id}"
+
+        encoded = encode_event(data, coalesce_key=coalesce_key)
+        sent_count = self._fan_out(list(self._connections.keys()), encoded)
+
         logger.debug(
             f"Broadcast solver event ({event_type}) to {sent_count} users "
             f"(task_id={task_id})"
@@ -332,6 +439,57 @@ class ConnectionManager:
 
         return sent_count
 
+    async def relay_redis_channel(
+        self, channel: str, hub: "RedisFanoutHub | None" = None
+    ) -> None:
+        """
+        Forward messages from a Redis channel to every connected client.
+
+        Uses the process-wide fan-out hub, so the channel shares one Redis
+        subscription with any GraphQL subscribers in this process. Each
+        message is decoded once by the hub and encoded once here; solver
+        events go through ``broadcast_solver_event`` so snapshots coalesce.
+
+        Args:
+            channel: Redis channel to relay
+            hub: Hub to attach to (defaults to the process-wide hub)
+        """
+        from app.websocket.redis_hub import get_redis_fanout_hub
+
+        if channel in self._relays:
+            return
+        hub = hub or get_redis_fanout_hub()
+
+        async def _relay(_channel: str, data: dict) -> None:
+            if str(data.get("eventType", "")).startswith("solver_"):
+                await self.broadcast_solver_event(data)
+            else:
+                self._fan_out(list(self._connections.keys()), encode_event(data))
+
+        self._relays[channel] = (hub, _relay)
+        try:
+            await hub.add_listener(channel, _relay)
+        except Exception:
+            del self._relays[channel]
+            await hub.remove_listener(channel, _relay)
+            raise
+        logger.info(f"Relaying Redis channel {channel} to WebSocket clients")
+
+    async def start(self, hub: "RedisFanoutHub | None" = None) -> None:
+        """
+        Start relaying ``BROADCAST_CHANNEL`` (called at application startup).
+
+        Args:
+            hub: Hub to attach to (defaults to the process-wide hub)
+        """
+        await self.relay_redis_channel(BROADCAST_CHANNEL, hub=hub)
+
+    async def stop(self) -> None:
+        """Stop every Redis relay (called at application shutdown)."""
+        relays, self._relays = self._relays, {}
+        for channel, (hub, listener) in relays.items():
+            await hub.remove_listener(channel, listener)
+
     async def handle_ping(self, connection: Connection) -> None:
         """
         Handle ping message from client.
@@ -379,11 +537,17 @@ class ConnectionManager:
         Returns:
             Dictionary with connection stats
         """
+        queues = [
+            conn.send_queue for conns in self._connections.values() for conn in conns
+        ]
         return {
             "total_connections": self.get_connection_count(),
             "unique_users": self.get_user_count(),
             "schedules_watched": len(self._schedule_watchers),
             "persons_watched": len(self._person_watchers),
+            "queued_events": sum(len(q) for q in queues),
+            "dropped_events": sum(q.dropped for q in queues),
+            "coalesced_events": sum(q.coalesced for q in queues),
         }
 
         # Global connection manager instance
@@ -634,3 +798,21 @@ async def broadcast_solver_event(data: dict) -> int:
     """
     manager = get_connection_manager()
     return await manager.broadcast_solver_event(data)
+
+
+def publish_solver_event(redis_client, data: dict) -> int:
+    """
+    Publish a solver event to ``BROADCAST_CHANNEL``.
+
+    Solver callbacks run on OR-Tools threads, usually in a Celery worker,
+    with no event loop and no WebSocket connections; the broadcast relay of
+    each API process delivers the event to its clients.
+
+    Args:
+        redis_client: Synchronous Redis client
+        data: Event dict with eventType, taskId, solutionNum, etc.
+
+    Returns:
+        Number of Redis subscribers that received the event
+    """
+    return redis_client.publish(BROADCAST_CHANNEL, json.dumps(data))
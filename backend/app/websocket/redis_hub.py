@@ -0,0 +1,337 @@
+"""Process-wide Redis pub/sub multiplexer for real-time subscribers.
+
+Every GraphQL subscription used to call ``pubsub.listen()`` on one shared
+``PubSub`` object, so concurrent subscribers raced each other for messages.
+``RedisFanoutHub`` owns the only ``PubSub`` in the process and a single
+reader task. Each Redis channel is subscribed once, however many local
+subscribers it has, and every message is JSON-decoded once before being
+handed to:
+
+- async-iterator subscribers (GraphQL resolvers) through bounded queues, and
+- callback listeners (the WebSocket ``ConnectionManager`` relay).
+
+A slow subscriber only loses its own oldest messages; it never stalls the
+reader or other subscribers.
+"""
+
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from typing import Any
+
+import redis.asyncio as redis
+
+from app.core.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SUBSCRIBER_QUEUE_SIZE = 256
+
+MessageListener = Callable[[str, dict[str, Any]], Awaitable[None]]
+
+# Queued to a subscriber to end its iteration
+_END = object()
+
+
+class RedisFanoutHub:
+    """
+    Multiplexes Redis channels onto many in-process subscribers.
+
+    Usage:
+        hub = get_redis_fanout_hub()
+        async for message in hub.subscribe("graphql:schedule:updates"):
+            ...
+    """
+
+    def __init__(
+        self,
+        redis_factory: Callable[[], Awaitable[redis.Redis]] | None = None,
+        queue_size: int = DEFAULT_SUBSCRIBER_QUEUE_SIZE,
+    ) -> None:
+        """
+        Initialize the hub.
+
+        Args:
+            redis_factory: Coroutine returning the Redis client to use.
+                Defaults to a client built from application settings.
+            queue_size: Per-subscriber queue bound
+        """
+        self._redis_factory = redis_factory
+        self._redis: redis.Redis | None = None
+        self._pubsub: Any = None
+        self._redis_channels: set[str] = set()
+        self._reader_task: asyncio.Task | None = None
+        self._queue_size = queue_size
+        self._subscribers: dict[str, set[asyncio.Queue]] = defaultdict(set)
+        self._listeners: dict[str, list[MessageListener]] = defaultdict(list)
+        self._lock = asyncio.Lock()
+        self.messages_received = 0
+        self.messages_dropped = 0
+
+    async def _get_redis(self) -> redis.Redis:
+        """Get or create the Redis client."""
+        if self._redis is None:
+            if self._redis_factory is not None:
+                self._redis = await self._redis_factory()
+            else:
+                settings = get_settings()
+                self._redis = redis.from_url(
+                    settings.redis_url_with_password, decode_responses=True
+                )
+        return self._redis
+
+    def _has_local_interest(self, channel: str) -> bool:
+        return bool(self._subscribers.get(channel)) or bool(
+            self._listeners.get(channel)
+        )
+
+    async def _ensure_channel(self, channel: str) -> None:
+        """Subscribe to a Redis channel the first time it gains interest."""
+        if self._pubsub is None:
+            client = await self._get_redis()
+            self._pubsub = client.pubsub()
+        if channel not in self._redis_channels:
+            await self._pubsub.subscribe(channel)
+            self._redis_channels.add(channel)
+            logger.info(f"Fan-out hub subscribed to channel: {channel}")
+        if self._reader_task is None or self._reader_task.done():
+            self._reader_task = asyncio.create_task(self._read_loop())
+
+    async def _release_channel(self, channel: str) -> None:
+        """Unsubscribe from a Redis channel once nobody local needs it."""
+        if self._has_local_interest(channel) or channel not in self._redis_channels:
+            return
+        self._redis_channels.discard(channel)
+        try:
+            await self._pubsub.unsubscribe(channel)
+            logger.info(f"Fan-out hub unsubscribed from channel: {channel}")
+        except Exception as e:
+            logger.error(f"Error unsubscribing from channel {channel}: {e}")
+
+    async def _read_loop(self) -> None:
+        """Single reader: decode each message once and dispatch it."""
+        while self._pubsub is not None:
+            try:
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=1.0
+                )
+            except asyncio.CancelledError:
+                raise
+            except redis.ConnectionError as e:
+                logger.error(f"Redis connection error in fan-out hub: {e}")
+                await asyncio.sleep(1.0)
+                continue
+
+            if message is None or message.get("type") != "message":
+                continue
+
+            channel = message["channel"]
+            if isinstance(channel, bytes):
+                channel = channel.decode()
+            try:
+                data = json.loads(message["data"])
+            except (json.JSONDecodeError, TypeError):
+                logger.warning(f"Failed to decode message: {message['data']}")
+                continue
+
+            self.messages_received += 1
+            await self.dispatch(channel, data)
+
+    async def dispatch(self, channel: str, data: dict[str, Any]) -> None:
+        """
+        Deliver an already-decoded message to local subscribers.
+
+        Subscribers share the same decoded dict and must treat it as
+        read-only.
+
+        Args:
+            channel: Channel the message arrived on
+            data: Decoded message payload
+        """
+        for queue in list(self._subscribers.get(channel, ())):
+            if queue.full():
+                # Drop the subscriber's oldest message rather than block
+                try:
+                    queue.get_nowait()
+                    self.messages_dropped += 1
+                except asyncio.QueueEmpty:
+                    pass
+            queue.put_nowait(data)
+
+        for listener in list(self._listeners.get(channel, ())):
+            try:
+                await listener(channel, data)
+            except Exception as e:
+                logger.error(f"Fan-out listener failed on {channel}: {e}")
+
+    async def subscribe(
+        self, *channels: str, handles: set[asyncio.Queue] | None = None
+    ) -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Subscribe to channels and yield decoded messages.
+
+        Args:
+            *channels: Channel names to subscribe to
+            handles: Set that holds this subscription's queue while it is
+                active, so its owner can end it with ``end_subscriptions``
+
+        Yields:
+            Message dictionaries from subscribed channels
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self._queue_size)
+        if handles is not None:
+            handles.add(queue)
+        async with self._lock:
+            for channel in channels:
+                self._subscribers[channel].add(queue)
+                await self._ensure_channel(channel)
+
+        try:
+            while True:
+                message = await queue.get()
+                if message is _END:
+                    return
+                yield message
+        finally:
+            if handles is not None:
+                handles.discard(queue)
+            async with self._lock:
+                for channel in channels:
+                    self._subscribers[channel].discard(queue)
+                    if not self._subscribers[channel]:
+                        del self._subscribers[channel]
+                    await self._release_channel(channel)
+
+    def end_subscriptions(self, handles: Iterable[asyncio.Queue]) -> None:
+        """
+        End subscriptions started with ``subscribe(..., handles=...)``.
+
+        Each subscriber stops iterating at its next read; messages still
+        queued for it are discarded.
+
+        Args:
+            handles: Queues of the subscriptions to end
+        """
+        for queue in list(handles):
+            for subscribers in self._subscribers.values():
+                subscribers.discard(queue)
+            while not queue.empty():
+                queue.get_nowait()
+            queue.put_nowait(_END)
+
+    async def add_listener(self, channel: str, listener: MessageListener) -> None:
+        """
+        Register a callback invoked for every message on a channel.
+
+        Listeners run on the reader task and must not block; the WebSocket
+        relay only enqueues onto connection send queues.
+
+        Args:
+            channel: Channel name
+            listener: Async callback taking (channel, data)
+        """
+        async with self._lock:
+            self._listeners[channel].append(listener)
+            await self._ensure_channel(channel)
+
+    async def remove_listener(self, channel: str, listener: MessageListener) -> None:
+        """
+        Unregister a callback previously added with ``add_listener``.
+
+        Args:
+            channel: Channel name
+            listener: Callback to remove
+        """
+        async with self._lock:
+            try:
+                self._listeners[channel].remove(listener)
+            except ValueError:
+                return
+            if not self._listeners[channel]:
+                del self._listeners[channel]
+            await self._release_channel(channel)
+
+    async def publish(self, channel: str, message: dict[str, Any]) -> int:
+        """
+        Publish a message to a Redis channel.
+
+        Args:
+            channel: Channel name
+            message: Message dictionary to publish
+
+        Returns:
+            Number of Redis subscribers (processes) that received it
+        """
+        try:
+            client = await self._get_redis()
+            return await client.publish(channel, json.dumps(message, default=str))
+        except redis.ConnectionError as e:
+            logger.error(f"Redis connection error in publish: {e}")
+            return 0
+        except Exception as e:
+            logger.error(f"Error publishing message: {e}")
+            return 0
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get hub statistics.
+
+        Returns:
+            Dictionary with channel, subscriber and message counters
+        """
+        return {
+            "channels": sorted(
+                set(self._subscribers.keys()) | set(self._listeners.keys())
+            ),
+            "subscribers": sum(len(s) for s in self._subscribers.values()),
+            "listeners": sum(len(lst) for lst in self._listeners.values()),
+            "messages_received": self.messages_received,
+            "messages_dropped": self.messages_dropped,
+        }
+
+    async def close(self) -> None:
+        """Stop the reader task and close Redis connections."""
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except asyncio.CancelledError:
+                pass
+            self._reader_task = None
+
+        if self._pubsub is not None:
+            await self._pubsub.close()
+            self._pubsub = None
+        self._redis_channels.clear()
+
+        if self._redis is not None and self._redis_factory is None:
+            await self._redis.close()
+        self._redis = None
+
+        logger.info("Redis fan-out hub closed")
+
+
+_hub: RedisFanoutHub | None = None
+
+
+def get_redis_fanout_hub() -> RedisFanoutHub:
+    """
+    Get the process-wide RedisFanoutHub instance.
+
+    Returns:
+        RedisFanoutHub singleton
+    """
+    global _hub
+    if _hub is None:
+        _hub = RedisFanoutHub()
+    return _hub
+
+
+async def close_redis_fanout_hub() -> None:
+    """Close the process-wide hub, if it was created (at app shutdown)."""
+    global _hub
+    if _hub is not None:
+        await _hub.close()
+        _hub = None
@@ -10,10 +10,13 @@ Metrics:
     - Connection pool efficiency
     - Lock contention under concurrent writes
     - Async task queue processing rate
+    - Per-request middleware overhead (BaseHTTPMiddleware stack vs
+      pure-ASGI pipeline) and streaming time-to-first-chunk
 
 Usage:
     python -m benchmarks.concurrent_requests_bench
     python -m benchmarks.concurrent_requests_bench --workers 50 --duration 30
+    python -m benchmarks.concurrent_requests_bench --operation middleware
 """
 
 import argparse
@@ -29,10 +32,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from sqlalchemy import create_engine, select
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
 
 from app.core.config import settings
 from app.models.assignment import Assignment
 from app.models.block import Block
+from app.middleware.pipeline import ASGIMiddleware, MiddlewarePipeline
 from app.models.person import Person
 from benchmarks import (
     BenchmarkResult,
@@ -301,6 +309,168 @@ async def benchmark_concurrent_writes(
         await async_engine.dispose()
 
 
+class _HeaderLayer(BaseHTTPMiddleware):
+    """A typical dispatch-style layer: call downstream, add one header."""
+
+    async def dispatch(self, request, call_next):
+        response = await call_next(request)
+        response.headers["X-Layer"] = "1"
+        return response
+
+
+class _HeaderStage(ASGIMiddleware):
+    """The same layer written as a pipeline stage."""
+
+    def on_response_start(self, context, headers):
+        headers["X-Layer"] = "1"
+
+
+STREAM_CHUNKS = 20
+
+
+def _build_middleware_app(mode: str, num_layers: int):
+    """Minimal app wrapped in ``num_layers`` BaseHTTPMiddleware or pipeline stages."""
+
+    async def ok(request):
+        return PlainTextResponse("ok")
+
+    async def stream(request):
+        async def chunks():
+            for _ in range(STREAM_CHUNKS):
+                yield b"x" * 1024
+                await asyncio.sleep(0.001)
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    app = Starlette(routes=[Route("/ok", ok), Route("/stream", stream)])
+    if mode == "base_http":
+        for _ in range(num_layers):
+            app.add_middleware(_HeaderLayer)
+    else:
+        app.add_middleware(
+            MiddlewarePipeline, stages=[_HeaderStage() for _ in range(num_layers)]
+        )
+    return app
+
+
+async def _asgi_request(app, path: str) -> float | None:
+    """
+    Drive one GET through the app in-process.
+
+    Returns:
+        Seconds until the first non-empty body chunk arrived, or None
+    """
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "headers": [(b"host", b"bench")],
+        "client": ("127.0.0.1", 5000),
+        "server": ("bench", 80),
+    }
+    start = time.perf_counter()
+    first_chunk: float | None = None
+    request_sent = False
+    response_done = asyncio.Event()
+
+    async def receive():
+        nonlocal request_sent
+        if not request_sent:
+            request_sent = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        nonlocal first_chunk
+        if message["type"] == "http.response.body":
+            if first_chunk is None and message.get("body"):
+                first_chunk = time.perf_counter() - start
+            if not message.get("more_body", False):
+                response_done.set()
+
+    await app(scope, receive, send)
+    return first_chunk
+
+
+async def benchmark_middleware_overhead(
+    mode: str = "pipeline",
+    num_layers: int = 6,
+    num_workers: int = 20,
+    duration_seconds: int = 5,
+    verbose: bool = False,
+) -> BenchmarkResult:
+    """Benchmark per-request cost of the middleware stack (no database)."""
+    label = "BaseHTTPMiddleware stack" if mode == "base_http" else "ASGI pipeline"
+    print_benchmark_header(
+        f"Middleware Overhead: {label} ({num_layers} layers, {num_workers} workers)",
+        "Benchmarking per-request middleware overhead and streaming first-chunk latency",
+    )
+
+    app = _build_middleware_app(mode, num_layers)
+    bare_app = _build_middleware_app(mode, 0)
+
+    # Baseline: the same app with no middleware, to isolate the overhead
+    bare_times = []
+    for _ in range(500):
+        op_start = time.perf_counter()
+        await _asgi_request(bare_app, "/ok")
+        bare_times.append(time.perf_counter() - op_start)
+    bare_avg = calculate_stats(bare_times)["avg"]
+
+    total_operations = 0
+    operation_times = []
+    start_time = time.perf_counter()
+
+    async def worker(worker_id: int):
+        nonlocal total_operations
+        worker_ops = 0
+        while (time.perf_counter() - start_time) < duration_seconds:
+            op_start = time.perf_counter()
+            await _asgi_request(app, "/ok")
+            operation_times.append(time.perf_counter() - op_start)
+            total_operations += 1
+            worker_ops += 1
+        if verbose:
+            print(f"  Worker {worker_id}: {worker_ops} requests")
+
+    await asyncio.gather(*[worker(i) for i in range(num_workers)])
+    total_duration = time.perf_counter() - start_time
+
+    first_chunk_times = [await _asgi_request(app, "/stream") for _ in range(50)]
+    first_chunk_stats = calculate_stats([t for t in first_chunk_times if t])
+
+    stats = calculate_stats(operation_times)
+    result = BenchmarkResult(
+        benchmark_name=f"middleware_{mode}_{num_layers}layers",
+        category="concurrent",
+        timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+        duration_seconds=total_duration,
+        iterations=total_operations,
+        avg_duration=stats["avg"],
+        min_duration=stats["min"],
+        max_duration=stats["max"],
+        std_deviation=stats["std_dev"],
+        throughput=total_operations / total_duration,
+        metadata={
+            "mode": mode,
+            "num_layers": num_layers,
+            "num_workers": num_workers,
+            "bare_app_avg_ms": f"{bare_avg * 1000:.3f}",
+            "overhead_per_request_ms": f"{(stats['avg'] - bare_avg) * 1000:.3f}",
+            "stream_first_chunk_avg_ms": f"{first_chunk_stats['avg'] * 1000:.3f}",
+        },
+    )
+
+    print_benchmark_results(result)
+    return result
+
+
 def run_suite(verbose: bool = False):
     """Run concurrent requests benchmark suite."""
     print("=" * 80)
@@ -327,6 +497,14 @@ def run_suite(verbose: bool = False):
             results.append(result)
             print()
 
+        # Middleware stack before/after the pure-ASGI pipeline
+        for mode in ["base_http", "pipeline"]:
+            result = await benchmark_middleware_overhead(
+                mode=mode, num_layers=6, duration_seconds=5, verbose=verbose
+            )
+            results.append(result)
+            print()
+
     asyncio.run(run_async_suite())
 
     # Save results
@@ -354,9 +532,12 @@ def main():
         "--operation",
         type=str,
         default="reads",
-        choices=["reads", "writes"],
+        choices=["reads", "writes", "middleware"],
         help="Operation type",
     )
+    parser.add_argument(
+        "--layers", type=int, default=6, help="Middleware layers (middleware only)"
+    )
     parser.add_argument("--suite", action="store_true", help="Run full suite")
     parser.add_argument("--verbose", action="store_true", help="Verbose output")
 
@@ -373,12 +554,22 @@ def main():
                     duration_seconds=args.duration,
                     verbose=args.verbose,
                 )
-            else:
+            elif args.operation == "writes":
                 result = await benchmark_concurrent_writes(
                     num_workers=args.workers,
                     duration_seconds=args.duration,
                     verbose=args.verbose,
                 )
+            else:
+                for mode in ["base_http", "pipeline"]:
+                    result = await benchmark_middleware_overhead(
+                        mode=mode,
+                        num_layers=args.layers,
+                        num_workers=args.workers,
+                        duration_seconds=args.duration,
+                        verbose=args.verbose,
+                    )
+                    print()
 
             output_dir = Path(__file__).parent.parent.parent / "benchmark_results"
             result.save(output_dir)
@@ -18,10 +18,14 @@ Metrics:
 Usage:
     python -m benchmarks.startup_time_bench
     python -m benchmarks.startup_time_bench --iterations 5
+
+    # CI gate: exit non-zero if cold start regresses
+    python -m benchmarks.startup_time_bench --benchmark budget --budget-seconds 12
 """
 
 import argparse
 import importlib
+import json
 import subprocess
 import sys
 import time
@@ -236,6 +240,118 @@ def benchmark_app_initialization(
     return result
 
 
+# Heavy libraries that must stay off the cold-start path. They are imported
+# lazily by the modules that need them (see app.core.lazy_imports and
+# app.api.lazy_router).
+STARTUP_FORBIDDEN_MODULES = (
+    "matplotlib",
+    "sklearn",
+    "statsmodels",
+    "ortools",
+    "pywt",
+    "ripser",
+)
+
+_COLD_IMPORT_PROBE = """
+import json, resource, sys, time
+start = time.perf_counter()
+import app.main
+print(json.dumps({
+    "seconds": time.perf_counter() - start,
+    "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+    "module_count": len(sys.modules),
+    "loaded": sorted({m.split(".")[0] for m in sys.modules}),
+}))
+"""
+
+
+def benchmark_import_budget(
+    budget_seconds: float,
+    iterations: int = 3,
+    verbose: bool = False,
+) -> tuple[BenchmarkResult, list[str]]:
+    """
+    Check cold ``import app.main`` against a time budget.
+
+    Each iteration runs in a fresh interpreter so nothing is cached. The
+    fastest run is compared with the budget to keep scheduler noise from
+    failing the gate.
+
+    Args:
+        budget_seconds: Maximum allowed cold import time
+        iterations: Number of fresh interpreters to time
+        verbose: Print per-iteration timings
+
+    Returns:
+        Tuple of (result, list of budget violations; empty if within budget)
+    """
+    print_benchmark_header(
+        "Cold Import Budget",
+        f"Checking cold import of app.main against a {budget_seconds:.1f}s budget",
+    )
+
+    backend_dir = Path(__file__).parent.parent
+    samples = []
+
+    for i in range(iterations):
+        proc = subprocess.run(
+            [sys.executable, "-c", _COLD_IMPORT_PROBE],
+            cwd=backend_dir,
+            capture_output=True,
+            text=True,
+            timeout=300,
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"Cold import failed: {proc.stderr[-500:]}")
+        sample = json.loads(proc.stdout.strip().splitlines()[-1])
+        samples.append(sample)
+
+        if verbose:
+            print(
+                f"  Iteration {i + 1}: {sample['seconds']:.2f}s, "
+                f"{sample['max_rss_mb']:.0f}MB RSS, "
+                f"{sample['module_count']} modules"
+            )
+
+    durations = [sample["seconds"] for sample in samples]
+    stats = calculate_stats(durations)
+    heavy_loaded = sorted(
+        set(STARTUP_FORBIDDEN_MODULES).intersection(samples[0]["loaded"])
+    )
+
+    violations = []
+    if stats["min"] > budget_seconds:
+        violations.append(
+            f"cold import took {stats['min']:.2f}s (budget {budget_seconds:.2f}s)"
+        )
+    if heavy_loaded:
+        violations.append(f"heavy modules loaded at startup: {', '.join(heavy_loaded)}")
+
+    result = BenchmarkResult(
+        benchmark_name="startup_import_budget",
+        category="startup",
+        timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
+        duration_seconds=sum(durations),
+        iterations=iterations,
+        avg_duration=stats["avg"],
+        min_duration=stats["min"],
+        max_duration=stats["max"],
+        std_deviation=stats["std_dev"],
+        peak_memory_mb=max(sample["max_rss_mb"] for sample in samples),
+        metadata={
+            "budget_seconds": budget_seconds,
+            "module_count": samples[0]["module_count"],
+            "heavy_modules_loaded": heavy_loaded,
+            "violations": violations,
+        },
+    )
+
+    print_benchmark_results(result)
+    for violation in violations:
+        print(f"  BUDGET EXCEEDED: {violation}")
+    return result, violations
+
+
 def benchmark_config_loading(
     iterations: int = 100, verbose: bool = False
 ) -> BenchmarkResult:
@@ -327,9 +443,15 @@ def main():
         "--benchmark",
         type=str,
         default="all",
-        choices=["config", "import", "db", "app", "all"],
+        choices=["config", "import", "db", "app", "budget", "all"],
         help="Benchmark type",
     )
+    parser.add_argument(
+        "--budget-seconds",
+        type=float,
+        default=12.0,
+        help="Cold import budget for --benchmark budget",
+    )
     parser.add_argument(
         "--iterations", type=int, default=10, help="Number of iterations"
     )
@@ -359,10 +481,21 @@ def main():
                 iterations=min(args.iterations, 5), verbose=args.verbose
             )
 
+        violations = []
+        if args.benchmark == "budget":
+            result, violations = benchmark_import_budget(
+                args.budget_seconds,
+                iterations=min(args.iterations, 5),
+                verbose=args.verbose,
+            )
+
         if args.benchmark != "all":
             output_dir = Path(__file__).parent.parent.parent / "benchmark_results"
             result.save(output_dir)
 
+        if violations:
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
@@ -22,7 +22,7 @@ from sqlalchemy_continuum import versioning_manager
 
 from app.core.security import get_password_hash
 from app.db.base import Base
-from app.db.session import get_async_db, get_db
+from app.db.session import get_async_db, get_db, get_read_db
 from app.main import app
 from app.models.absence import Absence
 from app.models.assignment import Assignment
@@ -201,8 +201,9 @@ def client(db: Session) -> Generator[TestClient, None, None]:
     the same in-memory SQLite database for tests, wrapped for async
     compatibility.
     """
-    # Override sync session
+    # Override sync sessions (read/write and read-only routes)
     app.dependency_overrides[get_db] = lambda: db
+    app.dependency_overrides[get_read_db] = lambda: db
 
     # Create async-compatible wrapper
     async_wrapper = AsyncSessionWrapper(db)
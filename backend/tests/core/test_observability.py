@@ -12,6 +12,7 @@ from app.core.observability import (
     request_id_ctx,
     with_request_id,
 )
+from app.middleware.pipeline import ASGIMiddleware
 
 
 # ==================== request_id context ====================
@@ -176,8 +177,9 @@ class TestRequestIDMiddleware:
     def test_max_length(self):
         assert RequestIDMiddleware.MAX_REQUEST_ID_LENGTH == 255
 
-    def test_has_dispatch(self):
-        assert hasattr(RequestIDMiddleware, "dispatch")
+    def test_is_pure_asgi_stage(self):
+        assert issubclass(RequestIDMiddleware, ASGIMiddleware)
+        assert hasattr(RequestIDMiddleware, "before_request")
 
 
 # ==================== with_request_id decorator ====================
@@ -0,0 +1,162 @@
+"""
+Tests for the roster-wide Three-Process Model.
+
+Tests cover:
+- Equivalence with stepping the scalar ThreeProcessModel
+- Duty and wake/sleep grids from half-day assignments
+- Matrix lookups used by the fatigue constraints
+"""
+
+import random
+from datetime import date, datetime, timedelta
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.frms.fatigue_constraint import FatigueConstraint, FatigueSoftConstraint
+from app.frms.roster_model import RosterFatigueModel, block_time
+from app.frms.three_process_model import ThreeProcessModel
+from app.scheduling.constraints.base import SchedulingContext
+
+MONDAY = date(2026, 1, 5)
+
+
+def _duties(people, days, seed, rate=0.6):
+    rng = random.Random(seed)
+    return [
+        (person, MONDAY + timedelta(days=d), tod)
+        for person in people
+        for d in range(days)
+        for tod in ("AM", "PM")
+        if rng.random() < rate
+    ]
+
+
+@pytest.mark.parametrize("quality", [1.0, 0.7])
+def test_matches_stepping_the_scalar_model(quality):
+    people = [uuid4() for _ in range(4)]
+    engine = RosterFatigueModel(sleep_quality=quality)
+    scalar = ThreeProcessModel()
+
+    result = engine.evaluate(
+        people,
+        MONDAY,
+        MONDAY + timedelta(days=6),
+        _duties(people, 7, seed=1),
+        initial_reservoir=60.0,
+    )
+
+    for row, person in enumerate(people):
+        state = scalar.create_state(person, 60.0, timestamp=result.start)
+        for k in range(result.steps):
+            score = scalar.calculate_effectiveness(state)
+            assert result.overall[row, k] == pytest.approx(score.overall)
+            assert result.homeostatic[row, k] == pytest.approx(score.homeostatic)
+            assert result.sleep_inertia[row, k] == pytest.approx(score.sleep_inertia)
+            if result.awake[row, k]:
+                state = scalar.update_wakefulness(state, engine.step_hours)
+            else:
+                state = scalar.update_sleep(state, engine.step_hours, quality)
+
+
+def test_awake_on_duty_and_outside_sleep_window():
+    person = uuid4()
+    engine = RosterFatigueModel(step_hours=1.0, sleep_window=(23.0, 7.0))
+    start = datetime.combine(MONDAY, datetime.min.time())
+
+    duty = engine.duty_grid([person], MONDAY, 48, [(person, MONDAY, "AM")])
+    awake = engine.awake_grid(duty, start)
+
+    assert np.flatnonzero(duty[0]).tolist() == list(range(7, 13))
+    asleep = np.flatnonzero(~awake[0]).tolist()
+    assert asleep == [0, 1, 2, 3, 4, 5, 6, 23, 24, 25, 26, 27, 28, 29, 30, 47]
+
+
+def test_duty_through_the_night_keeps_people_awake():
+    person = uuid4()
+    engine = RosterFatigueModel(duty_hours={"NIGHT": (19.0, 31.0)})
+    rested, on_call = engine.evaluate(
+        [uuid4(), person],
+        MONDAY,
+        MONDAY + timedelta(days=1),
+        [(person, MONDAY, "NIGHT")],
+    ).overall
+
+    morning = int(32 / engine.step_hours)
+    assert on_call[morning] < rested[morning]
+
+
+def test_sample_treats_unknown_people_as_rested():
+    person = uuid4()
+    result = RosterFatigueModel().evaluate([person], MONDAY, MONDAY, [])
+    times = [block_time(MONDAY, "AM"), block_time(MONDAY, "PM")]
+
+    values = result.sample([person, uuid4()], times)
+
+    assert values.shape == (2, 2)
+    assert values[0, 0] == result.at(person, times[0])
+    assert values[1].tolist() == [100.0, 100.0]
+
+
+def test_full_block_for_a_program():
+    people = [uuid4() for _ in range(60)]
+    engine = RosterFatigueModel()
+
+    result = engine.evaluate(
+        people, MONDAY, MONDAY + timedelta(days=27), _duties(people, 28, seed=2)
+    )
+
+    assert result.overall.shape == (60, 28 * 48)
+    assert ((result.overall >= 0) & (result.overall <= 100)).all()
+
+
+def _context(residents, blocks):
+    return SchedulingContext(
+        residents=residents,
+        faculty=[],
+        blocks=blocks,
+        templates=[SimpleNamespace(id=uuid4())],
+        start_date=blocks[0].date,
+        end_date=blocks[-1].date,
+    )
+
+
+class _RecordingModel:
+    def __init__(self):
+        self.constraints = []
+
+    def Add(self, constraint):
+        self.constraints.append(constraint)
+
+
+def test_constraints_screen_the_roster_in_one_pass():
+    residents = [SimpleNamespace(id=uuid4()) for _ in range(3)]
+    blocks = [
+        SimpleNamespace(id=uuid4(), date=MONDAY + timedelta(days=d), time_of_day=tod)
+        for d in range(3)
+        for tod in ("AM", "PM")
+    ]
+    context = _context(residents, blocks)
+    context.resident_idx = {r.id: i for i, r in enumerate(residents)}
+    context.block_idx = {b.id: i for i, b in enumerate(blocks)}
+    context.template_idx = {context.templates[0].id: 0}
+    x = {
+        (r, b, 0): f"x_{r}_{b}_0"
+        for r in range(len(residents))
+        for b in range(len(blocks))
+    }
+
+    # Morning blocks sit in the circadian trough, afternoon blocks do not
+    hard = FatigueConstraint(threshold=80.0)
+    model = _RecordingModel()
+    hard.add_to_cpsat(model, {"x": x}, context)
+
+    am_blocks = [i for i, b in enumerate(blocks) if b.time_of_day == "AM"]
+    assert len(model.constraints) == len(residents) * len(am_blocks)
+
+    soft = FatigueSoftConstraint()
+    variables = {"x": x}
+    soft.add_to_cpsat(None, variables, context)
+    assert variables["objective_terms"] == []
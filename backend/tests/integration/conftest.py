@@ -16,7 +16,7 @@ from sqlalchemy.orm import Session
 
 from app.core.security import get_password_hash
 from app.db.base import Base
-from app.db.session import get_async_db, get_db
+from app.db.session import get_async_db, get_db, get_read_db
 from app.main import app
 from app.models.block import Block
 from app.models.person import Person
@@ -80,6 +80,7 @@ def integration_client(integration_db: Session) -> Generator[TestClient, None, N
     endpoints (sync and async) use the same test database session.
     """
     app.dependency_overrides[get_db] = lambda: integration_db
+    app.dependency_overrides[get_read_db] = lambda: integration_db
 
     # Create async-compatible wrapper for endpoints using get_async_db
     async_wrapper = AsyncSessionWrapper(integration_db)
@@ -0,0 +1,236 @@
+"""Tests for the pure-ASGI middleware pipeline."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from fastapi.testclient import TestClient
+from slowapi import Limiter
+from slowapi.util import get_remote_address
+
+from app.caching.http_cache import HTTPCache
+from app.caching.middleware import HTTPCacheMiddleware
+from app.core.observability import RequestIDMiddleware
+from app.core.slowapi_limiter import SlowAPIRateLimitMiddleware
+from app.middleware.phi_middleware import PHIMiddleware
+from app.middleware.pipeline import (
+    ASGIMiddleware,
+    MiddlewarePipeline,
+    RequestContext,
+    get_request_context,
+)
+from app.middleware.security_headers import SecurityHeadersMiddleware
+
+
+class RecordingStage(ASGIMiddleware):
+    def __init__(self, name: str, events: list, short_circuit: bool = False):
+        super().__init__()
+        self.name = name
+        self.events = events
+        self.short_circuit = short_circuit
+
+    async def before_request(self, context: RequestContext):
+        self.events.append(f"{self.name}:before")
+        context.extras.setdefault("seen", []).append(self.name)
+        if self.short_circuit:
+            return JSONResponse({"short": self.name}, status_code=418)
+        return None
+
+    def on_response_start(self, context, headers):
+        self.events.append(f"{self.name}:start")
+        headers[f"X-{self.name}"] = str(context.status_code)
+
+    def after_request(self, context):
+        self.events.append(f"{self.name}:after")
+
+
+class InMemoryRedis:
+    """Just enough of the async Redis client for HTTPCache."""
+
+    def __init__(self):
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key):
+        return self.data.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.data[key] = value
+
+    async def delete(self, *keys):
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+def _streaming_app(release: asyncio.Event) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/export/stream")
+    async def stream():
+        async def chunks():
+            yield b"first,"
+            await release.wait()
+            yield b"second"
+
+        return StreamingResponse(chunks(), media_type="text/csv")
+
+    return app
+
+
+async def _first_chunk_arrives_before_generator_resumes(asgi_app, app_events):
+    """Drive a request by hand; fail if the first chunk is held back."""
+    release = app_events
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/api/v1/export/stream",
+        "raw_path": b"/api/v1/export/stream",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver")],
+        "client": ("127.0.0.1", 1234),
+        "server": ("testserver", 80),
+        "app": None,
+    }
+    received: list[dict] = []
+
+    async def receive():
+        await asyncio.sleep(3600)
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        received.append(message)
+        if message["type"] == "http.response.body" and message.get("body"):
+            # Only release the generator once the first chunk reached us
+            release.set()
+
+    await asyncio.wait_for(asgi_app(scope, receive, send), timeout=5)
+    return received
+
+
+def test_stages_share_context_and_run_in_nested_order():
+    events: list[str] = []
+    app = FastAPI()
+
+    @app.get("/ping")
+    async def ping(request: Request):
+        return {"seen": get_request_context(request.scope).extras["seen"]}
+
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[RecordingStage("Outer", events), RecordingStage("Inner", events)],
+    )
+
+    response = TestClient(app).get("/ping")
+
+    assert response.json() == {"seen": ["Outer", "Inner"]}
+    assert response.headers["X-Outer"] == "200"
+    assert response.headers["X-Inner"] == "200"
+    assert events == [
+        "Outer:before",
+        "Inner:before",
+        "Inner:start",
+        "Outer:start",
+        "Inner:after",
+        "Outer:after",
+    ]
+
+
+def test_short_circuit_skips_inner_stages():
+    events: list[str] = []
+    app = FastAPI()
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[
+            RecordingStage("Outer", events),
+            RecordingStage("Gate", events, short_circuit=True),
+            RecordingStage("Inner", events),
+        ],
+    )
+
+    response = TestClient(app).get("/anything")
+
+    assert response.status_code == 418
+    assert response.json() == {"short": "Gate"}
+    assert response.headers["X-Outer"] == "418"
+    assert "X-Inner" not in response.headers
+    assert "Inner:before" not in events
+    assert events[-2:] == ["Gate:after", "Outer:after"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_flushes_each_chunk():
+    release = asyncio.Event()
+    app = _streaming_app(release)
+    limiter = Limiter(
+        key_func=get_remote_address, default_limits=["100/minute"], headers_enabled=True
+    )
+    app.state.limiter = limiter
+    app.add_middleware(SecurityHeadersMiddleware)
+    app.add_middleware(SlowAPIRateLimitMiddleware)
+    app.add_middleware(HTTPCacheMiddleware)
+    app.add_middleware(
+        MiddlewarePipeline,
+        stages=[RequestIDMiddleware(), PHIMiddleware()],
+    )
+
+    asgi_app = app.build_middleware_stack()
+
+    async def call(scope, receive, send):
+        scope["app"] = app
+        await asgi_app(scope, receive, send)
+
+    received = await _first_chunk_arrives_before_generator_resumes(call, release)
+
+    start = received[0]
+    headers = {key.decode(): value.decode() for key, value in start["headers"]}
+    assert start["status"] == 200
+    assert headers["x-contains-phi"] == "true"
+    assert headers["x-content-type-options"] == "nosniff"
+    assert "x-request-id" in headers
+    assert "x-ratelimit-limit" in headers
+    bodies = [m["body"] for m in received if m["type"] == "http.response.body"]
+    assert bodies[:2] == [b"first,", b"second"]
+
+
+def test_http_cache_serves_repeat_gets_from_cache():
+    calls = []
+    app = FastAPI()
+
+    @app.get("/api/items")
+    async def items():
+        calls.append(1)
+        return {"items": [1, 2, 3]}
+
+    app.add_middleware(HTTPCacheMiddleware, default_max_age=60)
+    client = TestClient(app)
+
+    redis = InMemoryRedis()
+    with patch.object(HTTPCache, "_get_redis", return_value=redis):
+        first = client.get("/api/items")
+        second = client.get("/api/items")
+
+    assert first.headers["ETag"]
+    assert second.headers["X-Cache"] == "HIT"
+    assert second.json() == {"items": [1, 2, 3]}
+    assert len(calls) == 1
+
+
+def test_rate_limit_stage_rejects_over_limit():
+    app = FastAPI()
+    app.state.limiter = Limiter(
+        key_func=get_remote_address, default_limits=["2/minute"], headers_enabled=True
+    )
+    app.add_middleware(SlowAPIRateLimitMiddleware)
+
+    @app.get("/limited")
+    async def limited():
+        return {"ok": True}
+
+    client = TestClient(app)
+    responses = [client.get("/limited") for _ in range(3)]
+
+    assert [r.status_code for r in responses] == [200, 200, 429]
+    assert responses[0].headers["X-RateLimit-Limit"] == "2"
@@ -0,0 +1,163 @@
+"""Tests for the vectorized Pareto toolkit (no DB)."""
+
+import itertools
+
+import numpy as np
+import pytest
+
+from app.multi_objective.pareto import (
+    crowding_distance,
+    dominance_matrix,
+    fronts_from_ranks,
+    hypervolume,
+    hypervolume_estimate,
+    non_dominated_mask,
+    non_dominated_sort,
+    to_minimization,
+)
+
+
+# ---------------------------------------------------------------------------
+# Brute-force references
+# ---------------------------------------------------------------------------
+
+
+def _dominates(a, b) -> bool:
+    return all(x <= y for x, y in zip(a, b)) and any(x < y for x, y in zip(a, b))
+
+
+def _brute_ranks(points) -> list[int]:
+    remaining = set(range(len(points)))
+    ranks = [0] * len(points)
+    rank = 0
+    while remaining:
+        front = {
+            i
+            for i in remaining
+            if not any(_dominates(points[j], points[i]) for j in remaining)
+        }
+        for i in front:
+            ranks[i] = rank
+        remaining -= front
+        rank += 1
+    return ranks
+
+
+def _brute_hypervolume(points, ref) -> float:
+    """Inclusion-exclusion over all subsets (small sets only)."""
+    total = 0.0
+    for size in range(1, len(points) + 1):
+        for subset in itertools.combinations(points, size):
+            corner = np.max(subset, axis=0)
+            total += (-1) ** (size + 1) * np.prod(np.clip(ref - corner, 0, None))
+    return float(total)
+
+
+# ---------------------------------------------------------------------------
+# Sorting and crowding
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_non_dominated_sort_matches_brute_force(seed):
+    rng = np.random.default_rng(seed)
+    points = np.round(rng.random((40, 3)), 1)  # rounding forces ties
+
+    ranks = non_dominated_sort(points)
+
+    assert ranks.tolist() == _brute_ranks(points.tolist())
+    assert non_dominated_mask(points).tolist() == (ranks == 0).tolist()
+
+
+def test_dominance_matrix_and_fronts():
+    points = np.array([[1.0, 1.0], [2.0, 2.0], [1.0, 2.0], [1.0, 1.0]])
+
+    matrix = dominance_matrix(points)
+
+    assert matrix[0].tolist() == [False, True, True, False]
+    assert not matrix[:, 0].any()
+    fronts = fronts_from_ranks(non_dominated_sort(points))
+    assert [f.tolist() for f in fronts] == [[0, 3], [2], [1]]
+
+
+def test_crowding_distance_matches_loop():
+    rng = np.random.default_rng(7)
+    points = np.round(rng.random((12, 4)), 1)
+
+    expected = np.zeros(len(points))
+    for j in range(points.shape[1]):
+        order = sorted(range(len(points)), key=lambda i: points[i, j])
+        spread = points[order[-1], j] - points[order[0], j]
+        for k in range(1, len(order) - 1):
+            if spread > 0:
+                expected[order[k]] += (
+                    points[order[k + 1], j] - points[order[k - 1], j]
+                ) / spread
+        expected[order[0]] = expected[order[-1]] = np.inf
+
+    np.testing.assert_allclose(crowding_distance(points), expected)
+
+
+def test_crowding_distance_small_sets_are_boundaries():
+    assert np.isinf(crowding_distance(np.array([[0.0, 1.0], [1.0, 0.0]]))).all()
+
+
+def test_to_minimization_negates_maximized_columns():
+    values = to_minimization(np.array([[1.0, 2.0]]), [True, False])
+
+    assert values.tolist() == [[-1.0, 2.0]]
+
+
+# ---------------------------------------------------------------------------
+# Hypervolume
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.parametrize("m", [2, 3, 4, 5])
+def test_exact_hypervolume_matches_inclusion_exclusion(m):
+    rng = np.random.default_rng(m)
+    points = np.round(rng.random((8, m)), 1)
+    ref = np.full(m, 1.1)
+
+    value = hypervolume(points, ref, method="exact")
+
+    assert value == pytest.approx(_brute_hypervolume(points, ref))
+
+
+def test_hypervolume_ignores_points_outside_reference():
+    points = np.array([[0.5, 0.5], [2.0, 0.0]])
+
+    assert hypervolume(points, np.array([1.0, 1.0])) == pytest.approx(0.25)
+    assert hypervolume(np.empty((0, 2)), np.array([1.0, 1.0])) == 0.0
+
+
+def test_monte_carlo_estimate_is_seeded_and_bounded():
+    rng = np.random.default_rng(3)
+    points = np.round(rng.random((10, 5)), 1)
+    ref = np.full(5, 1.1)
+
+    estimate = hypervolume_estimate(points, ref)
+    low, high = estimate.interval(z=4.0)
+
+    assert not estimate.exact
+    assert estimate == hypervolume_estimate(points, ref)
+    assert low <= _brute_hypervolume(points, ref) <= high
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        hypervolume(np.zeros((1, 2)), np.ones(2), method="wfg")
+
+
+def test_six_objective_front_of_500_points():
+    rng = np.random.default_rng(11)
+    points = rng.random((500, 6))
+    points /= np.linalg.norm(points, axis=1, keepdims=True)
+
+    ranks = non_dominated_sort(points)
+    distance = crowding_distance(points[ranks == 0])
+    estimate = hypervolume_estimate(points, np.full(6, 1.1))
+
+    assert len(distance) == (ranks == 0).sum()
+    assert 0.0 < estimate.value < 1.1**6
+    assert estimate.std_error < 0.01 * estimate.value
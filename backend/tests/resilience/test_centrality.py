@@ -0,0 +1,145 @@
+"""
+Tests for the shared centrality service.
+
+Test scenarios:
+1. Exact measures match NetworkX on undirected, directed and weighted graphs
+2. Each measure is computed once per graph version
+3. Mutating a graph produces a new version
+4. Keystone scoring reuses one betweenness pass for every entity
+5. Sampled betweenness stays within its documented error bound
+"""
+
+import math
+from uuid import uuid4
+
+import networkx as nx
+import pytest
+
+from app.resilience.centrality import (
+    CentralityService,
+    betweenness_sample_size,
+    graph_digest,
+)
+from app.resilience import centrality as centrality_module
+from app.resilience.keystone_analysis import KeystoneAnalyzer
+
+
+def _max_error(actual: dict, expected: dict) -> float:
+    assert actual.keys() == expected.keys()
+    return max((abs(actual[n] - expected[n]) for n in expected), default=0.0)
+
+
+@pytest.fixture
+def service():
+    return CentralityService()
+
+
+@pytest.mark.parametrize(
+    "graph",
+    [
+        nx.gnm_random_graph(60, 150, seed=1),
+        nx.gnm_random_graph(40, 120, seed=2, directed=True),
+        nx.Graph([(1, 1), (1, 2), (2, 3)]),
+    ],
+    ids=["undirected", "directed", "self_loop"],
+)
+def test_measures_match_networkx(service, graph):
+    for i, (u, v) in enumerate(graph.edges()):
+        graph[u][v]["weight"] = 1 + i % 4
+
+    measures = service.measures(graph)
+
+    assert _max_error(measures["degree"], nx.degree_centrality(graph)) < 1e-12
+    assert (
+        _max_error(measures["betweenness"], nx.betweenness_centrality(graph)) < 1e-12
+    )
+    assert _max_error(measures["pagerank"], nx.pagerank(graph)) < 1e-12
+    assert (
+        _max_error(
+            measures["eigenvector"], nx.eigenvector_centrality(graph, max_iter=1000)
+        )
+        < 1e-12
+    )
+
+
+def test_each_measure_computed_once_per_version(service):
+    graph = nx.karate_club_graph()
+    rebuilt = nx.Graph(list(graph.edges(data=True)))
+
+    service.measures(graph)
+    service.measures(rebuilt)  # same structure, different object
+    service.betweenness(graph)
+
+    stats = service.get_stats()
+    assert stats["graphs"] == 1
+    assert stats["computations"] == {
+        "degree": 1,
+        "betweenness": 1,
+        "eigenvector": 1,
+        "pagerank": 1,
+    }
+    assert stats["hits"] == 5
+
+
+def test_mutation_creates_new_version(service):
+    graph = nx.path_graph(4)
+    before = graph_digest(graph)
+    assert service.betweenness(graph)[1] == pytest.approx(2 / 3)
+
+    graph.add_edge(0, 3)
+
+    assert graph_digest(graph) != before
+    assert service.betweenness(graph)[1] == pytest.approx(1 / 6)
+
+
+def test_keystone_scoring_reuses_betweenness(monkeypatch):
+    service = CentralityService()
+    monkeypatch.setattr(centrality_module, "_centrality_service", service)
+
+    class Entity:
+        def __init__(self, name):
+            self.id = uuid4()
+            self.name = name
+
+    faculty = [Entity(f"Faculty {i}") for i in range(8)]
+    services = {uuid4(): [f.id for f in faculty[i : i + 2]] for i in range(7)}
+    rotations = {
+        uuid4(): {"name": f"Rotation {i}", "required_services": [sid]}
+        for i, sid in enumerate(services)
+    }
+
+    KeystoneAnalyzer(keystone_threshold=0.0).identify_keystone_resources(
+        faculty, [], [], services, rotations
+    )
+
+    assert service.get_stats()["computations"]["betweenness"] == 1
+
+
+def test_sampled_betweenness_within_error_bound(service):
+    graph = nx.barabasi_albert_graph(400, 2, seed=3)
+    exact = nx.betweenness_centrality(graph)
+    epsilon, delta = 0.15, 0.1
+    k = betweenness_sample_size(graph.number_of_nodes(), epsilon, delta)
+
+    approximate = service.betweenness(graph, k=k)
+
+    assert k < graph.number_of_nodes()
+    assert _max_error(approximate, exact) < epsilon
+
+
+def test_sample_size_bound():
+    n, epsilon, delta = 10_000, 0.05, 0.1
+    k = betweenness_sample_size(n, epsilon, delta)
+
+    assert 2 * n * math.exp(-2 * (k - 1) * epsilon**2) <= delta
+    assert betweenness_sample_size(10, epsilon, delta) == 10
+
+
+def test_large_graphs_default_to_sampling():
+    service = CentralityService(approximate_above=50, epsilon=0.2, delta=0.2)
+    graph = nx.barabasi_albert_graph(200, 2, seed=4)
+
+    approximate = service.betweenness(graph)
+
+    assert _max_error(approximate, nx.betweenness_centrality(graph)) < 0.2
+    assert service.get_stats()["computations"]["betweenness"] == 1
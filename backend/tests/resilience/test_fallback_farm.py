@@ -0,0 +1,288 @@
+"""Tests for the fallback farm (pre-solved faculty-loss repairs)."""
+
+from dataclasses import replace
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.resilience.fallback_farm import (
+    FallbackFarm,
+    FallbackRepair,
+    LiveSchedule,
+    ScheduleSlot,
+    apply_repair,
+    loss_key,
+    lookup_repair,
+    save_repairs,
+    solve_repair,
+)
+from app.resilience.static_stability import FallbackScenario, FallbackScheduler
+
+
+def _schedule(faculty, blocks, pairs, unavailable=()):
+    """Schedule with one slot per (faculty index, block index) pair."""
+    return LiveSchedule(
+        faculty_ids=list(faculty),
+        slots=[ScheduleSlot(uuid4(), blocks[b], faculty[f]) for f, b in pairs],
+        unavailable={(faculty[f], blocks[b]) for f, b in unavailable},
+        block_dates={b: date.today() + timedelta(days=i) for i, b in enumerate(blocks)},
+    )
+
+
+@pytest.fixture
+def ids():
+    return [uuid4() for _ in range(4)], [uuid4() for _ in range(3)]
+
+
+def test_repair_moves_only_lost_slots_to_free_faculty(ids):
+    faculty, blocks = ids
+    # Faculty 0 covers every block; 1 is busy in block 0; 2 is absent in block 1
+    schedule = _schedule(
+        faculty,
+        blocks,
+        [(0, 0), (0, 1), (0, 2), (1, 0)],
+        unavailable=[(2, 1)],
+    )
+
+    repair = solve_repair(schedule, [faculty[0]])
+
+    assert repair.status == "optimal"
+    assert repair.coverage_rate == 1.0
+    moves = {r.block_id: r.to_person_id for r in repair.reassignments}
+    assert moves[blocks[0]] != faculty[1]
+    assert moves[blocks[1]] != faculty[2]
+    assert {r.from_person_id for r in repair.reassignments} == {faculty[0]}
+    # Three slots over three substitutes: nobody takes two
+    assert len(set(moves.values())) == 3
+
+
+def test_repair_reports_uncovered_slots(ids):
+    faculty, blocks = ids
+    schedule = _schedule(faculty[:2], blocks, [(0, 0), (1, 0)])
+
+    repair = solve_repair(schedule, [faculty[0]])
+
+    assert [r.block_id for r in repair.uncovered] == [blocks[0]]
+    assert repair.coverage_rate == 0.0
+
+
+def test_parallel_farm_matches_in_process(ids):
+    faculty, blocks = ids
+    schedule = _schedule(faculty, blocks, [(f, b) for f in range(3) for b in (f, 2)])
+
+    serial = FallbackFarm(workers=1).precompute(schedule)
+    parallel = FallbackFarm(workers=2).precompute(schedule)
+
+    assert set(serial) == {(faculty[f],) for f in range(3)}
+    assert set(parallel) == set(serial)
+    for key, repair in serial.items():
+        assert repair.coverage_rate == parallel[key].coverage_rate
+
+
+def test_lookup_checks_each_move(ids):
+    faculty, blocks = ids
+    schedule = _schedule(faculty, blocks, [(0, 0), (0, 1), (1, 2)])
+    repairs = FallbackFarm().precompute(schedule)
+    first, second = repairs[(faculty[0],)].reassignments
+
+    # Changes elsewhere in the schedule leave the repair usable
+    extra = ScheduleSlot(uuid4(), blocks[2], faculty[3])
+    changed = replace(schedule, slots=schedule.slots + [extra])
+    assert lookup_repair(repairs, [faculty[0]], changed).reassignments == [
+        first,
+        second,
+    ]
+
+    # One slot changed hands and the other substitute is now absent
+    slots = [
+        replace(s, person_id=faculty[2])
+        if s.assignment_id == first.assignment_id
+        else s
+        for s in schedule.slots
+    ]
+    stale = replace(
+        schedule, slots=slots, unavailable={(second.to_person_id, second.block_id)}
+    )
+    repair = lookup_repair(repairs, [faculty[0]], stale)
+    assert [r.assignment_id for r in repair.reassignments] == [second.assignment_id]
+    assert repair.uncovered == repair.reassignments
+    assert lookup_repair(repairs, [faculty[3]], schedule) is None
+
+
+def test_repair_round_trips_through_dict(ids):
+    faculty, blocks = ids
+    schedule = _schedule(faculty[:2], blocks, [(0, 0), (0, 1), (1, 1)])
+    repair = solve_repair(schedule, [faculty[0]])
+
+    restored = FallbackRepair.from_dict(repair.to_dict())
+
+    assert restored.lost_faculty == repair.lost_faculty == loss_key([faculty[0]])
+    assert restored.reassignments == repair.reassignments
+
+
+def test_scheduler_activates_installed_repair(ids):
+    faculty, blocks = ids
+    schedule = _schedule(faculty, blocks, [(0, 0), (1, 1), (1, 2)])
+    scheduler = FallbackScheduler()
+    today = date.today()
+
+    installed = scheduler.install_repairs(
+        FallbackFarm().precompute(schedule), today, today + timedelta(days=7)
+    )
+    # Absent only on the day of block 1
+    day = schedule.block_dates[blocks[1]]
+    repair = scheduler.activate_for_absence([faculty[1]], schedule, day, day)
+
+    fallback = installed[FallbackScenario.SINGLE_FACULTY_LOSS]
+    assert len(fallback.assignments) == 2
+    assert fallback.coverage_rate == 1.0
+    assert repair is not None and repair.lost_faculty == (faculty[1],)
+    assert [r.block_id for r in repair.reassignments] == [blocks[1]]
+    assert fallback.is_active
+
+
+def test_apply_repair_rechecks_moves_in_window(db, sample_faculty_members):
+    today = date.today()
+    tomorrow = today + timedelta(days=1)
+    blocks = [
+        Block(id=uuid4(), date=day, time_of_day=tod, block_number=1)
+        for day in (today, tomorrow)
+        for tod in ("AM", "PM")
+    ]
+    db.add_all(blocks)
+    lost = sample_faculty_members[0]
+    assignments = [
+        Assignment(id=uuid4(), block_id=b.id, person_id=lost.id, role="primary")
+        for b in blocks
+    ]
+    db.add_all(assignments)
+    db.commit()
+
+    schedule = LiveSchedule.from_db(db, today, tomorrow)
+    repair = solve_repair(schedule, [lost.id])
+    assert repair.coverage_rate == 1.0
+
+    # Today's AM slot changes hands before the repair is applied
+    other = next(f for f in sample_faculty_members if f.id != lost.id)
+    assignments[0].person_id = other.id
+    db.commit()
+
+    assert apply_repair(db, repair, today, today) == 1
+    db.commit()
+
+    for assignment in assignments:
+        db.refresh(assignment)
+    assert assignments[0].person_id == other.id
+    assert assignments[1].person_id != lost.id
+    # Tomorrow is outside the absence window
+    assert [a.person_id for a in assignments[2:]] == [lost.id, lost.id]
+
+
+def test_task_precomputes_configured_loss_sets(
+    db, sample_faculty_members, monkeypatch
+):
+    from app.resilience import fallback_farm, tasks
+
+    today = date.today()
+    block = Block(id=uuid4(), date=today, time_of_day="AM", block_number=1)
+    pair = [f.id for f in sample_faculty_members[:2]]
+    db.add(block)
+    db.add_all(
+        Assignment(id=uuid4(), block_id=block.id, person_id=pid, role="primary")
+        for pid in pair
+    )
+    db.commit()
+    saved = {}
+    monkeypatch.setattr(tasks, "get_db_session", lambda: db)
+    monkeypatch.setattr(
+        fallback_farm,
+        "save_repairs",
+        lambda fingerprint, repairs, *args, **kwargs: saved.update(repairs),
+    )
+
+    result = tasks.precompute_fallback_schedules(
+        days_ahead=7, workers=1, loss_sets=[[str(pid) for pid in pair]]
+    )
+
+    assert loss_key(pair) in saved
+    assert all((pid,) in saved for pid in pair)
+    double = result["results"][FallbackScenario.DOUBLE_FACULTY_LOSS.value]
+    assert double["repairs"] == 1
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.values = {}
+
+    def setex(self, key, ttl, value):
+        self.values[key] = value
+
+    def get(self, key):
+        return self.values.get(key)
+
+
+def test_activate_route_applies_stored_repair(
+    client, auth_headers, db, sample_faculty_members, monkeypatch
+):
+    from app.resilience import fallback_farm
+
+    today = date.today()
+    blocks = [
+        Block(id=uuid4(), date=today, time_of_day=tod, block_number=1)
+        for tod in ("AM", "PM")
+    ]
+    db.add_all(blocks)
+    lost = sample_faculty_members[0]
+    assignments = [
+        Assignment(id=uuid4(), block_id=b.id, person_id=lost.id, role="primary")
+        for b in blocks
+    ]
+    db.add_all(assignments)
+    db.commit()
+
+    # The worker saved repairs; the API process has none installed
+    redis = _FakeRedis()
+    monkeypatch.setattr(fallback_farm, "_get_redis_client", lambda: redis)
+    schedule = LiveSchedule.from_db(db, today, today)
+    save_repairs(
+        schedule.fingerprint,
+        FallbackFarm().precompute(schedule),
+        today,
+        today,
+        redis_client=redis,
+    )
+
+    response = client.post(
+        "/api/v1/resilience/fallbacks/activate",
+        headers=auth_headers,
+        json={
+            "scenario": "single_faculty_loss",
+            "reason": "Dr. Lost called in sick",
+            "faculty_ids": [str(lost.id)],
+            "start_date": today.isoformat(),
+            "end_date": today.isoformat(),
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["assignments_count"] == 2
+    for assignment in assignments:
+        db.refresh(assignment)
+        assert assignment.person_id != lost.id
+
+    other = sample_faculty_members[1]
+    response = client.post(
+        "/api/v1/resilience/fallbacks/activate",
+        headers=auth_headers,
+        json={
+            "scenario": "single_faculty_loss",
+            "reason": "No repair for this one",
+            "faculty_ids": [str(other.id)],
+            "start_date": today.isoformat(),
+            "end_date": today.isoformat(),
+        },
+    )
+    assert response.status_code == 404
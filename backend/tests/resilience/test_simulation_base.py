@@ -26,6 +26,8 @@ class TestSimulationConfigDefaults:
         assert cfg.pcs_probability == 0.0027
         assert cfg.recovery_time_hours == 4.0
         assert cfg.borrowing_enabled is True
+        assert cfg.workers == 1
+        assert cfg.ci_target is None
 
 
 # -- SimulationConfig validation ---------------------------------------------
@@ -100,6 +102,14 @@ class TestSimulationConfigValidation:
         with pytest.raises(ValueError, match="recovery_time_hours cannot be negative"):
             SimulationConfig(recovery_time_hours=-1.0)
 
+    def test_zero_workers_raises(self):
+        with pytest.raises(ValueError, match="workers must be at least 1"):
+            SimulationConfig(workers=0)
+
+    def test_non_positive_ci_target_raises(self):
+        with pytest.raises(ValueError, match="ci_target must be positive"):
+            SimulationConfig(ci_target=0.0)
+
     def test_zero_recovery_time_ok(self):
         cfg = SimulationConfig(recovery_time_hours=0.0)
         assert cfg.recovery_time_hours == 0.0
@@ -0,0 +1,135 @@
+"""Tests for the Monte Carlo replication runner (pure logic, no DB)."""
+
+from functools import partial
+
+import pytest
+
+from app.resilience.simulation.base import SimulationConfig
+from app.resilience.simulation.cascade_scenario import (
+    CascadeConfig,
+    cascade_replication,
+)
+from app.resilience.simulation.compound_stress_scenario import (
+    CompoundStressConfig,
+    run_compound_monte_carlo,
+)
+from app.resilience.simulation.n2_scenario import (
+    N2ContingencyScenario,
+    N2ScenarioConfig,
+    n2_replication,
+)
+from app.resilience.simulation.replication import (
+    ReplicationRunner,
+    RunningStatistic,
+)
+
+N2_CONFIG = N2ScenarioConfig(iterations=45)
+
+
+def _coin(seed: int) -> dict[str, float]:
+    return {"heads": float(seed % 2), "seed": float(seed)}
+
+
+# -- RunningStatistic ----------------------------------------------------------
+
+
+class TestRunningStatistic:
+    def test_mean_and_variance(self):
+        stat = RunningStatistic()
+        for value in [2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0]:
+            stat.add(value)
+        assert stat.mean == pytest.approx(5.0)
+        assert stat.variance == pytest.approx(32 / 7)
+        assert not stat.is_proportion
+
+    def test_proportion_uses_wilson_interval(self):
+        stat = RunningStatistic()
+        for _ in range(50):
+            stat.add(0.0)
+        # A normal approximation would claim zero uncertainty here
+        assert stat.is_proportion
+        assert stat.half_width() > 0.03
+
+    def test_half_width_undefined_before_two_samples(self):
+        stat = RunningStatistic()
+        stat.add(1.0)
+        assert stat.half_width() == float("inf")
+
+
+# -- ReplicationRunner ---------------------------------------------------------
+
+
+class TestReplicationRunner:
+    def test_seeds_are_reproducible_and_distinct(self):
+        runner = ReplicationRunner(SimulationConfig(seed=3), max_replications=60)
+        first = [seed for chunk in runner._seed_chunks() for seed in chunk]
+        second = [seed for chunk in runner._seed_chunks() for seed in chunk]
+        assert first == second
+        assert len(set(first)) == 60
+
+    def test_results_do_not_depend_on_worker_count(self):
+        summaries = [
+            ReplicationRunner(
+                SimulationConfig(seed=11, workers=workers), max_replications=60
+            ).run(partial(n2_replication, N2_CONFIG), "zone_failure_probability")
+            for workers in (1, 2)
+        ]
+        assert summaries[0].replications == summaries[1].replications == 60
+        assert summaries[0].means == summaries[1].means
+
+    def test_stops_early_once_interval_is_narrow(self):
+        runner = ReplicationRunner(
+            SimulationConfig(seed=5, ci_target=0.2),
+            max_replications=1000,
+            min_replications=30,
+            chunk_size=10,
+        )
+        summary = runner.run(_coin, "heads")
+        assert summary.converged
+        assert summary.stopped_early
+        assert summary.replications % 10 == 0
+        assert summary.ci_half_widths["heads"] < 0.2
+        low, high = summary.confidence_interval("heads")
+        assert low < summary.means["heads"] < high
+
+    def test_runs_all_replications_without_target(self):
+        summary = ReplicationRunner(SimulationConfig(), max_replications=40).run(
+            _coin, "heads"
+        )
+        assert summary.replications == 40
+        assert not summary.converged
+
+
+# -- Scenario replications -----------------------------------------------------
+
+
+class TestScenarioReplications:
+    def test_n2_replication_matches_scenario_run(self):
+        metrics = n2_replication(N2_CONFIG, seed=9)
+        result = N2ContingencyScenario(
+            N2ScenarioConfig(iterations=45, seed=9)
+        ).run()
+        assert metrics["zone_failure_probability"] == pytest.approx(
+            1 - result.pass_rate
+        )
+
+    def test_n2_losing_whole_zone_fails(self):
+        scenario = N2ContingencyScenario(
+            N2ScenarioConfig(faculty_count=4, zone_count=1, minimum_zone_coverage=2)
+        )
+        scenario.setup()
+        assert scenario._check_zone_sufficiency(0) == {0: "failed"}
+
+    def test_cascade_replication_metrics(self):
+        metrics = cascade_replication(CascadeConfig(max_simulation_days=60), seed=1)
+        assert metrics["collapsed"] in (0.0, 1.0)
+        assert metrics["final_faculty_count"] >= 0
+
+    def test_compound_monte_carlo_keeps_summary_keys(self):
+        mc = run_compound_monte_carlo(
+            CompoundStressConfig(duration_days=30), n_runs=20
+        )
+        assert mc["n_runs"] == 20
+        assert 0.0 <= mc["fmit_survival_rate"] <= 1.0
+        low, high = mc["fmit_survival_ci"]
+        assert low <= mc["fmit_survival_rate"] <= high
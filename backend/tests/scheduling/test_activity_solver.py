@@ -557,6 +557,119 @@ class TestHelperMethods:
         assert result == set()
 
 
+class TestEligibilityCompilation:
+    """Tests for _compile_eligibility (row-level predicate evaluation)."""
+
+    def _compile(self, solver, slots, template, activities, allowed):
+        clinic, cv, vas = activities
+        slot_meta = {
+            s_i: {
+                "person_id": slot.person_id,
+                "person_type": slot.person.type,
+                "template_id": template.id,
+                "week": 1,
+                "date": slot.date,
+                "time_of_day": slot.time_of_day,
+                "pgy_level": slot.person.pgy_level,
+            }
+            for s_i, slot in enumerate(slots)
+        }
+        activity_by_id = {act.id: act for act in activities}
+        return solver._compile_eligibility(
+            slots,
+            slot_meta,
+            {template.id: template},
+            activity_by_id,
+            set(activity_by_id),
+            {template.id: allowed},
+            [clinic.id, cv.id, vas.id],
+            [],
+            None,
+            clinic,
+            cv,
+            {vas.id},
+        )
+
+    def test_slots_share_rows_and_match_per_slot_rules(self):
+        """Residents sharing template and PGY share a row; VAS/CV gates hold."""
+        template = SimpleNamespace(
+            id=uuid4(),
+            name="Continuity Clinic",
+            abbreviation="C",
+            display_abbreviation="C",
+            rotation_type="outpatient",
+        )
+        clinic = _make_activity("C")
+        cv = _make_activity("CV")
+        vas = _make_activity("VAS")
+        monday, thursday = date(2026, 1, 5), date(2026, 1, 8)
+        slots = []
+        for pgy_level in (1, 2, 2):
+            for slot_date in (monday, thursday):
+                slot = _make_slot(person_type="resident", slot_date=slot_date)
+                slot.person.pgy_level = pgy_level
+                slots.append(slot)
+
+        solver = CPSATActivitySolver(MagicMock())
+        with patch.object(
+            solver,
+            "_is_vas_resident_template",
+            wraps=solver._is_vas_resident_template,
+        ) as vas_template_check:
+            eligibility = self._compile(
+                solver, slots, template, [clinic, cv, vas], [clinic.id, vas.id]
+            )
+
+        assert len(eligibility.row_allowed) == 2
+        assert vas_template_check.call_count == 2
+        assert eligibility.allowed_ids(0) == [clinic.id]
+        assert eligibility.allowed_ids(1) == [clinic.id, vas.id]
+        assert eligibility.allowed_ids(2) == [clinic.id, cv.id]
+        assert eligibility.allowed_ids(3) == [clinic.id, vas.id, cv.id]
+        assert eligibility.allowed.shape == (6, 3)
+        assert eligibility.allowed.sum() == 1 + 2 + 2 * (2 + 3)
+
+        pgy2_row = eligibility.slot_rows[3]
+        assert eligibility.vas_penalty[pgy2_row].tolist() == [0, 5]
+        assert eligibility.cv_penalty[pgy2_row] == 15
+        cv_col = eligibility.columns[cv.id]
+        clinic_col = eligibility.columns[clinic.id]
+        assert eligibility.capacity[pgy2_row, clinic_col]
+        assert not eligibility.capacity[pgy2_row, cv_col]
+
+    def test_faculty_predicates_run_once_per_person(self):
+        """Faculty eligibility is evaluated once per person, not per slot."""
+        template = SimpleNamespace(
+            id=uuid4(), name="Clinic", abbreviation="X", display_abbreviation="X"
+        )
+        clinic = _make_activity("C")
+        cv = _make_activity("CV")
+        vas = _make_activity("VAS")
+        first = _make_slot(person_type="faculty", slot_date=date(2026, 1, 5))
+        first.person.min_clinic_halfdays_per_week = 2
+        first.person.max_clinic_halfdays_per_week = 4
+        slots = [first]
+        for day in range(6, 10):
+            slot = _make_slot(person_type="faculty", slot_date=date(2026, 1, day))
+            slot.person, slot.person_id = first.person, first.person_id
+            slots.append(slot)
+
+        solver = CPSATActivitySolver(MagicMock())
+        with patch.object(
+            solver, "_get_faculty_clinic_caps", wraps=solver._get_faculty_clinic_caps
+        ) as caps:
+            eligibility = self._compile(
+                solver, slots, template, [clinic, cv, vas], [clinic.id]
+            )
+
+        assert caps.call_count == 1
+        assert set(eligibility.slot_rows.tolist()) == {0}
+        assert all(
+            eligibility.allowed_ids(s_i) == [clinic.id, cv.id]
+            for s_i in range(len(slots))
+        )
+
+
 class TestSolveReturnFormat:
     """Tests for solve() return value structure."""
 
@@ -876,6 +989,13 @@ class TestFacultyImmutability:
         assert result["success"] is True
         assert resident_slot.activity_id == clinic_activity.id
         assert faculty_slot.activity_id == existing_faculty_activity_id
+        assert set(result["stage_timings"]) == {
+            "load",
+            "compile_eligibility",
+            "build_model",
+            "solve",
+            "extract",
+        }
 
     def test_solve_keeps_baseline_faculty_slots_unchanged(self):
         """Baseline faculty slots (solver source) should remain unchanged."""
@@ -0,0 +1,173 @@
+"""Tests for the shared-snapshot conflict analysis and its incremental cache."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import insert, text
+from sqlalchemy.orm import Session
+
+from app.models.activity import Activity
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.half_day_assignment import HalfDayAssignment
+from app.models.person import Person
+from app.scheduling.conflicts import ConflictAnalyzer, ConflictType
+from app.scheduling.conflicts.cache import conflict_cache
+
+pytestmark = pytest.mark.asyncio
+
+START = date(2026, 2, 2)  # Monday
+END = START + timedelta(days=13)
+
+
+@pytest.fixture
+def schedule(db: Session) -> dict:
+    """A resident working 8 days straight and an unsupervised clinic slot."""
+    resident = Person(
+        id=uuid4(), name="Dr. Resident", type="resident", email="r@x.org", pgy_level=1
+    )
+    faculty = Person(id=uuid4(), name="Dr. Faculty", type="faculty", email="f@x.org")
+    clinic = Activity(id=uuid4(), name="Virtual clinic", code="CV", activity_category="clinical")
+    attending = Activity(
+        id=uuid4(),
+        name="Attending",
+        code="AT",
+        activity_category="clinical",
+        provides_supervision=True,
+    )
+    blocks = [
+        Block(id=uuid4(), date=START + timedelta(days=d), time_of_day="AM", block_number=1)
+        for d in range(14)
+    ]
+    db.add_all([resident, faculty, clinic, attending, *blocks])
+    db.flush()
+    assignments = [
+        Assignment(block_id=blocks[d].id, person_id=resident.id, role="primary")
+        for d in range(8)
+    ]
+    db.add_all(assignments)
+    db.add(
+        HalfDayAssignment(
+            person_id=resident.id,
+            date=START,
+            time_of_day="AM",
+            activity_id=clinic.id,
+            source="solver",
+        )
+    )
+    db.commit()
+    return {
+        "resident": resident,
+        "faculty": faculty,
+        "attending": attending,
+        "assignments": assignments,
+    }
+
+
+def _types(conflicts) -> list[ConflictType]:
+    return sorted(c.conflict_type for c in conflicts)
+
+
+async def _assert_matches_fresh_analysis(analyzer: ConflictAnalyzer, conflicts) -> None:
+    fresh = await analyzer.analyze_schedule(START, END, use_cache=False)
+    assert sorted(c.conflict_id for c in conflicts) == sorted(
+        c.conflict_id for c in fresh
+    )
+
+
+async def test_cached_analysis_matches_and_is_reused(schedule, async_db_session):
+    analyzer = ConflictAnalyzer(async_db_session)
+    before = conflict_cache.get_stats()
+
+    conflicts = await analyzer.analyze_schedule(START, END)
+    assert _types(conflicts) == sorted(
+        [ConflictType.ONE_IN_SEVEN_VIOLATION, ConflictType.SUPERVISION_RATIO_VIOLATION]
+    )
+    await _assert_matches_fresh_analysis(analyzer, conflicts)
+
+    again = await analyzer.analyze_schedule(START, END)
+    assert [c.conflict_id for c in again] == [c.conflict_id for c in conflicts]
+    assert conflict_cache.get_stats()["hits"] == before["hits"] + 1
+
+    # Focusing on a person drops other people's ACGME conflicts
+    focused = await analyzer.analyze_schedule(START, END, person_id=schedule["faculty"].id)
+    assert _types(focused) == [ConflictType.SUPERVISION_RATIO_VIOLATION]
+
+
+async def test_edits_recheck_only_touched_people_and_dates(
+    db: Session, schedule, async_db_session
+):
+    analyzer = ConflictAnalyzer(async_db_session)
+    await analyzer.analyze_schedule(START, END)
+    before = conflict_cache.get_stats()
+
+    # A day off in the middle ends the 1-in-7 violation
+    db.delete(schedule["assignments"][3])
+    db.commit()
+    conflicts = await analyzer.analyze_schedule(START, END)
+    assert _types(conflicts) == [ConflictType.SUPERVISION_RATIO_VIOLATION]
+    await _assert_matches_fresh_analysis(analyzer, conflicts)
+
+    # An attending in the clinic slot resolves the supervision conflict
+    db.add(
+        HalfDayAssignment(
+            person_id=schedule["faculty"].id,
+            date=START,
+            time_of_day="AM",
+            activity_id=schedule["attending"].id,
+            source="manual",
+        )
+    )
+    db.commit()
+    conflicts = await analyzer.analyze_schedule(START, END)
+    assert conflicts == []
+
+    stats = conflict_cache.get_stats()
+    assert stats["incremental"] == before["incremental"] + 2
+    assert stats["full"] == before["full"]
+
+
+async def test_changes_without_events_trigger_full_rebuild(
+    db: Session, schedule, async_db_session
+):
+    analyzer = ConflictAnalyzer(async_db_session)
+    await analyzer.analyze_schedule(START, END)
+    before = conflict_cache.get_stats()
+
+    # Raw SQL bypasses the ORM, like a write from another worker
+    db.execute(text("DELETE FROM half_day_assignments"))
+    db.commit()
+
+    conflicts = await analyzer.analyze_schedule(START, END)
+    assert _types(conflicts) == [ConflictType.ONE_IN_SEVEN_VIOLATION]
+    assert conflict_cache.get_stats()["full"] == before["full"] + 1
+
+
+async def test_unseen_changes_alongside_events_trigger_full_rebuild(
+    db: Session, schedule, async_db_session
+):
+    analyzer = ConflictAnalyzer(async_db_session)
+    await analyzer.analyze_schedule(START, END)
+    before = conflict_cache.get_stats()
+
+    # The resident's edit has an event; the faculty's Core write does not
+    db.delete(schedule["assignments"][3])
+    db.commit()
+    db.connection().execute(
+        insert(HalfDayAssignment.__table__).values(
+            id=uuid4(),
+            person_id=schedule["faculty"].id,
+            date=START,
+            time_of_day="AM",
+            activity_id=schedule["attending"].id,
+            source="manual",
+        )
+    )
+    db.commit()
+
+    conflicts = await analyzer.analyze_schedule(START, END)
+    assert conflicts == []
+    stats = conflict_cache.get_stats()
+    assert stats["full"] == before["full"] + 1
+    assert stats["incremental"] == before["incremental"]
@@ -0,0 +1,280 @@
+"""Tests for compiled CP-SAT model reuse across solves."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+from app.scheduling.constraints import ConstraintManager, SchedulingContext
+from app.scheduling.constraints.acgme import AvailabilityConstraint
+from app.scheduling.constraints.call_coverage import OvernightCallCoverageConstraint
+from app.scheduling.cpsat_model_cache import (
+    CPSATModelCache,
+    run_digest,
+    split_constraints,
+    structure_digest,
+)
+from app.scheduling.solvers import CPSATSolver
+
+
+class MockPerson:
+    def __init__(self, name="Test Person", person_type="resident", pgy_level=1):
+        self.id = uuid4()
+        self.name = name
+        self.type = person_type
+        self.pgy_level = pgy_level
+
+
+class MockBlock:
+    def __init__(self, block_date, time_of_day="AM"):
+        self.id = uuid4()
+        self.date = block_date
+        self.time_of_day = time_of_day
+        self.is_weekend = block_date.weekday() >= 5
+
+
+class MockTemplate:
+    def __init__(self, name, rotation_type="inpatient"):
+        self.id = uuid4()
+        self.name = name
+        self.rotation_type = rotation_type
+        self.max_residents = None
+        self.requires_procedure_credential = False
+
+
+class MockAssignment:
+    def __init__(self, person_id, block_id, rotation_template_id):
+        self.person_id = person_id
+        self.block_id = block_id
+        self.rotation_template_id = rotation_template_id
+
+
+def _make_context() -> SchedulingContext:
+    start = date(2024, 1, 8)  # Monday
+    blocks = [
+        MockBlock(start + timedelta(days=offset), tod)
+        for offset in range(2)
+        for tod in ("AM", "PM")
+    ]
+    residents = [MockPerson(name=f"Resident {i}") for i in range(2)]
+    faculty = [MockPerson(name="Faculty", person_type="faculty", pgy_level=None)]
+    context = SchedulingContext(
+        residents=residents,
+        faculty=faculty,
+        blocks=blocks,
+        templates=[MockTemplate("Wards"), MockTemplate("Nights")],
+        start_date=start,
+        end_date=start + timedelta(days=1),
+    )
+    for person in residents + faculty:
+        context.availability[person.id] = {
+            block.id: {"available": True, "replacement": None} for block in blocks
+        }
+    return context
+
+
+def _make_solver(cache: CPSATModelCache, manager=None) -> CPSATSolver:
+    return CPSATSolver(
+        constraint_manager=manager or ConstraintManager(),
+        timeout_seconds=5,
+        num_workers=1,
+        model_cache=cache,
+    )
+
+
+def _count_compiles(monkeypatch) -> list[int]:
+    calls: list[int] = []
+    original = CPSATSolver._compile_model
+
+    def counting(self, *args, **kwargs):
+        calls.append(1)
+        return original(self, *args, **kwargs)
+
+    monkeypatch.setattr(CPSATSolver, "_compile_model", counting)
+    return calls
+
+
+def test_resolve_reuses_compiled_model(monkeypatch):
+    calls = _count_compiles(monkeypatch)
+    cache = CPSATModelCache()
+    context = _make_context()
+
+    first = _make_solver(cache).solve(context)
+    second = _make_solver(cache).solve(context)
+
+    assert first.success and second.success
+    assert len(calls) == 1
+    assert first.statistics["model_cache"] == "miss"
+    assert second.statistics["model_cache"] == "hit"
+    assert second.objective_value == first.objective_value
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_preserved_assignments_are_pinned_on_a_clone():
+    cache = CPSATModelCache()
+    context = _make_context()
+    resident, block = context.residents[0], context.blocks[0]
+    nights = context.templates[1]
+    _make_solver(cache).solve(context)
+
+    result = _make_solver(cache).solve(
+        context, [MockAssignment(resident.id, block.id, nights.id)]
+    )
+
+    assert result.statistics["model_cache"] == "hit"
+    assert (resident.id, block.id, nights.id) in result.assignments
+    # The cached template keeps its original, unpinned domains
+    (compiled,) = cache._entries.values()
+    template_var = compiled.x[0, context.block_idx[block.id], 1]
+    domain = compiled.model.Proto().variables[template_var.Index()].domain
+    assert list(domain) == [0, 1]
+
+
+def test_availability_change_reuses_template(monkeypatch):
+    calls = _count_compiles(monkeypatch)
+    cache = CPSATModelCache()
+    context = _make_context()
+    _make_solver(cache).solve(context)
+
+    resident, block = context.residents[0], context.blocks[0]
+    context.availability[resident.id][block.id] = {
+        "available": False,
+        "replacement": "Leave",
+    }
+    result = _make_solver(cache).solve(context)
+
+    assert len(calls) == 1
+    assert result.success
+    assert result.statistics["model_cache"] == "hit"
+    assert all(
+        (person_id, block_id) != (resident.id, block.id)
+        for person_id, block_id, _ in result.assignments
+    )
+    # The closed slot is pinned on the clone, not the cached template
+    (compiled,) = cache._entries.values()
+    indicator = compiled.x_2d[0, context.block_idx[block.id]]
+    domain = compiled.model.Proto().variables[indicator.Index()].domain
+    assert list(domain) == [0, 1]
+
+
+def test_existing_assignment_edit_hits_cache():
+    cache = CPSATModelCache()
+    context = _make_context()
+    _make_solver(cache).solve(context)
+
+    resident, block = context.residents[0], context.blocks[0]
+    context.existing_assignments = [
+        MockAssignment(resident.id, block.id, context.templates[0].id)
+    ]
+    context.locked_blocks = {(resident.id, block.id)}
+    result = _make_solver(cache).solve(context)
+
+    assert result.success
+    assert result.statistics["model_cache"] == "hit"
+    assert all(
+        (person_id, block_id) != (resident.id, block.id)
+        for person_id, block_id, _ in result.assignments
+    )
+
+
+def test_run_layer_rebuilt_only_when_its_inputs_change(monkeypatch):
+    calls = _count_compiles(monkeypatch)
+    cache = CPSATModelCache()
+    context = _make_context()
+
+    def solve():
+        manager = ConstraintManager().add(AvailabilityConstraint())
+        return _make_solver(cache, manager).solve(context)
+
+    first = solve()
+    second = solve()
+    resident, block = context.residents[1], context.blocks[2]
+    context.availability[resident.id][block.id]["available"] = False
+    third = solve()
+
+    assert len(calls) == 1
+    assert first.statistics["model_cache"] == "miss"
+    assert second.statistics["model_cache"] == "hit"
+    assert third.statistics["model_cache"] == "template"
+    assert third.success
+    assert all(
+        (person_id, block_id) != (resident.id, block.id)
+        for person_id, block_id, _ in third.assignments
+    )
+
+
+def test_run_inputs_are_not_part_of_structure_digest():
+    context = _make_context()
+    manager = ConstraintManager().add(AvailabilityConstraint())
+    _, run_layer = split_constraints(manager)
+    digest = structure_digest(context, manager)
+    layer = run_digest(context, run_layer)
+
+    resident, block = context.residents[0], context.blocks[0]
+    context.availability[resident.id][block.id]["available"] = False
+
+    assert structure_digest(context, manager) == digest
+    assert run_digest(context, run_layer) != layer
+
+
+def test_constraint_configuration_is_part_of_digest():
+    context = _make_context()
+    plain = ConstraintManager()
+    with_call = ConstraintManager().add(OvernightCallCoverageConstraint())
+
+    assert structure_digest(context, plain) == structure_digest(context, plain)
+    assert structure_digest(context, plain) != structure_digest(context, with_call)
+
+
+def test_disabled_cache_builds_every_time(monkeypatch):
+    calls = _count_compiles(monkeypatch)
+    cache = CPSATModelCache(max_entries=0)
+    context = _make_context()
+
+    _make_solver(cache).solve(context)
+    result = _make_solver(cache).solve(context)
+
+    assert len(calls) == 2
+    assert result.statistics["model_cache"] == "disabled"
+
+
+def test_cache_evicts_least_recently_used():
+    cache = CPSATModelCache(max_entries=1)
+    first, second = _make_context(), _make_context()
+
+    _make_solver(cache).solve(first)
+    _make_solver(cache).solve(second)
+    result = _make_solver(cache).solve(first)
+
+    assert result.statistics["model_cache"] == "miss"
+    assert cache.get_stats()["evictions"] == 2
+
+
+def test_digest_reads_declared_fields_not_identity():
+    context = _make_context()
+    digest = structure_digest(context, ConstraintManager())
+
+    # Equal content in new objects digests the same
+    copies = []
+    for template in context.templates:
+        copy = MockTemplate(template.name, template.rotation_type)
+        copy.id = template.id
+        copies.append(copy)
+    context.templates = copies
+    assert structure_digest(context, ConstraintManager()) == digest
+
+    # A changed scalar field does not
+    context.templates[0].max_residents = 1
+    assert structure_digest(context, ConstraintManager()) != digest
+
+
+def test_undigestable_input_is_not_cached():
+    class Opaque:
+        pass
+
+    cache = CPSATModelCache()
+    context = _make_context()
+    context.preferences = {"source": Opaque()}
+
+    assert structure_digest(context, ConstraintManager()) is None
+    result = _make_solver(cache).solve(context)
+    assert result.statistics["model_cache"] == "uncacheable"
+    assert cache.get_stats()["entries"] == 0
@@ -0,0 +1,218 @@
+"""Tests for set-based persistence of solver output into half-day slots."""
+
+from datetime import date
+from types import SimpleNamespace
+from unittest.mock import patch
+from uuid import uuid4
+
+from sqlalchemy import event
+
+from app.db.batch_operations import upsert_half_day_assignments
+from app.models.activity import Activity, ActivityCategory
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
+from app.models.person import FacultyRole, Person
+from app.scheduling.engine import SchedulingEngine
+from app.scheduling.solvers import SolverResult
+
+MONDAY = date(2026, 5, 11)
+TUESDAY = date(2026, 5, 12)
+
+
+def _create_activity(db, code: str) -> Activity:
+    activity = Activity(
+        id=uuid4(),
+        name=code.upper(),
+        code=code,
+        display_abbreviation=code.upper(),
+        activity_category=ActivityCategory.CLINICAL.value,
+        is_protected=False,
+        counts_toward_physical_capacity=False,
+    )
+    db.add(activity)
+    db.flush()
+    return activity
+
+
+def _create_person(db, person_type: str = "resident") -> Person:
+    person = Person(
+        id=uuid4(),
+        name=f"Test {person_type}",
+        type=person_type,
+        faculty_role=FacultyRole.CORE.value if person_type == "faculty" else None,
+    )
+    db.add(person)
+    db.flush()
+    return person
+
+
+def _create_hda(db, person_id, slot_date, tod, activity_id, source):
+    hda = HalfDayAssignment(
+        person_id=person_id,
+        date=slot_date,
+        time_of_day=tod,
+        activity_id=activity_id,
+        source=source,
+    )
+    db.add(hda)
+    db.flush()
+    return hda
+
+
+def _block(slot_date: date, tod: str) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=uuid4(), date=slot_date, time_of_day=tod, is_weekend=False
+    )
+
+
+def _make_engine(db) -> SchedulingEngine:
+    """Create engine with real DB but bypassed __init__."""
+    with patch.object(SchedulingEngine, "__init__", lambda self, *a, **kw: None):
+        engine = SchedulingEngine.__new__(SchedulingEngine)
+        engine.db = db
+        engine.start_date = MONDAY
+        engine.end_date = TUESDAY
+    return engine
+
+
+def _slot(db, person_id, slot_date, tod) -> HalfDayAssignment:
+    return (
+        db.query(HalfDayAssignment)
+        .filter_by(person_id=person_id, date=slot_date, time_of_day=tod)
+        .one()
+    )
+
+
+def _count_statements(db) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    return statements
+
+
+def test_resident_slots_are_upserted_around_locked_rows(db):
+    off = _create_activity(db, "OFF")
+    fmit = _create_activity(db, "FMIT")
+    resident = _create_person(db)
+    blocks = [_block(MONDAY, "AM"), _block(MONDAY, "PM"), _block(TUESDAY, "AM")]
+    _create_hda(db, resident.id, MONDAY, "AM", fmit.id, AssignmentSource.PRELOAD.value)
+    stale = _create_hda(
+        db, resident.id, MONDAY, "PM", fmit.id, AssignmentSource.TEMPLATE.value
+    )
+    assignments = [
+        SimpleNamespace(person_id=resident.id, block_id=block.id) for block in blocks
+    ]
+
+    written = _make_engine(db)._persist_solver_assignments_to_half_day(
+        assignments, blocks
+    )
+
+    assert written == 2
+    locked = _slot(db, resident.id, MONDAY, "AM")
+    assert locked.activity_id == fmit.id
+    assert locked.source == AssignmentSource.PRELOAD.value
+    db.refresh(stale)
+    assert stale.activity_id == off.id
+    assert stale.source == AssignmentSource.SOLVER.value
+    assert _slot(db, resident.id, TUESDAY, "AM").activity_id == off.id
+
+
+def test_faculty_slots_use_one_upsert_statement(db):
+    _create_activity(db, "OFF")
+    clinic = _create_activity(db, "C")
+    supervise = _create_activity(db, "AT")
+    faculty = _create_person(db, "faculty")
+    blocks = [_block(MONDAY, "AM"), _block(MONDAY, "PM"), _block(TUESDAY, "AM")]
+    result = SolverResult(
+        success=True,
+        assignments=[],
+        status="optimal",
+        faculty_half_day_assignments=[
+            (faculty.id, blocks[0].id, "C"),
+            (faculty.id, blocks[1].id, "AT"),
+            (faculty.id, blocks[2].id, "C"),
+        ],
+    )
+    engine = _make_engine(db)
+    engine._get_activity_id_by_code("C")
+    engine._get_activity_id_by_code("AT")
+
+    statements = _count_statements(db)
+    written = engine._persist_faculty_half_day_from_solver(result, blocks)
+
+    assert written == 3
+    inserts = [s for s in statements if s.lstrip().upper().startswith("INSERT")]
+    assert len(inserts) == 1
+    assert "ON CONFLICT" in inserts[0].upper()
+    assert _slot(db, faculty.id, MONDAY, "AM").activity_id == clinic.id
+    assert _slot(db, faculty.id, MONDAY, "PM").activity_id == supervise.id
+
+
+def test_upsert_without_overwrite_only_fills_gaps(db):
+    off = _create_activity(db, "OFF")
+    clinic = _create_activity(db, "C")
+    faculty = _create_person(db, "faculty")
+    _create_hda(db, faculty.id, MONDAY, "AM", clinic.id, AssignmentSource.SOLVER.value)
+    rows = [
+        {
+            "person_id": faculty.id,
+            "date": slot_date,
+            "time_of_day": "AM",
+            "activity_id": off.id,
+            "source": AssignmentSource.SOLVER.value,
+        }
+        for slot_date in (MONDAY, TUESDAY)
+    ]
+
+    result = upsert_half_day_assignments(db, rows, overwrite=False)
+
+    assert (result.created, result.updated, result.skipped_existing) == (1, 0, 1)
+    assert _slot(db, faculty.id, MONDAY, "AM").activity_id == clinic.id
+    assert _slot(db, faculty.id, TUESDAY, "AM").activity_id == off.id
+
+
+def test_upsert_collapses_duplicate_slots(db):
+    off = _create_activity(db, "OFF")
+    clinic = _create_activity(db, "C")
+    resident = _create_person(db)
+    row = {
+        "person_id": resident.id,
+        "date": MONDAY,
+        "time_of_day": "PM",
+        "source": AssignmentSource.SOLVER.value,
+    }
+
+    result = upsert_half_day_assignments(
+        db, [{**row, "activity_id": off.id}, {**row, "activity_id": clinic.id}]
+    )
+
+    assert result.created == 1
+    assert _slot(db, resident.id, MONDAY, "PM").activity_id == clinic.id
+
+
+def test_delete_existing_counts_only_preserved_in_range(db):
+    resident = _create_person(db)
+    blocks = [
+        Block(id=uuid4(), date=slot_date, time_of_day="AM", block_number=1)
+        for slot_date in (MONDAY, TUESDAY, date(2026, 5, 19))
+    ]
+    db.add_all(blocks)
+    db.flush()
+    kept, replaced, outside = (
+        Assignment(id=uuid4(), block_id=block.id, person_id=resident.id, role="primary")
+        for block in blocks
+    )
+    db.add_all([kept, replaced, outside])
+    db.flush()
+
+    with patch("app.scheduling.engine.logger") as mock_logger:
+        _make_engine(db)._delete_existing_assignments({kept.id, outside.id})
+
+    message = mock_logger.info.call_args[0][0]
+    assert "Deleted 1 existing assignments" in message
+    assert message.endswith("preserved 1")
+    assert {a.id for a in db.query(Assignment)} == {kept.id, outside.id}
@@ -0,0 +1,175 @@
+"""Tests for batch what-if ACGME evaluation of swap candidates."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.services.swap.validation import Shift, SwapDelta
+from app.services.swap.validation.batch_compliance import (
+    DOUBLE_BOOKED,
+    EIGHTY_HOUR,
+    ONE_IN_SEVEN,
+    DutyHourTimelines,
+    evaluate_swap_deltas,
+    swap_delta,
+)
+
+START = date(2026, 3, 2)  # Monday
+ALICE, BOB = uuid4(), uuid4()
+
+
+def _timelines(worked: dict) -> DutyHourTimelines:
+    """Timelines over 10 weeks from {person: [(day offset, slot), ...]}."""
+    slots = np.zeros((2, 70, 2), dtype=np.int16)
+    person_index = {ALICE: 0, BOB: 1}
+    for person, shifts in worked.items():
+        for offset, slot in shifts:
+            slots[person_index[person], offset, slot] += 1
+    return DutyHourTimelines(start=START, person_index=person_index, slots=slots)
+
+
+def _day(offset: int) -> date:
+    return START + timedelta(days=offset)
+
+
+def test_each_candidate_gets_its_own_verdict():
+    # Alice works AM Mon-Sat of week 4 and one later AM; Bob works the
+    # Sundays either side and one later AM
+    timelines = _timelines(
+        {
+            ALICE: [(d, 0) for d in range(21, 27)] + [(45, 0)],
+            BOB: [(20, 0), (27, 0), (40, 0)],
+        }
+    )
+    alice_monday = Shift(ALICE, _day(21), "AM")
+
+    results = evaluate_swap_deltas(
+        timelines,
+        [
+            # Alice trades Monday for the next Sunday: still six days in a row
+            swap_delta("sunday", alice_monday, Shift(BOB, _day(27), "AM")),
+            # Trading for a far-away day is fine for both
+            swap_delta("far", alice_monday, Shift(BOB, _day(40), "AM")),
+            # Alice trades her later day for the Sunday before: 7 straight days
+            swap_delta("streak", Shift(ALICE, _day(45), "AM"), Shift(BOB, _day(20), "AM")),
+        ],
+    )
+
+    assert [r.key for r in results] == ["sunday", "far", "streak"]
+    assert results[0].compliant
+    assert results[1].compliant
+    assert results[2].violated_rules == [ONE_IN_SEVEN]
+    assert results[2].violations[0].person_id == ALICE
+
+
+def test_double_booking_and_eighty_hour_rule():
+    # Alice works both half-days for 26 days plus one AM: 53 blocks (318 h)
+    alice = [(d, s) for d in range(26) for s in (0, 1)] + [(26, 0)]
+    timelines = _timelines({ALICE: alice, BOB: [(5, 1), (26, 1), (60, 0)]})
+
+    results = evaluate_swap_deltas(
+        timelines,
+        [
+            # Alice trades her AM for Bob's PM on a day she already works PM
+            swap_delta("clash", Shift(ALICE, _day(5), "AM"), Shift(BOB, _day(5), "PM")),
+            # Taking Bob's PM is one block too many for the window
+            SwapDelta(
+                "extra",
+                removed=[Shift(BOB, _day(26), "PM")],
+                added=[Shift(ALICE, _day(26), "PM")],
+            ),
+        ],
+    )
+
+    assert results[0].violated_rules == [DOUBLE_BOOKED]
+    assert EIGHTY_HOUR in results[1].violated_rules
+    violation = next(v for v in results[1].violations if v.rule == EIGHTY_HOUR)
+    assert violation.value == 54
+    assert violation.limit == 53
+
+
+def test_existing_violation_is_not_blamed_on_candidate():
+    # Alice already works 10 days straight
+    timelines = _timelines({ALICE: [(d, 0) for d in range(10)], BOB: [(3, 1)]})
+
+    # Handing Bob one of those days cannot be blamed for the streak
+    results = evaluate_swap_deltas(
+        timelines,
+        [
+            SwapDelta(
+                "relief",
+                removed=[Shift(ALICE, _day(4), "AM")],
+                added=[Shift(BOB, _day(4), "AM")],
+            )
+        ],
+    )
+
+    assert results[0].compliant
+
+
+def test_unloaded_person_is_rejected():
+    timelines = _timelines({})
+
+    with pytest.raises(ValueError):
+        evaluate_swap_deltas(
+            timelines, [SwapDelta("x", added=[Shift(uuid4(), _day(1), "AM")])]
+        )
+
+
+def _full_recheck(timelines: DutyHourTimelines, delta: SwapDelta) -> set:
+    """(rule, person) failures from recomputing whole timelines."""
+    failures = set()
+    for person, row in timelines.person_index.items():
+        before = timelines.slots[row].astype(np.int32)
+        after = before.copy()
+        for shifts, change in ((delta.removed, -1), (delta.added, 1)):
+            for shift in shifts:
+                if shift.person_id == person:
+                    slot = 0 if shift.time_of_day == "AM" else 1
+                    after[(shift.date - START).days, slot] += change
+        after = np.maximum(after, 0)
+        for rule, width, limit, values in (
+            (DOUBLE_BOOKED, 1, 1, lambda t: t.max(axis=1)),
+            (EIGHTY_HOUR, 28, 53, lambda t: t.sum(axis=1)),
+            (ONE_IN_SEVEN, 7, 6, lambda t: (t.sum(axis=1) > 0).astype(int)),
+        ):
+            kernel = np.ones(width, dtype=int)
+            old = np.convolve(values(before), kernel, "valid")
+            new = np.convolve(values(after), kernel, "valid")
+            if ((new > limit) & (new > old)).any():
+                failures.add((rule, person))
+    return failures
+
+
+def test_touched_windows_match_full_recheck():
+    rng = np.random.default_rng(7)
+    timelines = _timelines(
+        {
+            person: [
+                (d, s) for d in range(70) for s in (0, 1) if rng.random() < density
+            ]
+            for person, density in ((ALICE, 0.9), (BOB, 0.4))
+        }
+    )
+
+    def shift(person):
+        return Shift(
+            person, _day(int(rng.integers(70))), "AM" if rng.random() < 0.5 else "PM"
+        )
+
+    deltas = [
+        SwapDelta(
+            i,
+            removed=[shift(ALICE), shift(BOB)],
+            added=[shift(ALICE), shift(BOB), shift(ALICE)],
+        )
+        for i in range(200)
+    ]
+
+    results = evaluate_swap_deltas(timelines, deltas)
+
+    for delta, result in zip(deltas, results):
+        found = {(v.rule, v.person_id) for v in result.violations}
+        assert found == _full_recheck(timelines, delta)
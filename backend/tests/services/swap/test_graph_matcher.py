@@ -0,0 +1,253 @@
+"""Tests for sparse maximum-weight and stable swap matching."""
+
+import itertools
+import random
+from datetime import date, timedelta
+from uuid import uuid4
+
+import networkx as nx
+import numpy as np
+import pytest
+from sqlalchemy.orm import Session
+
+from app.models.person import Person
+from app.models.swap import SwapRecord, SwapStatus, SwapType
+from app.services.swap.matching import GraphMatcher
+from app.services.swap.matching import graph_matcher
+from app.services.swap.matching.graph_matcher import (
+    SwapCandidateGraph,
+    candidate_pairs,
+    max_weight_matching,
+    score_pairs,
+    stable_roommates,
+)
+
+MONDAY = date(2026, 1, 5)
+
+
+def _requests(count: int, faculty: int, weeks: int, seed: int) -> list[SwapRecord]:
+    rng = random.Random(seed)
+    people = [uuid4() for _ in range(faculty)]
+    return [
+        SwapRecord(
+            id=uuid4(),
+            source_faculty_id=rng.choice(people),
+            source_week=MONDAY + timedelta(weeks=rng.randrange(weeks)),
+            target_faculty_id=rng.choice(people + [None] * faculty),
+            swap_type=SwapType.ABSORB,
+            status=SwapStatus.PENDING,
+        )
+        for _ in range(count)
+    ]
+
+
+def _random_graph(seed: int) -> tuple[SwapCandidateGraph, nx.Graph]:
+    rng = random.Random(seed)
+    n = rng.randrange(3, 20)
+    edges = [
+        (a, b, round(rng.uniform(0.31, 1.0), 2))
+        for a, b in itertools.combinations(range(n), 2)
+        if rng.random() < 0.3
+    ]
+    reference = nx.Graph()
+    reference.add_weighted_edges_from(edges)
+    graph = SwapCandidateGraph(
+        request_ids=[uuid4() for _ in range(n)],
+        first=np.array([a for a, _, _ in edges], dtype=np.int64),
+        second=np.array([b for _, b, _ in edges], dtype=np.int64),
+        weights=np.array([w for _, _, w in edges]),
+    )
+    return graph, reference
+
+
+def _weight(pairs, reference: nx.Graph) -> float:
+    return sum(reference[a][b]["weight"] for a, b in pairs)
+
+
+def test_candidates_are_blocked_and_scored_like_the_scalar_score():
+    requests = _requests(60, faculty=10, weeks=40, seed=3)
+    matcher = GraphMatcher(db=None)
+
+    first, second = candidate_pairs(requests)
+    scores = score_pairs(requests, first, second)
+
+    candidates = set(zip(first.tolist(), second.tolist()))
+    for a, b in itertools.combinations(range(len(requests)), 2):
+        ra, rb = requests[a], requests[b]
+        plausible = ra.source_faculty_id != rb.source_faculty_id and (
+            abs((ra.source_week - rb.source_week).days) <= 60
+            or ra.target_faculty_id == rb.source_faculty_id
+            or rb.target_faculty_id == ra.source_faculty_id
+        )
+        assert ((a, b) in candidates) == plausible
+    for a, b, score in zip(first, second, scores):
+        assert score == pytest.approx(
+            matcher._calculate_basic_compatibility(requests[a], requests[b])
+        )
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_candidates_are_blocked_by_rotation_type_and_eligibility(seed):
+    requests = _requests(60, faculty=10, weeks=40, seed=seed)
+    rng = random.Random(seed)
+    keys = [
+        rng.choice([None, ("inpatient", "core"), ("inpatient", "pd"), ("fmit", "core")])
+        for _ in requests
+    ]
+    block_keys = {r.id: key for r, key in zip(requests, keys) if key is not None}
+
+    first, second = candidate_pairs(requests, block_keys)
+
+    candidates = set(zip(first.tolist(), second.tolist()))
+    for a, b in itertools.combinations(range(len(requests)), 2):
+        ra, rb = requests[a], requests[b]
+        same_block = keys[a] is None or keys[b] is None or keys[a] == keys[b]
+        plausible = ra.source_faculty_id != rb.source_faculty_id and (
+            (same_block and abs((ra.source_week - rb.source_week).days) <= 60)
+            or ra.target_faculty_id == rb.source_faculty_id
+            or rb.target_faculty_id == ra.source_faculty_id
+        )
+        assert ((a, b) in candidates) == plausible
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_sparse_matching_is_optimal(seed):
+    graph, reference = _random_graph(seed)
+
+    pairs, exact = max_weight_matching(graph)
+
+    assert exact
+    nodes = [node for pair in pairs for node in pair]
+    assert len(nodes) == len(set(nodes))
+    assert _weight(pairs, reference) == pytest.approx(
+        _weight(nx.max_weight_matching(reference), reference)
+    )
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matching_without_exact_repair_is_valid(monkeypatch, seed):
+    monkeypatch.setattr(graph_matcher, "EXACT_REPAIR_MAX_EDGES", 0)
+    graph, reference = _random_graph(seed)
+
+    pairs, _ = max_weight_matching(graph)
+
+    nodes = [node for pair in pairs for node in pair]
+    assert len(nodes) == len(set(nodes))
+    assert all(reference.has_edge(a, b) for a, b in pairs)
+    # Odd cycles lose at most one edge each, so well over half the optimum
+    optimum = _weight(nx.max_weight_matching(reference), reference)
+    assert _weight(pairs, reference) >= 2 / 3 * optimum - 1e-9
+
+
+def _blocking_pairs(pairs, preferences):
+    partner = {a: b for pair in pairs for a, b in (pair, pair[::-1])}
+    rank = [{other: r for r, other in enumerate(prefs)} for prefs in preferences]
+
+    def prefers(x, y):
+        return x not in partner or rank[x][y] < rank[x][partner[x]]
+
+    return [
+        (x, y)
+        for x, prefs in enumerate(preferences)
+        for y in prefs
+        if partner.get(x) != y and prefers(x, y) and prefers(y, x)
+    ]
+
+
+def test_stable_roommates_finds_a_stable_matching():
+    rng = random.Random(7)
+    found = 0
+    for _ in range(100):
+        n = rng.randrange(2, 12)
+        acceptable = {
+            pair for pair in itertools.combinations(range(n), 2) if rng.random() < 0.7
+        }
+        preferences = []
+        for x in range(n):
+            prefs = [y for y in range(n) if (min(x, y), max(x, y)) in acceptable]
+            rng.shuffle(prefs)
+            preferences.append(prefs)
+
+        pairs = stable_roommates(preferences)
+
+        if pairs is not None:
+            found += 1
+            assert _blocking_pairs(pairs, preferences) == []
+    assert found > 50
+
+
+def test_stable_roommates_reports_when_none_exists():
+    # Three people prefer each other cyclically and all rank the fourth last
+    preferences = [[1, 2, 3], [2, 0, 3], [0, 1, 3], [0, 1, 2]]
+
+    assert stable_roommates(preferences) is None
+
+
+def test_stable_matching_falls_back_to_max_weight():
+    requests = _requests(4, faculty=4, weeks=1, seed=0)
+    ids = [r.id for r in requests]
+    preferences = {
+        ids[x]: [ids[y] for y in prefs]
+        for x, prefs in enumerate([[1, 2, 3], [2, 0, 3], [0, 1, 3], [0, 1, 2]])
+    }
+    for request in requests:
+        request.source_faculty_id = uuid4()
+
+    result = GraphMatcher(db=None).stable_match_requests(requests, preferences)
+
+    assert result.graph_stats["stable"] is False
+    assert len(result.matched_pairs) == 2
+
+
+def test_thousand_requests_match_on_a_sparse_graph():
+    requests = _requests(1000, faculty=150, weeks=52, seed=1)
+
+    result = GraphMatcher(db=None).match_requests(requests)
+
+    stats = result.graph_stats
+    assert stats["pairs_scored"] < stats["dense_pairs"] / 2
+    assert len(result.unmatched_requests) <= 10
+    matched = [request_id for pair in result.matched_pairs for request_id in pair]
+    assert len(matched) == len(set(matched))
+
+
+@pytest.mark.asyncio
+async def test_find_optimal_matching_pairs_reciprocal_requests(
+    db: Session, async_db_session
+):
+    people = [
+        Person(id=uuid4(), name=f"Dr. {n}", type="faculty", email=f"{n}@x.org")
+        for n in ("A", "B", "C", "D")
+    ]
+    db.add_all(people)
+    a, b, c, d = people
+    requests = [
+        SwapRecord(
+            source_faculty_id=a.id,
+            source_week=MONDAY,
+            target_faculty_id=b.id,
+            swap_type=SwapType.ONE_TO_ONE,
+        ),
+        SwapRecord(
+            source_faculty_id=b.id,
+            source_week=MONDAY + timedelta(weeks=1),
+            target_faculty_id=a.id,
+            swap_type=SwapType.ONE_TO_ONE,
+        ),
+        SwapRecord(
+            source_faculty_id=c.id,
+            source_week=MONDAY,
+            target_faculty_id=d.id,
+            swap_type=SwapType.ABSORB,
+        ),
+    ]
+    db.add_all(requests)
+    db.commit()
+
+    result = await GraphMatcher(async_db_session).find_optimal_matching()
+
+    assert [set(pair) for pair in result.matched_pairs] == [
+        {requests[0].id, requests[1].id}
+    ]
+    assert result.unmatched_requests == [requests[2].id]
+    assert result.total_weight == pytest.approx(1.0)
@@ -0,0 +1,144 @@
+"""Tests for the columnar (Arrow/Parquet) exporter."""
+
+from datetime import date
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy_continuum import transaction_class
+
+from app.models.assignment import Assignment
+from app.services.export.arrow_exporter import INCREMENTAL_OVERLAP, ArrowExporter
+from app.services.export.export_factory import ExportFactory
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture
+def assignments(db, sample_residents, sample_blocks, sample_rotation_template):
+    rows = [
+        Assignment(
+            id=uuid4(),
+            block_id=block.id,
+            person_id=sample_residents[i % len(sample_residents)].id,
+            rotation_template_id=sample_rotation_template.id,
+            role="primary",
+        )
+        for i, block in enumerate(sample_blocks)
+    ]
+    db.add_all(rows)
+    db.commit()
+    return rows
+
+
+@pytest.mark.asyncio
+async def test_parquet_keeps_native_and_dictionary_types(db, assignments):
+    data = await ArrowExporter(db).export_assignments(batch_size=4)
+
+    parquet = pq.ParquetFile(pa.BufferReader(data))
+    table = parquet.read()
+
+    assert table.num_rows == len(assignments)
+    assert parquet.metadata.num_row_groups == 4
+    assert pa.types.is_dictionary(table.schema.field("person_name").type)
+    assert pa.types.is_dictionary(table.schema.field("rotation_name").type)
+    assert table.schema.field("date").type == pa.date32()
+    assert pa.types.is_timestamp(table.schema.field("created_at").type)
+    assert table.column("date").to_pylist() == sorted(table.column("date").to_pylist())
+
+
+@pytest.mark.asyncio
+async def test_projection_and_filter_pushdown(db, assignments, sample_residents):
+    person = sample_residents[0]
+    table = await ArrowExporter(db).read_table(
+        "assignments",
+        fields=["assignment_id", "date"],
+        filters=[("person_id", "=", person.id), ("time_of_day", "in", ["AM"])],
+    )
+
+    expected = {
+        str(a.id)
+        for a in assignments
+        if a.person_id == person.id and a.block.time_of_day == "AM"
+    }
+    assert table.column_names == ["assignment_id", "date"]
+    assert set(table.column("assignment_id").to_pylist()) == expected
+
+    with pytest.raises(ValueError, match="Unknown column"):
+        await ArrowExporter(db).read_table("assignments", fields=["ssn"])
+    with pytest.raises(ValueError, match="Unsupported filter operator"):
+        await ArrowExporter(db).read_table(
+            "assignments", filters=[("date", "~", date.today())]
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_export_since_version(db, assignments):
+    # The fixture's transaction is old; later ones fall inside the overlap
+    transactions = transaction_class(Assignment).__table__
+    db.execute(
+        update(transactions).values(
+            issued_at=transactions.c.issued_at - INCREMENTAL_OVERLAP * 2
+        )
+    )
+    db.commit()
+    late = assignments[2]
+    late.notes = "committed late"
+    db.commit()
+
+    exporter = ArrowExporter(db, file_format="arrow")
+    snapshot = await exporter.read_table("assignments")
+    version = int(snapshot.schema.metadata[b"snapshot_version"])
+    assert version > 0
+
+    edited, deleted = assignments[0], assignments[1]
+    deleted_id = str(deleted.id)
+    edited.notes = "moved to clinic"
+    db.delete(deleted)
+    db.commit()
+
+    data = await exporter.export_assignments(since_version=version)
+    changes = pa.ipc.open_stream(data).read_all()
+
+    rows = {
+        row["assignment_id"]: row
+        for row in changes.select(["assignment_id", "change_type", "notes"]).to_pylist()
+    }
+    assert rows == {
+        str(edited.id): {
+            "assignment_id": str(edited.id),
+            "change_type": "upsert",
+            "notes": "moved to clinic",
+        },
+        deleted_id: {
+            "assignment_id": deleted_id,
+            "change_type": "delete",
+            "notes": None,
+        },
+        # Within the overlap window, so re-sent even though it is not newer
+        str(late.id): {
+            "assignment_id": str(late.id),
+            "change_type": "upsert",
+            "notes": "committed late",
+        },
+    }
+    assert int(changes.schema.metadata[b"snapshot_version"]) > version
+
+
+@pytest.mark.asyncio
+async def test_factory_routes_columnar_formats(db, assignments):
+    factory = ExportFactory(db)
+
+    chunks = [
+        chunk
+        async for chunk in factory.stream_export("schedule", "parquet", batch_size=5)
+    ]
+
+    assert len(chunks) > 1
+    assert pq.read_table(pa.BufferReader(b"".join(chunks))).num_rows == 14
+    assert factory.get_filename("schedule", "parquet", timestamp=False) == (
+        "schedule.parquet"
+    )
+    with pytest.raises(ValueError, match="parquet or arrow"):
+        await factory.export("half_day_assignments", "csv")
@@ -12,9 +12,12 @@ from app.models.block import Block
 from app.models.person import Person
 from app.models.rotation_template import RotationTemplate
 from app.services.audit_service import (
+    AuditCursor,
     get_audit_logs,
+    has_acgme_overrides,
+    iter_audit_logs,
+    query_audit_logs,
     ENTITY_MODEL_MAP,
-    VERSION_TABLE_MAP,
 )
 
 
@@ -136,13 +139,6 @@ class TestAuditService:
         assert "schedule_run" in ENTITY_MODEL_MAP
         assert "swap_record" in ENTITY_MODEL_MAP
 
-    def test_version_table_map_completeness(self):
-        """Test that version table map has required entries."""
-        assert "assignment" in VERSION_TABLE_MAP
-        assert "absence" in VERSION_TABLE_MAP
-        assert "schedule_run" in VERSION_TABLE_MAP
-        assert "swap_record" in VERSION_TABLE_MAP
-
     def test_get_audit_logs_invalid_page(self, db: Session):
         """Test audit logs with invalid page number."""
         # Should handle gracefully
@@ -214,3 +210,122 @@ class TestAuditService:
         end = (date.today() - timedelta(days=7)).isoformat()
         logs, total = get_audit_logs(db, start_date=start, end_date=end)
         assert isinstance(logs, list)
+
+
+class TestAuditKeysetPagination:
+    """Keyset pagination over real version history."""
+
+    @pytest.fixture
+    def history(self, db: Session) -> dict:
+        """Versioned absences and assignments across several transactions."""
+        resident = Person(
+            id=uuid4(),
+            name="Dr. Keyset",
+            type="resident",
+            email="keyset@hospital.org",
+            pgy_level=1,
+        )
+        template = RotationTemplate(
+            id=uuid4(), name="Clinic", rotation_type="outpatient", abbreviation="C"
+        )
+        block = Block(
+            id=uuid4(), date=date(2026, 3, 2), time_of_day="AM", block_number=1
+        )
+        db.add_all([resident, template, block])
+        db.commit()
+
+        absences = []
+        for i in range(5):
+            absence = Absence(
+                id=uuid4(),
+                person_id=resident.id,
+                start_date=date(2026, 3, 2) + timedelta(days=7 * i),
+                end_date=date(2026, 3, 3) + timedelta(days=7 * i),
+                absence_type="vacation",
+            )
+            db.add(absence)
+            db.commit()
+            absences.append(absence)
+
+        absences[0].notes = "Moved"
+        db.commit()
+
+        assignment = Assignment(
+            id=uuid4(),
+            block_id=block.id,
+            person_id=resident.id,
+            rotation_template_id=template.id,
+            role="primary",
+            override_reason="Critical case",
+        )
+        db.add(assignment)
+        db.commit()
+
+        db.delete(absences[4])
+        db.commit()
+        return {"absences": absences, "assignment": assignment}
+
+    def test_cursor_pages_cover_history_once(self, db: Session, history):
+        """Following next cursors returns every entry once, newest first."""
+        first = query_audit_logs(db, page_size=3)
+        assert first.total == 8
+
+        seen = list(first.entries)
+        cursor = first.next_cursor
+        while cursor is not None:
+            page = query_audit_logs(
+                db, page_size=3, after=AuditCursor.decode(cursor.encode())
+            )
+            seen.extend(page.entries)
+            cursor = page.next_cursor
+
+        assert [e.id for e in seen] == [e.id for e in iter_audit_logs(db, batch_size=2)]
+        assert len({e.id for e in seen}) == 8
+        assert seen[0].action == "delete"
+        assert seen[0].severity == "warning"
+        timestamps = [e.timestamp for e in seen]
+        assert timestamps == sorted(timestamps, reverse=True)
+
+    def test_offset_pages_match_cursor_pages(self, db: Session, history):
+        """Page numbers and cursors walk the same ordering."""
+        entries, total = get_audit_logs(db, page=2, page_size=3)
+        first = query_audit_logs(db, page_size=3)
+        second = query_audit_logs(db, page_size=3, after=first.next_cursor)
+
+        assert total == 8
+        assert [e.id for e in entries] == [e.id for e in second.entries]
+
+    def test_entries_resolve_names_and_changes(self, db: Session, history):
+        """Entries carry entity names and field changes from prior versions."""
+        moved = history["absences"][0]
+
+        entries, total = get_audit_logs(
+            db, entity_id=str(moved.id), actions=["update"]
+        )
+
+        assert total == 1
+        assert entries[0].entity_name == "Vacation - Dr. Keyset"
+        assert [(c.field, c.old_value, c.new_value) for c in entries[0].changes] == [
+            ("notes", None, "Moved")
+        ]
+
+    def test_filters_run_in_sql(self, db: Session, history):
+        """Search, severity and ACGME filters select the matching entries."""
+        overrides, total = get_audit_logs(db, acgme_overrides_only=True)
+        assert total == 1
+        assert overrides[0].acgme_override
+        assert overrides[0].acgme_justification == "Critical case"
+        assert has_acgme_overrides(db)
+        assert not has_acgme_overrides(db, entity_types=["absence"])
+
+        _, total = get_audit_logs(db, search="assignment - dr. keyset")
+        assert total == 1
+        _, total = get_audit_logs(db, severity=["warning"])
+        assert total == 1
+        _, total = get_audit_logs(db, entity_types=["absence"], actions=["create"])
+        assert total == 5
+
+    def test_invalid_cursor_is_rejected(self):
+        """Malformed cursors raise ValueError."""
+        with pytest.raises(ValueError):
+            AuditCursor.decode("not-a-cursor")
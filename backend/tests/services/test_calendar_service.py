@@ -8,6 +8,7 @@ import pytest
 from icalendar import Calendar
 from sqlalchemy.orm import Session
 
+from app.db.schedule_versions import PROGRAM, STRUCTURE, get_versions
 from app.models.assignment import Assignment
 from app.models.block import Block
 from app.models.calendar_subscription import CalendarSubscription
@@ -959,3 +960,132 @@ class TestCalendarService:
         # Verify UID format
         uid = str(event["uid"])
         assert "@residency-scheduler" in uid
+
+
+class TestCalendarFeedVersions:
+    """Feed validators follow schedule version counters."""
+
+    def _etag(self, db: Session, person: Person, blocks: list[Block]) -> str:
+        return CalendarService.person_feed_version(
+            db, person.id, blocks[0].date, blocks[-1].date
+        ).etag
+
+    def test_assignment_changes_bump_only_that_persons_feed(
+        self,
+        db: Session,
+        sample_resident: Person,
+        sample_faculty: Person,
+        sample_blocks: list[Block],
+        sample_rotation_template: RotationTemplate,
+    ):
+        resident_before = self._etag(db, sample_resident, sample_blocks)
+        faculty_before = self._etag(db, sample_faculty, sample_blocks)
+
+        assignment = Assignment(
+            id=uuid4(),
+            block_id=sample_blocks[0].id,
+            person_id=sample_resident.id,
+            rotation_template_id=sample_rotation_template.id,
+            role="primary",
+        )
+        db.add(assignment)
+        db.commit()
+        after_insert = self._etag(db, sample_resident, sample_blocks)
+
+        assert after_insert != resident_before
+        assert self._etag(db, sample_faculty, sample_blocks) == faculty_before
+
+        assignment.notes = "Moved to room 2"
+        db.commit()
+        assert self._etag(db, sample_resident, sample_blocks) != after_insert
+
+        # Reassigning bumps both the old and the new person
+        resident_before = self._etag(db, sample_resident, sample_blocks)
+        assignment.person_id = sample_faculty.id
+        db.commit()
+        assert self._etag(db, sample_resident, sample_blocks) != resident_before
+        assert self._etag(db, sample_faculty, sample_blocks) != faculty_before
+
+    def test_only_rendered_structure_edits_invalidate_feeds(
+        self,
+        db: Session,
+        sample_resident: Person,
+        sample_blocks: list[Block],
+        sample_rotation_template: RotationTemplate,
+    ):
+        before = self._etag(db, sample_resident, sample_blocks)
+
+        sample_resident.email = "new.address@example.com"
+        db.commit()
+        assert self._etag(db, sample_resident, sample_blocks) == before
+
+        sample_rotation_template.clinic_location = "Building C"
+        db.commit()
+        assert self._etag(db, sample_resident, sample_blocks) != before
+
+    def test_versions_bump_once_per_commit(
+        self,
+        db: Session,
+        sample_resident: Person,
+        sample_blocks: list[Block],
+        sample_rotation_template: RotationTemplate,
+    ):
+        def versions() -> list[int]:
+            return [v for v, _ in get_versions(db, [PROGRAM, STRUCTURE]).values()]
+
+        program, structure = versions()
+        for block in sample_blocks[:3]:
+            db.add(
+                Assignment(
+                    id=uuid4(),
+                    block_id=block.id,
+                    person_id=sample_resident.id,
+                    rotation_template_id=sample_rotation_template.id,
+                    role="primary",
+                )
+            )
+            db.flush()
+        assert versions() == [program, structure]
+        db.commit()
+        assert versions() == [program + 1, structure]
+
+        # Scopes collected by a rolled-back transaction are discarded
+        sample_rotation_template.clinic_location = "Building C"
+        db.flush()
+        db.rollback()
+        db.commit()
+        assert versions() == [program + 1, structure]
+
+    def test_stream_is_ordered_reproducible_and_cached(
+        self,
+        db: Session,
+        sample_resident: Person,
+        sample_blocks: list[Block],
+        sample_rotation_template: RotationTemplate,
+    ):
+        for block in reversed(sample_blocks[:4]):
+            db.add(
+                Assignment(
+                    id=uuid4(),
+                    block_id=block.id,
+                    person_id=sample_resident.id,
+                    rotation_template_id=sample_rotation_template.id,
+                    role="primary",
+                )
+            )
+        db.commit()
+        cache = CalendarService.fragment_cache
+        cache.clear()
+
+        args = (db, sample_resident.id, sample_blocks[0].date, sample_blocks[-1].date)
+        chunks = list(CalendarService.stream_ics_for_person(*args))
+        first = "".join(chunks)
+        second = CalendarService.generate_ics_for_person(*args)
+
+        assert len(chunks) == 4 + 2  # header, one fragment per event, footer
+        assert first == second
+        assert (cache.misses, cache.hits) == (4, 4)
+
+        events = [c for c in Calendar.from_ical(first).walk() if c.name == "VEVENT"]
+        starts = [event["dtstart"].dt for event in events]
+        assert starts == sorted(starts)
@@ -97,7 +97,9 @@ class TestExportFactory:
         assert "csv" in formats
         assert "json" in formats
         assert "xml" in formats
-        assert len(formats) == 3
+        assert "parquet" in formats
+        assert "arrow" in formats
+        assert len(formats) == 5
 
     def test_get_supported_types(self):
         types = ExportFactory.get_supported_types()
@@ -106,7 +108,8 @@ class TestExportFactory:
         assert "people" in types
         assert "blocks" in types
         assert "analytics" in types
-        assert len(types) == 5
+        assert "half_day_assignments" in types
+        assert len(types) == 6
 
 
 class TestExportFactoryContentType:
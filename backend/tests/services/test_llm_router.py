@@ -3,14 +3,23 @@
 Tests:
 - CircuitBreaker state machine (CLOSED -> OPEN -> HALF_OPEN -> CLOSED)
 - LLMRouter.classify_task heuristic routing
-- No external HTTP/LLM calls needed
+- Response cache, single-flight deduplication and provider queueing
+- No external HTTP/LLM calls needed (a local stub provider stands in)
 """
 
+import asyncio
 from datetime import datetime, timedelta
 
 import pytest
 
-from app.services.llm_router import CircuitBreaker, LLMRouter
+from app.schemas.llm import LLMRequest, LLMResponse
+from app.services.llm_router import (
+    CircuitBreaker,
+    LLMProvider,
+    LLMRouter,
+    ProviderUnavailableError,
+    ResponseCache,
+)
 
 
 # ============================================================================
@@ -322,3 +331,177 @@ class TestClassifyTask:
         """Airgap mode routes tool_calling to local provider."""
         result = await router.classify_task("test", tools=[{"name": "t"}])
         assert result.recommended_provider == "mlx"
+
+
+# ============================================================================
+# Response cache and concurrency limits
+# ============================================================================
+
+
+class StubProvider(LLMProvider):
+    """Local provider that echoes the prompt after an optional delay."""
+
+    def __init__(self, name: str, delay: float = 0.0) -> None:
+        super().__init__(name=name)
+        self.delay = delay
+        self.calls = 0
+        self.active = 0
+        self.peak_active = 0
+
+    async def generate(self, prompt, system=None, model=None, **kwargs):
+        self.calls += 1
+        self.active += 1
+        self.peak_active = max(self.peak_active, self.active)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.active -= 1
+        return LLMResponse(content=f"echo: {prompt}", provider=self.name, model="stub")
+
+    async def generate_with_tools(self, prompt, tools, system=None, **kwargs):
+        return await self.generate(prompt, system)
+
+    async def stream_generate(self, prompt, system=None, model=None, **kwargs):
+        yield  # pragma: no cover
+
+    def is_available(self) -> bool:
+        return True
+
+
+def _stub_router(delay: float = 0.0, **kwargs) -> tuple[LLMRouter, StubProvider]:
+    router = LLMRouter(airgap_mode=True, enable_fallback=False, **kwargs)
+    stub = StubProvider("ollama", delay=delay)
+    router.providers = {"ollama": stub}
+    return router, stub
+
+
+def _request(prompt: str = "Hello there", **kwargs) -> LLMRequest:
+    return LLMRequest(prompt=prompt, provider="ollama", **kwargs)
+
+
+class TestResponseCache:
+    """Test cache keys, TTL expiry and LRU eviction."""
+
+    def test_key_ignores_provider_whitespace_and_tool_order(self):
+        tools = [{"name": "a"}, {"name": "b"}]
+        key = ResponseCache.make_key(_request("Hello  there\n", tools=tools))
+        same = LLMRequest(
+            prompt=" Hello there", provider="auto", tools=list(reversed(tools))
+        )
+        assert ResponseCache.make_key(same) == key
+        assert ResponseCache.make_key(_request("Hello there", tools=tools)) == key
+        assert ResponseCache.make_key(_request(temperature=0.0)) != key
+
+    def test_ttl_and_lru_eviction(self):
+        now = [0.0]
+        cache = ResponseCache(ttl_seconds=10, max_entries=2, clock=lambda: now[0])
+        response = LLMResponse(content="x", provider="stub", model="stub")
+        cache.put("a", response)
+        cache.put("b", response)
+        assert cache.get("a") is response  # "b" is now least recently used
+        cache.put("c", response)
+        assert cache.get("b") is None
+        assert cache.evictions == 1
+        now[0] = 10.0
+        assert cache.get("a") is None
+        assert (cache.hits, cache.misses, len(cache)) == (1, 2, 1)
+
+
+class TestRouterCaching:
+    """Test cache hits, bypass and single-flight through LLMRouter.generate."""
+
+    async def test_repeat_request_served_from_cache(self):
+        router, stub = _stub_router()
+        first = await router.generate(_request())
+        second = await router.generate(_request("  Hello there "))
+
+        assert stub.calls == 1
+        assert second.content == first.content
+        assert second.metadata["cache_hit"] is True
+        stats = router.get_stats()
+        assert (stats.cache_hits, stats.cache_misses, stats.cache_size) == (1, 1, 1)
+        assert stats.total_requests == 2
+
+    async def test_metadata_can_bypass_cache(self):
+        router, stub = _stub_router()
+        await router.generate(_request())
+        await router.generate(_request(metadata={"cache": False}))
+
+        assert stub.calls == 2
+
+    async def test_concurrent_identical_requests_share_one_call(self):
+        router, stub = _stub_router(delay=0.05)
+        responses = await asyncio.gather(
+            *(router.generate(_request()) for _ in range(5))
+        )
+
+        assert stub.calls == 1
+        assert len({r.content for r in responses}) == 1
+        assert router.get_stats().deduplicated_requests == 4
+
+    async def test_failure_propagates_to_joined_requests(self):
+        router, stub = _stub_router(delay=0.05)
+
+        async def fail(*args, **kwargs):
+            await asyncio.sleep(0.05)
+            raise RuntimeError("boom")
+
+        stub.generate = fail
+        results = await asyncio.gather(
+            router.generate(_request()),
+            router.generate(_request()),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert router._inflight == {}
+        assert len(router.cache) == 0
+
+    async def test_waiters_retry_when_leader_is_cancelled(self):
+        router, stub = _stub_router(delay=0.05)
+        leader = asyncio.create_task(router.generate(_request()))
+        await asyncio.sleep(0.01)
+        waiters = [asyncio.create_task(router.generate(_request())) for _ in range(3)]
+        await asyncio.sleep(0.01)
+
+        leader.cancel()
+        responses = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert len({r.content for r in responses}) == 1
+        # One waiter became the new leader; the others joined its call
+        assert stub.calls == 2
+        assert router.get_stats().deduplicated_requests == 2
+        assert router._inflight == {}
+
+
+class TestRouterConcurrency:
+    """Test per-provider semaphores, queueing and queue timeouts."""
+
+    async def test_provider_limit_queues_excess_requests(self):
+        router, stub = _stub_router(delay=0.02, provider_concurrency={"ollama": 2})
+        await asyncio.gather(*(router.generate(_request(f"q{i}")) for i in range(6)))
+
+        assert stub.calls == 6
+        assert stub.peak_active == 2
+        queue = router.get_stats().queues["ollama"]
+        assert queue.max_concurrent == 2
+        assert queue.queued_total == 4
+        assert queue.in_flight == 0 and queue.waiting == 0
+        assert queue.avg_wait_ms > 0
+
+    async def test_queue_timeout_raises_unavailable(self):
+        router, stub = _stub_router(
+            delay=0.2, provider_concurrency={"ollama": 1}, queue_timeout=0.01
+        )
+        results = await asyncio.gather(
+            router.generate(_request("slow")),
+            router.generate(_request("queued")),
+            return_exceptions=True,
+        )
+
+        assert results[0].content == "echo: slow"
+        assert isinstance(results[1], ProviderUnavailableError)
+        assert router.get_stats().queues["ollama"].timeouts == 1
+        # Overload is not a provider failure
+        assert router.circuit_breaker.get_state("ollama").failure_count == 0
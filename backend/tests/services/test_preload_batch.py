@@ -0,0 +1,125 @@
+"""Tests for the shared in-memory preload batch."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.core.exceptions import ActivityNotFoundError
+from app.models.activity import Activity, ActivityCategory
+from app.models.half_day_assignment import AssignmentSource, HalfDayAssignment
+from app.models.person import Person
+from app.services.preload import PreloadBatch, PreloadRunStats
+from app.services.sync_preload_service import SyncPreloadService
+
+DAY = date(2026, 3, 12)
+
+
+def _activity(db, code: str, category: str) -> Activity:
+    activity = Activity(
+        id=uuid4(),
+        name=code,
+        code=code,
+        display_abbreviation=code,
+        activity_category=category,
+        is_protected=False,
+        counts_toward_physical_capacity=False,
+    )
+    db.add(activity)
+    return activity
+
+
+def _slot(db, person, time_of_day, activity, source) -> HalfDayAssignment:
+    slot = HalfDayAssignment(
+        person_id=person.id,
+        date=DAY,
+        time_of_day=time_of_day,
+        activity_id=activity.id,
+        source=source.value,
+    )
+    db.add(slot)
+    return slot
+
+
+def _slots(db, person) -> dict[tuple[date, str], HalfDayAssignment]:
+    rows = db.execute(
+        select(HalfDayAssignment).where(HalfDayAssignment.person_id == person.id)
+    ).scalars()
+    return {(row.date, row.time_of_day): row for row in rows}
+
+
+@pytest.fixture
+def setup(db):
+    person = Person(id=uuid4(), name="Dr. Batch", type="resident", pgy_level=1)
+    db.add(person)
+    clinic = _activity(db, "C", ActivityCategory.CLINICAL.value)
+    lec = _activity(db, "LEC", ActivityCategory.EDUCATIONAL.value)
+    leave = _activity(db, "LV-AM", ActivityCategory.TIME_OFF.value)
+    db.commit()
+    return person, clinic, lec, leave
+
+
+def test_batch_resolves_precedence_and_writes_in_bulk(db, setup):
+    person, clinic, lec, leave = setup
+    _slot(db, person, "AM", clinic, AssignmentSource.TEMPLATE)
+    _slot(db, person, "PM", clinic, AssignmentSource.MANUAL)
+    db.commit()
+
+    service = SyncPreloadService(db)
+    with service._preload_batch(DAY, DAY + timedelta(days=1)) as batch:
+        assert batch.slots_indexed == 2
+        # Template slot is overwritten, manual slot is kept
+        assert service._create_preload(person.id, DAY, "AM", lec.id)
+        assert not service._create_preload(person.id, DAY, "PM", lec.id)
+        # Time off replaces a non-time-off preload, not the other way round
+        assert service._create_preload(person.id, DAY, "AM", leave.id)
+        assert not service._create_preload(person.id, DAY, "AM", lec.id)
+        next_day = DAY + timedelta(days=1)
+        assert service._create_preload(person.id, next_day, "AM", lec.id)
+        assert batch.pending_writes == (1, 1)
+        # Nothing is written until the batch closes
+        assert (next_day, "AM") not in _slots(db, person)
+
+    slots = _slots(db, person)
+    assert slots[(DAY, "AM")].activity_id == leave.id
+    assert slots[(DAY, "AM")].source == AssignmentSource.PRELOAD.value
+    assert slots[(DAY, "PM")].source == AssignmentSource.MANUAL.value
+    assert slots[(DAY + timedelta(days=1), "AM")].activity_id == lec.id
+
+
+def test_create_preload_outside_batch_writes_through(db, setup):
+    person, _, lec, _ = setup
+
+    assert SyncPreloadService(db)._create_preload(person.id, DAY, "PM", lec.id)
+
+    assert _slots(db, person)[(DAY, "PM")].activity_id == lec.id
+
+
+def test_propose_requires_activity():
+    batch = PreloadBatch(DAY, DAY)
+
+    with pytest.raises(ActivityNotFoundError):
+        batch.propose(uuid4(), DAY, "AM", None)
+
+
+def test_run_stats_summary_lists_loaders(db, setup):
+    person, _, lec, _ = setup
+    service = SyncPreloadService(db)
+    stats = PreloadRunStats(block_number=9, academic_year=2025)
+
+    with service._preload_batch(DAY, DAY, stats=stats):
+        service._run_loader(
+            stats,
+            "lectures",
+            lambda: sum(
+                service._create_preload(person.id, DAY, tod, lec.id)
+                for tod in ("AM", "PM")
+            ),
+        )
+
+    assert [(s.name, s.rows, s.candidates) for s in stats.loaders] == [
+        ("lectures", 2, 2)
+    ]
+    assert stats.inserted == 2
+    assert "lectures=2/2" in stats.summary()
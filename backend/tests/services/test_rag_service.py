@@ -1,15 +1,21 @@
 """Tests for RAG (Retrieval-Augmented Generation) service.
 
 Note: Vector similarity tests require PostgreSQL with pgvector extension.
-SQLite tests will focus on chunking, ingestion flow, and business logic.
+SQLite tests will focus on chunking, ingestion flow, and business logic, plus
+the in-process index path against a dedicated rag_documents table.
 """
 
+import hashlib
+
+import numpy as np
 import pytest
-from uuid import uuid4
 from unittest.mock import MagicMock, patch
+from sqlalchemy import create_engine, func, select
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
 
-from app.services.rag_service import RAGService
+from app.services.rag_service import RAGService, SourceDocument
 from app.models.rag_document import RAGDocument
 
 
@@ -163,10 +169,8 @@ class TestRAGServiceIngestionRetries:
                 "embed_batch",
                 return_value=[[0.1], [0.2]],
             ),
-            patch.object(
-                db, "add", side_effect=lambda model: setattr(model, "id", uuid4())
-            ),
-            patch.object(db, "flush", side_effect=[transient_error, None, None]),
+            patch.object(db, "add_all"),
+            patch.object(db, "flush", side_effect=[transient_error, None]),
             patch.object(db, "rollback") as mock_rollback,
             patch.object(db, "commit") as mock_commit,
             patch("app.services.rag_service.time.sleep") as mock_sleep,
@@ -193,9 +197,7 @@ class TestRAGServiceIngestionRetries:
             patch.object(
                 service.embedding_service, "embed_batch", return_value=[[0.1]]
             ),
-            patch.object(
-                db, "add", side_effect=lambda model: setattr(model, "id", uuid4())
-            ),
+            patch.object(db, "add_all"),
             patch.object(db, "flush", side_effect=RuntimeError("invalid vector size")),
             patch.object(db, "rollback") as mock_rollback,
             patch.object(db, "commit") as mock_commit,
@@ -476,3 +478,112 @@ class TestRAGServiceDeletion:
         assert deleted == 3
         db.execute.assert_called_once()
         db.commit.assert_called_once()
+
+
+def _fake_embedding(text: str) -> list[float]:
+    """Bag-of-words embedding: each word adds to one hashed dimension."""
+    vector = np.zeros(384)
+    for word in text.lower().replace(".", " ").split():
+        vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 384] += 1.0
+    return vector.tolist()
+
+
+@pytest.fixture
+def rag_db():
+    """SQLite session with a rag_documents table (the shared test DB omits it)."""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    RAGDocument.__table__.create(engine)
+    with Session(engine) as session:
+        yield session
+    engine.dispose()
+
+
+@pytest.fixture
+def local_service(rag_db):
+    """RAGService on SQLite with a deterministic local embedder."""
+    service = RAGService(rag_db)
+    service.embedding_service = MagicMock()
+    service.embedding_service.EMBEDDING_DIM = 384
+    service.embedding_service.embed_text.side_effect = _fake_embedding
+    service.embedding_service.embed_batch.side_effect = lambda texts: [
+        _fake_embedding(t) for t in texts
+    ]
+    service.embedding_service.embed_batches.side_effect = (
+        lambda texts, **kwargs: [_fake_embedding(t) for t in texts]
+    )
+    return service
+
+
+class TestRAGServiceLocalIndex:
+    """Test retrieval and re-ingestion without pgvector."""
+
+    async def test_retrieve_ranks_with_filters(self, local_service):
+        await local_service.ingest_document(
+            content="Residents may work at most 80 hours per week.",
+            doc_type="acgme_rules",
+            metadata={"topic": "duty_hours"},
+            chunk_size=20,
+            chunk_overlap=0,
+        )
+        await local_service.ingest_document(
+            content="Every clinic needs a supervising faculty member.",
+            doc_type="scheduling_policy",
+            metadata={"topic": "supervision"},
+            chunk_size=20,
+            chunk_overlap=0,
+        )
+
+        response = await local_service.retrieve(
+            "How many hours per week may residents work?", min_similarity=0.3
+        )
+        assert [d.doc_type for d in response.documents] == ["acgme_rules"]
+        assert "80 hours" in response.documents[0].content
+
+        filtered = await local_service.retrieve(
+            "supervising faculty",
+            min_similarity=0.0,
+            metadata_filters={"topic": "supervision"},
+        )
+        assert [d.metadata["topic"] for d in filtered.documents] == ["supervision"]
+
+    async def test_ingest_reuses_stored_embeddings(self, local_service):
+        content = "Night float covers admissions. Day team rounds at seven."
+        await local_service.ingest_document(
+            content, "scheduling_policy", chunk_size=20, chunk_overlap=0
+        )
+        local_service.embedding_service.embed_batch.reset_mock()
+
+        response = await local_service.ingest_document(
+            content, "scheduling_policy", chunk_size=20, chunk_overlap=0
+        )
+
+        assert response.status == "success"
+        local_service.embedding_service.embed_batch.assert_not_called()
+
+    async def test_reindex_touches_only_changed_chunks(self, local_service, rag_db):
+        def source(content):
+            return SourceDocument("policy.md", content, "scheduling_policy")
+
+        first = "Call starts at five. Weekend call rotates weekly. Clinic opens early."
+        [created] = await local_service.reindex_sources(
+            [source(first)], chunk_size=5, chunk_overlap=0
+        )
+        assert created.chunks_created == 3
+        original = await local_service.retrieve("clinic opens", min_similarity=0.5)
+
+        second = first.replace("Clinic opens early.", "Clinic closes at noon.")
+        [updated] = await local_service.reindex_sources(
+            [source(second)], chunk_size=5, chunk_overlap=0, workers=2
+        )
+
+        assert updated.chunks_created == 1
+        assert updated.message.endswith("kept 2 unchanged, removed 1")
+        embedded = local_service.embedding_service.embed_batches.call_args.args[0]
+        assert embedded == ["Clinic closes at noon."]
+        assert rag_db.scalar(select(func.count()).select_from(RAGDocument)) == 3
+        # The local index reloads after the rewrite
+        closes = await local_service.retrieve("clinic closes", min_similarity=0.5)
+        assert closes.documents[0].content == "Clinic closes at noon."
+        assert original.documents[0].id not in {d.id for d in closes.documents}
@@ -0,0 +1,76 @@
+"""Tests for the in-process vector index (no DB)."""
+
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from app.services.vector_index import VectorIndex
+
+
+def _corpus(n: int, dim: int = 32, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((20, dim))
+    vectors = centers[rng.integers(0, 20, n)] + 0.5 * rng.standard_normal((n, dim))
+    ids = [uuid4() for _ in range(n)]
+    doc_types = ["rules" if i % 2 else "policy" for i in range(n)]
+    return ids, vectors, doc_types
+
+
+def _exact(vectors, query, k):
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    scores = unit @ (query / np.linalg.norm(query))
+    return list(np.argsort(-scores)[:k])
+
+
+def test_flat_search_matches_exact_ranking():
+    ids, vectors, doc_types = _corpus(300)
+    index = VectorIndex(dim=32)
+    index.add(ids, vectors, doc_types)
+
+    hits = index.search(vectors[7], top_k=5)
+
+    assert not index.is_trained
+    assert [chunk_id for chunk_id, _ in hits] == [
+        ids[i] for i in _exact(vectors, vectors[7], 5)
+    ]
+    assert hits[0] == (ids[7], pytest.approx(1.0))
+
+
+def test_ivf_search_recalls_exact_neighbours():
+    ids, vectors, doc_types = _corpus(4000)
+    index = VectorIndex(dim=32, train_threshold=1000)
+    for start in range(0, 4000, 500):
+        stop = start + 500
+        index.add(ids[start:stop], vectors[start:stop], doc_types[start:stop])
+
+    rng = np.random.default_rng(1)
+    recall = []
+    for row in rng.integers(0, 4000, 20):
+        query = vectors[row] + 0.1 * rng.standard_normal(32)
+        found = {chunk_id for chunk_id, _ in index.search(query, top_k=10)}
+        recall.append(len(found & {ids[i] for i in _exact(vectors, query, 10)}))
+
+    assert index.is_trained
+    assert np.mean(recall) >= 9.0
+
+
+def test_filters_threshold_and_removal():
+    ids, vectors, doc_types = _corpus(200)
+    metadata = [{"section": i % 4} for i in range(200)]
+    index = VectorIndex(dim=32, train_threshold=50, nprobe=1)
+    index.add(ids, vectors, doc_types, metadata)
+
+    hits = index.search(
+        vectors[3], top_k=10, doc_type="rules", metadata_filters={"section": "3"}
+    )
+    assert len(hits) == 10  # widened past a single probed list
+    assert all(ids.index(chunk_id) % 4 == 3 for chunk_id, _ in hits)
+    assert index.search(vectors[3], doc_type="unknown") == []
+
+    close = index.search(vectors[3], top_k=50, min_similarity=0.9)
+    assert close and all(score >= 0.9 for _, score in close)
+
+    assert index.remove([ids[3], uuid4()]) == 1
+    assert ids[3] not in {chunk_id for chunk_id, _ in index.search(vectors[3], 5)}
+    assert len(index) == 199
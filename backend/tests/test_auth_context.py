@@ -0,0 +1,204 @@
+"""Tests for the per-request auth context and in-process auth caches."""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+from fastapi import Depends, FastAPI, Request
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from app.core import auth_context as auth_context_module
+from app.core.auth_context import AuthContext, AuthUserCache, get_request_auth_context
+from app.core.security import (
+    create_access_token,
+    create_refresh_token,
+    get_current_active_user,
+    get_password_hash,
+)
+from app.core.token_revocation import BloomFilter, RevokedTokenCache
+from app.db.session import get_db
+from app.middleware.auth_context import AuthContextMiddleware
+from app.middleware.rate_limit_middleware import RateLimitMiddleware
+from app.models.token_blacklist import TokenBlacklist
+from app.models.user import User
+
+
+@pytest.fixture
+def user(db) -> User:
+    user = User(
+        id=uuid4(),
+        username="authctx",
+        email="authctx@test.org",
+        hashed_password=get_password_hash("testpass123"),
+        role="coordinator",
+        is_active=True,
+    )
+    db.add(user)
+    db.commit()
+    return user
+
+
+def _blacklist(db, jti: str) -> None:
+    db.add(TokenBlacklist(jti=jti, expires_at=datetime.now(UTC) + timedelta(hours=1)))
+    db.commit()
+
+
+def _live_cache() -> RevokedTokenCache:
+    """A cache whose pub/sub subscription is treated as connected."""
+    cache = RevokedTokenCache(capacity=1000)
+    cache._subscribed.set()
+    return cache
+
+
+def _count_selects(db, table: str) -> list[str]:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT") and table in statement:
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", record)
+    return statements
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=500, false_positive_rate=0.01)
+    members = [str(uuid4()) for _ in range(500)]
+    for member in members:
+        bloom.add(member)
+
+    assert all(member in bloom for member in members)
+    false_positives = sum(str(uuid4()) in bloom for _ in range(2000))
+    assert false_positives < 100
+
+
+def test_revocation_falls_back_to_database_without_subscription(db):
+    cache = RevokedTokenCache(capacity=1000)
+    _blacklist(db, "revoked-jti")
+
+    assert cache.is_revoked(db, "revoked-jti") is True
+    assert cache.is_revoked(db, "other-jti") is False
+    assert cache.get_stats()["db_checks"] == 2
+
+
+def test_subscribed_cache_answers_misses_from_memory(db):
+    cache = _live_cache()
+    _blacklist(db, "revoked-jti")
+
+    assert cache.is_revoked(db, "other-jti") is False
+    assert cache.is_revoked(db, "revoked-jti") is True
+    assert cache.is_revoked(db, "revoked-jti") is True
+
+    stats = cache.get_stats()
+    assert stats["authoritative"] is True
+    assert stats["filter_negatives"] == 1
+    assert stats["db_checks"] == 1  # confirmation of the bloom hit only
+    assert stats["lru_hits"] == 1
+
+
+def test_published_revocation_is_seen_without_resync(db):
+    cache = _live_cache()
+    cache.resync(db)
+    assert cache.is_revoked(db, "late-jti") is False
+
+    _blacklist(db, "late-jti")
+    cache.add("late-jti")  # as delivered by the pub/sub listener
+
+    assert cache.is_revoked(db, "late-jti") is True
+
+
+def test_stale_filter_is_rebuilt_from_database(db):
+    cache = _live_cache()
+    cache.resync_seconds = 0
+    _blacklist(db, "missed-jti")  # published while another worker was offline
+
+    assert cache.is_revoked(db, "missed-jti") is True
+
+
+def test_user_cache_merges_snapshot_without_select(db, user):
+    cache = AuthUserCache(ttl=60)
+    first = cache.get_user(db, user.id, version=1)
+    db.expunge_all()
+
+    selects = _count_selects(db, "users")
+    second = cache.get_user(db, user.id, version=1)
+
+    assert second is not first
+    assert second.username == "authctx"
+    assert second in db
+    assert selects == []
+
+
+def test_user_cache_is_invalidated_by_updates(db, user):
+    cache = AuthUserCache(ttl=60)
+    user_id = user.id
+    with patch.object(auth_context_module, "_auth_user_cache", cache):
+        cache.get_user(db, user_id, version=1)
+        user.is_active = False
+        db.commit()
+        db.expunge_all()
+
+        assert cache.get_user(db, user_id, version=1).is_active is False
+
+
+def test_refresh_token_claims_are_not_an_access_context():
+    context = AuthContext.from_token(create_refresh_token({"sub": "abc"}))
+
+    assert context.is_authenticated
+    assert context.token_type == "refresh"
+    assert AuthContext.from_token("not-a-jwt").error == "malformed"
+
+
+def test_token_is_decoded_once_per_request(db, user):
+    app = FastAPI()
+    app.add_middleware(AuthContextMiddleware)
+    app.dependency_overrides[get_db] = lambda: db
+    limiter = RateLimitMiddleware(app, redis_client=object())
+
+    @app.get("/me")
+    async def me(request: Request, current=Depends(get_current_active_user)):
+        user_id, role = limiter._extract_user_info(request)
+        return {
+            "username": current.username,
+            "limiter_user": user_id,
+            "role": role,
+            "same": get_request_auth_context(request) is request.state.auth_context,
+        }
+
+    token = create_access_token(
+        {"sub": str(user.id), "username": user.username, "role": user.role}
+    )
+    with patch.object(
+        auth_context_module.jwt, "decode", wraps=auth_context_module.jwt.decode
+    ) as decode:
+        response = TestClient(app).get(
+            "/me", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "username": "authctx",
+        "limiter_user": str(user.id),
+        "role": "coordinator",
+        "same": True,
+    }
+    assert decode.call_count == 1
+
+
+def test_revoked_token_is_rejected(db, user):
+    app = FastAPI()
+    app.add_middleware(AuthContextMiddleware)
+    app.dependency_overrides[get_db] = lambda: db
+
+    @app.get("/me")
+    async def me(current=Depends(get_current_active_user)):
+        return {"username": current.username}
+
+    token, jti, _ = create_access_token({"sub": str(user.id)}, return_details=True)
+    _blacklist(db, jti)
+
+    response = TestClient(app).get("/me", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 401
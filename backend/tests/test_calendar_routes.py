@@ -8,6 +8,7 @@ from datetime import date, datetime, timedelta
 from uuid import uuid4
 
 from fastapi.testclient import TestClient
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.models.assignment import Assignment
@@ -1097,3 +1098,75 @@ class TestCalendarEdgeCases:
 
         # Should handle gracefully
         assert response.status_code in [200, 400]
+
+
+class TestConditionalCalendarFeeds:
+    """Tests for ETag/Last-Modified handling on calendar feeds."""
+
+    def test_unchanged_feed_returns_304_without_reading_assignments(
+        self,
+        client: TestClient,
+        db: Session,
+        sample_blocks,
+        sample_resident,
+        sample_rotation_template,
+    ):
+        """Test conditional requests skip the assignments query."""
+        db.add(
+            Assignment(
+                id=uuid4(),
+                block_id=sample_blocks[0].id,
+                person_id=sample_resident.id,
+                rotation_template_id=sample_rotation_template.id,
+                role="primary",
+            )
+        )
+        db.commit()
+        url = f"/api/v1/calendar/export/person/{sample_resident.id}"
+        params = {
+            "start_date": sample_blocks[0].date.isoformat(),
+            "end_date": sample_blocks[-1].date.isoformat(),
+        }
+
+        response = client.get(url, params=params)
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/calendar")
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+
+        statements = []
+
+        def record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        engine = db.get_bind()
+        event.listen(engine, "before_cursor_execute", record)
+        try:
+            for headers in (
+                {"If-None-Match": etag},
+                {"If-Modified-Since": last_modified},
+            ):
+                cached = client.get(url, params=params, headers=headers)
+                assert cached.status_code == 304
+                assert cached.headers["etag"] == etag
+                assert cached.content == b""
+        finally:
+            event.remove(engine, "before_cursor_execute", record)
+        assert statements
+        assert not any("assignments" in statement for statement in statements)
+
+        # A schedule change invalidates the cached copy
+        db.add(
+            Assignment(
+                id=uuid4(),
+                block_id=sample_blocks[1].id,
+                person_id=sample_resident.id,
+                rotation_template_id=sample_rotation_template.id,
+                role="primary",
+            )
+        )
+        db.commit()
+        changed = client.get(url, params=params, headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert changed.text.count("BEGIN:VEVENT") == 2
@@ -8,6 +8,24 @@ import pytest
 from app.services.heatmap_service import HeatmapService
 
 
+def _daily_counts(assignments):
+    """Collapse mock assignments into date -> count."""
+    counts = {}
+    for assignment in assignments:
+        counts[assignment.block.date] = counts.get(assignment.block.date, 0) + 1
+    return counts
+
+
+def _mock_assignment_counts(assignments, entity_attr=None):
+    """Stand-in for HeatmapService._get_assignment_counts."""
+    counts = {}
+    for assignment in assignments:
+        entity = getattr(assignment, entity_attr) if entity_attr else None
+        key = (entity, assignment.block.date)
+        counts[key] = counts.get(key, 0) + 1
+    return MagicMock(return_value=(counts, len(assignments)))
+
+
 class TestHeatmapServiceGroupBy:
     """Test suite for HeatmapService group_by functionality."""
 
@@ -37,7 +55,7 @@ class TestHeatmapServiceGroupBy:
 
         result = service._generate_daily_heatmap(
             db,
-            assignments,
+            _daily_counts(assignments),
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 3),
             include_fmit=False,
@@ -72,7 +90,7 @@ class TestHeatmapServiceGroupBy:
 
         result = service._generate_daily_heatmap(
             db,
-            assignments,
+            _daily_counts(assignments),
             start_date=date(2025, 1, 1),
             end_date=date(2025, 1, 1),
             include_fmit=True,
@@ -109,7 +127,7 @@ class TestHeatmapServiceGroupBy:
 
         result = service._generate_weekly_heatmap(
             db,
-            assignments,
+            _daily_counts(assignments),
             start_date=date(2024, 12, 30),
             end_date=date(2025, 1, 10),
             include_fmit=False,
@@ -141,7 +159,7 @@ class TestHeatmapServiceGroupBy:
 
         result = service._generate_weekly_heatmap(
             db,
-            assignments,
+            _daily_counts(assignments),
             start_date=date(2025, 1, 6),
             end_date=date(2025, 1, 12),
             include_fmit=True,
@@ -177,7 +195,7 @@ class TestHeatmapServiceGroupBy:
             assignments.append(assignment)
 
         # Mock the query methods
-        service._get_assignments_in_range = MagicMock(return_value=assignments)
+        service._get_assignment_counts = _mock_assignment_counts(assignments)
 
         result = service.generate_unified_heatmap(
             db=db,
@@ -218,7 +236,7 @@ class TestHeatmapServiceGroupBy:
             assignments.append(assignment)
 
         # Mock the query methods
-        service._get_assignments_in_range = MagicMock(return_value=assignments)
+        service._get_assignment_counts = _mock_assignment_counts(assignments)
 
         result = service.generate_unified_heatmap(
             db=db,
@@ -266,7 +284,9 @@ class TestHeatmapServiceGroupBy:
         assignments.append(assignment2)
 
         # Mock query results
-        service._get_assignments_in_range = MagicMock(return_value=assignments)
+        service._get_assignment_counts = _mock_assignment_counts(
+            assignments, "person_id"
+        )
         db.query.return_value.filter.return_value.all.return_value = [person1, person2]
 
         result = service.generate_unified_heatmap(
@@ -312,7 +332,9 @@ class TestHeatmapServiceGroupBy:
         assignments.append(assignment2)
 
         # Mock query results
-        service._get_assignments_in_range = MagicMock(return_value=assignments)
+        service._get_assignment_counts = _mock_assignment_counts(
+            assignments, "rotation_template_id"
+        )
         db.query.return_value.filter.return_value.all.return_value = [
             rotation1,
             rotation2,
@@ -0,0 +1,141 @@
+"""Tests for lazily mounted routers and lazy package re-exports."""
+
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.lazy_router import LazyRouterMount, LazyRouterSpec, install_lazy_routers
+from app.core.lazy_imports import lazy_exports
+
+LAZY_MODULE = "lazy_router_fixture"
+
+
+@pytest.fixture
+def lazy_module(tmp_path, monkeypatch):
+    """A real, not-yet-imported module exposing ``router``."""
+    (tmp_path / f"{LAZY_MODULE}.py").write_text(
+        textwrap.dedent(
+            """
+            from fastapi import APIRouter
+
+            router = APIRouter()
+
+            @router.get("/ping")
+            async def ping():
+                return {"pong": True}
+
+            @router.get("/items/{item_id}")
+            async def item(item_id: int):
+                return {"item_id": item_id}
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    monkeypatch.delitem(sys.modules, LAZY_MODULE, raising=False)
+    yield LAZY_MODULE
+    sys.modules.pop(LAZY_MODULE, None)
+
+
+def _make_app(eager: bool = False) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/v1/health")
+    async def health():
+        return {"status": "ok"}
+
+    install_lazy_routers(
+        app,
+        [LazyRouterSpec(LAZY_MODULE, "/exotic", tags=("exotic",))],
+        prefix="/api/v1",
+        eager=eager,
+    )
+    return app
+
+
+def test_router_is_imported_on_first_request(lazy_module):
+    client = TestClient(_make_app())
+
+    assert client.get("/api/v1/health").status_code == 200
+    assert lazy_module not in sys.modules
+
+    response = client.get("/api/v1/exotic/items/7")
+
+    assert response.json() == {"item_id": 7}
+    assert lazy_module in sys.modules
+    assert client.get("/api/v1/exotic/ping").json() == {"pong": True}
+
+
+def test_placeholder_is_replaced_in_place(lazy_module):
+    app = _make_app()
+    client = TestClient(app)
+    client.get("/api/v1/exotic/ping")
+
+    paths = [route.path for route in app.router.routes]
+    assert not any(isinstance(route, LazyRouterMount) for route in app.router.routes)
+    assert paths[-2:] == ["/api/v1/exotic/ping", "/api/v1/exotic/items/{item_id}"]
+
+
+def test_unrelated_prefix_does_not_match(lazy_module):
+    client = TestClient(_make_app())
+
+    assert client.get("/api/v1/exotical").status_code == 404
+    assert lazy_module not in sys.modules
+
+
+def test_openapi_includes_lazy_routes(lazy_module):
+    client = TestClient(_make_app())
+
+    schema = client.get("/openapi.json").json()
+
+    assert "/api/v1/exotic/ping" in schema["paths"]
+    assert schema["paths"]["/api/v1/exotic/ping"]["get"]["tags"] == ["exotic"]
+
+
+def test_eager_mode_mounts_immediately(lazy_module):
+    _make_app(eager=True)
+
+    assert lazy_module in sys.modules
+
+
+def test_lazy_exports_import_on_access(monkeypatch):
+    package = type(sys)("lazy_package_fixture")
+    monkeypatch.setitem(sys.modules, package.__name__, package)
+    getattr_hook, dir_hook = lazy_exports(
+        package.__name__, {"dumps": "json", "join_path": "os.path:join"}
+    )
+    package.__getattr__ = getattr_hook
+
+    import json
+    import os.path
+
+    assert package.dumps is json.dumps
+    assert package.join_path is os.path.join
+    assert "dumps" in vars(package)  # cached after first access
+    assert {"dumps", "join_path"} <= set(dir_hook())
+    with pytest.raises(AttributeError):
+        package.missing
+
+
+def test_scheduling_package_defers_heavy_submodules():
+    probe = (
+        "import sys, app.scheduling.validator; "
+        "print('app.scheduling.penrose_visualization' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+    import app.scheduling as scheduling
+
+    assert scheduling.ACGMEValidator.__module__ == "app.scheduling.validator"
@@ -0,0 +1,209 @@
+"""Tests for vectorized ML inference and the process-wide model registry."""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.ml.inference.model_registry import ModelRegistry
+from app.ml.inference.schedule_scorer import ScheduleScorer
+from app.ml.models.batch_features import build_feature_matrix
+from app.ml.models.conflict_predictor import ConflictPredictor
+from app.ml.models.preference_predictor import PreferencePredictor
+from app.ml.models.workload_optimizer import WorkloadOptimizer
+
+
+def _conflict_case(i: int) -> dict:
+    return {
+        "person": {"type": "resident" if i % 2 else "faculty", "pgy_level": i % 3},
+        "proposed": {
+            "date": f"2026-01-{(i % 28) + 1:02d}",
+            "rotation_name": ["Clinic", "Inpatient", "Procedure"][i % 3],
+            "is_weekend": i % 7 == 0,
+        },
+        "existing": [{"date": f"2026-01-{d + 1:02d}"} for d in range(i % 8)],
+        "context": {"coverage_level": 0.5 + (i % 5) / 10},
+    }
+
+
+def _preference_case(i: int) -> dict:
+    return {
+        "person": {"type": "faculty", "faculty_role": ["pd", "core"][i % 2]},
+        "rotation": {"name": ["Clinic", "Inpatient"][i % 2]},
+        "block": {"date": f"2026-02-{(i % 28) + 1:02d}", "time_of_day": "AM"},
+    }
+
+
+def _workload_case(i: int) -> dict:
+    return {
+        "person": {"id": str(i), "type": "faculty", "target_clinical_blocks": 40},
+        "assignments": [{"rotation_name": "clinic"} for _ in range(i % 30)],
+    }
+
+
+@pytest.fixture(scope="module")
+def conflict_predictor() -> ConflictPredictor:
+    predictor = ConflictPredictor(n_estimators=10)
+    cases = [_conflict_case(i) for i in range(120)]
+    X = pd.concat(
+        [
+            predictor.extract_features(
+                c["person"], c["proposed"], c["existing"], c["context"]
+            )
+            for c in cases
+        ],
+        ignore_index=True,
+    )
+    y = np.array([i % 2 for i in range(len(cases))])
+    predictor.train(X, y)
+    return predictor
+
+
+@pytest.fixture(scope="module")
+def preference_predictor() -> PreferencePredictor:
+    predictor = PreferencePredictor(n_estimators=10)
+    cases = [_preference_case(i) for i in range(80)]
+    X = pd.concat(
+        [
+            predictor.extract_features(c["person"], c["rotation"], c["block"])
+            for c in cases
+        ],
+        ignore_index=True,
+    )
+    predictor.train(X, np.linspace(0.0, 1.0, len(cases)))
+    return predictor
+
+
+@pytest.fixture(scope="module")
+def workload_optimizer() -> WorkloadOptimizer:
+    optimizer = WorkloadOptimizer(n_estimators=10)
+    cases = [_workload_case(i) for i in range(60)]
+    X = pd.concat(
+        [optimizer.extract_features(c["person"], c["assignments"]) for c in cases],
+        ignore_index=True,
+    )
+    optimizer.train(X, np.linspace(0.2, 1.0, len(cases)))
+    return optimizer
+
+
+def test_build_feature_matrix_pads_and_orders_columns():
+    matrix = build_feature_matrix(
+        [{"b": 2, "a": 1, "extra": 9}, {"a": 3}], ["a", "b"], n_rows=2
+    )
+    assert matrix.tolist() == [[1.0, 2.0], [3.0, 0.0]]
+
+
+def test_conflict_batch_matches_single_row(conflict_predictor):
+    cases = [_conflict_case(i) for i in range(30)]
+    batch = conflict_predictor.predict_conflict_probabilities(cases)
+    single = [
+        conflict_predictor.predict_conflict_probability(
+            c["person"], c["proposed"], c["existing"], c["context"]
+        )
+        for c in cases
+    ]
+    np.testing.assert_allclose(batch, single)
+
+
+def test_high_risk_uses_single_predict_proba_call(conflict_predictor, monkeypatch):
+    calls = []
+    original = conflict_predictor.model.predict_proba
+
+    def counting(X):
+        calls.append(len(X))
+        return original(X)
+
+    monkeypatch.setattr(conflict_predictor.model, "predict_proba", counting)
+    conflict_predictor.identify_high_risk_assignments(
+        [_conflict_case(i) for i in range(50)], threshold=0.0
+    )
+    assert calls == [50]
+
+
+def test_preference_batch_matches_single_row(preference_predictor):
+    cases = [_preference_case(i) for i in range(20)]
+    batch = preference_predictor.predict_batch(cases)
+    single = [
+        preference_predictor.predict(c["person"], c["rotation"], c["block"])
+        for c in cases
+    ]
+    np.testing.assert_allclose(batch, single)
+
+
+def test_workload_batch_matches_single_row(workload_optimizer):
+    cases = [_workload_case(i) for i in range(20)]
+    batch = workload_optimizer.predict_optimal_workloads(cases)
+    single = [
+        workload_optimizer.predict_optimal_workload(c["person"], c["assignments"])
+        for c in cases
+    ]
+    np.testing.assert_allclose(batch, single)
+    assert workload_optimizer.calculate_fairness_metric(cases)["max_workload"] <= 1.0
+
+
+def test_registry_loads_each_version_once(tmp_path, conflict_predictor):
+    path = tmp_path / "conflict_predictor"
+    conflict_predictor.save(path)
+    registry = ModelRegistry()
+
+    first = registry.get("conflict", path)
+    second = registry.get("conflict", path)
+
+    assert first is second
+    assert registry.loads == 1 and registry.hits == 1
+
+
+def test_registry_hot_swaps_on_new_artifacts(tmp_path, conflict_predictor):
+    path = tmp_path / "conflict_predictor"
+    conflict_predictor.save(path)
+    registry = ModelRegistry()
+    first = registry.get("conflict", path)
+
+    # Simulate a retrain in another process rewriting the artifacts
+    later = time.time() + 5
+    for artifact in path.glob("*.pkl"):
+        os.utime(artifact, (later, later))
+
+    assert registry.get("conflict", path) is not first
+    assert registry.loads == 2
+
+
+def test_registry_publish_avoids_reload(tmp_path, conflict_predictor):
+    path = tmp_path / "conflict_predictor"
+    conflict_predictor.save(path)
+    registry = ModelRegistry()
+    registry.publish("conflict", path, conflict_predictor)
+
+    assert registry.get("conflict", path) is conflict_predictor
+    assert registry.loads == 0
+
+
+def test_scorer_shares_registry_models(tmp_path, conflict_predictor):
+    path = tmp_path / "conflict_predictor"
+    conflict_predictor.save(path)
+
+    scorer_a = ScheduleScorer(conflict_model_path=path)
+    scorer_b = ScheduleScorer(conflict_model_path=path)
+
+    assert scorer_a.conflict_predictor is scorer_b.conflict_predictor
+
+
+def test_scorer_conflict_risk_is_batched(conflict_predictor, monkeypatch):
+    scorer = ScheduleScorer()
+    scorer.conflict_predictor = conflict_predictor
+    calls = []
+    original = conflict_predictor.predict_conflict_probabilities
+
+    def counting(assignments):
+        calls.append(len(assignments))
+        return original(assignments)
+
+    monkeypatch.setattr(conflict_predictor, "predict_conflict_probabilities", counting)
+    result = scorer._score_conflict_risk(
+        {"assignments": [_conflict_case(i) for i in range(40)]}
+    )
+
+    assert calls == [40]
+    assert sum(result["risk_distribution"].values()) == 40
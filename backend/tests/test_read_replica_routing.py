@@ -0,0 +1,143 @@
+"""Tests for replica routing of read-only routes (two SQLite files stand in
+for a primary and its replica)."""
+
+import time
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import REGISTRY
+from sqlalchemy import Column, Integer, MetaData, String, Table, create_engine, select
+from sqlalchemy.orm import Session
+
+import app.db.session as db_session
+from app.db.replicas.health import HealthChecker
+from app.db.replicas.routing import ReadReplicaRouter
+from app.db.session import get_read_db
+
+metadata = MetaData()
+source = Table(
+    "source",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String(16)),
+)
+
+
+def _engine(path, name: str):
+    engine = create_engine(f"sqlite:///{path / name}.db")
+    metadata.create_all(engine)
+    with engine.begin() as conn:
+        conn.execute(source.insert().values(id=1, name=name))
+    return engine
+
+
+@pytest.fixture
+def engines(tmp_path):
+    return _engine(tmp_path, "primary"), _engine(tmp_path, "replica")
+
+
+def _served_by(session: Session) -> str:
+    return session.execute(select(source.c.name).where(source.c.id == 1)).scalar()
+
+
+def test_reads_go_to_replica_until_session_writes(engines):
+    primary, replica = engines
+    router = ReadReplicaRouter(primary, {"replica1": replica})
+
+    session = router.open_session("/reports")
+    assert _served_by(session) == "replica"
+
+    session.execute(source.insert().values(id=2, name="new"))
+    assert session.using_primary
+    assert _served_by(session) == "primary"
+    session.commit()
+    session.close()
+
+    with primary.connect() as conn:
+        assert conn.execute(select(source.c.name).where(source.c.id == 2)).scalar()
+
+
+def test_lagging_replica_falls_back_to_primary(engines, monkeypatch):
+    primary, replica = engines
+    monkeypatch.setattr(HealthChecker, "_measure_replication_lag", lambda self, c: 8.0)
+    router = ReadReplicaRouter(primary, {"replica1": replica}, max_lag_seconds=5.0)
+
+    session = router.open_session("/resilience/health")
+    assert _served_by(session) == "primary"
+    session.close()
+    assert router.get_route_stats()["/resilience/health"]["primary_reasons"] == {
+        "lag": 1
+    }
+
+    # Within budget the replica serves again
+    lenient = ReadReplicaRouter(primary, {"replica1": replica}, max_lag_seconds=10.0)
+    assert lenient.select()[2] == "replica"
+
+
+def test_failed_replica_connection_falls_back_to_primary(engines, tmp_path):
+    primary, _ = engines
+    missing = create_engine(f"sqlite:///{tmp_path}/no/such/dir/replica.db")
+    router = ReadReplicaRouter(primary, {"replica1": missing})
+    router.health_checker.is_replica_healthy = lambda *args, **kwargs: True
+
+    session = router.open_session("/export/schedule")
+    assert _served_by(session) == "primary"
+    session.close()
+
+    health = router.health_checker.get_cached_health("replica1")
+    assert health is not None and not health.is_healthy
+    assert router.get_route_stats()["/export/schedule"]["primary_reasons"] == {
+        "error": 1
+    }
+
+
+def test_recent_writer_reads_from_primary(engines):
+    primary, replica = engines
+    router = ReadReplicaRouter(primary, {"replica1": replica}, sticky_seconds=10.0)
+
+    deadline = router.record_write("user-1")
+    assert deadline > time.time()
+    assert router.select(user_id="user-1")[2] == "sticky"
+    assert router.select(user_id="user-2")[2] == "replica"
+
+    # The cookie carries the window to workers that did not see the write
+    assert router.select(primary_until=deadline)[2] == "sticky"
+    assert router.select(primary_until=time.time() - 1)[2] == "replica"
+
+
+def test_get_read_db_records_route_hit_rate(engines, monkeypatch):
+    primary, replica = engines
+    router = ReadReplicaRouter(primary, {"replica1": replica})
+    monkeypatch.setattr(db_session, "read_router", router)
+
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: int, db: Session = Depends(get_read_db)):
+        return {"served_by": _served_by(db)}
+
+    client = TestClient(app)
+    for item_id in range(3):
+        assert client.get(f"/items/{item_id}").json() == {"served_by": "replica"}
+
+    stats = router.get_route_stats()["/items/{item_id}"]
+    assert stats["replica"] == 3
+    assert stats["hit_rate"] == 1.0
+    assert (
+        REGISTRY.get_sample_value(
+            "db_read_routing_total",
+            {"route": "/items/{item_id}", "target": "replica", "reason": "replica"},
+        )
+        == 3
+    )
+
+
+def test_without_replicas_reads_from_primary(engines):
+    primary, _ = engines
+    router = ReadReplicaRouter(primary)
+
+    assert not router.enabled
+    session = router.open_session("/search")
+    assert _served_by(session) == "primary"
+    session.close()
@@ -0,0 +1,263 @@
+"""Tests for incrementally maintained schedule rollups."""
+
+from datetime import date, timedelta
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.db import rollups
+from app.db.rollups import (
+    BLOCK_COUNTS,
+    PERSON_WORKLOAD,
+    ROLLUPS,
+    daily_assignment_counts,
+    get_rollup_status,
+    person_day_counts,
+    reconcile_rollup,
+    rotation_day_counts,
+    stale_rollups,
+)
+from app.db.optimization.query_builder import OptimizedQueryBuilder
+from app.db.schedule_versions import STRUCTURE, get_versions
+from app.models.assignment import Assignment
+from app.models.block import Block
+from app.models.person import Person
+from app.models.rotation_template import RotationTemplate
+from app.models.schedule_rollup import PersonWorkloadRollup
+from app.services.fairness_audit_service import FairnessAuditService
+from app.services.heatmap_service import HeatmapService
+
+START = date(2026, 1, 5)  # Monday
+END = START + timedelta(days=6)
+
+
+@pytest.fixture(autouse=True)
+def refresh_requests(monkeypatch) -> list:
+    """Record refresh requests instead of enqueueing the task."""
+    requests: list = []
+    monkeypatch.setattr(rollups, "request_refresh", lambda: requests.append(1))
+    return requests
+
+
+@pytest.fixture
+def schedule(db: Session) -> dict:
+    """Two faculty, two rotations and a week of AM/PM blocks."""
+    people = [
+        Person(id=uuid4(), name=f"Dr. Faculty {i}", type="faculty", email=f"f{i}@x.org")
+        for i in range(2)
+    ]
+    clinic = RotationTemplate(
+        id=uuid4(), name="Clinic", rotation_type="outpatient", abbreviation="C"
+    )
+    fmit = RotationTemplate(
+        id=uuid4(), name="FMIT", rotation_type="inpatient", abbreviation="FMIT"
+    )
+    blocks = {
+        (START + timedelta(days=d), tod): Block(
+            id=uuid4(),
+            date=START + timedelta(days=d),
+            time_of_day=tod,
+            block_number=1,
+        )
+        for d in range(7)
+        for tod in ("AM", "PM")
+    }
+    db.add_all([*people, clinic, fmit, *blocks.values()])
+    db.flush()
+
+    for d in range(5):
+        day = START + timedelta(days=d)
+        db.add_all(
+            [
+                Assignment(
+                    block_id=blocks[(day, "AM")].id,
+                    person_id=people[0].id,
+                    rotation_template_id=clinic.id,
+                    role="primary",
+                ),
+                Assignment(
+                    block_id=blocks[(day, "PM")].id,
+                    person_id=people[1].id,
+                    rotation_template_id=fmit.id,
+                    role="primary",
+                ),
+            ]
+        )
+    db.commit()
+    return {"people": people, "clinic": clinic, "fmit": fmit, "blocks": blocks}
+
+
+def _raw_person_counts(db: Session) -> dict:
+    rows = db.execute(
+        select(Assignment.person_id, Block.date, func.count(Assignment.id))
+        .join(Block, Assignment.block_id == Block.id)
+        .group_by(Assignment.person_id, Block.date)
+    )
+    return {(person_id, day): count for person_id, day, count in rows}
+
+
+def _refresh(db: Session) -> list[str]:
+    """Reconcile every rollup the way the refresh task does."""
+    rebuilt = []
+    for name in ROLLUPS:
+        if reconcile_rollup(db, name):
+            rebuilt.append(name)
+        db.commit()
+    return rebuilt
+
+
+def _add(db: Session, schedule: dict, day: date, tod: str, person: int) -> Assignment:
+    assignment = Assignment(
+        block_id=schedule["blocks"][(day, tod)].id,
+        person_id=schedule["people"][person].id,
+        rotation_template_id=schedule["clinic"].id,
+        role="primary",
+    )
+    db.add(assignment)
+    db.commit()
+    return assignment
+
+
+def test_reads_before_build_use_raw_rows(
+    db: Session, schedule: dict, refresh_requests: list
+):
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+    daily = daily_assignment_counts(db, START, END)
+    assert len(daily) == 7 and daily[START] == 2
+
+    # Readers ask for a refresh but never build the rollups themselves
+    assert refresh_requests
+    assert all(get_rollup_status(db)[name]["row_count"] is None for name in ROLLUPS)
+
+
+def test_refresh_builds_rollups(db: Session, schedule: dict, refresh_requests):
+    assert _refresh(db) == list(ROLLUPS)
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+
+    fmit_days = rotation_day_counts(db, START, END, [schedule["fmit"].id])
+    assert sorted(day for _, day in fmit_days) == [
+        START + timedelta(days=d) for d in range(5)
+    ]
+
+    daily = daily_assignment_counts(db, START, END)
+    assert len(daily) == 7  # Weekend blocks exist with zero assignments
+    assert daily[START] == 2
+    assert daily[END] == 0
+
+    status = get_rollup_status(db)
+    assert all(status[name]["stale_since"] is None for name in ROLLUPS)
+    assert status[BLOCK_COUNTS]["row_count"] == 14
+    assert not refresh_requests
+
+
+def test_flushes_update_touched_dates(db: Session, schedule: dict):
+    _refresh(db)
+    saturday = START + timedelta(days=5)
+
+    added = _add(db, schedule, saturday, "AM", person=0)
+    assert daily_assignment_counts(db, saturday, saturday) == {saturday: 1}
+
+    # Moving an assignment refreshes both the old and the new date
+    added.block_id = schedule["blocks"][(END, "PM")].id
+    db.commit()
+    assert daily_assignment_counts(db, saturday, END) == {saturday: 0, END: 1}
+
+    db.delete(added)
+    db.commit()
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+
+    # Incremental refresh never needed a rebuild
+    assert stale_rollups(db) == []
+
+
+def test_bulk_delete_marks_stale_then_rebuilds(db: Session, schedule: dict):
+    _refresh(db)
+
+    db.query(Assignment).filter(
+        Assignment.person_id == schedule["people"][1].id
+    ).delete(synchronize_session=False)
+    db.commit()
+
+    assert get_rollup_status(db)[PERSON_WORKLOAD]["stale_since"] is not None
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+    assert get_rollup_status(db)[PERSON_WORKLOAD]["stale_since"] is not None
+
+    assert PERSON_WORKLOAD in _refresh(db)
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+    assert get_rollup_status(db)[PERSON_WORKLOAD]["stale_since"] is None
+
+
+def test_refresh_rebuilds_drifted_fresh_rollup(db: Session, schedule: dict):
+    _refresh(db)
+    assert _refresh(db) == []
+
+    # A lost update leaves a rollup marked fresh but wrong
+    db.execute(
+        PersonWorkloadRollup.__table__.update()
+        .where(PersonWorkloadRollup.date == START)
+        .values(assignment_count=PersonWorkloadRollup.assignment_count + 1)
+    )
+    db.commit()
+    assert stale_rollups(db) == []
+
+    assert _refresh(db) == [PERSON_WORKLOAD]
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+
+
+def test_query_builder_bulk_writes_reach_listeners(db: Session, schedule: dict):
+    _refresh(db)
+    before = get_versions(db, [STRUCTURE])[STRUCTURE][0]
+
+    OptimizedQueryBuilder(db).batch_create_assignments(
+        [
+            {
+                "id": uuid4(),
+                "block_id": schedule["blocks"][(END, "AM")].id,
+                "person_id": schedule["people"][0].id,
+                "role": "primary",
+            }
+        ]
+    )
+
+    assert get_versions(db, [STRUCTURE])[STRUCTURE][0] > before
+    assert get_rollup_status(db)[PERSON_WORKLOAD]["stale_since"] is not None
+    _refresh(db)
+    assert person_day_counts(db, START, END) == _raw_person_counts(db)
+
+
+def test_heatmap_matches_raw_assignments(db: Session, schedule: dict):
+    result = HeatmapService().generate_unified_heatmap(
+        db, START, END, include_fmit=False, group_by="weekly"
+    )
+    assert result.data.z_values == [[10.0]]
+    assert result.metadata["total_assignments"] == 10
+
+    coverage = HeatmapService().generate_coverage_heatmap(db, START, END)
+    assert coverage.coverage_percentage == pytest.approx(100 * 10 / 14)
+
+
+@pytest.mark.asyncio
+async def test_fairness_audit_reads_rollup_categories(
+    db: Session, schedule: dict, async_db_session
+):
+    _refresh(db)
+    report = await FairnessAuditService(async_db_session).generate_audit_report(
+        START, END
+    )
+    by_name = {w.person_name: w for w in report.workloads}
+
+    assert by_name["Dr. Faculty 0"].clinic_halfdays == 5
+    assert by_name["Dr. Faculty 1"].fmit_weeks == 1
+
+    # Renaming a template reclassifies history, from raw rows until rebuilt
+    schedule["clinic"].name = "FMIT Clinic"
+    db.commit()
+    report = await FairnessAuditService(async_db_session).generate_audit_report(
+        START, END
+    )
+    by_name = {w.person_name: w for w in report.workloads}
+    assert by_name["Dr. Faculty 0"].fmit_weeks == 1
+    _refresh(db)
+    assert db.scalar(select(func.sum(PersonWorkloadRollup.fmit_count))) == 10
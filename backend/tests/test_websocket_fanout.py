@@ -0,0 +1,324 @@
+"""Tests for serialize-once WebSocket fan-out and the Redis fan-out hub."""
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+from uuid import uuid4
+
+import pytest
+
+from app.websocket.events import ScheduleUpdatedEvent
+from app.websocket.fanout import EncodedEvent, OverflowPolicy, SendQueue, encode_event
+from app.websocket.manager import (
+    BROADCAST_CHANNEL,
+    ConnectionManager,
+    publish_solver_event,
+)
+from app.websocket.redis_hub import RedisFanoutHub
+
+
+class FakeWebSocket:
+    """Minimal WebSocket stand-in that records text frames."""
+
+    def __init__(self, delay: float = 0.0) -> None:
+        self.delay = delay
+        self.frames: list[str] = []
+        self.closed_with: int | None = None
+
+    async def accept(self) -> None:
+        return None
+
+    async def send_json(self, data: dict) -> None:
+        self.frames.append(json.dumps(data))
+
+    async def send_text(self, text: str) -> None:
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        self.frames.append(text)
+
+    async def close(self, code: int = 1000) -> None:
+        self.closed_with = code
+
+
+def _event(message: str = "update") -> ScheduleUpdatedEvent:
+    return ScheduleUpdatedEvent(
+        schedule_id=None,
+        academic_year_id=None,
+        user_id=None,
+        update_type="modified",
+        affected_blocks_count=1,
+        message=message,
+    )
+
+
+class TestEncodeEvent:
+    def test_model_uses_camel_case_aliases(self):
+        encoded = encode_event(_event())
+        assert json.loads(encoded.payload)["eventType"] == "schedule_updated"
+
+    def test_encoded_event_passes_through(self):
+        encoded = EncodedEvent(payload="{}")
+        assert encode_event(encoded) is encoded
+
+
+class TestSendQueue:
+    def test_drop_oldest(self):
+        queue = SendQueue(maxsize=2, policy=OverflowPolicy.DROP_OLDEST)
+        for i in range(3):
+            queue.put_nowait(EncodedEvent(payload=str(i)))
+        assert [e.payload for e in queue._items] == ["1", "2"]
+        assert queue.dropped == 1
+
+    def test_drop_newest(self):
+        queue = SendQueue(maxsize=1, policy=OverflowPolicy.DROP_NEWEST)
+        assert queue.put_nowait(EncodedEvent(payload="a"))
+        assert not queue.put_nowait(EncodedEvent(payload="b"))
+        assert queue._items[0].payload == "a"
+
+    def test_coalesce_replaces_in_place(self):
+        queue = SendQueue(maxsize=4, policy=OverflowPolicy.COALESCE)
+        queue.put_nowait(EncodedEvent(payload="p1", coalesce_key="task"))
+        queue.put_nowait(EncodedEvent(payload="other"))
+        queue.put_nowait(EncodedEvent(payload="p2", coalesce_key="task"))
+        assert [e.payload for e in queue._items] == ["p2", "other"]
+        assert queue.coalesced == 1
+
+    def test_disconnect_closes_queue(self):
+        queue = SendQueue(maxsize=1, policy=OverflowPolicy.DISCONNECT)
+        queue.put_nowait(EncodedEvent(payload="a"))
+        assert not queue.put_nowait(EncodedEvent(payload="b"))
+        assert queue.closed and queue.overflowed
+
+    @pytest.mark.asyncio
+    async def test_get_returns_none_after_close(self):
+        queue = SendQueue(maxsize=2)
+        queue.put_nowait(EncodedEvent(payload="a"))
+        queue.close()
+        assert (await queue.get()).payload == "a"
+        assert await queue.get() is None
+
+
+class TestConnectionManagerFanOut:
+    @pytest.mark.asyncio
+    async def test_broadcast_serializes_once(self):
+        manager = ConnectionManager()
+        schedule_id = uuid4()
+        sockets = []
+        for _ in range(20):
+            ws = FakeWebSocket()
+            user_id = uuid4()
+            await manager.connect(ws, user_id)
+            await manager.subscribe_to_schedule(user_id, schedule_id)
+            sockets.append(ws)
+
+        event = _event()
+        with patch.object(
+            ScheduleUpdatedEvent, "model_dump", wraps=event.model_dump
+        ) as dump:
+            sent = await manager.broadcast_to_schedule(schedule_id, event)
+
+        assert sent == 20
+        assert dump.call_count == 1
+
+        await asyncio.sleep(0.01)
+        assert all(len(ws.frames) == 2 for ws in sockets)  # ack + event
+
+    @pytest.mark.asyncio
+    async def test_slow_client_does_not_block_others(self):
+        manager = ConnectionManager()
+        slow, fast = FakeWebSocket(delay=0.5), FakeWebSocket()
+        await manager.connect(slow, uuid4())
+        await manager.connect(fast, uuid4())
+
+        await asyncio.wait_for(manager.broadcast_to_all(_event()), timeout=0.1)
+        await asyncio.sleep(0.01)
+
+        assert len(fast.frames) == 2
+        assert len(slow.frames) == 1
+
+    @pytest.mark.asyncio
+    async def test_solver_full_snapshots_coalesce_but_deltas_do_not(self):
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        connection = await manager.connect(ws, uuid4())
+        await connection.stop_writer()
+        connection.send_queue.closed = False  # keep queue open, no writer
+
+        full = {"eventType": "solver_solution", "taskId": "t1", "solutionType": "full"}
+        delta = {"eventType": "solver_solution", "taskId": "t1", "solutionType": "delta"}
+        await manager.broadcast_solver_event(full)
+        await manager.broadcast_solver_event(full)
+        await manager.broadcast_solver_event(delta)
+        await manager.broadcast_solver_event(delta)
+
+        assert len(connection.send_queue) == 3
+        assert manager.get_stats()["coalesced_events"] == 1
+
+    @pytest.mark.asyncio
+    async def test_disconnect_stops_writer(self):
+        manager = ConnectionManager()
+        connection = await manager.connect(FakeWebSocket(), uuid4())
+        await manager.disconnect(connection)
+        assert connection._writer_task is None
+        assert manager.get_connection_count() == 0
+
+
+def _fake_pubsub() -> AsyncMock:
+    """PubSub mock whose get_message idles like a real timeout poll."""
+
+    async def _idle(**kwargs):
+        await asyncio.sleep(0.01)
+        return None
+
+    pubsub = AsyncMock()
+    pubsub.get_message = AsyncMock(side_effect=_idle)
+    return pubsub
+
+
+class TestRedisFanoutHub:
+    @pytest.mark.asyncio
+    async def test_one_redis_subscription_per_channel(self):
+        pubsub = _fake_pubsub()
+
+        async def factory():
+            client = AsyncMock()
+            client.pubsub = lambda: pubsub
+            return client
+
+        hub = RedisFanoutHub(redis_factory=factory)
+        gen_a = hub.subscribe("chan")
+        gen_b = hub.subscribe("chan")
+        task_a = asyncio.create_task(gen_a.__anext__())
+        task_b = asyncio.create_task(gen_b.__anext__())
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        await hub.dispatch("chan", {"n": 1})
+        first_a, first_b = await task_a, await task_b
+
+        assert first_a == {"n": 1}
+        assert first_a is first_b  # decoded once, shared
+        pubsub.subscribe.assert_awaited_once_with("chan")
+
+        await gen_a.aclose()
+        pubsub.unsubscribe.assert_not_awaited()
+        await gen_b.aclose()
+        pubsub.unsubscribe.assert_awaited_once_with("chan")
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_listener_relays_to_websocket_manager(self):
+        pubsub = _fake_pubsub()
+
+        async def factory():
+            client = AsyncMock()
+            client.pubsub = lambda: pubsub
+            return client
+
+        hub = RedisFanoutHub(redis_factory=factory)
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, uuid4())
+        await manager.relay_redis_channel("solver", hub=hub)
+
+        await hub.dispatch("solver", {"eventType": "solver_complete"})
+        await asyncio.sleep(0.01)
+
+        assert json.loads(ws.frames[-1]) == {"eventType": "solver_complete"}
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_manager_start_and_stop_broadcast_relay(self):
+        pubsub = _fake_pubsub()
+
+        async def factory():
+            client = AsyncMock()
+            client.pubsub = lambda: pubsub
+            return client
+
+        hub = RedisFanoutHub(redis_factory=factory)
+        manager = ConnectionManager()
+        ws = FakeWebSocket()
+        await manager.connect(ws, uuid4())
+
+        await manager.start(hub=hub)
+        await manager.start(hub=hub)  # idempotent
+        pubsub.subscribe.assert_awaited_once_with(BROADCAST_CHANNEL)
+        await hub.dispatch(BROADCAST_CHANNEL, {"eventType": "solver_complete"})
+        await asyncio.sleep(0.01)
+        assert json.loads(ws.frames[-1]) == {"eventType": "solver_complete"}
+
+        await manager.stop()
+        assert hub.get_stats()["listeners"] == 0
+        pubsub.unsubscribe.assert_awaited_once_with(BROADCAST_CHANNEL)
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_published_solver_events_reach_relay_and_coalesce(self):
+        pubsub = _fake_pubsub()
+
+        async def factory():
+            client = AsyncMock()
+            client.pubsub = lambda: pubsub
+            return client
+
+        hub = RedisFanoutHub(redis_factory=factory)
+        manager = ConnectionManager()
+        ws = FakeWebSocket(delay=0.02)
+        await manager.connect(ws, uuid4())
+        await manager.start(hub=hub)
+
+        redis_client = MagicMock()
+        for num in range(1, 4):
+            publish_solver_event(
+                redis_client,
+                {
+                    "eventType": "solver_solution",
+                    "taskId": "t",
+                    "solutionType": "full",
+                    "solutionNum": num,
+                },
+            )
+        for (channel, payload), _ in redis_client.publish.call_args_list:
+            assert channel == BROADCAST_CHANNEL
+            await hub.dispatch(channel, json.loads(payload))
+        await asyncio.sleep(0.1)
+
+        nums = [json.loads(frame)["solutionNum"] for frame in ws.frames[1:]]
+        assert nums[-1] == 3
+        assert len(nums) < 3
+        await manager.stop()
+        await hub.close()
+
+    @pytest.mark.asyncio
+    async def test_subscription_manager_close_ends_only_its_subscriptions(self):
+        subscriptions = pytest.importorskip("app.graphql.subscriptions")
+        pubsub = _fake_pubsub()
+
+        async def factory():
+            client = AsyncMock()
+            client.pubsub = lambda: pubsub
+            return client
+
+        hub = RedisFanoutHub(redis_factory=factory)
+        with patch(
+            "app.graphql.subscriptions.get_redis_fanout_hub", return_value=hub
+        ):
+            manager = subscriptions.RedisSubscriptionManager()
+            ours = manager.subscribe("chan")
+            other = hub.subscribe("chan")
+            ours_next = asyncio.create_task(ours.__anext__())
+            other_next = asyncio.create_task(other.__anext__())
+            await asyncio.sleep(0)
+            await asyncio.sleep(0)
+
+            await manager.close()
+
+            with pytest.raises(StopAsyncIteration):
+                await ours_next
+            await hub.dispatch("chan", {"n": 1})
+            assert await other_next == {"n": 1}
+            pubsub.unsubscribe.assert_not_awaited()
+
+        await other.aclose()
+        await hub.close()
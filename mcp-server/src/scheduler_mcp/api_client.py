@@ -8,12 +8,20 @@ to call the FastAPI backend instead of accessing the database directly.
 import asyncio
 import logging
 import os
+from collections.abc import Awaitable
 from datetime import datetime
 from typing import Any
 
 import httpx
 from pydantic import BaseModel
 
+from .response_cache import (
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTL,
+    ResponseCache,
+    make_cache_key,
+)
+
 logger = logging.getLogger(__name__)
 
 # Retry configuration
@@ -21,6 +29,12 @@ DEFAULT_MAX_RETRIES = 3
 DEFAULT_RETRY_DELAY = 1.0  # seconds
 RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504}
 
+# Concurrency limit for fan_out()
+DEFAULT_FAN_OUT_CONCURRENCY = 8
+
+# Reads that must always hit the backend
+UNCACHED_PATHS = {"/health"}
+
 
 class APIConfig(BaseModel):
     """Configuration for API client."""
@@ -30,6 +44,8 @@ class APIConfig(BaseModel):
     api_prefix: str = "/api/v1"
     username: str = ""  # REQUIRED: Set via API_USERNAME env var
     password: str = ""  # REQUIRED: Set via API_PASSWORD env var
+    cache_ttl: float = DEFAULT_CACHE_TTL  # Seconds; 0 disables response caching
+    cache_max_entries: int = DEFAULT_CACHE_MAX_ENTRIES
 
 
 class SchedulerAPIClient:
@@ -40,6 +56,7 @@ class SchedulerAPIClient:
             base_url=os.environ.get("API_BASE_URL", "http://localhost:8000"),
             username=os.environ.get("API_USERNAME", ""),
             password=os.environ.get("API_PASSWORD", ""),
+            cache_ttl=float(os.environ.get("API_CACHE_TTL", DEFAULT_CACHE_TTL)),
         )
         if not self.config.username or not self.config.password:
             raise ValueError(
@@ -48,6 +65,9 @@ class SchedulerAPIClient:
             )
         self._client: httpx.AsyncClient | None = None
         self._token: str | None = None
+        self._cache = ResponseCache(
+            ttl=self.config.cache_ttl, max_entries=self.config.cache_max_entries
+        )
 
     async def __aenter__(self) -> "SchedulerAPIClient":
         self._client = httpx.AsyncClient(base_url=self.config.base_url, timeout=self.config.timeout)
@@ -82,6 +102,55 @@ class SchedulerAPIClient:
         logger.info("Successfully authenticated with backend API")
 
     async def _request_with_retry(
+        self,
+        method: str,
+        url: str,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        cache: bool | None = None,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """
+        Make HTTP request through the response cache, with retries.
+
+        By default GET requests are cached and coalesced, and any other
+        method is treated as a mutation that invalidates the cache.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            url: URL to request
+            max_retries: Maximum number of retry attempts
+            cache: True to cache a read-only non-GET request (e.g. a search
+                POST), False to bypass the cache without invalidating it,
+                None for the default behaviour
+            **kwargs: Additional arguments to pass to httpx request
+
+        Returns:
+            httpx.Response (shared between callers when served from cache)
+        """
+        if cache is None:
+            cache = method.upper() == "GET"
+            invalidates = not cache
+        else:
+            invalidates = False
+
+        if not cache or url in UNCACHED_PATHS:
+            try:
+                return await self._send_with_retry(
+                    method, url, max_retries=max_retries, **kwargs
+                )
+            finally:
+                if invalidates:
+                    self._cache.invalidate()
+
+        return await self._cache.get_or_fetch(
+            make_cache_key(method, url, **kwargs),
+            lambda: self._send_with_retry(
+                method, url, max_retries=max_retries, **kwargs
+            ),
+            should_cache=lambda response: response.status_code < 400,
+        )
+
+    async def _send_with_retry(
         self,
         method: str,
         url: str,
@@ -117,7 +186,7 @@ class SchedulerAPIClient:
                     self._token = None  # Clear stale token
                     new_headers = await self._ensure_authenticated()
                     kwargs["headers"] = new_headers
-                    return await self._request_with_retry(
+                    return await self._send_with_retry(
                         method, url, max_retries=max_retries, _token_refreshed=True, **kwargs
                     )
 
@@ -158,6 +227,14 @@ class SchedulerAPIClient:
             raise last_exception
         raise httpx.HTTPError(f"All {max_retries} retry attempts failed")
 
+    def invalidate_cache(self) -> None:
+        """Drop all cached responses (e.g. after out-of-band data changes)."""
+        self._cache.invalidate()
+
+    def get_cache_stats(self) -> dict[str, Any]:
+        """Get response cache statistics, including hit rate."""
+        return self._cache.get_stats()
+
     async def health_check(self) -> bool:
         """Check if FastAPI backend is available."""
         try:
@@ -214,6 +291,7 @@ class SchedulerAPIClient:
                     "POST",
                     f"{self.config.api_prefix}/schedules/validate",
                     headers=headers,
+                    cache=True,
                     json={
                         "schedule_id": schedule_id,
                         "constraint_config": constraint_config,
@@ -331,6 +409,7 @@ class SchedulerAPIClient:
             "POST",
             f"{self.config.api_prefix}/schedule/swaps/candidates",
             headers=headers,
+            cache=True,
             json={
                 "person_id": person_id,
                 "assignment_id": assignment_id,
@@ -665,6 +744,7 @@ class SchedulerAPIClient:
             "POST",
             f"{self.config.api_prefix}/compliance/report",
             headers=headers,
+            cache=False,
             json={
                 "start_date": start_date,
                 "end_date": end_date,
@@ -908,6 +988,30 @@ class SchedulerAPIClient:
         response.raise_for_status()
         return response.json()
 
+    async def get_composite_resilience(
+        self, analysis: str, payload: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Run a read-only composite resilience analysis.
+
+        Args:
+            analysis: Endpoint under /resilience/exotic/composite, e.g.
+                "creep-fatigue"
+            payload: Request body
+
+        Returns:
+            Analysis result
+        """
+        headers = await self._ensure_authenticated()
+        response = await self._request_with_retry(
+            "POST",
+            f"{self.config.api_prefix}/resilience/exotic/composite/{analysis}",
+            headers=headers,
+            cache=True,
+            json=payload,
+        )
+        response.raise_for_status()
+        return response.json()
+
     # ==================== RAG METHODS ====================
 
     async def rag_retrieve(
@@ -941,6 +1045,7 @@ class SchedulerAPIClient:
             "POST",
             f"{self.config.api_prefix}/rag/retrieve",
             headers=headers,
+            cache=True,
             json=payload,
         )
         response.raise_for_status()
@@ -977,6 +1082,7 @@ class SchedulerAPIClient:
             "POST",
             f"{self.config.api_prefix}/rag/context",
             headers=headers,
+            cache=True,
             json=payload,
         )
         response.raise_for_status()
@@ -1072,6 +1178,7 @@ class SchedulerAPIClient:
             "POST",
             f"{self.config.api_prefix}/task-history/search",
             headers=headers,
+            cache=True,
             json=payload,
         )
         response.raise_for_status()
@@ -1428,6 +1535,36 @@ class SchedulerAPIClient:
         return response.json()
 
 
+async def fan_out(
+    max_concurrency: int = DEFAULT_FAN_OUT_CONCURRENCY, **calls: Awaitable[Any]
+) -> dict[str, Any]:
+    """
+    Run several client calls concurrently for composite tools.
+
+    Identical reads issued by different calls are coalesced by the client's
+    response cache, and at most ``max_concurrency`` calls run at once.
+
+    Args:
+        max_concurrency: Maximum number of calls in flight
+        **calls: Named awaitables, e.g.
+            ``utilization=client.get_utilization(start, end)``
+
+    Returns:
+        Mapping of the same names to results; a failed call maps to its
+        exception instead of raising
+    """
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def _limited(call: Awaitable[Any]) -> Any:
+        async with limit:
+            return await call
+
+    results = await asyncio.gather(
+        *(_limited(call) for call in calls.values()), return_exceptions=True
+    )
+    return dict(zip(calls.keys(), results))
+
+
 # Module-level client instance
 _api_client: SchedulerAPIClient | None = None
 
@@ -1441,6 +1578,13 @@ async def get_api_client() -> SchedulerAPIClient:
     return _api_client
 
 
+def get_api_client_cache_stats() -> dict[str, Any] | None:
+    """Get response cache statistics for the shared client, if it exists."""
+    if _api_client is None:
+        return None
+    return _api_client.get_cache_stats()
+
+
 async def close_api_client() -> None:
     """Close the API client if open."""
     global _api_client
@@ -0,0 +1,192 @@
+"""
+Short-TTL response cache with request coalescing for the backend API client.
+
+Agent sessions re-request the same assignments, people and resilience
+metrics many times per minute, and composite tools often ask for the same
+date range concurrently. ``ResponseCache`` sits in front of
+``SchedulerAPIClient`` reads:
+
+- Single-flight: concurrent identical requests share one in-flight HTTP call.
+- TTL + LRU: successful responses are reused for a few seconds, bounded by
+  entry count.
+- Invalidation: mutating calls clear the cache. A generation counter stops a
+  read that started before a mutation from caching its (now stale) result.
+"""
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+DEFAULT_CACHE_TTL = 15.0  # seconds
+DEFAULT_CACHE_MAX_ENTRIES = 256
+
+
+class _LeaderCancelled(Exception):
+    """The fetch that coalesced callers were waiting on was cancelled."""
+
+
+def make_cache_key(method: str, url: str, **kwargs: Any) -> str:
+    """
+    Build a stable cache key from a request's method, URL, params and body.
+
+    Headers are deliberately excluded: every request from a client carries
+    the same credentials.
+
+    Args:
+        method: HTTP method
+        url: Request URL
+        **kwargs: httpx request kwargs (``params``, ``json``)
+
+    Returns:
+        Cache key string
+    """
+    return json.dumps(
+        [method.upper(), url, kwargs.get("params"), kwargs.get("json")],
+        sort_keys=True,
+        default=str,
+    )
+
+
+class ResponseCache:
+    """TTL-bounded LRU cache with single-flight request coalescing."""
+
+    def __init__(
+        self,
+        ttl: float = DEFAULT_CACHE_TTL,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Future] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether responses are cached (a TTL of 0 disables caching)."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def _get_fresh(self, key: str) -> tuple[bool, Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        return True, value
+
+    def _store(self, key: str, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_or_fetch(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool] = lambda _: True,
+    ) -> Any:
+        """
+        Return a cached value, join an identical in-flight fetch, or fetch.
+
+        Args:
+            key: Cache key (see ``make_cache_key``)
+            fetch: Coroutine factory performing the request
+            should_cache: Predicate deciding whether a result may be cached
+
+        Returns:
+            The fetched or cached value
+
+        Raises:
+            Exception: Whatever ``fetch`` raised; waiters on the same
+                in-flight request receive the same exception. If the caller
+                leading the fetch is cancelled, waiters retry instead.
+        """
+        while True:
+            if self.enabled:
+                found, value = self._get_fresh(key)
+                if found:
+                    self.hits += 1
+                    return value
+
+            in_flight = self._in_flight.get(key)
+            if in_flight is None:
+                return await self._lead(key, fetch, should_cache)
+            try:
+                value = await asyncio.shield(in_flight)
+            except _LeaderCancelled:
+                continue  # Retry, possibly as the new leader
+            self.coalesced += 1
+            return value
+
+    async def _lead(
+        self,
+        key: str,
+        fetch: Callable[[], Awaitable[Any]],
+        should_cache: Callable[[Any], bool],
+    ) -> Any:
+        """Perform the fetch that concurrent identical requests share."""
+        self.misses += 1
+        generation = self._generation
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await fetch()
+        except asyncio.CancelledError:
+            # Only this caller was cancelled; waiters retry without it
+            future.set_exception(_LeaderCancelled())
+            future.exception()  # Retrieved here in case nobody joined
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a failure nobody else awaited does not warn
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if (
+                self.enabled
+                and generation == self._generation
+                and should_cache(value)
+            ):
+                self._store(key, value)
+            return value
+        finally:
+            self._in_flight.pop(key, None)
+
+    def invalidate(self) -> None:
+        """Drop all cached responses after a mutating request."""
+        self._entries.clear()
+        self._generation += 1
+        self.invalidations += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hit/miss counters and hit rate
+        """
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "enabled": self.enabled,
+            "ttl_seconds": self.ttl,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
@@ -28,7 +28,7 @@ except ImportError:
     Route = None  # type: ignore
 
 # Import API client for RAG tools
-from .api_client import get_api_client
+from .api_client import get_api_client, get_api_client_cache_stats
 
 # Import ARO (Annual Rotation Optimizer) tools
 from .aro_tools import (
@@ -6170,6 +6170,49 @@ Format:
 # =============================================================================
 
 
+def _health_status() -> dict[str, Any]:
+    """Server health, configuration checks and API client cache stats."""
+    api_key_configured = bool(os.environ.get("MCP_API_KEY"))
+    api_credentials_configured = bool(
+        os.environ.get("API_USERNAME") and os.environ.get("API_PASSWORD")
+    )
+
+    return {
+        "status": "healthy",
+        "service": "residency-scheduler-mcp",
+        "version": "0.1.0",
+        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "checks": {
+            "mcp_server": "ok",
+            "api_key_configured": api_key_configured,
+            "api_credentials_configured": api_credentials_configured,
+        },
+        "api_client_cache": get_api_client_cache_stats(),
+    }
+
+
+@mcp.tool()
+async def get_mcp_health_tool() -> dict[str, Any]:
+    """
+    Get health status of the MCP server itself.
+
+    Returns:
+        Dict with:
+        - status: "healthy" while the server is serving requests
+        - checks: Whether API key and backend credentials are configured
+        - api_client_cache: Backend response cache statistics (hits, misses,
+          coalesced requests, hit rate), or None before the first backend call
+
+    Example:
+        health = await get_mcp_health_tool()
+
+        cache = health["api_client_cache"]
+        if cache:
+            print(f"Backend cache hit rate: {cache['hit_rate']:.0%}")
+    """
+    return _health_status()
+
+
 def create_health_endpoint():
     """Create a health check endpoint handler for Render/load balancers."""
     if not STARLETTE_AVAILABLE:
@@ -6177,24 +6220,7 @@ def create_health_endpoint():
 
     async def health_check(request):
         """Health check endpoint for monitoring."""
-        api_key_configured = bool(os.environ.get("MCP_API_KEY"))
-        api_credentials_configured = bool(
-            os.environ.get("API_USERNAME") and os.environ.get("API_PASSWORD")
-        )
-
-        return JSONResponse(
-            {
-                "status": "healthy",
-                "service": "residency-scheduler-mcp",
-                "version": "0.1.0",
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "checks": {
-                    "mcp_server": "ok",
-                    "api_key_configured": api_key_configured,
-                    "api_credentials_configured": api_credentials_configured,
-                },
-            }
-        )
+        return JSONResponse(_health_status())
 
     return health_check
 
@@ -742,7 +742,7 @@ async def find_deviation_incentives(
     logger.info(f"Finding deviation incentives for person {request.person_id}")
 
     try:
-        from ..api_client import get_api_client
+        from ..api_client import fan_out, get_api_client
 
         client = await get_api_client()
 
@@ -779,14 +779,22 @@ async def find_deviation_incentives(
         deviation_incentives: list[DeviationIncentive] = []
         best_alternative_utility = current_utility
 
-        # Fetch swap candidates
-        for assignment in person_assignments[:3]:  # Sample first 3 assignments
-            try:
-                swap_data = await client.get_swap_candidates(
+        # Fetch swap candidates concurrently
+        sampled = person_assignments[:3]  # Sample first 3 assignments
+        swap_results = await fan_out(
+            **{
+                str(index): client.get_swap_candidates(
                     person_id=request.person_id,
                     assignment_id=assignment.get("id"),
                     max_candidates=request.max_alternatives,
                 )
+                for index, assignment in enumerate(sampled)
+            }
+        )
+        for swap_data in swap_results.values():
+            try:
+                if isinstance(swap_data, Exception):
+                    raise swap_data
 
                 candidates = swap_data.get("candidates", [])
 
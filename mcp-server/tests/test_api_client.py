@@ -1,5 +1,7 @@
 """Tests for API client."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, Mock, patch
 
@@ -8,6 +10,7 @@ import httpx
 from scheduler_mcp.api_client import (
     APIConfig,
     SchedulerAPIClient,
+    fan_out,
     get_api_client,
     close_api_client,
 )
@@ -281,6 +284,162 @@ class TestSchedulerAPIClient:
             assert client.config.base_url == "http://custom:8080"
 
 
+def _cached_client(responses: list[httpx.Response], ttl: float = 15.0) -> SchedulerAPIClient:
+    """Client with a mocked transport returning responses after a short delay."""
+    client = SchedulerAPIClient(
+        APIConfig(username="u", password="p", cache_ttl=ttl)
+    )
+    client._client = AsyncMock()
+    client._token = "token"
+    queue = list(responses)
+
+    async def _request(method, url, **kwargs):
+        await asyncio.sleep(0.01)
+        return queue.pop(0)
+
+    client._client.request = AsyncMock(side_effect=_request)
+    return client
+
+
+def _json_response(payload: dict, status_code: int = 200) -> httpx.Response:
+    request = httpx.Request("GET", "http://test/api/v1/people")
+    return httpx.Response(status_code, request=request, json=payload)
+
+
+class TestResponseCache:
+    """Test request coalescing and the short-TTL response cache."""
+
+    async def test_concurrent_identical_reads_share_one_request(self):
+        client = _cached_client([_json_response({"items": [1]})])
+
+        results = await asyncio.gather(*(client.get_people() for _ in range(5)))
+
+        assert all(result == {"items": [1]} for result in results)
+        assert client._client.request.await_count == 1
+        assert client.get_cache_stats()["coalesced"] == 4
+
+    async def test_repeated_read_served_from_cache(self):
+        client = _cached_client([_json_response({"items": []})])
+
+        await client.get_people(limit=10)
+        await client.get_people(limit=10)
+
+        assert client._client.request.await_count == 1
+        stats = client.get_cache_stats()
+        assert stats["hits"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    async def test_different_params_are_separate_entries(self):
+        client = _cached_client([_json_response({}), _json_response({})])
+
+        await client.get_people(limit=10)
+        await client.get_people(limit=20)
+
+        assert client._client.request.await_count == 2
+
+    async def test_mutation_invalidates_cache(self):
+        client = _cached_client(
+            [
+                _json_response({"items": []}),
+                _json_response({"id": "s1"}),
+                _json_response({"items": ["changed"]}),
+            ]
+        )
+
+        await client.get_people()
+        await client.execute_swap("s1")
+        result = await client.get_people()
+
+        assert result == {"items": ["changed"]}
+        assert client._client.request.await_count == 3
+
+    async def test_logging_task_history_invalidates_cache(self):
+        client = _cached_client(
+            [
+                _json_response({"results": []}),
+                _json_response({"id": "t1"}),
+                _json_response({"results": ["t1"]}),
+            ]
+        )
+
+        await client.query_task_history({"query": "swap"})
+        await client.log_task_history({"task_description": "swap"})
+        result = await client.query_task_history({"query": "swap"})
+
+        assert result == {"results": ["t1"]}
+        assert client.get_cache_stats()["invalidations"] == 1
+
+    async def test_cancelled_leader_does_not_cancel_waiters(self):
+        client = _cached_client([_json_response({"items": [1]})])
+
+        leader = asyncio.create_task(client.get_people())
+        await asyncio.sleep(0.005)
+        waiters = [asyncio.create_task(client.get_people()) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        results = await asyncio.gather(*waiters)
+
+        assert leader.cancelled()
+        assert results == [{"items": [1]}, {"items": [1]}]
+        assert client._client.request.await_count == 2
+        assert client.get_cache_stats()["coalesced"] == 1
+
+    async def test_read_only_post_is_cached(self):
+        client = _cached_client([_json_response({"candidates": []})])
+
+        await client.get_swap_candidates(person_id="p1")
+        await client.get_swap_candidates(person_id="p1")
+
+        assert client._client.request.await_count == 1
+        assert client.get_cache_stats()["invalidations"] == 0
+
+    async def test_composite_resilience_reads_are_coalesced(self):
+        client = _cached_client([_json_response({"overall_index": 42.5})])
+
+        results = await asyncio.gather(
+            *(
+                client.get_composite_resilience(
+                    "unified-critical-index", {"include_details": True, "top_n": 5}
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert all(result == {"overall_index": 42.5} for result in results)
+        assert client._client.request.await_count == 1
+        assert client.get_cache_stats()["coalesced"] == 2
+
+    async def test_error_responses_are_not_cached(self):
+        client = _cached_client(
+            [_json_response({}, status_code=404), _json_response({"items": []})]
+        )
+
+        with pytest.raises(httpx.HTTPStatusError):
+            await client.get_people()
+        assert await client.get_people() == {"items": []}
+
+    async def test_zero_ttl_disables_caching(self):
+        client = _cached_client([_json_response({}), _json_response({})], ttl=0)
+
+        await client.get_people()
+        await client.get_people()
+
+        assert client._client.request.await_count == 2
+
+    async def test_fan_out_returns_results_and_exceptions(self):
+        async def ok():
+            return 1
+
+        async def fail():
+            raise ValueError("boom")
+
+        results = await fan_out(a=ok(), b=fail())
+
+        assert results["a"] == 1
+        assert isinstance(results["b"], ValueError)
+
+
 class TestModuleLevelFunctions:
     """Test module-level client management functions."""
 
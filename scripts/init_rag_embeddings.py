@@ -5,7 +5,9 @@ This script reads markdown files from docs/rag-knowledge/ and embeds them
 into the pgvector database for semantic search and RAG capabilities.
 
 Features:
-- Idempotent: Can be run multiple times (clears existing docs first)
+- Idempotent: Can be run multiple times (only changed chunks are rewritten)
+- Incremental: Unchanged chunks keep their stored embeddings
+- Parallel: New chunks from all documents are embedded in concurrent batches
 - Progress tracking: Shows chunk creation progress
 - Database validation: Checks connection before starting
 - Flexible CLI: Process all docs or specific ones
@@ -23,6 +25,9 @@ Usage:
 
     # Preview chunks without storing
     python scripts/init_rag_embeddings.py --dry-run
+
+    # Embed with 8 concurrent batches
+    python scripts/init_rag_embeddings.py --workers 8
 """
 
 import argparse
@@ -37,7 +42,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "backend"))
 from app.core.config import get_settings
 from app.core.logging import get_logger
 from app.db.session import SessionLocal
-from app.services.rag_service import RAGService
+from app.services.rag_service import RAGService, SourceDocument
 
 logger = get_logger(__name__)
 settings = get_settings()
@@ -81,13 +86,15 @@ DOCS_PATH = Path(__file__).parent.parent / "docs" / "rag-knowledge"
 class EmbeddingInitializer:
     """Handles RAG embedding initialization."""
 
-    def __init__(self, dry_run: bool = False):
+    def __init__(self, dry_run: bool = False, workers: int = 4):
         """Initialize the embedding initializer.
 
         Args:
             dry_run: If True, preview chunks without storing
+            workers: Concurrent embedding batches
         """
         self.dry_run = dry_run
+        self.workers = workers
         self.db = SessionLocal()
         self.rag_service = RAGService(self.db)
 
@@ -205,46 +212,15 @@ class EmbeddingInitializer:
                     "doc_type": doc_type,
                 }
 
-            # Clear existing chunks only for this source file (idempotent).
-            # Avoid deleting other files that share the same doc_type bucket.
-            existing_count = self.rag_service.delete_by_source_filename(filename)
-            if existing_count > 0:
-                logger.info(
-                    f"  • Cleared {existing_count} existing chunks for {filename}"
-                )
-
-            # Ingest document
-            metadata = {
-                "filename": filename,
-                "source": "docs/rag-knowledge",
-                "file_size": content_size,
-            }
-
-            result = await self.rag_service.ingest_document(
-                content=content,
-                doc_type=doc_type,
-                metadata=metadata,
+            # Reindex only this source file's chunks (idempotent). Other
+            # files that share the same doc_type bucket are left alone.
+            [result] = await self.rag_service.reindex_sources(
+                [self._source_document(filepath, content)],
                 chunk_size=chunk_size,
                 chunk_overlap=chunk_overlap,
+                workers=self.workers,
             )
-
-            if result.status == "success":
-                logger.info(f"  ✓ Created {result.chunks_created} chunks")
-                logger.info(f"  ✓ Average chunk size: ~{content_size // result.chunks_created:,} chars")
-                return {
-                    "filename": filename,
-                    "status": "success",
-                    "chunks_created": result.chunks_created,
-                    "doc_type": doc_type,
-                }
-            else:
-                logger.error(f"  ✗ Ingestion failed: {result.message}")
-                return {
-                    "filename": filename,
-                    "status": "error",
-                    "error": result.message,
-                    "doc_type": doc_type,
-                }
+            return self._report(filename, doc_type, result)
 
         except Exception as e:
             logger.error(f"  ✗ Error processing {filename}: {e}", exc_info=True)
@@ -255,6 +231,83 @@ class EmbeddingInitializer:
                 "doc_type": doc_type,
             }
 
+    async def reindex_documents(
+        self,
+        files: list[Path],
+        chunk_size: int = 500,
+        chunk_overlap: int = 50,
+    ) -> list[dict[str, Any]]:
+        """Reindex several documents, embedding their new chunks together.
+
+        Args:
+            files: Markdown files to reindex
+            chunk_size: Target chunk size in tokens
+            chunk_overlap: Overlap between chunks in tokens
+
+        Returns:
+            One result dict per file
+        """
+        results: list[dict[str, Any]] = []
+        sources = []
+        for filepath in files:
+            content = filepath.read_text(encoding="utf-8")
+            if not content.strip():
+                logger.warning(f"  ✗ {filepath.name} is empty, skipping")
+                results.append(
+                    {
+                        "filename": filepath.name,
+                        "status": "skipped",
+                        "reason": "empty_content",
+                    }
+                )
+                continue
+            sources.append(self._source_document(filepath, content))
+
+        logger.info(
+            f"Reindexing {len(sources)} document(s) with {self.workers} "
+            "embedding worker(s)"
+        )
+        responses = await self.rag_service.reindex_sources(
+            sources,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
+            workers=self.workers,
+        )
+        for source, response in zip(sources, responses):
+            logger.info(f"{source.filename} ({source.doc_type}):")
+            results.append(self._report(source.filename, source.doc_type, response))
+        return results
+
+    @staticmethod
+    def _source_document(filepath: Path, content: str) -> SourceDocument:
+        """Source document for a knowledge base file."""
+        filename = filepath.name
+        return SourceDocument(
+            filename=filename,
+            content=content,
+            doc_type=DOC_TYPE_MAP.get(filename, filename.replace(".md", "")),
+            metadata={"source": "docs/rag-knowledge", "file_size": len(content)},
+        )
+
+    @staticmethod
+    def _report(filename: str, doc_type: str, result: Any) -> dict[str, Any]:
+        """Log a reindex response and convert it to a result dict."""
+        if result.status == "success":
+            logger.info(f"  ✓ {result.message}")
+            return {
+                "filename": filename,
+                "status": "success",
+                "chunks_created": result.chunks_created,
+                "doc_type": doc_type,
+            }
+        logger.error(f"  ✗ Ingestion failed: {result.message}")
+        return {
+            "filename": filename,
+            "status": "error",
+            "error": result.message,
+            "doc_type": doc_type,
+        }
+
     async def process_all_documents(
         self,
         doc_filter: str | None = None,
@@ -288,15 +341,19 @@ class EmbeddingInitializer:
         logger.info(f"Found {len(files)} document(s) to process")
         logger.info(f"{'='*60}\n")
 
-        results = []
-        total_chunks = 0
-
-        for filepath in files:
-            result = await self.process_document(filepath, chunk_size, chunk_overlap)
-            results.append(result)
+        if self.dry_run:
+            results = [
+                await self.process_document(filepath, chunk_size, chunk_overlap)
+                for filepath in files
+            ]
+        else:
+            results = await self.reindex_documents(files, chunk_size, chunk_overlap)
 
-            if result["status"] in ["success", "dry_run"]:
-                total_chunks += result.get("chunks_created", 0)
+        total_chunks = sum(
+            r.get("chunks_created", 0)
+            for r in results
+            if r["status"] in ["success", "dry_run"]
+        )
 
         # Summary
         success_count = sum(1 for r in results if r["status"] in ["success", "dry_run"])
@@ -337,7 +394,9 @@ async def main(args: argparse.Namespace) -> int:
     logger.info("=" * 60)
 
     try:
-        with EmbeddingInitializer(dry_run=args.dry_run) as initializer:
+        with EmbeddingInitializer(
+            dry_run=args.dry_run, workers=args.workers
+        ) as initializer:
             # Validate database connection
             if not await initializer.validate_database():
                 logger.error("Database validation failed. Exiting.")
@@ -400,6 +459,9 @@ Examples:
 
   # Custom chunk size
   %(prog)s --chunk-size 1000 --chunk-overlap 100
+
+  # More concurrent embedding batches
+  %(prog)s --workers 8
         """,
     )
 
@@ -435,6 +497,13 @@ Examples:
         help="Overlap between chunks in tokens (default: 50)",
     )
 
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Concurrent embedding batches (default: 4)",
+    )
+
     return parser.parse_args()
 
 